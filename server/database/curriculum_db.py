@@ -6,9 +6,12 @@ This module supports both file-based storage (for development/simple deployments
 and PostgreSQL (for production/enterprise deployments).
 """
 
+import hashlib
 import json
 import os
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
@@ -334,15 +337,350 @@ class FileBasedStorage(CurriculumStorage):
         return False
 
 
+# Columns written when saving a curriculum, in the order of the row tuples
+# built below. The same tuples feed COPY and the unnest() topic update.
+TOPIC_COLUMNS = (
+    "id", "curriculum_id", "parent_id", "external_id", "title", "description",
+    "content_type", "order_index",
+    "time_overview", "time_introductory", "time_intermediate",
+    "time_advanced", "time_graduate", "time_research",
+    "content_depth", "interaction_mode", "checkpoint_frequency",
+    "content_hash", "subtree_hash",
+)
+
+# Columns an existing topic may change in place, with their SQL types
+TOPIC_UPDATE_TYPES = {
+    "external_id": "text", "title": "text", "description": "text",
+    "content_type": "text", "order_index": "int",
+    "time_overview": "text", "time_introductory": "text", "time_intermediate": "text",
+    "time_advanced": "text", "time_graduate": "text", "time_research": "text",
+    "content_depth": "text", "interaction_mode": "text", "checkpoint_frequency": "text",
+    "content_hash": "text", "subtree_hash": "text",
+}
+
+CONTENT_COLUMNS = {
+    "learning_objectives": (
+        "topic_id", "external_id", "statement", "abbreviated_statement",
+        "blooms_level", "order_index",
+    ),
+    "transcript_segments": (
+        "id", "topic_id", "segment_id", "segment_type", "content", "order_index",
+        "pace", "emotional_tone", "pause_after", "emphasis_words", "pronunciations",
+        "checkpoint_type", "checkpoint_question", "expected_response_type",
+        "expected_keywords", "expected_patterns", "celebration_message",
+        "stopping_point_type", "prompt_for_continue", "suggested_prompt",
+        "glossary_refs",
+    ),
+    "alternative_explanations": ("segment_id", "style", "content", "order_index"),
+    "examples": (
+        "topic_id", "external_id", "example_type", "title", "content", "explanation", "order_index",
+    ),
+    "misconceptions": (
+        "topic_id", "external_id", "triggers", "misconception", "correction", "explanation", "order_index",
+    ),
+    "assessments": (
+        "id", "topic_id", "external_id", "assessment_type", "question",
+        "correct_answer", "hint", "feedback_correct", "feedback_incorrect",
+        "feedback_partial", "order_index",
+    ),
+    "assessment_options": ("assessment_id", "option_id", "option_text", "is_correct", "order_index"),
+}
+
+# Content tables keyed directly by topic_id; the others cascade from these
+TOPIC_CONTENT_TABLES = ("learning_objectives", "transcript_segments", "examples", "misconceptions", "assessments")
+
+
+@dataclass
+class ContentSavePlan:
+    """
+    Set-based writes that bring a curriculum's stored topics in line
+    with its UMCF content tree.
+    """
+    topics: List[tuple] = field(default_factory=list)
+    content: Dict[str, List[tuple]] = field(
+        default_factory=lambda: {table: [] for table in CONTENT_COLUMNS}
+    )
+    topic_updates: List[tuple] = field(default_factory=list)
+    cleared_topic_ids: List[uuid.UUID] = field(default_factory=list)
+    deleted_topic_ids: List[uuid.UUID] = field(default_factory=list)
+    unchanged_topics: int = 0
+
+
+def _hash_json(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _node_key(external_id: Optional[str], order_index: int) -> Any:
+    """Siblings are matched by UMCF id, or by position when they have none."""
+    return external_id if external_id is not None else ("#", order_index)
+
+
+def _topic_row(
+    topic_id: uuid.UUID,
+    curriculum_id: uuid.UUID,
+    parent_id: Optional[uuid.UUID],
+    node: Dict[str, Any],
+    order_index: int,
+    content_hash: str,
+    subtree_hash: str,
+) -> tuple:
+    time_estimates = node.get("timeEstimates", {})
+    tutoring_config = node.get("tutoringConfig", {})
+    return (
+        topic_id, curriculum_id, parent_id,
+        node.get("id", {}).get("value"),
+        node.get("title"),
+        node.get("description"),
+        node.get("type", "topic"),
+        order_index,
+        time_estimates.get("overview"),
+        time_estimates.get("introductory"),
+        time_estimates.get("intermediate"),
+        time_estimates.get("advanced"),
+        time_estimates.get("graduate"),
+        time_estimates.get("research"),
+        tutoring_config.get("contentDepth"),
+        tutoring_config.get("interactionMode"),
+        tutoring_config.get("checkpointFrequency"),
+        content_hash, subtree_hash,
+    )
+
+
+def _add_topic_content(content: Dict[str, List[tuple]], topic_id: uuid.UUID, node: Dict[str, Any]):
+    """Add the rows hanging off one topic, with ids assigned up front."""
+    for idx, obj in enumerate(node.get("learningObjectives", [])):
+        content["learning_objectives"].append((
+            topic_id, obj.get("id", {}).get("value"),
+            obj.get("statement"), obj.get("abbreviatedStatement"),
+            obj.get("bloomsLevel"), idx,
+        ))
+
+    transcript = node.get("transcript", {})
+    for idx, segment in enumerate(transcript.get("segments", [])):
+        speaking_notes = segment.get("speakingNotes", {})
+        checkpoint = segment.get("checkpoint", {})
+        stopping_point = segment.get("stoppingPoint", {})
+        expected_response = checkpoint.get("expectedResponse", {})
+        segment_uuid = uuid.uuid4()
+
+        content["transcript_segments"].append((
+            segment_uuid, topic_id, segment.get("id"), segment.get("type"),
+            segment.get("content"), idx,
+            speaking_notes.get("pace"), speaking_notes.get("emotionalTone"),
+            speaking_notes.get("pauseAfter"), speaking_notes.get("emphasis", []),
+            json.dumps(speaking_notes.get("pronunciation", {})) if speaking_notes.get("pronunciation") else None,
+            checkpoint.get("type"), checkpoint.get("question"),
+            expected_response.get("type"), expected_response.get("keywords", []),
+            expected_response.get("acceptablePatterns", []),
+            checkpoint.get("celebrationMessage"),
+            stopping_point.get("type"), stopping_point.get("promptForContinue"),
+            stopping_point.get("suggestedPrompt"),
+            segment.get("glossaryRefs", []),
+        ))
+        for alt_idx, alt in enumerate(segment.get("alternativeExplanations", [])):
+            content["alternative_explanations"].append(
+                (segment_uuid, alt.get("style"), alt.get("content"), alt_idx)
+            )
+
+    for idx, example in enumerate(node.get("examples", [])):
+        content["examples"].append((
+            topic_id, example.get("id", {}).get("value"),
+            example.get("type"), example.get("title"),
+            example.get("content"), example.get("explanation"), idx,
+        ))
+
+    for idx, misc in enumerate(node.get("misconceptions", [])):
+        content["misconceptions"].append((
+            topic_id, misc.get("id", {}).get("value"),
+            misc.get("trigger", []), misc.get("misconception"),
+            misc.get("correction"), misc.get("explanation"), idx,
+        ))
+
+    for idx, assessment in enumerate(node.get("assessments", [])):
+        feedback = assessment.get("feedback", {})
+        assessment_uuid = uuid.uuid4()
+        content["assessments"].append((
+            assessment_uuid, topic_id, assessment.get("id", {}).get("value"),
+            assessment.get("type"), assessment.get("question"),
+            assessment.get("correctAnswer"), assessment.get("hint"),
+            feedback.get("correct"), feedback.get("incorrect"),
+            feedback.get("partial"), idx,
+        ))
+        for opt_idx, option in enumerate(assessment.get("options", [])):
+            content["assessment_options"].append((
+                assessment_uuid, option.get("id"),
+                option.get("text"), option.get("isCorrect", False), opt_idx,
+            ))
+
+
+def plan_content_save(
+    curriculum_id: uuid.UUID,
+    content: List[Dict[str, Any]],
+    existing_topics: List[Dict[str, Any]] = (),
+) -> ContentSavePlan:
+    """
+    Flatten a UMCF content tree into rows and diff it against the
+    stored topics of the same curriculum.
+
+    existing_topics are rows with id, parent_id, external_id,
+    order_index, content_hash and subtree_hash. Siblings are matched by
+    UMCF id (or position when they have none); a matched topic whose
+    subtree hash is unchanged is skipped along with all its descendants.
+    A matched topic whose own content changed is updated in place and
+    its learning objectives, segments, examples, misconceptions and
+    assessments are replaced. Unmatched stored topics are deleted, new
+    nodes are inserted with ids generated here so children can point at
+    their parent without a round trip.
+    """
+    plan = ContentSavePlan()
+
+    hashes: Dict[int, Tuple[str, str]] = {}
+
+    def compute_hashes(node: Dict[str, Any]) -> str:
+        own = _hash_json({k: v for k, v in node.items() if k != "children"})
+        child_hashes = [compute_hashes(child) for child in node.get("children", [])]
+        subtree = _hash_json([own, child_hashes]) if child_hashes else own
+        hashes[id(node)] = (own, subtree)
+        return subtree
+
+    for node in content:
+        compute_hashes(node)
+
+    children_by_parent: Dict[Optional[uuid.UUID], Dict[Any, Dict[str, Any]]] = {}
+    for row in existing_topics:
+        siblings = children_by_parent.setdefault(row["parent_id"], {})
+        key = _node_key(row["external_id"], row["order_index"])
+        if key in siblings:
+            plan.deleted_topic_ids.append(row["id"])
+        else:
+            siblings[key] = row
+
+    def insert(node: Dict[str, Any], parent_id: Optional[uuid.UUID], order_index: int):
+        topic_id = uuid.uuid4()
+        own, subtree = hashes[id(node)]
+        plan.topics.append(_topic_row(topic_id, curriculum_id, parent_id, node, order_index, own, subtree))
+        _add_topic_content(plan.content, topic_id, node)
+        for idx, child in enumerate(node.get("children", [])):
+            insert(child, topic_id, idx)
+
+    def save_children(nodes: List[Dict[str, Any]], parent_id: Optional[uuid.UUID]):
+        stored = children_by_parent.get(parent_id, {})
+        matched = set()
+        for idx, node in enumerate(nodes):
+            key = _node_key(node.get("id", {}).get("value"), idx)
+            row = stored.get(key)
+            if row is None or row["id"] in matched:
+                insert(node, parent_id, idx)
+                continue
+
+            matched.add(row["id"])
+            own, subtree = hashes[id(node)]
+            if row["subtree_hash"] == subtree and row["order_index"] == idx:
+                plan.unchanged_topics += 1 + _count_topics(node.get("children", []))
+                continue
+
+            plan.topic_updates.append(_topic_row(row["id"], curriculum_id, parent_id, node, idx, own, subtree))
+            if row["content_hash"] != own:
+                plan.cleared_topic_ids.append(row["id"])
+                _add_topic_content(plan.content, row["id"], node)
+            if row["subtree_hash"] == subtree:
+                # Moved but otherwise unchanged
+                plan.unchanged_topics += _count_topics(node.get("children", []))
+            else:
+                save_children(node.get("children", []), row["id"])
+
+        plan.deleted_topic_ids.extend(row["id"] for row in stored.values() if row["id"] not in matched)
+
+    save_children(content, None)
+    return plan
+
+
+def _count_topics(nodes: List[Dict[str, Any]]) -> int:
+    return sum(1 + _count_topics(node.get("children", [])) for node in nodes)
+
+
+# One round trip for a topic's transcript: every part is aggregated to
+# JSON in the database. asyncpg prepares and caches the statement per
+# connection, so repeat calls skip parsing and planning too.
+TOPIC_TRANSCRIPT_SQL = """
+    SELECT json_build_object(
+        'topic_id', $2::text,
+        'topic_title', t.title,
+        'segments', COALESCE((
+            SELECT json_agg(json_build_object(
+                'id', s.segment_id,
+                'type', s.segment_type,
+                'content', s.content,
+                'speaking_notes', CASE WHEN s.pace <> '' THEN json_build_object(
+                    'pace', s.pace,
+                    'emotional_tone', s.emotional_tone,
+                    'pause_after', s.pause_after
+                ) END,
+                'checkpoint', CASE WHEN s.checkpoint_type <> '' THEN json_build_object(
+                    'type', s.checkpoint_type,
+                    'question', s.checkpoint_question,
+                    'expected_keywords', s.expected_keywords,
+                    'celebration_message', s.celebration_message
+                ) END
+            ) ORDER BY s.order_index)
+            FROM transcript_segments s WHERE s.topic_id = t.id
+        ), '[]'),
+        'misconceptions', COALESCE((
+            SELECT json_agg(json_build_object(
+                'triggers', m.triggers,
+                'misconception', m.misconception,
+                'correction', m.correction,
+                'explanation', m.explanation
+            ) ORDER BY m.order_index)
+            FROM misconceptions m WHERE m.topic_id = t.id
+        ), '[]'),
+        'examples', COALESCE((
+            SELECT json_agg(json_build_object(
+                'example_type', e.example_type,
+                'title', e.title,
+                'content', e.content,
+                'explanation', e.explanation
+            ) ORDER BY e.order_index)
+            FROM examples e WHERE e.topic_id = t.id
+        ), '[]'),
+        'assessments', COALESCE((
+            SELECT json_agg((to_jsonb(a) || jsonb_build_object('options', COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'id', ao.option_id,
+                    'text', ao.option_text,
+                    'isCorrect', ao.is_correct
+                ) ORDER BY ao.order_index)
+                FROM assessment_options ao WHERE ao.assessment_id = a.id
+            ), '[]'))) ORDER BY a.order_index)
+            FROM assessments a WHERE a.topic_id = t.id
+        ), '[]')
+    )::text
+    FROM topics t
+    JOIN curricula c ON t.curriculum_id = c.id
+    WHERE (c.external_id = $1 OR c.id::text = $1)
+      AND (t.external_id = $2 OR t.id::text = $2)
+    LIMIT 1
+"""
+
+
 class PostgreSQLStorage(CurriculumStorage):
     """
     PostgreSQL-based curriculum storage with normalized tables.
     Provides granular editing and fast JSON export.
     """
 
+    # Topic transcripts are cached in-process for this long. Writes through
+    # this storage invalidate the cache at once; the TTL bounds how long
+    # writes from other processes go unseen.
+    TRANSCRIPT_CACHE_TTL_SECONDS = 60.0
+    TRANSCRIPT_CACHE_MAX_ENTRIES = 512
+
     def __init__(self, connection_string: str):
         self.connection_string = connection_string
         self.pool: Optional[asyncpg.Pool] = None
+        self._transcript_cache: OrderedDict[Tuple[str, str], Tuple[float, str]] = OrderedDict()
+        self._transcript_generation = 0
 
     async def connect(self):
         """Initialize the connection pool."""
@@ -363,6 +701,7 @@ class PostgreSQLStorage(CurriculumStorage):
 
     async def reload(self) -> int:
         """Refresh any caches. For PostgreSQL, this rebuilds JSON caches."""
+        self.invalidate_transcripts()
         async with self.pool.acquire() as conn:
             # Rebuild all JSON caches
             await conn.execute("""
@@ -543,168 +882,149 @@ class PostgreSQLStorage(CurriculumStorage):
         topic_id: str
     ) -> Optional[Dict[str, Any]]:
         """Get transcript segments for a specific topic."""
+        key = (curriculum_id, topic_id)
+        now = time.monotonic()
+        entry = self._transcript_cache.get(key)
+        if entry is not None and now - entry[0] < self.TRANSCRIPT_CACHE_TTL_SECONDS:
+            self._transcript_cache.move_to_end(key)
+            # Parsed per call so callers can't change the cached copy
+            return json.loads(entry[1])
+
+        generation = self._transcript_generation
         async with self.pool.acquire() as conn:
-            # Get topic
-            topic = await conn.fetchrow("""
-                SELECT t.id, t.title
-                FROM topics t
-                JOIN curricula c ON t.curriculum_id = c.id
-                WHERE (c.external_id = $1 OR c.id::text = $1)
-                  AND (t.external_id = $2 OR t.id::text = $2)
-            """, curriculum_id, topic_id)
-
-            if not topic:
-                return None
+            transcript = await conn.fetchval(TOPIC_TRANSCRIPT_SQL, curriculum_id, topic_id)
 
-            # Get segments
-            segments = await conn.fetch("""
-                SELECT segment_id, segment_type, content,
-                       pace, emotional_tone, pause_after,
-                       checkpoint_type, checkpoint_question,
-                       expected_keywords, celebration_message
-                FROM transcript_segments
-                WHERE topic_id = $1
-                ORDER BY order_index
-            """, topic['id'])
-
-            # Get misconceptions
-            misconceptions = await conn.fetch("""
-                SELECT triggers, misconception, correction, explanation
-                FROM misconceptions
-                WHERE topic_id = $1
-                ORDER BY order_index
-            """, topic['id'])
+        if transcript is None:
+            return None
 
-            # Get examples
-            examples = await conn.fetch("""
-                SELECT example_type, title, content, explanation
-                FROM examples
-                WHERE topic_id = $1
-                ORDER BY order_index
-            """, topic['id'])
-
-            # Get assessments
-            assessments = await conn.fetch("""
-                SELECT a.*, array_agg(
-                    jsonb_build_object(
-                        'id', ao.option_id,
-                        'text', ao.option_text,
-                        'isCorrect', ao.is_correct
-                    ) ORDER BY ao.order_index
-                ) as options
-                FROM assessments a
-                LEFT JOIN assessment_options ao ON a.id = ao.assessment_id
-                WHERE a.topic_id = $1
-                GROUP BY a.id
-                ORDER BY a.order_index
-            """, topic['id'])
+        # A write during the query may have made the result stale
+        if generation == self._transcript_generation:
+            self._transcript_cache[key] = (now, transcript)
+            self._transcript_cache.move_to_end(key)
+            while len(self._transcript_cache) > self.TRANSCRIPT_CACHE_MAX_ENTRIES:
+                self._transcript_cache.popitem(last=False)
+        return json.loads(transcript)
 
-            return {
-                "topic_id": topic_id,
-                "topic_title": topic['title'],
-                "segments": [
-                    {
-                        "id": s['segment_id'],
-                        "type": s['segment_type'],
-                        "content": s['content'],
-                        "speaking_notes": {
-                            "pace": s['pace'],
-                            "emotional_tone": s['emotional_tone'],
-                            "pause_after": s['pause_after']
-                        } if s['pace'] else None,
-                        "checkpoint": {
-                            "type": s['checkpoint_type'],
-                            "question": s['checkpoint_question'],
-                            "expected_keywords": s['expected_keywords'],
-                            "celebration_message": s['celebration_message']
-                        } if s['checkpoint_type'] else None
-                    }
-                    for s in segments
-                ],
-                "misconceptions": [dict(m) for m in misconceptions],
-                "examples": [dict(e) for e in examples],
-                "assessments": [dict(a) for a in assessments]
-            }
+    def invalidate_transcripts(self) -> None:
+        """Drop cached topic transcripts after curricula change."""
+        self._transcript_generation += 1
+        self._transcript_cache.clear()
 
     async def save_curriculum(
         self,
         curriculum_id: str,
         data: Dict[str, Any]
     ) -> str:
-        """Save or update a curriculum from UMCF JSON."""
+        """
+        Save or update a curriculum from UMCF JSON.
+
+        The content tree is flattened client-side and written with
+        set-based statements in one transaction; on re-save, subtrees
+        whose content hash is unchanged are left untouched. Databases
+        created before schema.sql had topic content hashes need
+        migrations/005_curriculum_bulk_save.sql.
+        """
+        umcf_id = data.get("id", {}).get("value", str(uuid.uuid4()))
+        educational = data.get("educational", {})
+        version_info = data.get("version", {})
+        lifecycle = data.get("lifecycle", {})
+        metadata = data.get("metadata", {})
+        curriculum_values = (
+            umcf_id,
+            data.get("id", {}).get("catalog"),
+            data.get("title"),
+            data.get("description"),
+            version_info.get("number", "1.0.0"),
+            version_info.get("date"),
+            version_info.get("changelog"),
+            lifecycle.get("status", "draft"),
+            educational.get("difficulty"),
+            educational.get("typicalAgeRange"),
+            educational.get("typicalLearningTime"),
+            metadata.get("language", "en-US"),
+            metadata.get("keywords", []),
+            metadata.get("subject", []),
+        )
+
         async with self.pool.acquire() as conn:
             async with conn.transaction():
-                # Check if curriculum exists
+                # The JSON cache is rebuilt once below, not per row
+                await conn.execute("SET LOCAL unamentis.defer_json_cache = 'on'")
+
                 existing_id = await conn.fetchval("""
                     SELECT id FROM curricula
                     WHERE external_id = $1 OR id::text = $1
                 """, curriculum_id)
 
                 if existing_id:
-                    # Delete existing (cascade will handle related tables)
-                    await conn.execute("DELETE FROM curricula WHERE id = $1", existing_id)
-
-                # Insert new curriculum
-                umcf_id = data.get("id", {}).get("value", str(uuid.uuid4()))
-                educational = data.get("educational", {})
-                version_info = data.get("version", {})
-                lifecycle = data.get("lifecycle", {})
-                metadata = data.get("metadata", {})
-
-                curriculum_uuid = await conn.fetchval("""
-                    INSERT INTO curricula (
-                        external_id, catalog, title, description,
-                        version_number, version_date, version_changelog,
-                        lifecycle_status, difficulty, age_range,
-                        typical_learning_time, language, keywords, subjects
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-                    RETURNING id
-                """,
-                    umcf_id,
-                    data.get("id", {}).get("catalog"),
-                    data.get("title"),
-                    data.get("description"),
-                    version_info.get("number", "1.0.0"),
-                    version_info.get("date"),
-                    version_info.get("changelog"),
-                    lifecycle.get("status", "draft"),
-                    educational.get("difficulty"),
-                    educational.get("typicalAgeRange"),
-                    educational.get("typicalLearningTime"),
-                    metadata.get("language", "en-US"),
-                    metadata.get("keywords", []),
-                    metadata.get("subject", [])
-                )
-
-                # Insert contributors
-                for contributor in lifecycle.get("contributors", []):
+                    # Update in place so unchanged topics can be kept
+                    curriculum_uuid = await conn.fetchval("""
+                        UPDATE curricula SET
+                            external_id = $2, catalog = $3, title = $4, description = $5,
+                            version_number = $6, version_date = $7, version_changelog = $8,
+                            lifecycle_status = $9, difficulty = $10, age_range = $11,
+                            typical_learning_time = $12, language = $13, keywords = $14,
+                            subjects = $15, updated_at = NOW()
+                        WHERE id = $1
+                        RETURNING id
+                    """, existing_id, *curriculum_values)
                     await conn.execute("""
-                        INSERT INTO curriculum_contributors (curriculum_id, name, role, organization)
-                        VALUES ($1, $2, $3, $4)
-                    """, curriculum_uuid, contributor.get("name"), contributor.get("role"),
-                        contributor.get("organization"))
-
-                # Insert glossary terms
-                glossary = data.get("glossary", {}).get("terms", [])
-                for term in glossary:
-                    await conn.execute("""
-                        INSERT INTO glossary_terms (
-                            curriculum_id, term_id, term, pronunciation,
-                            definition, spoken_definition, simple_definition,
-                            examples, related_terms
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                    """,
+                        WITH contributors AS (
+                            DELETE FROM curriculum_contributors WHERE curriculum_id = $1
+                        )
+                        DELETE FROM glossary_terms WHERE curriculum_id = $1
+                    """, curriculum_uuid)
+                    existing_topics = await conn.fetch("""
+                        SELECT id, parent_id, external_id, order_index, content_hash, subtree_hash
+                        FROM topics
+                        WHERE curriculum_id = $1
+                    """, curriculum_uuid)
+                else:
+                    curriculum_uuid = await conn.fetchval("""
+                        INSERT INTO curricula (
+                            external_id, catalog, title, description,
+                            version_number, version_date, version_changelog,
+                            lifecycle_status, difficulty, age_range,
+                            typical_learning_time, language, keywords, subjects
+                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
+                        RETURNING id
+                    """, *curriculum_values)
+                    existing_topics = []
+
+                contributors = [
+                    (curriculum_uuid, c.get("name"), c.get("role"), c.get("organization"))
+                    for c in lifecycle.get("contributors", [])
+                ]
+                if contributors:
+                    await conn.copy_records_to_table(
+                        "curriculum_contributors",
+                        records=contributors,
+                        columns=["curriculum_id", "name", "role", "organization"],
+                    )
+
+                glossary = [
+                    (
                         curriculum_uuid, term.get("id"), term.get("term"),
                         term.get("pronunciation"), term.get("definition"),
                         term.get("spokenDefinition"), term.get("simpleDefinition"),
-                        term.get("examples", []), term.get("relatedTerms", []))
-
-                # Insert content hierarchy
-                content = data.get("content", [])
-                for node in content:
-                    await self._insert_content_node(conn, curriculum_uuid, None, node, 0)
+                        term.get("examples", []), term.get("relatedTerms", []),
+                    )
+                    for term in data.get("glossary", {}).get("terms", [])
+                ]
+                if glossary:
+                    await conn.copy_records_to_table(
+                        "glossary_terms",
+                        records=glossary,
+                        columns=[
+                            "curriculum_id", "term_id", "term", "pronunciation",
+                            "definition", "spoken_definition", "simple_definition",
+                            "examples", "related_terms",
+                        ],
+                    )
+
+                plan = plan_content_save(curriculum_uuid, data.get("content", []), existing_topics)
+                await self._apply_content_plan(conn, plan)
 
-                # Rebuild JSON cache
                 await conn.execute("""
                     UPDATE curricula
                     SET json_cache = build_umcf_json(id),
@@ -712,153 +1032,49 @@ class PostgreSQLStorage(CurriculumStorage):
                     WHERE id = $1
                 """, curriculum_uuid)
 
-                return umcf_id
-
-    async def _insert_content_node(
-        self,
-        conn,
-        curriculum_id: uuid.UUID,
-        parent_id: Optional[uuid.UUID],
-        node: Dict[str, Any],
-        order_index: int
-    ) -> uuid.UUID:
-        """Recursively insert a content node and its children."""
-        time_estimates = node.get("timeEstimates", {})
-        tutoring_config = node.get("tutoringConfig", {})
-
-        # Insert topic
-        topic_id = await conn.fetchval("""
-            INSERT INTO topics (
-                curriculum_id, parent_id, external_id, title, description,
-                content_type, order_index,
-                time_overview, time_introductory, time_intermediate,
-                time_advanced, time_graduate, time_research,
-                content_depth, interaction_mode, checkpoint_frequency
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
-            RETURNING id
-        """,
-            curriculum_id, parent_id,
-            node.get("id", {}).get("value"),
-            node.get("title"),
-            node.get("description"),
-            node.get("type", "topic"),
-            order_index,
-            time_estimates.get("overview"),
-            time_estimates.get("introductory"),
-            time_estimates.get("intermediate"),
-            time_estimates.get("advanced"),
-            time_estimates.get("graduate"),
-            time_estimates.get("research"),
-            tutoring_config.get("contentDepth"),
-            tutoring_config.get("interactionMode"),
-            tutoring_config.get("checkpointFrequency")
+        self.invalidate_transcripts()
+        logger.info(
+            f"Saved curriculum {umcf_id}: {len(plan.topics)} topics inserted, "
+            f"{len(plan.topic_updates)} updated, {len(plan.deleted_topic_ids)} deleted, "
+            f"{plan.unchanged_topics} unchanged"
         )
-
-        # Insert learning objectives
-        for idx, obj in enumerate(node.get("learningObjectives", [])):
-            await conn.execute("""
-                INSERT INTO learning_objectives (
-                    topic_id, external_id, statement, abbreviated_statement,
-                    blooms_level, order_index
-                ) VALUES ($1, $2, $3, $4, $5, $6)
-            """,
-                topic_id, obj.get("id", {}).get("value"),
-                obj.get("statement"), obj.get("abbreviatedStatement"),
-                obj.get("bloomsLevel"), idx)
-
-        # Insert transcript segments
-        transcript = node.get("transcript", {})
-        for idx, segment in enumerate(transcript.get("segments", [])):
-            speaking_notes = segment.get("speakingNotes", {})
-            checkpoint = segment.get("checkpoint", {})
-            stopping_point = segment.get("stoppingPoint", {})
-            expected_response = checkpoint.get("expectedResponse", {})
-
-            segment_uuid = await conn.fetchval("""
-                INSERT INTO transcript_segments (
-                    topic_id, segment_id, segment_type, content, order_index,
-                    pace, emotional_tone, pause_after, emphasis_words, pronunciations,
-                    checkpoint_type, checkpoint_question, expected_response_type,
-                    expected_keywords, expected_patterns, celebration_message,
-                    stopping_point_type, prompt_for_continue, suggested_prompt,
-                    glossary_refs
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20)
-                RETURNING id
-            """,
-                topic_id, segment.get("id"), segment.get("type"),
-                segment.get("content"), idx,
-                speaking_notes.get("pace"), speaking_notes.get("emotionalTone"),
-                speaking_notes.get("pauseAfter"), speaking_notes.get("emphasis", []),
-                json.dumps(speaking_notes.get("pronunciation", {})) if speaking_notes.get("pronunciation") else None,
-                checkpoint.get("type"), checkpoint.get("question"),
-                expected_response.get("type"), expected_response.get("keywords", []),
-                expected_response.get("acceptablePatterns", []),
-                checkpoint.get("celebrationMessage"),
-                stopping_point.get("type"), stopping_point.get("promptForContinue"),
-                stopping_point.get("suggestedPrompt"),
-                segment.get("glossaryRefs", []))
-
-            # Insert alternative explanations
-            for alt_idx, alt in enumerate(segment.get("alternativeExplanations", [])):
-                await conn.execute("""
-                    INSERT INTO alternative_explanations (segment_id, style, content, order_index)
-                    VALUES ($1, $2, $3, $4)
-                """, segment_uuid, alt.get("style"), alt.get("content"), alt_idx)
-
-        # Insert examples
-        for idx, example in enumerate(node.get("examples", [])):
-            await conn.execute("""
-                INSERT INTO examples (
-                    topic_id, external_id, example_type, title, content, explanation, order_index
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-            """,
-                topic_id, example.get("id", {}).get("value"),
-                example.get("type"), example.get("title"),
-                example.get("content"), example.get("explanation"), idx)
-
-        # Insert misconceptions
-        for idx, misc in enumerate(node.get("misconceptions", [])):
-            await conn.execute("""
-                INSERT INTO misconceptions (
-                    topic_id, external_id, triggers, misconception, correction, explanation, order_index
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-            """,
-                topic_id, misc.get("id", {}).get("value"),
-                misc.get("trigger", []), misc.get("misconception"),
-                misc.get("correction"), misc.get("explanation"), idx)
-
-        # Insert assessments
-        for idx, assessment in enumerate(node.get("assessments", [])):
-            feedback = assessment.get("feedback", {})
-            assessment_uuid = await conn.fetchval("""
-                INSERT INTO assessments (
-                    topic_id, external_id, assessment_type, question,
-                    correct_answer, hint, feedback_correct, feedback_incorrect,
-                    feedback_partial, order_index
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                RETURNING id
-            """,
-                topic_id, assessment.get("id", {}).get("value"),
-                assessment.get("type"), assessment.get("question"),
-                assessment.get("correctAnswer"), assessment.get("hint"),
-                feedback.get("correct"), feedback.get("incorrect"),
-                feedback.get("partial"), idx)
-
-            # Insert options
-            for opt_idx, option in enumerate(assessment.get("options", [])):
-                await conn.execute("""
-                    INSERT INTO assessment_options (
-                        assessment_id, option_id, option_text, is_correct, order_index
-                    ) VALUES ($1, $2, $3, $4, $5)
-                """,
-                    assessment_uuid, option.get("id"),
-                    option.get("text"), option.get("isCorrect", False), opt_idx)
-
-        # Process children recursively
-        for idx, child in enumerate(node.get("children", [])):
-            await self._insert_content_node(conn, curriculum_id, topic_id, child, idx)
-
-        return topic_id
+        return umcf_id
+
+    async def _apply_content_plan(self, conn, plan: ContentSavePlan):
+        """Run a content save plan as a handful of set-based statements."""
+        if plan.deleted_topic_ids:
+            # Cascades to descendants and their content
+            await conn.execute("DELETE FROM topics WHERE id = ANY($1::uuid[])", plan.deleted_topic_ids)
+
+        if plan.cleared_topic_ids:
+            deletes = [
+                f"DELETE FROM {table} WHERE topic_id = ANY($1::uuid[])"
+                for table in TOPIC_CONTENT_TABLES
+            ]
+            ctes = ",\n".join(f"d{i} AS ({sql})" for i, sql in enumerate(deletes[:-1]))
+            await conn.execute(f"WITH {ctes}\n{deletes[-1]}", plan.cleared_topic_ids)
+
+        if plan.topic_updates:
+            positions = [TOPIC_COLUMNS.index(column) for column in TOPIC_UPDATE_TYPES]
+            columns = list(zip(*plan.topic_updates))
+            arrays = [list(columns[0])] + [list(columns[pos]) for pos in positions]
+            unnest_args = ", ".join(
+                ["$1::uuid[]"] + [f"${i}::{sql_type}[]" for i, sql_type in enumerate(TOPIC_UPDATE_TYPES.values(), start=2)]
+            )
+            assignments = ", ".join(f"{column} = u.{column}" for column in TOPIC_UPDATE_TYPES)
+            await conn.execute(f"""
+                UPDATE topics AS t
+                SET {assignments}, updated_at = NOW()
+                FROM unnest({unnest_args}) AS u(id, {", ".join(TOPIC_UPDATE_TYPES)})
+                WHERE t.id = u.id
+            """, *arrays)
+
+        # Parents are copied before children, and topics before their content
+        if plan.topics:
+            await conn.copy_records_to_table("topics", records=plan.topics, columns=list(TOPIC_COLUMNS))
+        for table, columns in CONTENT_COLUMNS.items():
+            if plan.content[table]:
+                await conn.copy_records_to_table(table, records=plan.content[table], columns=list(columns))
 
     async def delete_curriculum(self, curriculum_id: str) -> bool:
         """Delete a curriculum."""
@@ -867,7 +1083,8 @@ class PostgreSQLStorage(CurriculumStorage):
                 DELETE FROM curricula
                 WHERE external_id = $1 OR id::text = $1
             """, curriculum_id)
-            return "DELETE 1" in result
+        self.invalidate_transcripts()
+        return "DELETE 1" in result
 
 
 def create_storage(
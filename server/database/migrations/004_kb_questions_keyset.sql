@@ -0,0 +1,22 @@
+-- ============================================================================
+-- Knowledge Bowl Questions Keyset Pagination Migration
+-- ============================================================================
+--
+-- This migration adds:
+-- - An index matching the question browser's sort order, so each page
+--   is an index range scan that starts where the previous page ended
+--
+-- Apply with: psql $DATABASE_URL < migrations/004_kb_questions_keyset.sql
+--
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_kb_questions_created_id
+    ON kb_questions(created_at DESC, id DESC);
+
+COMMENT ON INDEX idx_kb_questions_created_id IS 'Keyset pagination order for question listing';
+
+-- ============================================================================
+-- Migration complete
+-- ============================================================================
+
+DO $$ BEGIN RAISE NOTICE 'KB Questions keyset pagination migration complete'; END $$;
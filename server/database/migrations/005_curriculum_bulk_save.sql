@@ -0,0 +1,65 @@
+-- ============================================================================
+-- Curriculum Bulk Save Migration
+-- ============================================================================
+--
+-- This migration adds:
+-- - Content hashes on topics, so re-saving a curriculum can skip
+--   subtrees that have not changed
+-- - A JSON cache trigger that a bulk save can defer for its transaction
+--   (SET LOCAL unamentis.defer_json_cache = 'on') and rebuild once at the
+--   end, instead of rebuilding the whole document for every inserted row
+-- - A fix for the same trigger on transcript_segments and
+--   learning_objectives, which have no curriculum_id column, and on
+--   DELETE, where NEW is null
+--
+-- schema.sql already includes these changes; this migration is for
+-- databases created before it. Apply with:
+--   psql $DATABASE_URL < migrations/005_curriculum_bulk_save.sql
+--
+-- ============================================================================
+
+ALTER TABLE topics ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+ALTER TABLE topics ADD COLUMN IF NOT EXISTS subtree_hash VARCHAR(64);
+
+COMMENT ON COLUMN topics.content_hash IS 'SHA-256 of the UMCF node without its children';
+COMMENT ON COLUMN topics.subtree_hash IS 'SHA-256 of the node and all of its descendants';
+
+CREATE OR REPLACE FUNCTION update_curriculum_json_cache()
+RETURNS TRIGGER AS $$
+DECLARE
+    row_data RECORD;
+    target_curriculum UUID;
+BEGIN
+    -- Bulk saves rebuild the cache once when they are done
+    IF current_setting('unamentis.defer_json_cache', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        row_data := OLD;
+    ELSE
+        row_data := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'topics' THEN
+        target_curriculum := row_data.curriculum_id;
+    ELSE
+        SELECT curriculum_id INTO target_curriculum FROM topics WHERE id = row_data.topic_id;
+    END IF;
+
+    IF target_curriculum IS NOT NULL THEN
+        UPDATE curricula
+        SET json_cache = build_umcf_json(target_curriculum),
+            json_cache_updated_at = NOW()
+        WHERE id = target_curriculum;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- Migration complete
+-- ============================================================================
+
+DO $$ BEGIN RAISE NOTICE 'Curriculum bulk save migration complete'; END $$;
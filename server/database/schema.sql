@@ -135,6 +135,10 @@ CREATE TABLE topics (
     interaction_mode VARCHAR(50),      -- lecture, socratic, guided, exploratory
     checkpoint_frequency VARCHAR(50),  -- high, medium, low
 
+    -- Change detection for bulk saves
+    content_hash VARCHAR(64),          -- SHA-256 of the UMCF node without its children
+    subtree_hash VARCHAR(64),          -- SHA-256 of the node and all of its descendants
+
     -- Timestamps
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
@@ -599,14 +603,36 @@ $$ LANGUAGE plpgsql;
 -- Function to update JSON cache
 CREATE OR REPLACE FUNCTION update_curriculum_json_cache()
 RETURNS TRIGGER AS $$
+DECLARE
+    row_data RECORD;
+    target_curriculum UUID;
 BEGIN
+    -- Bulk saves rebuild the cache once when they are done
+    IF current_setting('unamentis.defer_json_cache', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        row_data := OLD;
+    ELSE
+        row_data := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'topics' THEN
+        target_curriculum := row_data.curriculum_id;
+    ELSE
+        SELECT curriculum_id INTO target_curriculum FROM topics WHERE id = row_data.topic_id;
+    END IF;
+
     -- Update the curriculum's JSON cache
-    UPDATE curricula
-    SET json_cache = build_umcf_json(NEW.curriculum_id),
-        json_cache_updated_at = NOW()
-    WHERE id = NEW.curriculum_id;
+    IF target_curriculum IS NOT NULL THEN
+        UPDATE curricula
+        SET json_cache = build_umcf_json(target_curriculum),
+            json_cache_updated_at = NOW()
+        WHERE id = target_curriculum;
+    END IF;
 
-    RETURN NEW;
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
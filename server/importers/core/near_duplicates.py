@@ -0,0 +1,390 @@
+"""
+Near-duplicate detection for quiz questions using MinHash and LSH.
+
+Exact-text dedup misses paraphrased or lightly edited questions, and
+comparing every pair of questions is quadratic. Instead, each question
+gets a MinHash signature of its normalized character shingles. The
+signatures are bucketed with locality-sensitive hashing, so only
+questions that share a bucket are ever compared. Indexing and
+clustering are near-linear in the number of questions.
+
+Signatures use one-permutation hashing with densification. Each
+shingle is hashed once, and the hash range is split into num_perm
+bins, instead of hashing every shingle num_perm times. That keeps
+signing fast in pure Python.
+
+Answer shingles are added with extra weight. Templated questions that
+differ only in their answer ("What is the chemical symbol for gold?"
+and "... for silver?") are therefore not reported as duplicates.
+
+Usage:
+    index = NearDuplicateIndex(threshold=0.7)
+    for q in questions:
+        index.add(q["id"], q["question_text"], q.get("answer_text", ""))
+    for cluster in index.clusters():
+        print(cluster.representative, cluster.members)
+"""
+
+import re
+import unicodedata
+import zlib
+from itertools import repeat
+from operator import and_, mul, rshift
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Hashable, Iterable, Optional
+
+from .text_cleaner import clean_quiz_bowl_text, clean_science_bowl_answer
+
+DEFAULT_THRESHOLD = 0.7
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_ANSWER_WEIGHT = 3
+
+_MASK64 = (1 << 64) - 1
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_NON_WORD = re.compile(r"[\W_]+")
+_PARENTHETICAL = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_LEADING_ARTICLE = re.compile(r"^(?:the|a|an) ")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for comparison.
+
+    Removes Quiz Bowl markers, accents, punctuation and case, and
+    collapses whitespace. Anything but a string normalizes to "".
+    """
+    if not isinstance(text, str) or not text:
+        return ""
+    text = clean_quiz_bowl_text(text)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_WORD.sub(" ", text.casefold()).strip()
+
+
+def normalize_answer(text: str) -> str:
+    """Normalize an answer for comparison.
+
+    Also drops Science Bowl choice prefixes, parenthetical notes and a
+    leading article, so "DNA (deoxyribonucleic acid)" matches "DNA".
+    """
+    if not text:
+        return ""
+    text = _PARENTHETICAL.sub(" ", clean_science_bowl_answer(text))
+    return _LEADING_ARTICLE.sub("", normalize_text(text))
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE, normalize=normalize_text) -> set[bytes]:
+    """Shingles of the normalized text: its UTF-8 byte runs of length size.
+
+    Text shorter than one shingle is a single shingle, so short answers
+    still count.
+    """
+    data = normalize(text).encode()
+    if len(data) <= size:
+        return {data} if data else set()
+    return {data[i : i + size] for i in range(len(data) - size + 1)}
+
+
+def _false_probability_areas(threshold: float, bands: int, rows: int) -> tuple[float, float]:
+    """Internal: Areas under the LSH S-curve below and above the threshold.
+
+    Returns (false positive area, false negative area), integrated with
+    the midpoint rule.
+    """
+    steps = 100
+    fp = fn = 0.0
+    for i in range(steps):
+        s = threshold * (i + 0.5) / steps
+        fp += (1 - (1 - s**rows) ** bands) * threshold / steps
+        s = threshold + (1 - threshold) * (i + 0.5) / steps
+        fn += (1 - s**rows) ** bands * (1 - threshold) / steps
+    return fp, fn
+
+
+@lru_cache(maxsize=None)
+def optimal_bands(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Choose LSH (bands, rows) for a similarity threshold.
+
+    Minimizes the summed areas where pairs below the threshold become
+    candidates and pairs above it are missed, over bands * rows <= num_perm.
+    """
+    best = (1, num_perm)
+    best_error = float("inf")
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        fp, fn = _false_probability_areas(threshold, bands, rows)
+        if fp + fn < best_error:
+            best, best_error = (bands, rows), fp + fn
+    return best
+
+
+@dataclass
+class NearDuplicateCluster:
+    """A group of questions that are near-duplicates of each other.
+
+    The representative is the earliest-added question in the group.
+    Members are (key, estimated Jaccard similarity to the
+    representative), beginning with the representative itself at 1.0.
+    Members are linked through chains of similar pairs, so a member's
+    similarity to the representative can fall below the threshold.
+    """
+
+    representative: Hashable
+    members: list[tuple[Hashable, float]] = field(default_factory=list)
+
+
+class NearDuplicateIndex:
+    """MinHash LSH index of questions, keyed by any hashable ID.
+
+    Args:
+        threshold: Estimated Jaccard similarity at or above which two
+            questions are near-duplicates
+        num_perm: Signature length; longer signatures estimate more
+            precisely but cost more memory
+        shingle_size: Characters per shingle
+        answer_weight: How many times each answer shingle counts
+        seed: Hash seed, fixed so results are reproducible
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        answer_weight: int = DEFAULT_ANSWER_WEIGHT,
+        seed: int = 1,
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.answer_weight = answer_weight
+        self.seed = seed
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+
+        self._texts: dict[Hashable, tuple[str, str]] = {}
+        self._signatures: dict[Hashable, tuple[int, ...]] = {}
+        self._buckets: list[dict[tuple[int, ...], dict[Hashable, None]]] = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    # --- Signatures ---
+
+    def signature(self, question_text: str, answer_text: str = "") -> Optional[tuple[int, ...]]:
+        """MinHash signature of a question, or None if it has no text."""
+        features = shingles(question_text, self.shingle_size)
+        for s in shingles(answer_text, self.shingle_size, normalize_answer):
+            features.update(b"\x1f%d%s" % (i, s) for i in range(self.answer_weight))
+        if not features:
+            return None
+
+        # Hash each feature once: CRC32, spread over 64 bits by an odd
+        # multiplier. The top bits pick the bin. Sorted descending,
+        # dict() keeps the last, i.e. smallest, hash per bin. Every step
+        # runs in C.
+        num_perm = self.num_perm
+        hashes = sorted(
+            map(and_, map(mul, map(zlib.crc32, features, repeat(self.seed)), repeat(_MULTIPLIER)), repeat(_MASK64)),
+            reverse=True,
+        )
+        mins = dict(zip(map(rshift, map(mul, hashes, repeat(num_perm)), repeat(64)), hashes))
+        empty = -1
+        bins = [mins.get(i, empty) for i in range(num_perm)]
+
+        # Densify: an empty bin borrows from the next filled bin to its
+        # right, offset by the distance so borrowed values stay distinct
+        if len(mins) < num_perm:
+            offset = _MASK64 + 1
+            dense = bins[:]
+            # Bins after the last filled bin wrap around to the first
+            nxt = next(i for i, v in enumerate(bins) if v != empty) + num_perm
+            for i in range(num_perm - 1, -1, -1):
+                if bins[i] != empty:
+                    nxt = i
+                else:
+                    dense[i] = bins[nxt % num_perm] + (nxt - i) * offset
+            bins = dense
+        return tuple(bins)
+
+    def similarity(self, a: tuple[int, ...], b: tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(x == y for x, y in zip(a, b)) / self.num_perm
+
+    def _bands_of(self, signature: tuple[int, ...]) -> Iterable[tuple[int, tuple[int, ...]]]:
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows : (band + 1) * rows]
+
+    # --- Updates ---
+
+    def add(self, key: Hashable, question_text: str, answer_text: str = "") -> None:
+        """Index a question, replacing any earlier text for the same key.
+
+        Re-adding a key with unchanged text does no work, so callers can
+        re-sync a whole store cheaply. Questions without text are not
+        indexed.
+        """
+        texts = (question_text or "", answer_text or "")
+        if self._texts.get(key) == texts:
+            return
+        self.remove(key)
+        signature = self.signature(*texts)
+        if signature is not None:
+            self.add_signature(key, signature)
+            self._texts[key] = texts
+
+    def add_checked(self, key: Hashable, question_text: str, answer_text: str = "") -> list[tuple[Hashable, float]]:
+        """Index a question and return the other questions it nearly duplicates.
+
+        Same as query() followed by add(), but signs the text once.
+        """
+        texts = (question_text or "", answer_text or "")
+        self.remove(key)
+        signature = self.signature(*texts)
+        if signature is None:
+            return []
+        matches = self.query_signature(signature)
+        self.add_signature(key, signature)
+        self._texts[key] = texts
+        return matches
+
+    def add_signature(self, key: Hashable, signature: tuple[int, ...]) -> None:
+        """Index a signature computed by an index with the same num_perm and seed."""
+        self.remove(key)
+        self._signatures[key] = signature
+        for band, band_key in self._bands_of(signature):
+            self._buckets[band].setdefault(band_key, {})[key] = None
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a question from the index if present."""
+        signature = self._signatures.pop(key, None)
+        self._texts.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in self._bands_of(signature):
+            bucket = self._buckets[band][band_key]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[band][band_key]
+
+    def retain(self, keys: Iterable[Hashable]) -> None:
+        """Remove every indexed question whose key is not in keys."""
+        keep = set(keys)
+        for key in [k for k in self._signatures if k not in keep]:
+            self.remove(key)
+
+    def subset(self, keys: Iterable[Hashable], threshold: Optional[float] = None) -> "NearDuplicateIndex":
+        """A new index of some of this index's questions, without re-signing them.
+
+        Args:
+            keys: Keys to copy; keys that aren't indexed are skipped
+            threshold: Similarity threshold for the new index, default
+                this index's
+
+        Raises:
+            ValueError: If threshold is out of range
+        """
+        index = NearDuplicateIndex(
+            threshold=self.threshold if threshold is None else threshold,
+            num_perm=self.num_perm,
+            shingle_size=self.shingle_size,
+            answer_weight=self.answer_weight,
+            seed=self.seed,
+        )
+        for key in keys:
+            signature = self._signatures.get(key)
+            if signature is not None:
+                index.add_signature(key, signature)
+        return index
+
+    # --- Queries ---
+
+    def get_signature(self, key: Hashable) -> Optional[tuple[int, ...]]:
+        """The signature of an indexed question, or None."""
+        return self._signatures.get(key)
+
+    def query_signature(
+        self, signature: tuple[int, ...], exclude: Hashable = None
+    ) -> list[tuple[Hashable, float]]:
+        """Indexed questions similar to a signature, most similar first."""
+        candidates: dict[Hashable, None] = {}
+        for band, band_key in self._bands_of(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                candidates.update(bucket)
+        candidates.pop(exclude, None)
+
+        matches = []
+        for key in candidates:
+            score = self.similarity(signature, self._signatures[key])
+            if score >= self.threshold:
+                matches.append((key, score))
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def query(self, question_text: str, answer_text: str = "") -> list[tuple[Hashable, float]]:
+        """Indexed questions similar to the given text, most similar first."""
+        signature = self.signature(question_text, answer_text)
+        return self.query_signature(signature) if signature is not None else []
+
+    def similar_to(self, key: Hashable) -> list[tuple[Hashable, float]]:
+        """Indexed questions similar to an indexed question, most similar first."""
+        signature = self._signatures.get(key)
+        return self.query_signature(signature, exclude=key) if signature is not None else []
+
+    def clusters(self) -> list[NearDuplicateCluster]:
+        """Group indexed questions into near-duplicate clusters.
+
+        Only candidate pairs that share an LSH bucket are compared, and
+        a pair already in the same cluster is not compared again.
+        Clusters are in the order their representatives were added, and
+        singletons are omitted.
+        """
+        order = {key: i for i, key in enumerate(self._signatures)}
+        parent = {key: key for key in order}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for band_buckets in self._buckets:
+            for bucket in band_buckets.values():
+                if len(bucket) < 2:
+                    continue
+                members = list(bucket)
+                for i, a in enumerate(members):
+                    for b in members[:i]:
+                        root_a, root_b = find(a), find(b)
+                        if root_a == root_b:
+                            continue
+                        if self.similarity(self._signatures[a], self._signatures[b]) >= self.threshold:
+                            # The earlier-added root stays the representative
+                            if order[root_a] < order[root_b]:
+                                parent[root_b] = root_a
+                            else:
+                                parent[root_a] = root_b
+
+        groups: dict[Hashable, list[Hashable]] = {}
+        for key in order:
+            groups.setdefault(find(key), []).append(key)
+
+        clusters = []
+        for root, keys in groups.items():
+            if len(keys) < 2:
+                continue
+            rep_signature = self._signatures[root]
+            cluster = NearDuplicateCluster(representative=root)
+            for key in keys:
+                score = 1.0 if key == root else self.similarity(rep_signature, self._signatures[key])
+                cluster.members.append((key, score))
+            clusters.append(cluster)
+        return clusters
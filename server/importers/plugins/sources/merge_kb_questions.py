@@ -7,17 +7,26 @@ into a unified Knowledge Bowl question bundle.
 Can create:
 1. Full bundle (all questions for server/download)
 2. iOS bundle (balanced subset for app bundle)
+
+Questions are deduplicated by ID. With --similarity-threshold, near-duplicates
+(paraphrased or lightly edited copies of an earlier question) are dropped too.
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 import random
+import sys
 from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from importers.core.near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex
+
 
 # Target distribution for iOS bundle (based on competition weights)
 TARGET_DISTRIBUTION = {
@@ -60,6 +69,51 @@ def merge_questions(
     return merged
 
 
+def question_texts(q: dict[str, Any]) -> tuple[str, str]:
+    """Question and primary answer text of a bundle question."""
+    answer = q.get("answer", "")
+    if isinstance(answer, dict):
+        answer = answer.get("primary", "")
+    return q.get("text", ""), answer
+
+
+def drop_near_duplicates(
+    questions: list[dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Drop questions that nearly duplicate an earlier question.
+
+    Each question is checked only against the LSH candidates among the
+    questions kept so far, so this is near-linear in the number of
+    questions.
+
+    Args:
+        questions: Questions in priority order; the first of each group is kept
+        threshold: Estimated Jaccard similarity that counts as a duplicate
+
+    Returns:
+        (kept questions, dropped records with the ID of the kept question
+        each duplicates and their similarity)
+    """
+    index = NearDuplicateIndex(threshold=threshold)
+    kept: list[dict[str, Any]] = []
+    dropped: list[dict[str, Any]] = []
+
+    for q in questions:
+        signature = index.signature(*question_texts(q))
+        matches = index.query_signature(signature) if signature is not None else []
+        if matches:
+            position, similarity = matches[0]
+            dropped.append({"id": q.get("id"), "duplicate_of": kept[position].get("id"), "similarity": similarity})
+            continue
+        if signature is not None:
+            index.add_signature(len(kept), signature)
+        kept.append(q)
+
+    return kept, dropped
+
+
 def group_by_domain(questions: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
     """Group questions by domain."""
     grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
@@ -144,10 +198,19 @@ def print_stats(questions: list[dict[str, Any]], label: str) -> None:
         print(f"  {domain}: {count} ({pct:.1f}%, target: {target_pct:.0f}%)")
 
 
+def similarity_threshold(value: str) -> float:
+    """Parse a --similarity-threshold value, which must be in [0, 1]."""
+    try:
+        threshold = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {value!r}")
+    if not 0 <= threshold <= 1:
+        raise argparse.ArgumentTypeError(f"must be between 0 and 1, got {value}")
+    return threshold
+
+
 def main():
     """CLI entry point."""
-    import argparse
-
     parser = argparse.ArgumentParser(
         description="Merge KB questions from multiple sources"
     )
@@ -179,6 +242,15 @@ def main():
         default=1000,
         help="Number of questions for iOS bundle"
     )
+    parser.add_argument(
+        "--similarity-threshold",
+        type=similarity_threshold,
+        default=0,
+        help=(
+            "Drop near-duplicates at or above this estimated similarity, "
+            f"e.g. {DEFAULT_THRESHOLD} (default: 0, keep them)"
+        )
+    )
     parser.add_argument(
         "--seed",
         type=int,
@@ -204,6 +276,10 @@ def main():
         else:
             print(f"Warning: Source not found: {source_path}")
 
+    if args.similarity_threshold > 0:
+        all_questions, dropped = drop_near_duplicates(all_questions, args.similarity_threshold)
+        print(f"Dropped {len(dropped)} near-duplicate questions")
+
     print_stats(all_questions, "Full Merged Dataset")
 
     # Create full bundle
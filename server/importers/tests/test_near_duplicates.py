@@ -0,0 +1,200 @@
+"""
+Tests for MinHash/LSH near-duplicate detection.
+
+Tests cover:
+- Text normalization and shingling
+- Signature and similarity estimates
+- Index updates, queries and clustering
+- Precision and recall on the labelled fixture
+- Near-duplicate dropping when merging question bundles
+"""
+
+import argparse
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from ..core.near_duplicates import (
+    NearDuplicateIndex,
+    normalize_answer,
+    normalize_text,
+    optimal_bands,
+    shingles,
+)
+from ..plugins.sources.merge_kb_questions import drop_near_duplicates, similarity_threshold
+
+FIXTURE = Path(__file__).parent / "fixtures" / "near_duplicate_questions.json"
+
+
+def load_fixture():
+    with open(FIXTURE) as f:
+        return json.load(f)["questions"]
+
+
+def cluster_pairs(index):
+    """All pairs of keys that share a cluster."""
+    pairs = set()
+    for cluster in index.clusters():
+        keys = [key for key, _ in cluster.members]
+        pairs.update(frozenset(pair) for pair in itertools.combinations(keys, 2))
+    return pairs
+
+
+class TestNormalization:
+    """Tests for normalize_text, normalize_answer and shingles."""
+
+    def test_normalize_text(self):
+        assert normalize_text("For 10 points, name THIS  Café's owner (*)!") == "name this cafe s owner"
+        assert normalize_text("") == ""
+        assert normalize_text(None) == ""
+
+    def test_normalize_answer(self):
+        assert normalize_answer("W) The Mitochondrion (organelle)") == "mitochondrion"
+        assert normalize_answer("DNA [accept deoxyribonucleic acid]") == "dna"
+
+    def test_shingles(self):
+        assert shingles("Abcd!", 3) == {b"abc", b"bcd"}
+        assert shingles("Hi", 3) == {b"hi"}
+        assert shingles("?!", 3) == set()
+
+
+class TestSignatures:
+    """Tests for signatures and similarity estimates."""
+
+    def test_deterministic_and_exact_for_equal_text(self):
+        a, b = NearDuplicateIndex(), NearDuplicateIndex()
+        signature = a.signature("What is the SI unit of force?", "Newton")
+        assert signature == b.signature("what is the SI unit of force", "newton")
+        assert len(signature) == a.num_perm
+        assert a.similarity(signature, signature) == 1.0
+
+    def test_no_text_has_no_signature(self):
+        assert NearDuplicateIndex().signature("", "") is None
+
+    def test_estimate_tracks_jaccard(self):
+        index = NearDuplicateIndex(answer_weight=1)
+        text = "Which scientist formulated the three laws of motion and universal gravitation"
+        for edited in (text, text.replace("three", "3"), text[:40], "An unrelated question about rivers"):
+            a, b = shingles(text), shingles(edited)
+            exact = len(a & b) / len(a | b)
+            estimate = index.similarity(index.signature(text), index.signature(edited))
+            assert abs(estimate - exact) < 0.2
+
+    def test_optimal_bands(self):
+        bands, rows = optimal_bands(0.7, 128)
+        assert bands * rows <= 128
+        # A higher threshold needs more rows per band
+        assert optimal_bands(0.9, 128)[1] > rows > optimal_bands(0.5, 128)[1]
+
+    def test_rejects_bad_threshold(self):
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(threshold=0)
+
+
+class TestIndex:
+    """Tests for index updates and queries."""
+
+    @pytest.fixture
+    def index(self):
+        index = NearDuplicateIndex()
+        index.add("mars", "Which planet is known as the Red Planet?", "Mars")
+        index.add("gold", "What is the chemical symbol for gold?", "Au")
+        return index
+
+    def test_query(self, index):
+        [(key, similarity)] = index.query("Which planet is known as the red planet", "Mars")
+        assert key == "mars"
+        assert similarity == 1.0
+        assert index.query("What is the chemical symbol for silver?", "Ag") == []
+
+    def test_similar_to_excludes_self(self, index):
+        index.add("mars-2", "For 10 points, which planet is known as the Red Planet?", "Mars")
+        assert [key for key, _ in index.similar_to("mars")] == ["mars-2"]
+
+    def test_readd_replaces_text(self, index):
+        index.add("gold", "Which planet is known as the Red Planet?", "Mars")
+        assert [key for key, _ in index.similar_to("mars")] == ["gold"]
+
+    def test_remove_and_retain(self, index):
+        index.remove("mars")
+        index.remove("missing")
+        assert "mars" not in index
+        assert index.query("Which planet is known as the Red Planet?", "Mars") == []
+        index.retain([])
+        assert len(index) == 0
+
+    def test_add_checked(self, index):
+        matches = index.add_checked("mars-2", "Which planet is known as the Red Planet?", "Mars")
+        assert [key for key, _ in matches] == ["mars"]
+        assert "mars-2" in index
+
+    def test_subset_reuses_signatures(self, index):
+        subset = index.subset(["gold", "missing"], threshold=0.9)
+        assert len(subset) == 1
+        assert subset.threshold == 0.9
+        assert subset.get_signature("gold") == index.get_signature("gold")
+
+    def test_clusters(self):
+        index = NearDuplicateIndex()
+        for key in range(50):
+            index.add(key, "Which organelle is called the powerhouse of the cell?", "Mitochondria")
+        index.add("typo", "Which organelle is called the powrhouse of the cell?", "Mitochondria")
+        index.add("other", "What is the largest ocean on Earth?", "Pacific")
+
+        [cluster] = index.clusters()
+        assert cluster.representative == 0
+        assert cluster.members[0] == (0, 1.0)
+        assert len(cluster.members) == 51
+        assert dict(cluster.members)["typo"] >= index.threshold
+
+
+class TestFixture:
+    """Precision and recall on the labelled fixture."""
+
+    def test_precision_and_recall(self):
+        questions = load_fixture()
+        index = NearDuplicateIndex()
+        for q in questions:
+            index.add(q["id"], q["question_text"], q["answer_text"])
+
+        group = {q["id"]: q["group"] for q in questions}
+        truth = {frozenset(p) for p in itertools.combinations(group, 2) if group[p[0]] == group[p[1]]}
+        predicted = cluster_pairs(index)
+        true_positives = len(predicted & truth)
+
+        assert true_positives / len(predicted) >= 0.9
+        assert true_positives / len(truth) >= 0.9
+
+    def test_templated_questions_with_different_answers_are_distinct(self):
+        index = NearDuplicateIndex()
+        for q in load_fixture():
+            if q["group"].startswith(("sym-", "cap-", "sq-")):
+                index.add(q["id"], q["question_text"], q["answer_text"])
+        assert index.clusters() == []
+
+
+class TestDropNearDuplicates:
+    """Tests for merge_kb_questions.drop_near_duplicates."""
+
+    def test_keeps_first_of_each_group(self):
+        questions = [
+            {"id": "a", "text": "Which planet is known as the Red Planet?", "answer": {"primary": "Mars"}},
+            {"id": "b", "text": "What is the largest ocean on Earth?", "answer": "Pacific Ocean"},
+            {"id": "c", "text": "FTP, which planet is known as the Red Planet?", "answer": {"primary": "MARS"}},
+            {"id": "d", "text": "", "answer": ""},
+        ]
+        kept, dropped = drop_near_duplicates(questions)
+
+        assert [q["id"] for q in kept] == ["a", "b", "d"]
+        assert [(d["id"], d["duplicate_of"]) for d in dropped] == [("c", "a")]
+        assert dropped[0]["similarity"] >= 0.7
+
+    def test_threshold_option_range(self):
+        assert similarity_threshold("0") == 0
+        assert similarity_threshold("0.85") == 0.85
+        assert similarity_threshold("1") == 1
+        for value in ("-0.1", "1.5", "high"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                similarity_threshold(value)
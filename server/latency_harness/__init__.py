@@ -17,11 +17,13 @@ from .models import (
     AnalysisReport,
     PerformanceBaseline,
     BaselineMetrics,
+    LoadLevelResult,
     NetworkProfile,
     RunStatus,
 )
 from .orchestrator import LatencyTestOrchestrator
 from .analyzer import ResultsAnalyzer
+from .load import LoadProfile, LoadTarget, RampStage
 from .storage import (
     LatencyHarnessStorage,
     FileBasedLatencyStorage,
@@ -42,11 +44,16 @@ __all__ = [
     'AnalysisReport',
     'PerformanceBaseline',
     'BaselineMetrics',
+    'LoadLevelResult',
     'NetworkProfile',
     'RunStatus',
     # Orchestration
     'LatencyTestOrchestrator',
     'ResultsAnalyzer',
+    # Load generation
+    'LoadProfile',
+    'LoadTarget',
+    'RampStage',
     # Storage
     'LatencyHarnessStorage',
     'FileBasedLatencyStorage',
@@ -4,8 +4,7 @@ UnaMentis Latency Test Harness - Results Analyzer
 Statistical analysis and reporting for test results.
 """
 
-import statistics
-from collections import defaultdict
+import math
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -19,20 +18,64 @@ from .models import (
     NetworkMeetsTarget,
     NetworkProjection,
     Regression,
+    RegressionCheck,
     RegressionSeverity,
     NetworkProfile,
+    PerformanceBaseline,
+    BaselineMetrics,
 )
+from .stats import (
+    METRICS,
+    ResultColumns,
+    benjamini_hochberg,
+    mann_whitney_u,
+    network_hops,
+    percentile_sorted,
+    quantile_exceedance_test,
+)
+
+# Metric key -> name used in regression reports ("e2e" -> "e2e_median_ms")
+REGRESSION_METRIC_NAMES = {
+    "e2e": "e2e",
+    "stt": "stt",
+    "llmTTFB": "llm_ttfb",
+    "llmCompletion": "llm_completion",
+    "ttsTTFB": "tts_ttfb",
+    "ttsCompletion": "tts_completion",
+}
+
+# Tail quantiles checked alongside the median
+REGRESSION_TAIL_PERCENTILES = (95, 99)
 
 
 def percentile(data: List[float], p: int) -> float:
     """Calculate the p-th percentile of a list."""
-    if not data:
-        return 0.0
-    sorted_data = sorted(data)
-    k = (len(sorted_data) - 1) * p / 100
-    f = int(k)
-    c = f + 1 if f + 1 < len(sorted_data) else f
-    return sorted_data[f] + (k - f) * (sorted_data[c] - sorted_data[f])
+    return percentile_sorted(sorted(data), p)
+
+
+def baseline_metrics(columns: ResultColumns, config_id: Optional[str] = None) -> BaselineMetrics:
+    """
+    Baseline metrics for one configuration, or for all results.
+
+    Keeps thinned per-metric distributions for significance tests next to
+    the summary values. P99 here is the nearest-rank value, as baselines
+    have always stored it.
+    """
+    e2e = columns.column("e2e", config_id)
+    stt = columns.column("stt", config_id)
+    return BaselineMetrics(
+        median_e2e_ms=e2e.median(),
+        p99_e2e_ms=float(e2e.values[int(len(e2e) * 0.99)]),
+        min_e2e_ms=e2e.min(),
+        max_e2e_ms=e2e.max(),
+        median_stt_ms=stt.median() if len(stt) else None,
+        median_llm_ttfb_ms=columns.column("llmTTFB", config_id).median(),
+        median_llm_completion_ms=columns.column("llmCompletion", config_id).median(),
+        median_tts_ttfb_ms=columns.column("ttsTTFB", config_id).median(),
+        median_tts_completion_ms=columns.column("ttsCompletion", config_id).median(),
+        sample_count=len(e2e),
+        distributions=columns.distributions(config_id),
+    )
 
 
 class ResultsAnalyzer:
@@ -45,23 +88,57 @@ class ResultsAnalyzer:
     - Configuration ranking
     - Regression detection against baselines
     - Recommendations generation
+
+    Regressions against a PerformanceBaseline with stored distributions
+    must be statistically significant (Mann-Whitney U for medians, a
+    binomial exceedance test for P95/P99, Benjamini-Hochberg across all
+    checks) and at least min_regression_change large. Comparisons with
+    too few samples are skipped rather than guessed.
+
+    Each metric is extracted and sorted once per analysis (see
+    stats.ResultColumns), vectorized with NumPy when it is installed.
     """
 
-    def __init__(self, baselines: Optional[Dict[str, Dict[str, float]]] = None):
+    # Fewer values than this on either side and a check is skipped
+    MIN_REGRESSION_SAMPLES = 8
+    # Tail checks need this many values expected above the quantile
+    MIN_TAIL_EXCEEDANCES = 2
+    # Cliff's delta below this is a negligible effect (Romano et al.)
+    MIN_EFFECT_SIZE = 0.147
+
+    def __init__(
+        self,
+        baselines: Optional[Dict[str, Dict[str, float]]] = None,
+        false_discovery_rate: float = 0.05,
+        min_regression_change: float = 0.10,
+    ):
         """
         Initialize the analyzer.
 
         Args:
             baselines: Optional dict of config_id -> {metric: value} for regression detection
+            false_discovery_rate: Expected share of false alarms among reported regressions
+            min_regression_change: Smallest relative slowdown reported (0.1 = 10%)
         """
         self.baselines = baselines or {}
+        self.false_discovery_rate = false_discovery_rate
+        self.min_regression_change = min_regression_change
 
-    def analyze(self, run: TestRun) -> AnalysisReport:
+    def analyze(
+        self,
+        run: TestRun,
+        baseline: Optional[PerformanceBaseline] = None,
+        regression_threshold: Optional[float] = None,
+    ) -> AnalysisReport:
         """
         Analyze a test run and generate a comprehensive report.
 
         Args:
             run: The test run to analyze
+            baseline: Optional baseline to check for regressions, instead
+                of the scalar baselines given to the constructor
+            regression_threshold: Smallest relative slowdown reported
+                (defaults to min_regression_change)
 
         Returns:
             AnalysisReport with statistics, rankings, and recommendations
@@ -74,11 +151,24 @@ class ResultsAnalyzer:
         if not successful_results:
             return self._empty_report(run.id)
 
+        columns = ResultColumns(successful_results)
+
         # Compute statistics
-        summary = self._compute_summary(run, successful_results)
-        ranked_configs = self._rank_configurations(successful_results)
-        network_projections = self._compute_network_projections(successful_results)
-        regressions = self._detect_regressions(successful_results)
+        summary = self._compute_summary(run, columns)
+        ranked_configs = self._rank_configurations(columns)
+        network_projections = self._compute_network_projections(columns)
+        min_change = (
+            regression_threshold if regression_threshold is not None
+            else self.min_regression_change
+        )
+        if baseline is not None:
+            regression_checks = self._check_baseline(columns, baseline, min_change)
+            regressions = [
+                self._regression_from_check(c) for c in regression_checks if c.regressed
+            ]
+        else:
+            regression_checks = []
+            regressions = self._detect_regressions(columns)
         recommendations = self._generate_recommendations(
             ranked_configs, network_projections, regressions
         )
@@ -91,92 +181,60 @@ class ResultsAnalyzer:
             network_projections=network_projections,
             regressions=regressions,
             recommendations=recommendations,
+            regression_checks=regression_checks,
         )
 
     def _compute_summary(
-        self, run: TestRun, results: List[TestResult]
+        self, run: TestRun, columns: ResultColumns
     ) -> SummaryStatistics:
         """Compute overall summary statistics."""
-        e2e_latencies = [r.e2e_latency_ms for r in results]
-        stt_latencies = [r.stt_latency_ms for r in results if r.stt_latency_ms]
-        llm_ttfb = [r.llm_ttfb_ms for r in results]
-        llm_completion = [r.llm_completion_ms for r in results]
-        tts_ttfb = [r.tts_ttfb_ms for r in results]
-        tts_completion = [r.tts_completion_ms for r in results]
-
-        # Group by config to count unique configurations
-        by_config = defaultdict(list)
-        for r in results:
-            by_config[r.config_id].append(r)
+        e2e = columns.column("e2e")
+        stt = columns.column("stt")
 
         return SummaryStatistics(
-            total_configurations=len(by_config),
+            total_configurations=len(columns.config_ids),
             total_tests=len(run.results),
-            successful_tests=len(results),
-            failed_tests=len(run.results) - len(results),
-            overall_median_e2e_ms=statistics.median(e2e_latencies),
-            overall_p99_e2e_ms=percentile(e2e_latencies, 99),
-            overall_min_e2e_ms=min(e2e_latencies),
-            overall_max_e2e_ms=max(e2e_latencies),
-            median_stt_ms=statistics.median(stt_latencies) if stt_latencies else None,
-            median_llm_ttfb_ms=statistics.median(llm_ttfb),
-            median_llm_completion_ms=statistics.median(llm_completion),
-            median_tts_ttfb_ms=statistics.median(tts_ttfb),
-            median_tts_completion_ms=statistics.median(tts_completion),
+            successful_tests=len(columns),
+            failed_tests=len(run.results) - len(columns),
+            overall_median_e2e_ms=e2e.median(),
+            overall_p99_e2e_ms=e2e.percentile(99),
+            overall_min_e2e_ms=e2e.min(),
+            overall_max_e2e_ms=e2e.max(),
+            median_stt_ms=stt.median() if len(stt) else None,
+            median_llm_ttfb_ms=columns.column("llmTTFB").median(),
+            median_llm_completion_ms=columns.column("llmCompletion").median(),
+            median_tts_ttfb_ms=columns.column("ttsTTFB").median(),
+            median_tts_completion_ms=columns.column("ttsCompletion").median(),
             test_duration_minutes=run.elapsed_time / 60,
         )
 
     def _rank_configurations(
-        self, results: List[TestResult]
+        self, columns: ResultColumns
     ) -> List[RankedConfiguration]:
         """Rank configurations by E2E latency performance."""
-        # Group by config
-        by_config: Dict[str, List[TestResult]] = defaultdict(list)
-        for r in results:
-            by_config[r.config_id].append(r)
-
         ranked = []
-        for config_id, config_results in by_config.items():
-            e2e = [r.e2e_latency_ms for r in config_results]
-            stt = [r.stt_latency_ms for r in config_results if r.stt_latency_ms]
-            llm_ttfb = [r.llm_ttfb_ms for r in config_results]
-            llm_completion = [r.llm_completion_ms for r in config_results]
-            tts_ttfb = [r.tts_ttfb_ms for r in config_results]
-            tts_completion = [r.tts_completion_ms for r in config_results]
+        for config_id in columns.config_ids:
+            e2e = columns.column("e2e", config_id)
+            stt = columns.column("stt", config_id)
 
             breakdown = LatencyBreakdown(
-                stt_ms=statistics.median(stt) if stt else None,
-                llm_ttfb_ms=statistics.median(llm_ttfb),
-                llm_completion_ms=statistics.median(llm_completion),
-                tts_ttfb_ms=statistics.median(tts_ttfb),
-                tts_completion_ms=statistics.median(tts_completion),
+                stt_ms=stt.median() if len(stt) else None,
+                llm_ttfb_ms=columns.column("llmTTFB", config_id).median(),
+                llm_completion_ms=columns.column("llmCompletion", config_id).median(),
+                tts_ttfb_ms=columns.column("ttsTTFB", config_id).median(),
+                tts_completion_ms=columns.column("ttsCompletion", config_id).median(),
             )
 
-            # Calculate network projections for this config
+            # Calculate network projections for this config, counting
+            # the stages that require the network
             network_projections = {}
-            first_result = config_results[0]
-
-            # Determine which stages require network
-            stt_requires = first_result.stt_config and first_result.stt_config.get(
-                "provider"
-            ) not in ["apple", "glm-asr-ondevice", "web-speech"]
-            llm_requires = first_result.llm_config and first_result.llm_config.get(
-                "provider"
-            ) not in ["mlx"]
-            tts_requires = first_result.tts_config and first_result.tts_config.get(
-                "provider"
-            ) not in ["apple", "web-speech"]
+            first_result = columns.first_result(config_id)
+            hops = network_hops(first_result)
 
-            median_e2e = statistics.median(e2e)
+            median_e2e = e2e.median()
 
             for profile in NetworkProfile:
-                projected = median_e2e
-                if stt_requires:
-                    projected += profile.added_latency_ms
-                if llm_requires:
-                    projected += profile.added_latency_ms
-                if tts_requires:
-                    projected += profile.added_latency_ms
+                projected = median_e2e + profile.added_latency_ms * hops
 
                 network_projections[profile.value] = NetworkMeetsTarget(
                     e2e_ms=projected,
@@ -192,9 +250,9 @@ class ResultsAnalyzer:
                     rank=0,  # Will be set after sorting
                     config_id=config_id,
                     median_e2e_ms=median_e2e,
-                    p99_e2e_ms=percentile(e2e, 99),
-                    stddev_ms=statistics.stdev(e2e) if len(e2e) > 1 else 0,
-                    sample_count=len(config_results),
+                    p99_e2e_ms=e2e.percentile(99),
+                    stddev_ms=e2e.stdev(),
+                    sample_count=columns.count(config_id),
                     breakdown=breakdown,
                     network_projections=network_projections,
                     estimated_cost_per_hour=estimated_cost,
@@ -206,95 +264,48 @@ class ResultsAnalyzer:
 
         # Assign ranks
         for i, config in enumerate(ranked):
-            ranked[i] = RankedConfiguration(
-                rank=i + 1,
-                config_id=config.config_id,
-                median_e2e_ms=config.median_e2e_ms,
-                p99_e2e_ms=config.p99_e2e_ms,
-                stddev_ms=config.stddev_ms,
-                sample_count=config.sample_count,
-                breakdown=config.breakdown,
-                network_projections=config.network_projections,
-                estimated_cost_per_hour=config.estimated_cost_per_hour,
-            )
+            config.rank = i + 1
 
         return ranked
 
     def _compute_network_projections(
-        self, results: List[TestResult]
+        self, columns: ResultColumns
     ) -> List[NetworkProjection]:
         """Compute aggregate network projections."""
-        # Group by config for unique configs count
-        by_config: Dict[str, List[TestResult]] = defaultdict(list)
-        for r in results:
-            by_config[r.config_id].append(r)
-
-        total_configs = len(by_config)
+        total_configs = len(columns.config_ids)
 
         projections = []
         for profile in NetworkProfile:
-            # Collect projected E2E for this network profile
-            projected_values = []
-
-            for r in results:
-                if r.network_projections and profile.value in r.network_projections:
-                    projected_values.append(r.network_projections[profile.value])
-                else:
-                    # Calculate on the fly
-                    projected = r.e2e_latency_ms
-
-                    stt_requires = r.stt_config and r.stt_config.get(
-                        "provider"
-                    ) not in ["apple", "glm-asr-ondevice", "web-speech"]
-                    llm_requires = r.llm_config and r.llm_config.get(
-                        "provider"
-                    ) not in ["mlx"]
-                    tts_requires = r.tts_config and r.tts_config.get(
-                        "provider"
-                    ) not in ["apple", "web-speech"]
-
-                    if stt_requires:
-                        projected += profile.added_latency_ms
-                    if llm_requires:
-                        projected += profile.added_latency_ms
-                    if tts_requires:
-                        projected += profile.added_latency_ms
-
-                    projected_values.append(projected)
-
-            if not projected_values:
+            # Projected E2E for every result on this network profile
+            projected = columns.projected_e2e(profile)
+
+            if not len(projected):
                 continue
 
-            median_projected = statistics.median(projected_values)
-            configs_meeting = sum(1 for v in projected_values if v < 500)
+            median_projected = projected.median()
 
             projections.append(
                 NetworkProjection(
                     network=profile.value,
                     added_latency_ms=profile.added_latency_ms,
                     projected_median_ms=median_projected,
-                    projected_p99_ms=percentile(projected_values, 99),
+                    projected_p99_ms=projected.percentile(99),
                     meets_target=median_projected < 500,
-                    configs_meeting_target=configs_meeting,
+                    configs_meeting_target=projected.count_below(500),
                     total_configs=total_configs,
                 )
             )
 
         return projections
 
-    def _detect_regressions(self, results: List[TestResult]) -> List[Regression]:
+    def _detect_regressions(self, columns: ResultColumns) -> List[Regression]:
         """Detect regressions against baselines."""
         if not self.baselines:
             return []
 
         regressions = []
 
-        # Group by config
-        by_config: Dict[str, List[TestResult]] = defaultdict(list)
-        for r in results:
-            by_config[r.config_id].append(r)
-
-        for config_id, config_results in by_config.items():
+        for config_id in columns.config_ids:
             if config_id not in self.baselines:
                 continue
 
@@ -302,9 +313,7 @@ class ResultsAnalyzer:
 
             # Check E2E latency
             if "e2e_median_ms" in baseline:
-                current_median = statistics.median(
-                    [r.e2e_latency_ms for r in config_results]
-                )
+                current_median = columns.column("e2e", config_id).median()
                 baseline_value = baseline["e2e_median_ms"]
 
                 change_percent = (
@@ -312,12 +321,6 @@ class ResultsAnalyzer:
                 )
 
                 if change_percent > 10:  # More than 10% regression
-                    severity = RegressionSeverity.MINOR
-                    if change_percent > 50:
-                        severity = RegressionSeverity.SEVERE
-                    elif change_percent > 20:
-                        severity = RegressionSeverity.MODERATE
-
                     regressions.append(
                         Regression(
                             config_id=config_id,
@@ -325,12 +328,147 @@ class ResultsAnalyzer:
                             baseline_value=baseline_value,
                             current_value=current_median,
                             change_percent=change_percent,
-                            severity=severity,
+                            severity=self._severity(change_percent),
                         )
                     )
 
         return regressions
 
+    def _check_baseline(
+        self,
+        columns: ResultColumns,
+        baseline: PerformanceBaseline,
+        min_change: float,
+    ) -> List[RegressionCheck]:
+        """Compare every configuration and metric with a stored baseline."""
+        checks: List[RegressionCheck] = []
+        for config_id in columns.config_ids:
+            metrics = baseline.config_metrics.get(config_id)
+            if metrics is None:
+                continue
+            if not metrics.distributions:
+                checks.append(self._threshold_check(columns, config_id, metrics, min_change))
+                continue
+
+            for metric in METRICS:
+                baseline_values = metrics.distributions.get(metric)
+                current = columns.column(metric, config_id)
+                if not baseline_values or not len(current):
+                    continue
+                checks.append(self._median_check(config_id, metric, baseline_values, current))
+                for p in REGRESSION_TAIL_PERCENTILES:
+                    checks.append(self._tail_check(config_id, metric, baseline_values, current, p))
+
+        # Adjust for the number of comparisons, then require a real slowdown
+        tested = [c for c in checks if c.method != "threshold" and c.p_value is not None]
+        for check, adjusted in zip(tested, benjamini_hochberg([c.p_value for c in tested])):
+            check.p_value = adjusted
+            check.regressed = (
+                adjusted <= self.false_discovery_rate
+                and check.change_percent >= min_change * 100
+                and (check.method != "mann_whitney_u" or check.effect_size >= self.MIN_EFFECT_SIZE)
+            )
+        return checks
+
+    def _median_check(
+        self, config_id: str, metric: str, baseline_values: List[float], current
+    ) -> RegressionCheck:
+        baseline_median = percentile_sorted(baseline_values, 50)
+        check = RegressionCheck(
+            config_id=config_id,
+            metric=f"{REGRESSION_METRIC_NAMES[metric]}_median_ms",
+            method="mann_whitney_u",
+            baseline_count=len(baseline_values),
+            current_count=len(current),
+            baseline_value=baseline_median,
+            current_value=current.median(),
+        )
+        if min(check.baseline_count, check.current_count) < self.MIN_REGRESSION_SAMPLES:
+            check.skipped_reason = f"fewer than {self.MIN_REGRESSION_SAMPLES} samples"
+            return check
+
+        check.change_percent = self._change_percent(baseline_median, check.current_value)
+        check.p_value, check.effect_size = mann_whitney_u(baseline_values, current.values)
+        return check
+
+    def _tail_check(
+        self, config_id: str, metric: str, baseline_values: List[float], current, p: int
+    ) -> RegressionCheck:
+        baseline_value = percentile_sorted(baseline_values, p)
+        check = RegressionCheck(
+            config_id=config_id,
+            metric=f"{REGRESSION_METRIC_NAMES[metric]}_p{p}_ms",
+            method="quantile_exceedance",
+            baseline_count=len(baseline_values),
+            current_count=len(current),
+            baseline_value=baseline_value,
+            current_value=current.percentile(p),
+        )
+        needed = math.ceil(self.MIN_TAIL_EXCEEDANCES / (1 - p / 100))
+        if min(check.baseline_count, check.current_count) < needed:
+            check.skipped_reason = f"fewer than {needed} samples"
+            return check
+
+        result = quantile_exceedance_test(baseline_values, current.values, p / 100)
+        if result is None:
+            check.skipped_reason = "baseline too small to bound the quantile"
+            return check
+
+        check.change_percent = self._change_percent(baseline_value, check.current_value)
+        check.p_value, check.effect_size = result
+        return check
+
+    def _threshold_check(
+        self,
+        columns: ResultColumns,
+        config_id: str,
+        metrics: BaselineMetrics,
+        min_change: float,
+    ) -> RegressionCheck:
+        """Median E2E against a baseline saved without distributions."""
+        current_median = columns.column("e2e", config_id).median()
+        change_percent = self._change_percent(metrics.median_e2e_ms, current_median)
+        return RegressionCheck(
+            config_id=config_id,
+            metric="e2e_median_ms",
+            method="threshold",
+            baseline_count=metrics.sample_count,
+            current_count=columns.count(config_id),
+            baseline_value=metrics.median_e2e_ms,
+            current_value=current_median,
+            change_percent=change_percent,
+            regressed=change_percent > min_change * 100,
+        )
+
+    def _regression_from_check(self, check: RegressionCheck) -> Regression:
+        return Regression(
+            config_id=check.config_id,
+            metric=check.metric,
+            baseline_value=check.baseline_value,
+            current_value=check.current_value,
+            change_percent=check.change_percent,
+            severity=self._severity(check.change_percent),
+            method=check.method,
+            p_value=check.p_value,
+            effect_size=check.effect_size,
+            baseline_count=check.baseline_count,
+            current_count=check.current_count,
+        )
+
+    @staticmethod
+    def _change_percent(baseline_value: float, current_value: float) -> float:
+        if not baseline_value:
+            return 0.0
+        return (current_value - baseline_value) / baseline_value * 100
+
+    @staticmethod
+    def _severity(change_percent: float) -> RegressionSeverity:
+        if change_percent > 50:
+            return RegressionSeverity.SEVERE
+        if change_percent > 20:
+            return RegressionSeverity.MODERATE
+        return RegressionSeverity.MINOR
+
     def _generate_recommendations(
         self,
         ranked_configs: List[RankedConfiguration],
@@ -478,18 +616,18 @@ class ResultsAnalyzer:
         report2 = self.analyze(run2)
 
         # Find common configurations
-        configs1 = {c.config_id for c in report1.best_configurations}
-        configs2 = {c.config_id for c in report2.best_configurations}
+        configs1 = {c.config_id: c for c in report1.best_configurations}
+        configs2 = {c.config_id: c for c in report2.best_configurations}
 
-        common = configs1 & configs2
-        added = configs2 - configs1
-        removed = configs1 - configs2
+        common = configs1.keys() & configs2.keys()
+        added = configs2.keys() - configs1.keys()
+        removed = configs1.keys() - configs2.keys()
 
         # Compare common configurations
         changes = []
         for config_id in common:
-            cfg1 = next(c for c in report1.best_configurations if c.config_id == config_id)
-            cfg2 = next(c for c in report2.best_configurations if c.config_id == config_id)
+            cfg1 = configs1[config_id]
+            cfg2 = configs2[config_id]
 
             change_pct = (cfg2.median_e2e_ms - cfg1.median_e2e_ms) / cfg1.median_e2e_ms * 100
 
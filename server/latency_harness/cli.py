@@ -16,6 +16,13 @@ Usage:
 
     # Check for regressions against baseline
     python -m latency_harness.cli --suite quick_validation --baseline baseline_id --regression-threshold 0.2
+
+    # Latency vs throughput under concurrent load, against local stub servers
+    python -m latency_harness.cli --load --clients 1 2 4 8 16 --rate-per-client 0.5 --stage-duration 30
+
+    # The same against real OpenAI-compatible LLM and TTS servers
+    python -m latency_harness.cli --load --llm-url http://localhost:11434/v1/chat/completions \
+        --llm-model llama3.2 --tts-url http://localhost:8004/v1/audio/speech
 """
 
 import argparse
@@ -33,10 +40,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from latency_harness.orchestrator import LatencyTestOrchestrator
 from latency_harness.storage import FileBasedLatencyStorage, create_latency_storage
 from latency_harness.analyzer import ResultsAnalyzer
+from latency_harness.load import LoadProfile, LoadTarget, start_stub_servers
 from latency_harness.models import (
     ClientType,
     ClientCapabilities,
+    LLMTestConfig,
     RunStatus,
+    TTSTestConfig,
     create_quick_validation_suite,
     create_provider_comparison_suite,
 )
@@ -168,6 +178,53 @@ class LatencyTestCLI:
             "recommendations": report.recommendations,
         }
 
+    async def run_load_test(
+        self,
+        profile: LoadProfile,
+        target: Optional[LoadTarget] = None,
+        timeout: int = 300,
+    ) -> dict:
+        """
+        Run an open-loop load test and return its latency vs throughput curve.
+
+        Args:
+            profile: Load stages to run, in order
+            target: LLM and TTS endpoints; local stub servers if None
+            timeout: Maximum time to wait for all stages (seconds)
+
+        Returns:
+            dict with one entry per stage
+        """
+        stub_runner = None
+        if target is None:
+            stub_runner, target = await start_stub_servers()
+
+        try:
+            run = await self.orchestrator.start_load_run(profile, target)
+            logger.info(f"Started load run: {run.id}")
+
+            start_time = datetime.now()
+            while run.status == RunStatus.RUNNING:
+                elapsed = (datetime.now() - start_time).total_seconds()
+                if elapsed > timeout:
+                    await self.orchestrator.cancel_run(run.id)
+                    raise TimeoutError(f"Load run timed out after {timeout} seconds")
+                await asyncio.sleep(0.5)
+        finally:
+            if stub_runner:
+                await stub_runner.cleanup()
+
+        if run.status == RunStatus.FAILED:
+            raise RuntimeError(f"Load run failed: {run.id}")
+
+        return {
+            "run_id": run.id,
+            "status": run.status.value,
+            "stub_servers": stub_runner is not None,
+            "elapsed_seconds": run.elapsed_time,
+            "levels": [level.to_dict() for level in run.load_levels],
+        }
+
     async def check_regression(
         self,
         run_id: str,
@@ -185,7 +242,7 @@ class LatencyTestCLI:
         Returns:
             dict with regression analysis
         """
-        run = self.orchestrator.get_run(run_id)
+        run = await self.orchestrator.load_run(run_id)
         if not run:
             raise ValueError(f"Run not found: {run_id}")
 
@@ -213,9 +270,13 @@ class LatencyTestCLI:
                     "current_value": r.current_value,
                     "change_percent": r.change_percent,
                     "severity": r.severity.value,
+                    "method": r.method,
+                    "p_value": r.p_value,
+                    "effect_size": r.effect_size,
                 }
                 for r in report.regressions
             ],
+            "skipped_checks": sum(1 for c in report.regression_checks if c.skipped_reason),
             "pass": not has_regressions,
         }
 
@@ -276,6 +337,55 @@ async def main():
         help="Data directory for storage",
     )
 
+    # Load test options
+    parser.add_argument(
+        "--load",
+        action="store_true",
+        help="Run an open-loop load test instead of a suite",
+    )
+    parser.add_argument(
+        "--clients",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="Concurrent virtual clients per stage (default: 1 2 4 8 16)",
+    )
+    parser.add_argument(
+        "--rate-per-client",
+        type=float,
+        default=0.5,
+        help="Poisson arrivals per second per client (default: 0.5)",
+    )
+    parser.add_argument(
+        "--stage-duration",
+        type=float,
+        default=30,
+        help="Seconds of arrivals per stage (default: 30)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for the arrival schedule",
+    )
+    parser.add_argument(
+        "--llm-url",
+        help="OpenAI-compatible chat completions URL (default: local stub servers)",
+    )
+    parser.add_argument(
+        "--llm-model",
+        default="stub",
+        help="Model name sent to --llm-url",
+    )
+    parser.add_argument(
+        "--tts-url",
+        help="OpenAI-compatible speech URL (default: local stub servers)",
+    )
+    parser.add_argument(
+        "--tts-voice",
+        default="nova",
+        help="Voice sent to --tts-url",
+    )
+
     # CI-specific options
     parser.add_argument(
         "--ci",
@@ -320,6 +430,43 @@ async def main():
                     print(f"    Description: {suite.description}")
                     print()
 
+        elif args.load:
+            if bool(args.llm_url) != bool(args.tts_url):
+                raise ValueError("--llm-url and --tts-url must be given together")
+            target = None
+            if args.llm_url:
+                target = LoadTarget(
+                    llm_url=args.llm_url,
+                    tts_url=args.tts_url,
+                    llm=LLMTestConfig(provider="openai_compatible", model=args.llm_model),
+                    tts=TTSTestConfig(provider="openai_compatible", voice_id=args.tts_voice),
+                )
+            profile = LoadProfile.ramp(
+                args.clients, args.rate_per_client, args.stage_duration, seed=args.seed
+            )
+            result = await cli.run_load_test(profile, target, timeout=args.timeout)
+
+            if args.output == "json":
+                print(json.dumps(result, indent=2))
+            else:
+                print("\n" + "=" * 60)
+                print(f"Load Run Complete: {result['run_id']}")
+                print("=" * 60)
+                print(f"Targets: {'local stub servers' if result['stub_servers'] else args.llm_url}")
+                print(f"Duration: {result['elapsed_seconds']:.1f}s")
+                print()
+                print(f"{'clients':>7} {'offered/s':>9} {'achieved/s':>10} {'p50 ms':>8} "
+                      f"{'p95 ms':>8} {'p99 ms':>8} {'queue p99':>9} {'failed':>6}")
+                for level in result['levels']:
+                    p50, p95, p99 = (level[k] or 0.0 for k in ("medianE2EMs", "p95E2EMs", "p99E2EMs"))
+                    print(f"{level['clients']:>7} {level['arrivalRate']:>9.2f} {level['throughputRps']:>10.2f} "
+                          f"{p50:>8.1f} {p95:>8.1f} {p99:>8.1f} "
+                          f"{level['p99QueueDelayMs'] or 0.0:>9.1f} {level['failed']:>6}")
+                print()
+
+            if args.ci and any(level['failed'] for level in result['levels']):
+                exit_code = 1
+
         elif args.suite:
             # Run test suite
             use_mock = args.mock and not args.no_mock
@@ -373,9 +520,12 @@ async def main():
                         for r in regression_result['regressions']:
                             print(f"  [{r['severity'].upper()}] {r['config_id']}: "
                                   f"{r['metric']} {r['change_percent']:+.1f}% "
-                                  f"({r['baseline_value']:.1f}ms -> {r['current_value']:.1f}ms)")
+                                  f"({r['baseline_value']:.1f}ms -> {r['current_value']:.1f}ms)"
+                                  + (f", p={r['p_value']:.3g}" if r['p_value'] is not None else ""))
                     else:
                         print("No regressions detected")
+                    if regression_result['skipped_checks']:
+                        print(f"Skipped (too few samples): {regression_result['skipped_checks']}")
                     print()
 
                 if args.fail_on_regression and regression_result['has_regressions']:
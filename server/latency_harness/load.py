@@ -0,0 +1,438 @@
+"""
+UnaMentis Latency Test Harness - Load Generation
+================================================
+
+Test runs execute one configuration at a time for one client, which
+measures uncontended latency. A load run asks the other question: what
+happens to latency when many learners are talking to the same LLM and
+TTS servers at once.
+
+Open-loop arrivals
+------------------
+Each `RampStage` offers requests at a Poisson arrival rate for a fixed
+duration, served by a fixed number of concurrent virtual clients. The
+arrival schedule is drawn up front and never waits for responses, so a
+slow server does not slow down the arrivals (open loop). When every
+client is busy, arrivals queue until a client frees up.
+
+Coordinated omission
+--------------------
+Latencies that matter to a learner are measured from the intended
+arrival time, not from when a client got around to sending the
+request. E2E latency therefore includes the time a request spent
+queued behind busy clients; the per-stage `LoadLevelResult` reports
+that queue delay separately. Per-stage LLM and TTS timings are service
+times, measured from when each request was actually sent.
+
+Each request streams an OpenAI-style chat completion, then sends the
+generated text to an OpenAI-style speech endpoint. E2E latency is the
+time from intended arrival to the first audio byte.
+
+Stages run one after another. Their results are stored as regular
+results of one run, with one config ID per stage, and the stage
+summaries are stored on the run, which gives a latency versus
+throughput curve.
+
+Stub servers
+------------
+`start_stub_servers` serves both endpoints from one local aiohttp app
+with configurable timings and a limited number of parallel slots, so
+load runs (and their tests) need no real providers.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+from aiohttp import web
+
+from .models import (
+    ClientType,
+    LLMTestConfig,
+    LoadLevelResult,
+    NetworkProfile,
+    TestResult,
+    TTSTestConfig,
+)
+from .stats import MetricColumn
+
+logger = logging.getLogger(__name__)
+
+LOAD_SCENARIO_NAME = "load"
+STUB_PROVIDER = "stub"
+
+
+# =============================================================================
+# Profiles
+# =============================================================================
+
+
+@dataclass
+class RampStage:
+    """One load level: concurrent clients and the offered arrival rate."""
+    clients: int
+    arrival_rate: float  # requests per second
+    duration_s: float
+
+    @property
+    def config_id(self) -> str:
+        """Config ID of this stage's results."""
+        return f"load_c{self.clients}_r{self.arrival_rate:g}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "clients": self.clients,
+            "arrivalRate": self.arrival_rate,
+            "durationSeconds": self.duration_s,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RampStage":
+        return cls(
+            clients=data["clients"],
+            arrival_rate=data["arrivalRate"],
+            duration_s=data["durationSeconds"],
+        )
+
+
+@dataclass
+class LoadProfile:
+    """A named sequence of load stages."""
+    stages: List[RampStage]
+    name: str = "Load Test"
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if not self.stages:
+            raise ValueError("A load profile needs at least one stage")
+        for stage in self.stages:
+            if stage.clients < 1 or stage.arrival_rate <= 0 or stage.duration_s <= 0:
+                raise ValueError(f"Invalid load stage: {stage}")
+
+    @classmethod
+    def ramp(
+        cls,
+        clients: Sequence[int],
+        rate_per_client: float,
+        stage_duration_s: float,
+        seed: Optional[int] = None,
+    ) -> "LoadProfile":
+        """
+        Step through client counts, offering rate_per_client requests per
+        second for each client at every step.
+        """
+        return cls(
+            stages=[RampStage(n, n * rate_per_client, stage_duration_s) for n in clients],
+            seed=seed,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "seed": self.seed,
+            "stages": [s.to_dict() for s in self.stages],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadProfile":
+        return cls(
+            stages=[RampStage.from_dict(s) for s in data["stages"]],
+            name=data.get("name", "Load Test"),
+            seed=data.get("seed"),
+        )
+
+
+@dataclass
+class LoadTarget:
+    """The LLM and TTS endpoints a load run sends requests to."""
+    llm_url: str
+    tts_url: str
+    llm: LLMTestConfig = field(default_factory=lambda: LLMTestConfig(provider=STUB_PROVIDER, model=STUB_PROVIDER))
+    tts: TTSTestConfig = field(default_factory=lambda: TTSTestConfig(provider=STUB_PROVIDER, voice_id="nova"))
+    prompt: str = "Explain in two sentences why the sky is blue."
+    request_timeout_s: float = 30.0
+
+
+def poisson_arrivals(rate: float, duration_s: float, rng: random.Random) -> List[float]:
+    """Arrival offsets in seconds of a Poisson process over duration_s."""
+    arrivals = []
+    t = rng.expovariate(rate)
+    while t < duration_s:
+        arrivals.append(t)
+        t += rng.expovariate(rate)
+    return arrivals
+
+
+# =============================================================================
+# Load Generator
+# =============================================================================
+
+
+class LoadGenerator:
+    """Runs load stages against a LoadTarget."""
+
+    def __init__(self, target: LoadTarget, on_result: Optional[Callable[[TestResult], None]] = None):
+        self.target = target
+        self.on_result = on_result
+
+    async def run_stage(
+        self,
+        stage: RampStage,
+        rng: random.Random,
+        should_stop: Callable[[], bool] = lambda: False,
+    ) -> Tuple[List[TestResult], LoadLevelResult]:
+        """
+        Run one stage and return its results and summary.
+
+        Requests still queued when the schedule ends, or when should_stop
+        returns True, are completed before returning.
+        """
+        arrivals = poisson_arrivals(stage.arrival_rate, stage.duration_s, rng)
+        pending: asyncio.Queue = asyncio.Queue()
+        results: List[TestResult] = []
+        queue_delays: List[float] = []
+
+        connector = aiohttp.TCPConnector(limit=stage.clients)
+        timeout = aiohttp.ClientTimeout(total=self.target.request_timeout_s)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+
+            async def virtual_client():
+                while True:
+                    item = await pending.get()
+                    if item is None:
+                        return
+                    repetition, intended = item
+                    result, queue_delay_ms = await self._request(session, stage, repetition, intended)
+                    results.append(result)
+                    queue_delays.append(queue_delay_ms)
+                    if self.on_result:
+                        self.on_result(result)
+
+            clients = [asyncio.create_task(virtual_client()) for _ in range(stage.clients)]
+            start = time.perf_counter()
+            try:
+                # Open loop: arrivals follow the schedule whatever the clients are doing
+                for repetition, offset in enumerate(arrivals):
+                    if should_stop():
+                        break
+                    intended = start + offset
+                    delay = intended - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    pending.put_nowait((repetition, intended))
+                for _ in clients:
+                    pending.put_nowait(None)
+                await asyncio.gather(*clients)
+            finally:
+                for task in clients:
+                    task.cancel()
+            elapsed = time.perf_counter() - start
+
+        return results, summarize_stage(stage, results, queue_delays, elapsed)
+
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        stage: RampStage,
+        repetition: int,
+        intended: float,
+    ) -> Tuple[TestResult, float]:
+        """Send one LLM + TTS request; timings use the intended arrival time."""
+        sent = time.perf_counter()
+        queue_delay_ms = (sent - intended) * 1000
+        result = TestResult(
+            id=str(uuid.uuid4()),
+            config_id=stage.config_id,
+            scenario_name=LOAD_SCENARIO_NAME,
+            repetition=repetition,
+            timestamp=datetime.now(),
+            client_type=ClientType.LOAD_GENERATOR,
+            stt_latency_ms=None,
+            llm_ttfb_ms=0,
+            llm_completion_ms=0,
+            tts_ttfb_ms=0,
+            tts_completion_ms=0,
+            e2e_latency_ms=0,
+            network_profile=NetworkProfile.LOCALHOST,
+            llm_config=self.target.llm.to_dict(),
+            tts_config=self.target.tts.to_dict(),
+        )
+
+        try:
+            text, llm_first, llm_done, tokens = await self._stream_llm(session)
+            tts_sent = time.perf_counter()
+            tts_first, tts_done = await self._stream_tts(session, text)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            result.errors.append(f"{type(e).__name__}: {e}")
+            return result, queue_delay_ms
+
+        result.llm_ttfb_ms = (llm_first - sent) * 1000
+        result.llm_completion_ms = (llm_done - sent) * 1000
+        result.tts_ttfb_ms = (tts_first - tts_sent) * 1000
+        result.tts_completion_ms = (tts_done - tts_sent) * 1000
+        result.e2e_latency_ms = (tts_first - intended) * 1000
+        result.llm_output_tokens = tokens
+        return result, queue_delay_ms
+
+    async def _stream_llm(self, session: aiohttp.ClientSession) -> Tuple[str, float, float, int]:
+        """Stream a chat completion; returns text, first/last token times, token count."""
+        llm = self.target.llm
+        payload = {
+            "model": llm.model,
+            "messages": [{"role": "user", "content": self.target.prompt}],
+            "max_tokens": llm.max_tokens,
+            "temperature": llm.temperature,
+            "stream": True,
+        }
+        parts: List[str] = []
+        first: Optional[float] = None
+        async with session.post(self.target.llm_url, json=payload) as resp:
+            resp.raise_for_status()
+            async for line in resp.content:
+                line = line.strip()
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                choices = json.loads(data).get("choices") or [{}]
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    if first is None:
+                        first = time.perf_counter()
+                    parts.append(content)
+        done = time.perf_counter()
+
+        if first is None:
+            raise ValueError("LLM stream returned no content")
+        return "".join(parts), first, done, len(parts)
+
+    async def _stream_tts(self, session: aiohttp.ClientSession, text: str) -> Tuple[float, float]:
+        """Synthesize text; returns first and last audio byte times."""
+        tts = self.target.tts
+        payload = {
+            "model": "tts-1",
+            "input": text,
+            "voice": tts.voice_id,
+            "response_format": "wav",
+            "speed": tts.speed,
+        }
+        first: Optional[float] = None
+        async with session.post(self.target.tts_url, json=payload) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.content.iter_any():
+                if chunk and first is None:
+                    first = time.perf_counter()
+        done = time.perf_counter()
+
+        if first is None:
+            raise ValueError("TTS response had no audio")
+        return first, done
+
+
+def summarize_stage(
+    stage: RampStage,
+    results: List[TestResult],
+    queue_delays_ms: List[float],
+    elapsed_s: float,
+) -> LoadLevelResult:
+    """Summarize one stage; throughput counts successful requests."""
+    e2e = MetricColumn([r.e2e_latency_ms for r in results if r.is_success])
+    delays = MetricColumn(queue_delays_ms)
+    successful = len(e2e)
+    return LoadLevelResult(
+        config_id=stage.config_id,
+        clients=stage.clients,
+        arrival_rate=stage.arrival_rate,
+        duration_s=round(elapsed_s, 3),
+        requests=len(results),
+        successful=successful,
+        failed=len(results) - successful,
+        throughput_rps=round(successful / elapsed_s, 3) if elapsed_s > 0 else 0.0,
+        median_e2e_ms=round(e2e.median(), 2) if successful else None,
+        p95_e2e_ms=round(e2e.percentile(95), 2) if successful else None,
+        p99_e2e_ms=round(e2e.percentile(99), 2) if successful else None,
+        max_e2e_ms=round(e2e.max(), 2) if successful else None,
+        median_queue_delay_ms=round(delays.median(), 2) if len(delays) else None,
+        p99_queue_delay_ms=round(delays.percentile(99), 2) if len(delays) else None,
+    )
+
+
+# =============================================================================
+# Stub Servers
+# =============================================================================
+
+
+@dataclass
+class StubTiming:
+    """How the stub LLM and TTS servers respond."""
+    llm_ttfb_s: float = 0.05
+    tokens: int = 20
+    token_interval_s: float = 0.005
+    tts_ttfb_s: float = 0.04
+    audio_chunks: int = 4
+    audio_chunk_interval_s: float = 0.01
+    # Requests each stub serves at once; more wait, as on a real GPU server
+    slots: int = 4
+
+
+async def start_stub_servers(timing: Optional[StubTiming] = None) -> Tuple[web.AppRunner, LoadTarget]:
+    """
+    Serve a stub /v1/chat/completions and /v1/audio/speech on a free local port.
+
+    Returns the runner (call cleanup() when done) and a LoadTarget for it.
+    """
+    timing = timing or StubTiming()
+    llm_slots = asyncio.Semaphore(timing.slots)
+    tts_slots = asyncio.Semaphore(timing.slots)
+    audio_chunk = b"\x00\x00" * 2400  # 100 ms of 24 kHz 16-bit silence
+
+    async def chat_completions(request: web.Request) -> web.StreamResponse:
+        await request.json()
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        async with llm_slots:
+            await response.prepare(request)
+            await asyncio.sleep(timing.llm_ttfb_s)
+            for i in range(timing.tokens):
+                if i:
+                    await asyncio.sleep(timing.token_interval_s)
+                chunk = {"choices": [{"index": 0, "delta": {"content": f"token{i} "}}]}
+                await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def speech(request: web.Request) -> web.StreamResponse:
+        await request.json()
+        response = web.StreamResponse(headers={"Content-Type": "audio/wav"})
+        async with tts_slots:
+            await response.prepare(request)
+            await asyncio.sleep(timing.tts_ttfb_s)
+            for i in range(timing.audio_chunks):
+                if i:
+                    await asyncio.sleep(timing.audio_chunk_interval_s)
+                await response.write(audio_chunk)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    app.router.add_post("/v1/audio/speech", speech)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+
+    port = runner.addresses[0][1]
+    base_url = f"http://127.0.0.1:{port}"
+    target = LoadTarget(
+        llm_url=f"{base_url}/v1/chat/completions",
+        tts_url=f"{base_url}/v1/audio/speech",
+    )
+    return runner, target
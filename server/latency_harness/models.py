@@ -19,6 +19,7 @@ class ClientType(str, Enum):
     IOS_SIMULATOR = "ios_simulator"
     IOS_DEVICE = "ios_device"
     WEB = "web"
+    LOAD_GENERATOR = "load_generator"
 
 
 class RunStatus(str, Enum):
@@ -489,6 +490,69 @@ class ClientStatus:
 # Test Run
 # ============================================================================
 
+@dataclass
+class LoadLevelResult:
+    """
+    Aggregate outcome of one load stage: a number of concurrent virtual
+    clients offered requests at a Poisson arrival rate.
+
+    Latencies are measured from each request's intended arrival time, so
+    time spent waiting for a free client is included (coordinated
+    omission correction); queue delay reports that wait on its own.
+    """
+    config_id: str
+    clients: int
+    arrival_rate: float
+    duration_s: float
+    requests: int
+    successful: int
+    failed: int
+    throughput_rps: float
+    median_e2e_ms: Optional[float] = None
+    p95_e2e_ms: Optional[float] = None
+    p99_e2e_ms: Optional[float] = None
+    max_e2e_ms: Optional[float] = None
+    median_queue_delay_ms: Optional[float] = None
+    p99_queue_delay_ms: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "configId": self.config_id,
+            "clients": self.clients,
+            "arrivalRate": self.arrival_rate,
+            "durationSeconds": self.duration_s,
+            "requests": self.requests,
+            "successful": self.successful,
+            "failed": self.failed,
+            "throughputRps": self.throughput_rps,
+            "medianE2EMs": self.median_e2e_ms,
+            "p95E2EMs": self.p95_e2e_ms,
+            "p99E2EMs": self.p99_e2e_ms,
+            "maxE2EMs": self.max_e2e_ms,
+            "medianQueueDelayMs": self.median_queue_delay_ms,
+            "p99QueueDelayMs": self.p99_queue_delay_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadLevelResult":
+        return cls(
+            config_id=data["configId"],
+            clients=data["clients"],
+            arrival_rate=data["arrivalRate"],
+            duration_s=data["durationSeconds"],
+            requests=data["requests"],
+            successful=data["successful"],
+            failed=data["failed"],
+            throughput_rps=data["throughputRps"],
+            median_e2e_ms=data.get("medianE2EMs"),
+            p95_e2e_ms=data.get("p95E2EMs"),
+            p99_e2e_ms=data.get("p99E2EMs"),
+            max_e2e_ms=data.get("maxE2EMs"),
+            median_queue_delay_ms=data.get("medianQueueDelayMs"),
+            p99_queue_delay_ms=data.get("p99QueueDelayMs"),
+        )
+
+
 @dataclass
 class TestRun:
     """A complete test run (execution of a test suite)."""
@@ -503,6 +567,8 @@ class TestRun:
     completed_at: Optional[datetime] = None
     completed_configurations: int = 0
     results: List[TestResult] = field(default_factory=list)
+    # Per-stage summaries, only for load runs
+    load_levels: List[LoadLevelResult] = field(default_factory=list)
 
     @property
     def progress_percent(self) -> float:
@@ -531,6 +597,7 @@ class TestRun:
             "progressPercent": self.progress_percent,
             "elapsedTimeSeconds": self.elapsed_time,
             "results": [r.to_dict() for r in self.results],
+            "loadLevels": [level.to_dict() for level in self.load_levels],
         }
 
     @classmethod
@@ -557,6 +624,7 @@ class TestRun:
             completed_at=completed_at,
             completed_configurations=data.get("completedConfigurations", 0),
             results=results,
+            load_levels=[LoadLevelResult.from_dict(level) for level in data.get("loadLevels", [])],
         )
 
 
@@ -630,6 +698,53 @@ class Regression:
     current_value: float
     change_percent: float
     severity: RegressionSeverity
+    # Set when the regression came from a significance test
+    method: str = "threshold"
+    p_value: Optional[float] = None
+    effect_size: Optional[float] = None
+    baseline_count: Optional[int] = None
+    current_count: Optional[int] = None
+
+
+@dataclass
+class RegressionCheck:
+    """
+    One comparison of a metric against its baseline.
+
+    method is "mann_whitney_u" (effect_size is Cliff's delta),
+    "quantile_exceedance" (effect_size is how many times more often than
+    expected the baseline quantile is exceeded) or "threshold" for
+    baselines saved without distributions. p_value is adjusted for the
+    number of checks in the report (Benjamini-Hochberg).
+    """
+    config_id: str
+    metric: str
+    method: str
+    baseline_count: int
+    current_count: int
+    baseline_value: Optional[float] = None
+    current_value: Optional[float] = None
+    change_percent: Optional[float] = None
+    p_value: Optional[float] = None
+    effect_size: Optional[float] = None
+    regressed: bool = False
+    skipped_reason: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "configId": self.config_id,
+            "metric": self.metric,
+            "method": self.method,
+            "baselineCount": self.baseline_count,
+            "currentCount": self.current_count,
+            "baselineValue": self.baseline_value,
+            "currentValue": self.current_value,
+            "changePercent": self.change_percent,
+            "pValue": self.p_value,
+            "effectSize": self.effect_size,
+            "regressed": self.regressed,
+            "skippedReason": self.skipped_reason,
+        }
 
 
 @dataclass
@@ -641,6 +756,7 @@ class AnalysisReport:
     network_projections: List[NetworkProjection]
     regressions: List[Regression]
     recommendations: List[str]
+    regression_checks: List[RegressionCheck] = field(default_factory=list)
 
 
 # ============================================================================
@@ -844,6 +960,9 @@ class BaselineMetrics:
     median_tts_ttfb_ms: float
     median_tts_completion_ms: float
     sample_count: int
+    # Sorted, thinned samples per metric ("e2e", "llmTTFB", ...) for
+    # significance tests; empty for baselines saved before they were kept
+    distributions: Dict[str, List[float]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -857,6 +976,7 @@ class BaselineMetrics:
             "medianTTSTTFBMs": self.median_tts_ttfb_ms,
             "medianTTSCompletionMs": self.median_tts_completion_ms,
             "sampleCount": self.sample_count,
+            "distributions": self.distributions,
         }
 
     @classmethod
@@ -872,6 +992,7 @@ class BaselineMetrics:
             median_tts_ttfb_ms=data["medianTTSTTFBMs"],
             median_tts_completion_ms=data["medianTTSCompletionMs"],
             sample_count=data["sampleCount"],
+            distributions=data.get("distributions", {}),
         )
 
 
@@ -9,6 +9,7 @@ This module is the central coordinator for the latency test harness. It manages:
 3. **Test Execution**: Schedule and run tests across available clients
 4. **Result Collection**: Gather results without blocking test execution (fire-and-forget)
 5. **Real-time Updates**: Broadcast progress via callbacks/WebSocket
+6. **Load Runs**: Drive many concurrent virtual clients at LLM/TTS servers
 
 Architecture Overview
 --------------------
@@ -92,11 +93,13 @@ See Also
 - `models.py`: Data models for tests, results, configurations
 - `storage.py`: Persistence backends (file, PostgreSQL)
 - `analyzer.py`: Statistical analysis of results
+- `load.py`: Open-loop load generation and stub LLM/TTS servers
 - `docs/LATENCY_TEST_HARNESS_GUIDE.md`: Complete usage guide
 """
 
 import asyncio
 import logging
+import random
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Callable, Any
 from dataclasses import dataclass, field
@@ -115,6 +118,8 @@ from .models import (
     RunStatus,
     NetworkProfile,
 )
+from .load import LoadGenerator, LoadProfile, LoadTarget
+from .stats import LiveRunStatistics
 
 logger = logging.getLogger(__name__)
 
@@ -152,7 +157,11 @@ class LatencyTestOrchestrator:
         self.clients: Dict[str, ConnectedClient] = {}
         self.active_runs: Dict[str, TestRun] = {}
         self.completed_runs: Dict[str, TestRun] = {}
+        # Runs listed from storage without their results
+        self._summary_run_ids: Set[str] = set()
         self.suites: Dict[str, TestSuiteDefinition] = {}
+        # Streaming latency sketches for runs executing in this process
+        self.live_statistics: Dict[str, LiveRunStatistics] = {}
 
         # Optional persistent storage
         self.storage = storage
@@ -199,16 +208,15 @@ class LatencyTestOrchestrator:
                 self.suites[suite.id] = suite
             logger.info(f"Loaded {len(suites)} test suites from storage")
 
-            # Load recent runs
+            # Load recent runs; results are read on demand by load_run
             runs, _ = await self.storage.list_runs(limit=100)
             for run in runs:
                 if run.status == RunStatus.RUNNING:
                     # Stale running run (server restarted) - mark as failed
                     run.status = RunStatus.FAILED
                     await self.storage.save_run(run)
-                    self.completed_runs[run.id] = run
-                else:
-                    self.completed_runs[run.id] = run
+                self.completed_runs[run.id] = run
+                self._summary_run_ids.add(run.id)
             logger.info(f"Loaded {len(runs)} test runs from storage")
 
         except Exception as e:
@@ -517,6 +525,7 @@ class LatencyTestOrchestrator:
         )
 
         self.active_runs[run_id] = run
+        self.live_statistics[run_id] = LiveRunStatistics()
         client.status.is_running_test = True
 
         # Persist to storage
@@ -541,6 +550,7 @@ class LatencyTestOrchestrator:
         configurations: List[TestConfiguration],
     ):
         """Execute a test run (background task)."""
+        live_stats = self.live_statistics.setdefault(run.id, LiveRunStatistics())
         try:
             # Get scenarios for quick lookup
             scenarios_by_name = {s.name: s for s in suite.scenarios}
@@ -563,6 +573,7 @@ class LatencyTestOrchestrator:
                     # Update in-memory state (immediate, non-blocking)
                     run.results.append(result)
                     run.completed_configurations = i + 1
+                    live_stats.add(result)
 
                     # FIRE-AND-FORGET: Queue result for async persistence
                     # This returns immediately without blocking the test loop
@@ -603,6 +614,7 @@ class LatencyTestOrchestrator:
                         errors=[str(e)],
                     )
                     run.results.append(error_result)
+                    live_stats.add(error_result)
 
             # Mark run as completed
             run.status = RunStatus.COMPLETED
@@ -628,6 +640,7 @@ class LatencyTestOrchestrator:
                     await self.storage.save_run(run)
                 except Exception as e:
                     logger.error(f"Failed to persist completed run: {e}")
+            self.live_statistics.pop(run.id, None)
 
             logger.info(f"Test run completed: {run.id} ({len(run.results)} results)")
 
@@ -646,6 +659,98 @@ class LatencyTestOrchestrator:
                     await self.storage.save_run(run)
                 except Exception as persist_error:
                     logger.error(f"Failed to persist failed run: {persist_error}")
+            self.live_statistics.pop(run.id, None)
+
+    async def start_load_run(self, profile: LoadProfile, target: LoadTarget) -> TestRun:
+        """
+        Start an open-loop load run against the target's LLM and TTS servers.
+
+        Unlike suite runs, no client is needed: virtual clients in this
+        process send the requests. Each stage counts as one configuration;
+        its results use the stage's config ID and its summary is added to
+        run.load_levels when it finishes.
+        """
+        run_id = f"load_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        run = TestRun(
+            id=run_id,
+            suite_name=profile.name,
+            suite_id="load_test",
+            started_at=datetime.now(),
+            client_id="load_generator",
+            client_type=ClientType.LOAD_GENERATOR,
+            total_configurations=len(profile.stages),
+            status=RunStatus.RUNNING,
+        )
+
+        self.active_runs[run_id] = run
+        self.live_statistics[run_id] = LiveRunStatistics()
+
+        if self.storage:
+            try:
+                await self.storage.save_run(run)
+            except Exception as e:
+                logger.error(f"Failed to persist run: {e}")
+
+        logger.info(f"Started load run: {run_id} ({len(profile.stages)} stages)")
+
+        asyncio.create_task(self._execute_load_run(run, profile, target))
+
+        return run
+
+    async def _execute_load_run(self, run: TestRun, profile: LoadProfile, target: LoadTarget):
+        """Execute a load run's stages in order (background task)."""
+        live_stats = self.live_statistics.setdefault(run.id, LiveRunStatistics())
+
+        def record(result: TestResult):
+            # Called by virtual clients as requests finish; must not block them
+            run.results.append(result)
+            live_stats.add(result)
+            self._enqueue_result(run.id, result)
+            if self.on_result:
+                self.on_result(run.id, result)
+
+        generator = LoadGenerator(target, on_result=record)
+        rng = random.Random(profile.seed)
+
+        def cancelled() -> bool:
+            return run.status == RunStatus.CANCELLED
+
+        try:
+            for stage in profile.stages:
+                if cancelled():
+                    break
+
+                _, level = await generator.run_stage(stage, rng, should_stop=cancelled)
+                run.load_levels.append(level)
+                run.completed_configurations += 1
+                self._enqueue_status_update(run.id, run.status, run.completed_configurations)
+
+                if self.on_progress:
+                    self.on_progress(run.id, run.completed_configurations, run.total_configurations)
+
+            if run.status != RunStatus.CANCELLED:
+                run.status = RunStatus.COMPLETED
+                run.completed_at = datetime.now()
+            logger.info(f"Load run finished: {run.id} ({len(run.results)} requests)")
+
+        except Exception as e:
+            logger.error(f"Load run failed: {e}")
+            run.status = RunStatus.FAILED
+            run.completed_at = datetime.now()
+
+        self.active_runs.pop(run.id, None)
+        self.completed_runs[run.id] = run
+
+        # Stage summaries live in the run itself, so save it whole
+        if self.storage:
+            try:
+                await self.storage.save_run(run)
+            except Exception as e:
+                logger.error(f"Failed to persist load run: {e}")
+        self.live_statistics.pop(run.id, None)
+
+        if self.on_run_complete and run.status == RunStatus.COMPLETED:
+            self.on_run_complete(run)
 
     async def _execute_test_on_client(
         self,
@@ -715,8 +820,6 @@ class LatencyTestOrchestrator:
         self, config: TestConfiguration, client_type: ClientType
     ) -> TestResult:
         """Create a mock result for testing."""
-        import random
-
         base_latency = 100 + random.uniform(0, 200)
 
         return TestResult(
@@ -760,9 +863,46 @@ class LatencyTestOrchestrator:
             logger.info(f"Cancelled test run: {run_id}")
 
     def get_run(self, run_id: str) -> Optional[TestRun]:
-        """Get a test run by ID."""
+        """
+        Get a test run by ID.
+
+        Runs loaded from storage at startup may not have their results;
+        use load_run when the results are needed.
+        """
         return self.active_runs.get(run_id) or self.completed_runs.get(run_id)
 
+    async def get_live_statistics(self, run_id: str) -> Optional[LiveRunStatistics]:
+        """
+        Get streaming latency statistics for a run.
+
+        Sketches are kept only while a run executes; for finished runs
+        they are rebuilt from the run's results, reading storage if needed.
+        """
+        live_stats = self.live_statistics.get(run_id)
+        if live_stats is not None:
+            return live_stats
+
+        run = await self.load_run(run_id)
+        if run is None:
+            return None
+        live_stats = LiveRunStatistics()
+        for result in run.results:
+            live_stats.add(result)
+        return live_stats
+
+    async def load_run(self, run_id: str) -> Optional[TestRun]:
+        """Get a test run by ID with its results, reading storage if needed."""
+        run = self.get_run(run_id)
+        if run is not None and run_id not in self._summary_run_ids:
+            return run
+
+        if self.storage:
+            # Not cached, so memory stays flat however many runs are viewed
+            stored = await self.storage.get_run(run_id)
+            if stored is not None:
+                return stored
+        return run
+
     def list_runs(
         self,
         status: Optional[RunStatus] = None,
@@ -0,0 +1,604 @@
+"""
+UnaMentis Latency Test Harness - Statistics Primitives
+======================================================
+
+Building blocks for ResultsAnalyzer and for live statistics while a run
+is in progress.
+
+Columns
+-------
+`ResultColumns` pulls each metric out of a run's results once, groups
+the results by configuration once, and hands out `MetricColumn`s that
+are sorted once and then answer any number of percentile, median and
+threshold queries. NumPy is used when it is installed; otherwise the
+same columns are built from plain lists, with identical results.
+
+Sketches
+--------
+`DDSketch` is a mergeable quantile sketch with a fixed relative error
+(1% by default): every quantile it reports is within that fraction of
+a value that is actually at that rank. Its size depends on the range of
+the values, not on how many there are, so the orchestrator can keep one
+per configuration and metric for the whole run and the dashboard can
+read P50/P95/P99 at any time. `LiveRunStatistics` holds those sketches
+for one run.
+
+Significance tests
+------------------
+Distribution-free tests used for regression detection against baseline
+samples: a one-sided Mann-Whitney U test with Cliff's delta as effect
+size for shifts in the bulk of a distribution, a binomial exceedance
+test for its tail quantiles, and Benjamini-Hochberg adjustment for the
+many (configuration, metric) comparisons made per run.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import groupby
+from operator import attrgetter
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import NetworkProfile, TestResult
+
+# Try to import numpy for vectorized columns
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Metric key -> TestResult attribute, in report order
+METRICS: Dict[str, str] = {
+    "e2e": "e2e_latency_ms",
+    "stt": "stt_latency_ms",
+    "llmTTFB": "llm_ttfb_ms",
+    "llmCompletion": "llm_completion_ms",
+    "ttsTTFB": "tts_ttfb_ms",
+    "ttsCompletion": "tts_completion_ms",
+}
+
+# Metrics that are not measured for every result (e.g. no STT stage);
+# missing and zero values are left out, as the analyzer always has
+OPTIONAL_METRICS = {"stt"}
+
+# Baselines keep at most this many values per configuration and metric
+BASELINE_SAMPLE_LIMIT = 1000
+
+# Providers that run on the device and so add no network hop
+ON_DEVICE_STT_PROVIDERS = {"apple", "glm-asr-ondevice", "web-speech"}
+ON_DEVICE_LLM_PROVIDERS = {"mlx"}
+ON_DEVICE_TTS_PROVIDERS = {"apple", "web-speech"}
+
+
+def network_hops(result: TestResult) -> int:
+    """Count the pipeline stages of a result that go over the network."""
+    hops = 0
+    if result.stt_config and result.stt_config.get("provider") not in ON_DEVICE_STT_PROVIDERS:
+        hops += 1
+    if result.llm_config and result.llm_config.get("provider") not in ON_DEVICE_LLM_PROVIDERS:
+        hops += 1
+    if result.tts_config and result.tts_config.get("provider") not in ON_DEVICE_TTS_PROVIDERS:
+        hops += 1
+    return hops
+
+
+def percentile_sorted(sorted_data: Sequence[float], p: float) -> float:
+    """Calculate the p-th percentile of already sorted data."""
+    n = len(sorted_data)
+    if not n:
+        return 0.0
+    k = (n - 1) * p / 100
+    f = int(k)
+    c = f + 1 if f + 1 < n else f
+    return float(sorted_data[f] + (k - f) * (sorted_data[c] - sorted_data[f]))
+
+
+def thin_sorted(sorted_data: Sequence[float], limit: int) -> Sequence[float]:
+    """Keep at most limit evenly spaced order statistics of sorted data."""
+    n = len(sorted_data)
+    if n <= limit:
+        return sorted_data
+    if limit < 2:
+        return [sorted_data[n // 2]]
+    step = (n - 1) / (limit - 1)
+    return [sorted_data[round(i * step)] for i in range(limit)]
+
+
+# =============================================================================
+# Columns
+# =============================================================================
+
+
+class MetricColumn:
+    """The values of one metric, sorted once and queried many times."""
+
+    def __init__(self, values: Any, drop_missing: bool = False):
+        if HAS_NUMPY:
+            data = np.asarray(values, dtype=float)
+            if drop_missing:
+                data = data[~np.isnan(data)]
+            self.values = np.sort(data)
+        else:
+            if drop_missing:
+                values = [v for v in values if not math.isnan(v)]
+            self.values = sorted(values)
+
+    @classmethod
+    def from_sorted(cls, values: Any) -> "MetricColumn":
+        """Wrap values that are already sorted."""
+        column = cls.__new__(cls)
+        column.values = values
+        return column
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def percentile(self, p: float) -> float:
+        return percentile_sorted(self.values, p)
+
+    def median(self) -> float:
+        """Median, computed the same way as statistics.median."""
+        n = len(self.values)
+        if not n:
+            return 0.0
+        mid = n // 2
+        if n % 2:
+            return float(self.values[mid])
+        return float((self.values[mid - 1] + self.values[mid]) / 2)
+
+    def min(self) -> float:
+        return float(self.values[0]) if len(self.values) else 0.0
+
+    def max(self) -> float:
+        return float(self.values[-1]) if len(self.values) else 0.0
+
+    def stdev(self) -> float:
+        """Sample standard deviation, or 0 with fewer than two values."""
+        n = len(self.values)
+        if n < 2:
+            return 0.0
+        if HAS_NUMPY:
+            return float(np.std(self.values, ddof=1))
+        mean = math.fsum(self.values) / n
+        return math.sqrt(math.fsum((v - mean) ** 2 for v in self.values) / (n - 1))
+
+    def count_below(self, threshold: float) -> int:
+        """Number of values strictly below threshold."""
+        if HAS_NUMPY:
+            return int(np.searchsorted(self.values, threshold, side="left"))
+        return bisect_left(self.values, threshold)
+
+
+class ResultColumns:
+    """
+    Column view of a list of results for the analyzer.
+
+    Results are grouped by configuration in one pass. Each metric is
+    extracted once, in result order, and each (metric, configuration)
+    column is sorted the first time it is asked for.
+    """
+
+    def __init__(self, results: List[TestResult]):
+        self.results = results
+        self._groups: Dict[str, List[int]] = {}
+        for index, result in enumerate(results):
+            group = self._groups.get(result.config_id)
+            if group is None:
+                group = self._groups[result.config_id] = []
+            group.append(index)
+
+        self._values: Dict[str, Any] = {}
+        self._columns: Dict[Tuple[str, Optional[str]], MetricColumn] = {}
+        self._index_arrays: Dict[str, Any] = {}
+        self._hops: Optional[Any] = None
+        self._hops_by_config: Dict[str, int] = {}
+        self._recorded: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def config_ids(self) -> List[str]:
+        """Configuration IDs in order of first appearance."""
+        return list(self._groups)
+
+    def count(self, config_id: str) -> int:
+        return len(self._groups[config_id])
+
+    def first_result(self, config_id: str) -> TestResult:
+        return self.results[self._groups[config_id][0]]
+
+    def values(self, metric: str) -> Any:
+        """All values of a metric in result order (NaN where missing)."""
+        values = self._values.get(metric)
+        if values is None:
+            values = list(map(attrgetter(METRICS[metric]), self.results))
+            if metric in OPTIONAL_METRICS:
+                values = [v or math.nan for v in values]
+            if HAS_NUMPY:
+                values = np.asarray(values, dtype=float)
+            self._values[metric] = values
+        return values
+
+    def column(self, metric: str, config_id: Optional[str] = None) -> MetricColumn:
+        """Sorted column for a metric, overall or for one configuration."""
+        key = (metric, config_id)
+        column = self._columns.get(key)
+        if column is None:
+            column = MetricColumn(
+                self._select(self.values(metric), config_id),
+                drop_missing=metric in OPTIONAL_METRICS,
+            )
+            self._columns[key] = column
+        return column
+
+    def projected_e2e(self, profile: NetworkProfile) -> MetricColumn:
+        """
+        Sorted E2E latency projected onto a network profile.
+
+        Projections recorded on a result take precedence; otherwise the
+        profile's added latency is counted once per network hop.
+        """
+        key = (f"network:{profile.value}", None)
+        column = self._columns.get(key)
+        if column is None:
+            added = profile.added_latency_ms
+            hops = self._network_hops()
+            if not self._recorded_projections() and len(set(self._hops_by_config.values())) == 1:
+                # Same shift for every result, so the sorted order holds
+                shift = added * next(iter(self._hops_by_config.values()))
+                e2e = self.column("e2e").values
+                if HAS_NUMPY:
+                    column = MetricColumn.from_sorted(e2e + shift)
+                else:
+                    column = MetricColumn.from_sorted([v + shift for v in e2e])
+            else:
+                e2e = self.values("e2e")
+                if HAS_NUMPY:
+                    projected = e2e + added * hops
+                else:
+                    projected = [v + added * h for v, h in zip(e2e, hops)]
+                for index in self._recorded_projections():
+                    recorded = self.results[index].network_projections
+                    if profile.value in recorded:
+                        projected[index] = recorded[profile.value]
+                column = MetricColumn(projected)
+            self._columns[key] = column
+        return column
+
+    def distributions(
+        self, config_id: Optional[str] = None, limit: int = BASELINE_SAMPLE_LIMIT
+    ) -> Dict[str, List[float]]:
+        """Sorted samples of every metric for a baseline, thinned to limit values."""
+        distributions = {}
+        for metric in METRICS:
+            values = self.column(metric, config_id).values
+            if len(values):
+                distributions[metric] = [round(float(v), 3) for v in thin_sorted(values, limit)]
+        return distributions
+
+    def _recorded_projections(self) -> List[int]:
+        if self._recorded is None:
+            self._recorded = [i for i, r in enumerate(self.results) if r.network_projections]
+        return self._recorded
+
+    def _network_hops(self) -> Any:
+        # Hops depend on the providers, which are the same for every
+        # result of a configuration
+        if self._hops is None:
+            self._hops_by_config = {
+                config_id: network_hops(self.first_result(config_id)) for config_id in self._groups
+            }
+            if HAS_NUMPY:
+                hops = np.zeros(len(self.results))
+                for config_id, config_hops in self._hops_by_config.items():
+                    hops[self._indices(config_id)] = config_hops
+            else:
+                hops = [0] * len(self.results)
+                for config_id, indices in self._groups.items():
+                    config_hops = self._hops_by_config[config_id]
+                    for index in indices:
+                        hops[index] = config_hops
+            self._hops = hops
+        return self._hops
+
+    def _indices(self, config_id: str) -> Any:
+        indices = self._index_arrays.get(config_id)
+        if indices is None:
+            indices = self._index_arrays[config_id] = np.asarray(self._groups[config_id], dtype=np.intp)
+        return indices
+
+    def _select(self, values: Any, config_id: Optional[str]) -> Any:
+        if config_id is None:
+            return values
+        if HAS_NUMPY:
+            return values[self._indices(config_id)]
+        return [values[i] for i in self._groups[config_id]]
+
+
+# =============================================================================
+# Sketches
+# =============================================================================
+
+
+class DDSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Positive values are counted in logarithmic buckets of ratio
+    gamma = (1 + a) / (1 - a); a quantile is read back as the midpoint of
+    its bucket, which is within relative accuracy a of the true value.
+    Values too small to bucket (including zero) are counted separately.
+    """
+
+    MIN_INDEXABLE_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        if value < 0:
+            raise ValueError("DDSketch only accepts non-negative values")
+        if value > self.MIN_INDEXABLE_VALUE:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+        else:
+            self.zero_count += count
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def update(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "DDSketch") -> None:
+        """Add the contents of another sketch with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile q (0-1), or None if the sketch is empty."""
+        if not self.count:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError("quantile must be between 0 and 1")
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return self.min
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relativeAccuracy": self.relative_accuracy,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zeroCount": self.zero_count,
+            "bins": {str(key): count for key, count in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DDSketch":
+        sketch = cls(data["relativeAccuracy"])
+        sketch.bins = {int(key): count for key, count in data.get("bins", {}).items()}
+        sketch.zero_count = data.get("zeroCount", 0)
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+
+class LiveRunStatistics:
+    """
+    Streaming per-configuration and overall latency sketches for a run.
+
+    Updated by the orchestrator as each result arrives; adding a result
+    costs a handful of dictionary updates, so it stays out of the way of
+    the measurements themselves.
+    """
+
+    QUANTILES = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.overall: Dict[str, DDSketch] = {}
+        self.by_config: Dict[str, Dict[str, DDSketch]] = {}
+        self.successful_tests = 0
+        self.failed_tests = 0
+
+    def add(self, result: TestResult) -> None:
+        if not result.is_success:
+            self.failed_tests += 1
+            return
+        self.successful_tests += 1
+
+        config = self.by_config.setdefault(result.config_id, {})
+        for metric, attr in METRICS.items():
+            value = getattr(result, attr)
+            if value is None or (metric in OPTIONAL_METRICS and not value):
+                continue
+            for sketches in (self.overall, config):
+                sketch = sketches.get(metric)
+                if sketch is None:
+                    sketch = sketches[metric] = DDSketch(self.relative_accuracy)
+                sketch.add(value)
+
+    def summary(self, include_configurations: bool = True) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "successfulTests": self.successful_tests,
+            "failedTests": self.failed_tests,
+            "relativeAccuracy": self.relative_accuracy,
+            "overall": self._describe(self.overall),
+        }
+        if include_configurations:
+            data["configurations"] = {
+                config_id: self._describe(sketches)
+                for config_id, sketches in self.by_config.items()
+            }
+        return data
+
+    def _describe(self, sketches: Dict[str, DDSketch]) -> Dict[str, Dict[str, Any]]:
+        described = {}
+        for metric in METRICS:
+            sketch = sketches.get(metric)
+            if sketch is None:
+                continue
+            entry: Dict[str, Any] = {"count": sketch.count}
+            for name, q in self.QUANTILES:
+                entry[name] = sketch.quantile(q)
+            described[metric] = entry
+        return described
+
+
+# =============================================================================
+# Significance tests
+# =============================================================================
+
+
+def mann_whitney_u(baseline: Sequence[float], current: Sequence[float]) -> Tuple[float, float]:
+    """
+    One-sided Mann-Whitney U test that current is stochastically greater.
+
+    Both samples must be sorted. Uses the normal approximation with tie
+    and continuity corrections, so it needs a handful of values on each
+    side (see the analyzer's minimum-sample guard).
+
+    Returns:
+        (p_value, cliffs_delta), where Cliff's delta runs from -1 (every
+        current value is lower) to 1 (every current value is higher)
+    """
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        return 1.0, 0.0
+
+    # U counts pairs with the current value higher, ties as half
+    if HAS_NUMPY:
+        below = np.searchsorted(baseline, current, side="left")
+        at_or_below = np.searchsorted(baseline, current, side="right")
+        u = float(np.sum(below + at_or_below)) / 2
+        _, counts = np.unique(np.concatenate([baseline, current]), return_counts=True)
+        tie_term = float(np.sum(counts.astype(float) ** 3 - counts))
+    else:
+        u = sum(bisect_left(baseline, x) + bisect_right(baseline, x) for x in current) / 2
+        tie_term = 0.0
+        for _, group in groupby(merge(baseline, current)):
+            t = sum(1 for _ in group)
+            tie_term += t ** 3 - t
+
+    delta = 2 * u / (n1 * n2) - 1
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0.0
+    if variance <= 0:
+        return (0.0 if delta > 0 else 1.0), delta
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 1 - NormalDist().cdf(z), delta
+
+
+def binomial_sf(k: int, n: int, p: float) -> float:
+    """P(X >= k) for X ~ Binomial(n, p)."""
+    if k <= 0:
+        return 1.0
+    if k > n:
+        return 0.0
+    if p <= 0:
+        return 0.0
+    if p >= 1:
+        return 1.0
+    log_p, log_q = math.log(p), math.log1p(-p)
+    log_n = math.lgamma(n + 1)
+    total = math.fsum(
+        math.exp(log_n - math.lgamma(i + 1) - math.lgamma(n - i + 1) + i * log_p + (n - i) * log_q)
+        for i in range(k, n + 1)
+    )
+    return min(1.0, total)
+
+
+def quantile_upper_bound(sorted_data: Sequence[float], q: float, confidence: float = 0.95) -> Optional[float]:
+    """
+    Distribution-free upper confidence bound for the q-quantile.
+
+    Returns None when the sample is too small for the bound to be one of
+    its values.
+    """
+    n = len(sorted_data)
+    z = NormalDist().inv_cdf(confidence)
+    rank = math.ceil(n * q + z * math.sqrt(n * q * (1 - q)))
+    if rank > n or rank < 1:
+        return None
+    return float(sorted_data[rank - 1])
+
+
+def quantile_exceedance_test(
+    baseline: Sequence[float], current: Sequence[float], q: float, confidence: float = 0.95
+) -> Optional[Tuple[float, float]]:
+    """
+    One-sided test that the q-quantile of current exceeds the baseline's.
+
+    If the current q-quantile were no higher than the baseline's, at most
+    a (1 - q) share of current values would lie above it. Values above an
+    upper confidence bound of the baseline quantile are counted, and the
+    count is compared with Binomial(n, 1 - q). Both samples must be
+    sorted.
+
+    Returns:
+        (p_value, exceedance_ratio), the ratio being the observed share
+        above the bound over the expected 1 - q; or None if the baseline
+        is too small to bound its quantile
+    """
+    threshold = quantile_upper_bound(baseline, q, confidence)
+    if threshold is None or not len(current):
+        return None
+    if HAS_NUMPY:
+        exceedances = len(current) - int(np.searchsorted(current, threshold, side="right"))
+    else:
+        exceedances = len(current) - bisect_right(current, threshold)
+    expected_share = 1 - q
+    ratio = exceedances / len(current) / expected_share
+    return binomial_sf(exceedances, len(current), expected_share), ratio
+
+
+def benjamini_hochberg(p_values: Sequence[float]) -> List[float]:
+    """Benjamini-Hochberg adjusted p-values, in the order given."""
+    m = len(p_values)
+    adjusted = [1.0] * m
+    running = 1.0
+    for rank, index in zip(range(m, 0, -1), sorted(range(m), key=lambda i: p_values[i], reverse=True)):
+        running = min(running, p_values[index] * m / rank)
+        adjusted[index] = running
+    return adjusted
@@ -7,10 +7,11 @@ supporting both development (file-based) and production (PostgreSQL) storage.
 
 Storage Backends
 ---------------
-1. **FileBasedLatencyStorage** - JSON files on disk
+1. **FileBasedLatencyStorage** - JSON files and a SQLite run index on disk
    - Best for: Development, simple deployments, debugging
    - Location: `server/data/latency_harness/`
-   - Structure: Separate directories for suites/, runs/, baselines/
+   - Structure: Directories for suites/ and baselines/, runs.db for runs
+     and their results
 
 2. **PostgreSQLLatencyStorage** - Relational database
    - Best for: Production, high-volume testing, concurrent access
@@ -84,7 +85,7 @@ Environment Variables
 
 Thread Safety
 ------------
-- FileBasedLatencyStorage: Uses in-memory caches, safe for single-process
+- FileBasedLatencyStorage: In-memory caches and a local SQLite file, safe for single-process
 - PostgreSQLLatencyStorage: Connection pool handles concurrency
 
 See Also
@@ -96,6 +97,7 @@ See Also
 
 import json
 import os
+import sqlite3
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -242,7 +244,14 @@ class LatencyHarnessStorage(ABC):
 class FileBasedLatencyStorage(LatencyHarnessStorage):
     """
     File-based storage for development and simple deployments.
-    Stores data as JSON files in a directory structure.
+
+    Suites and baselines are JSON files. Runs live in a local SQLite
+    file (runs.db): one row per run holding its summary, and one row per
+    result with the stage latencies as columns next to the full result
+    JSON. Nothing about runs is held in memory; listing runs reads one
+    page of summaries through an index, and results are only read when a
+    run or its results are requested. Run JSON files from before the
+    index existed are imported on first start and left in place.
     """
 
     def __init__(self, data_dir: Path):
@@ -250,25 +259,37 @@ class FileBasedLatencyStorage(LatencyHarnessStorage):
         self.suites_dir = data_dir / "suites"
         self.runs_dir = data_dir / "runs"
         self.baselines_dir = data_dir / "baselines"
+        self.runs_db_path = data_dir / "runs.db"
 
         # In-memory caches
         self._suites: Dict[str, TestSuiteDefinition] = {}
-        self._runs: Dict[str, TestRun] = {}
         self._baselines: Dict[str, PerformanceBaseline] = {}
 
+        self._db: Optional[sqlite3.Connection] = None
+
     async def initialize(self):
         """Initialize storage directories and load cached data."""
         # Create directories
         for dir_path in [self.suites_dir, self.runs_dir, self.baselines_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
 
+        self._db = sqlite3.connect(self.runs_db_path)
+        self._db.executescript(RUN_INDEX_SCHEMA)
+
         # Load existing data
         await self._load_suites()
-        await self._load_runs()
+        await self._import_legacy_runs()
         await self._load_baselines()
 
-        logger.info(f"Loaded {len(self._suites)} suites, {len(self._runs)} runs, "
-                   f"{len(self._baselines)} baselines from {self.data_dir}")
+        run_count = self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        logger.info(f"Loaded {len(self._suites)} suites, {len(self._baselines)} baselines "
+                   f"and indexed {run_count} runs from {self.data_dir}")
+
+    async def close(self):
+        """Close the run index."""
+        if self._db:
+            self._db.close()
+            self._db = None
 
     async def _load_suites(self):
         """Load test suites from disk."""
@@ -281,16 +302,33 @@ class FileBasedLatencyStorage(LatencyHarnessStorage):
             except Exception as e:
                 logger.error(f"Failed to load suite {suite_file}: {e}")
 
-    async def _load_runs(self):
-        """Load test runs from disk."""
-        for run_file in self.runs_dir.glob("*.json"):
+    async def _import_legacy_runs(self):
+        """Index run JSON files written before the run index existed.
+
+        The files are left where they are. Each is imported once, so a
+        run deleted after its import stays deleted, and a file never
+        replaces a run already in the index.
+        """
+        imported = {
+            row[0] for row in self._db.execute("SELECT file_name FROM legacy_imports")
+        }
+        for run_file in sorted(self.runs_dir.glob("*.json")):
+            if run_file.name in imported:
+                continue
             try:
                 with open(run_file, 'r') as f:
-                    data = json.load(f)
-                run = TestRun.from_dict(data)
-                self._runs[run.id] = run
+                    run = TestRun.from_dict(json.load(f))
+                with self._db:
+                    indexed = self._db.execute(
+                        "SELECT 1 FROM runs WHERE id = ?", (run.id,)
+                    ).fetchone()
+                    if not indexed:
+                        self._write_run(run)
+                    self._db.execute(
+                        "INSERT INTO legacy_imports (file_name) VALUES (?)", (run_file.name,)
+                    )
             except Exception as e:
-                logger.error(f"Failed to load run {run_file}: {e}")
+                logger.error(f"Failed to import run {run_file}: {e}")
 
     async def _load_baselines(self):
         """Load baselines from disk."""
@@ -337,6 +375,52 @@ class FileBasedLatencyStorage(LatencyHarnessStorage):
     # Test Run Operations
     # =========================================================================
 
+    def _write_run(self, run: TestRun):
+        """Upsert a run's summary and any results it carries."""
+        summary = run.to_dict()
+        del summary["results"]
+        self._db.execute("""
+            INSERT INTO runs (id, suite_id, status, started_at, run_json)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                suite_id = excluded.suite_id,
+                status = excluded.status,
+                started_at = excluded.started_at,
+                run_json = excluded.run_json
+        """, (run.id, run.suite_id, run.status.value, run.started_at.isoformat(),
+              json.dumps(summary, default=str)))
+        self._write_results(run.id, run.results)
+
+    def _write_results(self, run_id: str, results: List[TestResult]):
+        """Append results; ones already stored for the run are skipped."""
+        self._db.executemany("""
+            INSERT OR IGNORE INTO results (
+                run_id, id, config_id, stt_latency_ms, llm_ttfb_ms, llm_completion_ms,
+                tts_ttfb_ms, tts_completion_ms, e2e_latency_ms, is_success, result_json
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (run_id, r.id, r.config_id, r.stt_latency_ms, r.llm_ttfb_ms, r.llm_completion_ms,
+             r.tts_ttfb_ms, r.tts_completion_ms, r.e2e_latency_ms, r.is_success,
+             json.dumps(r.to_dict(), default=str))
+            for r in results
+        ])
+
+    def _read_results(self, run_id: str, config_id: Optional[str] = None, limit: int = -1) -> List[TestResult]:
+        if config_id:
+            rows = self._db.execute("""
+                SELECT result_json FROM results
+                WHERE run_id = ? AND config_id = ?
+                ORDER BY seq LIMIT ?
+            """, (run_id, config_id, limit))
+        else:
+            rows = self._db.execute("""
+                SELECT result_json FROM results
+                WHERE run_id = ?
+                ORDER BY seq LIMIT ?
+            """, (run_id, limit))
+        return [TestResult.from_dict(json.loads(row[0])) for row in rows]
+
     async def list_runs(
         self,
         status: Optional[RunStatus] = None,
@@ -344,33 +428,44 @@ class FileBasedLatencyStorage(LatencyHarnessStorage):
         limit: int = 50,
         offset: int = 0
     ) -> Tuple[List[TestRun], int]:
-        runs = list(self._runs.values())
+        """
+        List run summaries, newest first.
 
-        # Apply filters
+        Results are not loaded; use get_run or get_results for those.
+        """
+        conditions = []
+        params: List[Any] = []
         if status:
-            runs = [r for r in runs if r.status == status]
+            conditions.append("status = ?")
+            params.append(status.value)
         if suite_id:
-            runs = [r for r in runs if r.suite_id == suite_id]
-
-        # Sort by start time descending
-        runs.sort(key=lambda r: r.started_at or datetime.min, reverse=True)
-
-        total = len(runs)
-        runs = runs[offset:offset + limit]
-
+            conditions.append("suite_id = ?")
+            params.append(suite_id)
+        where_clause = " AND ".join(conditions) if conditions else "1"
+
+        total = self._db.execute(f"SELECT COUNT(*) FROM runs WHERE {where_clause}", params).fetchone()[0]
+        rows = self._db.execute(f"""
+            SELECT run_json FROM runs
+            WHERE {where_clause}
+            ORDER BY started_at DESC
+            LIMIT ? OFFSET ?
+        """, params + [limit, offset])
+
+        runs = [TestRun.from_dict(json.loads(row[0])) for row in rows]
         return runs, total
 
     async def get_run(self, run_id: str) -> Optional[TestRun]:
-        return self._runs.get(run_id)
-
-    async def save_run(self, run: TestRun) -> str:
-        self._runs[run.id] = run
+        row = self._db.execute("SELECT run_json FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if not row:
+            return None
 
-        # Write to disk
-        run_file = self.runs_dir / f"{run.id}.json"
-        with open(run_file, 'w') as f:
-            json.dump(run.to_dict(), f, indent=2, default=str)
+        run = TestRun.from_dict(json.loads(row[0]))
+        run.results = self._read_results(run_id)
+        return run
 
+    async def save_run(self, run: TestRun) -> str:
+        with self._db:
+            self._write_run(run)
         return run.id
 
     async def update_run_status(
@@ -380,28 +475,25 @@ class FileBasedLatencyStorage(LatencyHarnessStorage):
         completed_configurations: Optional[int] = None,
         completed_at: Optional[datetime] = None
     ) -> bool:
-        run = self._runs.get(run_id)
-        if not run:
+        row = self._db.execute("SELECT run_json FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if not row:
             return False
 
+        run = TestRun.from_dict(json.loads(row[0]))
         run.status = status
         if completed_configurations is not None:
             run.completed_configurations = completed_configurations
         if completed_at is not None:
             run.completed_at = completed_at
 
+        # Only the summary changes; results stay as they are
         await self.save_run(run)
         return True
 
     async def delete_run(self, run_id: str) -> bool:
-        if run_id not in self._runs:
-            return False
-
-        del self._runs[run_id]
-
-        run_file = self.runs_dir / f"{run_id}.json"
-        if run_file.exists():
-            run_file.unlink()
+        with self._db:
+            self._db.execute("DELETE FROM results WHERE run_id = ?", (run_id,))
+            deleted = self._db.execute("DELETE FROM runs WHERE id = ?", (run_id,)).rowcount
 
         # Also delete results directory if exists
         results_dir = self.runs_dir / run_id
@@ -409,18 +501,16 @@ class FileBasedLatencyStorage(LatencyHarnessStorage):
             import shutil
             shutil.rmtree(results_dir)
 
-        return True
+        return deleted > 0
 
     # =========================================================================
     # Test Result Operations
     # =========================================================================
 
     async def save_result(self, run_id: str, result: TestResult) -> str:
-        # Add result to run
-        run = self._runs.get(run_id)
-        if run:
-            run.results.append(result)
-            await self.save_run(run)
+        with self._db:
+            if self._db.execute("SELECT 1 FROM runs WHERE id = ?", (run_id,)).fetchone():
+                self._write_results(run_id, [result])
 
         return result.id
 
@@ -430,15 +520,7 @@ class FileBasedLatencyStorage(LatencyHarnessStorage):
         config_id: Optional[str] = None,
         limit: int = 1000
     ) -> List[TestResult]:
-        run = self._runs.get(run_id)
-        if not run:
-            return []
-
-        results = run.results
-        if config_id:
-            results = [r for r in results if r.config_id == config_id]
-
-        return results[:limit]
+        return self._read_results(run_id, config_id, limit)
 
     # =========================================================================
     # Baseline Operations
@@ -830,6 +912,49 @@ class PostgreSQLLatencyStorage(LatencyHarnessStorage):
             return PerformanceBaseline.from_dict(json.loads(row['baseline_json']))
 
 
+# SQLite schema for FileBasedLatencyStorage's run index
+RUN_INDEX_SCHEMA = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    suite_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    run_json TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status, started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_suite ON runs(suite_id, started_at DESC);
+
+-- seq keeps results in the order they were appended
+CREATE TABLE IF NOT EXISTS results (
+    seq INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    config_id TEXT NOT NULL,
+    stt_latency_ms REAL,
+    llm_ttfb_ms REAL,
+    llm_completion_ms REAL,
+    tts_ttfb_ms REAL,
+    tts_completion_ms REAL,
+    e2e_latency_ms REAL,
+    is_success INTEGER,
+    result_json TEXT NOT NULL,
+    UNIQUE (run_id, id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_results_config ON results(run_id, config_id);
+
+-- Run JSON files from before the index that have been imported
+CREATE TABLE IF NOT EXISTS legacy_imports (
+    file_name TEXT PRIMARY KEY
+);
+"""
+
+
 # PostgreSQL Schema
 LATENCY_HARNESS_SCHEMA = """
 -- Test Suites
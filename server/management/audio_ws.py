@@ -13,6 +13,7 @@ from aiohttp import web, WSMsgType
 
 from fov_context import SessionManager, UserSession, UserVoiceConfig
 from session_cache_integration import SessionCacheIntegration
+from state_backend import AFFINITY_COOKIE, StateBackend, affinity_headers, worker_id
 
 logger = logging.getLogger(__name__)
 
@@ -35,21 +36,31 @@ class AudioWebSocketHandler:
     - audio: Audio data response
     - error: Error response
     - prefetch_status: Background prefetch progress
+
+    The handshake response carries sticky-session hints (an affinity
+    cookie naming this worker, plus X-Session-Affinity/X-Worker-Id
+    headers) so a load balancer can keep a learner on one worker.
     """
 
+    TOPIC_SEGMENTS_NAMESPACE = "topic_segments"
+
     def __init__(
         self,
         session_manager: SessionManager,
         session_cache: SessionCacheIntegration,
+        state_backend: Optional[StateBackend] = None,
     ):
         """Initialize WebSocket handler.
 
         Args:
             session_manager: Session manager for user sessions
             session_cache: Session-cache integration for audio retrieval
+            state_backend: Optional backend; a shared one makes topic
+                segments registered by any worker visible to all
         """
         self.session_manager = session_manager
         self.session_cache = session_cache
+        self.state_backend = state_backend if state_backend and state_backend.shared else None
 
         # Active connections: session_id -> WebSocketResponse
         self._connections: Dict[str, web.WebSocketResponse] = {}
@@ -68,11 +79,24 @@ class AudioWebSocketHandler:
         if curriculum_id not in self._segments_by_topic:
             self._segments_by_topic[curriculum_id] = {}
         self._segments_by_topic[curriculum_id][topic_id] = segments
+        if self.state_backend:
+            self.state_backend.set_json(
+                self.TOPIC_SEGMENTS_NAMESPACE, f"{curriculum_id}/{topic_id}", segments
+            )
 
     def get_topic_segments(self, curriculum_id: str, topic_id: str) -> Optional[List[str]]:
         """Get segments for a topic."""
         if curriculum_id in self._segments_by_topic:
-            return self._segments_by_topic[curriculum_id].get(topic_id)
+            segments = self._segments_by_topic[curriculum_id].get(topic_id)
+            if segments is not None:
+                return segments
+        if self.state_backend:
+            segments = self.state_backend.get_json(
+                self.TOPIC_SEGMENTS_NAMESPACE, f"{curriculum_id}/{topic_id}"
+            )
+            if segments is not None:
+                self._segments_by_topic.setdefault(curriculum_id, {})[topic_id] = segments
+            return segments
         return None
 
     async def handle_connection(self, request: web.Request) -> web.WebSocketResponse:
@@ -87,28 +111,32 @@ class AudioWebSocketHandler:
         session_id = request.query.get("session_id")
         user_id = request.query.get("user_id")
 
-        ws = web.WebSocketResponse()
-        await ws.prepare(request)
-
         # Get or create user session
         session: Optional[UserSession] = None
 
         if session_id:
-            session = self.session_manager.get_user_session(session_id)
+            session = await self.session_manager.get_user_session_async(session_id)
 
         if not session and user_id:
-            session = self.session_manager.get_user_session_by_user(user_id)
+            session = await self.session_manager.get_user_session_by_user_async(user_id)
+
+        if not session and user_id:
+            session = await self.session_manager.create_user_session_async(user_id)
+
+        ws = web.WebSocketResponse()
+        if session:
+            # Sticky-session hints must go out with the handshake
+            ws.headers.update(affinity_headers(session.session_id))
+            ws.set_cookie(AFFINITY_COOKIE, worker_id(), httponly=True, samesite="Lax")
+        await ws.prepare(request)
 
         if not session:
-            if user_id:
-                session = self.session_manager.create_user_session(user_id)
-            else:
-                await ws.send_json({
-                    "type": "error",
-                    "error": "No session_id or user_id provided",
-                })
-                await ws.close()
-                return ws
+            await ws.send_json({
+                "type": "error",
+                "error": "No session_id or user_id provided",
+            })
+            await ws.close()
+            return ws
 
         # Register connection
         self._connections[session.session_id] = ws
@@ -227,6 +255,7 @@ class AudioWebSocketHandler:
 
             # Update playback state
             session.update_playback(segment_index, 0, True)
+            await self.session_manager.save_user_session_async(session)
 
             # Send audio response
             await ws.send_json({
@@ -274,6 +303,20 @@ class AudioWebSocketHandler:
         is_playing = data.get("is_playing", True)
 
         session.update_playback(segment_index, offset_ms, is_playing)
+        await self.session_manager.save_user_session_async(session)
+
+        # Re-plan prefetch from the reported position so the buffer tracks
+        # seeks and playback speed rather than only audio requests
+        if is_playing:
+            segments = self.get_topic_segments(
+                session.playback_state.curriculum_id, session.playback_state.topic_id
+            )
+            if segments:
+                asyncio.create_task(
+                    self.session_cache.prefetch_upcoming(
+                        session, segment_index, segments
+                    )
+                )
 
         # Acknowledge
         await ws.send_json({
@@ -304,6 +347,10 @@ class AudioWebSocketHandler:
 
         # Update playback state (stopped)
         session.update_playback(segment_index, offset_ms, False)
+        await self.session_manager.save_user_session_async(session)
+
+        # The conversation may take the lesson elsewhere; drop queued prefetch
+        self.session_cache.cancel_prefetch(session.session_id)
 
         logger.info(
             f"Barge-in from session {session.session_id} at segment {segment_index}, "
@@ -343,6 +390,10 @@ class AudioWebSocketHandler:
             cfg_weight=data.get("cfg_weight"),
             language=data.get("language"),
         )
+        await self.session_manager.save_user_session_async(session)
+
+        # Prefetches for the old voice would never be played
+        self.session_cache.cancel_prefetch(session.session_id)
 
         await ws.send_json({
             "type": "voice_config_ack",
@@ -375,6 +426,8 @@ class AudioWebSocketHandler:
             return
 
         session.set_current_topic(curriculum_id, topic_id)
+        await self.session_manager.save_user_session_async(session)
+        self.session_cache.cancel_prefetch(session.session_id)
 
         # Get segment count
         segments = self.get_topic_segments(curriculum_id, topic_id)
@@ -20,7 +20,7 @@ from .auth_api import AuthAPI, register_auth_routes
 from .auth_middleware import auth_middleware, require_auth, require_role, setup_token_service
 from .token_service import TokenService, TokenConfig
 from .password_service import PasswordService
-from .rate_limiter import RateLimiter, rate_limit_middleware
+from .rate_limiter import RateLimiter, SharedRateLimiter, create_rate_limiter, rate_limit_middleware
 
 __all__ = [
     'AuthAPI',
@@ -33,5 +33,7 @@ __all__ = [
     'TokenConfig',
     'PasswordService',
     'RateLimiter',
+    'SharedRateLimiter',
+    'create_rate_limiter',
     'rate_limit_middleware',
 ]
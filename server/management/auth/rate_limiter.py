@@ -2,18 +2,21 @@
 Rate Limiter
 
 Provides rate limiting for authentication endpoints using a token bucket algorithm.
-Supports both in-memory (development) and Redis (production) backends.
+Supports both in-memory (single worker) and shared StateBackend (multiple
+workers) bucket storage.
 """
 
 import asyncio
+import json
 import logging
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Callable, Dict, Optional, Tuple
 
 from aiohttp import web
 
+from state_backend import StateBackend
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,14 +62,12 @@ class InMemoryRateLimiter:
     In-memory rate limiter using token bucket algorithm.
     Suitable for development and single-instance deployments.
 
-    For production with multiple instances, use Redis-backed rate limiting.
+    For multiple worker processes, use SharedRateLimiter.
     """
 
     def __init__(self, limits: Optional[Dict[str, RateLimitConfig]] = None):
         self.limits = limits or DEFAULT_LIMITS
-        self._buckets: Dict[str, RateLimitState] = defaultdict(
-            lambda: RateLimitState(tokens=0, last_update=time.time())
-        )
+        self._buckets: Dict[str, RateLimitState] = {}
         self._lock = asyncio.Lock()
 
     def get_limit_config(self, category: str) -> RateLimitConfig:
@@ -95,43 +96,56 @@ class InMemoryRateLimiter:
 
         async with self._lock:
             now = time.time()
-            state = self._buckets[bucket_key]
-
-            # Calculate tokens to add based on time passed
-            time_passed = now - state.last_update
-            refill_rate = config.requests / config.window_seconds
-            tokens_to_add = time_passed * refill_rate
-
-            # Update bucket
-            state.tokens = min(config.burst, state.tokens + tokens_to_add)
-            state.last_update = now
-
-            # Check if we have tokens available
-            if state.tokens >= 1:
-                state.tokens -= 1
-                state.request_count += 1
-                allowed = True
-            else:
-                allowed = False
-
-            # Calculate headers
-            remaining = max(0, int(state.tokens))
-            reset_time = int(now + (config.window_seconds - (now % config.window_seconds)))
-
-            headers = {
-                'X-RateLimit-Limit': config.requests,
-                'X-RateLimit-Remaining': remaining,
-                'X-RateLimit-Reset': reset_time,
-                'X-RateLimit-Window': config.window_seconds,
-            }
-
-            if not allowed:
-                # Calculate retry-after
-                tokens_needed = 1 - state.tokens
-                retry_after = int(tokens_needed / refill_rate) + 1
-                headers['Retry-After'] = retry_after
-
-            return allowed, headers
+            state = self._buckets.get(bucket_key)
+            if state is None:
+                # New buckets start full
+                state = RateLimitState(tokens=config.burst, last_update=now)
+                self._buckets[bucket_key] = state
+
+            return self._take_token(state, config, now)
+
+    @staticmethod
+    def _take_token(
+        state: RateLimitState,
+        config: RateLimitConfig,
+        now: float
+    ) -> Tuple[bool, Dict[str, int]]:
+        """Internal: Refill a bucket, take a token if one is left, build headers."""
+        # Calculate tokens to add based on time passed
+        time_passed = now - state.last_update
+        refill_rate = config.requests / config.window_seconds
+        tokens_to_add = time_passed * refill_rate
+
+        # Update bucket
+        state.tokens = min(config.burst, state.tokens + tokens_to_add)
+        state.last_update = now
+
+        # Check if we have tokens available
+        if state.tokens >= 1:
+            state.tokens -= 1
+            state.request_count += 1
+            allowed = True
+        else:
+            allowed = False
+
+        # Calculate headers
+        remaining = max(0, int(state.tokens))
+        reset_time = int(now + (config.window_seconds - (now % config.window_seconds)))
+
+        headers = {
+            'X-RateLimit-Limit': config.requests,
+            'X-RateLimit-Remaining': remaining,
+            'X-RateLimit-Reset': reset_time,
+            'X-RateLimit-Window': config.window_seconds,
+        }
+
+        if not allowed:
+            # Calculate retry-after
+            tokens_needed = 1 - state.tokens
+            retry_after = int(tokens_needed / refill_rate) + 1
+            headers['Retry-After'] = retry_after
+
+        return allowed, headers
 
     async def reset(self, key: str, category: str = 'default') -> None:
         """Reset rate limit for a key (e.g., after successful auth)."""
@@ -156,10 +170,72 @@ class InMemoryRateLimiter:
         return len(expired_keys)
 
 
+class SharedRateLimiter(InMemoryRateLimiter):
+    """
+    Token bucket rate limiter with buckets in a StateBackend.
+
+    Every worker process using the same shared backend draws from the
+    same buckets, so limits hold however requests are balanced.
+    """
+
+    NAMESPACE = "rate_limits"
+
+    def __init__(
+        self,
+        backend: StateBackend,
+        limits: Optional[Dict[str, RateLimitConfig]] = None
+    ):
+        super().__init__(limits)
+        self.backend = backend
+
+    async def check_rate_limit(
+        self,
+        key: str,
+        category: str = 'default'
+    ) -> Tuple[bool, Dict[str, int]]:
+        """Check if a request is within rate limits (see InMemoryRateLimiter)."""
+        config = self.get_limit_config(category)
+        result = {}
+
+        def take(raw: Optional[bytes]) -> bytes:
+            now = time.time()
+            if raw:
+                state = RateLimitState(**json.loads(raw))
+            else:
+                state = RateLimitState(tokens=config.burst, last_update=now)
+            result["allowed"], result["headers"] = self._take_token(state, config, now)
+            return json.dumps(asdict(state)).encode()
+
+        # A bucket left alone until it refills is the same as a new one
+        full_after = config.burst * config.window_seconds / config.requests
+        await asyncio.to_thread(
+            self.backend.update, self.NAMESPACE, f"{category}:{key}", take, full_after
+        )
+        return result["allowed"], result["headers"]
+
+    async def reset(self, key: str, category: str = 'default') -> None:
+        """Reset rate limit for a key (e.g., after successful auth)."""
+        await asyncio.to_thread(self.backend.delete, self.NAMESPACE, f"{category}:{key}")
+
+    async def cleanup_expired(self, max_age_seconds: int = 3600) -> int:
+        """Remove buckets that have refilled; they expire in the backend."""
+        return await asyncio.to_thread(self.backend.purge_expired, self.NAMESPACE)
+
+
 # Alias for backwards compatibility
 RateLimiter = InMemoryRateLimiter
 
 
+def create_rate_limiter(
+    limits: Optional[Dict[str, RateLimitConfig]] = None,
+    backend: Optional[StateBackend] = None
+) -> InMemoryRateLimiter:
+    """Create a rate limiter that shares buckets when the backend is shared."""
+    if backend is not None and backend.shared:
+        return SharedRateLimiter(backend, limits)
+    return InMemoryRateLimiter(limits)
+
+
 def get_rate_limit_category(path: str) -> str:
     """
     Determine rate limit category from request path.
@@ -269,7 +345,8 @@ async def rate_limit_middleware(request: web.Request, handler: Callable) -> web.
 
 def setup_rate_limiter(
     app: web.Application,
-    limits: Optional[Dict[str, RateLimitConfig]] = None
+    limits: Optional[Dict[str, RateLimitConfig]] = None,
+    backend: Optional[StateBackend] = None
 ) -> RateLimiter:
     """
     Set up rate limiting for an aiohttp application.
@@ -277,11 +354,13 @@ def setup_rate_limiter(
     Args:
         app: The aiohttp application
         limits: Optional custom rate limit configurations
+        backend: Optional state backend; a shared one shares buckets
+            between worker processes
 
     Returns:
         The configured RateLimiter instance
     """
-    rate_limiter = RateLimiter(limits)
+    rate_limiter = create_rate_limiter(limits, backend)
     app['rate_limiter'] = rate_limiter
 
     # Schedule periodic cleanup
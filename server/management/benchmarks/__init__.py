@@ -0,0 +1,2 @@
+# Management server benchmarks
+# Standalone scripts; run from server/management with `python -m benchmarks.<name>`
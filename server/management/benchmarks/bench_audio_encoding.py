@@ -0,0 +1,96 @@
+"""
+Benchmark for the compressed audio storage tier.
+
+Synthesizes speech-like 16-bit mono WAV clips, runs them through
+AudioEncoder for every requested format that is installed on this host, and
+reports the cache capacity gain and encoder cost per minute of audio.
+
+Usage (from server/management):
+    python -m benchmarks.bench_audio_encoding --formats flac,opus --minutes 10
+"""
+
+import argparse
+import array
+import asyncio
+import io
+import math
+import random
+import time
+import wave
+
+from tts_cache.encoding import AudioEncoder, CODECS
+
+CACHE_BUDGET_BYTES = 2 * 1024 * 1024 * 1024  # TTSCache default
+
+
+def synth_clip(seconds: float, sample_rate: int = 24000, seed: int = 0) -> bytes:
+    """Voiced harmonics with a syllable-rate envelope, pauses and breath noise."""
+    rng = random.Random(seed)
+    pitch = rng.uniform(90, 220)
+    samples = array.array("h")
+    for n in range(int(seconds * sample_rate)):
+        t = n / sample_rate
+        syllable = max(0.0, math.sin(2 * math.pi * 4.0 * t))  # ~4 syllables/s
+        pause = 0.0 if (t % 2.5) > 2.2 else 1.0  # short gap every phrase
+        voiced = sum(
+            math.sin(2 * math.pi * pitch * h * t) / h for h in (1, 2, 3, 5)
+        )
+        value = 6000 * syllable * pause * voiced + rng.gauss(0, 120)
+        samples.append(max(-32768, min(32767, int(value))))
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return buf.getvalue()
+
+
+async def run(formats, minutes: float, clip_seconds: float, workers: int) -> None:
+    encoder = AudioEncoder(formats=formats, max_workers=workers, min_savings_ratio=0.0)
+    if not encoder.enabled:
+        wanted = ", ".join(f"{f} ({CODECS[f].binary})" for f in formats if f in CODECS)
+        print(f"No requested encoders are installed: {wanted or formats}")
+        return
+
+    clip_count = max(1, int(minutes * 60 / clip_seconds))
+    print(f"Synthesizing {clip_count} x {clip_seconds:.0f}s clips ({minutes:.1f} min of audio)...")
+    clips = [synth_clip(clip_seconds, seed=i) for i in range(clip_count)]
+    wav_bytes = sum(len(c) for c in clips)
+
+    for format_name in encoder.formats:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(encoder.encode(c, format_name) for c in clips))
+        wall = time.perf_counter() - start
+
+        stats = encoder.stats[format_name]
+        encoded_bytes = sum(len(r.data) for r in results if r is not None)
+        ratio = wav_bytes / encoded_bytes if encoded_bytes else 0.0
+        wav_minutes = CACHE_BUDGET_BYTES / (wav_bytes / minutes)
+        encoded_minutes = wav_minutes * ratio
+
+        print(f"\n[{format_name}] lossless={CODECS[format_name].lossless}")
+        print(f"  size:        {wav_bytes / 1e6:.1f} MB wav -> {encoded_bytes / 1e6:.1f} MB ({ratio:.2f}x)")
+        print(f"  2 GB budget: {wav_minutes:,.0f} -> {encoded_minutes:,.0f} minutes of audio")
+        print(f"  encode cost: {stats.encode_seconds_per_audio_minute:.3f} encoder-seconds per audio minute")
+        print(f"  wall time:   {wall:.2f}s with {workers} workers "
+              f"({minutes * 60 / wall:,.0f}x realtime)")
+
+    encoder.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--formats", default="flac,opus")
+    parser.add_argument("--minutes", type=float, default=5.0)
+    parser.add_argument("--clip-seconds", type=float, default=6.0)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    asyncio.run(run(formats, args.minutes, args.clip_seconds, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Benchmark for the shared content-addressed audio store.
+
+Replays a realistic mix through the TTS cache, KB audio and pregen jobs,
+once with private storage per subsystem and once with a shared
+AudioBlobStore. The mix has three parts:
+
+- KB modules are pre-generated.
+- A pregen job covers a slice of the same questions plus curriculum text.
+- Live sessions then request a blend of KB questions, curriculum segments
+  and novel text.
+
+It reports bytes on disk (unique inodes), TTS generations and the live
+cache hit rate for both runs.
+
+Usage (from server/management):
+    python -m benchmarks.bench_blob_store --questions 400 --live-requests 2000
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import os
+import random
+import tempfile
+import time
+import wave
+from pathlib import Path
+from typing import Dict, List
+from uuid import uuid4
+
+from tts_cache import AudioBlobStore, TTSCache, TTSCacheKey
+from tts_cache.kb_audio import KBAudioManager
+from tts_pregen.models import ItemStatus, TTSJobItem
+from tts_pregen.orchestrator import TTSPregenOrchestrator
+
+VOICE = "nova"
+PROVIDER = "vibevoice"
+SAMPLE_RATE = 24000
+
+
+class StubPool:
+    """Returns a WAV roughly as long as the text would take to speak."""
+
+    def __init__(self):
+        self.generations = 0
+
+    async def generate_with_priority(self, text, voice_id, provider, speed, chatterbox_config, priority):
+        self.generations += 1
+        seconds = max(0.5, len(text) / 15)
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(SAMPLE_RATE)
+            wav_file.writeframes(b"\x00\x00" * int(seconds * SAMPLE_RATE))
+        return buf.getvalue(), SAMPLE_RATE, seconds
+
+
+def build_mix(questions: int, live_requests: int, seed: int) -> Dict:
+    rng = random.Random(seed)
+    words = "energy matter planet theorem river empire enzyme orbit sonnet treaty".split()
+
+    def sentence(n: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(n)).capitalize() + f" {rng.random():.6f}."
+
+    module = {"domains": [{"questions": [
+        {
+            "id": f"q{i:04d}",
+            "question_text": sentence(18),
+            "answer_text": sentence(3),
+            "hints": [sentence(8)],
+            "explanation": sentence(25),
+        }
+        for i in range(questions)
+    ]}]}
+    kb_texts = [
+        text
+        for q in module["domains"][0]["questions"]
+        for text in (q["question_text"], q["answer_text"], *q["hints"], q["explanation"])
+    ]
+    curriculum = [sentence(20) for _ in range(questions)]
+
+    # Pregen job: a quarter of the KB questions (re-voiced for a pack) plus curriculum
+    pregen = kb_texts[: len(kb_texts) // 4] + curriculum
+
+    # Live traffic: 40% KB question text, 40% curriculum, 20% novel
+    live = []
+    for _ in range(live_requests):
+        roll = rng.random()
+        if roll < 0.4:
+            live.append(rng.choice(kb_texts))
+        elif roll < 0.8:
+            live.append(rng.choice(curriculum))
+        else:
+            live.append(sentence(12))
+    return {"module": module, "pregen": pregen, "live": live}
+
+
+def disk_usage(root: Path) -> int:
+    """Bytes of unique files under root (hardlinks counted once)."""
+    seen = set()
+    total = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            st = os.stat(os.path.join(dirpath, name))
+            if (st.st_dev, st.st_ino) not in seen:
+                seen.add((st.st_dev, st.st_ino))
+                total += st.st_size
+    return total
+
+
+async def run_mix(root: Path, mix: Dict, shared: bool) -> Dict:
+    pool = StubPool()
+    store = None
+    if shared:
+        store = AudioBlobStore(root / "tts_blobs")
+        await store.initialize()
+
+    cache = TTSCache(root / "tts_cache", max_size_bytes=1 << 40, blob_store=store)
+    await cache.initialize()
+
+    kb = KBAudioManager(
+        str(root / "kb_audio"), pool, delay_between_requests=0, max_concurrent=8, blob_store=store
+    )
+    await kb.initialize()
+    job_id = await kb.prefetch_module("bench-module", mix["module"], voice_id=VOICE, provider=PROVIDER)
+    task, _ = kb._jobs[job_id]
+    await task
+
+    orchestrator = TTSPregenOrchestrator(None, pool, blob_store=store)
+    output_dir = root / "tts-pregenerated" / "jobs" / "bench" / "audio"
+    output_dir.mkdir(parents=True)
+    job = uuid4()
+    for index, text in enumerate(mix["pregen"]):
+        item = TTSJobItem(
+            id=uuid4(), job_id=job, item_index=index, text_content=text,
+            text_hash=TTSJobItem.hash_text(text), status=ItemStatus.PENDING,
+        )
+        await orchestrator._process_item(item, PROVIDER, VOICE, {}, output_dir, "wav")
+
+    # Live sessions: cache-aside, generating on a miss
+    for text in mix["live"]:
+        key = TTSCacheKey.from_request(text=text, voice_id=VOICE, provider=PROVIDER)
+        if await cache.get(key) is None:
+            audio, sample_rate, duration = await pool.generate_with_priority(
+                text, VOICE, PROVIDER, 1.0, None, None
+            )
+            await cache.put(key, audio, sample_rate, duration)
+
+    stats = await cache.get_stats()
+    await cache.shutdown()
+    return {
+        "disk_bytes": disk_usage(root),
+        "generations": pool.generations,
+        "hit_rate": stats.hit_rate,
+        "shared_hits": stats.shared_hits,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    mix = build_mix(args.questions, args.live_requests, args.seed)
+    print(
+        f"{args.questions} KB questions ({args.questions * 4} segments), "
+        f"{len(mix['pregen'])} pregen items, {len(mix['live'])} live requests"
+    )
+
+    results: List[Dict] = []
+    for shared in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            result = await run_mix(Path(tmp), mix, shared)
+            result["seconds"] = time.perf_counter() - start
+            results.append(result)
+
+    print(f"{'storage':<9} {'disk MB':>9} {'TTS calls':>10} {'live hit %':>11} {'shared hits':>12} {'seconds':>8}")
+    for name, result in zip(("private", "shared"), results):
+        print(
+            f"{name:<9} {result['disk_bytes'] / 1e6:>9.1f} {result['generations']:>10} "
+            f"{result['hit_rate']:>11.1f} {result['shared_hits']:>12} {result['seconds']:>8.2f}"
+        )
+
+    private, shared = results
+    saved = private["disk_bytes"] - shared["disk_bytes"]
+    print(
+        f"\nDisk saved: {saved / 1e6:.1f} MB ({saved / private['disk_bytes'] * 100:.0f}%), "
+        f"TTS calls avoided: {private['generations'] - shared['generations']}, "
+        f"live hit-rate uplift: {shared['hit_rate'] - private['hit_rate']:+.1f} points"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, default=400)
+    parser.add_argument("--live-requests", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
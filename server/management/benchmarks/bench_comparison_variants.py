@@ -0,0 +1,177 @@
+"""
+Benchmark for comparison session variant generation.
+
+Builds a samples x configurations session spread over several providers,
+each with its own synthesis latency, and generates it through
+TTSComparisonManager twice:
+
+- serial: one background slot and one write per variant, matching
+  generation one variant at a time.
+- parallel: per-provider limits from TTSResourcePool, with batched
+  status writes.
+
+It reports wall time, database writes and the slowest provider's share
+of the work (its serial time divided by its concurrency limit), which is
+the floor the parallel run should approach.
+
+Usage (from server/management):
+    python -m benchmarks.bench_comparison_variants --samples 10 --configs 6
+    python -m benchmarks.bench_comparison_variants --latency vibevoice=0.8,piper=0.1
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from tts_cache.resource_pool import GenerationResult, TTSResourcePool
+from tts_pregen.comparison_manager import TTSComparisonManager
+from tts_pregen.models import TTSComparisonSession, TTSComparisonVariant
+
+
+class StubPool(TTSResourcePool):
+    """Resource pool whose providers sleep for a fixed latency."""
+
+    def __init__(self, latency: Dict[str, float], **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+
+    async def _generate_tts(self, text, voice_id, provider, speed, chatterbox_config):
+        await asyncio.sleep(self.latency[provider])
+        return GenerationResult(b"\x00\x00" * 2400, 24000, 0.1)
+
+
+class MemoryRepository:
+    """Just enough of TTSPregenRepository for generate_variants."""
+
+    def __init__(self, session: TTSComparisonSession, variants: List[TTSComparisonVariant], latency: float):
+        self.session = session
+        self.variants = variants
+        self.latency = latency
+        self.writes = 0
+
+    async def _round_trip(self) -> None:
+        self.writes += 1
+        await asyncio.sleep(self.latency)
+
+    async def get_session(self, session_id: UUID) -> Optional[TTSComparisonSession]:
+        return self.session
+
+    async def get_session_variants(self, session_id: UUID) -> List[TTSComparisonVariant]:
+        return self.variants
+
+    async def update_session_status(self, session_id: UUID, status) -> bool:
+        await self._round_trip()
+        return True
+
+    async def update_variants(self, variants: List[TTSComparisonVariant]) -> int:
+        await self._round_trip()
+        return len(variants)
+
+
+def build_session(samples: int, providers: List[str], configs: int):
+    session = TTSComparisonSession.create(
+        name="bench",
+        samples=[{"text": f"Sample sentence number {i}."} for i in range(samples)],
+        configurations=[
+            {"name": f"config {c}", "provider": providers[c % len(providers)], "voice_id": "nova"}
+            for c in range(configs)
+        ],
+    )
+    variants = [
+        TTSComparisonVariant.create(
+            session_id=session.id,
+            sample_index=s_idx,
+            config_index=c_idx,
+            text_content=sample["text"],
+            tts_config=config,
+        )
+        for s_idx, sample in enumerate(session.config["samples"])
+        for c_idx, config in enumerate(session.config["configurations"])
+    ]
+    return session, variants
+
+
+async def run_once(args: argparse.Namespace, latency: Dict[str, float], parallel: bool) -> Dict:
+    session, variants = build_session(args.samples, list(latency), args.configs)
+    repo = MemoryRepository(session, variants, args.db_latency_ms / 1000)
+    if parallel:
+        pool = StubPool(
+            latency,
+            max_concurrent_background=args.background_slots,
+            provider_concurrency=args.provider_concurrency,
+        )
+        flush_batch_size = 25
+    else:
+        pool = StubPool(latency, max_concurrent_background=1)
+        flush_batch_size = 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = TTSComparisonManager(
+            repo, pool, storage_dir=tmp, flush_batch_size=flush_batch_size
+        )
+        start = time.perf_counter()
+        await manager.generate_variants(session.id)
+        seconds = time.perf_counter() - start
+
+    per_provider = {
+        provider: sum(1 for v in variants if v.tts_config["provider"] == provider)
+        for provider in latency
+    }
+    floor = max(
+        per_provider[p] * latency[p] / pool.get_provider_limit(p) for p in latency
+    )
+    return {"seconds": seconds, "writes": repo.writes, "floor": floor}
+
+
+def parse_pairs(value: str, cast) -> Dict:
+    pairs = {}
+    for pair in value.split(","):
+        key, _, item = pair.partition("=")
+        if key.strip():
+            pairs[key.strip()] = cast(item)
+    return pairs
+
+
+async def run(args: argparse.Namespace) -> None:
+    latency = parse_pairs(args.latency, float)
+    args.provider_concurrency = parse_pairs(args.provider_concurrency, int)
+    print(
+        f"{args.samples} samples x {args.configs} configs over {len(latency)} providers "
+        f"(latency {args.latency}; limits {args.provider_concurrency or 'shared'})"
+    )
+
+    print(f"{'mode':<9} {'seconds':>8} {'DB writes':>10} {'floor s':>8}")
+    results = {}
+    for name, parallel in (("serial", False), ("parallel", True)):
+        result = await run_once(args, latency, parallel)
+        results[name] = result
+        floor = f"{result['floor']:.2f}" if parallel else "-"
+        print(f"{name:<9} {result['seconds']:>8.2f} {result['writes']:>10} {floor:>8}")
+
+    serial, parallel = results["serial"], results["parallel"]
+    print(
+        f"\nSpeedup: {serial['seconds'] / parallel['seconds']:.1f}x, "
+        f"parallel wall time is {parallel['seconds'] / parallel['floor']:.2f}x the slowest provider's share"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--configs", type=int, default=6)
+    parser.add_argument("--latency", default="vibevoice=0.4,chatterbox=0.3,piper=0.05")
+    parser.add_argument("--provider-concurrency", default="vibevoice=1,chatterbox=2,piper=2")
+    parser.add_argument("--background-slots", type=int, default=5)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark for ConfidenceMonitor response scoring.
+
+Scores long LLM-style responses three ways:
+
+- per-marker: the previous approach, one substring test or re.search per
+  hedging phrase and pattern and a str.count per vague word.
+- compiled: ConfidenceMonitor.analyze_response, one pass of the combined
+  marker regex.
+- streamed: ConfidenceMonitor.stream(), fed in --chunk-size pieces as a
+  token stream would arrive, then finished.
+
+It reports throughput in MB/s for each response length, and the cost of
+each streamed chunk in microseconds.
+
+Usage (from server/management):
+    python -m benchmarks.bench_confidence_monitor --repeat 50
+"""
+
+import argparse
+import re
+import statistics
+import time
+from typing import Callable, List
+
+from fov_context.confidence import ConfidenceMonitor
+
+PLAIN_SENTENCES = [
+    "Energy is conserved in a closed system, so the total stays the same. ",
+    "When the gas expands against the piston it does work on its surroundings. ",
+    "Heat flows from the hotter body to the colder one until both are equal. ",
+    "The first law relates the change in internal energy to heat and work. ",
+]
+MARKER_SENTENCES = [
+    "I think the heat probably flows from the hotter body to the colder one. ",
+    "Work done by the gas is roughly the area under the curve. ",
+    "I don't have information about your specific apparatus. ",
+    "Typically the efficiency is around forty percent, more or less. ",
+    "The surrounding air is unlikely to matter for this estimate. ",
+]
+
+
+def make_response(chars: int, marker_every: int = 1) -> str:
+    """Build a response with one marker sentence per `marker_every` sentences."""
+    parts: List[str] = []
+    size = 0
+    index = 0
+    while size < chars:
+        if index % marker_every == 0:
+            sentence = MARKER_SENTENCES[(index // marker_every) % len(MARKER_SENTENCES)]
+        else:
+            sentence = PLAIN_SENTENCES[index % len(PLAIN_SENTENCES)]
+        parts.append(sentence)
+        size += len(sentence)
+        index += 1
+    return "".join(parts)[:chars]
+
+
+def analyze_per_marker(text: str) -> float:
+    """The previous scoring loops, kept here as the baseline."""
+    text = text.lower()
+    monitor = ConfidenceMonitor
+    hedges = [w for p, w in monitor.HEDGING_PHRASES.items() if p in text]
+    hedging = min(1.0, sum(hedges) / len(hedges)) if hedges else 0.0
+    deflection = 0.0
+    for pattern in monitor.DEFLECTION_PATTERNS:
+        if re.search(pattern, text):
+            deflection = 0.8
+    gap = 0.0
+    for pattern in monitor.KNOWLEDGE_GAP_PATTERNS:
+        if re.search(pattern, text):
+            gap = 0.9
+    total = 0.0
+    text.split()
+    for word, weight in monitor.VAGUE_LANGUAGE.items():
+        total += weight * min(text.count(word), 3)
+    vague = min(1.0, total / (1 + min(500, len(text)) / 500.0))
+    return hedging + deflection + gap + vague
+
+
+def analyze_streamed(text: str, chunk_size: int) -> None:
+    stream = ConfidenceMonitor().stream()
+    for i in range(0, len(text), chunk_size):
+        stream.feed(text[i:i + chunk_size])
+    stream.finish()
+
+
+def throughput(func: Callable[[str], object], text: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        timings.append(time.perf_counter() - start)
+    return len(text) / statistics.median(timings) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=16, help="Characters per streamed chunk")
+    args = parser.parse_args()
+
+    monitor = ConfidenceMonitor()
+    print(f"Throughput (MB/s, median of {args.repeat}); streamed in {args.chunk_size}-char chunks")
+    print(f"{'markers':<8} {'chars':>8} {'per-marker':>11} {'compiled':>9} {'streamed':>9} {'us/chunk':>9}")
+    for label, marker_every in (("dense", 1), ("typical", 6)):
+        for chars in (1_000, 10_000, 100_000):
+            text = make_response(chars, marker_every)
+            baseline = throughput(analyze_per_marker, text, args.repeat)
+            compiled = throughput(monitor.analyze_response, text, args.repeat)
+            streamed = throughput(lambda t: analyze_streamed(t, args.chunk_size), text, args.repeat)
+            per_chunk = args.chunk_size / (streamed * 1e6) * 1e6
+            print(
+                f"{label:<8} {chars:>8} {baseline:>11.1f} {compiled:>9.1f} "
+                f"{streamed:>9.2f} {per_chunk:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
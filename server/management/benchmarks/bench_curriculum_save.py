@@ -0,0 +1,149 @@
+"""
+Benchmark for saving curricula to PostgreSQL.
+
+Times PostgreSQLStorage.save_curriculum on a synthetic UMCF document
+for:
+
+- fresh: the curriculum is new.
+- resave: the same document again, unchanged.
+- edited: one leaf topic's transcript changed.
+- reordered: the top-level units in reverse order.
+
+Needs a PostgreSQL database with the uuid-ossp and pg_trgm extensions
+available. The benchmark loads database/schema.sql and migration 005
+into a scratch schema that it creates and drops, so existing curricula
+are not touched.
+
+Usage (from server/management):
+    DATABASE_URL=postgresql://localhost/unamentis python -m benchmarks.bench_curriculum_save --units 20
+"""
+
+import argparse
+import asyncio
+import copy
+import os
+import sys
+import time
+from pathlib import Path
+
+import asyncpg
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.curriculum_db import PostgreSQLStorage
+
+SCHEMA = "curriculum_save_bench"
+DATABASE_DIR = Path(__file__).parent.parent.parent / "database"
+
+
+def make_topic(path: str, depth: int, fanout: int) -> dict:
+    return {
+        "id": {"value": f"topic-{path}"},
+        "title": f"Topic {path}",
+        "description": f"Synthetic topic {path}.",
+        "type": "unit" if depth else "topic",
+        "timeEstimates": {"overview": "PT5M", "introductory": "PT15M"},
+        "learningObjectives": [
+            {"id": {"value": f"lo-{path}-{i}"}, "statement": f"Objective {i}", "bloomsLevel": "understand"}
+            for i in range(2)
+        ],
+        "transcript": {
+            "segments": [
+                {
+                    "id": f"seg-{path}-{i}",
+                    "type": "explanation",
+                    "content": f"Segment {i} of topic {path}. " * 8,
+                    "speakingNotes": {"pace": "normal", "emphasis": ["topic"]},
+                    "alternativeExplanations": [{"style": "simpler", "content": "Put simply..."}],
+                }
+                for i in range(6)
+            ]
+        },
+        "examples": [{"id": {"value": f"ex-{path}"}, "type": "worked", "title": "Example", "content": "..."}],
+        "assessments": [
+            {
+                "id": {"value": f"as-{path}"},
+                "type": "choice",
+                "question": f"Question on {path}?",
+                "options": [{"id": o, "text": f"Option {o}", "isCorrect": o == "a"} for o in "abcd"],
+            }
+        ],
+        "children": [make_topic(f"{path}.{i}", depth - 1, fanout) for i in range(fanout)] if depth else [],
+    }
+
+
+def make_curriculum(units: int, depth: int, fanout: int) -> dict:
+    return {
+        "id": {"value": "bench-curriculum", "catalog": "bench"},
+        "title": "Benchmark Curriculum",
+        "version": {"number": "1.0.0"},
+        "lifecycle": {"contributors": [{"name": "Bench", "role": "author"}]},
+        "metadata": {"keywords": ["bench"]},
+        "glossary": {"terms": [{"id": f"term-{i}", "term": f"Term {i}"} for i in range(50)]},
+        "content": [make_topic(str(u), depth, fanout) for u in range(units)],
+    }
+
+
+def count_topics(nodes: list[dict]) -> int:
+    return sum(1 + count_topics(node.get("children", [])) for node in nodes)
+
+
+async def create_schema(url: str) -> None:
+    conn = await asyncpg.connect(url)
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await conn.execute(f"CREATE SCHEMA {SCHEMA}")
+        await conn.execute(f"SET search_path = {SCHEMA}, public")
+        await conn.execute((DATABASE_DIR / "schema.sql").read_text())
+        await conn.execute((DATABASE_DIR / "migrations" / "005_curriculum_bulk_save.sql").read_text())
+    finally:
+        await conn.close()
+
+
+async def drop_schema(url: str) -> None:
+    conn = await asyncpg.connect(url)
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    finally:
+        await conn.close()
+
+
+async def bench(url: str, units: int, depth: int, fanout: int) -> None:
+    document = make_curriculum(units, depth, fanout)
+    edited = copy.deepcopy(document)
+    leaf = edited["content"][-1]
+    while leaf["children"]:
+        leaf = leaf["children"][-1]
+    leaf["transcript"]["segments"][0]["content"] = "Rewritten segment."
+    reordered = dict(document, content=list(reversed(document["content"])))
+
+    await create_schema(url)
+    storage = PostgreSQLStorage(url)
+    storage.pool = await asyncpg.create_pool(url, server_settings={"search_path": f"{SCHEMA}, public"})
+    try:
+        print(f"{count_topics(document['content'])} topics\n")
+        print(f"{'phase':<10} {'seconds':>9}")
+        for phase, data in (("fresh", document), ("resave", document), ("edited", edited), ("reordered", reordered)):
+            start = time.perf_counter()
+            await storage.save_curriculum("bench-curriculum", data)
+            print(f"{phase:<10} {time.perf_counter() - start:>9.3f}")
+    finally:
+        await storage.close()
+        await drop_schema(url)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--units", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("set DATABASE_URL or pass --database-url")
+
+    asyncio.run(bench(args.database_url, args.units, args.depth, args.fanout))
+
+
+if __name__ == "__main__":
+    main()
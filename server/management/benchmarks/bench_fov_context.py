@@ -0,0 +1,149 @@
+"""
+Benchmark for FOV context building across a tutoring session.
+
+Replays a 60-turn session through FOVContextManager.build_messages_for_llm
+with realistic topic material. The topic changes every --turns-per-topic
+turns, and learner signals and questions arrive now and then. The same
+session is timed twice:
+
+- uncached: every buffer is rendered and every section joined on every
+  turn.
+- cached: the manager's per-buffer render caches are used.
+
+It reports time per turn and the number of working, episodic and
+semantic buffer renders per session (counted in a separate, untimed run).
+
+Usage (from server/management):
+    python -m benchmarks.bench_fov_context --turns 60 --repeat 200
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from fov_context.manager import FOVContextManager
+from fov_context.models import (
+    ConversationTurn,
+    EpisodicBuffer,
+    FOVContext,
+    GlossaryTerm,
+    MessageRole,
+    MisconceptionTrigger,
+    SemanticBuffer,
+    TopicSummary,
+    WorkingBuffer,
+)
+
+PARAGRAPH = (
+    "Energy can neither be created nor destroyed, only converted from one form to another. "
+    "In a closed system the change in internal energy equals heat added minus work done. "
+)
+
+
+def build_messages_uncached(manager: FOVContextManager, history: List[ConversationTurn]) -> list:
+    """build_messages_for_llm without render caches: render and join everything."""
+    budgets = manager.budget_config.budgets
+    max_turns = manager.budget_config.max_conversation_turns
+    manager.immediate_buffer.recent_turns = list(history[-max_turns:])
+    context = FOVContext(
+        system_prompt=manager.base_system_prompt,
+        immediate_context=manager.immediate_buffer.render(budgets.immediate),
+        working_context=manager.working_buffer.render(budgets.working),
+        episodic_context=manager.episodic_buffer.render(budgets.episodic),
+        semantic_context=manager.semantic_buffer.render(budgets.semantic),
+    )
+    messages = context.to_messages()
+    for turn in history[-max_turns:]:
+        messages.append({"role": turn.role.value, "content": turn.content})
+    return messages
+
+
+def set_topic(manager: FOVContextManager, index: int, total: int) -> None:
+    manager.set_current_topic(
+        topic_id=f"topic-{index}",
+        topic_title=f"Topic {index}: Conservation of Energy",
+        topic_content=PARAGRAPH * 20,
+        learning_objectives=[f"Objective {i} for topic {index}" for i in range(5)],
+        glossary_terms=[GlossaryTerm(f"term{i}", PARAGRAPH[:120]) for i in range(8)],
+        misconception_triggers=[
+            MisconceptionTrigger(f"phrase {i}", "misconception", PARAGRAPH[:100]) for i in range(4)
+        ],
+    )
+    manager.set_curriculum_position("physics", "Physics 101", index, total, "Unit 1", "Module 1")
+
+
+def run_session(turns: int, turns_per_topic: int, cached: bool, count_renders: bool = False) -> Dict:
+    manager = FOVContextManager.for_context_window(200_000)
+    manager.update_semantic_buffer(
+        curriculum_outline="\n".join(f"{i}. Topic {i}" for i in range(40)),
+        prerequisite_topics=["Algebra", "Vectors", "Kinematics"],
+        upcoming_topics=["Entropy", "Heat engines", "Refrigeration"],
+    )
+
+    renders = {"count": 0}
+    originals = {cls: cls.render for cls in (WorkingBuffer, EpisodicBuffer, SemanticBuffer)}
+    for cls, original in originals.items() if count_renders else ():
+
+        def counted(self, budget, counter=None, original=original):
+            renders["count"] += 1
+            return original(self, budget, counter)
+
+        cls.render = counted
+
+    build: Callable = (
+        manager.build_messages_for_llm if cached
+        else lambda history: build_messages_uncached(manager, history)
+    )
+
+    history: List[ConversationTurn] = []
+    timings = []
+    total_topics = turns // turns_per_topic + 1
+    try:
+        for turn in range(turns):
+            if turn % turns_per_topic == 0:
+                if turn:
+                    manager.record_topic_completion(
+                        TopicSummary(f"topic-{turn}", f"Topic {turn}", PARAGRAPH, 0.8)
+                    )
+                set_topic(manager, turn // turns_per_topic, total_topics)
+            if turn % 7 == 3:
+                manager.record_user_question(f"Could you explain step {turn} again?")
+            if turn % 11 == 5:
+                manager.record_clarification_request()
+
+            history.append(ConversationTurn(role=MessageRole.USER, content=f"Learner turn {turn}. " + PARAGRAPH))
+            manager.update_session_duration()
+            start = time.perf_counter()
+            build(history)
+            timings.append(time.perf_counter() - start)
+            history.append(ConversationTurn(role=MessageRole.ASSISTANT, content=PARAGRAPH * 2))
+    finally:
+        for cls, original in originals.items():
+            cls.render = original
+
+    return {"seconds": sum(timings), "renders": renders["count"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=60)
+    parser.add_argument("--turns-per-topic", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.turns}-turn session, topic change every {args.turns_per_topic} turns, {args.repeat} runs")
+    print(f"{'mode':<9} {'us/turn':>9} {'renders/session':>16}")
+    results = {}
+    for name, cached in (("uncached", False), ("cached", True)):
+        runs = [run_session(args.turns, args.turns_per_topic, cached) for _ in range(args.repeat)]
+        per_turn = statistics.median(r["seconds"] for r in runs) / args.turns * 1e6
+        results[name] = per_turn
+        renders = run_session(args.turns, args.turns_per_topic, cached, count_renders=True)["renders"]
+        print(f"{name:<9} {per_turn:>9.1f} {renders:>16}")
+
+    print(f"\nSpeedup: {results['uncached'] / results['cached']:.2f}x per turn")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark for FOV context-expansion retrieval.
+
+Generates a large synthetic curriculum (units of topics, each with
+transcript segments and misconceptions, plus a glossary) and measures:
+
+- build: indexing the UMCF document from scratch.
+- save / load: persisting the index and restoring it on the next start.
+- query: BM25 search latency for learner-style questions, over the
+  whole curriculum and limited to one unit.
+
+Usage (from server/management):
+    python -m benchmarks.bench_fov_retrieval --units 20 --topics 25 --segments 20
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from fov_context.retrieval import CurriculumIndex, CurriculumIndexStore
+
+VOCABULARY = (
+    "energy force mass velocity momentum heat entropy work power wave frequency "
+    "amplitude pressure volume temperature charge current voltage resistance field "
+    "magnet orbit gravity friction acceleration inertia torque lever pulley spring "
+    "oscillation photon electron proton neutron atom molecule reaction equilibrium "
+    "system closed open conserved transfer convert measure unit scale ratio graph"
+).split()
+FILLER = "the a of in is and to that it as for with this on by".split()
+
+
+def sentence(rng: random.Random, words: int = 14) -> str:
+    tokens = [rng.choice(VOCABULARY) if rng.random() < 0.45 else rng.choice(FILLER) for _ in range(words)]
+    return " ".join(tokens).capitalize() + "."
+
+
+def make_curriculum(units: int, topics: int, segments: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    children = []
+    for u in range(units):
+        unit_topics = []
+        for t in range(topics):
+            unit_topics.append({
+                "id": {"value": f"topic-{u}-{t}"},
+                "title": f"{rng.choice(VOCABULARY).title()} and {rng.choice(VOCABULARY)}",
+                "transcript": {"segments": [
+                    {"id": f"seg-{u}-{t}-{s}", "content": " ".join(sentence(rng) for _ in range(4))}
+                    for s in range(segments)
+                ]},
+                "misconceptions": [{
+                    "misconception": sentence(rng, 10),
+                    "correction": sentence(rng, 16),
+                    "triggerPhrases": [rng.choice(VOCABULARY)],
+                }],
+            })
+        children.append({"id": {"value": f"unit-{u}"}, "title": f"Unit {u}", "children": unit_topics})
+    return {
+        "content": [{"id": {"value": "root"}, "title": "Synthetic", "children": children}],
+        "glossary": {"terms": [
+            {"term": word, "definition": sentence(rng, 12)} for word in VOCABULARY
+        ]},
+    }
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--units", type=int, default=20)
+    parser.add_argument("--topics", type=int, default=25)
+    parser.add_argument("--segments", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+
+    umcf = make_curriculum(args.units, args.topics, args.segments)
+    index, build_seconds = timed(lambda: CurriculumIndex.from_umcf(umcf))
+    print(f"{len(index)} passages, {len(index._postings)} terms")
+    print(f"build: {build_seconds * 1000:.0f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        CurriculumIndexStore(Path(directory)).load_or_build("bench", umcf)
+        size = (Path(directory) / "bench.json").stat().st_size
+        _, load_seconds = timed(lambda: CurriculumIndexStore(Path(directory)).load_or_build("bench", umcf))
+    print(f"load from disk ({size / 1e6:.1f} MB, includes fingerprinting): {load_seconds * 1000:.0f} ms")
+
+    rng = random.Random(11)
+    queries = [
+        f"why does {rng.choice(VOCABULARY)} change the {rng.choice(VOCABULARY)} of a {rng.choice(VOCABULARY)}"
+        for _ in range(args.queries)
+    ]
+    unit = "unit-3"
+    for label, where in (("full curriculum", None), ("one unit", lambda p: p.unit_id == unit)):
+        latencies = []
+        for query in queries:
+            _, seconds = timed(lambda: index.search(query, k=4, where=where))
+            latencies.append(seconds * 1000)
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95)]
+        print(f"query ({label}): p50 {statistics.median(latencies):.2f} ms, p95 {p95:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
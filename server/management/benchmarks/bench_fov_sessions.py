@@ -0,0 +1,88 @@
+"""
+Benchmark for FOV session memory.
+
+Simulates many concurrent learners, each holding a long conversation,
+and measures memory per session with the default caps and with caps
+large enough to keep everything (the previous unbounded behaviour):
+
+- traced: bytes allocated while creating the sessions (tracemalloc).
+- estimated: SessionManager.memory_stats(), as served by /api/fov/memory.
+
+It then spills every session to a temporary directory and reports
+reap time and the memory left resident.
+
+Usage (from server/management):
+    python -m benchmarks.bench_fov_sessions --sessions 1000 --turns 400
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from fov_context.session import SessionConfig, SessionManager
+
+QUESTION = "Why does the entropy of a closed system never decrease over time? "
+ANSWER = "Because there are overwhelmingly more disordered microstates than ordered ones. " * 3
+
+
+def populate(manager: SessionManager, sessions: int, turns: int, config: SessionConfig) -> None:
+    for _ in range(sessions):
+        session = manager.create_session("physics-101", config)
+        session.set_current_topic("entropy", "Entropy", ANSWER * 10, ["Define entropy"])
+        for _ in range(turns // 2):
+            session.add_user_turn(QUESTION)
+            session.add_assistant_turn(ANSWER)
+            session.process_response_with_confidence(ANSWER)
+
+
+def measure(label: str, sessions: int, turns: int, config: SessionConfig) -> SessionManager:
+    manager = SessionManager()
+    tracemalloc.start()
+    populate(manager, sessions, turns, config)
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = manager.memory_stats(top=0)["fov_sessions"]
+    print(
+        f"{label:<10} {traced / sessions / 1024:>12.1f} {stats['mean_bytes'] / 1024:>14.1f} "
+        f"{traced / 1e6:>12.1f}"
+    )
+    return manager
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--turns", type=int, default=400)
+    args = parser.parse_args()
+
+    print(f"{args.sessions} sessions x {args.turns} turns")
+    print(f"{'caps':<10} {'traced KB/s':>12} {'estimated KB/s':>14} {'traced MB':>12}")
+    unbounded = SessionConfig(max_history_turns=10**9, max_events=10**9)
+    measure("unbounded", args.sessions, args.turns, unbounded)
+    manager = measure("default", args.sessions, args.turns, SessionConfig())
+
+    with tempfile.TemporaryDirectory() as directory:
+        manager.spill_dir = Path(directory)
+        start = time.perf_counter()
+        result = manager.reap(datetime.now() + timedelta(minutes=manager.spill_after_minutes + 1))
+        elapsed = time.perf_counter() - start
+        on_disk = sum(p.stat().st_size for p in Path(directory).iterdir())
+        stats = manager.memory_stats(top=0)["fov_sessions"]
+        print(
+            f"\nspilled {result['spilled']} sessions in {elapsed * 1000:.0f} ms "
+            f"({on_disk / result['spilled'] / 1024:.1f} KB each on disk); "
+            f"{stats['resident']} resident"
+        )
+
+        session_id = manager.list_sessions()[0]["session_id"]
+        start = time.perf_counter()
+        manager.get_session(session_id)
+        print(f"restore one session: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark for FOV token budgeting.
+
+Renders the working, episodic and semantic buffers over a range of
+budgets and measures the result three ways:
+
+- chars/4: the estimate the buffers used to budget with.
+- counter: the configured counter (tiktoken when installed, otherwise
+  the heuristic BPE approximation).
+- reference: tiktoken cl100k_base, when installed.
+
+It reports how far each estimate is from the reference, how much of the
+budget the packed output uses, and the per-call cost of counting with a
+cold and a warm LRU cache.
+
+Usage (from server/management):
+    python -m benchmarks.bench_fov_tokens --repeat 2000
+"""
+
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from fov_context.models import (
+    EpisodicBuffer,
+    GlossaryTerm,
+    MisconceptionTrigger,
+    SemanticBuffer,
+    TopicSummary,
+    WorkingBuffer,
+)
+from fov_context.tokens import (
+    TIKTOKEN_AVAILABLE,
+    CachedTokenCounter,
+    HeuristicTokenCounter,
+    TiktokenCounter,
+    get_token_counter,
+)
+
+PARAGRAPH = (
+    "Energy can neither be created nor destroyed, only converted from one form to another. "
+    "In a closed system, dU = Q - W; e.g. 1,250 J of heat at 300 K raises U by ~1.2 kJ. "
+)
+
+BUDGETS = (100, 300, 700, 1500, 4000)
+
+
+def build_buffers() -> Dict[str, object]:
+    return {
+        "working": WorkingBuffer(
+            topic_title="Conservation of Energy",
+            topic_content=PARAGRAPH * 60,
+            learning_objectives=[f"Apply the first law to case {i}" for i in range(5)],
+            glossary_terms=[GlossaryTerm(f"term{i}", PARAGRAPH[:120]) for i in range(8)],
+            misconception_triggers=[
+                MisconceptionTrigger(f"phrase {i}", "misconception", PARAGRAPH[:100]) for i in range(4)
+            ],
+        ),
+        "episodic": EpisodicBuffer(
+            topic_summaries=[
+                TopicSummary(f"topic-{i}", f"Topic {i}", PARAGRAPH * 2, 0.8) for i in range(12)
+            ],
+            user_questions=[f"Why is step {i} allowed?" for i in range(5)],
+        ),
+        "semantic": SemanticBuffer(
+            curriculum_outline="\n".join(f"{i}. Topic {i}: {PARAGRAPH[:60]}" for i in range(80)),
+            prerequisite_topics=["Algebra", "Vectors", "Kinematics"],
+            upcoming_topics=["Entropy", "Heat engines", "Refrigeration"],
+        ),
+    }
+
+
+def measure_accuracy(counter, reference) -> List[Dict]:
+    rows = []
+    for name, buffer in build_buffers().items():
+        for budget in BUDGETS:
+            rendered = buffer.render(budget, counter)
+            actual = reference.count(rendered) if reference else None
+            rows.append({
+                "buffer": name,
+                "budget": budget,
+                "chars4": len(rendered) // 4,
+                "counted": counter.count(rendered),
+                "actual": actual,
+            })
+    return rows
+
+
+def time_per_call(func, texts: List[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) / (repeat * len(texts)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    counter = get_token_counter()
+    reference = TiktokenCounter() if TIKTOKEN_AVAILABLE else None
+    print(f"Counter: {counter.name}")
+    print(f"Reference: {reference.name if reference else 'unavailable (install tiktoken)'}")
+
+    rows = measure_accuracy(counter, reference)
+    print(f"\n{'buffer':<9} {'budget':>6} {'chars/4':>8} {'counter':>8} {'actual':>8} {'used':>6}")
+    for row in rows:
+        actual = row["actual"] if row["actual"] is not None else row["counted"]
+        print(
+            f"{row['buffer']:<9} {row['budget']:>6} {row['chars4']:>8} {row['counted']:>8} "
+            f"{actual if row['actual'] is not None else '-':>8} {actual / row['budget']:>6.0%}"
+        )
+
+    if reference:
+        for label, key in (("chars/4", "chars4"), ("counter", "counted")):
+            errors = [abs(row[key] - row["actual"]) / max(1, row["actual"]) for row in rows]
+            over = sum(1 for row in rows if row["actual"] > row["budget"])
+            print(f"{label:<8} mean error {statistics.mean(errors):>6.1%}  over budget: {over}/{len(rows)}")
+
+    sections = [PARAGRAPH * n for n in (1, 4, 16)]
+    heuristic = HeuristicTokenCounter()
+    print(f"\nPer-call cost over {args.repeat} repeats (us)")
+    print(f"{'counter':<24} {'cold':>8} {'cached':>8}")
+    bases = [heuristic] + ([reference] if reference else [])
+    for base in bases:
+        cold = time_per_call(base.count, sections, args.repeat)
+        cached = CachedTokenCounter(base)
+        warm = time_per_call(cached.count, sections, args.repeat)
+        print(f"{base.name:<24} {cold:>8.2f} {warm:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark for Knowledge Bowl question imports.
+
+Compares KBQuestionsRepository.import_questions_bulk (one upsert per
+question, in batches of 1000 as /api/kb/sync-to-database used to run
+it) with import_questions_staged (COPY into a temporary table and one
+set-based upsert), for:
+
+- fresh: every question is new.
+- reimport: the same questions again, unchanged.
+- changed: the same questions with a tenth of them edited.
+
+Needs a PostgreSQL database with migration 003 applied. The benchmark
+works in a scratch schema that it creates and drops, so existing
+questions are not touched.
+
+Usage (from server/management):
+    DATABASE_URL=postgresql://localhost/unamentis python -m benchmarks.bench_kb_import --questions 50000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+import asyncpg
+
+from kb_questions_repository import KBQuestionsRepository
+
+SCHEMA = "kb_import_bench"
+DOMAINS = ["science", "mathematics", "literature", "history", "social_studies", "arts"]
+
+
+def make_questions(count: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"bench-{i:07d}",
+            "domain_id": rng.choice(DOMAINS),
+            "subcategory": "General",
+            "question_text": f"Benchmark question {i}: what is {rng.randint(1, 10**6)}?",
+            "answer_text": f"Answer {i}",
+            "acceptable_answers": [f"answer {i}", f"ans {i}"],
+            "difficulty": rng.randint(1, 5),
+            "hints": ["Think about it"],
+            "explanation": "Synthetic benchmark question.",
+            "question_source": "custom",
+        }
+        for i in range(count)
+    ]
+
+
+async def create_schema(url: str) -> None:
+    conn = await asyncpg.connect(url)
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await conn.execute(f"CREATE SCHEMA {SCHEMA}")
+        for table in ("kb_domains", "kb_questions", "kb_packs", "kb_pack_questions"):
+            await conn.execute(
+                f"CREATE TABLE {SCHEMA}.{table} (LIKE public.{table} INCLUDING ALL)"
+            )
+        await conn.execute(f"INSERT INTO {SCHEMA}.kb_domains SELECT * FROM public.kb_domains")
+    finally:
+        await conn.close()
+
+
+async def drop_schema(url: str) -> None:
+    conn = await asyncpg.connect(url)
+    try:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    finally:
+        await conn.close()
+
+
+async def run_loop(repo: KBQuestionsRepository, questions: list[dict]) -> str:
+    imported = 0
+    for i in range(0, len(questions), 1000):
+        imported += await repo.import_questions_bulk(questions[i : i + 1000])
+    return f"{imported} upserted"
+
+
+async def run_staged(repo: KBQuestionsRepository, questions: list[dict]) -> str:
+    counts = await repo.import_questions_staged(questions)
+    return f"{counts['inserted']} ins / {counts['updated']} upd / {counts['skipped']} skip"
+
+
+async def bench(url: str, count: int) -> None:
+    questions = make_questions(count)
+    changed = [
+        dict(q, answer_text=q["answer_text"] + " (edited)") if i % 10 == 0 else q
+        for i, q in enumerate(questions)
+    ]
+
+    await create_schema(url)
+    pool = await asyncpg.create_pool(url, server_settings={"search_path": SCHEMA})
+    try:
+        repo = KBQuestionsRepository(pool)
+        print(f"{'method':<8} {'phase':<10} {'seconds':>9} {'questions/s':>12}  result")
+        for name, run in (("loop", run_loop), ("staged", run_staged)):
+            async with pool.acquire() as conn:
+                await conn.execute("TRUNCATE kb_questions CASCADE")
+            for phase, batch in (("fresh", questions), ("reimport", questions), ("changed", changed)):
+                start = time.perf_counter()
+                result = await run(repo, batch)
+                elapsed = time.perf_counter() - start
+                print(f"{name:<8} {phase:<10} {elapsed:>9.2f} {count / elapsed:>12.0f}  {result}")
+    finally:
+        await pool.close()
+        await drop_schema(url)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, default=50_000)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("set DATABASE_URL or pass --database-url")
+
+    asyncio.run(bench(args.database_url, args.questions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark for Knowledge Bowl question listing.
+
+Loads synthetic questions into a scratch schema, then times
+KBQuestionsRepository.list_questions at increasing depths, paging by
+OFFSET and by cursor. Cursor pages should cost the same at any depth;
+OFFSET pages grow with the number of rows skipped. Counts and facets
+are served from the repository's cache after the first page.
+
+Needs a PostgreSQL database with migrations 003 and 004 applied.
+
+Usage (from server/management):
+    DATABASE_URL=postgresql://localhost/unamentis python -m benchmarks.bench_kb_listing --questions 100000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+import asyncpg
+
+from benchmarks.bench_kb_import import SCHEMA, create_schema, drop_schema, make_questions
+from kb_questions_repository import KBQuestionsRepository
+
+
+async def time_page(repo: KBQuestionsRepository, repeats: int, **kwargs) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await repo.list_questions(**kwargs)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+async def bench(url: str, count: int, page_size: int, repeats: int) -> None:
+    await create_schema(url)
+    pool = await asyncpg.create_pool(url, server_settings={"search_path": SCHEMA})
+    try:
+        repo = KBQuestionsRepository(pool)
+        await repo.import_questions_staged(make_questions(count))
+        async with pool.acquire() as conn:
+            # Spread creation times so the sort key is realistic
+            await conn.execute(
+                "UPDATE kb_questions SET created_at = NOW() - (random() * INTERVAL '365 days')"
+            )
+            await conn.execute("ANALYZE kb_questions")
+
+        # Cursors at each depth, found by walking the index once
+        depths = [d for d in (0, 1_000, 10_000, 50_000, count - page_size) if 0 <= d < count]
+        cursors = {}
+        async with pool.acquire() as conn:
+            for depth in depths:
+                if depth:
+                    row = await conn.fetchrow(
+                        "SELECT created_at, id FROM kb_questions"
+                        " ORDER BY created_at DESC, id DESC OFFSET $1 LIMIT 1",
+                        depth - 1,
+                    )
+                    cursors[depth] = repo.encode_question_cursor(
+                        {"created_at": row["created_at"].isoformat(), "id": row["id"]}
+                    )
+
+        print(f"{'depth':>8} {'offset ms':>10} {'cursor ms':>10}")
+        for depth in depths:
+            by_offset = await time_page(repo, repeats, limit=page_size, offset=depth)
+            by_cursor = await time_page(repo, repeats, limit=page_size, cursor=cursors.get(depth))
+            print(f"{depth:>8} {by_offset:>10.2f} {by_cursor:>10.2f}")
+    finally:
+        await pool.close()
+        await drop_schema(url)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("set DATABASE_URL or pass --database-url")
+
+    asyncio.run(bench(args.database_url, args.questions, args.page_size, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark for the file-backed KB packs store.
+
+Writes a synthetic questions store and packs registry to a temporary
+directory and times the two hot file-backed requests:
+
+- questions: /api/kb/questions with a search and a domain filter.
+- pack: /api/kb/packs/{id} stats and domain groups.
+
+"reparse" re-reads and scans the JSON files on every request, as
+kb_packs_api did before; "indexed" uses the cached files and
+KBLocalIndex. The first indexed request includes building the index.
+
+Usage (from server/management):
+    python -m benchmarks.bench_kb_local_store --questions 50000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import kb_packs_api
+
+WORDS = "energy force motion atom cell war treaty poem novel river mountain planet".split()
+
+
+def write_sources(directory: Path, count: int) -> None:
+    rng = random.Random(11)
+    questions = {
+        f"q{i}": {
+            "id": f"q{i}",
+            "domain_id": rng.choice(["science", "history", "literature", "arts"]),
+            "subcategory": "General",
+            "question_text": " ".join(rng.choice(WORDS) for _ in range(25)),
+            "answer_text": rng.choice(WORDS),
+            "difficulty": rng.randint(1, 5),
+            "question_type": "toss_up",
+            "status": "active",
+            "has_audio": rng.random() < 0.3,
+        }
+        for i in range(count)
+    }
+    ids = list(questions)
+    packs = [
+        {"id": f"pack-{p}", "name": f"Pack {p}", "question_ids": rng.sample(ids, min(count, 1000))}
+        for p in range(20)
+    ]
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "questions.json").write_text(json.dumps({"questions": questions, "version": "1.0.0"}, indent=2))
+    (directory / "registry.json").write_text(json.dumps({"packs": packs, "version": "1.0.0"}, indent=2))
+
+
+def reparse_questions(directory: Path) -> int:
+    store = json.loads((directory / "questions.json").read_text())
+    json.loads((directory / "registry.json").read_text())
+    matches = [
+        q for q in store["questions"].values()
+        if q.get("domain_id") == "science"
+        and ("atom cell" in q["question_text"].lower() or "atom cell" in q["answer_text"].lower())
+    ]
+    return len(matches[:20])
+
+
+def indexed_questions() -> int:
+    index = kb_packs_api.get_local_index(kb_packs_api.load_packs_registry(), kb_packs_api.load_questions_store())
+    page, _ = index.query_questions(domain_id="science", search="atom cell")
+    return len(page)
+
+
+def reparse_pack(directory: Path) -> int:
+    store = json.loads((directory / "questions.json").read_text())
+    registry = json.loads((directory / "registry.json").read_text())
+    pack = registry["packs"][0]
+    kb_packs_api.get_domain_groups(pack, store)
+    return kb_packs_api.calculate_pack_stats(pack, store)["question_count"]
+
+
+def indexed_pack() -> int:
+    registry = kb_packs_api.load_packs_registry()
+    index = kb_packs_api.get_local_index(registry, kb_packs_api.load_questions_store())
+    pack = registry["packs"][0]
+    index.pack_summary(pack, kb_packs_api.get_domain_groups)
+    return index.pack_summary(pack, kb_packs_api.calculate_pack_stats)["question_count"]
+
+
+def timed(func, repeats: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples[0], statistics.median(samples[1:] or samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, default=50_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "kb_packs"
+        write_sources(directory, args.questions)
+        kb_packs_api.PACKS_DIR = directory
+        size_mb = (directory / "questions.json").stat().st_size / 1e6
+        print(f"{args.questions} questions, {size_mb:.1f} MB store\n")
+
+        print(f"{'request':<10} {'mode':<8} {'first ms':>10} {'median ms':>10}")
+        for name, reparse, indexed in (
+            ("questions", lambda: reparse_questions(directory), indexed_questions),
+            ("pack", lambda: reparse_pack(directory), indexed_pack),
+        ):
+            for mode, func in (("reparse", reparse), ("indexed", indexed)):
+                first, median = timed(func, args.repeats)
+                print(f"{name:<10} {mode:<8} {first:>10.2f} {median:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
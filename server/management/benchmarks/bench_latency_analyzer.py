@@ -0,0 +1,130 @@
+"""
+Benchmark for latency harness result analysis.
+
+Generates synthetic runs and times:
+
+- per-call: the overall and per-configuration statistics computed the
+  previous way, rebuilding each metric list and sorting it again for
+  every median and percentile.
+- analyze: ResultsAnalyzer.analyze, which extracts and sorts each
+  metric once (vectorized when NumPy is installed).
+- live add: feeding every result into LiveRunStatistics, as the
+  orchestrator does while a run executes, reported per result.
+- live read: one P50/P95/P99 summary of those sketches.
+
+Usage (from server/management):
+    python -m benchmarks.bench_latency_analyzer --results 10000 100000 1000000 --configs 50
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from latency_harness.analyzer import ResultsAnalyzer, percentile
+from latency_harness.models import ClientType, NetworkProfile, RunStatus, TestResult, TestRun
+from latency_harness.stats import HAS_NUMPY, LiveRunStatistics
+
+METRIC_ATTRIBUTES = (
+    "e2e_latency_ms", "llm_ttfb_ms", "llm_completion_ms", "tts_ttfb_ms", "tts_completion_ms",
+)
+
+
+def make_run(results: int, configs: int, rng: random.Random) -> TestRun:
+    started = datetime(2026, 1, 1)
+    return TestRun(
+        id="bench_run",
+        suite_name="Provider Comparison",
+        suite_id="provider_comparison",
+        started_at=started,
+        client_id="client_1",
+        client_type=ClientType.IOS_SIMULATOR,
+        total_configurations=results,
+        status=RunStatus.COMPLETED,
+        completed_at=started,
+        completed_configurations=results,
+        results=[
+            TestResult(
+                id=f"result_{i}",
+                config_id=f"config_{i % configs}",
+                scenario_name="short_response",
+                repetition=i // configs,
+                timestamp=started,
+                client_type=ClientType.IOS_SIMULATOR,
+                stt_latency_ms=rng.uniform(30, 120),
+                llm_ttfb_ms=rng.uniform(80, 300),
+                llm_completion_ms=rng.uniform(300, 900),
+                tts_ttfb_ms=rng.uniform(50, 200),
+                tts_completion_ms=rng.uniform(200, 600),
+                e2e_latency_ms=rng.lognormvariate(6.2, 0.4),
+                network_profile=NetworkProfile.LOCALHOST,
+                stt_config={"provider": "deepgram"},
+                llm_config={"provider": "anthropic"},
+                tts_config={"provider": "chatterbox"},
+            )
+            for i in range(results)
+        ],
+    )
+
+
+def per_call_statistics(results: list[TestResult]) -> None:
+    for attr in METRIC_ATTRIBUTES:
+        statistics.median([getattr(r, attr) for r in results])
+    e2e = [r.e2e_latency_ms for r in results]
+    percentile(e2e, 99)
+
+    by_config = defaultdict(list)
+    for r in results:
+        by_config[r.config_id].append(r)
+    for config_results in by_config.values():
+        for attr in METRIC_ATTRIBUTES:
+            statistics.median([getattr(r, attr) for r in config_results])
+        e2e = [r.e2e_latency_ms for r in config_results]
+        percentile(e2e, 99)
+        statistics.stdev(e2e)
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def bench(sizes: list[int], configs: int) -> None:
+    rng = random.Random(13)
+    analyzer = ResultsAnalyzer()
+    print(f"numpy: {'yes' if HAS_NUMPY else 'no'}, {configs} configurations\n")
+    print(f"{'results':>9} {'per-call s':>11} {'analyze s':>10} {'live add us':>12} {'live read ms':>13}")
+    for size in sizes:
+        run = make_run(size, configs, rng)
+
+        per_call = timed(per_call_statistics, run.results)
+        analyze = timed(analyzer.analyze, run)
+
+        live = LiveRunStatistics()
+        start = time.perf_counter()
+        for result in run.results:
+            live.add(result)
+        live_add = (time.perf_counter() - start) / size
+        live_read = timed(live.summary)
+
+        print(f"{size:>9} {per_call:>11.3f} {analyze:>10.3f} {live_add * 1e6:>12.2f} {live_read * 1000:>13.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--configs", type=int, default=50)
+    args = parser.parse_args()
+
+    bench(args.results, args.configs)
+
+
+if __name__ == "__main__":
+    main()
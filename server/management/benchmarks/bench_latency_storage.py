@@ -0,0 +1,142 @@
+"""
+Benchmark for the latency harness file-based run storage.
+
+Writes a history of synthetic runs and times what the harness does with
+it: start up, list the newest page of runs, and load two runs with
+their results to compare them.
+
+"json" is the previous layout, one JSON file per run that startup
+parses in full; "indexed" is FileBasedLatencyStorage with its SQLite
+run index. Times should stay flat for the index as the history grows.
+
+Usage (from server/management):
+    python -m benchmarks.bench_latency_storage --runs 10 100 1000 --results 200
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from latency_harness.models import ClientType, NetworkProfile, RunStatus, TestResult, TestRun
+from latency_harness.storage import FileBasedLatencyStorage
+
+
+def make_run(index: int, results: int, rng: random.Random) -> TestRun:
+    started = datetime(2026, 1, 1) + timedelta(minutes=index)
+    return TestRun(
+        id=f"run_{index:06d}",
+        suite_name="Quick Validation",
+        suite_id="quick_validation",
+        started_at=started,
+        client_id="client_1",
+        client_type=ClientType.IOS_SIMULATOR,
+        total_configurations=results,
+        status=RunStatus.COMPLETED,
+        completed_at=started + timedelta(minutes=1),
+        completed_configurations=results,
+        results=[
+            TestResult(
+                id=f"run_{index:06d}_{i}",
+                config_id=f"config_{i % 8}",
+                scenario_name="short_response",
+                repetition=i,
+                timestamp=started,
+                client_type=ClientType.IOS_SIMULATOR,
+                stt_latency_ms=None,
+                llm_ttfb_ms=rng.uniform(80, 300),
+                llm_completion_ms=rng.uniform(300, 900),
+                tts_ttfb_ms=rng.uniform(50, 200),
+                tts_completion_ms=rng.uniform(200, 600),
+                e2e_latency_ms=rng.uniform(300, 1200),
+                network_profile=NetworkProfile.LOCALHOST,
+            )
+            for i in range(results)
+        ],
+    )
+
+
+async def bench_json(directory: Path, run_ids: list[str]) -> tuple[float, float, float]:
+    start = time.perf_counter()
+    runs = {}
+    for run_file in (directory / "runs").glob("*.json"):
+        run = TestRun.from_dict(json.loads(run_file.read_text()))
+        runs[run.id] = run
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sorted(runs.values(), key=lambda r: r.started_at, reverse=True)[:50]
+    listing = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _ = [runs[run_id].results for run_id in run_ids]
+    compare = time.perf_counter() - start
+    return startup, listing, compare
+
+
+async def bench_indexed(directory: Path, run_ids: list[str]) -> tuple[float, float, float]:
+    start = time.perf_counter()
+    storage = FileBasedLatencyStorage(directory)
+    await storage.initialize()
+    startup = time.perf_counter() - start
+
+    try:
+        start = time.perf_counter()
+        await storage.list_runs(limit=50)
+        listing = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for run_id in run_ids:
+            await storage.get_run(run_id)
+        compare = time.perf_counter() - start
+    finally:
+        await storage.close()
+    return startup, listing, compare
+
+
+async def bench(run_counts: list[int], results: int) -> None:
+    rng = random.Random(5)
+    print(f"{results} results per run\n")
+    print(f"{'runs':>6} {'layout':<8} {'startup ms':>11} {'list ms':>9} {'compare ms':>11}")
+    for count in run_counts:
+        runs = [make_run(i, results, rng) for i in range(count)]
+        run_ids = [runs[0].id, runs[-1].id]
+        with tempfile.TemporaryDirectory() as tmp:
+            json_dir = Path(tmp) / "json"
+            (json_dir / "runs").mkdir(parents=True)
+            for run in runs:
+                (json_dir / "runs" / f"{run.id}.json").write_text(json.dumps(run.to_dict(), default=str))
+
+            indexed_dir = Path(tmp) / "indexed"
+            storage = FileBasedLatencyStorage(indexed_dir)
+            await storage.initialize()
+            for run in runs:
+                await storage.save_run(run)
+            await storage.close()
+
+            for layout, run_bench, directory in (
+                ("json", bench_json, json_dir),
+                ("indexed", bench_indexed, indexed_dir),
+            ):
+                startup, listing, compare = await run_bench(directory, run_ids)
+                print(f"{count:>6} {layout:<8} {startup * 1000:>11.1f} {listing * 1000:>9.2f} {compare * 1000:>11.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--results", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(bench(args.runs, args.results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark for MinHash/LSH near-duplicate detection.
+
+Reports precision and recall on the labelled fixture in
+importers/tests/fixtures. Then it times indexing and clustering of a
+synthetic corpus in which a share of the questions are lightly edited
+copies of others, and scores the planted pairs.
+
+Pairs are compared only within shared LSH buckets; the table shows
+how many comparisons that took next to the all-pairs count.
+
+Usage (from server/management):
+    python -m benchmarks.bench_near_duplicates --questions 100000
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from importers.core.near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex
+
+FIXTURE = Path(__file__).parent.parent.parent / "importers" / "tests" / "fixtures" / "near_duplicate_questions.json"
+
+
+def score(predicted: set, truth: set) -> tuple[float, float]:
+    hits = len(predicted & truth)
+    return (hits / len(predicted) if predicted else 1.0), (hits / len(truth) if truth else 1.0)
+
+
+def cluster_pairs(index: NearDuplicateIndex) -> set:
+    pairs = set()
+    for cluster in index.clusters():
+        keys = [key for key, _ in cluster.members]
+        pairs.update(frozenset(pair) for pair in itertools.combinations(keys, 2))
+    return pairs
+
+
+def bench_fixture(threshold: float) -> None:
+    with open(FIXTURE) as f:
+        questions = json.load(f)["questions"]
+    index = NearDuplicateIndex(threshold=threshold)
+    for q in questions:
+        index.add(q["id"], q["question_text"], q["answer_text"])
+    group = {q["id"]: q["group"] for q in questions}
+    truth = {frozenset(p) for p in itertools.combinations(group, 2) if group[p[0]] == group[p[1]]}
+    precision, recall = score(cluster_pairs(index), truth)
+    print(f"fixture: {len(questions)} questions, {len(truth)} duplicate pairs")
+    print(f"  precision {precision:.2f}  recall {recall:.2f}\n")
+
+
+def make_corpus(count: int, duplicate_share: float, seed: int) -> tuple[list[tuple[str, str, str]], set]:
+    """Questions as (id, text, answer), and the planted duplicate pairs."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10))) for _ in range(20_000)
+    ]
+    # Zipf-like word frequencies, as in real text
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+
+    questions = []
+    planted = set()
+    originals = int(count * (1 - duplicate_share))
+    for i in range(originals):
+        words = rng.choices(vocabulary, weights, k=rng.randint(10, 30))
+        questions.append((f"q{i}", " ".join(words) + "?", rng.choice(vocabulary)))
+    for i in range(originals, count):
+        source_id, text, answer = questions[rng.randrange(originals)]
+        words = text.split()
+        for _ in range(rng.randint(1, 2)):
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        if rng.random() < 0.3:
+            words.insert(0, "For 10 points,")
+        questions.append((f"q{i}", " ".join(words), answer.upper()))
+        planted.add(frozenset((source_id, f"q{i}")))
+    return questions, planted
+
+
+def bench_corpus(count: int, duplicate_share: float, threshold: float) -> None:
+    questions, planted = make_corpus(count, duplicate_share, seed=7)
+    index = NearDuplicateIndex(threshold=threshold)
+
+    start = time.perf_counter()
+    for key, text, answer in questions:
+        index.add(key, text, answer)
+    index_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predicted = cluster_pairs(index)
+    cluster_seconds = time.perf_counter() - start
+
+    candidate_comparisons = sum(
+        len(bucket) * (len(bucket) - 1) // 2 for buckets in index._buckets for bucket in buckets.values()
+    )
+    # Planted copies of the same original are duplicates of each other too
+    truth = set()
+    for cluster in _planted_groups(planted):
+        truth.update(frozenset(pair) for pair in itertools.combinations(cluster, 2))
+    precision, recall = score(predicted, truth)
+
+    print(f"corpus: {count} questions, {len(planted)} planted near-duplicates, {index.bands}x{index.rows} bands")
+    print(f"{'step':<22} {'seconds':>10}")
+    print(f"{'index':<22} {index_seconds:>10.2f}")
+    print(f"{'cluster':<22} {cluster_seconds:>10.2f}")
+    print(f"\nbucket comparisons {candidate_comparisons:,} vs all pairs {count * (count - 1) // 2:,}")
+    print(f"planted pairs: precision {precision:.3f}  recall {recall:.3f}")
+
+
+def _planted_groups(planted: set) -> list[set]:
+    groups: dict[str, set] = {}
+    for pair in planted:
+        a, b = sorted(pair, key=lambda key: int(key[1:]))
+        groups.setdefault(a, {a}).add(b)
+    return list(groups.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, default=100_000)
+    parser.add_argument("--duplicate-share", type=float, default=0.1)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    bench_fixture(args.threshold)
+    bench_corpus(args.questions, args.duplicate_share, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
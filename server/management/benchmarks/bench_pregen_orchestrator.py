@@ -0,0 +1,223 @@
+"""
+Benchmark for TTS pre-generation job throughput.
+
+Creates a job of N items, runs it through TTSPregenOrchestrator against a
+stub TTS server (started in-process) and reports items/second plus database
+round trips for a serial baseline (one worker, one write per item) and the
+pooled configuration (worker pool, batched claims and flushes).
+
+Pass --dsn to run against a real Postgres with the tts_pregen schema;
+otherwise an in-memory repository adds --db-latency-ms to every call.
+
+Usage (from server/management):
+    python -m benchmarks.bench_pregen_orchestrator --items 10000 --concurrency 8
+    python -m benchmarks.bench_pregen_orchestrator --dsn postgresql://localhost/unamentis
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import tempfile
+import time
+import wave
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from aiohttp import web
+
+from tts_cache.resource_pool import TTSResourcePool
+from tts_pregen.job_manager import JobManager
+from tts_pregen.models import ItemStatus, JobStatus, TTSJobItem, TTSPregenJob
+from tts_pregen.orchestrator import TTSPregenOrchestrator
+from tts_pregen.repository import TTSPregenRepository
+
+STUB_PROVIDER = "stub"
+
+
+def silent_wav(seconds: float = 0.5, sample_rate: int = 24000) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(b"\x00\x00" * int(seconds * sample_rate))
+    return buf.getvalue()
+
+
+async def start_stub_tts(latency: float, slots: int) -> web.AppRunner:
+    """OpenAI-style /v1/audio/speech that serves `slots` requests at a time."""
+    audio = silent_wav()
+    capacity = asyncio.Semaphore(slots)
+
+    async def speech(request: web.Request) -> web.Response:
+        await request.json()
+        async with capacity:
+            await asyncio.sleep(latency)
+        return web.Response(body=audio, content_type="audio/wav")
+
+    app = web.Application()
+    app.router.add_post("/v1/audio/speech", speech)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+class MemoryRepository:
+    """The repository calls the orchestrator makes, held in memory.
+
+    Every call sleeps for the configured latency and counts as a round trip.
+    """
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.round_trips = 0
+        self.jobs: Dict[UUID, TTSPregenJob] = {}
+        self.items: Dict[UUID, TTSJobItem] = {}
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+
+    async def create_job(self, job: TTSPregenJob) -> TTSPregenJob:
+        await self._round_trip()
+        self.jobs[job.id] = job
+        return job
+
+    async def create_job_items(self, items: List[TTSJobItem]) -> int:
+        await self._round_trip()
+        self.items.update((item.id, item) for item in items)
+        return len(items)
+
+    async def get_job(self, job_id: UUID) -> Optional[TTSPregenJob]:
+        await self._round_trip()
+        return self.jobs.get(job_id)
+
+    async def update_job_status(self, job_id: UUID, status: JobStatus, **fields) -> TTSPregenJob:
+        await self._round_trip()
+        job = self.jobs[job_id]
+        job.status = status
+        for name, value in fields.items():
+            setattr(job, name, value)
+        return job
+
+    async def update_job_progress(self, job_id: UUID, **counters) -> None:
+        await self._round_trip()
+        job = self.jobs[job_id]
+        for name, value in counters.items():
+            if value is not None:
+                setattr(job, name, value)
+
+    async def claim_pending_items(self, job_id: UUID, limit: int = 100) -> List[TTSJobItem]:
+        await self._round_trip()
+        claimed = sorted(
+            (i for i in self.items.values() if i.job_id == job_id and i.status == ItemStatus.PENDING),
+            key=lambda i: i.item_index,
+        )[:limit]
+        for item in claimed:
+            item.status = ItemStatus.PROCESSING
+        return [TTSJobItem(**vars(item)) for item in claimed]
+
+    async def requeue_processing_items(self, job_id: UUID) -> int:
+        await self._round_trip()
+        return 0
+
+    async def update_job_items(self, items: List[TTSJobItem]) -> int:
+        await self._round_trip()
+        for item in items:
+            self.items[item.id] = TTSJobItem(**vars(item))
+        return len(items)
+
+
+async def run_job(
+    repository,
+    tts_pool: TTSResourcePool,
+    output_dir: str,
+    items: int,
+    **orchestrator_kwargs,
+) -> Dict[str, float]:
+    job_manager = JobManager(repository, base_output_dir=output_dir)
+    job = await job_manager.create_job(
+        name="bench",
+        source_type="custom",
+        items=[{"text": f"Benchmark sentence number {i}."} for i in range(items)],
+        tts_config={"provider": STUB_PROVIDER, "voice_id": "nova", "settings": {}},
+    )
+    orchestrator = TTSPregenOrchestrator(job_manager, tts_pool, **orchestrator_kwargs)
+
+    round_trips = getattr(repository, "round_trips", 0)
+    start = time.perf_counter()
+    await orchestrator.start_job(job.id)
+    while orchestrator.is_job_running(job.id):
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - start
+
+    job = await job_manager.get_job(job.id)
+    return {
+        "status": job.status.value,
+        "completed": job.completed_items,
+        "seconds": elapsed,
+        "items_per_second": job.completed_items / elapsed if elapsed else 0.0,
+        "round_trips": getattr(repository, "round_trips", 0) - round_trips,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    runner = await start_stub_tts(args.tts_ms / 1000, args.tts_slots)
+    port = runner.addresses[0][1]
+
+    db_pool = None
+    if args.dsn:
+        import asyncpg
+        db_pool = await asyncpg.create_pool(args.dsn, min_size=2, max_size=args.concurrency + 2)
+
+    configs = [
+        ("serial", dict(concurrency=1, flush_batch_size=1)),
+        ("pooled", dict(concurrency=args.concurrency, flush_batch_size=args.flush_batch_size)),
+    ]
+
+    print(
+        f"{args.items} items, stub TTS {args.tts_ms:.0f}ms x {args.tts_slots} slots, "
+        + (f"Postgres {args.dsn}" if db_pool else f"in-memory DB {args.db_latency_ms:.1f}ms/call")
+    )
+    print(f"{'config':<8} {'status':>10} {'done':>7} {'seconds':>9} {'items/s':>9} {'db calls':>9}")
+
+    try:
+        for name, kwargs in configs:
+            tts_pool = TTSResourcePool(max_concurrent_background=kwargs["concurrency"])
+            tts_pool.configure_server(STUB_PROVIDER, f"http://127.0.0.1:{port}/v1/audio/speech")
+            repository = (
+                TTSPregenRepository(db_pool) if db_pool
+                else MemoryRepository(args.db_latency_ms / 1000)
+            )
+            with tempfile.TemporaryDirectory() as output_dir:
+                result = await run_job(repository, tts_pool, output_dir, args.items, **kwargs)
+            round_trips = result["round_trips"] if not db_pool else "-"
+            print(
+                f"{name:<8} {result['status']:>10} {result['completed']:>7} "
+                f"{result['seconds']:>9.2f} {result['items_per_second']:>9.1f} {round_trips:>9}"
+            )
+    finally:
+        if db_pool:
+            await db_pool.close()
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=8, help="Workers for the pooled run")
+    parser.add_argument("--flush-batch-size", type=int, default=100)
+    parser.add_argument("--tts-ms", type=float, default=20.0, help="Stub TTS latency per request")
+    parser.add_argument("--tts-slots", type=int, default=8, help="Requests the stub serves in parallel")
+    parser.add_argument("--db-latency-ms", type=float, default=1.0, help="In-memory DB latency per call")
+    parser.add_argument("--dsn", help="Postgres DSN; uses the real repository instead of memory")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
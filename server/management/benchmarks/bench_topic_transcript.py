@@ -0,0 +1,115 @@
+"""
+Benchmark for topic transcript reads from PostgreSQL.
+
+Saves a synthetic curriculum (see bench_curriculum_save) and times
+transcript reads for random leaf topics:
+
+- multi-query: the previous PostgreSQLStorage.get_topic_transcript,
+  with one query each for the topic, segments, misconceptions,
+  examples and assessments.
+- single: the JSON-aggregated query, with the in-process cache cleared
+  before every read.
+- cached: PostgreSQLStorage.get_topic_transcript with a warm cache.
+
+Needs a PostgreSQL database; see bench_curriculum_save.
+
+Usage (from server/management):
+    DATABASE_URL=postgresql://localhost/unamentis python -m benchmarks.bench_topic_transcript --reads 2000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+
+import asyncpg
+
+from benchmarks.bench_curriculum_save import SCHEMA, create_schema, drop_schema, make_curriculum
+from database.curriculum_db import PostgreSQLStorage
+
+
+def leaf_ids(nodes: list[dict]) -> list[str]:
+    ids = []
+    for node in nodes:
+        ids.extend(leaf_ids(node["children"]) if node["children"] else [node["id"]["value"]])
+    return ids
+
+
+async def multi_query(pool: asyncpg.Pool, curriculum_id: str, topic_id: str) -> int:
+    async with pool.acquire() as conn:
+        topic = await conn.fetchrow("""
+            SELECT t.id, t.title FROM topics t JOIN curricula c ON t.curriculum_id = c.id
+            WHERE (c.external_id = $1 OR c.id::text = $1) AND (t.external_id = $2 OR t.id::text = $2)
+        """, curriculum_id, topic_id)
+        segments = await conn.fetch(
+            "SELECT * FROM transcript_segments WHERE topic_id = $1 ORDER BY order_index", topic["id"]
+        )
+        await conn.fetch("SELECT * FROM misconceptions WHERE topic_id = $1 ORDER BY order_index", topic["id"])
+        await conn.fetch("SELECT * FROM examples WHERE topic_id = $1 ORDER BY order_index", topic["id"])
+        await conn.fetch("""
+            SELECT a.*, array_agg(jsonb_build_object('id', ao.option_id) ORDER BY ao.order_index) AS options
+            FROM assessments a LEFT JOIN assessment_options ao ON a.id = ao.assessment_id
+            WHERE a.topic_id = $1 GROUP BY a.id ORDER BY a.order_index
+        """, topic["id"])
+        return len(segments)
+
+
+async def timed(read, topics: list[str]) -> list[float]:
+    samples = []
+    for topic_id in topics:
+        start = time.perf_counter()
+        await read(topic_id)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def bench(url: str, reads: int) -> None:
+    document = make_curriculum(units=20, depth=2, fanout=5)
+    rng = random.Random(3)
+    # A hot set of topics, as during a class working through the same unit
+    hot = rng.sample(leaf_ids(document["content"]), 50)
+    topics = [rng.choice(hot) for _ in range(reads)]
+
+    await create_schema(url)
+    storage = PostgreSQLStorage(url)
+    storage.pool = await asyncpg.create_pool(url, server_settings={"search_path": f"{SCHEMA}, public"})
+    try:
+        await storage.save_curriculum("bench-curriculum", document)
+
+        async def single(topic_id: str) -> None:
+            storage.invalidate_transcripts()
+            await storage.get_topic_transcript("bench-curriculum", topic_id)
+
+        async def cached(topic_id: str) -> None:
+            await storage.get_topic_transcript("bench-curriculum", topic_id)
+
+        print(f"{reads} reads over {len(hot)} topics\n")
+        print(f"{'mode':<12} {'p50 ms':>8} {'p99 ms':>8}")
+        for mode, read in (
+            ("multi-query", lambda topic_id: multi_query(storage.pool, "bench-curriculum", topic_id)),
+            ("single", single),
+            ("cached", cached),
+        ):
+            samples = sorted(await timed(read, topics))
+            p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+            print(f"{mode:<12} {statistics.median(samples):>8.3f} {p99:>8.3f}")
+    finally:
+        await storage.close()
+        await drop_schema(url)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("set DATABASE_URL or pass --database-url")
+
+    asyncio.run(bench(args.database_url, args.reads))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,26 @@
 
 import asyncio
 import logging
+import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from aiohttp import web
 
+from deployment_scheduler import (
+    DeadlineGate,
+    PlanEntry,
+    PlanItem,
+    ThroughputEstimator,
+    as_local_naive,
+    plan_deadlines,
+)
 from fov_context import UserVoiceConfig
+from idle_manager import IdleState
 from tts_cache import TTSCache, TTSCacheKey, TTSResourcePool, Priority
 
 logger = logging.getLogger(__name__)
@@ -57,6 +68,12 @@ class ScheduledDeployment:
     error: Optional[str] = None
     failed_segment_indices: List[int] = field(default_factory=list)
 
+    # Deadline planning
+    auto_start: bool = True
+    estimated_seconds: Optional[float] = None
+    latest_start: Optional[datetime] = None
+    deadline_feasible: Optional[bool] = None
+
     @property
     def percent_complete(self) -> float:
         if self.total_segments == 0:
@@ -88,6 +105,10 @@ class ScheduledDeployment:
             "generation_started_at": self.generation_started_at.isoformat() if self.generation_started_at else None,
             "generation_completed_at": self.generation_completed_at.isoformat() if self.generation_completed_at else None,
             "error": self.error,
+            "auto_start": self.auto_start,
+            "estimated_seconds": round(self.estimated_seconds, 1) if self.estimated_seconds is not None else None,
+            "latest_start": self.latest_start.isoformat() if self.latest_start else None,
+            "deadline_feasible": self.deadline_feasible,
         }
 
 
@@ -96,6 +117,10 @@ class ScheduledDeploymentManager:
 
     Features:
     - Schedule deployments with target dates
+    - Earliest-deadline-first planning from measured provider throughput
+    - Auto-start at the latest safe time, or earlier while the server is idle
+    - Deployments share generation slots in deadline order
+    - Warnings for deadlines that cannot be met
     - Background pre-generation using SCHEDULED priority
     - Progress tracking and status monitoring
     - Cache coverage verification
@@ -112,8 +137,9 @@ class ScheduledDeploymentManager:
             voice_config=UserVoiceConfig(voice_id="nova")
         )
 
-        # Start generation (or wait for automatic start)
+        # Start generation now, or let the scheduler start it in time
         await manager.start_generation(deployment.id)
+        manager.start_scheduler()
 
         # Check status
         status = manager.get_deployment(deployment.id)
@@ -124,17 +150,30 @@ class ScheduledDeploymentManager:
         cache: TTSCache,
         resource_pool: TTSResourcePool,
         auto_start_hours_before: int = 24,
+        idle_manager: Optional[Any] = None,
+        throughput: Optional[ThroughputEstimator] = None,
+        clock: Callable[[], datetime] = datetime.now,
+        safety_factor: float = 1.25,
     ):
         """Initialize deployment manager.
 
         Args:
             cache: Global TTS cache
             resource_pool: TTS resource pool
-            auto_start_hours_before: Hours before target date to auto-start generation
+            auto_start_hours_before: Hours before target date that an idle
+                server may start generation early
+            idle_manager: Optional IdleManager used to detect spare capacity
+            throughput: Provider throughput estimator (measured as segments run)
+            clock: Returns the current time (injectable for simulation)
+            safety_factor: Multiplier on estimated synthesis time when planning
         """
         self.cache = cache
         self.resource_pool = resource_pool
         self.auto_start_hours = auto_start_hours_before
+        self.idle_manager = idle_manager
+        self.throughput = throughput or ThroughputEstimator()
+        self.clock = clock
+        self.safety_factor = safety_factor
 
         # Deployments: id -> (deployment, task)
         self._deployments: Dict[str, tuple[ScheduledDeployment, Optional[asyncio.Task]]] = {}
@@ -142,6 +181,14 @@ class ScheduledDeploymentManager:
         # Curriculum segment loader (set by server.py)
         self._segment_loader: Optional[callable] = None
 
+        # Characters left to synthesize, by deployment
+        self._remaining_chars: Dict[str, int] = {}
+
+        # Generation slots shared by all deployments in deadline order
+        self._gate = DeadlineGate(resource_pool.max_concurrent_background)
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._warned_infeasible: set = set()
+
     def set_segment_loader(self, loader: callable) -> None:
         """Set the function to load curriculum segments.
 
@@ -178,6 +225,7 @@ class ScheduledDeploymentManager:
             curriculum_id=curriculum_id,
             target_date=target_date,
             voice_config=voice_config or UserVoiceConfig(),
+            auto_start=auto_start,
         )
 
         self._deployments[deployment_id] = (deployment, None)
@@ -299,10 +347,131 @@ class ScheduledDeploymentManager:
             "is_ready": cached_count == total,
         }
 
+    # =========================================================================
+    # Deadline Planning
+    # =========================================================================
+
+    async def plan_schedule(self) -> List[PlanEntry]:
+        """Plan all pending deployments earliest-deadline-first.
+
+        Updates each deployment's estimate, latest safe start and
+        feasibility, and logs a warning the first time a deadline looks
+        unreachable.
+
+        Returns:
+            Plan entries in deadline order
+        """
+        items = []
+        for deployment, _ in self._deployments.values():
+            if deployment.status not in (DeploymentStatus.SCHEDULED, DeploymentStatus.GENERATING):
+                continue
+            remaining = self._remaining_chars.get(deployment.id)
+            if remaining is None:
+                if not self._segment_loader:
+                    continue
+                segments = await self._segment_loader(deployment.curriculum_id)
+                remaining = sum(len(text) for text in segments or [])
+                if remaining:
+                    # An empty load (curriculum not imported yet) is retried next tick
+                    self._remaining_chars[deployment.id] = remaining
+
+            provider = deployment.voice_config.tts_provider
+            items.append(PlanItem(
+                deployment_id=deployment.id,
+                deadline=as_local_naive(deployment.target_date),
+                provider=provider,
+                remaining_chars=remaining,
+                parallelism=self.resource_pool.get_provider_limit(provider),
+            ))
+
+        plan = plan_deadlines(items, self.clock(), self.throughput, self.safety_factor)
+
+        for entry in plan:
+            deployment = self.get_deployment(entry.deployment_id)
+            deployment.estimated_seconds = entry.estimated_seconds
+            deployment.latest_start = entry.latest_start
+            deployment.deadline_feasible = entry.feasible
+            if not entry.feasible and entry.deployment_id not in self._warned_infeasible:
+                self._warned_infeasible.add(entry.deployment_id)
+                logger.warning(
+                    f"Deployment {deployment.id} ({deployment.name}) will likely miss its "
+                    f"target date {deployment.target_date.isoformat()}: projected finish "
+                    f"{entry.projected_finish.isoformat()}, "
+                    f"{-entry.slack_seconds / 3600:.1f}h late"
+                )
+
+        return plan
+
+    def has_idle_capacity(self) -> bool:
+        """Whether the server is idle enough to start deployments early."""
+        if self.idle_manager is None or not self.idle_manager.enabled:
+            return False
+        return self.idle_manager.current_state.level >= IdleState.WARM.level
+
+    async def tick(self) -> List[PlanEntry]:
+        """Re-plan and auto-start deployments that are due.
+
+        A deployment starts once its latest safe start has arrived, or
+        earlier when the server is idle and the target date is within
+        auto_start_hours_before.
+
+        Returns:
+            The plan used for this tick
+        """
+        plan = await self.plan_schedule()
+        now = self.clock()
+        idle = self.has_idle_capacity()
+
+        for entry in plan:
+            deployment = self.get_deployment(entry.deployment_id)
+            if deployment.status != DeploymentStatus.SCHEDULED or not deployment.auto_start:
+                continue
+            early_window = entry.deadline - timedelta(hours=self.auto_start_hours)
+            if now >= entry.latest_start or (idle and now >= early_window):
+                reason = "deadline" if now >= entry.latest_start else "idle capacity"
+                logger.info(f"Auto-starting deployment {deployment.id} ({reason})")
+                await self.start_generation(deployment.id)
+
+        return plan
+
+    def start_scheduler(self, interval_seconds: float = 60.0) -> None:
+        """Start the background planning loop."""
+        if self._scheduler_task and not self._scheduler_task.done():
+            return
+        self._scheduler_task = asyncio.create_task(self._scheduler_loop(interval_seconds))
+
+    async def stop_scheduler(self) -> None:
+        """Stop the background planning loop."""
+        if self._scheduler_task and not self._scheduler_task.done():
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+        self._scheduler_task = None
+
+    async def _scheduler_loop(self, interval_seconds: float) -> None:
+        """Internal: Periodically re-plan and auto-start deployments."""
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Deployment scheduler tick failed: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    # =========================================================================
+    # Generation
+    # =========================================================================
+
     async def _run_generation(self, deployment: ScheduledDeployment) -> None:
-        """Internal: Run pre-generation for a deployment."""
+        """Internal: Run pre-generation for a deployment.
+
+        Segments are generated by as many workers as the provider allows,
+        each taking a slot from the shared deadline gate so concurrent
+        deployments interleave earliest-deadline-first.
+        """
         deployment.status = DeploymentStatus.GENERATING
-        deployment.generation_started_at = datetime.now()
+        deployment.generation_started_at = self.clock()
 
         try:
             if not self._segment_loader:
@@ -314,57 +483,29 @@ class ScheduledDeploymentManager:
                 raise ValueError(f"No segments found for curriculum {deployment.curriculum_id}")
 
             deployment.total_segments = len(segments)
-            voice_config = deployment.voice_config
+            self._remaining_chars[deployment.id] = sum(len(text) for text in segments)
 
             logger.info(
                 f"Starting generation for deployment {deployment.id}: "
                 f"{len(segments)} segments"
             )
 
-            for i, text in enumerate(segments):
-                # Check if cancelled
-                if deployment.status == DeploymentStatus.CANCELLED:
-                    break
-
-                key = TTSCacheKey.from_request(
-                    text=text,
-                    voice_id=voice_config.voice_id,
-                    provider=voice_config.tts_provider,
-                    speed=voice_config.speed,
-                    exaggeration=voice_config.exaggeration,
-                    cfg_weight=voice_config.cfg_weight,
-                    language=voice_config.language,
-                )
+            queue = deque(enumerate(segments))
+            deadline = as_local_naive(deployment.target_date).timestamp()
+            provider = deployment.voice_config.tts_provider
 
-                # Check if already cached
-                if await self.cache.has(key):
-                    deployment.cached_segments += 1
-                    deployment.completed_segments += 1
-                    continue
+            async def worker() -> None:
+                while queue and deployment.status != DeploymentStatus.CANCELLED:
+                    i, text = queue.popleft()
+                    await self._gate.acquire(deadline)
+                    try:
+                        await self._generate_segment(deployment, i, text)
+                    finally:
+                        self._gate.release()
 
-                # Generate with SCHEDULED priority (low, won't starve live users)
-                try:
-                    audio_data, sample_rate, duration = await self.resource_pool.generate_with_priority(
-                        text=text,
-                        voice_id=voice_config.voice_id,
-                        provider=voice_config.tts_provider,
-                        speed=voice_config.speed,
-                        chatterbox_config=voice_config.get_chatterbox_config(),
-                        priority=Priority.SCHEDULED,
-                    )
-
-                    await self.cache.put(key, audio_data, sample_rate, duration)
-                    deployment.generated_segments += 1
-                    deployment.completed_segments += 1
-
-                except asyncio.CancelledError:
-                    deployment.status = DeploymentStatus.CANCELLED
-                    break
-                except Exception as e:
-                    logger.warning(f"Failed to generate segment {i} for deployment {deployment.id}: {e}")
-                    deployment.failed_segments += 1
-                    deployment.completed_segments += 1
-                    deployment.failed_segment_indices.append(i)
+            workers = min(self.resource_pool.get_provider_limit(provider), len(segments))
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            deployment.failed_segment_indices.sort()
 
             # Mark complete
             if deployment.status != DeploymentStatus.CANCELLED:
@@ -373,7 +514,7 @@ class ScheduledDeploymentManager:
                 else:
                     deployment.status = DeploymentStatus.COMPLETED
 
-            deployment.generation_completed_at = datetime.now()
+            deployment.generation_completed_at = self.clock()
 
             logger.info(
                 f"Deployment {deployment.id} generation complete: "
@@ -384,20 +525,61 @@ class ScheduledDeploymentManager:
 
         except asyncio.CancelledError:
             deployment.status = DeploymentStatus.CANCELLED
-            deployment.generation_completed_at = datetime.now()
+            deployment.generation_completed_at = self.clock()
         except Exception as e:
             deployment.status = DeploymentStatus.FAILED
             deployment.error = str(e)
-            deployment.generation_completed_at = datetime.now()
+            deployment.generation_completed_at = self.clock()
             logger.error(f"Deployment {deployment.id} failed: {e}")
 
+    async def _generate_segment(self, deployment: ScheduledDeployment, i: int, text: str) -> None:
+        """Internal: Ensure one segment is cached, measuring provider throughput."""
+        voice_config = deployment.voice_config
+        key = TTSCacheKey.from_request(
+            text=text,
+            voice_id=voice_config.voice_id,
+            provider=voice_config.tts_provider,
+            speed=voice_config.speed,
+            exaggeration=voice_config.exaggeration,
+            cfg_weight=voice_config.cfg_weight,
+            language=voice_config.language,
+        )
+
+        # Check if already cached
+        if await self.cache.has(key):
+            deployment.cached_segments += 1
+        else:
+            # Generate with SCHEDULED priority (low, won't starve live users)
+            try:
+                started = time.monotonic()
+                audio_data, sample_rate, duration = await self.resource_pool.generate_with_priority(
+                    text=text,
+                    voice_id=voice_config.voice_id,
+                    provider=voice_config.tts_provider,
+                    speed=voice_config.speed,
+                    chatterbox_config=voice_config.get_chatterbox_config(),
+                    priority=Priority.SCHEDULED,
+                )
+                self.throughput.record(voice_config.tts_provider, len(text), time.monotonic() - started)
+
+                await self.cache.put(key, audio_data, sample_rate, duration)
+                deployment.generated_segments += 1
+
+            except Exception as e:
+                logger.warning(f"Failed to generate segment {i} for deployment {deployment.id}: {e}")
+                deployment.failed_segments += 1
+                deployment.failed_segment_indices.append(i)
+
+        deployment.completed_segments += 1
+        self._remaining_chars[deployment.id] -= len(text)
+
     def cleanup_old_deployments(self, max_age_days: int = 30) -> int:
         """Remove completed deployments older than max_age.
 
         Returns:
             Number of deployments removed
         """
-        now = datetime.now()
+        now = self.clock()
         removed = 0
 
         for deployment_id in list(self._deployments.keys()):
@@ -413,6 +595,8 @@ class ScheduledDeploymentManager:
                     age_days = (now - deployment.generation_completed_at).days
                     if age_days > max_age_days:
                         del self._deployments[deployment_id]
+                        self._remaining_chars.pop(deployment_id, None)
+                        self._warned_infeasible.discard(deployment_id)
                         removed += 1
 
         return removed
@@ -438,7 +622,8 @@ async def handle_create_deployment(request: web.Request) -> web.Response:
             "voice_id": "nova",
             "tts_provider": "vibevoice",
             "speed": 1.0
-        }
+        },
+        "auto_start": true
     }
     """
     try:
@@ -483,7 +668,9 @@ async def handle_create_deployment(request: web.Request) -> web.Response:
         curriculum_id=curriculum_id,
         target_date=target_date,
         voice_config=voice_config,
+        auto_start=bool(data.get("auto_start", True)),
     )
+    await manager.plan_schedule()
 
     return web.json_response({
         "status": "scheduled",
@@ -507,6 +694,27 @@ async def handle_list_deployments(request: web.Request) -> web.Response:
     })
 
 
+async def handle_get_deployment_schedule(request: web.Request) -> web.Response:
+    """
+    GET /api/deployments/schedule
+
+    Get the earliest-deadline-first plan: estimated synthesis time, latest
+    safe start and projected finish for every pending deployment, plus the
+    provider throughput the estimates are based on.
+    """
+    manager: ScheduledDeploymentManager = request.app.get("deployment_manager")
+    if not manager:
+        return web.json_response({"error": "Deployment manager not initialized"}, status=503)
+
+    plan = await manager.plan_schedule()
+    return web.json_response({
+        "plan": [entry.to_dict() for entry in plan],
+        "infeasible": [entry.deployment_id for entry in plan if not entry.feasible],
+        "idle_capacity": manager.has_idle_capacity(),
+        "throughput": manager.throughput.to_dict(),
+    })
+
+
 async def handle_get_deployment(request: web.Request) -> web.Response:
     """
     GET /api/deployments/{id}
@@ -609,6 +817,7 @@ def register_deployment_routes(app: web.Application) -> None:
 
     app.router.add_post("/api/deployments", handle_create_deployment)
     app.router.add_get("/api/deployments", handle_list_deployments)
+    app.router.add_get("/api/deployments/schedule", handle_get_deployment_schedule)
     app.router.add_get("/api/deployments/{id}", handle_get_deployment)
     app.router.add_post("/api/deployments/{id}/start", handle_start_deployment)
     app.router.add_delete("/api/deployments/{id}", handle_cancel_deployment)
@@ -0,0 +1,240 @@
+# Deployment Scheduler
+# Earliest-deadline-first planning of curriculum pre-generation
+
+import asyncio
+import heapq
+import itertools
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+# Conservative synthesis rates (characters per second, per slot) used until a
+# provider has been measured
+DEFAULT_CHARS_PER_SECOND: Dict[str, float] = {
+    "vibevoice": 40.0,
+    "chatterbox": 30.0,
+    "piper": 400.0,
+}
+FALLBACK_CHARS_PER_SECOND = 40.0
+
+
+def as_local_naive(value: datetime) -> datetime:
+    """Normalize a datetime to naive local time so API and clock values compare."""
+    if value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+
+class ThroughputEstimator:
+    """Tracks measured synthesis throughput per TTS provider.
+
+    Each completed generation updates an exponentially weighted average of
+    characters synthesized per second for its provider, so estimates follow
+    the hardware and models actually deployed.
+    """
+
+    def __init__(
+        self,
+        defaults: Optional[Dict[str, float]] = None,
+        smoothing: float = 0.2,
+    ):
+        """Initialize the estimator.
+
+        Args:
+            defaults: Prior characters per second by provider
+            smoothing: Weight given to each new measurement (0-1)
+        """
+        self.defaults = dict(DEFAULT_CHARS_PER_SECOND if defaults is None else defaults)
+        self.smoothing = smoothing
+        self._measured: Dict[str, float] = {}
+        self._samples: Dict[str, int] = {}
+
+    def record(self, provider: str, chars: int, seconds: float) -> None:
+        """Record one generation of `chars` characters taking `seconds`."""
+        if chars <= 0 or seconds <= 0:
+            return
+        rate = chars / seconds
+        current = self._measured.get(provider)
+        self._measured[provider] = (
+            rate if current is None
+            else current + self.smoothing * (rate - current)
+        )
+        self._samples[provider] = self._samples.get(provider, 0) + 1
+
+    def chars_per_second(self, provider: str) -> float:
+        """Current throughput estimate for one slot of a provider."""
+        return self._measured.get(
+            provider, self.defaults.get(provider, FALLBACK_CHARS_PER_SECOND)
+        )
+
+    def estimate_seconds(self, provider: str, chars: int, parallelism: int = 1) -> float:
+        """Estimate wall time to synthesize `chars` characters.
+
+        Args:
+            provider: TTS provider name
+            chars: Characters still to synthesize
+            parallelism: Concurrent requests the provider will serve
+
+        Returns:
+            Estimated seconds
+        """
+        return chars / (self.chars_per_second(provider) * max(1, parallelism))
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        providers = set(self.defaults) | set(self._measured)
+        return {
+            provider: {
+                "chars_per_second": round(self.chars_per_second(provider), 1),
+                "samples": self._samples.get(provider, 0),
+            }
+            for provider in sorted(providers)
+        }
+
+
+@dataclass
+class PlanItem:
+    """Remaining work for one deployment, as input to the planner."""
+    deployment_id: str
+    deadline: datetime
+    provider: str
+    remaining_chars: int
+    parallelism: int = 1
+
+
+@dataclass
+class PlanEntry:
+    """Planned timing for one deployment."""
+    deployment_id: str
+    deadline: datetime
+    estimated_seconds: float
+    latest_start: datetime
+    projected_finish: datetime
+    feasible: bool
+
+    @property
+    def slack_seconds(self) -> float:
+        return (self.deadline - self.projected_finish).total_seconds()
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "deployment_id": self.deployment_id,
+            "deadline": self.deadline.isoformat(),
+            "estimated_seconds": round(self.estimated_seconds, 1),
+            "latest_start": self.latest_start.isoformat(),
+            "projected_finish": self.projected_finish.isoformat(),
+            "slack_seconds": round(self.slack_seconds, 1),
+            "feasible": self.feasible,
+        }
+
+
+def plan_deadlines(
+    items: List[PlanItem],
+    now: datetime,
+    estimator: ThroughputEstimator,
+    safety_factor: float = 1.25,
+) -> List[PlanEntry]:
+    """Plan deployments earliest-deadline-first.
+
+    Deployments are assumed to run one after another in deadline order,
+    each at its provider's parallelism. That over-estimates finish times
+    when providers differ (they really share the pool side by side), so
+    the plan errs on the safe side.
+
+    Latest starts come from a backward pass: each deployment must finish
+    by its own deadline and before the next deployment's latest start.
+
+    Args:
+        items: Remaining work per deployment
+        now: Current time
+        estimator: Provider throughput estimates
+        safety_factor: Multiplier on estimated synthesis time
+
+    Returns:
+        Plan entries in deadline order
+    """
+    ordered = sorted(items, key=lambda item: item.deadline)
+    durations = [
+        estimator.estimate_seconds(item.provider, item.remaining_chars, item.parallelism)
+        * safety_factor
+        for item in ordered
+    ]
+
+    latest_starts: List[datetime] = [now] * len(ordered)
+    must_end: Optional[datetime] = None
+    for index in range(len(ordered) - 1, -1, -1):
+        end = ordered[index].deadline if must_end is None else min(ordered[index].deadline, must_end)
+        latest_starts[index] = end - timedelta(seconds=durations[index])
+        must_end = latest_starts[index]
+
+    entries = []
+    finish = now
+    for item, duration, latest_start in zip(ordered, durations, latest_starts):
+        finish = finish + timedelta(seconds=duration)
+        entries.append(PlanEntry(
+            deployment_id=item.deployment_id,
+            deadline=item.deadline,
+            estimated_seconds=duration,
+            latest_start=latest_start,
+            projected_finish=finish,
+            feasible=finish <= item.deadline,
+        ))
+    return entries
+
+
+class DeadlineGate:
+    """Shares generation slots between deployments, earliest deadline first.
+
+    Every segment acquires a slot with its deployment's deadline; when a
+    slot frees up it goes to the waiter with the earliest deadline, so
+    concurrent deployments interleave at segment granularity and an urgent
+    deployment overtakes one that started earlier.
+    """
+
+    def __init__(self, slots: int):
+        self.slots = max(1, slots)
+        self._in_use = 0
+        self._waiters: List[tuple] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, deadline: float) -> None:
+        """Wait for a slot, served in deadline order."""
+        if self._in_use < self.slots and not self._waiters:
+            self._in_use += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (deadline, next(self._counter), future))
+        if self._in_use < self.slots:
+            loop.call_soon(self._wake)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over just as we were cancelled
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a slot.
+
+        The handoff is deferred one loop iteration so a worker releasing a
+        slot and immediately asking for the next one queues behind more
+        urgent waiters instead of skipping them.
+        """
+        self._in_use -= 1
+        asyncio.get_running_loop().call_soon(self._wake)
+
+    def _wake(self) -> None:
+        """Internal: Hand free slots to the most urgent live waiters."""
+        while self._waiters and self._in_use < self.slots:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self._in_use += 1
+                future.set_result(None)
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
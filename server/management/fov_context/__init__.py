@@ -10,10 +10,12 @@ from .confidence import (
     ConfidenceMarker,
     ConfidenceMonitor,
     ConfidenceMonitorConfig,
+    ConfidenceStream,
     ConfidenceTrend,
     ExpansionPriority,
     ExpansionRecommendation,
     ExpansionScope,
+    MarkerMatcher,
 )
 from .manager import (
     DEFAULT_SYSTEM_PROMPT,
@@ -39,6 +41,13 @@ from .models import (
     TranscriptSegment,
     WorkingBuffer,
 )
+from .retrieval import (
+    CurriculumIndex,
+    CurriculumIndexStore,
+    Passage,
+    RetrievalHit,
+    passages_from_umcf,
+)
 from .session import (
     FOVSession,
     PlaybackState,
@@ -46,9 +55,21 @@ from .session import (
     SessionEvent,
     SessionManager,
     SessionState,
+    StaleSessionError,
     UserSession,
     UserVoiceConfig,
 )
+from .tokens import (
+    CachedTokenCounter,
+    HeuristicTokenCounter,
+    PackItem,
+    TIKTOKEN_AVAILABLE,
+    TiktokenCounter,
+    TokenCounter,
+    get_token_counter,
+    pack_items,
+    truncate_to_tokens,
+)
 
 __all__ = [
     # Models
@@ -78,10 +99,18 @@ __all__ = [
     "ConfidenceMarker",
     "ConfidenceMonitor",
     "ConfidenceMonitorConfig",
+    "ConfidenceStream",
     "ConfidenceTrend",
     "ExpansionPriority",
     "ExpansionRecommendation",
     "ExpansionScope",
+    "MarkerMatcher",
+    # Retrieval
+    "CurriculumIndex",
+    "CurriculumIndexStore",
+    "Passage",
+    "RetrievalHit",
+    "passages_from_umcf",
     # Session
     "FOVSession",
     "PlaybackState",
@@ -89,6 +118,17 @@ __all__ = [
     "SessionEvent",
     "SessionManager",
     "SessionState",
+    "StaleSessionError",
     "UserSession",
     "UserVoiceConfig",
+    # Tokens
+    "CachedTokenCounter",
+    "HeuristicTokenCounter",
+    "PackItem",
+    "TIKTOKEN_AVAILABLE",
+    "TiktokenCounter",
+    "TokenCounter",
+    "get_token_counter",
+    "pack_items",
+    "truncate_to_tokens",
 ]
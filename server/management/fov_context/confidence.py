@@ -5,12 +5,13 @@ Analyzes LLM responses for uncertainty signals and determines when
 to trigger context expansion.
 """
 
+import itertools
 import logging
 import re
-from collections import deque
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +119,189 @@ class ExpansionRecommendation:
     query_hint: Optional[str] = None
 
 
+# Streaming holds back this many trailing characters before treating a
+# marker match as final; longer than any phrase or pattern match
+STREAM_HOLDBACK_CHARS = 96
+
+
+@dataclass
+class MarkerCounts:
+    """Marker occurrences found in a response."""
+    hedging: set[str] = field(default_factory=set)
+    deflection: bool = False
+    knowledge_gap: bool = False
+    vague: Counter = field(default_factory=Counter)
+
+    def add(self, marker: ConfidenceMarker, key: str, occurrences: int = 1) -> None:
+        if marker == ConfidenceMarker.HEDGING:
+            self.hedging.add(key)
+        elif marker == ConfidenceMarker.QUESTION_DEFLECTION:
+            self.deflection = True
+        elif marker == ConfidenceMarker.KNOWLEDGE_GAP:
+            self.knowledge_gap = True
+        else:
+            self.vague[key] += occurrences
+
+    def merged(self, other: "MarkerCounts") -> "MarkerCounts":
+        """Return a new MarkerCounts combining both."""
+        return MarkerCounts(
+            hedging=self.hedging | other.hedging,
+            deflection=self.deflection or other.deflection,
+            knowledge_gap=self.knowledge_gap or other.knowledge_gap,
+            vague=self.vague + other.vague,
+        )
+
+
+def expand_marker_pattern(pattern: str) -> list[str]:
+    """Expand a marker pattern such as "i (don't|can't) know" into literals.
+
+    Marker patterns are literal text with unnested (a|b) alternations.
+    """
+    if re.search(r"[.^$*+?{}\[\]\\]", pattern):
+        raise ValueError(f"Unsupported syntax in marker pattern: {pattern!r}")
+    options = [
+        group.split("|") if group else [literal]
+        for group, literal in re.findall(r"\(([^()]*)\)|([^()]+)", pattern)
+    ]
+    return ["".join(parts) for parts in itertools.product(*options)]
+
+
+def _trie_regex(literals: Iterable[str]) -> str:
+    """Internal: Regex source matching any literal, factored as a prefix trie."""
+    trie: dict = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        ends_here = "" in node
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        return "(?:" + "|".join(branches) + (")?" if ends_here else ")")
+
+    return build(trie)
+
+
+class MarkerMatcher:
+    """
+    Every hedging phrase, deflection and knowledge-gap pattern, and vague
+    word compiled into one trie-shaped regex, so a response is scanned once
+    instead of once per marker.
+
+    Markers must start and end on word boundaries ("likely" does not match
+    inside "unlikely"). Markers that overlap, or that are a prefix of a
+    longer marker, are all reported, as with separate per-marker searches.
+    """
+
+    def __init__(
+        self,
+        hedging_phrases: dict[str, float],
+        deflection_patterns: list[str],
+        knowledge_gap_patterns: list[str],
+        vague_language: dict[str, float],
+    ):
+        self._literals: dict[str, list[tuple[ConfidenceMarker, str]]] = {}
+        for marker, keys, expand in (
+            (ConfidenceMarker.HEDGING, hedging_phrases, False),
+            (ConfidenceMarker.QUESTION_DEFLECTION, deflection_patterns, True),
+            (ConfidenceMarker.KNOWLEDGE_GAP, knowledge_gap_patterns, True),
+            (ConfidenceMarker.VAGUE_LANGUAGE, vague_language, False),
+        ):
+            for key in keys:
+                for literal in expand_marker_pattern(key) if expand else [key]:
+                    self._literals.setdefault(literal, []).append((marker, key))
+
+        # A match also reports shorter markers it begins with, and scanning
+        # resumes inside it when another marker could start there
+        self._hits: dict[str, list[tuple[ConfidenceMarker, str]]] = {}
+        self._rescan: set[str] = set()
+        boundary = re.compile(r"\b")
+        for literal in self._literals:
+            hits = []
+            for other, entries in self._literals.items():
+                if other == literal or (literal.startswith(other) and boundary.match(literal, len(other))):
+                    hits.extend(entries)
+            self._hits[literal] = hits
+            for inner in boundary.finditer(literal, 1):
+                rest = literal[inner.start():]
+                if rest[:1].isalnum() and any(
+                    (other.startswith(rest) and boundary.match(other, len(rest)))
+                    or (rest.startswith(other) and boundary.match(rest, len(other)))
+                    for other in self._literals
+                ):
+                    self._rescan.add(literal)
+                    break
+
+        self.pattern = re.compile(r"\b(?:" + _trie_regex(self._literals) + r")\b")
+
+    @classmethod
+    def for_monitor(cls, monitor_cls: type) -> "MarkerMatcher":
+        """Get the compiled matcher for a monitor class's marker tables.
+
+        Compiled on first use and cached on the class.
+        """
+        cached = monitor_cls.__dict__.get("_compiled_matcher")
+        if cached is None:
+            cached = cls(
+                monitor_cls.HEDGING_PHRASES,
+                monitor_cls.DEFLECTION_PATTERNS,
+                monitor_cls.KNOWLEDGE_GAP_PATTERNS,
+                monitor_cls.VAGUE_LANGUAGE,
+            )
+            monitor_cls._compiled_matcher = cached
+        return cached
+
+    def scan(
+        self,
+        text: str,
+        pos: int = 0,
+        endpos: Optional[int] = None,
+    ) -> Iterator[tuple[int, ConfidenceMarker, str]]:
+        """Yield (start, marker, key) for markers starting in text[pos:endpos].
+
+        Text must already be lowercased. Characters outside the range are
+        still used for word boundaries and for matches that run past endpos.
+        """
+        end = len(text) if endpos is None else endpos
+        search = self.pattern.search
+        hits = self._hits
+        rescan = self._rescan
+        for match in self.pattern.finditer(text, pos):
+            start = match.start()
+            if start >= end:
+                return
+            literal = match.group()
+            for marker, key in hits[literal]:
+                yield start, marker, key
+            if literal in rescan:
+                # Markers starting inside this one
+                inner_end = min(match.end(), end)
+                inner = search(text, start + 1)
+                while inner is not None and inner.start() < inner_end:
+                    for marker, key in hits[inner.group()]:
+                        yield inner.start(), marker, key
+                    inner = search(text, inner.start() + 1)
+
+    def count(self, text: str) -> MarkerCounts:
+        """Count markers in lowercased text."""
+        counts = MarkerCounts()
+        found = self.pattern.findall(text)
+        if not self._rescan.isdisjoint(found):
+            for _, marker, key in self.scan(text):
+                counts.add(marker, key)
+            return counts
+
+        for literal, occurrences in Counter(found).items():
+            for marker, key in self._hits[literal]:
+                counts.add(marker, key, occurrences)
+        return counts
+
+
 class ConfidenceMonitor:
     """
     Monitors LLM response confidence and determines when context expansion
@@ -134,6 +318,7 @@ class ConfidenceMonitor:
         self.config = config or ConfidenceMonitorConfig.tutoring()
         self._recent_scores: deque[float] = deque(maxlen=10)
         self._last_analysis: Optional[ConfidenceAnalysis] = None
+        self._matcher = MarkerMatcher.for_monitor(type(self))
 
     # --- Hedging Phrases ---
     HEDGING_PHRASES = {
@@ -209,66 +394,31 @@ class ConfidenceMonitor:
             ConfidenceAnalysis with scores and detected markers
         """
         text = response.lower()
-        detected_markers: set[ConfidenceMarker] = set()
-
-        # Calculate component scores
-        hedging_score = self._calculate_hedging_score(text)
-        if hedging_score > 0.3:
-            detected_markers.add(ConfidenceMarker.HEDGING)
-
-        deflection_score = self._calculate_deflection_score(text)
-        if deflection_score > 0.3:
-            detected_markers.add(ConfidenceMarker.QUESTION_DEFLECTION)
-
-        knowledge_gap_score = self._calculate_knowledge_gap_score(text)
-        if knowledge_gap_score > 0.3:
-            detected_markers.add(ConfidenceMarker.KNOWLEDGE_GAP)
-
-        vague_score = self._calculate_vague_language_score(text)
-        if vague_score > 0.3:
-            detected_markers.add(ConfidenceMarker.VAGUE_LANGUAGE)
-
-        # Calculate weighted uncertainty score
-        uncertainty_score = (
-            hedging_score * self.config.hedging_weight +
-            deflection_score * self.config.deflection_weight +
-            knowledge_gap_score * self.config.knowledge_gap_weight +
-            vague_score * self.config.vague_language_weight
-        )
-
-        # Confidence is inverse of uncertainty (clamped to 0-1)
-        confidence_score = max(0.0, min(1.0, 1.0 - uncertainty_score))
+        analysis = self._score(self._matcher.count(text), len(text))
 
         # Record score for trend analysis
-        self._record_score(confidence_score)
+        self._record_score(analysis.confidence_score)
 
         # Determine trend
-        trend = self._calculate_trend()
-
-        analysis = ConfidenceAnalysis(
-            confidence_score=confidence_score,
-            uncertainty_score=uncertainty_score,
-            hedging_score=hedging_score,
-            question_deflection_score=deflection_score,
-            knowledge_gap_score=knowledge_gap_score,
-            vague_language_score=vague_score,
-            detected_markers=detected_markers,
-            trend=trend
-        )
+        analysis.trend = self._calculate_trend()
 
         self._last_analysis = analysis
 
         logger.debug(
             "Analyzed response confidence",
             extra={
-                "confidence": confidence_score,
-                "markers": [m.value for m in detected_markers],
-                "trend": trend.value
+                "confidence": analysis.confidence_score,
+                "markers": [m.value for m in analysis.detected_markers],
+                "trend": analysis.trend.value
             }
         )
 
         return analysis
 
+    def stream(self) -> "ConfidenceStream":
+        """Start scoring a response incrementally as it is generated."""
+        return ConfidenceStream(self)
+
     def should_trigger_expansion(self, analysis: ConfidenceAnalysis) -> bool:
         """Determine if context expansion should be triggered."""
         # Low confidence triggers expansion
@@ -350,57 +500,84 @@ class ConfidenceMonitor:
 
     # --- Private Methods ---
 
-    def _calculate_hedging_score(self, text: str) -> float:
-        """Calculate hedging language score."""
-        total_score = 0.0
-        match_count = 0
+    def _score(self, counts: MarkerCounts, text_length: int) -> ConfidenceAnalysis:
+        """Score marker counts; the trend is left for the caller to set."""
+        detected_markers: set[ConfidenceMarker] = set()
 
-        for phrase, weight in self.HEDGING_PHRASES.items():
-            if phrase in text:
-                total_score += weight
-                match_count += 1
+        # Calculate component scores
+        hedging_score = self._hedging_score(counts)
+        if hedging_score > 0.3:
+            detected_markers.add(ConfidenceMarker.HEDGING)
 
-        if match_count == 0:
-            return 0.0
+        deflection_score = 0.8 if counts.deflection else 0.0
+        if deflection_score > 0.3:
+            detected_markers.add(ConfidenceMarker.QUESTION_DEFLECTION)
 
-        return min(1.0, total_score / max(1, match_count))
+        knowledge_gap_score = 0.9 if counts.knowledge_gap else 0.0
+        if knowledge_gap_score > 0.3:
+            detected_markers.add(ConfidenceMarker.KNOWLEDGE_GAP)
 
-    def _calculate_deflection_score(self, text: str) -> float:
-        """Calculate question deflection score."""
-        max_score = 0.0
+        vague_score = self._vague_language_score(counts, text_length)
+        if vague_score > 0.3:
+            detected_markers.add(ConfidenceMarker.VAGUE_LANGUAGE)
 
-        for pattern in self.DEFLECTION_PATTERNS:
-            if re.search(pattern, text):
-                max_score = max(max_score, 0.8)
+        # Calculate weighted uncertainty score
+        uncertainty_score = (
+            hedging_score * self.config.hedging_weight +
+            deflection_score * self.config.deflection_weight +
+            knowledge_gap_score * self.config.knowledge_gap_weight +
+            vague_score * self.config.vague_language_weight
+        )
 
-        return max_score
+        # Confidence is inverse of uncertainty (clamped to 0-1)
+        confidence_score = max(0.0, min(1.0, 1.0 - uncertainty_score))
 
-    def _calculate_knowledge_gap_score(self, text: str) -> float:
-        """Calculate knowledge gap score."""
-        max_score = 0.0
+        return ConfidenceAnalysis(
+            confidence_score=confidence_score,
+            uncertainty_score=uncertainty_score,
+            hedging_score=hedging_score,
+            question_deflection_score=deflection_score,
+            knowledge_gap_score=knowledge_gap_score,
+            vague_language_score=vague_score,
+            detected_markers=detected_markers,
+        )
+
+    def _calculate_hedging_score(self, text: str) -> float:
+        """Calculate hedging language score."""
+        return self._hedging_score(self._matcher.count(text))
 
-        for pattern in self.KNOWLEDGE_GAP_PATTERNS:
-            if re.search(pattern, text):
-                max_score = max(max_score, 0.9)
+    def _calculate_deflection_score(self, text: str) -> float:
+        """Calculate question deflection score."""
+        return 0.8 if self._matcher.count(text).deflection else 0.0
 
-        return max_score
+    def _calculate_knowledge_gap_score(self, text: str) -> float:
+        """Calculate knowledge gap score."""
+        return 0.9 if self._matcher.count(text).knowledge_gap else 0.0
 
     def _calculate_vague_language_score(self, text: str) -> float:
         """Calculate vague language score."""
-        total_score = 0.0
-        word_count = len(text.split())
+        return self._vague_language_score(self._matcher.count(text), len(text))
 
-        for word, weight in self.VAGUE_LANGUAGE.items():
-            count = text.count(word)
-            if count > 0:
-                # Cap at 3 occurrences
-                total_score += weight * min(count, 3)
+    def _hedging_score(self, counts: MarkerCounts) -> float:
+        """Hedging score: mean weight of the distinct phrases used."""
+        if not counts.hedging:
+            return 0.0
 
-        # Normalize by text length
-        if word_count == 0:
+        total_score = sum(self.HEDGING_PHRASES[phrase] for phrase in counts.hedging)
+        return min(1.0, total_score / len(counts.hedging))
+
+    def _vague_language_score(self, counts: MarkerCounts, text_length: int) -> float:
+        """Vague language score, damped for longer responses."""
+        # Cap at 3 occurrences per word
+        total_score = sum(
+            self.VAGUE_LANGUAGE[word] * min(count, 3)
+            for word, count in counts.vague.items()
+        )
+        if total_score == 0:
             return 0.0
 
-        length_factor = min(500, len(text)) / 500.0
+        # Normalize by text length
+        length_factor = min(500, text_length) / 500.0
         normalized = total_score / (1 + length_factor)
 
         return min(1.0, normalized)
@@ -429,3 +606,83 @@ class ConfidenceMonitor:
             return ConfidenceTrend.DECLINING
         else:
             return ConfidenceTrend.STABLE
+
+
+class ConfidenceStream:
+    """
+    Scores a response chunk by chunk while the LLM is still generating it,
+    so expansion can be triggered before the response finishes.
+
+    Each feed() scans only the new text plus a short held-back tail, so the
+    cost of a response is linear in its length however it is chunked.
+    Matches near the end stay provisional until enough text follows to rule
+    out a longer or word-boundary-breaking continuation.
+    """
+
+    def __init__(self, monitor: ConfidenceMonitor):
+        self.monitor = monitor
+        self.length = 0
+        self.finished = False
+        self._final = MarkerCounts()
+        # Unsettled text, preceded by one settled character for \b
+        self._tail = ""
+        self._tail_start = 0
+        self._last: Optional[ConfidenceAnalysis] = None
+
+    def feed(self, chunk: str) -> ConfidenceAnalysis:
+        """Add generated text and return the provisional analysis so far.
+
+        The provisional analysis carries the monitor's current trend and
+        is not recorded in its history; call finish() for that.
+        """
+        if self.finished:
+            raise RuntimeError("Confidence stream already finished")
+
+        self._tail += chunk.lower()
+        self.length += len(chunk)
+
+        # Settle matches that start far enough back to be complete
+        settle_before = len(self._tail) - STREAM_HOLDBACK_CHARS
+        if settle_before > self._tail_start:
+            for _, marker, key in self.monitor._matcher.scan(
+                self._tail, self._tail_start, settle_before
+            ):
+                self._final.add(marker, key)
+            self._tail = self._tail[settle_before - 1:]
+            self._tail_start = 1
+
+        analysis = self.monitor._score(self._counts(), self.length)
+        analysis.trend = self.monitor._calculate_trend()
+        self._last = analysis
+        return analysis
+
+    @property
+    def should_expand(self) -> bool:
+        """Whether the text so far already warrants context expansion."""
+        return self._last is not None and self.monitor.should_trigger_expansion(self._last)
+
+    def finish(self) -> ConfidenceAnalysis:
+        """Score the complete response and record it with the monitor.
+
+        Equivalent to monitor.analyze_response() on the concatenated chunks.
+        """
+        if self.finished:
+            raise RuntimeError("Confidence stream already finished")
+        self.finished = True
+
+        monitor = self.monitor
+        analysis = monitor._score(self._counts(), self.length)
+        monitor._record_score(analysis.confidence_score)
+        analysis.trend = monitor._calculate_trend()
+        monitor._last_analysis = analysis
+        self._last = analysis
+        return analysis
+
+    def _counts(self) -> MarkerCounts:
+        """Internal: Settled counts plus provisional matches in the tail."""
+        provisional = None
+        for _, marker, key in self.monitor._matcher.scan(self._tail, self._tail_start):
+            if provisional is None:
+                provisional = MarkerCounts()
+            provisional.add(marker, key)
+        return self._final if provisional is None else self._final.merged(provisional)
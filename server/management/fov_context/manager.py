@@ -49,6 +49,9 @@ If the student interrupts or asks a question, respond helpfully based on the con
 
 Always maintain a supportive, encouraging tone while being intellectually rigorous."""
 
+# Buffers whose renderings are cached between LLM calls
+CACHED_BUFFERS = ("working", "episodic", "semantic")
+
 
 @dataclass
 class FOVContextManager:
@@ -60,6 +63,10 @@ class FOVContextManager:
     - Working Buffer: Current topic materials
     - Episodic Buffer: Session memory
     - Semantic Buffer: Curriculum overview
+
+    Working, episodic and semantic renderings are cached and only rebuilt
+    after one of the mutating methods below bumps that buffer's version.
+    Code that edits a buffer's fields directly must call invalidate().
     """
 
     # Configuration
@@ -72,6 +79,14 @@ class FOVContextManager:
     episodic_buffer: EpisodicBuffer = field(default_factory=EpisodicBuffer)
     semantic_buffer: SemanticBuffer = field(default_factory=SemanticBuffer)
 
+    # Render caches, keyed by buffer name
+    _versions: dict = field(
+        default_factory=lambda: dict.fromkeys(CACHED_BUFFERS, 0),
+        init=False, repr=False, compare=False
+    )
+    _render_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _prefix_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     @classmethod
     def for_model(
         cls,
@@ -116,6 +131,7 @@ class FOVContextManager:
             FOVContext with all buffer layers rendered
         """
         budgets = self.budget_config.budgets
+        counter = self.budget_config.token_counter
 
         # Update immediate buffer with current state
         if conversation_history:
@@ -125,18 +141,27 @@ class FOVContextManager:
         if barge_in_utterance:
             self.immediate_buffer.barge_in_utterance = barge_in_utterance
 
-        # Render each buffer within its budget
-        immediate_context = self.immediate_buffer.render(budgets.immediate)
-        working_context = self.working_buffer.render(budgets.working)
-        episodic_context = self.episodic_buffer.render(budgets.episodic)
-        semantic_context = self.semantic_buffer.render(budgets.semantic)
-
+        # Render each buffer within its budget; only the immediate buffer
+        # changes every turn, the rest come from cache until invalidated
+        immediate_context = self.immediate_buffer.render(budgets.immediate, counter)
+        working_context = self._render_cached("working", self.working_buffer, budgets.working)
+        episodic_context = self._render_cached("episodic", self.episodic_buffer, budgets.episodic)
+        semantic_context = self._render_cached("semantic", self.semantic_buffer, budgets.semantic)
+
+        sections = (
+            self.base_system_prompt,
+            immediate_context,
+            working_context,
+            episodic_context,
+            semantic_context,
+        )
         context = FOVContext(
             system_prompt=self.base_system_prompt,
             immediate_context=immediate_context,
             working_context=working_context,
             episodic_context=episodic_context,
-            semantic_context=semantic_context
+            semantic_context=semantic_context,
+            total_token_estimate=sum(counter.count(section) for section in sections)
         )
 
         logger.debug(
@@ -163,7 +188,12 @@ class FOVContextManager:
         """
         context = self.build_context(conversation_history, barge_in_utterance)
 
-        messages = context.to_messages()
+        # Same text as context.to_messages(), reusing the joined sections
+        # that precede the immediate context
+        system_message = self._system_prefix(context)
+        if context.immediate_context:
+            system_message += f"\n\n=== IMMEDIATE CONTEXT ===\n{context.immediate_context}"
+        messages = [{"role": "system", "content": system_message}]
 
         # Add conversation history as separate messages
         if conversation_history:
@@ -176,6 +206,51 @@ class FOVContextManager:
 
         return messages
 
+    # --- Render Caching ---
+
+    def invalidate(self, buffer: Optional[str] = None) -> None:
+        """Mark a cached buffer rendering stale.
+
+        Args:
+            buffer: "working", "episodic" or "semantic"; None invalidates all
+        """
+        for name in CACHED_BUFFERS if buffer is None else (buffer,):
+            self._versions[name] += 1
+
+    def _render_cached(self, name: str, buffer, token_budget: int) -> str:
+        """Render a buffer, reusing the last rendering if nothing changed."""
+        counter = self.budget_config.token_counter
+        key = (self._versions[name], token_budget, counter)
+        cached = self._render_cache.get(name)
+        # Holding the buffer also catches wholesale replacement of it
+        if cached is not None and cached[0] is buffer and cached[1] == key:
+            return cached[2]
+
+        rendered = buffer.render(token_budget, counter)
+        self._render_cache[name] = (buffer, key, rendered)
+        return rendered
+
+    def _system_prefix(self, context: FOVContext) -> str:
+        """System prompt plus the cached sections, joined once per change."""
+        key = (
+            context.system_prompt,
+            context.semantic_context,
+            context.working_context,
+            context.episodic_context,
+        )
+        if self._prefix_cache is not None and self._prefix_cache[0] == key:
+            return self._prefix_cache[1]
+
+        prefix = FOVContext(
+            system_prompt=context.system_prompt,
+            immediate_context="",
+            working_context=context.working_context,
+            episodic_context=context.episodic_context,
+            semantic_context=context.semantic_context,
+        ).to_system_message()
+        self._prefix_cache = (key, prefix)
+        return prefix
+
     # --- Immediate Buffer Management ---
 
     def set_current_segment(self, segment: TranscriptSegment) -> None:
@@ -231,6 +306,7 @@ class FOVContextManager:
             self.working_buffer.glossary_terms = glossary_terms
         if misconception_triggers is not None:
             self.working_buffer.misconception_triggers = misconception_triggers
+        self.invalidate("working")
 
         logger.debug(
             "Updated working buffer",
@@ -255,6 +331,12 @@ class FOVContextManager:
             glossary_terms=glossary_terms or [],
             misconception_triggers=misconception_triggers or []
         )
+        self.invalidate("working")
+
+    def set_retrieved_passages(self, passages: list[str]) -> None:
+        """Replace the passages pulled in by context expansion (best first)."""
+        self.working_buffer.retrieved_passages = list(passages)
+        self.invalidate("working")
 
     # --- Episodic Buffer Management ---
 
@@ -268,6 +350,7 @@ class FOVContextManager:
             self.episodic_buffer.topic_summaries = (
                 self.episodic_buffer.topic_summaries[-max_summaries:]
             )
+        self.invalidate("episodic")
 
         logger.debug(
             "Recorded topic completion",
@@ -287,27 +370,36 @@ class FOVContextManager:
             self.episodic_buffer.user_questions = (
                 self.episodic_buffer.user_questions[-max_questions:]
             )
+        self.invalidate("episodic")
 
     def record_clarification_request(self) -> None:
         """Record that the user requested clarification."""
         self.episodic_buffer.learner_signals.clarification_requests += 1
+        self.invalidate("episodic")
 
     def record_repetition_request(self) -> None:
         """Record that the user requested repetition."""
         self.episodic_buffer.learner_signals.repetition_requests += 1
+        self.invalidate("episodic")
 
     def record_confusion_signal(self) -> None:
         """Record a confusion indicator."""
         self.episodic_buffer.learner_signals.confusion_indicators += 1
+        self.invalidate("episodic")
 
     def set_pace_preference(self, preference: PacePreference) -> None:
         """Set the detected pace preference."""
         self.episodic_buffer.learner_signals.pace_preference = preference
+        self.invalidate("episodic")
 
     def update_session_duration(self) -> None:
         """Update the session duration."""
         duration = datetime.now() - self.episodic_buffer.session_start
-        self.episodic_buffer.session_duration_minutes = duration.total_seconds() / 60
+        minutes = duration.total_seconds() / 60
+        # Called every turn; the rendering only shows whole minutes
+        if f"{minutes:.0f}" != f"{self.episodic_buffer.session_duration_minutes:.0f}":
+            self.invalidate("episodic")
+        self.episodic_buffer.session_duration_minutes = minutes
 
     # --- Semantic Buffer Management ---
 
@@ -327,6 +419,7 @@ class FOVContextManager:
             self.semantic_buffer.prerequisite_topics = prerequisite_topics
         if upcoming_topics is not None:
             self.semantic_buffer.upcoming_topics = upcoming_topics
+        self.invalidate("semantic")
 
     def set_curriculum_position(
         self,
@@ -346,6 +439,7 @@ class FOVContextManager:
             unit_title=unit_title,
             module_title=module_title
         )
+        self.invalidate("semantic")
 
     # --- State Management ---
 
@@ -355,6 +449,7 @@ class FOVContextManager:
         self.working_buffer = WorkingBuffer()
         self.episodic_buffer = EpisodicBuffer()
         self.semantic_buffer = SemanticBuffer()
+        self.invalidate()
         logger.info("FOV context manager reset")
 
     def get_state_snapshot(self) -> dict:
@@ -378,7 +473,8 @@ class FOVContextManager:
                 "topic_title": self.working_buffer.topic_title,
                 "objective_count": len(self.working_buffer.learning_objectives),
                 "glossary_count": len(self.working_buffer.glossary_terms),
-                "misconception_count": len(self.working_buffer.misconception_triggers)
+                "misconception_count": len(self.working_buffer.misconception_triggers),
+                "retrieved_count": len(self.working_buffer.retrieved_passages)
             },
             "episodic": {
                 "topic_count": len(self.episodic_buffer.topic_summaries),
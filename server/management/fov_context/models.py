@@ -12,12 +12,29 @@ Hierarchical Cognitive Buffers:
 - Semantic: Curriculum overview, topic positioning
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 import uuid
 
+from .tokens import PackItem, TokenCounter, get_token_counter, pack_items
+
+
+def slotted(cls):
+    """Rebuild a dataclass with __slots__.
+
+    Used for the small records a session keeps many of. Equivalent to
+    dataclass(slots=True), which needs Python 3.10.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
 
 class ModelTier(str, Enum):
     """Model capability tiers based on context window size."""
@@ -86,14 +103,25 @@ class TokenBudgets:
 
 @dataclass
 class AdaptiveBudgetConfig:
-    """Configuration for adaptive token budgets."""
+    """Configuration for adaptive token budgets.
+
+    Budgets are measured with token_counter, the shared cached BPE counter
+    unless one is supplied.
+    """
     tier: ModelTier
     budgets: TokenBudgets
     max_conversation_turns: int
     model_context_window: int
+    token_counter: TokenCounter = field(
+        default_factory=get_token_counter, repr=False, compare=False
+    )
 
     @classmethod
-    def from_context_window(cls, context_window: int) -> "AdaptiveBudgetConfig":
+    def from_context_window(
+        cls,
+        context_window: int,
+        token_counter: Optional[TokenCounter] = None
+    ) -> "AdaptiveBudgetConfig":
         """Create config from model context window size."""
         tier = ModelTier.from_context_window(context_window)
         budgets = TokenBudgets.for_tier(tier)
@@ -110,14 +138,19 @@ class AdaptiveBudgetConfig:
             tier=tier,
             budgets=budgets,
             max_conversation_turns=max_turns[tier],
-            model_context_window=context_window
+            model_context_window=context_window,
+            token_counter=token_counter or get_token_counter()
         )
 
     @classmethod
-    def for_model(cls, model_name: str) -> "AdaptiveBudgetConfig":
+    def for_model(
+        cls,
+        model_name: str,
+        token_counter: Optional[TokenCounter] = None
+    ) -> "AdaptiveBudgetConfig":
         """Create config for a specific model."""
         context_window = MODEL_CONTEXT_WINDOWS.get(model_name, 32_000)
-        return cls.from_context_window(context_window)
+        return cls.from_context_window(context_window, token_counter)
 
 
 # Known model context windows
@@ -160,6 +193,7 @@ class MessageRole(str, Enum):
     ASSISTANT = "assistant"
 
 
+@slotted
 @dataclass
 class ConversationTurn:
     """A single turn in the conversation."""
@@ -199,33 +233,32 @@ class ImmediateBuffer:
     current_segment: Optional[TranscriptSegment] = None
     interrupted_at_position: Optional[float] = None
 
-    def render(self, token_budget: int) -> str:
-        """Render buffer content within token budget."""
+    def render(self, token_budget: int, counter: Optional[TokenCounter] = None) -> str:
+        """Render buffer content within token budget.
+
+        Older turns are dropped whole before newer ones; the barge-in and
+        interrupted segment are cut only if they alone exceed the budget.
+        """
         parts = []
 
         # Barge-in gets highest priority
         if self.barge_in_utterance:
-            parts.append(f"[USER INTERRUPTED]: {self.barge_in_utterance}")
+            parts.append(PackItem(
+                f"[USER INTERRUPTED]: {self.barge_in_utterance}", 1000, truncatable=True
+            ))
 
         # Current segment context
         if self.current_segment:
-            parts.append(f"[INTERRUPTED CONTENT]: {self.current_segment.text}")
+            parts.append(PackItem(
+                f"[INTERRUPTED CONTENT]: {self.current_segment.text}", 900, truncatable=True
+            ))
 
         # Recent conversation turns (newest first for priority)
-        for turn in reversed(self.recent_turns):
+        for age, turn in enumerate(reversed(self.recent_turns)):
             role_label = "User" if turn.role == MessageRole.USER else "Tutor"
-            parts.append(f"{role_label}: {turn.content}")
+            parts.append(PackItem(f"{role_label}: {turn.content}", 800 - age))
 
-        result = "\n\n".join(parts)
-        return self._truncate_to_budget(result, token_budget)
-
-    def _truncate_to_budget(self, text: str, budget: int) -> str:
-        """Truncate text to fit within token budget."""
-        estimated_tokens = len(text) // 4
-        if estimated_tokens <= budget:
-            return text
-        target_chars = budget * 4
-        return text[:target_chars - 3] + "..."
+        return pack_items(parts, token_budget, counter or get_token_counter())
 
 
 @dataclass
@@ -248,7 +281,8 @@ class MisconceptionTrigger:
 class WorkingBuffer:
     """
     Working Buffer: Current topic context.
-    Contains topic materials, glossary, and misconception triggers.
+    Contains topic materials, glossary, misconception triggers, and
+    passages retrieved during context expansion.
     """
     topic_id: Optional[str] = None
     topic_title: str = ""
@@ -256,43 +290,46 @@ class WorkingBuffer:
     learning_objectives: list[str] = field(default_factory=list)
     glossary_terms: list[GlossaryTerm] = field(default_factory=list)
     misconception_triggers: list[MisconceptionTrigger] = field(default_factory=list)
+    retrieved_passages: list[str] = field(default_factory=list)
 
-    def render(self, token_budget: int) -> str:
-        """Render buffer content within token budget."""
+    def render(self, token_budget: int, counter: Optional[TokenCounter] = None) -> str:
+        """Render buffer content within token budget.
+
+        The topic outline fills whatever the other sections leave.
+        """
         parts = []
 
         if self.topic_title:
-            parts.append(f"CURRENT TOPIC: {self.topic_title}")
+            parts.append(PackItem(f"CURRENT TOPIC: {self.topic_title}", 100))
 
         if self.learning_objectives:
             objectives = "\n".join(f"- {obj}" for obj in self.learning_objectives)
-            parts.append(f"LEARNING OBJECTIVES:\n{objectives}")
+            parts.append(PackItem(f"LEARNING OBJECTIVES:\n{objectives}", 90))
 
         if self.topic_content:
-            parts.append(f"TOPIC OUTLINE:\n{self.topic_content}")
+            parts.append(PackItem(
+                f"TOPIC OUTLINE:\n{self.topic_content}", 50, truncatable=True
+            ))
 
         if self.glossary_terms:
             terms = "\n".join(
                 f"- {t.term}: {t.definition}" for t in self.glossary_terms[:5]
             )
-            parts.append(f"KEY TERMS:\n{terms}")
+            parts.append(PackItem(f"KEY TERMS:\n{terms}", 70))
 
         if self.misconception_triggers:
             triggers = "\n".join(
                 f"- Watch for: '{t.trigger_phrase}' -> Clarify: {t.remediation}"
                 for t in self.misconception_triggers[:3]
             )
-            parts.append(f"COMMON MISCONCEPTIONS:\n{triggers}")
+            parts.append(PackItem(f"COMMON MISCONCEPTIONS:\n{triggers}", 80))
 
-        result = "\n\n".join(parts)
-        return self._truncate_to_budget(result, token_budget)
+        if self.retrieved_passages:
+            # Best match first, so trimming drops the weakest passages
+            passages = "\n".join(f"- {p}" for p in self.retrieved_passages)
+            parts.append(PackItem(f"RELATED MATERIAL:\n{passages}", 75, truncatable=True))
 
-    def _truncate_to_budget(self, text: str, budget: int) -> str:
-        estimated_tokens = len(text) // 4
-        if estimated_tokens <= budget:
-            return text
-        target_chars = budget * 4
-        return text[:target_chars - 3] + "..."
+        return pack_items(parts, token_budget, counter or get_token_counter())
 
 
 class PacePreference(str, Enum):
@@ -335,15 +372,16 @@ class EpisodicBuffer:
     session_start: datetime = field(default_factory=datetime.now)
     session_duration_minutes: float = 0.0
 
-    def render(self, token_budget: int) -> str:
+    def render(self, token_budget: int, counter: Optional[TokenCounter] = None) -> str:
         """Render buffer content within token budget."""
         parts = []
 
         # Session context
-        parts.append(
+        parts.append(PackItem(
             f"SESSION: Started {self.session_start.strftime('%H:%M')}, "
-            f"Duration: {self.session_duration_minutes:.0f} min"
-        )
+            f"Duration: {self.session_duration_minutes:.0f} min",
+            100,
+        ))
 
         # Learner signals
         signals = self.learner_signals
@@ -355,7 +393,7 @@ class EpisodicBuffer:
                 signal_parts.append(f"{signals.confusion_indicators} confusion signals")
             if signals.pace_preference:
                 signal_parts.append(f"prefers {signals.pace_preference.value} pace")
-            parts.append(f"LEARNER SIGNALS: {', '.join(signal_parts)}")
+            parts.append(PackItem(f"LEARNER SIGNALS: {', '.join(signal_parts)}", 90))
 
         # Topic summaries
         if self.topic_summaries:
@@ -363,22 +401,14 @@ class EpisodicBuffer:
                 f"- {s.title} (mastery: {s.mastery_level:.0%})"
                 for s in self.topic_summaries[-5:]  # Last 5 topics
             )
-            parts.append(f"COMPLETED TOPICS:\n{summaries}")
+            parts.append(PackItem(f"COMPLETED TOPICS:\n{summaries}", 70, truncatable=True))
 
         # Recent questions
         if self.user_questions:
             questions = "\n".join(f"- {q}" for q in self.user_questions[-3:])
-            parts.append(f"RECENT QUESTIONS:\n{questions}")
-
-        result = "\n\n".join(parts)
-        return self._truncate_to_budget(result, token_budget)
+            parts.append(PackItem(f"RECENT QUESTIONS:\n{questions}", 80))
 
-    def _truncate_to_budget(self, text: str, budget: int) -> str:
-        estimated_tokens = len(text) // 4
-        if estimated_tokens <= budget:
-            return text
-        target_chars = budget * 4
-        return text[:target_chars - 3] + "..."
+        return pack_items(parts, token_budget, counter or get_token_counter())
 
 
 @dataclass
@@ -403,38 +433,36 @@ class SemanticBuffer:
     prerequisite_topics: list[str] = field(default_factory=list)
     upcoming_topics: list[str] = field(default_factory=list)
 
-    def render(self, token_budget: int) -> str:
-        """Render buffer content within token budget."""
+    def render(self, token_budget: int, counter: Optional[TokenCounter] = None) -> str:
+        """Render buffer content within token budget.
+
+        The outline fills whatever the other sections leave.
+        """
         parts = []
 
         if self.position:
             pos = self.position
             progress = f"{pos.current_topic_index + 1}/{pos.total_topics}"
-            parts.append(
+            parts.append(PackItem(
                 f"CURRICULUM: {pos.curriculum_title}\n"
-                f"Progress: Topic {progress}"
-            )
+                f"Progress: Topic {progress}",
+                100,
+            ))
 
         if self.curriculum_outline:
-            parts.append(f"OUTLINE:\n{self.curriculum_outline}")
+            parts.append(PackItem(
+                f"OUTLINE:\n{self.curriculum_outline}", 50, truncatable=True
+            ))
 
         if self.prerequisite_topics:
             prereqs = ", ".join(self.prerequisite_topics[:3])
-            parts.append(f"Prerequisites: {prereqs}")
+            parts.append(PackItem(f"Prerequisites: {prereqs}", 80))
 
         if self.upcoming_topics:
             upcoming = ", ".join(self.upcoming_topics[:3])
-            parts.append(f"Coming up: {upcoming}")
-
-        result = "\n\n".join(parts)
-        return self._truncate_to_budget(result, token_budget)
+            parts.append(PackItem(f"Coming up: {upcoming}", 90))
 
-    def _truncate_to_budget(self, text: str, budget: int) -> str:
-        estimated_tokens = len(text) // 4
-        if estimated_tokens <= budget:
-            return text
-        target_chars = budget * 4
-        return text[:target_chars - 3] + "..."
+        return pack_items(parts, token_budget, counter or get_token_counter())
 
 
 # --- Complete FOV Context ---
@@ -0,0 +1,384 @@
+"""
+FOV Retrieval Index - Server-side implementation
+
+Per-curriculum BM25 index over transcript segments, topic text, glossary
+terms and misconceptions. Context expansion queries it to pull the most
+relevant passages into the working buffer instead of dumping whole topics.
+
+Indexes are built when a curriculum is loaded and persisted as JSON next
+to the other server data, keyed by a fingerprint of the UMCF document so
+an edited curriculum is re-indexed on the next load.
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import math
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+
+# BM25 parameters (standard Okapi defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Topic text without transcript segments is split into passages of about
+# this many characters, at sentence boundaries
+PASSAGE_CHARS = 600
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been
+before being below between both but by can could did do does doing down during
+each few for from further had has have having he her here hers herself him
+himself his how i if in into is it its itself just me more most my myself no
+nor not now of off on once only or other our ours ourselves out over own same
+she should so some such than that the their theirs them themselves then there
+these they this those through to too under until up very was we were what
+when where which while who whom why will with would you your yours yourself
+yourselves
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens with stopwords removed and plurals folded."""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+@dataclass
+class Passage:
+    """A retrievable unit of curriculum content."""
+    passage_id: str
+    kind: str  # "segment", "text", "glossary" or "misconception"
+    text: str
+    topic_id: Optional[str] = None
+    topic_title: str = ""
+    unit_id: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+@dataclass
+class RetrievalHit:
+    """A passage returned by a query, with its BM25 score."""
+    passage: Passage
+    score: float
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {**self.passage.to_dict(), "score": round(self.score, 3)}
+
+
+def _node_id(node: dict, fallback: str) -> str:
+    node_id = node.get("id")
+    if isinstance(node_id, dict):
+        return node_id.get("value") or fallback
+    return node_id or fallback
+
+
+def _chunk_text(text: str, max_chars: int = PASSAGE_CHARS) -> list[str]:
+    """Internal: Split text into passages at sentence boundaries."""
+    chunks: list[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def passages_from_umcf(umcf: dict) -> list[Passage]:
+    """Extract retrievable passages from a UMCF curriculum document."""
+    passages: list[Passage] = []
+
+    def walk(node: dict, unit_id: Optional[str], path: str) -> None:
+        node_id = _node_id(node, path)
+        title = node.get("title", "")
+
+        transcript = node.get("transcript")
+        segments = transcript.get("segments", []) if isinstance(transcript, dict) else []
+        for index, segment in enumerate(segments):
+            text = segment.get("content", "") if isinstance(segment, dict) else ""
+            if text:
+                passages.append(Passage(
+                    passage_id=segment.get("id") or f"{node_id}/seg-{index}",
+                    kind="segment",
+                    text=text,
+                    topic_id=node_id,
+                    topic_title=title,
+                    unit_id=unit_id,
+                ))
+
+        content = node.get("content")
+        if not segments and isinstance(content, dict) and content.get("text"):
+            for index, chunk in enumerate(_chunk_text(content["text"])):
+                passages.append(Passage(
+                    passage_id=f"{node_id}/text-{index}",
+                    kind="text",
+                    text=chunk,
+                    topic_id=node_id,
+                    topic_title=title,
+                    unit_id=unit_id,
+                ))
+
+        for index, item in enumerate(node.get("misconceptions", []) or []):
+            if not isinstance(item, dict) or not item.get("misconception"):
+                continue
+            text = f"Misconception: {item['misconception']}"
+            if item.get("correction"):
+                text += f" Correction: {item['correction']}"
+            if item.get("triggerPhrases"):
+                text += f" (Signals: {', '.join(item['triggerPhrases'])})"
+            passages.append(Passage(
+                passage_id=item.get("id") or f"{node_id}/misc-{index}",
+                kind="misconception",
+                text=text,
+                topic_id=node_id,
+                topic_title=title,
+                unit_id=unit_id,
+            ))
+
+        for index, child in enumerate(node.get("children", []) or []):
+            if isinstance(child, dict):
+                walk(child, node_id, f"{path}.{index}")
+
+    for index, root in enumerate(umcf.get("content", []) or []):
+        if isinstance(root, dict):
+            walk(root, None, f"node-{index}")
+
+    glossary = umcf.get("glossary", {})
+    terms = glossary.get("terms", []) if isinstance(glossary, dict) else []
+    for index, term in enumerate(terms):
+        if isinstance(term, dict) and term.get("term") and term.get("definition"):
+            passages.append(Passage(
+                passage_id=term.get("id") or f"glossary-{index}",
+                kind="glossary",
+                text=f"{term['term']}: {term['definition']}",
+            ))
+
+    return passages
+
+
+def umcf_fingerprint(umcf: dict) -> str:
+    """Stable hash of a UMCF document, used to detect stale indexes."""
+    canonical = json.dumps(umcf, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CurriculumIndex:
+    """
+    BM25 inverted index over one curriculum's passages.
+
+    Each posting stores its precomputed BM25 term-frequency weight, so a
+    query only sums idf * weight over the postings of its own terms.
+    """
+
+    def __init__(
+        self,
+        passages: list[Passage],
+        postings: dict[str, list[list[int]]],
+        doc_lengths: list[int],
+        fingerprint: str = "",
+    ):
+        self.passages = passages
+        self.fingerprint = fingerprint
+        self._term_frequencies = postings
+        self._doc_lengths = doc_lengths
+
+        count = len(passages)
+        average = (sum(doc_lengths) / count) if count else 0.0
+        norms = [
+            BM25_K1 * (1 - BM25_B + BM25_B * length / average) if average else BM25_K1
+            for length in doc_lengths
+        ]
+        self._idf: dict[str, float] = {}
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        for term, entries in postings.items():
+            self._idf[term] = math.log(1 + (count - len(entries) + 0.5) / (len(entries) + 0.5))
+            self._postings[term] = [
+                (doc, tf * (BM25_K1 + 1) / (tf + norms[doc])) for doc, tf in entries
+            ]
+
+    @classmethod
+    def build(cls, passages: list[Passage], fingerprint: str = "") -> "CurriculumIndex":
+        """Index a list of passages."""
+        postings: dict[str, list[list[int]]] = {}
+        doc_lengths = []
+        for doc, passage in enumerate(passages):
+            tokens = tokenize(f"{passage.topic_title} {passage.text}")
+            doc_lengths.append(len(tokens))
+            frequencies: dict[str, int] = {}
+            for token in tokens:
+                frequencies[token] = frequencies.get(token, 0) + 1
+            for token, tf in frequencies.items():
+                postings.setdefault(token, []).append([doc, tf])
+        return cls(passages, postings, doc_lengths, fingerprint)
+
+    @classmethod
+    def from_umcf(cls, umcf: dict) -> "CurriculumIndex":
+        """Index a UMCF curriculum document."""
+        return cls.build(passages_from_umcf(umcf), umcf_fingerprint(umcf))
+
+    def __len__(self) -> int:
+        return len(self.passages)
+
+    def search(
+        self,
+        query: str,
+        k: int = 5,
+        where: Optional[Callable[[Passage], bool]] = None,
+    ) -> list[RetrievalHit]:
+        """Return the k passages that best match a query.
+
+        Args:
+            query: Free-text query
+            k: Maximum passages to return
+            where: Optional filter limiting which passages may be returned
+
+        Returns:
+            Hits in descending score order
+        """
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for doc, weight in postings:
+                scores[doc] = scores.get(doc, 0.0) + idf * weight
+
+        candidates: Iterable[tuple[int, float]] = scores.items()
+        if where is not None:
+            passages = self.passages
+            candidates = [(doc, score) for doc, score in candidates if where(passages[doc])]
+
+        best = heapq.nlargest(k, candidates, key=lambda item: item[1])
+        return [RetrievalHit(self.passages[doc], score) for doc, score in best]
+
+    def topic_unit(self, topic_id: str) -> Optional[str]:
+        """The unit (parent node) containing a topic, if indexed."""
+        for passage in self.passages:
+            if passage.topic_id == topic_id:
+                return passage.unit_id
+        return None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "passages": [passage.to_dict() for passage in self.passages],
+            "postings": self._term_frequencies,
+            "doc_lengths": self._doc_lengths,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CurriculumIndex":
+        """Restore an index saved with to_dict()."""
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported index version: {data.get('version')}")
+        return cls(
+            passages=[Passage(**passage) for passage in data["passages"]],
+            postings=data["postings"],
+            doc_lengths=data["doc_lengths"],
+            fingerprint=data.get("fingerprint", ""),
+        )
+
+
+class CurriculumIndexStore:
+    """
+    Retrieval indexes by curriculum ID, persisted to a directory.
+
+    load_or_build() reuses a saved index while the curriculum's
+    fingerprint is unchanged and rebuilds (and re-saves) it otherwise.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else None
+        self._indexes: dict[str, CurriculumIndex] = {}
+
+    def _path(self, curriculum_id: str) -> Path:
+        safe_id = re.sub(r"[^A-Za-z0-9._-]", "_", curriculum_id)
+        return self.directory / f"{safe_id}.json"
+
+    def load_or_build(self, curriculum_id: str, umcf: dict) -> CurriculumIndex:
+        """Get the index for a curriculum, building it if missing or stale."""
+        fingerprint = umcf_fingerprint(umcf)
+        index = self._indexes.get(curriculum_id)
+        if index is not None and index.fingerprint == fingerprint:
+            return index
+
+        index = self._load(curriculum_id, fingerprint)
+        if index is None:
+            index = CurriculumIndex.build(passages_from_umcf(umcf), fingerprint)
+            self._save(curriculum_id, index)
+            logger.info(f"Built retrieval index for {curriculum_id}: {len(index)} passages")
+
+        self._indexes[curriculum_id] = index
+        return index
+
+    def get(self, curriculum_id: str) -> Optional[CurriculumIndex]:
+        """Get a loaded index by curriculum ID."""
+        return self._indexes.get(curriculum_id)
+
+    def remove(self, curriculum_id: str) -> None:
+        """Forget a curriculum's index and delete its saved copy."""
+        self._indexes.pop(curriculum_id, None)
+        if self.directory:
+            self._path(curriculum_id).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Forget all loaded indexes (saved copies are kept for reuse)."""
+        self._indexes.clear()
+
+    def _load(self, curriculum_id: str, fingerprint: str) -> Optional[CurriculumIndex]:
+        """Internal: Load a saved index if it matches the fingerprint."""
+        if not self.directory:
+            return None
+        path = self._path(curriculum_id)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("fingerprint") != fingerprint:
+                return None
+            return CurriculumIndex.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable retrieval index {path}: {e}")
+            return None
+
+    def _save(self, curriculum_id: str, index: CurriculumIndex) -> None:
+        """Internal: Persist an index, atomically replacing any old copy."""
+        if not self.directory:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(curriculum_id)
+            tmp_path = path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index.to_dict(), f, separators=(",", ":"))
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not save retrieval index for {curriculum_id}: {e}")
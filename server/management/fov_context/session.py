@@ -4,14 +4,26 @@ FOV Session Management - Server-side session state with FOV context
 Manages session lifecycle and integrates FOV context for voice learning.
 """
 
+import asyncio
+import json
 import logging
+import pickle
+import sys
 import uuid
+import weakref
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
-
-from .confidence import ConfidenceAnalysis, ConfidenceMonitor, ExpansionRecommendation
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from .confidence import (
+    ConfidenceAnalysis,
+    ConfidenceMonitor,
+    ExpansionRecommendation,
+    ExpansionScope,
+)
 from .manager import FOVContextManager
 from .models import (
     AdaptiveBudgetConfig,
@@ -23,7 +35,12 @@ from .models import (
     MisconceptionTrigger,
     TopicSummary,
     TranscriptSegment,
+    slotted,
 )
+from .retrieval import CurriculumIndex, CurriculumIndexStore, RetrievalHit
+
+if TYPE_CHECKING:
+    from state_backend import StateBackend
 
 logger = logging.getLogger(__name__)
 
@@ -138,8 +155,15 @@ class SessionConfig:
     system_prompt: Optional[str] = None
     auto_expand_context: bool = True
     confidence_threshold: float = 0.5
+    retrieval_top_k: int = 4
+    # Share of the working budget retrieved passages may take
+    retrieval_budget_share: float = 0.5
+    # Per-session caps; the oldest turns and events are dropped first
+    max_history_turns: int = 200
+    max_events: int = 200
 
 
+@slotted
 @dataclass
 class SessionEvent:
     """An event that occurred during the session."""
@@ -157,8 +181,9 @@ class FOVSession:
     - Session state and lifecycle
     - FOV context manager for LLM calls
     - Confidence monitoring for auto-expansion
+    - Retrieval of relevant curriculum passages on expansion
     - Curriculum position and progress
-    - Conversation history
+    - Conversation history and event log, capped by the session config
     """
 
     session_id: str
@@ -166,6 +191,7 @@ class FOVSession:
     config: SessionConfig
     context_manager: FOVContextManager
     confidence_monitor: ConfidenceMonitor = field(default_factory=ConfidenceMonitor)
+    retrieval_index: Optional[CurriculumIndex] = None
 
     # State
     state: SessionState = SessionState.IDLE
@@ -176,21 +202,35 @@ class FOVSession:
     created_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
+    last_active_at: datetime = field(default_factory=datetime.now)
 
-    # Conversation
-    conversation_history: list[ConversationTurn] = field(default_factory=list)
-    events: list[SessionEvent] = field(default_factory=list)
+    # Conversation (ring buffers sized in __post_init__)
+    conversation_history: deque[ConversationTurn] = field(default_factory=deque)
+    events: deque[SessionEvent] = field(default_factory=deque)
 
     # Metrics
     total_turns: int = 0
     barge_in_count: int = 0
     expansion_count: int = 0
 
+    def __post_init__(self):
+        self.conversation_history = deque(
+            self.conversation_history, maxlen=self.config.max_history_turns
+        )
+        self.events = deque(self.events, maxlen=self.config.max_events)
+
+    def __getstate__(self):
+        # The retrieval index is shared per curriculum and reattached on restore
+        state = self.__dict__.copy()
+        state["retrieval_index"] = None
+        return state
+
     @classmethod
     def create(
         cls,
         curriculum_id: str,
-        config: Optional[SessionConfig] = None
+        config: Optional[SessionConfig] = None,
+        retrieval_index: Optional[CurriculumIndex] = None
     ) -> "FOVSession":
         """Create a new session."""
         config = config or SessionConfig()
@@ -204,7 +244,8 @@ class FOVSession:
             session_id=str(uuid.uuid4()),
             curriculum_id=curriculum_id,
             config=config,
-            context_manager=context_manager
+            context_manager=context_manager,
+            retrieval_index=retrieval_index
         )
 
         session._log_event("session_created", {"curriculum_id": curriculum_id})
@@ -352,7 +393,7 @@ class FOVSession:
         self.context_manager.update_session_duration()
 
         context = self.context_manager.build_context(
-            conversation_history=self.conversation_history,
+            conversation_history=list(self.conversation_history),
             barge_in_utterance=barge_in_utterance
         )
 
@@ -370,7 +411,7 @@ class FOVSession:
         self.context_manager.update_session_duration()
 
         messages = self.context_manager.build_messages_for_llm(
-            conversation_history=self.conversation_history,
+            conversation_history=list(self.conversation_history),
             barge_in_utterance=barge_in_utterance
         )
 
@@ -422,9 +463,83 @@ class FOVSession:
         recommendation = None
         if self.config.auto_expand_context:
             recommendation = self.get_expansion_recommendation(analysis)
+            if recommendation.should_expand:
+                if recommendation.query_hint is None:
+                    recommendation.query_hint = self._last_user_utterance()
+                self.expand_context(recommendation)
 
         return analysis, recommendation
 
+    def expand_context(
+        self,
+        recommendation: ExpansionRecommendation,
+        query: Optional[str] = None
+    ) -> list[RetrievalHit]:
+        """
+        Pull the passages most relevant to the learner's question into the
+        working buffer, searching the recommendation's scope.
+
+        Passages are added best-first until they would take more than
+        retrieval_budget_share of the working budget.
+
+        Args:
+            recommendation: Expansion recommendation (scope and query hint)
+            query: Query text; defaults to the hint, then the last user turn
+
+        Returns:
+            The passages added
+        """
+        query = query or recommendation.query_hint or self._last_user_utterance()
+        if self.retrieval_index is None or not query:
+            return []
+
+        hits = self.retrieval_index.search(
+            query,
+            k=self.config.retrieval_top_k,
+            where=self._scope_filter(recommendation.suggested_scope),
+        )
+
+        budget_config = self.context_manager.budget_config
+        remaining = int(budget_config.budgets.working * self.config.retrieval_budget_share)
+        selected: list[RetrievalHit] = []
+        for hit in hits:
+            cost = budget_config.token_counter.count(hit.passage.text)
+            if cost > remaining:
+                continue
+            selected.append(hit)
+            remaining -= cost
+
+        self.context_manager.set_retrieved_passages([
+            f"[{hit.passage.topic_title}] {hit.passage.text}" if hit.passage.topic_title
+            else hit.passage.text
+            for hit in selected
+        ])
+        self._log_event("context_expanded", {
+            "scope": recommendation.suggested_scope.value,
+            "query": query,
+            "passage_ids": [hit.passage.passage_id for hit in selected]
+        })
+        return selected
+
+    def _scope_filter(self, scope: ExpansionScope):
+        """Internal: Passage filter for an expansion scope."""
+        topic_id = self.current_topic_id
+        if not topic_id or scope == ExpansionScope.FULL_CURRICULUM:
+            return None
+        if scope == ExpansionScope.CURRENT_TOPIC:
+            return lambda passage: passage.topic_id in (topic_id, None)
+        if scope == ExpansionScope.RELATED_TOPICS:
+            return lambda passage: passage.topic_id != topic_id
+        unit_id = self.retrieval_index.topic_unit(topic_id)
+        return lambda passage: passage.topic_id is None or passage.unit_id == unit_id
+
+    def _last_user_utterance(self) -> Optional[str]:
+        """Internal: Content of the most recent user turn."""
+        for turn in reversed(self.conversation_history):
+            if turn.role == MessageRole.USER:
+                return turn.content
+        return None
+
     # --- Learner Signals ---
 
     def record_clarification_request(self) -> None:
@@ -481,6 +596,7 @@ class FOVSession:
             "created_at": self.created_at.isoformat(),
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "ended_at": self.ended_at.isoformat() if self.ended_at else None,
+            "last_active_at": self.last_active_at.isoformat(),
             "duration_minutes": duration,
             "total_turns": self.total_turns,
             "barge_in_count": self.barge_in_count,
@@ -512,6 +628,20 @@ class FOVSession:
             data=data or {}
         )
         self.events.append(event)
+        self.last_active_at = event.timestamp
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by this session.
+
+        Objects shared between sessions (retrieval index, token counter,
+        compiled marker patterns) are not counted.
+        """
+        shared = (
+            self.retrieval_index,
+            self.context_manager.budget_config.token_counter,
+            self.confidence_monitor._matcher,
+        )
+        return _deep_sizeof(self, {id(obj) for obj in shared})
 
 
 @dataclass
@@ -542,6 +672,7 @@ class UserSession:
 
     # Associated FOV session (for conversation context)
     fov_session: Optional[FOVSession] = None
+    fov_session_id: Optional[str] = None
 
     # Timing
     created_at: datetime = field(default_factory=datetime.now)
@@ -565,8 +696,15 @@ class UserSession:
     def attach_fov_session(self, fov_session: FOVSession) -> None:
         """Attach an FOV session for conversation context."""
         self.fov_session = fov_session
+        self.fov_session_id = fov_session.session_id
         self.last_active_at = datetime.now()
 
+    def __getstate__(self):
+        # The FOV session is stored on its own and reattached by id
+        state = self.__dict__.copy()
+        state["fov_session"] = None
+        return state
+
     def update_voice_config(
         self,
         voice_id: Optional[str] = None,
@@ -615,24 +753,119 @@ class UserSession:
             "voice_config": self.voice_config.to_dict(),
             "playback_state": self.playback_state.to_dict(),
             "prefetch_lookahead": self.prefetch_lookahead,
-            "fov_session_id": self.fov_session.session_id if self.fov_session else None,
+            "fov_session_id": self.fov_session.session_id if self.fov_session else self.fov_session_id,
             "created_at": self.created_at.isoformat(),
             "last_active_at": self.last_active_at.isoformat(),
         }
 
 
+def _deep_sizeof(obj: Any, seen: set[int]) -> int:
+    """Internal: Sum sys.getsizeof over obj and everything it references.
+
+    Objects whose ids are already in seen are skipped, as are classes
+    and enum members, which are shared by every session.
+    """
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, (type, Enum)):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+        else:
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for name in getattr(type(item), "__slots__", ()):
+                if hasattr(item, name):
+                    stack.append(getattr(item, name))
+    return total
+
+
+# Shared-backend sessions are stored as version + pickle. A version is an
+# 8-hex-digit generation, bumped by every save, then random hex.
+VERSION_LENGTH = 32
+
+
+def _next_version(previous: Optional[str]) -> str:
+    """Internal: The version a save replacing previous writes."""
+    return f"{_version_generation(previous) + 1:08x}{uuid.uuid4().hex[:VERSION_LENGTH - 8]}"
+
+
+def _version_generation(version: Optional[str]) -> int:
+    """Internal: How many saves produced a version (0 for none)."""
+    return int(version[:8], 16) if version else 0
+
+
+class StaleSessionError(Exception):
+    """A session was saved from a copy that another worker has since
+    replaced or ended."""
+
+    def __init__(self, session_id: str):
+        super().__init__(f"Session {session_id} changed since it was loaded")
+        self.session_id = session_id
+
+
 class SessionManager:
     """
     Manages multiple FOV sessions and user sessions.
 
     Provides session lifecycle management and lookup.
     Tracks both FOV sessions (conversation context) and user sessions (playback state).
+
+    Memory stays bounded by a reaper (see reap/start_reaper):
+    - Sessions idle longer than idle_ttl_minutes are ended and removed
+    - With a spill_dir, sessions idle longer than spill_after_minutes are
+      pickled to disk and dropped from memory; get_session restores them
+
+    Request handlers use the *_async methods, which run spill files,
+    shared-backend calls and unpickling in a worker thread instead of on
+    the event loop.
+
+    With a shared state_backend, sessions live in the backend so several
+    worker processes can serve them. Each worker keeps a local copy that
+    is reloaded when another worker has saved a newer version; callers
+    publish changes with save_session/save_user_session. FOV session
+    saves are compare-and-swap on the version the local copy was loaded
+    at and raise StaleSessionError instead of overwriting a newer save.
     """
 
-    def __init__(self):
+    FOV_NAMESPACE = "fov_sessions"
+    META_NAMESPACE = "fov_session_meta"
+    USER_NAMESPACE = "user_sessions"
+    USER_INDEX_NAMESPACE = "user_session_ids"
+
+    def __init__(
+        self,
+        retrieval_indexes: Optional[CurriculumIndexStore] = None,
+        idle_ttl_minutes: float = 60,
+        spill_after_minutes: float = 10,
+        spill_dir: Optional[Path] = None,
+        state_backend: Optional["StateBackend"] = None,
+    ):
+        self.retrieval_indexes = retrieval_indexes
+        self.idle_ttl_minutes = idle_ttl_minutes
+        self.spill_after_minutes = spill_after_minutes
+        self.spill_dir = spill_dir
+        self.state_backend = state_backend
+        # session_id -> version of the local copy (shared backend only)
+        self._versions: dict[str, str] = {}
+        # session_id -> lock serializing this worker's saves of a session
+        self._save_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
         self._sessions: dict[str, FOVSession] = {}
         self._user_sessions: dict[str, UserSession] = {}  # session_id -> UserSession
         self._users_to_sessions: dict[str, str] = {}      # user_id -> session_id
+        # session_id -> (last_active_at, state at spill time)
+        self._spilled: dict[str, tuple[datetime, dict]] = {}
+        self._spill_dir_ready = False
+        # session_id -> restore in progress, shared by concurrent lookups
+        self._restoring: dict[str, asyncio.Task] = {}
+        self._reaper_task: Optional[asyncio.Task] = None
 
     def create_session(
         self,
@@ -640,8 +873,18 @@ class SessionManager:
         config: Optional[SessionConfig] = None
     ) -> FOVSession:
         """Create a new FOV session."""
-        session = FOVSession.create(curriculum_id, config)
-        self._sessions[session.session_id] = session
+        session = self._new_session(curriculum_id, config)
+        self.save_session(session)
+        return session
+
+    async def create_session_async(
+        self,
+        curriculum_id: str,
+        config: Optional[SessionConfig] = None
+    ) -> FOVSession:
+        """Create a new FOV session (see create_session), saving it off the event loop."""
+        session = self._new_session(curriculum_id, config)
+        await self.save_session_async(session)
         return session
 
     def create_user_session(
@@ -654,6 +897,11 @@ class SessionManager:
 
         If user already has an active session, returns that session.
         """
+        if self.shared:
+            return self._attach_fov_session(
+                self._claim_shared_user_session(user_id, organization_id, voice_config)
+            )
+
         # Check for existing session
         existing_session_id = self._users_to_sessions.get(user_id)
         if existing_session_id and existing_session_id in self._user_sessions:
@@ -667,32 +915,172 @@ class SessionManager:
         logger.info(f"Created user session {session.session_id} for user {user_id}")
         return session
 
+    async def create_user_session_async(
+        self,
+        user_id: str,
+        organization_id: Optional[str] = None,
+        voice_config: Optional[UserVoiceConfig] = None,
+    ) -> UserSession:
+        """Create or get a user session (see create_user_session), off the event loop."""
+        if not self.shared:
+            return self.create_user_session(user_id, organization_id, voice_config)
+        session = await asyncio.to_thread(
+            self._claim_shared_user_session, user_id, organization_id, voice_config
+        )
+        return await self._attach_fov_session_async(session)
+
     def get_session(self, session_id: str) -> Optional[FOVSession]:
-        """Get a FOV session by ID."""
-        return self._sessions.get(session_id)
+        """Get a FOV session by ID, restoring it from disk if spilled.
+
+        Lookups count as activity for the reaper.
+        """
+        if self.shared:
+            session = self._load_shared_session(session_id)
+        else:
+            session = self._sessions.get(session_id)
+        if session is None and session_id in self._spilled:
+            session = self._restore(session_id)
+        if session is not None:
+            session.last_active_at = datetime.now()
+        return session
+
+    async def get_session_async(self, session_id: str) -> Optional[FOVSession]:
+        """Get a FOV session by ID (see get_session), restoring it off the event loop."""
+        if self.shared:
+            session = await self._load_shared_session_async(session_id)
+        else:
+            session = self._sessions.get(session_id)
+        if session is None and session_id in self._spilled:
+            session = await self._restore_async(session_id)
+        if session is not None:
+            session.last_active_at = datetime.now()
+        return session
 
     def get_user_session(self, session_id: str) -> Optional[UserSession]:
         """Get a user session by ID."""
+        if self.shared:
+            return self._attach_fov_session(self._fetch_shared_user_session(session_id))
         return self._user_sessions.get(session_id)
 
+    async def get_user_session_async(self, session_id: str) -> Optional[UserSession]:
+        """Get a user session by ID (see get_user_session), off the event loop."""
+        if not self.shared:
+            return self.get_user_session(session_id)
+        session = await asyncio.to_thread(self._fetch_shared_user_session, session_id)
+        return await self._attach_fov_session_async(session)
+
     def get_user_session_by_user(self, user_id: str) -> Optional[UserSession]:
         """Get a user session by user ID."""
+        if self.shared:
+            return self._attach_fov_session(self._fetch_shared_user_session_by_user(user_id))
+
         session_id = self._users_to_sessions.get(user_id)
         if session_id:
             return self._user_sessions.get(session_id)
         return None
 
+    async def get_user_session_by_user_async(self, user_id: str) -> Optional[UserSession]:
+        """Get a user session by user ID (see get_user_session_by_user), off the event loop."""
+        if not self.shared:
+            return self.get_user_session_by_user(user_id)
+        session = await asyncio.to_thread(self._fetch_shared_user_session_by_user, user_id)
+        return await self._attach_fov_session_async(session)
+
+    def save_session(self, session: FOVSession) -> None:
+        """Publish a FOV session's changes to the shared backend.
+
+        Sessions are live objects without a shared backend, so this is a
+        no-op there.
+
+        Raises:
+            StaleSessionError: Another worker saved or ended the session
+                since this copy was loaded; nothing was written
+        """
+        if not self.shared:
+            return
+        expected = self._expected_version(session)
+        try:
+            version = self._store_shared_session(
+                session.session_id, expected, *self._snapshot(session)
+            )
+        except StaleSessionError:
+            self._forget_session(session.session_id)
+            raise
+        self._versions[session.session_id] = version
+
+    async def save_session_async(self, session: FOVSession) -> None:
+        """Publish a FOV session's changes (see save_session), off the event loop.
+
+        The session is pickled on the event loop, so the stored copy is a
+        consistent snapshot even if a handler changes it during the write.
+        This worker's saves of a session are serialized so that they never
+        conflict with each other.
+        """
+        if not self.shared:
+            return
+        lock = self._save_locks.setdefault(session.session_id, asyncio.Lock())
+        async with lock:
+            expected = self._expected_version(session)
+            try:
+                version = await asyncio.to_thread(
+                    self._store_shared_session,
+                    session.session_id, expected, *self._snapshot(session),
+                )
+            except StaleSessionError:
+                if self._sessions.get(session.session_id) is session:
+                    self._forget_session(session.session_id)
+                raise
+            if self._sessions.get(session.session_id) is session:
+                self._versions[session.session_id] = version
+
+    def save_user_session(self, session: UserSession) -> None:
+        """Publish a user session's changes to the shared backend (see save_session)."""
+        if not self.shared:
+            return
+        self._store_shared_user_session(
+            session.session_id, session.user_id, pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    async def save_user_session_async(self, session: UserSession) -> None:
+        """Publish a user session's changes (see save_user_session), off the event loop."""
+        if not self.shared:
+            return
+        await asyncio.to_thread(
+            self._store_shared_user_session,
+            session.session_id,
+            session.user_id,
+            pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
     def end_session(self, session_id: str) -> bool:
         """End and remove a FOV session."""
+        if self.shared:
+            self._forget_session(session_id)
+            return self._delete_shared_session(session_id)
+
         session = self._sessions.get(session_id)
         if session:
             session.end()
             del self._sessions[session_id]
             return True
+        if session_id in self._spilled:
+            del self._spilled[session_id]
+            self._spill_path(session_id).unlink(missing_ok=True)
+            return True
         return False
 
+    async def end_session_async(self, session_id: str) -> bool:
+        """End and remove a FOV session (see end_session), off the event loop."""
+        if not self.shared:
+            return self.end_session(session_id)
+        self._forget_session(session_id)
+        return await asyncio.to_thread(self._delete_shared_session, session_id)
+
     def end_user_session(self, session_id: str) -> bool:
         """End and remove a user session."""
+        if self.shared:
+            return self._forget_user_session(self._remove_shared_user_session(session_id))
+
         session = self._user_sessions.get(session_id)
         if session:
             # Remove user mapping
@@ -706,19 +1094,53 @@ class SessionManager:
             return True
         return False
 
+    async def end_user_session_async(self, session_id: str) -> bool:
+        """End and remove a user session (see end_user_session), off the event loop."""
+        if not self.shared:
+            return self.end_user_session(session_id)
+        return self._forget_user_session(
+            await asyncio.to_thread(self._remove_shared_user_session, session_id)
+        )
+
     def list_sessions(self) -> list[dict]:
-        """List all active FOV sessions."""
+        """List all active FOV sessions.
+
+        Spilled sessions are listed with their state as of the spill, and
+        shared ones with their state as of the last save.
+        """
+        if self.shared:
+            return [
+                json.loads(raw)["state"]
+                for _, raw in self.state_backend.items(self.META_NAMESPACE)
+            ]
         return [
             session.get_state()
             for session in self._sessions.values()
-        ]
+        ] + [state for _, state in self._spilled.values()]
+
+    async def list_sessions_async(self) -> list[dict]:
+        """List all active FOV sessions (see list_sessions), off the event loop."""
+        if not self.shared:
+            return self.list_sessions()
+        return await asyncio.to_thread(self.list_sessions)
 
     def list_user_sessions(self) -> list[dict]:
         """List all active user sessions."""
-        return [
-            session.get_state()
-            for session in self._user_sessions.values()
-        ]
+        return [session.get_state() for session in self._iter_user_sessions()]
+
+    def _iter_user_sessions(self) -> list[UserSession]:
+        """Internal: All user sessions, loading shared ones from the backend."""
+        if self.shared:
+            return [
+                pickle.loads(raw)
+                for _, raw in self.state_backend.items(self.USER_NAMESPACE)
+            ]
+        return list(self._user_sessions.values())
+
+    @property
+    def shared(self) -> bool:
+        """Whether sessions live in a backend shared with other workers."""
+        return self.state_backend is not None and self.state_backend.shared
 
     def cleanup_ended_sessions(self) -> int:
         """Remove ended FOV sessions. Returns count of removed sessions."""
@@ -732,13 +1154,7 @@ class SessionManager:
 
     def cleanup_inactive_user_sessions(self, max_inactive_minutes: int = 60) -> int:
         """Remove user sessions inactive for too long. Returns count removed."""
-        now = datetime.now()
-        inactive = []
-
-        for session_id, session in self._user_sessions.items():
-            age_minutes = (now - session.last_active_at).total_seconds() / 60
-            if age_minutes > max_inactive_minutes:
-                inactive.append(session_id)
+        inactive = self._inactive_user_sessions(datetime.now(), max_inactive_minutes)
 
         for session_id in inactive:
             self.end_user_session(session_id)
@@ -747,3 +1163,534 @@ class SessionManager:
             logger.info(f"Cleaned up {len(inactive)} inactive user sessions")
 
         return len(inactive)
+
+    def _inactive_user_sessions(self, now: datetime, max_inactive_minutes: float) -> list[str]:
+        """Internal: IDs of user sessions inactive for longer than max_inactive_minutes."""
+        return [
+            session.session_id for session in self._iter_user_sessions()
+            if (now - session.last_active_at).total_seconds() / 60 > max_inactive_minutes
+        ]
+
+    # --- Eviction ---
+
+    def reap(self, now: Optional[datetime] = None) -> dict:
+        """Expire idle sessions and spill cold ones to disk.
+
+        Returns:
+            Counts of sessions removed, expired and spilled
+        """
+        now = now or datetime.now()
+        if self.shared:
+            result = self._expire_shared(now, *self._purge_shared(now))
+        else:
+            result = self._expire(now)
+            if self.spill_dir is not None:
+                result["spilled"] = sum(1 for session in self._cold_sessions(now) if self._spill(session))
+
+        if any(result.values()):
+            logger.info(f"Session reaper: {result}")
+        return result
+
+    async def reap_async(self, now: Optional[datetime] = None) -> dict:
+        """Like reap, but spill files and shared-backend calls run in a worker thread.
+
+        The event loop keeps serving requests while cold sessions are
+        written; a session used meanwhile stays resident.
+        """
+        now = now or datetime.now()
+        if self.shared:
+            result = self._expire_shared(now, *await asyncio.to_thread(self._purge_shared, now))
+        else:
+            result = self._expire(now)
+            if self.spill_dir is not None:
+                for session in self._cold_sessions(now):
+                    if await self._spill_async(session):
+                        result["spilled"] += 1
+
+        if any(result.values()):
+            logger.info(f"Session reaper: {result}")
+        return result
+
+    def _expire(self, now: datetime) -> dict:
+        """Internal: The expiry half of reap without a shared backend; returns reap's counts."""
+        ttl_seconds = self.idle_ttl_minutes * 60
+        result = {
+            "ended_removed": self.cleanup_ended_sessions(),
+            "expired": 0,
+            "spilled": 0,
+            "user_sessions_expired": self.cleanup_inactive_user_sessions(self.idle_ttl_minutes),
+        }
+
+        expired = [
+            sid for sid, session in self._sessions.items()
+            if (now - session.last_active_at).total_seconds() > ttl_seconds
+        ] + [
+            sid for sid, (last_active_at, _) in self._spilled.items()
+            if (now - last_active_at).total_seconds() > ttl_seconds
+        ]
+        for sid in expired:
+            self.end_session(sid)
+        result["expired"] = len(expired)
+        return result
+
+    def _purge_shared(self, now: datetime) -> tuple[int, list[UserSession]]:
+        """Internal: The backend half of a shared reap.
+
+        The backend expires sessions by TTL; this drops expired keys and
+        removes inactive user sessions. Touches only the backend, so it is
+        safe to run in a worker thread.
+
+        Returns:
+            (expired FOV session count, removed user sessions)
+        """
+        expired = self.state_backend.purge_expired(self.META_NAMESPACE)
+        for namespace in (self.FOV_NAMESPACE, self.USER_NAMESPACE, self.USER_INDEX_NAMESPACE):
+            self.state_backend.purge_expired(namespace)
+        removed = [
+            self._remove_shared_user_session(session_id)
+            for session_id in self._inactive_user_sessions(now, self.idle_ttl_minutes)
+        ]
+        return expired, [session for session in removed if session is not None]
+
+    def _expire_shared(self, now: datetime, expired: int, removed: list[UserSession]) -> dict:
+        """Internal: The local half of a shared reap; returns reap's counts.
+
+        Local copies of cold sessions are dropped; the next get_session
+        reloads them.
+        """
+        for session in removed:
+            self._forget_user_session(session)
+        cold = [
+            sid for sid, session in self._sessions.items()
+            if (now - session.last_active_at).total_seconds() > self.spill_after_minutes * 60
+        ]
+        for sid in cold:
+            self._forget_session(sid)
+        return {
+            "ended_removed": self.cleanup_ended_sessions(),
+            "expired": expired,
+            "spilled": len(cold),
+            "user_sessions_expired": len(removed),
+        }
+
+    def _cold_sessions(self, now: datetime) -> list[FOVSession]:
+        """Internal: Resident sessions idle long enough to spill."""
+        # Sessions a user session holds on to would stay in memory anyway
+        attached = {
+            user.fov_session.session_id
+            for user in self._user_sessions.values()
+            if user.fov_session
+        }
+        return [
+            session for sid, session in self._sessions.items()
+            if sid not in attached
+            and (now - session.last_active_at).total_seconds() > self.spill_after_minutes * 60
+        ]
+
+    def start_reaper(self, interval_seconds: float = 60.0) -> None:
+        """Start the background eviction loop."""
+        if self._reaper_task and not self._reaper_task.done():
+            return
+        self._reaper_task = asyncio.create_task(self._reaper_loop(interval_seconds))
+
+    async def stop_reaper(self) -> None:
+        """Stop the background eviction loop."""
+        if self._reaper_task and not self._reaper_task.done():
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+        self._reaper_task = None
+
+    async def _reaper_loop(self, interval_seconds: float) -> None:
+        """Internal: Periodically reap idle sessions."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.reap_async()
+            except Exception as e:
+                logger.error(f"Session reaper failed: {e}")
+
+    def memory_stats(self, top: int = 20) -> dict:
+        """Approximate memory held by sessions.
+
+        Args:
+            top: How many of the largest FOV sessions to list individually
+        """
+        now = datetime.now()
+        per_session = sorted(
+            (
+                {
+                    "session_id": sid,
+                    "curriculum_id": session.curriculum_id,
+                    "bytes": session.memory_bytes(),
+                    "turns": len(session.conversation_history),
+                    "events": len(session.events),
+                    "idle_seconds": round((now - session.last_active_at).total_seconds(), 1),
+                }
+                for sid, session in self._sessions.items()
+            ),
+            key=lambda entry: entry["bytes"],
+            reverse=True,
+        )
+        fov_bytes = sum(entry["bytes"] for entry in per_session)
+        user_bytes = sum(
+            _deep_sizeof(user, {id(user.fov_session)})
+            for user in self._user_sessions.values()
+        )
+
+        return {
+            "fov_sessions": {
+                "resident": len(per_session),
+                "spilled": len(self._spilled),
+                "total_bytes": fov_bytes,
+                "mean_bytes": fov_bytes // len(per_session) if per_session else 0,
+                "max_bytes": per_session[0]["bytes"] if per_session else 0,
+                "largest": per_session[:top],
+            },
+            "user_sessions": {
+                "count": len(self._user_sessions),
+                "total_bytes": user_bytes,
+            },
+            "limits": {
+                "idle_ttl_minutes": self.idle_ttl_minutes,
+                "spill_after_minutes": self.spill_after_minutes,
+                "spill_enabled": self.spill_dir is not None,
+                "shared_backend": self.shared,
+            },
+        }
+
+    # --- Shared backend ---
+    #
+    # The _fetch/_store/_remove/_claim/_purge helpers touch only the
+    # backend, so the *_async methods run them in a worker thread; the
+    # local dicts are only changed on the calling thread.
+
+    def _new_session(self, curriculum_id: str, config: Optional[SessionConfig]) -> FOVSession:
+        """Internal: Create a FOV session and make it resident."""
+        index = self.retrieval_indexes.get(curriculum_id) if self.retrieval_indexes else None
+        session = FOVSession.create(curriculum_id, config, index)
+        self._sessions[session.session_id] = session
+        return session
+
+    def _forget_session(self, session_id: str) -> None:
+        """Internal: Drop the local copy of a shared session."""
+        self._sessions.pop(session_id, None)
+        self._versions.pop(session_id, None)
+
+    def _forget_user_session(self, session: Optional[UserSession]) -> bool:
+        """Internal: Drop local state of a user session removed from the backend."""
+        if session is None:
+            return False
+        if session.fov_session_id:
+            self._forget_session(session.fov_session_id)
+        logger.info(f"Ended user session {session.session_id} for user {session.user_id}")
+        return True
+
+    def _load_shared_session(self, session_id: str) -> Optional[FOVSession]:
+        """Internal: The backend's copy of a session, reusing the local one if current."""
+        version, session = self._fetch_shared_session(session_id, self._local_version(session_id))
+        return self._install_shared_session(session_id, version, session)
+
+    async def _load_shared_session_async(self, session_id: str) -> Optional[FOVSession]:
+        """Internal: _load_shared_session with the backend read in a worker thread."""
+        version, session = await asyncio.to_thread(
+            self._fetch_shared_session, session_id, self._local_version(session_id)
+        )
+        if session is None and version is not None and session_id not in self._sessions:
+            # The local copy that matched was dropped during the read
+            version, session = await asyncio.to_thread(self._fetch_shared_session, session_id, None)
+        return self._install_shared_session(session_id, version, session)
+
+    def _local_version(self, session_id: str) -> Optional[str]:
+        """Internal: Version of the resident copy of a shared session."""
+        return self._versions.get(session_id) if session_id in self._sessions else None
+
+    def _fetch_shared_session(
+        self,
+        session_id: str,
+        known_version: Optional[str],
+    ) -> tuple[Optional[str], Optional[FOVSession]]:
+        """Internal: Read (version, copy) of a session from the backend.
+
+        The copy is None when the backend still holds known_version, and
+        both are None when the session is gone.
+        """
+        meta = self.state_backend.get_json(self.META_NAMESPACE, session_id)
+        if meta is None:
+            return None, None
+        if meta["version"] == known_version:
+            return known_version, None
+        raw = self.state_backend.get(self.FOV_NAMESPACE, session_id)
+        if raw is None:
+            # Left behind by a save that raced end_session
+            self.state_backend.delete(self.META_NAMESPACE, session_id)
+            return None, None
+        return raw[:VERSION_LENGTH].decode(), pickle.loads(raw[VERSION_LENGTH:])
+
+    def _install_shared_session(
+        self,
+        session_id: str,
+        version: Optional[str],
+        session: Optional[FOVSession],
+    ) -> Optional[FOVSession]:
+        """Internal: Make a fetched copy resident unless the local one is as new."""
+        if version is None:
+            self._forget_session(session_id)
+            return None
+        local = self._sessions.get(session_id)
+        # This worker may have saved a newer version while the fetch ran,
+        # or be saving the local copy right now
+        save_lock = self._save_locks.get(session_id)
+        if local is not None and (
+            (save_lock is not None and save_lock.locked())
+            or _version_generation(self._versions.get(session_id)) >= _version_generation(version)
+        ):
+            return local
+        if session is None:
+            return None
+        if self.retrieval_indexes:
+            session.retrieval_index = self.retrieval_indexes.get(session.curriculum_id)
+        self._sessions[session_id] = session
+        self._versions[session_id] = version
+        return session
+
+    def _expected_version(self, session: FOVSession) -> Optional[str]:
+        """Internal: The version a save of this copy must replace (None if never saved)."""
+        if self._sessions.get(session.session_id) is not session:
+            # Replaced by a newer copy, or ended, since it was loaded
+            raise StaleSessionError(session.session_id)
+        return self._versions.get(session.session_id)
+
+    @staticmethod
+    def _snapshot(session: FOVSession) -> tuple[bytes, dict]:
+        """Internal: A session's pickle and listed state, taken together."""
+        return pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL), session.get_state()
+
+    def _store_shared_session(
+        self,
+        session_id: str,
+        expected_version: Optional[str],
+        payload: bytes,
+        state: dict,
+    ) -> str:
+        """Internal: Compare-and-swap a pickled session into the backend.
+
+        Returns:
+            The new version
+
+        Raises:
+            StaleSessionError: The backend does not hold expected_version
+        """
+        version = _next_version(expected_version)
+        ttl_seconds = self.idle_ttl_minutes * 60
+
+        def swap(current: Optional[bytes]) -> bytes:
+            current_version = current[:VERSION_LENGTH].decode() if current else None
+            if current_version != expected_version:
+                raise StaleSessionError(session_id)
+            return version.encode() + payload
+
+        def newer_meta(current: Optional[bytes]) -> bytes:
+            # Saves can finish their metadata writes out of order
+            if current and (
+                _version_generation(json.loads(current)["version"]) >= _version_generation(version)
+            ):
+                return current
+            return json.dumps({"version": version, "state": state}).encode()
+
+        # Data before metadata, so a reader that sees the new version finds it
+        self.state_backend.update(self.FOV_NAMESPACE, session_id, swap, ttl_seconds)
+        self.state_backend.update(self.META_NAMESPACE, session_id, newer_meta, ttl_seconds)
+        return version
+
+    def _delete_shared_session(self, session_id: str) -> bool:
+        """Internal: Remove a FOV session from the backend."""
+        self.state_backend.delete(self.FOV_NAMESPACE, session_id)
+        return self.state_backend.delete(self.META_NAMESPACE, session_id)
+
+    def _attach_fov_session(self, session: Optional[UserSession]) -> Optional[UserSession]:
+        """Internal: Reattach a loaded user session's FOV session."""
+        if session is not None and session.fov_session_id:
+            session.fov_session = self.get_session(session.fov_session_id)
+        return session
+
+    async def _attach_fov_session_async(self, session: Optional[UserSession]) -> Optional[UserSession]:
+        """Internal: _attach_fov_session with the FOV session loaded off the event loop."""
+        if session is not None and session.fov_session_id:
+            session.fov_session = await self.get_session_async(session.fov_session_id)
+        return session
+
+    def _fetch_shared_user_session(self, session_id: str) -> Optional[UserSession]:
+        """Internal: Load a user session from the backend, without its FOV session."""
+        raw = self.state_backend.get(self.USER_NAMESPACE, session_id)
+        return pickle.loads(raw) if raw is not None else None
+
+    def _fetch_shared_user_session_by_user(self, user_id: str) -> Optional[UserSession]:
+        """Internal: Load a user's session from the backend, without its FOV session."""
+        session_id = self.state_backend.get(self.USER_INDEX_NAMESPACE, user_id)
+        return self._fetch_shared_user_session(session_id.decode()) if session_id else None
+
+    def _store_shared_user_session(self, session_id: str, user_id: str, payload: bytes) -> None:
+        """Internal: Write a pickled user session and its user mapping to the backend."""
+        ttl_seconds = self.idle_ttl_minutes * 60
+        self.state_backend.set(self.USER_NAMESPACE, session_id, payload, ttl_seconds)
+        self.state_backend.set(
+            self.USER_INDEX_NAMESPACE, user_id, session_id.encode(), ttl_seconds
+        )
+
+    def _remove_shared_user_session(self, session_id: str) -> Optional[UserSession]:
+        """Internal: Remove a user session and its FOV session from the backend.
+
+        Returns the removed session, or None if there was none.
+        """
+        session = self._fetch_shared_user_session(session_id)
+        if not session:
+            return None
+        # Only drop the user mapping if it still points at this session
+        self.state_backend.update(
+            self.USER_INDEX_NAMESPACE,
+            session.user_id,
+            lambda current: None if current == session_id.encode() else current,
+        )
+        if session.fov_session_id:
+            self._delete_shared_session(session.fov_session_id)
+        self.state_backend.delete(self.USER_NAMESPACE, session_id)
+        return session
+
+    def _claim_shared_user_session(
+        self,
+        user_id: str,
+        organization_id: Optional[str],
+        voice_config: Optional[UserVoiceConfig],
+    ) -> UserSession:
+        """Internal: Create a user session unless another worker already has."""
+        existing = self._fetch_shared_user_session_by_user(user_id)
+        if existing:
+            return existing
+
+        session = UserSession.create(user_id, organization_id, voice_config)
+        ttl_seconds = self.idle_ttl_minutes * 60
+        self.state_backend.set(
+            self.USER_NAMESPACE,
+            session.session_id,
+            pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL),
+            ttl_seconds,
+        )
+        # Claim the user; if another worker won the race, use its session
+        claimed = self.state_backend.update(
+            self.USER_INDEX_NAMESPACE,
+            user_id,
+            lambda current: current or session.session_id.encode(),
+            ttl_seconds,
+        ).decode()
+        if claimed != session.session_id:
+            winner = self._fetch_shared_user_session(claimed)
+            if winner:
+                self.state_backend.delete(self.USER_NAMESPACE, session.session_id)
+                return winner
+            # The claim pointed at an expired session; take it over
+            self.state_backend.set(
+                self.USER_INDEX_NAMESPACE, user_id, session.session_id.encode(), ttl_seconds
+            )
+
+        logger.info(f"Created user session {session.session_id} for user {user_id}")
+        return session
+
+    def _spill_path(self, session_id: str) -> Path:
+        """Internal: File a spilled session is stored in."""
+        return Path(self.spill_dir) / f"{session_id}.pkl"
+
+    def _spill(self, session: FOVSession) -> bool:
+        """Internal: Write a session to disk and drop it from memory."""
+        if not self._write_spill(session):
+            return False
+        self._mark_spilled(session)
+        return True
+
+    async def _spill_async(self, session: FOVSession) -> bool:
+        """Internal: _spill with the file written from a worker thread."""
+        last_active_at = session.last_active_at
+        if not await asyncio.to_thread(self._write_spill, session):
+            return False
+        if self._sessions.get(session.session_id) is not session or session.last_active_at != last_active_at:
+            # Used or ended while it was being written; keep the live copy
+            self._spill_path(session.session_id).unlink(missing_ok=True)
+            return False
+        self._mark_spilled(session)
+        return True
+
+    def _write_spill(self, session: FOVSession) -> bool:
+        """Internal: Pickle a session to its spill file. Safe to run in a thread."""
+        try:
+            if not self._spill_dir_ready:
+                # Spilled sessions do not outlive the process, like resident ones
+                Path(self.spill_dir).mkdir(parents=True, exist_ok=True)
+                for stale in Path(self.spill_dir).glob("*.pkl"):
+                    if stale.stem not in self._spilled:
+                        stale.unlink(missing_ok=True)
+                self._spill_dir_ready = True
+
+            path = self._spill_path(session.session_id)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(session, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Could not spill session {session.session_id}: {e}")
+            return False
+        return True
+
+    def _mark_spilled(self, session: FOVSession) -> None:
+        """Internal: Drop a session whose spill file is written from memory."""
+        self._spilled[session.session_id] = (session.last_active_at, session.get_state())
+        del self._sessions[session.session_id]
+
+    def _restore(self, session_id: str) -> Optional[FOVSession]:
+        """Internal: Load a spilled session back into memory."""
+        self._spilled.pop(session_id)
+        session = self._read_spill(session_id)
+        if session is not None:
+            self._install_restored(session)
+        return session
+
+    async def _restore_async(self, session_id: str) -> Optional[FOVSession]:
+        """Internal: _restore with the file read from a worker thread.
+
+        Concurrent lookups of the same session wait for one restore.
+        """
+        task = self._restoring.get(session_id)
+        if task is None:
+            task = asyncio.ensure_future(self._restore_from_thread(session_id))
+            self._restoring[session_id] = task
+            task.add_done_callback(lambda _: self._restoring.pop(session_id, None))
+        return await asyncio.shield(task)
+
+    async def _restore_from_thread(self, session_id: str) -> Optional[FOVSession]:
+        """Internal: Body of _restore_async."""
+        session = await asyncio.to_thread(self._read_spill, session_id)
+        if self._spilled.pop(session_id, None) is None:
+            # Ended while the file was being read
+            return None
+        if session is not None:
+            self._install_restored(session)
+        return session
+
+    def _read_spill(self, session_id: str) -> Optional[FOVSession]:
+        """Internal: Unpickle and delete a spill file. Safe to run in a thread."""
+        path = self._spill_path(session_id)
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not restore spilled session {session_id}: {e}")
+            return None
+        finally:
+            path.unlink(missing_ok=True)
+
+    def _install_restored(self, session: FOVSession) -> None:
+        """Internal: Make a restored session resident again."""
+        if self.retrieval_indexes:
+            session.retrieval_index = self.retrieval_indexes.get(session.curriculum_id)
+        self._sessions[session.session_id] = session
@@ -0,0 +1,228 @@
+"""
+FOV Token Counting - Server-side implementation
+
+Token counters and priority-aware packing for FOV buffer budgets.
+
+A local BPE tokenizer (tiktoken) is used when installed, loaded once per
+encoding; otherwise a regex approximation of BPE pre-tokenization is
+used. Counts are memoized per string, so unchanged buffer sections cost a
+dictionary lookup.
+"""
+
+import logging
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+ELLIPSIS = "..."
+
+# Approximates GPT-style pre-tokenization: contractions, letter runs with
+# an optional leading space, up to three digits, punctuation runs, spaces
+_PIECE_PATTERN = re.compile(
+    r"'(?:s|t|re|ve|m|ll|d)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+"
+)
+
+
+class TokenCounter:
+    """Counts tokens in text."""
+
+    name = "base"
+
+    def count(self, text: str) -> int:
+        raise NotImplementedError
+
+
+class HeuristicTokenCounter(TokenCounter):
+    """Approximate BPE counts without a tokenizer.
+
+    Short words and spaces are one token each, as in common BPE
+    vocabularies. Longer words cost a token per ~4 further characters and
+    punctuation runs a token per 2 characters.
+    """
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        tokens = 0
+        for piece in _PIECE_PATTERN.findall(text):
+            core = piece.strip()
+            if not core:
+                tokens += 1
+            elif core[0].isalpha():
+                tokens += 1 + math.ceil(max(0, len(core) - 6) / 4)
+            elif core[0].isdigit():
+                tokens += 1
+            else:
+                tokens += math.ceil(len(core) / 2)
+        return tokens
+
+
+class TiktokenCounter(TokenCounter):
+    """Exact counts from a local tiktoken BPE encoding."""
+
+    def __init__(self, encoding: str = DEFAULT_ENCODING):
+        if not TIKTOKEN_AVAILABLE:
+            raise RuntimeError("tiktoken is not installed")
+        self.name = f"tiktoken:{encoding}"
+        self._encoding = _load_encoding(encoding)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+class CachedTokenCounter(TokenCounter):
+    """Memoizes another counter's results per string (LRU)."""
+
+    def __init__(self, counter: TokenCounter, maxsize: int = 4096):
+        self.counter = counter
+        self.name = counter.name
+        self.count = lru_cache(maxsize=maxsize)(counter.count)
+
+    def cache_info(self):
+        return self.count.cache_info()
+
+    def __reduce__(self):
+        # Pickled sessions come back to the shared counter, not a copy
+        if self is get_token_counter():
+            return get_token_counter, ()
+        if self is get_token_counter(None):
+            return get_token_counter, (None,)
+        return CachedTokenCounter, (self.counter, self.count.cache_parameters()["maxsize"])
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(encoding: str):
+    """Internal: Load a BPE encoding once per process."""
+    return tiktoken.get_encoding(encoding)
+
+
+@lru_cache(maxsize=None)
+def get_token_counter(encoding: Optional[str] = DEFAULT_ENCODING) -> TokenCounter:
+    """Get the shared, cached token counter.
+
+    Args:
+        encoding: tiktoken encoding name; None forces the heuristic counter
+
+    Returns:
+        A tiktoken counter when available, else the heuristic, both cached
+    """
+    if encoding and TIKTOKEN_AVAILABLE:
+        try:
+            return CachedTokenCounter(TiktokenCounter(encoding))
+        except Exception as e:
+            logger.warning(f"Could not load tokenizer {encoding}, using heuristic counts: {e}")
+    return CachedTokenCounter(HeuristicTokenCounter())
+
+
+# --- Packing ---
+
+@dataclass
+class PackItem:
+    """One section of a buffer rendering."""
+    text: str
+    priority: int
+    truncatable: bool = False
+
+
+def truncate_to_tokens(text: str, budget: int, counter: TokenCounter) -> str:
+    """Cut text to fit a token budget, at a word boundary where possible.
+
+    Args:
+        text: Text to cut
+        budget: Maximum tokens, including the trailing ellipsis
+        counter: Token counter
+
+    Returns:
+        The text, a word-boundary prefix ending in "...", or "" if nothing fits
+    """
+    if counter.count(text) <= budget:
+        return text
+    if counter.count(ELLIPSIS) > budget:
+        return ""
+
+    # Probe prefixes uncached so they don't evict real entries
+    probe = counter.counter if isinstance(counter, CachedTokenCounter) else counter
+
+    def fits(end: int) -> bool:
+        return probe.count(text[:end].rstrip() + ELLIPSIS) <= budget
+
+    # Binary search over word boundaries, then characters if no word fits
+    boundaries = [m.start() for m in re.finditer(r"\s+", text)]
+    lo, hi = 0, len(boundaries)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if fits(boundaries[mid - 1]):
+            lo = mid
+        else:
+            hi = mid - 1
+    if lo:
+        return text[:boundaries[lo - 1]].rstrip() + ELLIPSIS
+
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if fits(mid):
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + ELLIPSIS if lo else ""
+
+
+def pack_items(
+    items: list[PackItem],
+    token_budget: int,
+    counter: TokenCounter,
+    separator: str = "\n\n",
+) -> str:
+    """Join items in their given order, keeping the most important that fit.
+
+    Items are considered from highest to lowest priority. An item that does
+    not fit is dropped whole unless it is truncatable (or is the most
+    important item), in which case it is cut at a word boundary to fill the
+    remaining budget.
+
+    Args:
+        items: Sections in display order
+        token_budget: Maximum tokens for the joined result
+        counter: Token counter
+        separator: Text placed between kept items
+
+    Returns:
+        The packed text
+    """
+    items = [item for item in items if item.text]
+    if not items:
+        return ""
+
+    separator_cost = counter.count(separator)
+    order = sorted(range(len(items)), key=lambda i: -items[i].priority)
+    kept: dict[int, str] = {}
+    remaining = token_budget
+
+    for position, index in enumerate(order):
+        item = items[index]
+        overhead = separator_cost if kept else 0
+        cost = counter.count(item.text) + overhead
+        if cost <= remaining:
+            kept[index] = item.text
+            remaining -= cost
+        elif item.truncatable or position == 0:
+            trimmed = truncate_to_tokens(item.text, remaining - overhead, counter)
+            if trimmed:
+                kept[index] = trimmed
+                remaining -= counter.count(trimmed) + overhead
+
+    result = separator.join(kept[i] for i in sorted(kept))
+    # Merges across separators can shift counts slightly; never overflow
+    return truncate_to_tokens(result, token_budget, counter)
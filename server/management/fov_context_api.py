@@ -8,20 +8,27 @@ Provides endpoints for:
 - Confidence analysis and expansion recommendations
 """
 
+import json
 import logging
+from pathlib import Path
+from typing import Optional
+
 from aiohttp import web
 
 from fov_context import (
+    CurriculumIndexStore,
     FOVSession,
     SessionConfig,
     SessionManager,
     SessionState,
+    StaleSessionError,
     ConversationTurn,
     MessageRole,
     TranscriptSegment,
     GlossaryTerm,
     MisconceptionTrigger,
 )
+from state_backend import StateBackend
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +41,35 @@ def get_session_manager() -> SessionManager:
     return _session_manager
 
 
-def setup_fov_context_routes(app: web.Application) -> None:
-    """Register FOV context API routes."""
+def setup_fov_context_routes(
+    app: web.Application,
+    retrieval_indexes: Optional[CurriculumIndexStore] = None,
+    spill_dir: Optional[Path] = None,
+    state_backend: Optional[StateBackend] = None
+) -> None:
+    """Register FOV context API routes and the session reaper.
+
+    Sessions created afterwards search retrieval_indexes, when given,
+    to expand context. Idle sessions are spilled to spill_dir, when
+    given, instead of being kept in memory, and with a shared
+    state_backend they are kept there so any worker can serve them.
+    """
+    if retrieval_indexes is not None:
+        _session_manager.retrieval_indexes = retrieval_indexes
+    if spill_dir is not None:
+        _session_manager.spill_dir = spill_dir
+    if state_backend is not None:
+        _session_manager.state_backend = state_backend
+
+    async def start_reaper(app):
+        _session_manager.start_reaper()
+
+    async def stop_reaper(app):
+        await _session_manager.stop_reaper()
+
+    app.on_startup.append(start_reaper)
+    app.on_cleanup.append(stop_reaper)
+
     app.router.add_post("/api/sessions", handle_create_session)
     app.router.add_get("/api/sessions", handle_list_sessions)
     app.router.add_get("/api/sessions/{session_id}", handle_get_session)
@@ -74,10 +108,27 @@ def setup_fov_context_routes(app: web.Application) -> None:
     # Debug and observability
     app.router.add_get("/api/sessions/{session_id}/debug", handle_debug_session)
     app.router.add_get("/api/fov/health", handle_fov_health)
+    app.router.add_get("/api/fov/memory", handle_fov_memory)
 
     logger.info("FOV context API routes registered")
 
 
+async def _save_session(session: FOVSession) -> None:
+    """Publish a handler's changes to a session.
+
+    Raises:
+        web.HTTPConflict: Another request (possibly on another worker)
+            changed the session first; the client should reload and retry
+    """
+    try:
+        await _session_manager.save_session_async(session)
+    except StaleSessionError:
+        raise web.HTTPConflict(
+            text=json.dumps({"error": "Session was changed by another request; reload and retry"}),
+            content_type="application/json",
+        )
+
+
 # --- Session Lifecycle Handlers ---
 
 async def handle_create_session(request: web.Request) -> web.Response:
@@ -115,7 +166,7 @@ async def handle_create_session(request: web.Request) -> web.Response:
         auto_expand_context=data.get("auto_expand_context", True)
     )
 
-    session = _session_manager.create_session(curriculum_id, config)
+    session = await _session_manager.create_session_async(curriculum_id, config)
 
     return web.json_response({
         "session_id": session.session_id,
@@ -131,7 +182,7 @@ async def handle_list_sessions(request: web.Request) -> web.Response:
 
     GET /api/sessions
     """
-    sessions = _session_manager.list_sessions()
+    sessions = await _session_manager.list_sessions_async()
     return web.json_response({"sessions": sessions})
 
 
@@ -142,7 +193,7 @@ async def handle_get_session(request: web.Request) -> web.Response:
     GET /api/sessions/{session_id}
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -160,7 +211,7 @@ async def handle_start_session(request: web.Request) -> web.Response:
     POST /api/sessions/{session_id}/start
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -169,6 +220,7 @@ async def handle_start_session(request: web.Request) -> web.Response:
         )
 
     session.start()
+    await _save_session(session)
     return web.json_response({"state": session.state.value})
 
 
@@ -179,7 +231,7 @@ async def handle_pause_session(request: web.Request) -> web.Response:
     POST /api/sessions/{session_id}/pause
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -188,6 +240,7 @@ async def handle_pause_session(request: web.Request) -> web.Response:
         )
 
     session.pause()
+    await _save_session(session)
     return web.json_response({"state": session.state.value})
 
 
@@ -198,7 +251,7 @@ async def handle_resume_session(request: web.Request) -> web.Response:
     POST /api/sessions/{session_id}/resume
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -207,6 +260,7 @@ async def handle_resume_session(request: web.Request) -> web.Response:
         )
 
     session.resume()
+    await _save_session(session)
     return web.json_response({"state": session.state.value})
 
 
@@ -217,7 +271,7 @@ async def handle_end_session(request: web.Request) -> web.Response:
     POST /api/sessions/{session_id}/end
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -228,6 +282,7 @@ async def handle_end_session(request: web.Request) -> web.Response:
     # Get final state before ending
     final_state = session.get_state()
     session.end()
+    await _save_session(session)
 
     return web.json_response(final_state)
 
@@ -240,7 +295,7 @@ async def handle_delete_session(request: web.Request) -> web.Response:
     """
     session_id = request.match_info["session_id"]
 
-    if _session_manager.end_session(session_id):
+    if await _session_manager.end_session_async(session_id):
         return web.json_response({"deleted": True})
     else:
         return web.json_response(
@@ -266,7 +321,7 @@ async def handle_set_topic(request: web.Request) -> web.Response:
     }
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -303,6 +358,7 @@ async def handle_set_topic(request: web.Request) -> web.Response:
         glossary_terms=glossary_terms,
         misconceptions=misconceptions
     )
+    await _save_session(session)
 
     return web.json_response({
         "topic_id": topic_id,
@@ -324,7 +380,7 @@ async def handle_set_position(request: web.Request) -> web.Response:
     }
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -347,6 +403,7 @@ async def handle_set_position(request: web.Request) -> web.Response:
         unit_title=data.get("unit_title"),
         curriculum_outline=data.get("curriculum_outline")
     )
+    await _save_session(session)
 
     return web.json_response({"updated": True})
 
@@ -365,7 +422,7 @@ async def handle_set_segment(request: web.Request) -> web.Response:
     }
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -390,6 +447,7 @@ async def handle_set_segment(request: web.Request) -> web.Response:
     )
 
     session.set_current_segment(segment)
+    await _save_session(session)
 
     return web.json_response({"updated": True})
 
@@ -407,7 +465,7 @@ async def handle_add_turn(request: web.Request) -> web.Response:
     }
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -430,6 +488,7 @@ async def handle_add_turn(request: web.Request) -> web.Response:
         turn = session.add_user_turn(content)
     else:
         turn = session.add_assistant_turn(content)
+    await _save_session(session)
 
     return web.json_response({
         "turn_id": turn.id,
@@ -451,7 +510,7 @@ async def handle_barge_in(request: web.Request) -> web.Response:
     Returns the built context for the LLM call.
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -476,6 +535,7 @@ async def handle_barge_in(request: web.Request) -> web.Response:
     # Build context for LLM
     context = session.build_llm_context(barge_in_utterance=utterance)
     messages = session.build_llm_messages(barge_in_utterance=utterance)
+    await _save_session(session)
 
     return web.json_response({
         "session_id": session_id,
@@ -501,7 +561,7 @@ async def handle_get_context(request: web.Request) -> web.Response:
     GET /api/sessions/{session_id}/context
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -522,7 +582,7 @@ async def handle_build_context(request: web.Request) -> web.Response:
     }
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -538,6 +598,8 @@ async def handle_build_context(request: web.Request) -> web.Response:
     barge_in_utterance = data.get("barge_in_utterance")
 
     context = session.build_llm_context(barge_in_utterance)
+    if barge_in_utterance:
+        await _save_session(session)
 
     return web.json_response({
         "system_message": context.to_system_message(),
@@ -556,7 +618,7 @@ async def handle_get_messages(request: web.Request) -> web.Response:
     GET /api/sessions/{session_id}/messages
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -581,7 +643,7 @@ async def handle_analyze_response(request: web.Request) -> web.Response:
     }
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -600,6 +662,7 @@ async def handle_analyze_response(request: web.Request) -> web.Response:
     response = data.get("response", "")
 
     analysis, recommendation = session.process_response_with_confidence(response)
+    await _save_session(session)
 
     result = {
         "confidence_score": analysis.confidence_score,
@@ -617,7 +680,8 @@ async def handle_analyze_response(request: web.Request) -> web.Response:
             "should_expand": recommendation.should_expand,
             "priority": recommendation.priority.value,
             "scope": recommendation.suggested_scope.value,
-            "reason": recommendation.reason
+            "reason": recommendation.reason,
+            "retrieved_passages": session.context_manager.working_buffer.retrieved_passages
         }
 
     return web.json_response(result)
@@ -636,7 +700,7 @@ async def handle_record_signal(request: web.Request) -> web.Response:
     }
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -668,6 +732,7 @@ async def handle_record_signal(request: web.Request) -> web.Response:
             {"error": f"Unknown signal type: {signal_type}"},
             status=400
         )
+    await _save_session(session)
 
     return web.json_response({"recorded": True})
 
@@ -681,7 +746,7 @@ async def handle_get_events(request: web.Request) -> web.Response:
     GET /api/sessions/{session_id}/events?type=barge_in
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -706,7 +771,7 @@ async def handle_debug_session(request: web.Request) -> web.Response:
     Returns comprehensive buffer state, token usage, and diagnostic info.
     """
     session_id = request.match_info["session_id"]
-    session = _session_manager.get_session(session_id)
+    session = await _session_manager.get_session_async(session_id)
 
     if not session:
         return web.json_response(
@@ -822,7 +887,7 @@ async def handle_fov_health(request: web.Request) -> web.Response:
 
     Returns overall health and status of the FOV context system.
     """
-    sessions = _session_manager.list_sessions()
+    sessions = await _session_manager.list_sessions_async()
     active_sessions = [s for s in sessions if s.get("state") == "active"]
     paused_sessions = [s for s in sessions if s.get("state") == "paused"]
 
@@ -841,3 +906,20 @@ async def handle_fov_health(request: web.Request) -> web.Response:
             "model_tiers": ["CLOUD", "MID_RANGE", "ON_DEVICE", "TINY"]
         }
     })
+
+
+async def handle_fov_memory(request: web.Request) -> web.Response:
+    """
+    Get approximate memory held by sessions.
+
+    GET /api/fov/memory?top=20
+
+    Returns resident and spilled session counts, total and per-session
+    bytes for the largest sessions, and the eviction limits in force.
+    """
+    try:
+        top = int(request.query.get("top", 20))
+    except ValueError:
+        return web.json_response({"error": "top must be an integer"}, status=400)
+
+    return web.json_response(_session_manager.memory_stats(top=max(0, top)))
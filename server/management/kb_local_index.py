@@ -0,0 +1,237 @@
+"""
+KB Local Index - Indexed view of the file-backed Knowledge Bowl store.
+
+The JSON files under data/kb_packs stay the source of truth. This index
+is an in-memory SQLite database built from their parsed contents so
+question filtering, text search and pack statistics don't walk the
+whole corpus on every request.
+
+Each source (questions store, packs registry) is re-indexed only when
+that source changes. Text search uses an FTS5 trigram index over
+lowercased text, which matches exactly the substrings Python's `in`
+would; SQLite builds without FTS5 fall back to instr() scans.
+"""
+
+import logging
+import sqlite3
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Minimum search length the trigram index can answer
+_TRIGRAM = 3
+
+
+def _scalar(value: Any) -> Any:
+    """Internal: A value SQLite can store and compare like Python does, else None."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (str, int, float)):
+        return value
+    return None
+
+
+def _lower(value: Any) -> str:
+    return value.lower() if isinstance(value, str) else ""
+
+
+class KBLocalIndex:
+    """Indexes a questions store and packs registry for filtered queries.
+
+    Questions keep their store order (their position in the store's
+    "questions" mapping), so results match a linear scan of the store.
+    """
+
+    def __init__(self):
+        self._conn = sqlite3.connect(":memory:")
+        self._conn.executescript(
+            """
+            CREATE TABLE questions (
+                ord INTEGER PRIMARY KEY,
+                id, domain_id, subcategory, difficulty, question_type,
+                has_audio, status,
+                question_lower TEXT, answer_lower TEXT
+            );
+            CREATE INDEX idx_questions_id ON questions(id);
+            CREATE INDEX idx_questions_domain ON questions(domain_id, subcategory);
+            CREATE INDEX idx_questions_difficulty ON questions(difficulty);
+            CREATE INDEX idx_questions_status ON questions(status);
+            CREATE TABLE memberships (pack_id, question_id);
+            CREATE INDEX idx_memberships_pack ON memberships(pack_id);
+            """
+        )
+        try:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE question_text USING fts5("
+                " question_lower, answer_lower,"
+                " content='questions', content_rowid='ord',"
+                " tokenize='trigram case_sensitive 1')"
+            )
+            self.fts = True
+        except sqlite3.OperationalError:
+            logger.info("SQLite FTS5 trigram tokenizer unavailable, KB search will scan")
+            self.fts = False
+
+        self._questions: list[dict] = []
+        self._questions_source: Optional[dict] = None
+        self._questions_version: Any = None
+        self._registry_source: Optional[dict] = None
+        self._registry_version: Any = None
+        self._packs: dict[str, dict] = {}
+        self._pack_cache: dict[tuple, tuple] = {}
+
+    # --- Sync ---
+
+    def sync(
+        self,
+        registry: dict,
+        registry_version: Any,
+        questions_store: dict,
+        questions_version: Any,
+    ) -> None:
+        """Re-index whichever source changed.
+
+        A source counts as changed if it is a different object or its
+        version differs; callers bump the version after changing a
+        source in place. The index keeps a reference to each source,
+        so an object identity can't be reused while indexed.
+        """
+        questions_changed = (
+            questions_store is not self._questions_source
+            or questions_version != self._questions_version
+        )
+        registry_changed = (
+            registry is not self._registry_source
+            or registry_version != self._registry_version
+        )
+        if questions_changed:
+            self._index_questions(questions_store)
+            self._questions_source = questions_store
+            self._questions_version = questions_version
+        if registry_changed:
+            self._index_registry(registry)
+            self._registry_source = registry
+            self._registry_version = registry_version
+        if questions_changed or registry_changed:
+            self._pack_cache.clear()
+
+    def _index_questions(self, questions_store: dict) -> None:
+        """Internal: Replace the indexed questions."""
+        self._questions = list(questions_store.get("questions", {}).values())
+        rows = (
+            (
+                ord,
+                _scalar(q.get("id")),
+                _scalar(q.get("domain_id")),
+                _scalar(q.get("subcategory")),
+                _scalar(q.get("difficulty")),
+                _scalar(q.get("question_type")),
+                1 if q.get("has_audio", False) else 0,
+                _scalar(q.get("status")),
+                _lower(q.get("question_text", "")),
+                _lower(q.get("answer_text", "")),
+            )
+            for ord, q in enumerate(self._questions)
+        )
+        with self._conn:
+            self._conn.execute("DELETE FROM questions")
+            self._conn.executemany("INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            if self.fts:
+                self._conn.execute("INSERT INTO question_text(question_text) VALUES ('rebuild')")
+
+    def _index_registry(self, registry: dict) -> None:
+        """Internal: Replace the indexed pack memberships."""
+        # The first pack with an ID wins, as in a linear scan
+        self._packs = {}
+        for pack in registry.get("packs", []):
+            self._packs.setdefault(pack["id"], pack)
+        rows = (
+            (pack_id, _scalar(qid))
+            for pack_id, pack in self._packs.items()
+            for qid in pack.get("question_ids", [])
+        )
+        with self._conn:
+            self._conn.execute("DELETE FROM memberships")
+            self._conn.executemany("INSERT INTO memberships VALUES (?, ?)", rows)
+
+    # --- Queries ---
+
+    def query_questions(
+        self,
+        pack_id: Optional[str] = None,
+        domain_id: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        difficulties: Optional[list[int]] = None,
+        question_type: Optional[str] = None,
+        has_audio: Optional[bool] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[dict], int]:
+        """Filter questions in store order and return one page and the total.
+
+        Filters behave as the linear scan in /api/kb/questions did: a
+        pack_id that matches no pack is ignored, and search is a
+        substring of the lowercased question or answer text.
+        """
+        conditions = ["TRUE"]
+        params: list[Any] = []
+
+        if pack_id and pack_id in self._packs:
+            conditions.append("q.id IN (SELECT question_id FROM memberships WHERE pack_id = ?)")
+            params.append(pack_id)
+        for column, value in (
+            ("domain_id", domain_id),
+            ("subcategory", subcategory),
+            ("question_type", question_type),
+            ("status", status),
+        ):
+            if value:
+                conditions.append(f"q.{column} = ?")
+                params.append(value)
+        if difficulties:
+            conditions.append(f"q.difficulty IN ({', '.join('?' * len(difficulties))})")
+            params.extend(difficulties)
+        if has_audio is not None:
+            conditions.append("q.has_audio = ?")
+            params.append(1 if has_audio else 0)
+        if search:
+            if self.fts and len(search) >= _TRIGRAM:
+                conditions.append("q.ord IN (SELECT rowid FROM question_text WHERE question_text MATCH ?)")
+                params.append('"' + search.replace('"', '""') + '"')
+            else:
+                conditions.append("(instr(q.question_lower, ?) > 0 OR instr(q.answer_lower, ?) > 0)")
+                params.extend([search, search])
+
+        where = " AND ".join(conditions)
+        if limit >= 0 and offset >= 0:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM questions q WHERE {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT q.ord FROM questions q WHERE {where} ORDER BY q.ord LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
+            return [self._questions[row[0]] for row in rows], total
+
+        # Negative bounds: keep Python slice semantics
+        rows = self._conn.execute(f"SELECT q.ord FROM questions q WHERE {where} ORDER BY q.ord", params).fetchall()
+        matches = [self._questions[row[0]] for row in rows]
+        return matches[offset : offset + limit], len(matches)
+
+    def pack_summary(self, pack: dict, compute: Callable[[dict, dict], Any]) -> Any:
+        """Memoize compute(pack, questions_store) until either source changes.
+
+        Args:
+            pack: A pack from the indexed registry
+            compute: Module-level function such as calculate_pack_stats
+
+        Returns:
+            The computed value, cached per pack and function
+        """
+        key = (pack.get("id"), compute)
+        cached = self._pack_cache.get(key)
+        if cached is not None and cached[0] is pack:
+            return cached[1]
+        value = compute(pack, self._questions_source)
+        self._pack_cache[key] = (pack, value)
+        return value
@@ -10,6 +10,7 @@ Provides endpoints for managing question packs:
 - POST /api/kb/packs/{pack_id}/questions - Add questions to pack
 - DELETE /api/kb/packs/{pack_id}/questions/{question_id} - Remove question from pack
 - POST /api/kb/packs/bundle - Create a bundle from multiple packs
+- POST /api/kb/packs/preview-dedup - Preview exact and near-duplicates
 
 Question management:
 - GET /api/kb/questions - List questions (with filters)
@@ -20,18 +21,25 @@ Question management:
 - POST /api/kb/questions/bulk-update - Bulk update questions
 """
 
+import copy
 import json
 import logging
+import os
 import re
+import sys
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from aiohttp import web
 
+from kb_local_index import KBLocalIndex
 from modules_api import load_module_content
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from importers.core.near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -90,60 +98,161 @@ def get_questions_store_path() -> Path:
     return PACKS_DIR / "questions.json"
 
 
-def load_packs_registry() -> dict[str, Any]:
-    """Load the packs registry from disk."""
-    registry_path = get_packs_registry_path()
-    if not registry_path.exists():
-        return {"packs": [], "version": "1.0.0"}
+# Parsed JSON files, reused while the file is unchanged:
+# path -> ((inode, mtime_ns, size), data)
+_json_cache: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+# Bumped whenever a cached file's data is replaced or saved
+_json_versions: dict[Path, int] = {}
+
+_local_index = KBLocalIndex()
+
+# MinHash signatures of the questions store, and the (store, version)
+# they were last synced to
+_near_duplicates = NearDuplicateIndex()
+_near_duplicates_synced: tuple[Any, Any] = (None, None)
 
+
+def _file_signature(path: Path) -> Optional[tuple[int, int, int]]:
+    """Internal: Identity of a file's current contents, or None if unknown."""
     try:
-        with open(registry_path, encoding="utf-8") as f:
-            return json.load(f)
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _load_json_file(
+    path: Path,
+    default: dict[str, Any],
+    label: str,
+    for_update: bool = False,
+) -> dict[str, Any]:
+    """Internal: Load a JSON file, parsing it again only when it changed.
+
+    The returned data is shared between callers until the file changes
+    and must not be modified; callers that modify it pass for_update to
+    get their own copy, so changes they don't save never leak into it.
+    """
+    if not path.exists():
+        _json_cache.pop(path, None)
+        return default
+
+    signature = _file_signature(path)
+    cached = _json_cache.get(path)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1]) if for_update else cached[1]
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
     except Exception as e:
-        logger.error(f"Failed to load packs registry: {e}")
-        return {"packs": [], "version": "1.0.0"}
+        logger.error(f"Failed to load {label}: {e}")
+        return default
 
+    if signature is not None:
+        _json_cache[path] = (signature, data)
+        _json_versions[path] = _json_versions.get(path, 0) + 1
+        if for_update:
+            return copy.deepcopy(data)
+    return data
 
-def save_packs_registry(registry: dict[str, Any]):
-    """Save the packs registry to disk."""
+
+def _save_json_file(path: Path, data: dict[str, Any]) -> None:
+    """Internal: Write a JSON file atomically and keep it cached.
+
+    Raises:
+        OSError, TypeError: If the data can't be written
+    """
     ensure_packs_directory()
-    registry_path = get_packs_registry_path()
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    _json_cache.pop(path, None)
+    _json_versions[path] = _json_versions.get(path, 0) + 1
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+    signature = _file_signature(path)
+    if signature is not None:
+        _json_cache[path] = (signature, data)
 
+
+def load_packs_registry(for_update: bool = False) -> dict[str, Any]:
+    """Load the packs registry from disk (cached while unchanged).
+
+    Pass for_update to get a copy that is safe to modify.
+    """
+    return _load_json_file(
+        get_packs_registry_path(), {"packs": [], "version": "1.0.0"}, "packs registry", for_update
+    )
+
+
+def save_packs_registry(registry: dict[str, Any]):
+    """Save the packs registry to disk."""
     try:
-        with open(registry_path, "w", encoding="utf-8") as f:
-            json.dump(registry, f, indent=2)
+        _save_json_file(get_packs_registry_path(), registry)
         logger.info(f"Saved packs registry with {len(registry.get('packs', []))} packs")
     except Exception as e:
         logger.error(f"Failed to save packs registry: {e}")
 
 
-def load_questions_store() -> dict[str, Any]:
-    """Load the questions store from disk."""
-    store_path = get_questions_store_path()
-    if not store_path.exists():
-        return {"questions": {}, "version": "1.0.0"}
+def load_questions_store(for_update: bool = False) -> dict[str, Any]:
+    """Load the questions store from disk (cached while unchanged).
 
-    try:
-        with open(store_path, encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Failed to load questions store: {e}")
-        return {"questions": {}, "version": "1.0.0"}
+    Pass for_update to get a copy that is safe to modify.
+    """
+    return _load_json_file(
+        get_questions_store_path(), {"questions": {}, "version": "1.0.0"}, "questions store", for_update
+    )
 
 
 def save_questions_store(store: dict[str, Any]):
     """Save the questions store to disk."""
-    ensure_packs_directory()
-    store_path = get_questions_store_path()
-
     try:
-        with open(store_path, "w", encoding="utf-8") as f:
-            json.dump(store, f, indent=2)
+        _save_json_file(get_questions_store_path(), store)
         logger.info(f"Saved questions store with {len(store.get('questions', {}))} questions")
     except Exception as e:
         logger.error(f"Failed to save questions store: {e}")
 
 
+def get_local_index(registry: dict[str, Any], questions_store: dict[str, Any]) -> KBLocalIndex:
+    """Get the local index, synced to the given registry and store."""
+    _local_index.sync(
+        registry,
+        _json_versions.get(get_packs_registry_path()),
+        questions_store,
+        _json_versions.get(get_questions_store_path()),
+    )
+    return _local_index
+
+
+def get_near_duplicate_index(questions_store: dict[str, Any]) -> NearDuplicateIndex:
+    """Get the near-duplicate index, synced to the given questions store.
+
+    Only questions added or edited since the last sync are re-signed.
+    """
+    global _near_duplicates_synced
+    version = _json_versions.get(get_questions_store_path())
+    source, synced_version = _near_duplicates_synced
+    if questions_store is not source or version != synced_version:
+        questions = questions_store.get("questions", {})
+        for qid, q in questions.items():
+            _near_duplicates.add(qid, q.get("question_text", ""), q.get("answer_text", ""))
+        _near_duplicates.retain(questions)
+        _near_duplicates_synced = (questions_store, version)
+    return _near_duplicates
+
+
+def parse_similarity_threshold(value: Any) -> float:
+    """Validate a near-duplicate similarity threshold from a request body.
+
+    Raises:
+        ValueError: If the value isn't a number in (0, 1]
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 < value <= 1:
+        raise ValueError("similarity_threshold must be a number in (0, 1]")
+    return float(value)
+
+
 def generate_pack_id() -> str:
     """Generate a unique pack ID."""
     return f"pack-{uuid.uuid4().hex[:8]}"
@@ -267,6 +376,7 @@ async def handle_list_packs(request: web.Request) -> web.Response:
     try:
         registry = load_packs_registry()
         questions_store = load_questions_store()
+        index = get_local_index(registry, questions_store)
 
         # Parse query params
         pack_type = request.query.get("type")
@@ -296,7 +406,7 @@ async def handle_list_packs(request: web.Request) -> web.Response:
                     continue
 
             # Calculate stats
-            stats = calculate_pack_stats(pack, questions_store)
+            stats = index.pack_summary(pack, calculate_pack_stats)
 
             filtered.append(
                 {
@@ -375,7 +485,7 @@ async def handle_create_pack(request: web.Request) -> web.Response:
                 {"success": False, "error": f"Invalid status. Valid: {VALID_STATUSES}"}, status=400
             )
 
-        registry = load_packs_registry()
+        registry = load_packs_registry(for_update=True)
         now = datetime.now(timezone.utc).isoformat()
 
         pack = {
@@ -431,11 +541,13 @@ async def handle_get_pack(request: web.Request) -> web.Response:
         if not pack:
             return web.json_response({"success": False, "error": f"Pack not found: {pack_id}"}, status=404)
 
+        index = get_local_index(registry, questions_store)
+
         # Calculate stats
-        stats = calculate_pack_stats(pack, questions_store)
+        stats = index.pack_summary(pack, calculate_pack_stats)
 
         # Get domain groups
-        domain_groups = get_domain_groups(pack, questions_store)
+        domain_groups = index.pack_summary(pack, get_domain_groups)
 
         response = {
             "success": True,
@@ -465,7 +577,7 @@ async def handle_update_pack(request: web.Request) -> web.Response:
 
     try:
         data = await request.json()
-        registry = load_packs_registry()
+        registry = load_packs_registry(for_update=True)
 
         # Find pack
         pack_idx = None
@@ -530,7 +642,7 @@ async def handle_delete_pack(request: web.Request) -> web.Response:
         return web.json_response({"success": False, "error": f"Invalid pack_id: {pack_id}"}, status=400)
 
     try:
-        registry = load_packs_registry()
+        registry = load_packs_registry(for_update=True)
 
         # Find pack
         pack = None
@@ -581,8 +693,8 @@ async def handle_add_questions_to_pack(request: web.Request) -> web.Response:
         if not question_ids:
             return web.json_response({"success": False, "error": "No question_ids provided"}, status=400)
 
-        registry = load_packs_registry()
-        questions_store = load_questions_store()
+        registry = load_packs_registry(for_update=True)
+        questions_store = load_questions_store(for_update=True)
 
         # Find pack
         pack_idx = None
@@ -654,8 +766,8 @@ async def handle_remove_question_from_pack(request: web.Request) -> web.Response
         return web.json_response({"success": False, "error": f"Invalid question_id: {question_id}"}, status=400)
 
     try:
-        registry = load_packs_registry()
-        questions_store = load_questions_store()
+        registry = load_packs_registry(for_update=True)
+        questions_store = load_questions_store(for_update=True)
 
         # Find pack
         pack_idx = None
@@ -711,6 +823,7 @@ async def handle_create_bundle(request: web.Request) -> web.Response:
         "source_pack_ids": ["pack1", "pack2"],
         "is_reference_bundle": false,
         "deduplication_strategy": "keep_first",
+        "similarity_threshold": 0.8,  // optional, also skip near-duplicates with keep_first
         "excluded_question_ids": [],
         "difficulty_tier": "varsity"
     }
@@ -726,8 +839,15 @@ async def handle_create_bundle(request: web.Request) -> web.Response:
         if not source_pack_ids:
             return web.json_response({"success": False, "error": "No source_pack_ids provided"}, status=400)
 
-        registry = load_packs_registry()
-        questions_store = load_questions_store()
+        similarity_threshold = None
+        if data.get("similarity_threshold") is not None:
+            try:
+                similarity_threshold = parse_similarity_threshold(data["similarity_threshold"])
+            except ValueError as e:
+                return web.json_response({"success": False, "error": str(e)}, status=400)
+
+        registry = load_packs_registry(for_update=True)
+        questions_store = load_questions_store(for_update=True)
 
         # Validate source packs exist
         pack_map = {p["id"]: p for p in registry.get("packs", [])}
@@ -739,11 +859,18 @@ async def handle_create_bundle(request: web.Request) -> web.Response:
 
         # Collect all question IDs from source packs
         all_question_ids = []
+        added_ids: set[str] = set()
         seen_questions: dict[str, str] = {}  # question_text -> first question_id
         duplicates = []
         dedup_strategy = data.get("deduplication_strategy", "keep_first")
         excluded_ids = set(data.get("excluded_question_ids", []))
 
+        # Near-duplicates of questions already kept, reusing the store's signatures
+        near_index = kept_index = None
+        if dedup_strategy == "keep_first" and similarity_threshold is not None:
+            near_index = get_near_duplicate_index(questions_store)
+            kept_index = near_index.subset([], threshold=similarity_threshold)
+
         for pack_id in source_pack_ids:
             pack = pack_map[pack_id]
             for qid in pack.get("question_ids", []):
@@ -760,9 +887,21 @@ async def handle_create_bundle(request: web.Request) -> web.Response:
                     if q_text in seen_questions:
                         duplicates.append({"question_id": qid, "duplicate_of": seen_questions[q_text]})
                         continue
+
+                    signature = near_index.get_signature(qid) if near_index else None
+                    if signature is not None:
+                        matches = kept_index.query_signature(signature)
+                        if matches:
+                            duplicate_of, similarity = matches[0]
+                            duplicates.append(
+                                {"question_id": qid, "duplicate_of": duplicate_of, "similarity": round(similarity, 3)}
+                            )
+                            continue
+                        kept_index.add_signature(qid, signature)
                     seen_questions[q_text] = qid
 
-                if qid not in all_question_ids:
+                if qid not in added_ids:
+                    added_ids.add(qid)
                     all_question_ids.append(qid)
 
         # Validate difficulty tier
@@ -825,11 +964,14 @@ async def handle_create_bundle(request: web.Request) -> web.Response:
 async def handle_preview_deduplication(request: web.Request) -> web.Response:
     """POST /api/kb/packs/preview-dedup
 
-    Preview duplicates before creating a bundle.
+    Preview duplicates before creating a bundle. Exact duplicates share
+    the same question text; near-duplicate groups link distinct texts
+    whose estimated similarity reaches the threshold.
 
     Request body:
     {
-        "source_pack_ids": ["pack1", "pack2"]
+        "source_pack_ids": ["pack1", "pack2"],
+        "similarity_threshold": 0.7  // optional
     }
     """
     try:
@@ -839,6 +981,11 @@ async def handle_preview_deduplication(request: web.Request) -> web.Response:
         if not source_pack_ids:
             return web.json_response({"success": False, "error": "No source_pack_ids provided"}, status=400)
 
+        try:
+            similarity_threshold = parse_similarity_threshold(data.get("similarity_threshold", DEFAULT_THRESHOLD))
+        except ValueError as e:
+            return web.json_response({"success": False, "error": str(e)}, status=400)
+
         registry = load_packs_registry()
         questions_store = load_questions_store()
 
@@ -873,12 +1020,34 @@ async def handle_preview_deduplication(request: web.Request) -> web.Response:
                 duplicate_groups.append({"question_text": q_text[:100] + "..." if len(q_text) > 100 else q_text, "occurrences": occurrences})
                 total_duplicates += len(occurrences) - 1
 
+        # Near-duplicates among the distinct texts, by their first occurrence
+        first_occurrences = {occurrences[0]["question_id"]: occurrences[0] for occurrences in text_to_occurrences.values()}
+        near_index = get_near_duplicate_index(questions_store).subset(first_occurrences, threshold=similarity_threshold)
+        near_duplicate_groups = []
+        total_near_duplicates = 0
+        for cluster in near_index.clusters():
+            members = []
+            for qid, similarity in cluster.members:
+                q_text = questions_store["questions"][qid].get("question_text", "")
+                members.append(
+                    {
+                        **first_occurrences[qid],
+                        "question_text": q_text[:100] + "..." if len(q_text) > 100 else q_text,
+                        "similarity": round(similarity, 3),
+                    }
+                )
+            near_duplicate_groups.append({"question_text": members[0]["question_text"], "members": members})
+            total_near_duplicates += len(cluster.members) - 1
+
         return web.json_response(
             {
                 "success": True,
                 "duplicate_groups": duplicate_groups[:50],  # Limit to 50 groups
                 "total_duplicates": total_duplicates,
                 "unique_questions_after_dedup": unique_after_dedup,
+                "near_duplicate_groups": near_duplicate_groups[:50],
+                "total_near_duplicates": total_near_duplicates,
+                "similarity_threshold": similarity_threshold,
             }
         )
 
@@ -908,6 +1077,8 @@ async def handle_list_questions(request: web.Request) -> web.Response:
     - search: Search in question/answer text
     - limit: Max results (default 20)
     - offset: Pagination offset
+    - cursor: Continue after a previous page (next_cursor from its response;
+      database only, replaces offset)
     """
     try:
         # Parse query params
@@ -933,18 +1104,27 @@ async def handle_list_questions(request: web.Request) -> web.Response:
         # Try database first
         repo = get_kb_repo(request)
         if repo:
-            questions, total = await repo.list_questions(
-                pack_id=pack_id,
-                domain_id=domain_id,
-                subcategory=subcategory,
-                difficulties=difficulties,
-                question_type=question_type,
-                has_audio=has_audio,
-                status=status,
-                search=search,
-                limit=limit,
-                offset=offset,
-            )
+            filters = {
+                "pack_id": pack_id,
+                "domain_id": domain_id,
+                "subcategory": subcategory,
+                "difficulties": difficulties,
+                "question_type": question_type,
+                "has_audio": has_audio,
+                "status": status,
+                "search": search,
+            }
+            try:
+                questions, total = await repo.list_questions(
+                    **filters,
+                    limit=limit,
+                    offset=offset,
+                    cursor=request.query.get("cursor"),
+                )
+            except ValueError:
+                return web.json_response({"success": False, "error": "Invalid cursor"}, status=400)
+            facets = await repo.get_question_facets(**filters)
+            next_cursor = repo.encode_question_cursor(questions[-1]) if len(questions) == limit else None
             return web.json_response(
                 {
                     "success": True,
@@ -952,58 +1132,27 @@ async def handle_list_questions(request: web.Request) -> web.Response:
                     "total": total,
                     "limit": limit,
                     "offset": offset,
+                    "next_cursor": next_cursor,
+                    "facets": facets,
                     "source": "database",
                 }
             )
 
-        # Fallback to JSON store
+        # Fallback to JSON store, queried through the local index
         questions_store = load_questions_store()
         registry = load_packs_registry()
-
-        # Get questions to filter
-        all_questions = list(questions_store.get("questions", {}).values())
-
-        # If pack_id specified, filter to that pack's questions
-        if pack_id:
-            pack = None
-            for p in registry.get("packs", []):
-                if p["id"] == pack_id:
-                    pack = p
-                    break
-            if pack:
-                pack_question_ids = set(pack.get("question_ids", []))
-                all_questions = [q for q in all_questions if q.get("id") in pack_question_ids]
-
-        # Apply filters
-        filtered = []
-        for q in all_questions:
-            if domain_id and q.get("domain_id") != domain_id:
-                continue
-            if subcategory and q.get("subcategory") != subcategory:
-                continue
-            if difficulties and q.get("difficulty") not in difficulties:
-                continue
-            if question_type and q.get("question_type") != question_type:
-                continue
-            if has_audio is not None:
-                q_has_audio = q.get("has_audio", False)
-                if has_audio and not q_has_audio:
-                    continue
-                if not has_audio and q_has_audio:
-                    continue
-            if status and q.get("status") != status:
-                continue
-            if search:
-                q_text = q.get("question_text", "").lower()
-                a_text = q.get("answer_text", "").lower()
-                if search not in q_text and search not in a_text:
-                    continue
-
-            filtered.append(q)
-
-        # Paginate
-        total = len(filtered)
-        paginated = filtered[offset : offset + limit]
+        paginated, total = get_local_index(registry, questions_store).query_questions(
+            pack_id=pack_id,
+            domain_id=domain_id,
+            subcategory=subcategory,
+            difficulties=difficulties,
+            question_type=question_type,
+            has_audio=has_audio,
+            status=status,
+            search=search,
+            limit=limit,
+            offset=offset,
+        )
 
         return web.json_response(
             {
@@ -1074,8 +1223,8 @@ async def handle_create_question(request: web.Request) -> web.Response:
                 {"success": False, "error": f"Invalid question_source. Valid: {VALID_QUESTION_SOURCES}"}, status=400
             )
 
-        questions_store = load_questions_store()
-        registry = load_packs_registry()
+        questions_store = load_questions_store(for_update=True)
+        registry = load_packs_registry(for_update=True)
 
         now = datetime.now(timezone.utc).isoformat()
         question_id = generate_question_id(data["domain_id"], data.get("subcategory", "general"))
@@ -1103,6 +1252,14 @@ async def handle_create_question(request: web.Request) -> web.Response:
             "updated_at": now,
         }
 
+        # Warn about existing questions this one nearly duplicates
+        near_duplicates = [
+            {"question_id": qid, "similarity": round(similarity, 3)}
+            for qid, similarity in get_near_duplicate_index(questions_store).query(
+                question["question_text"], question["answer_text"]
+            )[:5]
+        ]
+
         if "questions" not in questions_store:
             questions_store["questions"] = {}
         questions_store["questions"][question_id] = question
@@ -1123,7 +1280,7 @@ async def handle_create_question(request: web.Request) -> web.Response:
 
         logger.info(f"Created question: {question_id}")
 
-        return web.json_response({"success": True, "question": question})
+        return web.json_response({"success": True, "question": question, "near_duplicates": near_duplicates})
 
     except json.JSONDecodeError:
         return web.json_response({"success": False, "error": "Invalid JSON"}, status=400)
@@ -1168,7 +1325,7 @@ async def handle_update_question(request: web.Request) -> web.Response:
 
     try:
         data = await request.json()
-        questions_store = load_questions_store()
+        questions_store = load_questions_store(for_update=True)
 
         question = questions_store.get("questions", {}).get(question_id)
         if not question:
@@ -1236,8 +1393,8 @@ async def handle_delete_question(request: web.Request) -> web.Response:
         return web.json_response({"success": False, "error": f"Invalid question_id: {question_id}"}, status=400)
 
     try:
-        questions_store = load_questions_store()
-        registry = load_packs_registry()
+        questions_store = load_questions_store(for_update=True)
+        registry = load_packs_registry(for_update=True)
 
         question = questions_store.get("questions", {}).get(question_id)
         if not question:
@@ -1289,7 +1446,7 @@ async def handle_bulk_update_questions(request: web.Request) -> web.Response:
         if not updates:
             return web.json_response({"success": False, "error": "No updates provided"}, status=400)
 
-        questions_store = load_questions_store()
+        questions_store = load_questions_store(for_update=True)
 
         # Validate updates
         if "difficulty" in updates and not (1 <= updates["difficulty"] <= 5):
@@ -1361,8 +1518,8 @@ async def handle_import_from_module(request: web.Request) -> web.Response:
         if not module_content:
             return web.json_response({"success": False, "error": "Knowledge Bowl module not found"}, status=404)
 
-        registry = load_packs_registry()
-        questions_store = load_questions_store()
+        registry = load_packs_registry(for_update=True)
+        questions_store = load_questions_store(for_update=True)
 
         # Find pack
         pack_idx = None
@@ -1383,6 +1540,8 @@ async def handle_import_from_module(request: web.Request) -> web.Response:
         # Import questions
         imported_count = 0
         skipped_count = 0
+        near_duplicates = []
+        near_index = get_near_duplicate_index(questions_store)
         now = datetime.now(timezone.utc).isoformat()
 
         for domain in module_content.get("domains", []):
@@ -1432,6 +1591,14 @@ async def handle_import_from_module(request: web.Request) -> web.Response:
                     "updated_at": now,
                 }
 
+                # Warn about near-duplicates of stored or just-imported questions
+                matches = near_index.add_checked(question_id, question["question_text"], question["answer_text"])
+                if matches:
+                    similar_to, similarity = matches[0]
+                    near_duplicates.append(
+                        {"question_id": question_id, "similar_to": similar_to, "similarity": round(similarity, 3)}
+                    )
+
                 questions_store.setdefault("questions", {})[question_id] = question
                 pack.setdefault("question_ids", []).append(question_id)
                 imported_count += 1
@@ -1448,6 +1615,8 @@ async def handle_import_from_module(request: web.Request) -> web.Response:
                 "success": True,
                 "imported_count": imported_count,
                 "skipped_count": skipped_count,
+                "near_duplicate_count": len(near_duplicates),
+                "near_duplicates": near_duplicates[:20],  # Limit to first 20
             }
         )
 
@@ -1681,14 +1850,9 @@ async def handle_sync_to_database(request: web.Request) -> web.Response:
         importer_count = len(questions_to_import) - module_count
         logger.info(f"Loaded {importer_count} additional questions from importers")
 
-        # Import all questions in batches
-        batch_size = 1000
-        total_imported = 0
-        for i in range(0, len(questions_to_import), batch_size):
-            batch = questions_to_import[i : i + batch_size]
-            imported = await repo.import_questions_bulk(batch)
-            total_imported += imported
-            logger.info(f"Imported batch {i // batch_size + 1}: {imported} questions")
+        # Import all questions in one staged COPY and upsert
+        counts = await repo.import_questions_staged(questions_to_import)
+        total_imported = counts["inserted"] + counts["updated"]
 
         total_count = await repo.get_question_count()
         domain_counts = await repo.get_domain_question_counts()
@@ -1699,6 +1863,9 @@ async def handle_sync_to_database(request: web.Request) -> web.Response:
             {
                 "success": True,
                 "imported_count": total_imported,
+                "inserted_count": counts["inserted"],
+                "updated_count": counts["updated"],
+                "skipped_count": counts["skipped"],
                 "module_questions": module_count,
                 "importer_questions": importer_count,
                 "total_questions": total_count,
@@ -8,14 +8,33 @@ Provides async database operations for:
 - Statistics and aggregations
 """
 
+import base64
+import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 import asyncpg
 
 logger = logging.getLogger(__name__)
 
+# Temporary table that bulk imports COPY into before merging
+_STAGING_TABLE = "kb_questions_staging"
+_STAGING_COLUMNS = [
+    "ord", "id", "domain_id", "subcategory", "question_text", "answer_text",
+    "acceptable_answers", "difficulty", "difficulty_tier", "speed_target_seconds",
+    "question_type", "question_source", "buzzable", "hints", "explanation",
+    "has_audio", "status",
+]
+
+# Values allowed by the kb_questions CHECK constraints
+_DIFFICULTY_TIERS = {"elementary", "middle_school", "jv", "varsity", "championship", "college"}
+_QUESTION_TYPES = {"toss_up", "bonus", "pyramid", "lightning"}
+_QUESTION_SOURCES = {"naqt", "nsb", "qb_packets", "custom", "ai_generated"}
+_STATUSES = {"active", "draft", "archived"}
+
 
 class KBQuestionsRepository:
     """Repository for Knowledge Bowl questions database operations.
@@ -23,8 +42,14 @@ class KBQuestionsRepository:
     Uses asyncpg connection pool for PostgreSQL access.
     """
 
+    # Question counts and facets are cached per filter for this long
+    FACET_CACHE_TTL_SECONDS = 60.0
+    FACET_CACHE_MAX_ENTRIES = 256
+
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
+        self._facet_cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._facet_generation = 0
 
     # =========================================================================
     # DOMAIN OPERATIONS
@@ -99,6 +124,7 @@ class KBQuestionsRepository:
                 now,
                 now,
             )
+            self.invalidate_facets()
             logger.info(f"Created question: {question['id']}")
             return await self.get_question(question["id"])
 
@@ -130,85 +156,179 @@ class KBQuestionsRepository:
         search: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> tuple[list[dict], int]:
-        """List questions with optional filtering."""
-        async with self.pool.acquire() as conn:
-            # Build query conditions
-            conditions = []
-            params: list[Any] = []
-            param_idx = 1
-
-            # Join with pack_questions if filtering by pack
-            if pack_id:
-                join_clause = "JOIN kb_pack_questions pq ON q.id = pq.question_id"
-                conditions.append(f"pq.pack_id = ${param_idx}")
-                params.append(pack_id)
-                param_idx += 1
-            else:
-                join_clause = ""
-
-            if domain_id:
-                conditions.append(f"q.domain_id = ${param_idx}")
-                params.append(domain_id)
-                param_idx += 1
-
-            if subcategory:
-                conditions.append(f"q.subcategory = ${param_idx}")
-                params.append(subcategory)
-                param_idx += 1
-
-            if difficulties:
-                conditions.append(f"q.difficulty = ANY(${param_idx})")
-                params.append(difficulties)
-                param_idx += 1
-
-            if question_type:
-                conditions.append(f"q.question_type = ${param_idx}")
-                params.append(question_type)
-                param_idx += 1
+        """List questions with optional filtering.
+
+        Questions are ordered newest first, ties broken by ID. A cursor
+        from encode_question_cursor() on the previous page's last question
+        continues after it with an index range scan, so every page costs
+        the same; offset is ignored when a cursor is given. The total is
+        cached per filter (see get_question_facets).
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        filters = (pack_id, domain_id, subcategory, difficulties, question_type, has_audio, status, search)
+        conditions, params = self._question_filters(*filters)
+        total = await self._cached(
+            ("count", *self._filter_key(*filters)),
+            lambda conn: conn.fetchval(
+                f"SELECT COUNT(*) FROM kb_questions q WHERE {' AND '.join(conditions)}",
+                *params,
+            ),
+        )
+
+        if cursor:
+            created_at, question_id = _decode_question_cursor(cursor)
+            conditions.append(f"(q.created_at, q.id) < (${len(params) + 1}, ${len(params) + 2})")
+            params.extend([created_at, question_id])
+            page_clause = f"LIMIT ${len(params) + 1}"
+            params.append(limit)
+        else:
+            page_clause = f"LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}"
+            params.extend([limit, offset])
 
-            if has_audio is not None:
-                conditions.append(f"q.has_audio = ${param_idx}")
-                params.append(has_audio)
-                param_idx += 1
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT q.*, d.name as domain_name, d.icon_name as domain_icon
+                FROM kb_questions q
+                JOIN kb_domains d ON q.domain_id = d.id
+                WHERE {' AND '.join(conditions)}
+                ORDER BY q.created_at DESC, q.id DESC
+                {page_clause}
+                """,
+                *params,
+            )
+            questions = [self._row_to_question(row) for row in rows]
 
-            if status:
-                conditions.append(f"q.status = ${param_idx}")
-                params.append(status)
-                param_idx += 1
+            return questions, total
 
-            if search:
-                conditions.append(f"q.search_vector @@ plainto_tsquery('english', ${param_idx})")
-                params.append(search)
-                param_idx += 1
+    async def get_question_facets(
+        self,
+        pack_id: Optional[str] = None,
+        domain_id: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        difficulties: Optional[list[int]] = None,
+        question_type: Optional[str] = None,
+        has_audio: Optional[bool] = None,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> dict[str, dict]:
+        """Count matching questions per domain, difficulty and status.
 
-            where_clause = " AND ".join(conditions) if conditions else "TRUE"
+        Counts are cached per filter for FACET_CACHE_TTL_SECONDS and
+        dropped whenever this repository writes questions or packs; the
+        TTL bounds staleness from writes made by other processes.
+        """
+        filters = (pack_id, domain_id, subcategory, difficulties, question_type, has_audio, status, search)
+        conditions, params = self._question_filters(*filters)
 
-            # Get total count
-            count_query = f"""
-                SELECT COUNT(DISTINCT q.id)
-                FROM kb_questions q
-                {join_clause}
-                WHERE {where_clause}
-            """
-            total = await conn.fetchval(count_query, *params)
-
-            # Get questions
-            query = f"""
-                SELECT DISTINCT q.*, d.name as domain_name, d.icon_name as domain_icon
+        async def load(conn: asyncpg.Connection) -> dict[str, dict]:
+            rows = await conn.fetch(
+                f"""
+                SELECT q.domain_id, q.difficulty, q.status, COUNT(*) AS count
                 FROM kb_questions q
-                JOIN kb_domains d ON q.domain_id = d.id
-                {join_clause}
-                WHERE {where_clause}
-                ORDER BY q.created_at DESC
-                LIMIT ${param_idx} OFFSET ${param_idx + 1}
-            """
-            params.extend([limit, offset])
-
-            rows = await conn.fetch(query, *params)
-            questions = [self._row_to_question(row) for row in rows]
+                WHERE {' AND '.join(conditions)}
+                GROUP BY q.domain_id, q.difficulty, q.status
+                """,
+                *params,
+            )
+            facets: dict[str, dict] = {"domain": {}, "difficulty": {}, "status": {}}
+            for row in rows:
+                for facet, column in (("domain", "domain_id"), ("difficulty", "difficulty"), ("status", "status")):
+                    counts = facets[facet]
+                    counts[row[column]] = counts.get(row[column], 0) + row["count"]
+            return facets
+
+        return await self._cached(("facets", *self._filter_key(*filters)), load)
+
+    @staticmethod
+    def _question_filters(
+        pack_id: Optional[str],
+        domain_id: Optional[str],
+        subcategory: Optional[str],
+        difficulties: Optional[list[int]],
+        question_type: Optional[str],
+        has_audio: Optional[bool],
+        status: Optional[str],
+        search: Optional[str],
+    ) -> tuple[list[str], list[Any]]:
+        """Internal: WHERE conditions on kb_questions q, and their parameters."""
+        conditions = ["TRUE"]
+        params: list[Any] = []
+
+        def add(condition: str, value: Any) -> None:
+            params.append(value)
+            conditions.append(condition.format(f"${len(params)}"))
+
+        # EXISTS keeps one row per question, so no DISTINCT is needed
+        if pack_id:
+            add(
+                "EXISTS (SELECT 1 FROM kb_pack_questions pq"
+                " WHERE pq.question_id = q.id AND pq.pack_id = {})",
+                pack_id,
+            )
+        if domain_id:
+            add("q.domain_id = {}", domain_id)
+        if subcategory:
+            add("q.subcategory = {}", subcategory)
+        if difficulties:
+            add("q.difficulty = ANY({})", difficulties)
+        if question_type:
+            add("q.question_type = {}", question_type)
+        if has_audio is not None:
+            add("q.has_audio = {}", has_audio)
+        if status:
+            add("q.status = {}", status)
+        if search:
+            add("q.search_vector @@ plainto_tsquery('english', {})", search)
+
+        return conditions, params
+
+    @staticmethod
+    def _filter_key(*filters: Any) -> tuple:
+        """Internal: Hashable cache key for a set of filters."""
+        return tuple(
+            tuple(sorted(value)) if isinstance(value, list) else value
+            for value in filters
+        )
+
+    async def _cached(self, key: tuple, load: Callable[[asyncpg.Connection], Awaitable[Any]]) -> Any:
+        """Internal: Value from the count/facet cache, loading it on a miss."""
+        now = time.monotonic()
+        entry = self._facet_cache.get(key)
+        if entry is not None and now - entry[0] < self.FACET_CACHE_TTL_SECONDS:
+            self._facet_cache.move_to_end(key)
+            return entry[1]
+
+        generation = self._facet_generation
+        async with self.pool.acquire() as conn:
+            value = await load(conn)
+        # A write during the load may have made the value stale
+        if generation == self._facet_generation:
+            self._facet_cache[key] = (now, value)
+            self._facet_cache.move_to_end(key)
+            while len(self._facet_cache) > self.FACET_CACHE_MAX_ENTRIES:
+                self._facet_cache.popitem(last=False)
+        return value
+
+    @staticmethod
+    def encode_question_cursor(question: dict) -> Optional[str]:
+        """Cursor for the page after a question from list_questions.
+
+        Returns None for a question without a creation time.
+        """
+        if not question.get("created_at"):
+            return None
+        payload = json.dumps([question["created_at"], question["id"]]).encode()
+        return base64.urlsafe_b64encode(payload).decode()
 
-            return questions, total
+    def invalidate_facets(self) -> None:
+        """Drop cached counts and facets after questions or packs change."""
+        self._facet_cache.clear()
+        self._facet_generation += 1
 
     async def update_question(self, question_id: str, updates: dict) -> Optional[dict]:
         """Update a question."""
@@ -242,6 +362,7 @@ class KBQuestionsRepository:
                 f"UPDATE kb_questions SET {', '.join(set_parts)} WHERE id = $1",
                 *params,
             )
+            self.invalidate_facets()
             logger.info(f"Updated question: {question_id}")
             return await self.get_question(question_id)
 
@@ -253,6 +374,7 @@ class KBQuestionsRepository:
             )
             deleted = result.split()[-1] != "0"
             if deleted:
+                self.invalidate_facets()
                 logger.info(f"Deleted question: {question_id}")
             return deleted
 
@@ -284,6 +406,7 @@ class KBQuestionsRepository:
                 *params,
             )
             count = int(result.split()[-1])
+            self.invalidate_facets()
             logger.info(f"Bulk updated {count} questions")
             return count
 
@@ -430,6 +553,7 @@ class KBQuestionsRepository:
             )
             deleted = result.split()[-1] != "0"
             if deleted:
+                self.invalidate_facets()
                 logger.info(f"Deleted pack: {pack_id}")
             return deleted
 
@@ -488,6 +612,7 @@ class KBQuestionsRepository:
                 datetime.now(timezone.utc),
             )
 
+            self.invalidate_facets()
             logger.info(f"Added {added} questions to pack {pack_id}")
             return added
 
@@ -508,6 +633,7 @@ class KBQuestionsRepository:
                     pack_id,
                     datetime.now(timezone.utc),
                 )
+                self.invalidate_facets()
                 logger.info(f"Removed question {question_id} from pack {pack_id}")
             return deleted
 
@@ -597,9 +723,151 @@ class KBQuestionsRepository:
                 except Exception as e:
                     logger.warning(f"Failed to import question {q.get('id')}: {e}")
 
+            self.invalidate_facets()
             logger.info(f"Imported {imported} questions")
             return imported
 
+    async def import_questions_staged(
+        self, questions: list[dict], pack_id: Optional[str] = None
+    ) -> dict[str, int]:
+        """Bulk import questions with COPY and one set-based upsert.
+
+        Questions are copied into a temporary table and merged into
+        kb_questions in a single statement, so the cost is a few round
+        trips regardless of size. Existing questions get the same columns
+        updated as import_questions_bulk, and only when they changed.
+
+        Questions that would violate the table's constraints (missing
+        fields, out-of-range values, unknown domain) are skipped rather
+        than failing the import, as are repeated IDs after the first.
+
+        Args:
+            questions: Question dicts, as for import_questions_bulk
+            pack_id: If given, the imported questions become this pack's
+                members, in import order
+
+        Returns:
+            Counts of questions inserted, updated and skipped (invalid,
+            duplicate or unchanged)
+        """
+        records = []
+        seen_ids: set[str] = set()
+        for q in questions:
+            record = _staging_record(q, len(records))
+            if record is None or record[1] in seen_ids:
+                continue
+            seen_ids.add(record[1])
+            records.append(record)
+
+        counts = {"inserted": 0, "updated": 0, "skipped": len(questions)}
+        if not records:
+            return counts
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"""
+                    CREATE TEMP TABLE {_STAGING_TABLE} (
+                        ord INTEGER, id TEXT, domain_id TEXT, subcategory TEXT,
+                        question_text TEXT, answer_text TEXT, acceptable_answers TEXT[],
+                        difficulty INTEGER, difficulty_tier TEXT, speed_target_seconds REAL,
+                        question_type TEXT, question_source TEXT, buzzable BOOLEAN,
+                        hints TEXT[], explanation TEXT, has_audio BOOLEAN, status TEXT
+                    ) ON COMMIT DROP
+                    """
+                )
+                await conn.copy_records_to_table(
+                    _STAGING_TABLE, records=records, columns=_STAGING_COLUMNS
+                )
+                row = await conn.fetchrow(
+                    f"""
+                    WITH upserted AS (
+                        INSERT INTO kb_questions (
+                            id, domain_id, subcategory, question_text, answer_text,
+                            acceptable_answers, difficulty, difficulty_tier, speed_target_seconds,
+                            question_type, question_source, buzzable,
+                            hints, explanation, has_audio, status, created_at, updated_at
+                        )
+                        SELECT
+                            s.id, s.domain_id, s.subcategory, s.question_text, s.answer_text,
+                            s.acceptable_answers, s.difficulty, s.difficulty_tier, s.speed_target_seconds,
+                            s.question_type, s.question_source, s.buzzable,
+                            s.hints, s.explanation, s.has_audio, s.status, $1, $1
+                        FROM {_STAGING_TABLE} s
+                        JOIN kb_domains d ON d.id = s.domain_id
+                        ON CONFLICT (id) DO UPDATE SET
+                            domain_id = EXCLUDED.domain_id,
+                            subcategory = EXCLUDED.subcategory,
+                            question_text = EXCLUDED.question_text,
+                            answer_text = EXCLUDED.answer_text,
+                            acceptable_answers = EXCLUDED.acceptable_answers,
+                            difficulty = EXCLUDED.difficulty,
+                            hints = EXCLUDED.hints,
+                            explanation = EXCLUDED.explanation,
+                            updated_at = EXCLUDED.updated_at
+                        WHERE (
+                            kb_questions.domain_id, kb_questions.subcategory,
+                            kb_questions.question_text, kb_questions.answer_text,
+                            kb_questions.acceptable_answers, kb_questions.difficulty,
+                            kb_questions.hints, kb_questions.explanation
+                        ) IS DISTINCT FROM (
+                            EXCLUDED.domain_id, EXCLUDED.subcategory,
+                            EXCLUDED.question_text, EXCLUDED.answer_text,
+                            EXCLUDED.acceptable_answers, EXCLUDED.difficulty,
+                            EXCLUDED.hints, EXCLUDED.explanation
+                        )
+                        RETURNING (xmax = 0) AS inserted
+                    )
+                    SELECT
+                        COUNT(*) FILTER (WHERE inserted) AS inserted,
+                        COUNT(*) FILTER (WHERE NOT inserted) AS updated
+                    FROM upserted
+                    """,
+                    datetime.now(timezone.utc),
+                )
+                counts["inserted"] = row["inserted"]
+                counts["updated"] = row["updated"]
+                counts["skipped"] -= row["inserted"] + row["updated"]
+
+                if pack_id:
+                    await self._refresh_pack_members(conn, pack_id)
+
+        self.invalidate_facets()
+        logger.info(
+            f"Imported questions: {counts['inserted']} inserted, "
+            f"{counts['updated']} updated, {counts['skipped']} skipped"
+        )
+        return counts
+
+    async def _refresh_pack_members(self, conn: asyncpg.Connection, pack_id: str) -> None:
+        """Internal: Make the staged questions a pack's members, in staged order."""
+        now = datetime.now(timezone.utc)
+        await conn.execute(
+            f"""
+            DELETE FROM kb_pack_questions pq
+            WHERE pq.pack_id = $1
+              AND NOT EXISTS (SELECT 1 FROM {_STAGING_TABLE} s WHERE s.id = pq.question_id)
+            """,
+            pack_id,
+        )
+        await conn.execute(
+            f"""
+            INSERT INTO kb_pack_questions (pack_id, question_id, position, added_at)
+            SELECT $1, s.id, ROW_NUMBER() OVER (ORDER BY s.ord), $2
+            FROM {_STAGING_TABLE} s
+            JOIN kb_questions q ON q.id = s.id
+            ON CONFLICT (pack_id, question_id) DO UPDATE SET position = EXCLUDED.position
+            WHERE kb_pack_questions.position IS DISTINCT FROM EXCLUDED.position
+            """,
+            pack_id,
+            now,
+        )
+        await conn.execute(
+            "UPDATE kb_packs SET updated_at = $2 WHERE id = $1",
+            pack_id,
+            now,
+        )
+
     async def get_question_count(self) -> int:
         """Get total question count."""
         async with self.pool.acquire() as conn:
@@ -612,3 +880,58 @@ class KBQuestionsRepository:
                 "SELECT domain_id, COUNT(*) as count FROM kb_questions GROUP BY domain_id"
             )
             return {row["domain_id"]: row["count"] for row in rows}
+
+
+def _staging_record(q: dict, ord: int) -> Optional[tuple]:
+    """Build a staging row for a question, or None if the table would reject it.
+
+    Defaults match import_questions_bulk.
+    """
+    question_id = q.get("id")
+    subcategory = q.get("subcategory", "General")
+    difficulty = q.get("difficulty", 2)
+    difficulty_tier = q.get("difficulty_tier")
+    question_type = q.get("question_type", "toss_up")
+    question_source = q.get("question_source", "naqt")
+    status = q.get("status", "active")
+
+    if not (
+        isinstance(question_id, str) and 0 < len(question_id) <= 100
+        and q.get("domain_id") and q.get("question_text") and q.get("answer_text")
+        and (subcategory is None or len(subcategory) <= 100)
+        and isinstance(difficulty, int) and 1 <= difficulty <= 5
+        and (difficulty_tier is None or difficulty_tier in _DIFFICULTY_TIERS)
+        and question_type in _QUESTION_TYPES
+        and question_source in _QUESTION_SOURCES
+        and status in _STATUSES
+    ):
+        return None
+
+    return (
+        ord,
+        question_id,
+        q["domain_id"],
+        subcategory,
+        q["question_text"],
+        q["answer_text"],
+        list(q.get("acceptable_answers") or []),
+        difficulty,
+        difficulty_tier,
+        q.get("speed_target_seconds", 5.0),
+        question_type,
+        question_source,
+        q.get("buzzable", True),
+        list(q.get("hints") or []),
+        q.get("explanation"),
+        q.get("has_audio", False),
+        status,
+    )
+
+
+def _decode_question_cursor(cursor: str) -> tuple[datetime, str]:
+    """Internal: (created_at, id) from a cursor; ValueError if malformed."""
+    try:
+        created_at, question_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), str(question_id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -21,7 +21,8 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "latency_harness"))
 
 from latency_harness.orchestrator import LatencyTestOrchestrator
-from latency_harness.analyzer import ResultsAnalyzer
+from latency_harness.analyzer import ResultsAnalyzer, baseline_metrics
+from latency_harness.stats import ResultColumns
 from latency_harness.storage import create_latency_storage, FileBasedLatencyStorage
 from latency_harness.models import (
     TestSuiteDefinition,
@@ -83,12 +84,21 @@ async def broadcast_latency_update(msg_type: str, data: dict):
 def _on_progress(run_id: str, completed: int, total: int):
     """Callback for test progress updates."""
     import asyncio
-    asyncio.create_task(broadcast_latency_update("test_progress", {
+    asyncio.create_task(_broadcast_progress(run_id, completed, total))
+
+
+async def _broadcast_progress(run_id: str, completed: int, total: int):
+    """Broadcast a progress update with the run's latency statistics so far."""
+    live_stats = await _orchestrator.get_live_statistics(run_id) if _orchestrator else None
+    await broadcast_latency_update("test_progress", {
         "runId": run_id,
         "completedConfigurations": completed,
         "totalConfigurations": total,
         "progressPercent": (completed / total * 100) if total > 0 else 0,
-    }))
+        # Overall P50/P95/P99 so far; per-configuration figures are on
+        # the live-stats endpoint
+        "liveStatistics": live_stats.summary(include_configurations=False) if live_stats else None,
+    })
 
 
 def _on_result(run_id: str, result: TestResult):
@@ -369,7 +379,7 @@ async def handle_get_run(request: web.Request) -> web.Response:
     """GET /api/latency-tests/runs/{run_id} - Get run details."""
     run_id = request.match_info["run_id"]
     orchestrator = get_orchestrator()
-    run = orchestrator.get_run(run_id)
+    run = await orchestrator.load_run(run_id)
 
     if not run:
         return web.json_response(
@@ -384,7 +394,7 @@ async def handle_get_run_results(request: web.Request) -> web.Response:
     """GET /api/latency-tests/runs/{run_id}/results - Get run results."""
     run_id = request.match_info["run_id"]
     orchestrator = get_orchestrator()
-    run = orchestrator.get_run(run_id)
+    run = await orchestrator.load_run(run_id)
 
     if not run:
         return web.json_response(
@@ -401,6 +411,28 @@ async def handle_get_run_results(request: web.Request) -> web.Response:
     })
 
 
+async def handle_get_live_stats(request: web.Request) -> web.Response:
+    """GET /api/latency-tests/runs/{run_id}/live-stats - Get streaming P50/P95/P99."""
+    run_id = request.match_info["run_id"]
+    orchestrator = get_orchestrator()
+    live_stats = await orchestrator.get_live_statistics(run_id)
+    run = orchestrator.get_run(run_id)
+
+    if not run or not live_stats:
+        return web.json_response(
+            {"error": f"No live statistics for run: {run_id}"},
+            status=404
+        )
+
+    return web.json_response({
+        "runId": run.id,
+        "status": run.status.value,
+        "completedConfigurations": run.completed_configurations,
+        "totalConfigurations": run.total_configurations,
+        **live_stats.summary(),
+    })
+
+
 async def handle_cancel_run(request: web.Request) -> web.Response:
     """DELETE /api/latency-tests/runs/{run_id} - Cancel a test run."""
     run_id = request.match_info["run_id"]
@@ -421,7 +453,7 @@ async def handle_get_analysis(request: web.Request) -> web.Response:
     """GET /api/latency-tests/runs/{run_id}/analysis - Get analysis report."""
     run_id = request.match_info["run_id"]
     orchestrator = get_orchestrator()
-    run = orchestrator.get_run(run_id)
+    run = await orchestrator.load_run(run_id)
 
     if not run:
         return web.json_response(
@@ -497,21 +529,28 @@ async def handle_get_analysis(request: web.Request) -> web.Response:
             }
             for p in report.network_projections
         ],
-        "regressions": [
-            {
-                "configId": r.config_id,
-                "metric": r.metric,
-                "baselineValue": r.baseline_value,
-                "currentValue": r.current_value,
-                "changePercent": r.change_percent,
-                "severity": r.severity.value,
-            }
-            for r in report.regressions
-        ],
+        "regressions": [_regression_to_dict(r) for r in report.regressions],
         "recommendations": report.recommendations,
     })
 
 
+def _regression_to_dict(regression) -> Dict:
+    """Serialize a Regression for API responses."""
+    return {
+        "configId": regression.config_id,
+        "metric": regression.metric,
+        "baselineValue": regression.baseline_value,
+        "currentValue": regression.current_value,
+        "changePercent": regression.change_percent,
+        "severity": regression.severity.value,
+        "method": regression.method,
+        "pValue": regression.p_value,
+        "effectSize": regression.effect_size,
+        "baselineCount": regression.baseline_count,
+        "currentCount": regression.current_count,
+    }
+
+
 async def handle_compare_runs(request: web.Request) -> web.Response:
     """POST /api/latency-tests/compare - Compare two test runs."""
     try:
@@ -526,8 +565,8 @@ async def handle_compare_runs(request: web.Request) -> web.Response:
             )
 
         orchestrator = get_orchestrator()
-        run1 = orchestrator.get_run(run1_id)
-        run2 = orchestrator.get_run(run2_id)
+        run1 = await orchestrator.load_run(run1_id)
+        run2 = await orchestrator.load_run(run2_id)
 
         if not run1:
             return web.json_response(
@@ -558,7 +597,7 @@ async def handle_export_results(request: web.Request) -> web.Response:
     format_type = request.query.get("format", "json")
 
     orchestrator = get_orchestrator()
-    run = orchestrator.get_run(run_id)
+    run = await orchestrator.load_run(run_id)
 
     if not run:
         return web.json_response(
@@ -998,7 +1037,7 @@ async def handle_create_baseline(request: web.Request) -> web.Response:
 
         # Get the run
         orchestrator = get_orchestrator()
-        run = orchestrator.get_run(run_id)
+        run = await orchestrator.load_run(run_id)
 
         if not run:
             return web.json_response(
@@ -1021,54 +1060,14 @@ async def handle_create_baseline(request: web.Request) -> web.Response:
                 status=400
             )
 
-        # Compute per-config metrics
-        config_metrics: Dict[str, BaselineMetrics] = {}
-        by_config: Dict[str, List] = defaultdict(list)
-
-        for r in successful_results:
-            by_config[r.config_id].append(r)
-
-        for config_id, results in by_config.items():
-            e2e = [r.e2e_latency_ms for r in results]
-            stt = [r.stt_latency_ms for r in results if r.stt_latency_ms]
-            llm_ttfb = [r.llm_ttfb_ms for r in results]
-            llm_completion = [r.llm_completion_ms for r in results]
-            tts_ttfb = [r.tts_ttfb_ms for r in results]
-            tts_completion = [r.tts_completion_ms for r in results]
-
-            config_metrics[config_id] = BaselineMetrics(
-                median_e2e_ms=statistics.median(e2e),
-                p99_e2e_ms=sorted(e2e)[int(len(e2e) * 0.99)] if len(e2e) > 1 else e2e[0],
-                min_e2e_ms=min(e2e),
-                max_e2e_ms=max(e2e),
-                median_stt_ms=statistics.median(stt) if stt else None,
-                median_llm_ttfb_ms=statistics.median(llm_ttfb),
-                median_llm_completion_ms=statistics.median(llm_completion),
-                median_tts_ttfb_ms=statistics.median(tts_ttfb),
-                median_tts_completion_ms=statistics.median(tts_completion),
-                sample_count=len(results),
-            )
-
-        # Compute overall metrics
-        all_e2e = [r.e2e_latency_ms for r in successful_results]
-        all_stt = [r.stt_latency_ms for r in successful_results if r.stt_latency_ms]
-        all_llm_ttfb = [r.llm_ttfb_ms for r in successful_results]
-        all_llm_completion = [r.llm_completion_ms for r in successful_results]
-        all_tts_ttfb = [r.tts_ttfb_ms for r in successful_results]
-        all_tts_completion = [r.tts_completion_ms for r in successful_results]
-
-        overall_metrics = BaselineMetrics(
-            median_e2e_ms=statistics.median(all_e2e),
-            p99_e2e_ms=sorted(all_e2e)[int(len(all_e2e) * 0.99)] if len(all_e2e) > 1 else all_e2e[0],
-            min_e2e_ms=min(all_e2e),
-            max_e2e_ms=max(all_e2e),
-            median_stt_ms=statistics.median(all_stt) if all_stt else None,
-            median_llm_ttfb_ms=statistics.median(all_llm_ttfb),
-            median_llm_completion_ms=statistics.median(all_llm_completion),
-            median_tts_ttfb_ms=statistics.median(all_tts_ttfb),
-            median_tts_completion_ms=statistics.median(all_tts_completion),
-            sample_count=len(successful_results),
-        )
+        # Compute per-config and overall metrics, keeping the
+        # distributions that regression checks test against
+        columns = ResultColumns(successful_results)
+        config_metrics: Dict[str, BaselineMetrics] = {
+            config_id: baseline_metrics(columns, config_id)
+            for config_id in columns.config_ids
+        }
+        overall_metrics = baseline_metrics(columns)
 
         # Create baseline
         baseline_id = str(uuid.uuid4())[:8]
@@ -1141,7 +1140,7 @@ async def handle_check_baseline(request: web.Request) -> web.Response:
 
         # Get the run
         orchestrator = get_orchestrator()
-        run = orchestrator.get_run(run_id)
+        run = await orchestrator.load_run(run_id)
 
         if not run:
             return web.json_response(
@@ -1149,22 +1148,17 @@ async def handle_check_baseline(request: web.Request) -> web.Response:
                 status=404
             )
 
-        # Convert baseline to format expected by analyzer
-        baseline_dict: Dict[str, Dict[str, float]] = {}
-        for config_id, metrics in baseline.config_metrics.items():
-            baseline_dict[config_id] = {
-                "e2e_median_ms": metrics.median_e2e_ms,
-                "e2e_p99_ms": metrics.p99_e2e_ms,
-                "stt_median_ms": metrics.median_stt_ms,
-                "llm_ttfb_median_ms": metrics.median_llm_ttfb_ms,
-                "llm_completion_median_ms": metrics.median_llm_completion_ms,
-                "tts_ttfb_median_ms": metrics.median_tts_ttfb_ms,
-                "tts_completion_median_ms": metrics.median_tts_completion_ms,
-            }
-
         # Analyze with baseline for regression detection
-        analyzer = ResultsAnalyzer(baselines=baseline_dict)
-        report = analyzer.analyze(run)
+        analyzer = ResultsAnalyzer()
+        report = analyzer.analyze(run, baseline=baseline)
+
+        # Worst significant regression per configuration
+        severity_order = ["minor", "moderate", "severe"]
+        regressed_severity: Dict[str, str] = {}
+        for r in report.regressions:
+            current = regressed_severity.get(r.config_id)
+            if current is None or severity_order.index(r.severity.value) > severity_order.index(current):
+                regressed_severity[r.config_id] = r.severity.value
 
         # Compute comparison summary
         comparison_results = []
@@ -1177,9 +1171,9 @@ async def handle_check_baseline(request: web.Request) -> web.Response:
         for config_id, results in by_config.items():
             current_median = statistics.median([r.e2e_latency_ms for r in results])
 
-            baseline_metrics = baseline.config_metrics.get(config_id)
-            if baseline_metrics:
-                baseline_median = baseline_metrics.median_e2e_ms
+            config_baseline = baseline.config_metrics.get(config_id)
+            if config_baseline:
+                baseline_median = config_baseline.median_e2e_ms
                 change_percent = ((current_median - baseline_median) / baseline_median * 100)
 
                 comparison_results.append({
@@ -1188,13 +1182,8 @@ async def handle_check_baseline(request: web.Request) -> web.Response:
                     "currentMedianMs": current_median,
                     "changePercent": round(change_percent, 2),
                     "improved": change_percent < -5,
-                    "regressed": change_percent > 10,
-                    "severity": (
-                        "severe" if change_percent > 50 else
-                        "moderate" if change_percent > 20 else
-                        "minor" if change_percent > 10 else
-                        "none"
-                    ),
+                    "regressed": config_id in regressed_severity,
+                    "severity": regressed_severity.get(config_id, "none"),
                 })
             else:
                 # New config not in baseline
@@ -1229,16 +1218,10 @@ async def handle_check_baseline(request: web.Request) -> web.Response:
                 "meetsTarget1000ms": overall_current_median < 1000,
             },
             "regressions": [
-                {
-                    "configId": r.config_id,
-                    "metric": r.metric,
-                    "baselineValue": r.baseline_value,
-                    "currentValue": r.current_value,
-                    "changePercent": round(r.change_percent, 2),
-                    "severity": r.severity.value,
-                }
+                dict(_regression_to_dict(r), changePercent=round(r.change_percent, 2))
                 for r in report.regressions
             ],
+            "regressionChecks": [c.to_dict() for c in report.regression_checks],
             "configComparisons": sorted(
                 comparison_results,
                 key=lambda x: x.get("changePercent") or 0,
@@ -1809,6 +1792,7 @@ def register_latency_harness_routes(app: web.Application):
     app.router.add_get("/api/latency-tests/runs", handle_list_runs)
     app.router.add_get("/api/latency-tests/runs/{run_id}", handle_get_run)
     app.router.add_get("/api/latency-tests/runs/{run_id}/results", handle_get_run_results)
+    app.router.add_get("/api/latency-tests/runs/{run_id}/live-stats", handle_get_live_stats)
     app.router.add_delete("/api/latency-tests/runs/{run_id}", handle_cancel_run)
 
     # Analysis
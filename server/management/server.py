@@ -62,7 +62,7 @@ from media_api import register_media_routes
 # Import authentication system
 from auth import (
     AuthAPI, register_auth_routes, auth_middleware, rate_limit_middleware,
-    TokenService, TokenConfig, RateLimiter, setup_token_service
+    TokenService, TokenConfig, create_rate_limiter, setup_token_service
 )
 
 # Import latency test harness system
@@ -75,7 +75,9 @@ from diagnostic_logging import diag_logger, get_diagnostic_config, set_diagnosti
 from fov_context_api import setup_fov_context_routes
 
 # Import TTS cache system
-from tts_cache import TTSCache, TTSResourcePool, CurriculumPrefetcher
+from tts_cache import (
+    TTSCache, TTSResourcePool, CurriculumPrefetcher, PrefetchPlanner, AudioEncoder, AudioBlobStore,
+)
 from tts_cache.kb_audio import KBAudioManager
 from tts_api import register_tts_routes
 
@@ -94,6 +96,9 @@ from deployment_api import register_deployment_routes, ScheduledDeploymentManage
 # Import audio WebSocket handler
 from audio_ws import AudioWebSocketHandler, register_audio_websocket
 
+# Import shared state for multi-worker deployments
+from state_backend import create_state_backend
+
 # Import modules API for server-driven training modules
 from modules_api import register_modules_routes, schedule_kb_audio_prefetch
 
@@ -104,7 +109,7 @@ from kb_packs_api import register_kb_packs_routes
 from bonjour_advertiser import start_bonjour_advertising
 
 # Import session management (for UserSession, UserVoiceConfig)
-from fov_context import SessionManager, UserVoiceConfig
+from fov_context import CurriculumIndexStore, SessionManager, UserVoiceConfig
 
 # Import model context windows for dynamic parameter limits
 from fov_context.models import MODEL_CONTEXT_WINDOWS
@@ -134,6 +139,16 @@ PORT = int(os.environ.get("VOICELEARN_MGMT_PORT", "8766"))
 MAX_LOG_ENTRIES = 10000
 MAX_METRICS_HISTORY = 1000
 
+# FOV context data; override to keep indexes and spilled sessions elsewhere
+FOV_INDEX_DIR_ENV = "FOV_INDEX_DIR"
+FOV_SPILL_DIR_ENV = "FOV_SPILL_DIR"
+
+
+def fov_data_dir(env_var: str, default_name: str) -> Path:
+    """Directory for FOV context data, from env_var or under data/."""
+    return Path(os.environ.get(env_var) or Path(__file__).parent / "data" / default_name)
+
+
 # Service paths (relative to unamentis-ios root)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 VIBEVOICE_DIR = PROJECT_ROOT.parent / "vibevoice-realtime-openai-api"
@@ -533,6 +548,11 @@ class ManagementState:
         self.curriculums: Dict[str, CurriculumSummary] = {}
         self.curriculum_details: Dict[str, CurriculumDetail] = {}
         self.curriculum_raw: Dict[str, Dict[str, Any]] = {}  # Full UMCF data by ID
+        # Retrieval indexes for FOV context expansion. Built only once
+        # enable_retrieval_indexes() is called from the startup hook, so
+        # importing this module does not build or write any index.
+        self.retrieval_indexes = CurriculumIndexStore()
+        self._index_curricula = False
         self.stats = {
             "total_logs_received": 0,
             "total_metrics_received": 0,
@@ -707,12 +727,20 @@ class ManagementState:
         self.curriculums[umcf_id] = summary
         self.curriculum_details[umcf_id] = detail
         self.curriculum_raw[umcf_id] = umcf
+        if self._index_curricula:
+            self.retrieval_indexes.load_or_build(umcf_id, umcf)
+
+    def enable_retrieval_indexes(self, directory: Optional[Path]):
+        """Build retrieval indexes for curricula loaded from now on, saved to directory."""
+        self.retrieval_indexes.directory = Path(directory) if directory else None
+        self._index_curricula = True
 
     def reload_curricula(self):
         """Reload all curricula from disk."""
         self.curriculums.clear()
         self.curriculum_details.clear()
         self.curriculum_raw.clear()
+        self.retrieval_indexes.clear()
         self._load_curricula()
 
 
@@ -2816,6 +2844,7 @@ async def handle_delete_curriculum(request: web.Request) -> web.Response:
             del state.curriculum_details[curriculum_id]
         if curriculum_id in state.curriculum_raw:
             del state.curriculum_raw[curriculum_id]
+        state.retrieval_indexes.remove(curriculum_id)
 
         await broadcast_message("curriculum_deleted", {
             "id": curriculum_id,
@@ -4581,6 +4610,11 @@ def create_app() -> web.Application:
     """Create and configure the aiohttp application."""
     # Limit request body size to 1MB to prevent DoS attacks via large JSON payloads
     app = web.Application(client_max_size=1024 * 1024)
+    app["broadcast_message"] = broadcast_message
+
+    # Session and rate-limit state; "sqlite:///path" shares it between workers
+    state_backend = create_state_backend(os.environ.get("VOICELEARN_STATE_BACKEND"))
+    app["state_backend"] = state_backend
 
     # CORS middleware
     @web.middleware
@@ -4708,7 +4742,7 @@ def create_app() -> web.Application:
             refresh_token_lifetime_days=int(os.environ.get("AUTH_REFRESH_TOKEN_DAYS", "30")),
         )
         token_service = TokenService(token_config)
-        rate_limiter = RateLimiter()
+        rate_limiter = create_rate_limiter(backend=state_backend)
 
         # Store in app for later use when db pool is available
         app["token_service"] = token_service
@@ -4729,7 +4763,12 @@ def create_app() -> web.Application:
     register_latency_harness_routes(app)
 
     # FOV Context Management System
-    setup_fov_context_routes(app)
+    setup_fov_context_routes(
+        app,
+        state.retrieval_indexes,
+        spill_dir=fov_data_dir(FOV_SPILL_DIR_ENV, "fov_sessions"),
+        state_backend=state_backend
+    )
 
     # Set up callback to reload curricula when import completes
     def on_import_complete(progress):
@@ -4801,6 +4840,7 @@ def create_app() -> web.Application:
     # Startup hook to detect existing services and load curricula
     async def on_startup(app):
         await detect_existing_processes()
+        state.enable_retrieval_indexes(fov_data_dir(FOV_INDEX_DIR_ENV, "fov_index"))
         state._load_curricula()  # Load all UMCF curricula on startup
 
         # Initialize feature flags client (deferred from module load for async-friendly startup)
@@ -4817,16 +4857,45 @@ def create_app() -> web.Application:
             except Exception as e:
                 logger.warning(f"Feature flags initialization failed: {e}")
 
+        # Optional compressed audio tier, e.g. TTS_AUDIO_FORMATS="flac,opus"
+        audio_encoder = None
+        audio_formats = [
+            f.strip() for f in os.environ.get("TTS_AUDIO_FORMATS", "").split(",") if f.strip()
+        ]
+        if audio_formats:
+            audio_encoder = AudioEncoder(
+                formats=audio_formats,
+                keep_canonical=os.environ.get("TTS_AUDIO_KEEP_WAV", "true").lower() != "false",
+            )
+            if audio_encoder.enabled:
+                logger.info(f"[Startup] Audio encoding enabled: {list(audio_encoder.formats)}")
+            else:
+                audio_encoder = None
+        app["audio_encoder"] = audio_encoder
+
+        # Content-addressed audio shared by the cache, KB audio and pregen jobs
+        blob_store = AudioBlobStore(Path(__file__).parent / "data" / "tts_blobs")
+        await blob_store.initialize()
+        await blob_store.collect_garbage()
+        app["audio_blob_store"] = blob_store
+
         # Initialize TTS cache
         cache_dir = Path(__file__).parent / "data" / "tts_cache"
-        tts_cache = TTSCache(cache_dir)
+        tts_cache = TTSCache(cache_dir, encoder=audio_encoder, blob_store=blob_store)
         await tts_cache.initialize()
         app["tts_cache"] = tts_cache
 
         # Initialize TTS resource pool (priority-based generation)
+        # Optional per-provider caps on background work, e.g. "vibevoice=1,piper=3"
+        provider_concurrency = {}
+        for pair in os.environ.get("TTS_PROVIDER_CONCURRENCY", "").split(","):
+            provider, _, limit = pair.partition("=")
+            if provider.strip() and limit.strip().isdigit():
+                provider_concurrency[provider.strip()] = int(limit)
         resource_pool = TTSResourcePool(
             max_concurrent_live=7,      # Live users get 7 concurrent slots
-            max_concurrent_background=3  # Background pre-generation gets 3
+            max_concurrent_background=3,  # Background pre-generation gets 3
+            provider_concurrency=provider_concurrency,
         )
         app["tts_resource_pool"] = resource_pool
 
@@ -4834,10 +4903,24 @@ def create_app() -> web.Application:
         prefetcher = CurriculumPrefetcher(tts_cache, resource_pool)
         app["tts_prefetcher"] = prefetcher
 
+        # Buffer-target prefetch for live playback sessions
+        prefetch_planner = PrefetchPlanner(
+            tts_cache,
+            resource_pool,
+            target_buffer_seconds=float(os.environ.get("TTS_PREFETCH_BUFFER_SECONDS", "30")),
+        )
+        app["tts_prefetch_planner"] = prefetch_planner
+
         # Initialize Knowledge Bowl audio manager for pre-generated TTS
         kb_audio_dir = Path(__file__).parent / "data" / "kb_audio"
         try:
-            kb_audio_manager = KBAudioManager(str(kb_audio_dir), resource_pool)
+            kb_audio_manager = KBAudioManager(
+                str(kb_audio_dir),
+                resource_pool,
+                encoder=audio_encoder,
+                max_concurrent=resource_pool.max_concurrent_background,
+                blob_store=blob_store,
+            )
             await kb_audio_manager.initialize()
             app["kb_audio_manager"] = kb_audio_manager
             logger.info("[Startup] KB audio manager initialized")
@@ -4846,15 +4929,20 @@ def create_app() -> web.Application:
             app["kb_audio_manager"] = None
 
         # Initialize session manager (handles both FOV and user sessions)
-        session_manager = SessionManager()
+        session_manager = SessionManager(state_backend=state_backend)
+        session_manager.start_reaper()
         app["session_manager"] = session_manager
 
         # Initialize session-cache integration bridge
-        session_cache = SessionCacheIntegration(tts_cache, resource_pool, prefetcher)
+        session_cache = SessionCacheIntegration(
+            tts_cache, resource_pool, prefetcher, planner=prefetch_planner
+        )
         app["session_cache"] = session_cache
 
         # Initialize scheduled deployment manager
-        deployment_manager = ScheduledDeploymentManager(tts_cache, resource_pool)
+        deployment_manager = ScheduledDeploymentManager(
+            tts_cache, resource_pool, idle_manager=idle_manager
+        )
 
         # Set up segment loader for deployment manager
         async def load_curriculum_segments(curriculum_id: str) -> list:
@@ -4874,9 +4962,10 @@ def create_app() -> web.Application:
 
         deployment_manager.set_segment_loader(load_curriculum_segments)
         app["deployment_manager"] = deployment_manager
+        deployment_manager.start_scheduler()
 
         # Initialize audio WebSocket handler
-        audio_ws_handler = AudioWebSocketHandler(session_manager, session_cache)
+        audio_ws_handler = AudioWebSocketHandler(session_manager, session_cache, state_backend)
         register_audio_websocket(app, audio_ws_handler)
 
         # Register deployment API routes
@@ -4961,11 +5050,13 @@ def create_app() -> web.Application:
 
         # Cleanup inactive user sessions
         if "session_manager" in app:
+            await app["session_manager"].stop_reaper()
             removed = app["session_manager"].cleanup_inactive_user_sessions(max_inactive_minutes=0)
             logger.info(f"[Cleanup] Removed {removed} user sessions")
 
         # Cleanup old deployments
         if "deployment_manager" in app:
+            await app["deployment_manager"].stop_scheduler()
             removed = app["deployment_manager"].cleanup_old_deployments(max_age_days=0)
             logger.info(f"[Cleanup] Removed {removed} old deployments")
 
@@ -4985,6 +5076,8 @@ def create_app() -> web.Application:
         await shutdown_latency_harness()
         logger.info("[Cleanup] Background tasks stopped")
 
+        state_backend.close()
+
     app.on_startup.append(on_startup)
     app.on_cleanup.append(on_cleanup)
 
@@ -3,10 +3,18 @@
 
 import asyncio
 import logging
+import time
 from typing import List, Optional, Tuple
 
 from fov_context import UserSession, UserVoiceConfig
-from tts_cache import TTSCache, TTSCacheKey, TTSResourcePool, Priority, CurriculumPrefetcher
+from tts_cache import (
+    TTSCache,
+    TTSCacheKey,
+    TTSResourcePool,
+    Priority,
+    CurriculumPrefetcher,
+    PrefetchPlanner,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +27,7 @@ class SessionCacheIntegration:
     - Translate user voice config to cache keys
     - Handle audio retrieval with cache-first strategy
     - Trigger prefetch for upcoming segments
-    - Track cache hits per session for analytics
+    - Track cache hits and buffer health per session for analytics
 
     Design principle: Cache keys are user-agnostic (no user_id).
     Same text + same voice config = same cache entry for ALL users.
@@ -30,6 +38,7 @@ class SessionCacheIntegration:
         cache: TTSCache,
         resource_pool: TTSResourcePool,
         prefetcher: Optional[CurriculumPrefetcher] = None,
+        planner: Optional[PrefetchPlanner] = None,
     ):
         """Initialize session-cache integration.
 
@@ -37,10 +46,12 @@ class SessionCacheIntegration:
             cache: Global TTS cache instance
             resource_pool: TTS resource pool for priority-based generation
             prefetcher: Optional prefetcher for background pre-generation
+            planner: Optional buffer-target planner for live playback prefetch
         """
         self.cache = cache
         self.resource_pool = resource_pool
         self.prefetcher = prefetcher
+        self.planner = planner
 
         # Per-session analytics (session_id -> stats)
         self._session_stats: dict[str, dict] = {}
@@ -88,6 +99,7 @@ class SessionCacheIntegration:
             return cached, True, duration
 
         # Cache miss - generate with LIVE priority (user is waiting)
+        start = time.monotonic()
         try:
             audio_data, sample_rate, duration = await self.resource_pool.generate_with_priority(
                 text=segment_text,
@@ -101,6 +113,16 @@ class SessionCacheIntegration:
             # Store in global cache (available to all users with same config)
             await self.cache.put(key, audio_data, sample_rate, duration)
 
+            if self.planner:
+                self.planner.observe_generation(
+                    segment_text,
+                    voice_config.voice_id,
+                    voice_config.tts_provider,
+                    voice_config.speed,
+                    duration,
+                    time.monotonic() - start,
+                )
+
             self._record_miss(session.session_id)
             return audio_data, False, duration
 
@@ -164,17 +186,35 @@ class SessionCacheIntegration:
         Fire-and-forget operation that runs in background.
         Uses PREFETCH priority (lower than LIVE).
 
+        With a planner and no explicit lookahead, prefetch is sized to keep
+        the planner's seconds-of-audio buffer ahead of the playhead.
+        Otherwise a fixed lookahead is handed to the prefetcher.
+
         Args:
             session: User session with voice configuration
             current_index: Current segment index
             segments: All segments in the topic
             lookahead: Number of segments to prefetch (default: session's setting)
         """
+        voice_config = session.voice_config
+
+        if self.planner and lookahead is None:
+            await self.planner.schedule(
+                session_id=session.session_id,
+                segments=segments,
+                current_index=current_index,
+                offset_ms=session.playback_state.segment_offset_ms,
+                voice_id=voice_config.voice_id,
+                provider=voice_config.tts_provider,
+                speed=voice_config.speed,
+                chatterbox_config=voice_config.get_chatterbox_config(),
+            )
+            return
+
         if not self.prefetcher:
             return
 
         lookahead = lookahead or session.prefetch_lookahead
-        voice_config = session.voice_config
 
         await self.prefetcher.prefetch_upcoming(
             curriculum_id=session.playback_state.curriculum_id,
@@ -187,6 +227,22 @@ class SessionCacheIntegration:
             chatterbox_config=voice_config.get_chatterbox_config(),
         )
 
+    def cancel_prefetch(self, session_id: str) -> int:
+        """Drop a session's pending prefetches (topic change, barge-in, voice change).
+
+        Returns:
+            Number of prefetches released
+        """
+        if not self.planner:
+            return 0
+        return self.planner.cancel_session(session_id)
+
+    def get_buffer_health(self, session_id: str) -> Optional[dict]:
+        """Get prefetch buffer health for a specific session."""
+        if not self.planner:
+            return None
+        return self.planner.get_buffer_health(session_id)
+
     def get_session_stats(self, session_id: str) -> Optional[dict]:
         """Get cache statistics for a specific session."""
         return self._session_stats.get(session_id)
@@ -199,18 +255,24 @@ class SessionCacheIntegration:
         """Clear statistics for a session (e.g., when session ends)."""
         if session_id in self._session_stats:
             del self._session_stats[session_id]
+        if self.planner:
+            self.planner.remove_session(session_id)
 
     def _record_hit(self, session_id: str) -> None:
         """Record a cache hit for a session."""
         if session_id not in self._session_stats:
             self._session_stats[session_id] = {"hits": 0, "misses": 0}
         self._session_stats[session_id]["hits"] += 1
+        if self.planner:
+            self.planner.record_playback(session_id, cache_hit=True)
 
     def _record_miss(self, session_id: str) -> None:
         """Record a cache miss for a session."""
         if session_id not in self._session_stats:
             self._session_stats[session_id] = {"hits": 0, "misses": 0}
         self._session_stats[session_id]["misses"] += 1
+        if self.planner:
+            self.planner.record_playback(session_id, cache_hit=False)
 
 
 async def estimate_generation_time(
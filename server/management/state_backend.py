@@ -0,0 +1,291 @@
+# Shared State Backend
+# Key-value state shared by the worker processes behind a load balancer
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Cookie set on WebSocket handshakes so a load balancer can pin a
+# connection (and the HTTP calls that share its cookies) to one worker
+AFFINITY_COOKIE = "voicelearn_affinity"
+
+
+def worker_id() -> str:
+    """Identify this worker process (VOICELEARN_WORKER_ID, else host-pid)."""
+    return os.environ.get("VOICELEARN_WORKER_ID") or f"{socket.gethostname()}-{os.getpid()}"
+
+
+def affinity_headers(session_id: str) -> Dict[str, str]:
+    """Sticky-session hints for responses that belong to a session."""
+    return {
+        "X-Session-Affinity": session_id,
+        "X-Worker-Id": worker_id(),
+    }
+
+
+class StateBackend(ABC):
+    """Namespaced key-value store with optional expiry.
+
+    Values are bytes; callers choose the encoding. update() must be atomic
+    with respect to every process that uses the same backend.
+    """
+
+    # True when other processes see the same state
+    shared = False
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Get a live value."""
+        pass
+
+    @abstractmethod
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: bytes,
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        """Store a value, expiring after ttl_seconds if given."""
+        pass
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> bool:
+        """Delete a key. Returns True if it existed."""
+        pass
+
+    @abstractmethod
+    def items(self, namespace: str) -> List[Tuple[str, bytes]]:
+        """All live (key, value) pairs in a namespace."""
+        pass
+
+    @abstractmethod
+    def update(
+        self,
+        namespace: str,
+        key: str,
+        func: Callable[[Optional[bytes]], Optional[bytes]],
+        ttl_seconds: Optional[float] = None
+    ) -> Optional[bytes]:
+        """Atomically replace a value with func(old value).
+
+        Returning None from func deletes the key. Returns the new value.
+        """
+        pass
+
+    @abstractmethod
+    def purge_expired(self, namespace: Optional[str] = None) -> int:
+        """Drop expired keys, in one namespace or all. Returns how many."""
+        pass
+
+    def close(self) -> None:
+        """Release any connections."""
+
+    def get_json(self, namespace: str, key: str) -> Any:
+        raw = self.get(namespace, key)
+        return json.loads(raw) if raw is not None else None
+
+    def set_json(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        self.set(namespace, key, json.dumps(value).encode(), ttl_seconds)
+
+
+class InMemoryStateBackend(StateBackend):
+    """Process-local backend; the default for single-worker deployments."""
+
+    def __init__(self):
+        self._data: Dict[Tuple[str, str], Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, namespace: str, key: str, now: float) -> Optional[bytes]:
+        """Internal: Current value, dropping it if expired. Must hold lock."""
+        entry = self._data.get((namespace, key))
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            del self._data[(namespace, key)]
+            return None
+        return value
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(namespace, key, time.time())
+
+    def set(self, namespace, key, value, ttl_seconds=None) -> None:
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            self._data[(namespace, key)] = (value, expires_at)
+
+    def delete(self, namespace: str, key: str) -> bool:
+        with self._lock:
+            return self._data.pop((namespace, key), None) is not None
+
+    def items(self, namespace: str) -> List[Tuple[str, bytes]]:
+        now = time.time()
+        with self._lock:
+            return [
+                (key, value)
+                for (ns, key), (value, expires_at) in list(self._data.items())
+                if ns == namespace and (expires_at is None or expires_at > now)
+            ]
+
+    def update(self, namespace, key, func, ttl_seconds=None) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            value = func(self._live(namespace, key, now))
+            if value is None:
+                self._data.pop((namespace, key), None)
+            else:
+                expires_at = now + ttl_seconds if ttl_seconds is not None else None
+                self._data[(namespace, key)] = (value, expires_at)
+            return value
+
+    def purge_expired(self, namespace: Optional[str] = None) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [
+                k for k, (_, expires_at) in self._data.items()
+                if expires_at is not None and expires_at <= now
+                and (namespace is None or k[0] == namespace)
+            ]
+            for k in expired:
+                del self._data[k]
+        return len(expired)
+
+
+class SQLiteStateBackend(StateBackend):
+    """Backend in a SQLite database in WAL mode, shared by local workers.
+
+    Readers never block the writer under WAL; update() takes the write
+    lock up front (BEGIN IMMEDIATE) so read-modify-write cycles from
+    different processes serialize.
+    """
+
+    shared = True
+
+    def __init__(self, path: Path, timeout_seconds: float = 5.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS state ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " expires_at REAL,"
+            " PRIMARY KEY (namespace, key)"
+            ") WITHOUT ROWID"
+        )
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM state WHERE namespace = ? AND key = ?"
+                " AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, namespace, key, value, ttl_seconds=None) -> None:
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state VALUES (?, ?, ?, ?)",
+                (namespace, key, value, expires_at),
+            )
+
+    def delete(self, namespace: str, key: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+        return cursor.rowcount > 0
+
+    def items(self, namespace: str) -> List[Tuple[str, bytes]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT key, value FROM state WHERE namespace = ?"
+                " AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, time.time()),
+            ).fetchall()
+
+    def update(self, namespace, key, func, ttl_seconds=None) -> Optional[bytes]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT value FROM state WHERE namespace = ? AND key = ?"
+                    " AND (expires_at IS NULL OR expires_at > ?)",
+                    (namespace, key, now),
+                ).fetchone()
+                value = func(row[0] if row else None)
+                if value is None:
+                    self._conn.execute(
+                        "DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key)
+                    )
+                else:
+                    expires_at = now + ttl_seconds if ttl_seconds is not None else None
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO state VALUES (?, ?, ?, ?)",
+                        (namespace, key, value, expires_at),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return value
+
+    def purge_expired(self, namespace: Optional[str] = None) -> int:
+        query = "DELETE FROM state WHERE expires_at IS NOT NULL AND expires_at <= ?"
+        params: Tuple = (time.time(),)
+        if namespace is not None:
+            query += " AND namespace = ?"
+            params += (namespace,)
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_state_backend(url: Optional[str] = None) -> StateBackend:
+    """Create a backend from a URL.
+
+    Args:
+        url: "memory" (or empty) for the in-process backend, or
+            "sqlite:///relative/path.db" / "sqlite:////absolute/path.db"
+
+    Raises:
+        ValueError: For an unsupported URL
+    """
+    if not url or url == "memory":
+        return InMemoryStateBackend()
+    if url.startswith("sqlite:///"):
+        return SQLiteStateBackend(Path(url[len("sqlite:///"):]))
+    raise ValueError(f"Unsupported state backend URL: {url}")
@@ -29,6 +29,13 @@ logger = logging.getLogger(__name__)
 IS_CI = os.environ.get("CI") == "true" or os.environ.get("GITHUB_ACTIONS") == "true"
 
 
+@pytest.fixture(autouse=True, scope="session")
+def fov_data_dirs(tmp_path_factory):
+    """Keep FOV retrieval indexes and spilled sessions out of server/management/data."""
+    os.environ.setdefault("FOV_INDEX_DIR", str(tmp_path_factory.mktemp("fov_index")))
+    os.environ.setdefault("FOV_SPILL_DIR", str(tmp_path_factory.mktemp("fov_sessions")))
+
+
 # =============================================================================
 # REAL FIXTURES - NO MOCKS ALLOWED
 # =============================================================================
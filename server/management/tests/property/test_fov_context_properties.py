@@ -26,6 +26,7 @@ from fov_context.models import (
     FOVContext,
     LearnerSignals,
 )
+from fov_context.tokens import get_token_counter
 
 
 # --- Property Tests: ModelTier ---
@@ -290,11 +291,9 @@ class TestBufferRenderingProperties:
 
         rendered = buffer.render(token_budget=budget)
 
-        # Rough token estimate (4 chars per token)
-        estimated_tokens = len(rendered) // 4
-        # Allow some slack for truncation boundary
-        assert estimated_tokens <= budget + 10, (
-            f"Rendered {estimated_tokens} tokens exceeds budget {budget}"
+        tokens = get_token_counter().count(rendered)
+        assert tokens <= budget, (
+            f"Rendered {tokens} tokens exceeds budget {budget}"
         )
 
     @given(st.integers(min_value=10, max_value=10000))
@@ -307,9 +306,8 @@ class TestBufferRenderingProperties:
         )
 
         rendered = buffer.render(token_budget=budget)
-        estimated_tokens = len(rendered) // 4
 
-        assert estimated_tokens <= budget + 10
+        assert get_token_counter().count(rendered) <= budget
 
     @given(st.integers(min_value=10, max_value=10000))
     def test_episodic_buffer_respects_budget(self, budget: int):
@@ -328,9 +326,8 @@ class TestBufferRenderingProperties:
         )
 
         rendered = buffer.render(token_budget=budget)
-        estimated_tokens = len(rendered) // 4
 
-        assert estimated_tokens <= budget + 10
+        assert get_token_counter().count(rendered) <= budget
 
     @given(st.integers(min_value=10, max_value=10000))
     def test_semantic_buffer_respects_budget(self, budget: int):
@@ -342,9 +339,8 @@ class TestBufferRenderingProperties:
         )
 
         rendered = buffer.render(token_budget=budget)
-        estimated_tokens = len(rendered) // 4
 
-        assert estimated_tokens <= budget + 10
+        assert get_token_counter().count(rendered) <= budget
 
 
 # --- Property Tests: FOVContext ---
@@ -12,6 +12,7 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from aiohttp import web, WSMsgType
 
+from state_backend import AFFINITY_COOKIE
 from audio_ws import (
     AudioWebSocketHandler,
     handle_audio_websocket,
@@ -28,6 +29,11 @@ class MockWebSocketResponse:
         self.prepared = False
         self._receive_queue = asyncio.Queue()
         self._exception = None
+        self.headers = {}
+        self.cookies = {}
+
+    def set_cookie(self, name, value, **kwargs):  # noqa: ARG002
+        self.cookies[name] = value
 
     async def prepare(self, request):  # noqa: ARG002
         self.prepared = True
@@ -130,6 +136,7 @@ class MockSessionManager:
     def __init__(self):
         self.sessions = {}
         self._created_sessions = []
+        self.saved = []
 
     def get_user_session(self, session_id: str):
         return self.sessions.get(session_id)
@@ -146,6 +153,21 @@ class MockSessionManager:
         self._created_sessions.append(session)
         return session
 
+    def save_user_session(self, session):
+        self.saved.append(session.session_id)
+
+    async def get_user_session_async(self, session_id: str):
+        return self.get_user_session(session_id)
+
+    async def get_user_session_by_user_async(self, user_id: str):
+        return self.get_user_session_by_user(user_id)
+
+    async def create_user_session_async(self, user_id: str):
+        return self.create_user_session(user_id)
+
+    async def save_user_session_async(self, session):
+        self.save_user_session(session)
+
 
 class MockSessionCache:
     """Mock session cache integration."""
@@ -153,6 +175,7 @@ class MockSessionCache:
     def __init__(self):
         self.audio_requests = []
         self.prefetch_calls = []
+        self.cancel_calls = []
         self._audio_data = b"test-audio-data"
         self._cache_hit = True
         self._duration = 2.5
@@ -164,6 +187,10 @@ class MockSessionCache:
     async def prefetch_upcoming(self, session, segment_index: int, segments: list):
         self.prefetch_calls.append((session.session_id, segment_index, len(segments)))
 
+    def cancel_prefetch(self, session_id: str) -> int:
+        self.cancel_calls.append(session_id)
+        return 0
+
 
 # =============================================================================
 # HANDLER INITIALIZATION TESTS
@@ -679,6 +706,19 @@ class TestMessageHandling:
         assert ws.sent_messages[0]["segment_index"] == 3
         assert "server_time" in ws.sent_messages[0]
 
+    @pytest.mark.asyncio
+    async def test_handle_sync_replans_prefetch_while_playing(self, handler, session):
+        """Test sync re-plans prefetch from the reported position."""
+        ws = MockWebSocketResponse()
+        handler.set_topic_segments("test-curriculum", "test-topic", ["a", "b", "c"])
+
+        await handler._handle_sync(ws, session, {"segment_index": 1, "is_playing": True})
+        await asyncio.sleep(0)
+        await handler._handle_sync(ws, session, {"segment_index": 1, "is_playing": False})
+        await asyncio.sleep(0)
+
+        assert handler.session_cache.prefetch_calls == [(session.session_id, 1, 3)]
+
     @pytest.mark.asyncio
     async def test_handle_barge_in_stops_playback(self, handler, session):
         """Test barge-in stops playback."""
@@ -693,6 +733,7 @@ class TestMessageHandling:
         assert session.playback_state.is_playing is False
         assert session.playback_state.segment_index == 5
         assert session.playback_state.offset_ms == 2000
+        assert handler.session_cache.cancel_calls == [session.session_id]
 
     @pytest.mark.asyncio
     async def test_handle_barge_in_sends_ack(self, handler, session):
@@ -745,6 +786,7 @@ class TestMessageHandling:
 
         assert session.playback_state.curriculum_id == "test-curriculum"
         assert session.playback_state.topic_id == "test-topic"
+        assert handler.session_cache.cancel_calls == [session.session_id]
 
     @pytest.mark.asyncio
     async def test_handle_set_topic_sends_response(self, handler, session):
@@ -1216,6 +1258,27 @@ class TestHandleConnectionFlow:
             # Verify session was found and connection was registered then cleaned up
             assert result is mock_ws
 
+    @pytest.mark.asyncio
+    async def test_handle_connection_sends_affinity_hints(self, handler, monkeypatch):
+        """Test the handshake carries sticky-session hints."""
+        monkeypatch.setenv("VOICELEARN_WORKER_ID", "worker-a")
+        session = MockUserSession("existing-session", "user-1")
+        handler.session_manager.sessions["existing-session"] = session
+
+        request = MagicMock()
+        request.query = {"session_id": "existing-session"}
+
+        with patch('audio_ws.web.WebSocketResponse') as MockWS:
+            mock_ws = MockWebSocketResponse()
+            mock_ws.add_close()
+            MockWS.return_value = mock_ws
+
+            await handler.handle_connection(request)
+
+            assert mock_ws.headers["X-Session-Affinity"] == "existing-session"
+            assert mock_ws.headers["X-Worker-Id"] == "worker-a"
+            assert mock_ws.cookies[AFFINITY_COOKIE] == "worker-a"
+
     @pytest.mark.asyncio
     async def test_handle_connection_with_user_id_lookup(self, handler):
         """Test handle_connection finds existing session by user_id."""
@@ -0,0 +1,361 @@
+"""
+Tests for PostgreSQL curriculum storage in database/curriculum_db.py.
+
+Tests cover:
+- Content save plans: what a (re-)save inserts, updates, clears and deletes
+- Applying a plan through a mock connection
+- Topic transcripts: response shape and the in-process cache
+"""
+
+import copy
+import json
+import sys
+import uuid
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add server directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from database.curriculum_db import (
+    CONTENT_COLUMNS,
+    TOPIC_COLUMNS,
+    TOPIC_TRANSCRIPT_SQL,
+    PostgreSQLStorage,
+    plan_content_save,
+)
+
+CURRICULUM_ID = uuid.UUID("00000000-0000-0000-0000-0000000000c1")
+
+
+def node(external_id, title, children=(), **fields):
+    return {
+        "id": {"value": external_id},
+        "title": title,
+        "type": "topic" if not children else "unit",
+        **fields,
+        "children": list(children),
+    }
+
+
+def segment(segment_id, text):
+    return {"id": segment_id, "type": "lecture", "content": text}
+
+
+@pytest.fixture
+def content():
+    return [
+        node("u1", "Unit 1", [
+            node("t1", "Energy", transcript={"segments": [segment("s1", "Energy is...")]}),
+            node("t2", "Power", transcript={"segments": [segment("s2", "Power is...")]}),
+        ]),
+        node("u2", "Unit 2", [
+            node("t3", "Work", examples=[{"id": {"value": "e1"}, "title": "Lifting a box"}]),
+        ]),
+    ]
+
+
+def stored_topics(plan):
+    """Topic rows as save_curriculum reads them back after a plan ran."""
+    columns = ("id", "parent_id", "external_id", "order_index", "content_hash", "subtree_hash")
+    positions = [TOPIC_COLUMNS.index(column) for column in columns]
+    return [dict(zip(columns, (row[pos] for pos in positions))) for row in plan.topics]
+
+
+def row_field(row, column):
+    return row[TOPIC_COLUMNS.index(column)]
+
+
+def topic_ids(existing):
+    return {row["external_id"]: row["id"] for row in existing}
+
+
+class TestPlanContentSave:
+    """Tests for plan_content_save."""
+
+    def test_first_save_inserts_everything(self, content):
+        plan = plan_content_save(CURRICULUM_ID, content)
+
+        assert [row_field(row, "external_id") for row in plan.topics] == ["u1", "t1", "t2", "u2", "t3"]
+        inserted = set()
+        for row in plan.topics:
+            # Parents are copied before their children
+            assert row_field(row, "parent_id") is None or row_field(row, "parent_id") in inserted
+            inserted.add(row[0])
+        assert [row[2] for row in plan.content["transcript_segments"]] == ["s1", "s2"]
+        assert len(plan.content["examples"]) == 1
+        assert not (plan.topic_updates or plan.cleared_topic_ids or plan.deleted_topic_ids)
+
+    def test_unchanged_resave_writes_nothing(self, content):
+        existing = stored_topics(plan_content_save(CURRICULUM_ID, content))
+
+        plan = plan_content_save(CURRICULUM_ID, copy.deepcopy(content), existing)
+
+        assert plan.unchanged_topics == 5
+        assert not (plan.topics or plan.topic_updates or plan.cleared_topic_ids or plan.deleted_topic_ids)
+        assert not any(plan.content.values())
+
+    def test_edited_leaf_rewrites_only_its_subtree(self, content):
+        existing = stored_topics(plan_content_save(CURRICULUM_ID, content))
+        ids = topic_ids(existing)
+
+        content[0]["children"][1]["transcript"]["segments"][0]["content"] = "Power is energy per second"
+        plan = plan_content_save(CURRICULUM_ID, content, existing)
+
+        # The unit only gets its subtree hash updated; the leaf is rewritten
+        assert [row[0] for row in plan.topic_updates] == [ids["u1"], ids["t2"]]
+        assert plan.cleared_topic_ids == [ids["t2"]]
+        assert [row[1] for row in plan.content["transcript_segments"]] == [ids["t2"]]
+        assert plan.unchanged_topics == 3
+        assert not (plan.topics or plan.deleted_topic_ids)
+
+    def test_sibling_reorder_updates_positions_only(self, content):
+        existing = stored_topics(plan_content_save(CURRICULUM_ID, content))
+        ids = topic_ids(existing)
+
+        content.reverse()
+        plan = plan_content_save(CURRICULUM_ID, content, existing)
+
+        assert {row[0]: row_field(row, "order_index") for row in plan.topic_updates} == {
+            ids["u2"]: 0, ids["u1"]: 1,
+        }
+        assert plan.unchanged_topics == 3
+        assert not (plan.topics or plan.cleared_topic_ids or plan.deleted_topic_ids)
+        assert not any(plan.content.values())
+
+    def test_node_moved_to_new_parent(self, content):
+        existing = stored_topics(plan_content_save(CURRICULUM_ID, content))
+        ids = topic_ids(existing)
+
+        content[1]["children"].append(content[0]["children"].pop())
+        plan = plan_content_save(CURRICULUM_ID, content, existing)
+
+        # Siblings are matched under their parent, so a move is a delete
+        # under the old parent and an insert under the new one
+        assert plan.deleted_topic_ids == [ids["t2"]]
+        assert [(row_field(row, "external_id"), row_field(row, "parent_id")) for row in plan.topics] == [
+            ("t2", ids["u2"]),
+        ]
+        assert plan.topics[0][0] != ids["t2"]
+        assert [row[2] for row in plan.content["transcript_segments"]] == ["s2"]
+        assert {row[0] for row in plan.topic_updates} == {ids["u1"], ids["u2"]}
+        assert not plan.cleared_topic_ids
+
+    def test_duplicate_ids(self, content):
+        existing = stored_topics(plan_content_save(CURRICULUM_ID, content))
+        ids = topic_ids(existing)
+        duplicate = dict(existing[-1], id=uuid.uuid4(), order_index=1)
+
+        plan = plan_content_save(CURRICULUM_ID, content, existing + [duplicate])
+        # A second stored topic with the same UMCF id is dropped
+        assert plan.deleted_topic_ids == [duplicate["id"]]
+        assert not (plan.topics or plan.topic_updates)
+
+        content[1]["children"].append(copy.deepcopy(content[1]["children"][0]))
+        plan = plan_content_save(CURRICULUM_ID, content, existing)
+        # A second node with the same UMCF id becomes a topic of its own
+        assert [row_field(row, "external_id") for row in plan.topics] == ["t3"]
+        assert plan.topics[0][0] != ids["t3"]
+        assert not plan.deleted_topic_ids
+
+    def test_deleted_subtree(self, content):
+        existing = stored_topics(plan_content_save(CURRICULUM_ID, content))
+        ids = topic_ids(existing)
+
+        del content[1]
+        plan = plan_content_save(CURRICULUM_ID, content, existing)
+
+        # Deleting the unit cascades to its children in the database
+        assert plan.deleted_topic_ids == [ids["u2"]]
+        assert plan.unchanged_topics == 3
+        assert not (plan.topics or plan.topic_updates or plan.cleared_topic_ids)
+
+
+class TestApplyContentPlan:
+    """Tests for PostgreSQLStorage._apply_content_plan with a mock connection."""
+
+    @pytest.fixture
+    def storage(self):
+        return PostgreSQLStorage("postgresql://localhost/test")
+
+    @pytest.fixture
+    def mock_conn(self):
+        return AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_plan_issues_no_statements(self, storage, mock_conn, content):
+        existing = stored_topics(plan_content_save(CURRICULUM_ID, content))
+        plan = plan_content_save(CURRICULUM_ID, content, existing)
+
+        await storage._apply_content_plan(mock_conn, plan)
+
+        assert mock_conn.mock_calls == []
+
+    @pytest.mark.asyncio
+    async def test_first_save_copies_topics_before_content(self, storage, mock_conn, content):
+        plan = plan_content_save(CURRICULUM_ID, content)
+
+        await storage._apply_content_plan(mock_conn, plan)
+
+        mock_conn.execute.assert_not_called()
+        tables = [call.args[0] for call in mock_conn.copy_records_to_table.call_args_list]
+        assert tables == ["topics", "transcript_segments", "examples"]
+        topics_call = mock_conn.copy_records_to_table.call_args_list[0]
+        assert topics_call.kwargs["records"] == plan.topics
+        assert topics_call.kwargs["columns"] == list(TOPIC_COLUMNS)
+        segments_call = mock_conn.copy_records_to_table.call_args_list[1]
+        assert segments_call.kwargs["columns"] == list(CONTENT_COLUMNS["transcript_segments"])
+
+    @pytest.mark.asyncio
+    async def test_changes_run_as_set_based_statements(self, storage, mock_conn, content):
+        existing = stored_topics(plan_content_save(CURRICULUM_ID, content))
+        ids = topic_ids(existing)
+        content[0]["children"][1]["title"] = "Power and energy"
+        content[0]["children"].append(node("t4", "Efficiency"))
+        del content[1]
+
+        plan = plan_content_save(CURRICULUM_ID, content, existing)
+        await storage._apply_content_plan(mock_conn, plan)
+
+        delete_call, clear_call, update_call = mock_conn.execute.call_args_list
+        assert delete_call.args[0].startswith("DELETE FROM topics")
+        assert delete_call.args[1] == [ids["u2"]]
+        assert "DELETE FROM assessments" in clear_call.args[0]
+        assert clear_call.args[1] == [ids["t2"]]
+        assert "unnest(" in update_call.args[0]
+        # One array per updated column, each with a value per updated topic
+        assert update_call.args[1] == [ids["u1"], ids["t2"]]
+        assert all(len(array) == 2 for array in update_call.args[1:])
+
+        tables = [call.args[0] for call in mock_conn.copy_records_to_table.call_args_list]
+        assert tables == ["topics", "transcript_segments"]
+        assert [row_field(row, "external_id") for row in plan.topics] == ["t4"]
+
+
+# What TOPIC_TRANSCRIPT_SQL returns: to_jsonb renders assessment ids and
+# timestamps as JSON strings, and options are aggregated as objects
+TRANSCRIPT_JSON = json.dumps({
+    "topic_id": "t1",
+    "topic_title": "Energy",
+    "segments": [{"id": "s1", "type": "lecture", "content": "Energy is...",
+                  "speaking_notes": None, "checkpoint": None}],
+    "misconceptions": [],
+    "examples": [],
+    "assessments": [{
+        "id": "6f1c2d9e-0000-4000-8000-000000000001",
+        "topic_id": "6f1c2d9e-0000-4000-8000-000000000002",
+        "question": "What is energy?",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "options": [{"id": "a", "text": "The ability to do work", "isCorrect": True}],
+    }],
+})
+
+
+class TestTopicTranscript:
+    """Tests for PostgreSQLStorage.get_topic_transcript with a mock connection."""
+
+    @pytest.fixture
+    def mock_conn(self):
+        conn = AsyncMock()
+        conn.fetchval.return_value = TRANSCRIPT_JSON
+        conn.transaction = MagicMock()
+        return conn
+
+    @pytest.fixture
+    def storage(self, mock_conn):
+        storage = PostgreSQLStorage("postgresql://localhost/test")
+        storage.pool = MagicMock()
+        storage.pool.acquire.return_value.__aenter__.return_value = mock_conn
+        return storage
+
+    def test_query_builds_json_objects(self):
+        # Options are built as objects, not serialized to strings, and the
+        # assessment row goes through to_jsonb so uuids and timestamps
+        # come back as JSON strings
+        assert "jsonb_agg(jsonb_build_object(" in TOPIC_TRANSCRIPT_SQL
+        assert "'isCorrect', ao.is_correct" in TOPIC_TRANSCRIPT_SQL
+        assert "to_jsonb(a)" in TOPIC_TRANSCRIPT_SQL
+        assert TOPIC_TRANSCRIPT_SQL.rstrip().endswith("LIMIT 1")
+
+    @pytest.mark.asyncio
+    async def test_response_shape(self, storage, mock_conn):
+        transcript = await storage.get_topic_transcript("physics-101", "t1")
+
+        mock_conn.fetchval.assert_awaited_once_with(TOPIC_TRANSCRIPT_SQL, "physics-101", "t1")
+        assessment = transcript["assessments"][0]
+        assert isinstance(assessment["id"], str)
+        assert isinstance(assessment["created_at"], str)
+        assert assessment["options"] == [{"id": "a", "text": "The ability to do work", "isCorrect": True}]
+        # The API layer can encode it as is
+        assert json.loads(json.dumps(transcript)) == transcript
+
+    @pytest.mark.asyncio
+    async def test_missing_topic_not_cached(self, storage, mock_conn):
+        mock_conn.fetchval.return_value = None
+
+        assert await storage.get_topic_transcript("physics-101", "nope") is None
+        assert await storage.get_topic_transcript("physics-101", "nope") is None
+        assert mock_conn.fetchval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_hit(self, storage, mock_conn):
+        first = await storage.get_topic_transcript("physics-101", "t1")
+        first["segments"].clear()
+        second = await storage.get_topic_transcript("physics-101", "t1")
+
+        assert mock_conn.fetchval.await_count == 1
+        # Each hit is a fresh copy
+        assert len(second["segments"]) == 1
+        await storage.get_topic_transcript("physics-101", "t2")
+        assert mock_conn.fetchval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_entries_expire(self, storage, mock_conn, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("database.curriculum_db.time.monotonic", lambda: now[0])
+
+        await storage.get_topic_transcript("physics-101", "t1")
+        now[0] += storage.TRANSCRIPT_CACHE_TTL_SECONDS + 1
+        await storage.get_topic_transcript("physics-101", "t1")
+
+        assert mock_conn.fetchval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates(self, storage, mock_conn):
+        mock_conn.execute.return_value = "DELETE 1"
+        await storage.get_topic_transcript("physics-101", "t1")
+
+        assert await storage.delete_curriculum("physics-101") is True
+        await storage.get_topic_transcript("physics-101", "t1")
+
+        assert mock_conn.fetchval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_save_invalidates(self, storage, mock_conn):
+        await storage.get_topic_transcript("physics-101", "t1")
+
+        # New curriculum: no existing row, then the inserted id
+        mock_conn.fetchval.side_effect = [None, CURRICULUM_ID]
+        await storage.save_curriculum("physics-101", {"id": {"value": "physics-101"}, "title": "Physics"})
+        mock_conn.fetchval.side_effect = None
+        await storage.get_topic_transcript("physics-101", "t1")
+
+        assert mock_conn.fetchval.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_save_during_fetch_not_cached(self, storage, mock_conn):
+        async def fetch_while_saving(*args):
+            # A save finishes while the transcript query is in flight
+            storage.invalidate_transcripts()
+            return TRANSCRIPT_JSON
+
+        mock_conn.fetchval.side_effect = fetch_while_saving
+        assert (await storage.get_topic_transcript("physics-101", "t1"))["topic_id"] == "t1"
+
+        mock_conn.fetchval.side_effect = None
+        await storage.get_topic_transcript("physics-101", "t1")
+        await storage.get_topic_transcript("physics-101", "t1")
+        # The result read during the save was not cached; the next one was
+        assert mock_conn.fetchval.await_count == 2
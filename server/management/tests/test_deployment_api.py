@@ -178,11 +178,16 @@ class MockTTSCache:
 class MockResourcePool:
     """Mock TTS resource pool for testing."""
 
+    max_concurrent_background = 1
+
     def __init__(self):
         self.generation_calls = []
         self._should_fail = False
         self._fail_on_indices = set()
 
+    def get_provider_limit(self, provider):
+        return self.max_concurrent_background
+
     async def generate_with_priority(self, **kwargs):
         self.generation_calls.append(kwargs)
 
@@ -0,0 +1,439 @@
+"""
+Tests for Deadline-Aware Deployment Scheduling
+
+Tests verify throughput estimation, earliest-deadline-first planning,
+auto-start timing against a simulated clock, idle-capacity early starts,
+and interleaving of concurrent deployments through the deadline gate.
+"""
+
+import asyncio
+import json
+import logging
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from aiohttp.test_utils import make_mocked_request
+
+from deployment_api import (
+    DeploymentStatus,
+    ScheduledDeploymentManager,
+    handle_get_deployment_schedule,
+)
+from deployment_scheduler import (
+    DeadlineGate,
+    PlanItem,
+    ThroughputEstimator,
+    as_local_naive,
+    plan_deadlines,
+)
+from idle_manager import IdleState
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+START = datetime(2025, 3, 1, 9, 0)
+
+
+class SimulatedClock:
+    """Clock the tests move forward by hand."""
+
+    def __init__(self, now=START):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+class StubCache:
+    async def has(self, key):
+        return False
+
+    async def put(self, key, audio_data, sample_rate, duration):
+        pass
+
+
+class StubProvider:
+    """Resource pool that synthesizes after a short delay and logs the order."""
+
+    def __init__(self, slots=1, delay=0.001):
+        self.max_concurrent_background = slots
+        self.delay = delay
+        self.calls = []
+
+    def get_provider_limit(self, provider):
+        return self.max_concurrent_background
+
+    async def generate_with_priority(self, text, **kwargs):
+        self.calls.append(text)
+        await asyncio.sleep(self.delay)
+        return b"audio", 24000, 1.0
+
+
+class StubIdleManager:
+    def __init__(self, state=IdleState.ACTIVE):
+        self.enabled = True
+        self.current_state = state
+
+
+def make_manager(clock, pool=None, idle_manager=None, chars_per_second=10.0):
+    manager = ScheduledDeploymentManager(
+        StubCache(),
+        pool or StubProvider(),
+        idle_manager=idle_manager,
+        throughput=ThroughputEstimator(defaults={"vibevoice": chars_per_second}),
+        clock=clock,
+        safety_factor=1.0,
+    )
+
+    async def load_segments(curriculum_id):
+        # "<name>-<segments>": each segment is 100 characters
+        count = int(curriculum_id.rsplit("-", 1)[1])
+        return [f"{curriculum_id}:{i}".ljust(100, ".") for i in range(count)]
+
+    manager.set_segment_loader(load_segments)
+    return manager
+
+
+async def wait_for(manager, deployment):
+    _, task = manager._deployments[deployment.id]
+    await asyncio.wait_for(task, timeout=5.0)
+
+
+# =============================================================================
+# THROUGHPUT ESTIMATOR TESTS
+# =============================================================================
+
+
+class TestThroughputEstimator:
+    """Tests for ThroughputEstimator."""
+
+    def test_uses_defaults_until_measured(self):
+        estimator = ThroughputEstimator(defaults={"piper": 400.0})
+
+        assert estimator.chars_per_second("piper") == 400.0
+        assert estimator.estimate_seconds("piper", 800) == 2.0
+        assert estimator.estimate_seconds("piper", 800, parallelism=2) == 1.0
+
+    def test_measurements_are_smoothed(self):
+        estimator = ThroughputEstimator(defaults={}, smoothing=0.5)
+
+        estimator.record("vibevoice", 100, 1.0)
+        assert estimator.chars_per_second("vibevoice") == 100.0
+
+        estimator.record("vibevoice", 100, 0.5)
+        assert estimator.chars_per_second("vibevoice") == 150.0
+        assert estimator.to_dict()["vibevoice"] == {"chars_per_second": 150.0, "samples": 2}
+
+    def test_ignores_empty_measurements(self):
+        estimator = ThroughputEstimator(defaults={"x": 5.0})
+        estimator.record("x", 0, 1.0)
+        estimator.record("x", 10, 0.0)
+
+        assert estimator.chars_per_second("x") == 5.0
+
+
+# =============================================================================
+# PLANNER TESTS
+# =============================================================================
+
+
+class TestPlanDeadlines:
+    """Tests for plan_deadlines."""
+
+    @pytest.fixture
+    def estimator(self):
+        return ThroughputEstimator(defaults={"vibevoice": 1.0})
+
+    def test_orders_by_deadline_and_projects_finish(self, estimator):
+        items = [
+            PlanItem("late", START + timedelta(hours=10), "vibevoice", 3600),
+            PlanItem("early", START + timedelta(hours=2), "vibevoice", 3600),
+        ]
+
+        plan = plan_deadlines(items, START, estimator, safety_factor=1.0)
+
+        assert [entry.deployment_id for entry in plan] == ["early", "late"]
+        assert plan[0].projected_finish == START + timedelta(hours=1)
+        assert plan[1].projected_finish == START + timedelta(hours=2)
+        assert all(entry.feasible for entry in plan)
+
+    def test_latest_start_leaves_room_for_later_deadlines(self, estimator):
+        items = [
+            PlanItem("a", START + timedelta(hours=5), "vibevoice", 2 * 3600),
+            PlanItem("b", START + timedelta(hours=6), "vibevoice", 3 * 3600),
+        ]
+
+        a, b = plan_deadlines(items, START, estimator, safety_factor=1.0)
+
+        # b must start by 03:00, so a must finish by then and start by 01:00
+        assert b.latest_start == START + timedelta(hours=3)
+        assert a.latest_start == START + timedelta(hours=1)
+
+    def test_flags_infeasible_deadlines(self, estimator):
+        items = [
+            PlanItem("a", START + timedelta(hours=1), "vibevoice", 3600),
+            PlanItem("b", START + timedelta(hours=1, minutes=30), "vibevoice", 3600),
+        ]
+
+        a, b = plan_deadlines(items, START, estimator, safety_factor=1.0)
+
+        assert a.feasible
+        assert not b.feasible
+        assert b.slack_seconds == -30 * 60
+
+    def test_safety_factor_and_parallelism(self, estimator):
+        item = PlanItem("a", START + timedelta(hours=4), "vibevoice", 3600, parallelism=2)
+
+        (entry,) = plan_deadlines([item], START, estimator, safety_factor=1.5)
+
+        assert entry.estimated_seconds == 2700
+        assert entry.latest_start == START + timedelta(hours=4) - timedelta(seconds=2700)
+
+    def test_timezone_aware_deadlines_are_normalized(self):
+        aware = datetime(2025, 3, 1, 9, 0, tzinfo=timezone.utc)
+        assert as_local_naive(aware) == aware.astimezone().replace(tzinfo=None)
+        assert as_local_naive(START) is START
+
+
+# =============================================================================
+# DEADLINE GATE TESTS
+# =============================================================================
+
+
+class TestDeadlineGate:
+    """Tests for DeadlineGate."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_earliest_deadline_first(self):
+        gate = DeadlineGate(slots=1)
+        await gate.acquire(0)
+        order = []
+
+        async def waiter(deadline):
+            await gate.acquire(deadline)
+            order.append(deadline)
+            gate.release()
+
+        tasks = [asyncio.create_task(waiter(d)) for d in (30, 10, 20)]
+        await asyncio.sleep(0)
+        assert gate.waiting == 3
+
+        gate.release()
+        await asyncio.gather(*tasks)
+
+        assert order == [10, 20, 30]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        gate = DeadlineGate(slots=1)
+        await gate.acquire(0)
+
+        cancelled = asyncio.create_task(gate.acquire(1))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+
+        gate.release()
+        await asyncio.wait_for(gate.acquire(2), timeout=1.0)
+
+
+# =============================================================================
+# SCHEDULING TESTS
+# =============================================================================
+
+
+class TestDeadlineScheduling:
+    """Tests for auto-start timing with a simulated clock."""
+
+    @pytest.mark.asyncio
+    async def test_starts_at_latest_safe_time(self):
+        clock = SimulatedClock()
+        manager = make_manager(clock, chars_per_second=0.1)
+        # 6 segments x 100 chars at 0.1 chars/s = 6000s of synthesis
+        deployment = await manager.schedule_deployment(
+            "Training", "course-6", START + timedelta(hours=10)
+        )
+
+        await manager.tick()
+        assert deployment.status == DeploymentStatus.SCHEDULED
+        assert deployment.latest_start == START + timedelta(hours=10, seconds=-6000)
+        assert deployment.deadline_feasible
+
+        clock.advance(hours=8)
+        await manager.tick()
+        assert deployment.status == DeploymentStatus.SCHEDULED
+
+        clock.advance(hours=1)
+        await manager.tick()
+        await wait_for(manager, deployment)
+        assert deployment.status == DeploymentStatus.COMPLETED
+        assert deployment.generated_segments == 6
+
+    @pytest.mark.asyncio
+    async def test_idle_capacity_starts_early_within_window(self):
+        clock = SimulatedClock()
+        idle = StubIdleManager(IdleState.COOL)
+        manager = make_manager(clock, idle_manager=idle)
+        far = await manager.schedule_deployment("Far", "far-2", START + timedelta(days=3))
+        near = await manager.schedule_deployment("Near", "near-2", START + timedelta(hours=20))
+
+        await manager.tick()
+        await wait_for(manager, near)
+
+        assert near.status == DeploymentStatus.COMPLETED
+        assert far.status == DeploymentStatus.SCHEDULED
+
+    @pytest.mark.asyncio
+    async def test_busy_server_waits_for_latest_start(self):
+        clock = SimulatedClock()
+        manager = make_manager(clock, idle_manager=StubIdleManager(IdleState.ACTIVE))
+        deployment = await manager.schedule_deployment("Near", "near-2", START + timedelta(hours=20))
+
+        await manager.tick()
+
+        assert deployment.status == DeploymentStatus.SCHEDULED
+        assert not manager.has_idle_capacity()
+
+    @pytest.mark.asyncio
+    async def test_manual_deployments_are_not_auto_started(self):
+        clock = SimulatedClock()
+        manager = make_manager(clock)
+        deployment = await manager.schedule_deployment(
+            "Manual", "course-2", START + timedelta(minutes=1), auto_start=False
+        )
+
+        await manager.tick()
+
+        assert deployment.status == DeploymentStatus.SCHEDULED
+
+    @pytest.mark.asyncio
+    async def test_warns_once_for_infeasible_deadline(self, caplog):
+        clock = SimulatedClock()
+        manager = make_manager(clock, chars_per_second=0.01)
+        deployment = await manager.schedule_deployment(
+            "Rushed", "course-5", START + timedelta(hours=1), auto_start=False
+        )
+
+        with caplog.at_level(logging.WARNING, logger="deployment_api"):
+            await manager.plan_schedule()
+            await manager.plan_schedule()
+
+        assert deployment.deadline_feasible is False
+        warnings = [r for r in caplog.records if "miss its target date" in r.message]
+        assert len(warnings) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_curriculum_load_is_retried(self):
+        clock = SimulatedClock()
+        manager = make_manager(clock, chars_per_second=0.1)
+        loaded = {}
+
+        async def load_segments(curriculum_id):
+            return loaded.get(curriculum_id, [])
+
+        manager.set_segment_loader(load_segments)
+        deployment = await manager.schedule_deployment(
+            "Pending", "course", START + timedelta(hours=10), auto_start=False
+        )
+
+        (entry,) = await manager.plan_schedule()
+        assert entry.estimated_seconds == 0
+
+        loaded["course"] = ["x" * 100] * 6
+        (entry,) = await manager.plan_schedule()
+        assert entry.estimated_seconds == 6000
+        assert deployment.latest_start == START + timedelta(hours=10, seconds=-6000)
+
+    @pytest.mark.asyncio
+    async def test_measured_throughput_updates_plan(self):
+        clock = SimulatedClock()
+        manager = make_manager(clock, chars_per_second=0.001)
+        first = await manager.schedule_deployment("First", "first-3", START + timedelta(hours=1))
+        await manager.start_generation(first.id)
+        await wait_for(manager, first)
+
+        # The stub provider is far faster than the 0.001 chars/s prior
+        assert manager.throughput.chars_per_second("vibevoice") > 1000
+        second = await manager.schedule_deployment(
+            "Second", "second-3", START + timedelta(hours=1), auto_start=False
+        )
+        (entry,) = await manager.plan_schedule()
+        assert entry.deployment_id == second.id
+        assert entry.feasible
+
+
+class TestInterleaving:
+    """Tests for deployments sharing generation slots."""
+
+    @pytest.mark.asyncio
+    async def test_urgent_deployment_overtakes_running_one(self):
+        clock = SimulatedClock()
+        pool = StubProvider(slots=1, delay=0.005)
+        manager = make_manager(clock, pool=pool)
+        relaxed = await manager.schedule_deployment("Relaxed", "relaxed-6", START + timedelta(days=2))
+        urgent = await manager.schedule_deployment("Urgent", "urgent-3", START + timedelta(hours=2))
+
+        await manager.start_generation(relaxed.id)
+        while len(pool.calls) < 2:
+            await asyncio.sleep(0.001)
+        await manager.start_generation(urgent.id)
+        await wait_for(manager, urgent)
+        await wait_for(manager, relaxed)
+
+        owners = [call.split(":")[0] for call in pool.calls]
+        first_urgent = owners.index("urgent-3")
+        # Once the urgent deployment arrives it takes every slot until done
+        assert owners[first_urgent:first_urgent + 3] == ["urgent-3"] * 3
+        assert first_urgent < len(owners) - 3
+        assert relaxed.status == urgent.status == DeploymentStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_cancel_releases_slots(self):
+        clock = SimulatedClock()
+        pool = StubProvider(slots=1, delay=0.01)
+        manager = make_manager(clock, pool=pool)
+        first = await manager.schedule_deployment("First", "first-50", START + timedelta(hours=1))
+        second = await manager.schedule_deployment("Second", "second-2", START + timedelta(hours=2))
+
+        await manager.start_generation(first.id)
+        await manager.start_generation(second.id)
+        await asyncio.sleep(0.02)
+        await manager.cancel_deployment(first.id)
+        await wait_for(manager, second)
+
+        assert first.status == DeploymentStatus.CANCELLED
+        assert second.status == DeploymentStatus.COMPLETED
+
+
+# =============================================================================
+# API TESTS
+# =============================================================================
+
+
+class TestScheduleEndpoint:
+    """Tests for GET /api/deployments/schedule."""
+
+    @pytest.mark.asyncio
+    async def test_returns_plan(self):
+        clock = SimulatedClock()
+        manager = make_manager(clock, chars_per_second=0.01)
+        ok = await manager.schedule_deployment("Ok", "ok-1", START + timedelta(days=3))
+        late = await manager.schedule_deployment("Late", "late-9", START + timedelta(hours=2))
+
+        request = make_mocked_request(
+            "GET", "/api/deployments/schedule", app={"deployment_manager": manager}
+        )
+        response = await handle_get_deployment_schedule(request)
+        data = json.loads(response.body)
+
+        assert response.status == 200
+        assert [entry["deployment_id"] for entry in data["plan"]] == [late.id, ok.id]
+        assert data["infeasible"] == [late.id]
+        assert data["idle_capacity"] is False
+        assert "vibevoice" in data["throughput"]
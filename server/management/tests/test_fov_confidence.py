@@ -19,6 +19,8 @@ from fov_context.confidence import (
     ExpansionPriority,
     ExpansionRecommendation,
     ExpansionScope,
+    MarkerMatcher,
+    STREAM_HOLDBACK_CHARS,
 )
 
 
@@ -1235,3 +1237,132 @@ class TestIntegration:
         analysis = monitor.analyze_response("Another response.")
         assert analysis.trend == ConfidenceTrend.STABLE
         assert len(monitor._recent_scores) == 1
+
+
+# --- Compiled Matcher Tests ---
+
+
+class TestMarkerMatcher:
+    """Tests for the single-pass marker matcher."""
+
+    def test_matcher_compiled_once_per_class(self):
+        """Test monitors share one compiled matcher."""
+        assert ConfidenceMonitor()._matcher is ConfidenceMonitor()._matcher
+
+    def test_subclass_tables_get_own_matcher(self):
+        """Test a subclass overriding its tables is not served the base matcher."""
+
+        class CustomMonitor(ConfidenceMonitor):
+            HEDGING_PHRASES = {"i reckon": 0.9}
+
+        analysis = CustomMonitor().analyze_response("I reckon it is the mitochondria.")
+        assert analysis.hedging_score == 0.9
+        assert ConfidenceMonitor().analyze_response("I reckon so.").hedging_score == 0.0
+
+    def test_all_categories_found_in_one_scan(self):
+        """Test one scan reports every category."""
+        matcher = MarkerMatcher.for_monitor(ConfidenceMonitor)
+        text = "i think i can't help with that, i don't know, probably."
+        markers = {marker for _, marker, _ in matcher.scan(text)}
+        assert markers == {
+            ConfidenceMarker.HEDGING,
+            ConfidenceMarker.QUESTION_DEFLECTION,
+            ConfidenceMarker.KNOWLEDGE_GAP,
+            ConfidenceMarker.VAGUE_LANGUAGE,
+        }
+
+    def test_overlapping_markers_all_found(self):
+        """Test markers sharing text are each counted."""
+        counts = MarkerMatcher.for_monitor(ConfidenceMonitor).count("it might be probably fine")
+        assert "might be" in counts.hedging
+        assert counts.vague["probably"] == 1
+
+    @pytest.mark.parametrize("text", [
+        "an unlikely outcome",
+        "the surrounding field",
+        "we must think it over",
+        "they'll maybeline",
+    ])
+    def test_markers_respect_word_boundaries(self, text):
+        """Test markers inside longer words are ignored."""
+        analysis = ConfidenceMonitor().analyze_response(text)
+        assert analysis.hedging_score == 0.0
+        assert analysis.vague_language_score == 0.0
+
+    def test_vague_words_counted(self):
+        """Test repeated vague words are counted per occurrence."""
+        counts = MarkerMatcher.for_monitor(ConfidenceMonitor).count(
+            "probably yes, probably no, roughly"
+        )
+        assert counts.vague == {"probably": 2, "roughly": 1}
+
+
+# --- Streaming Tests ---
+
+
+class TestConfidenceStream:
+    """Tests for scoring responses as they are generated."""
+
+    RESPONSE = (
+        "Energy is conserved in a closed system. I'm not sure, but the heat "
+        "probably flows from hot to cold. I don't have information about "
+        "your specific experiment, so you should consult your lab notes. "
+    ) * 3
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 50, 1000])
+    def test_finish_matches_batch_analysis(self, chunk_size):
+        """Test the streamed result equals analyzing the whole response."""
+        expected = ConfidenceMonitor().analyze_response(self.RESPONSE)
+
+        stream = ConfidenceMonitor().stream()
+        for i in range(0, len(self.RESPONSE), chunk_size):
+            stream.feed(self.RESPONSE[i:i + chunk_size])
+        analysis = stream.finish()
+
+        assert analysis.confidence_score == pytest.approx(expected.confidence_score)
+        assert analysis.detected_markers == expected.detected_markers
+
+    def test_marker_split_across_chunks(self):
+        """Test a marker split between chunks is still found."""
+        stream = ConfidenceMonitor().stream()
+        stream.feed("Honestly, I don't ha")
+        analysis = stream.feed("ve information about that.")
+        assert ConfidenceMarker.KNOWLEDGE_GAP in analysis.detected_markers
+
+    def test_expansion_triggered_before_response_ends(self):
+        """Test a knowledge gap early in a long response triggers expansion."""
+        stream = ConfidenceMonitor().stream()
+        stream.feed("I don't have information about that course. ")
+        assert stream.should_expand is True
+        for _ in range(20):
+            stream.feed("Here is some general background on the topic. ")
+        assert stream.should_expand is True
+
+    def test_settled_matches_survive_long_tail(self):
+        """Test matches are kept once they scroll out of the held-back tail."""
+        stream = ConfidenceMonitor().stream()
+        stream.feed("I think so. ")
+        analysis = stream.feed("x " * STREAM_HOLDBACK_CHARS * 3)
+        assert analysis.hedging_score == pytest.approx(0.4)
+
+    def test_provisional_feeds_not_recorded(self):
+        """Test only finish() records a score for trend analysis."""
+        monitor = ConfidenceMonitor()
+        stream = monitor.stream()
+        stream.feed("I'm not sure. ")
+        stream.feed("Maybe.")
+        assert len(monitor._recent_scores) == 0
+
+        stream.finish()
+        assert len(monitor._recent_scores) == 1
+        assert monitor._last_analysis is not None
+
+    def test_finished_stream_rejects_input(self):
+        """Test a finished stream cannot be fed or finished again."""
+        stream = ConfidenceMonitor().stream()
+        stream.feed("Done.")
+        stream.finish()
+        with pytest.raises(RuntimeError):
+            stream.feed("more")
+        with pytest.raises(RuntimeError):
+            stream.finish()
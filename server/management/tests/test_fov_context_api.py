@@ -147,6 +147,7 @@ class MockWorkingBuffer:
         self.topic_content = "Topic content here"
         self.glossary_terms = [{"term": "physics", "definition": "science"}]
         self.misconception_triggers = []
+        self.retrieved_passages = []
 
 
 class MockEpisodicBuffer:
@@ -288,6 +289,7 @@ class MockSessionManager:
     """Mock session manager."""
     def __init__(self):
         self.sessions = {}
+        self.saved = []
 
     def create_session(self, curriculum_id, config):
         session = MockSession(curriculum_id=curriculum_id)
@@ -297,15 +299,33 @@ class MockSessionManager:
     def get_session(self, session_id):
         return self.sessions.get(session_id)
 
+    async def get_session_async(self, session_id):
+        return self.get_session(session_id)
+
     def list_sessions(self):
         return [s.get_state() for s in self.sessions.values()]
 
+    def save_session(self, session):
+        self.saved.append(session.session_id)
+
     def end_session(self, session_id):
         if session_id in self.sessions:
             del self.sessions[session_id]
             return True
         return False
 
+    async def create_session_async(self, curriculum_id, config):
+        return self.create_session(curriculum_id, config)
+
+    async def list_sessions_async(self):
+        return self.list_sessions()
+
+    async def save_session_async(self, session):
+        self.save_session(session)
+
+    async def end_session_async(self, session_id):
+        return self.end_session(session_id)
+
 
 # --- Fixtures ---
 
@@ -449,6 +469,7 @@ class TestSessionLifecycle:
             assert response.status == 200
             data = json.loads(response.body)
             assert data["state"] == "active"
+            assert mock_session_manager.saved == ["session-123"]
 
     @pytest.mark.asyncio
     async def test_start_session_not_found(self, mock_request_factory, mock_session_manager):
@@ -463,6 +484,23 @@ class TestSessionLifecycle:
 
             assert response.status == 404
 
+    @pytest.mark.asyncio
+    async def test_start_session_conflict(self, mock_request_factory, mock_session_manager):
+        """Test a save rejected because another worker changed the session."""
+        mock_session_manager.save_session_async = AsyncMock(
+            side_effect=fov_context_api.StaleSessionError("session-123")
+        )
+        with patch.object(fov_context_api, '_session_manager', mock_session_manager):
+            request = mock_request_factory(
+                method="POST",
+                match_info={"session_id": "session-123"}
+            )
+
+            with pytest.raises(web.HTTPConflict) as exc_info:
+                await fov_context_api.handle_start_session(request)
+
+            assert "error" in json.loads(exc_info.value.text)
+
     @pytest.mark.asyncio
     async def test_pause_session(self, mock_request_factory, mock_session_manager):
         """Test pausing a session."""
@@ -1171,6 +1209,30 @@ class TestDebugAndHealth:
             assert "features" in data
             assert data["features"]["confidence_monitoring"] is True
 
+    async def test_fov_memory_success(self, mock_request_factory):
+        """Test FOV memory stats endpoint."""
+        manager = fov_context_api.SessionManager()
+        manager.create_session("physics-101").add_user_turn("What is work?")
+        with patch.object(fov_context_api, '_session_manager', manager):
+            request = mock_request_factory(query_params={"top": "1"})
+
+            response = await fov_context_api.handle_fov_memory(request)
+
+            assert response.status == 200
+            data = json.loads(response.body)
+            assert data["fov_sessions"]["resident"] == 1
+            assert data["fov_sessions"]["total_bytes"] > 0
+            assert len(data["fov_sessions"]["largest"]) == 1
+            assert data["fov_sessions"]["largest"][0]["turns"] == 1
+
+    async def test_fov_memory_invalid_top(self, mock_request_factory):
+        """Test FOV memory stats endpoint rejects a non-integer top."""
+        request = mock_request_factory(query_params={"top": "many"})
+
+        response = await fov_context_api.handle_fov_memory(request)
+
+        assert response.status == 400
+
 
 # --- Route Registration Tests ---
 
@@ -1206,11 +1268,26 @@ class TestRouteRegistration:
             "/api/sessions/{session_id}/events",
             "/api/sessions/{session_id}/debug",
             "/api/fov/health",
+            "/api/fov/memory",
         ]
 
         for expected in expected_routes:
             assert any(expected in route for route in routes), f"Route {expected} not found"
 
+    async def test_setup_registers_session_reaper(self, tmp_path):
+        """Test that the reaper is tied to the app lifecycle."""
+        app = web.Application()
+        manager = fov_context_api.SessionManager()
+
+        with patch.object(fov_context_api, '_session_manager', manager):
+            fov_context_api.setup_fov_context_routes(app, spill_dir=tmp_path)
+            assert manager.spill_dir == tmp_path
+
+            await app.on_startup[-1](app)
+            assert manager._reaper_task is not None
+            await app.on_cleanup[-1](app)
+            assert manager._reaper_task is None
+
     def test_get_session_manager(self):
         """Test get_session_manager helper function."""
         manager = fov_context_api.get_session_manager()
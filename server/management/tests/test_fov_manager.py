@@ -791,6 +791,117 @@ class TestLLMMessagesBuilding:
         assert len(messages) == max_turns + 1
 
 
+class TestRenderCaching:
+    """Tests for cached buffer renderings."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = FOVContextManager.for_context_window(200_000)
+        manager.set_current_topic(
+            topic_id="topic-001",
+            topic_title="Thermodynamics",
+            topic_content="Energy is conserved.",
+            learning_objectives=["State the first law"],
+        )
+        manager.set_curriculum_position("physics", "Physics 101", 2, 10)
+        return manager
+
+    @staticmethod
+    def count_renders(manager):
+        counts = {}
+        for name in ("working", "episodic", "semantic"):
+            buffer = getattr(manager, f"{name}_buffer")
+            original = buffer.render
+
+            def render(budget, counter=None, name=name, original=original):
+                counts[name] = counts.get(name, 0) + 1
+                return original(budget, counter)
+
+            object.__setattr__(buffer, "render", render)
+        return counts
+
+    def test_steady_state_turns_reuse_renderings(self, manager):
+        """Test only the immediate buffer is rendered again on later turns."""
+        counts = self.count_renders(manager)
+
+        for i in range(5):
+            manager.add_conversation_turn(ConversationTurn(content=f"Question {i}"))
+            manager.build_messages_for_llm()
+
+        assert counts == {"working": 1, "episodic": 1, "semantic": 1}
+
+    @pytest.mark.parametrize("mutate, buffer", [
+        (lambda m: m.update_working_buffer(topic_title="Entropy"), "working"),
+        (lambda m: m.set_current_topic("t2", "Entropy", "", []), "working"),
+        (lambda m: m.record_user_question("Why?"), "episodic"),
+        (lambda m: m.record_clarification_request(), "episodic"),
+        (lambda m: m.record_confusion_signal(), "episodic"),
+        (lambda m: m.record_topic_completion(
+            TopicSummary(topic_id="t1", title="Heat", summary="", mastery_level=0.9)
+        ), "episodic"),
+        (lambda m: m.update_semantic_buffer(upcoming_topics=["Waves"]), "semantic"),
+        (lambda m: m.set_curriculum_position("physics", "Physics 101", 3, 10), "semantic"),
+    ])
+    def test_mutations_refresh_rendering(self, manager, mutate, buffer):
+        """Test each mutating method makes its buffer render again."""
+        before = manager.build_messages_for_llm()[0]["content"]
+
+        mutate(manager)
+        after = manager.build_messages_for_llm()[0]["content"]
+        fresh = FOVContextManager(
+            budget_config=manager.budget_config,
+            working_buffer=manager.working_buffer,
+            episodic_buffer=manager.episodic_buffer,
+            semantic_buffer=manager.semantic_buffer,
+        ).build_context().to_system_message()
+
+        assert after != before
+        assert after == fresh
+
+    def test_session_duration_only_invalidates_on_new_minute(self, manager):
+        """Test per-turn duration updates keep the cache until the minute changes."""
+        counts = self.count_renders(manager)
+        manager.build_context()
+
+        manager.update_session_duration()
+        manager.build_context()
+        assert counts["episodic"] == 1
+
+        manager.episodic_buffer.session_start = datetime.now() - timedelta(minutes=5)
+        manager.update_session_duration()
+        context = manager.build_context()
+        assert counts["episodic"] == 2
+        assert "Duration: 5 min" in context.episodic_context
+
+    def test_invalidate_after_direct_edit(self, manager):
+        """Test invalidate() picks up fields edited directly."""
+        manager.build_context()
+        manager.working_buffer.topic_title = "Edited"
+
+        assert "Edited" not in manager.build_context().working_context
+        manager.invalidate("working")
+        assert "Edited" in manager.build_context().working_context
+
+    def test_replaced_buffer_is_rendered(self, manager):
+        """Test assigning a new buffer object bypasses the cache."""
+        manager.build_context()
+        manager.reset()
+
+        context = manager.build_context()
+
+        assert context.working_context == ""
+        assert context.semantic_context == ""
+
+    def test_messages_match_uncached_context(self, manager):
+        """Test the cached system message equals FOVContext.to_messages()."""
+        history = [ConversationTurn(role=MessageRole.USER, content="Hello")]
+        manager.build_messages_for_llm(history)
+
+        messages = manager.build_messages_for_llm(history, barge_in_utterance="Wait")
+
+        assert messages[0] == manager.build_context(history, "Wait").to_messages()[0]
+
+
 # =============================================================================
 # State Management Tests
 # =============================================================================
@@ -0,0 +1,283 @@
+"""
+Tests for fov_context/retrieval.py and retrieval-backed context expansion.
+
+Tests cover:
+- Tokenization
+- Passage extraction from UMCF documents
+- BM25 ranking and filtering
+- Index persistence and staleness detection
+- FOVSession expansion into the working buffer
+"""
+
+import json
+
+import pytest
+
+from fov_context.confidence import ExpansionRecommendation, ExpansionPriority, ExpansionScope
+from fov_context.retrieval import (
+    CurriculumIndex,
+    CurriculumIndexStore,
+    passages_from_umcf,
+    tokenize,
+)
+from fov_context.session import FOVSession, SessionConfig, SessionManager
+
+
+def make_umcf() -> dict:
+    return {
+        "id": {"value": "physics-101"},
+        "title": "Physics 101",
+        "content": [{
+            "id": {"value": "root"},
+            "title": "Physics 101",
+            "children": [
+                {
+                    "id": {"value": "unit-energy"},
+                    "title": "Energy",
+                    "children": [
+                        {
+                            "id": {"value": "topic-conservation"},
+                            "title": "Conservation of Energy",
+                            "transcript": {"segments": [
+                                {"id": "seg-1", "content": "Energy cannot be created or destroyed in a closed system."},
+                                {"id": "seg-2", "content": "Kinetic energy turns into potential energy as a ball rises."},
+                            ]},
+                            "misconceptions": [{
+                                "id": "misc-1",
+                                "misconception": "Energy is used up when a car brakes",
+                                "triggerPhrases": ["used up"],
+                                "correction": "Braking converts kinetic energy into heat.",
+                            }],
+                        },
+                        {
+                            "id": {"value": "topic-heat"},
+                            "title": "Heat Engines",
+                            "content": {"text": "A heat engine converts heat into work. " * 30},
+                        },
+                    ],
+                },
+                {
+                    "id": {"value": "unit-waves"},
+                    "title": "Waves",
+                    "children": [{
+                        "id": {"value": "topic-sound"},
+                        "title": "Sound",
+                        "transcript": {"segments": [
+                            {"id": "seg-3", "content": "Sound is a pressure wave travelling through air."},
+                        ]},
+                    }],
+                },
+            ],
+        }],
+        "glossary": {"terms": [
+            {"id": "term-entropy", "term": "Entropy", "definition": "A measure of disorder in a system."},
+        ]},
+    }
+
+
+@pytest.fixture
+def index():
+    return CurriculumIndex.from_umcf(make_umcf())
+
+
+class TestTokenize:
+    """Tests for query and passage tokenization."""
+
+    def test_lowercases_and_drops_stopwords(self):
+        assert tokenize("The Energy of a System") == ["energy", "system"]
+
+    def test_folds_plurals(self):
+        assert tokenize("engines engine") == ["engine", "engine"]
+
+    def test_keeps_double_s(self):
+        assert tokenize("mass") == ["mass"]
+
+
+class TestPassageExtraction:
+    """Tests for passages_from_umcf."""
+
+    def test_extracts_all_kinds(self):
+        kinds = {p.kind for p in passages_from_umcf(make_umcf())}
+        assert kinds == {"segment", "text", "misconception", "glossary"}
+
+    def test_segments_keep_topic_and_unit(self):
+        passages = {p.passage_id: p for p in passages_from_umcf(make_umcf())}
+        segment = passages["seg-1"]
+        assert segment.topic_id == "topic-conservation"
+        assert segment.topic_title == "Conservation of Energy"
+        assert segment.unit_id == "unit-energy"
+
+    def test_long_text_split_into_passages(self):
+        text_passages = [p for p in passages_from_umcf(make_umcf()) if p.kind == "text"]
+        assert len(text_passages) > 1
+        assert all(len(p.text) <= 700 for p in text_passages)
+
+    def test_misconception_includes_correction(self):
+        passages = {p.passage_id: p for p in passages_from_umcf(make_umcf())}
+        assert "Braking converts kinetic energy into heat." in passages["misc-1"].text
+
+    def test_empty_document(self):
+        assert passages_from_umcf({}) == []
+
+
+class TestSearch:
+    """Tests for BM25 search."""
+
+    def test_best_match_first(self, index):
+        hits = index.search("why does sound travel through air", k=3)
+        assert hits[0].passage.passage_id == "seg-3"
+
+    def test_scores_descending(self, index):
+        hits = index.search("energy heat", k=10)
+        scores = [hit.score for hit in hits]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_respects_k(self, index):
+        assert len(index.search("energy", k=2)) == 2
+
+    def test_unknown_terms_return_nothing(self, index):
+        assert index.search("quantum chromodynamics") == []
+
+    def test_filter_limits_results(self, index):
+        hits = index.search("heat work", k=10, where=lambda p: p.topic_id == "topic-heat")
+        assert hits
+        assert all(hit.passage.topic_id == "topic-heat" for hit in hits)
+
+    def test_topic_unit(self, index):
+        assert index.topic_unit("topic-sound") == "unit-waves"
+        assert index.topic_unit("missing") is None
+
+
+class TestPersistence:
+    """Tests for CurriculumIndexStore."""
+
+    def test_round_trip_preserves_results(self, index):
+        restored = CurriculumIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+        query = "kinetic energy braking"
+        assert [(h.passage, h.score) for h in restored.search(query)] == [
+            (h.passage, h.score) for h in index.search(query)
+        ]
+
+    def test_saved_index_reused(self, tmp_path, monkeypatch):
+        umcf = make_umcf()
+        CurriculumIndexStore(tmp_path).load_or_build("physics", umcf)
+        assert (tmp_path / "physics.json").exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("index should be loaded, not rebuilt")
+
+        monkeypatch.setattr(CurriculumIndex, "build", fail)
+        index = CurriculumIndexStore(tmp_path).load_or_build("physics", umcf)
+        assert len(index) == len(passages_from_umcf(umcf))
+
+    def test_changed_curriculum_rebuilt(self, tmp_path):
+        umcf = make_umcf()
+        CurriculumIndexStore(tmp_path).load_or_build("physics", umcf)
+
+        umcf["glossary"]["terms"].append(
+            {"term": "Joule", "definition": "The SI unit of energy."}
+        )
+        index = CurriculumIndexStore(tmp_path).load_or_build("physics", umcf)
+        assert index.search("joule")
+
+    def test_corrupt_file_rebuilt(self, tmp_path):
+        (tmp_path / "physics.json").write_text("{not json")
+        index = CurriculumIndexStore(tmp_path).load_or_build("physics", make_umcf())
+        assert len(index) > 0
+
+    def test_remove_deletes_saved_copy(self, tmp_path):
+        store = CurriculumIndexStore(tmp_path)
+        store.load_or_build("physics", make_umcf())
+        store.remove("physics")
+        assert store.get("physics") is None
+        assert not (tmp_path / "physics.json").exists()
+
+    def test_memory_only_store(self):
+        store = CurriculumIndexStore()
+        assert store.load_or_build("physics", make_umcf()) is store.get("physics")
+
+
+def recommendation(scope: ExpansionScope, hint=None) -> ExpansionRecommendation:
+    return ExpansionRecommendation(
+        should_expand=True,
+        priority=ExpansionPriority.MEDIUM,
+        suggested_scope=scope,
+        reason="test",
+        query_hint=hint,
+    )
+
+
+class TestSessionExpansion:
+    """Tests for FOVSession.expand_context."""
+
+    @pytest.fixture
+    def session(self, index):
+        session = FOVSession.create("physics-101", retrieval_index=index)
+        session.set_current_topic("topic-conservation", "Conservation of Energy", "", [])
+        return session
+
+    def test_passages_added_to_working_buffer(self, session):
+        hits = session.expand_context(recommendation(ExpansionScope.FULL_CURRICULUM, "sound in air"))
+        assert hits[0].passage.passage_id == "seg-3"
+        working = session.context_manager.build_context().working_context
+        assert "RELATED MATERIAL" in working
+        assert "pressure wave" in working
+
+    def test_current_topic_scope(self, session):
+        hits = session.expand_context(recommendation(ExpansionScope.CURRENT_TOPIC, "energy heat"))
+        assert hits
+        assert all(h.passage.topic_id in ("topic-conservation", None) for h in hits)
+
+    def test_related_topics_scope_excludes_current(self, session):
+        hits = session.expand_context(recommendation(ExpansionScope.RELATED_TOPICS, "energy heat"))
+        assert hits
+        assert all(h.passage.topic_id != "topic-conservation" for h in hits)
+
+    def test_current_unit_scope(self, session):
+        hits = session.expand_context(recommendation(ExpansionScope.CURRENT_UNIT, "air wave energy"))
+        assert all(h.passage.unit_id in ("unit-energy", None) for h in hits)
+
+    def test_query_defaults_to_last_user_turn(self, session):
+        session.add_user_turn("How does sound move through air?")
+        hits = session.expand_context(recommendation(ExpansionScope.FULL_CURRICULUM))
+        assert hits[0].passage.passage_id == "seg-3"
+
+    def test_passages_stay_within_budget_share(self, index):
+        config = SessionConfig(model_context_window=4_000, retrieval_top_k=20)
+        session = FOVSession.create("physics-101", config, retrieval_index=index)
+        session.expand_context(recommendation(ExpansionScope.FULL_CURRICULUM, "heat engine work"))
+
+        manager = session.context_manager
+        counter = manager.budget_config.token_counter
+        used = sum(counter.count(p) for p in manager.working_buffer.retrieved_passages)
+        assert used <= manager.budget_config.budgets.working * config.retrieval_budget_share
+
+    def test_without_index_nothing_retrieved(self):
+        session = FOVSession.create("physics-101")
+        assert session.expand_context(recommendation(ExpansionScope.FULL_CURRICULUM, "energy")) == []
+
+    def test_low_confidence_response_triggers_retrieval(self, session):
+        session.add_user_turn("What happens to energy when a car brakes?")
+        _, rec = session.process_response_with_confidence(
+            "I don't have information about that, I'm not sure."
+        )
+        assert rec.should_expand is True
+        assert rec.query_hint == "What happens to energy when a car brakes?"
+        assert session.context_manager.working_buffer.retrieved_passages
+        assert session.get_events("context_expanded")
+
+    def test_topic_change_clears_passages(self, session):
+        session.expand_context(recommendation(ExpansionScope.FULL_CURRICULUM, "sound"))
+        session.set_current_topic("topic-sound", "Sound", "", [])
+        assert session.context_manager.working_buffer.retrieved_passages == []
+
+
+class TestSessionManagerIndexes:
+    """Tests for SessionManager attaching curriculum indexes."""
+
+    def test_session_gets_curriculum_index(self):
+        store = CurriculumIndexStore()
+        index = store.load_or_build("physics-101", make_umcf())
+        manager = SessionManager(retrieval_indexes=store)
+        assert manager.create_session("physics-101").retrieval_index is index
+        assert manager.create_session("other").retrieval_index is None
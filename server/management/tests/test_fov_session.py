@@ -10,9 +10,11 @@ Tests cover:
 - FOVSession class and all its methods
 - UserSession class and all its methods
 - SessionManager class and all its methods
+- Per-session caps, idle expiry, spilling to disk and memory stats
 - Edge cases, error handling, and boundary conditions
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
@@ -1488,6 +1490,254 @@ class TestSessionManagerUserSessions:
         assert manager.get_user_session(inactive_session.session_id) is None
 
 
+# --- Bounded Memory Tests ---
+
+
+class TestSessionCaps:
+    """Tests for per-session ring buffers."""
+
+    def test_history_capped_at_config_limit(self):
+        session = FOVSession.create("c1", SessionConfig(max_history_turns=5))
+        for i in range(12):
+            session.add_user_turn(f"turn {i}")
+
+        assert len(session.conversation_history) == 5
+        assert session.conversation_history[0].content == "turn 7"
+        assert session.total_turns == 12
+
+    def test_events_capped_at_config_limit(self):
+        session = FOVSession.create("c1", SessionConfig(max_events=10))
+        for i in range(30):
+            session.add_user_turn(f"turn {i}")
+
+        events = session.get_events()
+        assert len(events) == 10
+        assert events[-1]["data"]["content"] == "turn 29"
+
+    def test_context_still_built_from_capped_history(self):
+        session = FOVSession.create("c1", SessionConfig(max_history_turns=3))
+        for i in range(6):
+            session.add_user_turn(f"turn {i}")
+
+        context = session.build_llm_context()
+        assert "turn 5" in context.immediate_context
+        assert "turn 2" not in context.immediate_context
+
+    def test_records_use_slots(self):
+        assert not hasattr(SessionEvent(event_type="x"), "__dict__")
+        assert not hasattr(ConversationTurn(content="x"), "__dict__")
+
+    def test_activity_updates_last_active(self):
+        session = FOVSession.create("c1")
+        session.last_active_at = datetime.now() - timedelta(hours=1)
+        session.add_user_turn("hello")
+        assert datetime.now() - session.last_active_at < timedelta(seconds=5)
+
+    def test_memory_bytes_grows_with_history(self):
+        session = FOVSession.create("c1")
+        before = session.memory_bytes()
+        for i in range(20):
+            session.add_user_turn("a fairly long question about entropy " * 5)
+        assert session.memory_bytes() > before
+
+
+class TestSessionManagerEviction:
+    """Tests for SessionManager.reap, spilling and memory stats."""
+
+    def test_idle_sessions_expire(self):
+        manager = SessionManager(idle_ttl_minutes=30)
+        idle = manager.create_session("c1")
+        active = manager.create_session("c1")
+        idle.last_active_at = datetime.now() - timedelta(minutes=45)
+
+        result = manager.reap()
+
+        assert result["expired"] == 1
+        assert idle.state == SessionState.ENDED
+        assert manager.get_session(idle.session_id) is None
+        assert manager.get_session(active.session_id) is active
+
+    def test_idle_user_sessions_expire(self):
+        manager = SessionManager(idle_ttl_minutes=30)
+        user = manager.create_user_session("user-1")
+        user.last_active_at = datetime.now() - timedelta(minutes=45)
+
+        assert manager.reap()["user_sessions_expired"] == 1
+        assert manager.get_user_session_by_user("user-1") is None
+
+    def test_no_spill_without_directory(self):
+        manager = SessionManager(spill_after_minutes=1)
+        session = manager.create_session("c1")
+        session.last_active_at = datetime.now() - timedelta(minutes=5)
+
+        assert manager.reap()["spilled"] == 0
+        assert manager.get_session(session.session_id) is session
+
+    def test_cold_session_spilled_and_restored(self, tmp_path):
+        manager = SessionManager(spill_after_minutes=10, spill_dir=tmp_path)
+        session = manager.create_session("c1")
+        session.add_user_turn("What is entropy?")
+        session.last_active_at = datetime.now() - timedelta(minutes=15)
+
+        assert manager.reap()["spilled"] == 1
+        assert manager.memory_stats()["fov_sessions"]["resident"] == 0
+        assert (tmp_path / f"{session.session_id}.pkl").exists()
+        assert [s["session_id"] for s in manager.list_sessions()] == [session.session_id]
+
+        restored = manager.get_session(session.session_id)
+        assert restored is not None
+        assert restored.conversation_history[-1].content == "What is entropy?"
+        assert restored.conversation_history.maxlen == session.config.max_history_turns
+        assert not (tmp_path / f"{session.session_id}.pkl").exists()
+
+    def test_restored_session_gets_retrieval_index(self, tmp_path):
+        index = MagicMock()
+        store = MagicMock()
+        store.get.return_value = index
+        manager = SessionManager(retrieval_indexes=store, spill_after_minutes=1, spill_dir=tmp_path)
+        session = manager.create_session("c1")
+        session.last_active_at = datetime.now() - timedelta(minutes=5)
+        manager.reap()
+
+        assert manager.get_session(session.session_id).retrieval_index is index
+
+    def test_end_spilled_session(self, tmp_path):
+        manager = SessionManager(spill_after_minutes=1, spill_dir=tmp_path)
+        session = manager.create_session("c1")
+        session.last_active_at = datetime.now() - timedelta(minutes=5)
+        manager.reap()
+
+        assert manager.end_session(session.session_id) is True
+        assert manager.get_session(session.session_id) is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_spilled_session_expires(self, tmp_path):
+        manager = SessionManager(idle_ttl_minutes=30, spill_after_minutes=1, spill_dir=tmp_path)
+        session = manager.create_session("c1")
+        session.last_active_at = datetime.now() - timedelta(minutes=5)
+        manager.reap()
+
+        assert manager.reap(datetime.now() + timedelta(minutes=40))["expired"] == 1
+        assert manager.list_sessions() == []
+
+    def test_attached_session_not_spilled(self, tmp_path):
+        manager = SessionManager(spill_after_minutes=1, spill_dir=tmp_path)
+        user = manager.create_user_session("user-1")
+        session = manager.create_session("c1")
+        user.attach_fov_session(session)
+        session.last_active_at = datetime.now() - timedelta(minutes=5)
+
+        assert manager.reap()["spilled"] == 0
+
+    def test_stale_spill_files_removed(self, tmp_path):
+        (tmp_path / "old-session.pkl").write_bytes(b"stale")
+        manager = SessionManager(spill_after_minutes=1, spill_dir=tmp_path)
+        session = manager.create_session("c1")
+        session.last_active_at = datetime.now() - timedelta(minutes=5)
+        manager.reap()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [f"{session.session_id}.pkl"]
+
+    async def test_reap_async_spills_and_restores(self, tmp_path):
+        manager = SessionManager(spill_after_minutes=10, spill_dir=tmp_path)
+        session = manager.create_session("c1")
+        session.add_user_turn("What is entropy?")
+        session.last_active_at = datetime.now() - timedelta(minutes=15)
+
+        assert (await manager.reap_async())["spilled"] == 1
+        assert manager.memory_stats()["fov_sessions"]["resident"] == 0
+
+        first, second = await asyncio.gather(
+            manager.get_session_async(session.session_id),
+            manager.get_session_async(session.session_id),
+        )
+        assert first is second
+        assert first.conversation_history[-1].content == "What is entropy?"
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_spill_does_not_block_event_loop(self, tmp_path):
+        manager = SessionManager(spill_after_minutes=1, spill_dir=tmp_path)
+        for _ in range(3):
+            manager.create_session("c1").last_active_at = datetime.now() - timedelta(minutes=5)
+        write_spill = manager._write_spill
+
+        def slow_write(session):
+            time.sleep(0.05)
+            return write_spill(session)
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(tick())
+        with patch.object(manager, "_write_spill", side_effect=slow_write):
+            assert (await manager.reap_async())["spilled"] == 3
+        ticker.cancel()
+
+        assert ticks > 10
+
+    async def test_session_used_during_spill_stays_resident(self, tmp_path):
+        manager = SessionManager(spill_after_minutes=1, spill_dir=tmp_path)
+        session = manager.create_session("c1")
+        session.last_active_at = datetime.now() - timedelta(minutes=5)
+        write_spill = manager._write_spill
+
+        def write_then_touch(spilled):
+            written = write_spill(spilled)
+            # A request arrives while the file is being written
+            spilled.add_user_turn("still here")
+            return written
+
+        with patch.object(manager, "_write_spill", side_effect=write_then_touch):
+            assert (await manager.reap_async())["spilled"] == 0
+
+        assert manager.get_session(session.session_id) is session
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_session_ended_during_restore(self, tmp_path):
+        manager = SessionManager(spill_after_minutes=1, spill_dir=tmp_path)
+        session = manager.create_session("c1")
+        session.last_active_at = datetime.now() - timedelta(minutes=5)
+        await manager.reap_async()
+
+        restore = asyncio.create_task(manager.get_session_async(session.session_id))
+        await asyncio.sleep(0)
+        manager.end_session(session.session_id)
+
+        assert await restore is None
+        assert manager.list_sessions() == []
+
+    def test_memory_stats(self):
+        manager = SessionManager()
+        small = manager.create_session("c1")
+        large = manager.create_session("c1")
+        for i in range(20):
+            large.add_user_turn("tell me more about the second law " * 4)
+        manager.create_user_session("user-1")
+
+        stats = manager.memory_stats(top=1)
+        fov = stats["fov_sessions"]
+        assert fov["resident"] == 2
+        assert fov["largest"][0]["session_id"] == large.session_id
+        assert fov["max_bytes"] > small.memory_bytes()
+        assert fov["total_bytes"] == sum(s.memory_bytes() for s in (small, large))
+        assert stats["user_sessions"]["count"] == 1
+        assert stats["limits"]["spill_enabled"] is False
+
+    async def test_reaper_task_lifecycle(self):
+        manager = SessionManager()
+        manager.start_reaper(interval_seconds=0.01)
+        task = manager._reaper_task
+        assert not task.done()
+        await manager.stop_reaper()
+        assert task.cancelled()
+        assert manager._reaper_task is None
+
+
 # --- Edge Cases and Integration Tests ---
 
 
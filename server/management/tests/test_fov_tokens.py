@@ -0,0 +1,199 @@
+"""
+Tests for fov_context/tokens.py (token counting and budget packing).
+
+Tests cover:
+- Heuristic BPE approximation
+- Counter selection and LRU caching
+- Word-boundary truncation
+- Priority-aware packing of buffer sections
+- Buffer rendering and manager wiring with a custom counter
+"""
+
+import pytest
+
+from fov_context.manager import FOVContextManager
+from fov_context.models import (
+    AdaptiveBudgetConfig,
+    ConversationTurn,
+    ImmediateBuffer,
+    MessageRole,
+    WorkingBuffer,
+)
+from fov_context.tokens import (
+    CachedTokenCounter,
+    HeuristicTokenCounter,
+    PackItem,
+    TokenCounter,
+    get_token_counter,
+    pack_items,
+    truncate_to_tokens,
+)
+
+
+class WordCounter(TokenCounter):
+    """One token per whitespace-separated word, recording calls."""
+
+    name = "words"
+
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+
+@pytest.fixture
+def words():
+    return WordCounter()
+
+
+class TestHeuristicTokenCounter:
+    """Tests for the regex BPE approximation."""
+
+    def test_empty_text(self):
+        assert HeuristicTokenCounter().count("") == 0
+
+    def test_common_words_are_one_token_each(self):
+        assert HeuristicTokenCounter().count("the cat sat on the mat") == 6
+
+    def test_long_words_cost_more(self):
+        counter = HeuristicTokenCounter()
+        assert counter.count("thermodynamically") > counter.count("heat")
+
+    def test_numbers_split_into_three_digit_groups(self):
+        assert HeuristicTokenCounter().count("1234567") == 3
+
+    def test_denser_than_four_chars_for_code_like_text(self):
+        text = "f(x)={a:[1,2]};"
+        assert HeuristicTokenCounter().count(text) > len(text) // 4
+
+
+class TestCounterSelection:
+    """Tests for get_token_counter and CachedTokenCounter."""
+
+    def test_shared_counter_is_singleton(self):
+        assert get_token_counter() is get_token_counter()
+
+    def test_shared_counter_is_cached(self):
+        assert isinstance(get_token_counter(), CachedTokenCounter)
+
+    def test_none_encoding_forces_heuristic(self):
+        assert get_token_counter(None).name == "heuristic"
+
+    def test_cache_skips_repeat_counts(self, words):
+        cached = CachedTokenCounter(words, maxsize=8)
+        assert cached.count("one two three") == 3
+        assert cached.count("one two three") == 3
+        assert words.calls == 1
+        assert cached.cache_info().hits == 1
+
+    def test_config_uses_shared_counter_by_default(self):
+        config = AdaptiveBudgetConfig.for_model("gpt-4o")
+        assert config.token_counter is get_token_counter()
+
+    def test_config_accepts_custom_counter(self, words):
+        config = AdaptiveBudgetConfig.from_context_window(8_000, token_counter=words)
+        assert config.token_counter is words
+
+
+class TestTruncateToTokens:
+    """Tests for truncate_to_tokens."""
+
+    def test_text_within_budget_is_unchanged(self, words):
+        assert truncate_to_tokens("a b c", 3, words) == "a b c"
+
+    def test_cuts_at_word_boundary(self, words):
+        result = truncate_to_tokens("alpha beta gamma delta", 2, words)
+        assert result == "alpha beta..."
+
+    def test_result_fits_budget(self):
+        counter = HeuristicTokenCounter()
+        text = "Energy is conserved in a closed system. " * 50
+        for budget in (5, 17, 64):
+            assert counter.count(truncate_to_tokens(text, budget, counter)) <= budget
+
+    def test_unbroken_text_cut_by_characters(self):
+        counter = HeuristicTokenCounter()
+        result = truncate_to_tokens("x" * 10000, 100, counter)
+        assert result.endswith("...")
+        assert counter.count(result) <= 100
+
+    def test_zero_budget_returns_empty(self, words):
+        assert truncate_to_tokens("a b c", 0, words) == ""
+
+
+class TestPackItems:
+    """Tests for priority-aware packing."""
+
+    def test_everything_fits(self, words):
+        items = [PackItem("a b", 1), PackItem("c d", 2)]
+        assert pack_items(items, 10, words) == "a b\n\nc d"
+
+    def test_drops_lowest_priority_items_whole(self, words):
+        items = [
+            PackItem("low priority words here", 1),
+            PackItem("keep this", 10),
+            PackItem("also keep", 5),
+        ]
+        assert pack_items(items, 5, words) == "keep this\n\nalso keep"
+
+    def test_keeps_display_order(self, words):
+        items = [PackItem("first", 1), PackItem("second", 3), PackItem("third", 2)]
+        assert pack_items(items, 10, words) == "first\n\nsecond\n\nthird"
+
+    def test_truncatable_item_fills_remaining_budget(self, words):
+        items = [
+            PackItem("title", 10),
+            PackItem("one two three four five six", 1, truncatable=True),
+        ]
+        assert pack_items(items, 4, words) == "title\n\none two three..."
+
+    def test_most_important_item_is_cut_rather_than_dropped(self, words):
+        items = [PackItem("a b c d e f", 10), PackItem("x", 1)]
+        assert pack_items(items, 3, words) == "a b c..."
+
+    def test_empty_items_ignored(self, words):
+        assert pack_items([PackItem("", 5)], 10, words) == ""
+
+
+class TestBufferRendering:
+    """Tests for buffers rendered through a token counter."""
+
+    def test_immediate_buffer_drops_oldest_turns_first(self, words):
+        buffer = ImmediateBuffer(recent_turns=[
+            ConversationTurn(role=MessageRole.USER, content="oldest turn text"),
+            ConversationTurn(role=MessageRole.ASSISTANT, content="middle turn text"),
+            ConversationTurn(role=MessageRole.USER, content="newest turn text"),
+        ])
+        rendered = buffer.render(9, words)
+        assert "oldest" not in rendered
+        assert rendered == "User: newest turn text\n\nTutor: middle turn text"
+
+    def test_working_buffer_trims_outline_before_objectives(self, words):
+        buffer = WorkingBuffer(
+            topic_title="Entropy",
+            topic_content="word " * 200,
+            learning_objectives=["Define entropy"],
+        )
+        rendered = buffer.render(20, words)
+        assert "LEARNING OBJECTIVES" in rendered
+        assert "TOPIC OUTLINE" in rendered
+        assert words.count(rendered) <= 20
+
+    def test_manager_uses_configured_counter(self, words):
+        config = AdaptiveBudgetConfig.from_context_window(8_000, token_counter=words)
+        manager = FOVContextManager(budget_config=config)
+        manager.set_current_topic("t1", "Entropy", "content " * 50, ["Define entropy"])
+        context = manager.build_context([
+            ConversationTurn(role=MessageRole.USER, content="why does entropy grow")
+        ])
+        assert words.calls > 0
+        expected = sum(words.count(section) for section in (
+            context.system_prompt,
+            context.immediate_context,
+            context.working_context,
+            context.episodic_context,
+            context.semantic_context,
+        ))
+        assert context.total_token_estimate == expected
@@ -418,6 +418,101 @@ class TestKBAudioManagerCoverage:
         assert status.total_segments == 12
 
 
+class TestCoverageIndex:
+    """Tests for cached, incrementally maintained coverage."""
+
+    @pytest.mark.asyncio
+    async def test_coverage_tracks_generation_without_recompute(self, tmp_kb_dir, sample_module_content):
+        """Test coverage follows segments as they are written."""
+        manager = KBAudioManager(str(tmp_kb_dir), TrackingResourcePool(), delay_between_requests=0.0)
+        await manager.initialize()
+        before = manager.get_coverage_status("test-module", sample_module_content, content_version=1)
+        assert before.covered_segments == 0
+
+        await run_job(manager, sample_module_content)
+
+        after = manager.get_cached_coverage("test-module", content_version=1)
+        assert after.covered_segments == 12
+        assert after.covered_questions == 3
+        assert after.is_complete
+        assert after.total_size_bytes == manager._manifests["test-module"].total_size_bytes
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_skips_content(self, kb_manager, sample_module_content):
+        """Test a matching content version answers without reading content."""
+        kb_manager.get_coverage_status("test-module", sample_module_content, content_version="v1")
+
+        status = kb_manager.get_coverage_status("test-module", {}, content_version="v1")
+
+        assert status.total_segments == 12
+        assert kb_manager.get_cached_coverage("test-module", "v2") is None
+
+    @pytest.mark.asyncio
+    async def test_layout_change_rebuilds(self, kb_manager, sample_module_content):
+        """Test new content with a different segment layout is recounted."""
+        kb_manager.get_coverage_status("test-module", sample_module_content, content_version=1)
+        sample_module_content["domains"][1]["questions"][0]["hints"] = ["Count"]
+
+        status = kb_manager.get_coverage_status("test-module", sample_module_content, content_version=2)
+
+        assert status.total_segments == 13
+
+    @pytest.mark.asyncio
+    async def test_manifest_entries_outside_content_are_ignored(self, kb_manager, sample_module_content):
+        """Test only segments the content defines count as covered."""
+        manifest = KBManifest(
+            module_id="test-module", voice_id="nova", provider="vibevoice",
+            generated_at=datetime.now(),
+        )
+        for qid, key in (("sci-001", "question"), ("sci-001", "hint_5"), ("gone-001", "question")):
+            manifest.segments.setdefault(qid, {})[key] = KBAudioEntry(
+                question_id=qid, segment_type="question", file_path="/x.wav",
+                size_bytes=100, duration_seconds=1.0, sample_rate=24000,
+                created_at=datetime.now(),
+            )
+        kb_manager._manifests["test-module"] = manifest
+
+        status = kb_manager.get_coverage_status("test-module", sample_module_content)
+
+        assert status.covered_segments == 1
+        assert status.total_size_bytes == 100
+
+
+class TestSegmentAvailability:
+    """Tests for batch availability lookups."""
+
+    @pytest.mark.asyncio
+    async def test_availability_from_manifest(self, tmp_kb_dir, sample_module_content):
+        """Test available and missing segments are reported with totals."""
+        manager = KBAudioManager(str(tmp_kb_dir), TrackingResourcePool(), delay_between_requests=0.0)
+        await manager.initialize()
+        await run_job(manager, sample_module_content)
+
+        result = manager.get_segment_availability(
+            "test-module", ["sci-002", "unknown"], ["question", "hint_0", "hint_1"]
+        )
+
+        assert result["segments"]["sci-002"]["question"]["available"] is True
+        assert result["segments"]["sci-002"]["hint_1"]["available"] is False
+        assert result["available_count"] == 2
+        assert result["missing_count"] == 4
+        assert result["total_size_bytes"] == sum(
+            manager._manifests["test-module"].segments["sci-002"][k].size_bytes
+            for k in ("question", "hint_0")
+        )
+
+    @pytest.mark.asyncio
+    async def test_table_rebuilt_when_manifest_replaced(self, tmp_kb_dir, sample_module_content):
+        """Test a regenerated manifest is picked up."""
+        manager = KBAudioManager(str(tmp_kb_dir), TrackingResourcePool(), delay_between_requests=0.0)
+        await manager.initialize()
+        assert manager.get_segment_availability("test-module", ["sci-001"], ["question"])["available_count"] == 0
+
+        await run_job(manager, sample_module_content)
+
+        assert manager.get_segment_availability("test-module", ["sci-001"], ["question"])["available_count"] == 1
+
+
 class TestKBAudioManagerGetAudio:
     """Tests for audio retrieval."""
 
@@ -758,6 +853,159 @@ class TestCancelJob:
         task.cancel.assert_called_once()
 
 
+# =============================================================================
+# MODULE GENERATION TESTS
+# =============================================================================
+
+
+class TrackingResourcePool:
+    """Resource pool that records concurrency and can fail or block segments."""
+
+    def __init__(self, fail_texts=(), block_after=None):
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+        self.fail_texts = set(fail_texts)
+        self.block_after = block_after
+        self.blocked = asyncio.Event()
+
+    async def generate_with_priority(self, text, voice_id, provider, speed, chatterbox_config, priority):
+        self.calls.append(text)
+        if self.block_after is not None and len(self.calls) > self.block_after:
+            self.blocked.set()
+            await asyncio.Event().wait()
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if text in self.fail_texts:
+                raise RuntimeError("TTS error")
+            return b"RIFF" + text.encode(), 24000, 1.5
+        finally:
+            self.active -= 1
+
+
+async def run_job(manager, module_content, **kwargs):
+    job_id = await manager.prefetch_module("test-module", module_content, **kwargs)
+    task, progress = manager._jobs[job_id]
+    await task
+    return progress
+
+
+class TestGenerateModuleAudio:
+    """Tests for parallel, resumable module generation."""
+
+    @pytest.mark.asyncio
+    async def test_generates_with_bounded_concurrency(self, tmp_kb_dir, sample_module_content):
+        pool = TrackingResourcePool()
+        manager = KBAudioManager(str(tmp_kb_dir), pool, delay_between_requests=0.0, max_concurrent=3)
+        await manager.initialize()
+
+        progress = await run_job(manager, sample_module_content)
+
+        assert progress.status == "completed"
+        assert progress.generated == 12
+        assert pool.max_active == 3
+        assert (tmp_kb_dir / "test-module" / "sci-001" / "hint_1.wav").exists()
+        assert not list((tmp_kb_dir / "test-module").rglob("*.tmp"))
+
+        manifest = json.loads((tmp_kb_dir / "test-module" / "manifest.json").read_text())
+        assert "complete" not in manifest
+        assert manifest["total_segments"] == 12
+        assert manifest["total_questions"] == 3
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_existing_files_and_manifest(self, tmp_kb_dir, sample_module_content):
+        pool = TrackingResourcePool()
+        manager = KBAudioManager(str(tmp_kb_dir), pool, delay_between_requests=0.0)
+        await manager.initialize()
+        await run_job(manager, sample_module_content)
+
+        # Lose one file; the rest should be reused with their recorded durations
+        (tmp_kb_dir / "test-module" / "sci-002" / "answer.wav").unlink()
+        pool.calls.clear()
+
+        progress = await run_job(manager, sample_module_content)
+
+        assert pool.calls == ["Water"]
+        assert progress.cached == 11
+        assert progress.generated == 1
+        manifest = await manager.get_manifest("test-module")
+        assert manifest.segments["sci-001"]["question"].duration_seconds == 1.5
+
+    @pytest.mark.asyncio
+    async def test_force_regenerate_ignores_existing(self, tmp_kb_dir, sample_module_content):
+        pool = TrackingResourcePool()
+        manager = KBAudioManager(str(tmp_kb_dir), pool, delay_between_requests=0.0)
+        await manager.initialize()
+        await run_job(manager, sample_module_content)
+        pool.calls.clear()
+
+        progress = await run_job(manager, sample_module_content, force_regenerate=True)
+
+        assert progress.generated == 12
+        assert len(pool.calls) == 12
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted(self, tmp_kb_dir, sample_module_content):
+        pool = TrackingResourcePool(fail_texts={"Water"})
+        manager = KBAudioManager(str(tmp_kb_dir), pool, delay_between_requests=0.0)
+        await manager.initialize()
+
+        progress = await run_job(manager, sample_module_content)
+
+        assert progress.status == "completed_with_errors"
+        assert progress.failed == 1
+        assert progress.completed == 12
+        manifest = await manager.get_manifest("test-module")
+        assert manifest.total_segments == 11
+
+    @pytest.mark.asyncio
+    async def test_cancel_checkpoints_manifest(self, tmp_kb_dir, sample_module_content):
+        pool = TrackingResourcePool(block_after=4)
+        manager = KBAudioManager(
+            str(tmp_kb_dir), pool, delay_between_requests=0.0,
+            max_concurrent=1, checkpoint_interval=100,
+        )
+        await manager.initialize()
+
+        job_id = await manager.prefetch_module("test-module", sample_module_content)
+        await pool.blocked.wait()
+        await manager.cancel(job_id)
+        task, progress = manager._jobs[job_id]
+        await asyncio.gather(task, return_exceptions=True)
+
+        manifest = json.loads((tmp_kb_dir / "test-module" / "manifest.json").read_text())
+        assert manifest["complete"] is False
+        assert manifest["total_segments"] == 4
+
+        # A rerun only generates what the cancelled job did not
+        pool.block_after = None
+        pool.calls.clear()
+        progress = await run_job(manager, sample_module_content)
+        assert progress.cached == 4
+        assert len(pool.calls) == 8
+
+    @pytest.mark.asyncio
+    async def test_periodic_checkpoints(self, tmp_kb_dir, sample_module_content):
+        pool = TrackingResourcePool(block_after=5)
+        manager = KBAudioManager(
+            str(tmp_kb_dir), pool, delay_between_requests=0.0,
+            max_concurrent=1, checkpoint_interval=2,
+        )
+        await manager.initialize()
+
+        job_id = await manager.prefetch_module("test-module", sample_module_content)
+        await pool.blocked.wait()
+
+        manifest = json.loads((tmp_kb_dir / "test-module" / "manifest.json").read_text())
+        assert manifest["complete"] is False
+        assert manifest["total_segments"] == 4
+
+        await manager.cancel(job_id)
+        await asyncio.gather(manager._jobs[job_id][0], return_exceptions=True)
+
+
 # =============================================================================
 # FEEDBACK AUDIO GENERATION TESTS
 # =============================================================================
@@ -0,0 +1,250 @@
+"""
+Tests for Knowledge Bowl Audio Packs
+
+Tests verify pack building and parsing, subset re-packing, staleness-driven
+rebuilds in KBAudioManager and the pack download endpoints.
+"""
+
+import io
+import pytest
+from datetime import datetime
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+import tts_api
+from tts_cache.kb_audio import KBAudioEntry, KBAudioManager, KBManifest
+from tts_cache.kb_audio_pack import (
+    PACK_CONTENT_TYPE,
+    KBAudioPack,
+    build_pack,
+    read_index,
+)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+AUDIO = {
+    ("q-001", "question"): b"RIFF-question-one",
+    ("q-001", "answer"): b"RIFF-answer-one",
+    ("q-001", "hint_0"): b"RIFF-hint-zero",
+    ("q-001", "hint_1"): b"RIFF-hint-one",
+    ("q-002", "question"): b"RIFF-question-two" * 50,
+}
+
+
+def write_module(base_dir, module_id="test-module", generated_at=None):
+    """Write audio files and return a matching manifest."""
+    module_dir = base_dir / module_id
+    manifest = KBManifest(
+        module_id=module_id,
+        voice_id="nova",
+        provider="vibevoice",
+        generated_at=generated_at or datetime(2026, 1, 1),
+    )
+    for (qid, stem), data in AUDIO.items():
+        (module_dir / qid).mkdir(parents=True, exist_ok=True)
+        path = module_dir / qid / f"{stem}.wav"
+        path.write_bytes(data)
+        manifest.segments.setdefault(qid, {})[stem] = KBAudioEntry(
+            question_id=qid,
+            segment_type="hint" if stem.startswith("hint_") else stem,
+            file_path=str(path),
+            size_bytes=len(data),
+            duration_seconds=1.25,
+            sample_rate=24000,
+            created_at=datetime(2026, 1, 1),
+            hint_index=int(stem[5:]) if stem.startswith("hint_") else 0,
+        )
+    return module_dir, manifest
+
+
+@pytest.fixture
+async def manager(tmp_path):
+    manager = KBAudioManager(str(tmp_path / "kb_audio"), resource_pool=None)
+    await manager.initialize()
+    module_dir, manifest = write_module(manager.base_dir)
+    manager._manifests["test-module"] = manifest
+    return manager
+
+
+# =============================================================================
+# PACK FORMAT
+# =============================================================================
+
+
+class TestBuildPack:
+    """Tests for writing and reading packs."""
+
+    def test_round_trip(self, tmp_path):
+        module_dir, manifest = write_module(tmp_path)
+
+        path = build_pack(module_dir, manifest)
+        pack = KBAudioPack(path)
+
+        assert len(pack.index.entries) == len(AUDIO)
+        for (qid, stem), data in AUDIO.items():
+            entry = pack.get(qid, stem)
+            assert bytes(pack.read(entry)) == data
+            assert entry.duration_seconds == 1.25
+        assert pack.size_bytes == path.stat().st_size
+        pack.close()
+
+    def test_offsets_are_absolute(self, tmp_path):
+        module_dir, manifest = write_module(tmp_path)
+        path = build_pack(module_dir, manifest)
+
+        raw = path.read_bytes()
+        with open(path, "rb") as f:
+            index, header_length = read_index(f)
+
+        assert index.entries[0].offset == header_length
+        for entry in index.entries:
+            key = (entry.question_id, entry.segment)
+            assert raw[entry.offset:entry.offset + entry.length] == AUDIO[key]
+
+    def test_missing_files_are_skipped(self, tmp_path):
+        module_dir, manifest = write_module(tmp_path)
+        (module_dir / "q-001" / "answer.wav").unlink()
+
+        pack = KBAudioPack(build_pack(module_dir, manifest))
+
+        assert pack.get("q-001", "answer") is None
+        assert len(pack.index.entries) == len(AUDIO) - 1
+        pack.close()
+
+    def test_rejects_non_pack(self, tmp_path):
+        path = tmp_path / "bogus.kbpack"
+        path.write_bytes(b"NOPE" + b"\x00" * 20)
+        with pytest.raises(ValueError):
+            KBAudioPack(path)
+
+
+class TestSubset:
+    """Tests for selecting and re-packing entries."""
+
+    def test_select_by_question_and_segment(self, tmp_path):
+        module_dir, manifest = write_module(tmp_path)
+        pack = KBAudioPack(build_pack(module_dir, manifest))
+
+        hints = pack.select(question_ids=["q-001"], segments=["hint"])
+        assert [e.segment for e in hints] == ["hint_0", "hint_1"]
+        assert len(pack.select(segments=["question"])) == 2
+        pack.close()
+
+    def test_subset_is_a_valid_pack(self, tmp_path):
+        module_dir, manifest = write_module(tmp_path)
+        pack = KBAudioPack(build_pack(module_dir, manifest))
+
+        header, views = pack.subset(pack.select(segments=["question"]))
+        data = header + b"".join(bytes(v) for v in views)
+        index, _ = read_index(io.BytesIO(data))
+
+        assert len(index.entries) == 2
+        for entry in index.entries:
+            key = (entry.question_id, entry.segment)
+            assert data[entry.offset:entry.offset + entry.length] == AUDIO[key]
+        pack.close()
+
+    def test_subset_survives_close_while_streaming(self, tmp_path):
+        module_dir, manifest = write_module(tmp_path)
+        pack = KBAudioPack(build_pack(module_dir, manifest))
+        entries = pack.select(segments=["question"])
+
+        _, views = pack.subset(entries)
+        # Pack invalidated before any audio was written
+        pack.close()
+
+        for entry, view in zip(entries, views):
+            assert bytes(view) == AUDIO[(entry.question_id, entry.segment)]
+
+
+# =============================================================================
+# MANAGER
+# =============================================================================
+
+
+class TestManagerGetPack:
+    """Tests for KBAudioManager.get_pack."""
+
+    async def test_builds_and_reuses(self, manager):
+        first = await manager.get_pack("test-module")
+        second = await manager.get_pack("test-module")
+
+        assert first is second
+        assert first.path.exists()
+
+    async def test_rebuilds_when_manifest_changes(self, manager):
+        first = await manager.get_pack("test-module")
+        manager._manifests["test-module"].generated_at = datetime(2026, 2, 1)
+
+        second = await manager.get_pack("test-module")
+
+        assert second is not first
+        assert second.index.manifest_generated_at == datetime(2026, 2, 1)
+
+    async def test_unknown_or_invalid_module(self, manager):
+        assert await manager.get_pack("missing") is None
+        assert await manager.get_pack("../etc") is None
+
+    async def test_unavailable_format_falls_back_to_wav(self, manager):
+        pack = await manager.get_pack("test-module", "flac")
+        assert pack.index.format == "wav"
+
+
+# =============================================================================
+# ENDPOINTS
+# =============================================================================
+
+
+@pytest.fixture
+async def client(manager):
+    app = web.Application()
+    app["kb_audio_manager"] = manager
+    app.router.add_get("/api/kb/audio-pack/{module_id}", tts_api.handle_kb_audio_pack)
+    app.router.add_get("/api/kb/audio-pack/{module_id}/index", tts_api.handle_kb_audio_pack_index)
+    client = TestClient(TestServer(app))
+    await client.start_server()
+    yield client
+    await client.close()
+
+
+class TestPackEndpoints:
+    """Tests for the pack download endpoints."""
+
+    async def test_full_pack_and_range(self, client):
+        resp = await client.get("/api/kb/audio-pack/test-module")
+        assert resp.status == 200
+        assert resp.headers["Content-Type"] == PACK_CONTENT_TYPE
+        full = await resp.read()
+
+        index = await (await client.get("/api/kb/audio-pack/test-module/index")).json()
+        entry = index["entries"][-1]
+        start, end = entry["offset"], entry["offset"] + entry["length"] - 1
+
+        resp = await client.get(
+            "/api/kb/audio-pack/test-module",
+            headers={"Range": f"bytes={start}-{end}"},
+        )
+        assert resp.status == 206
+        assert await resp.read() == full[start:end + 1]
+        assert index["pack_size_bytes"] == len(full)
+
+    async def test_subset_download(self, client):
+        resp = await client.get(
+            "/api/kb/audio-pack/test-module",
+            params={"question_ids": "q-002"},
+        )
+        assert resp.status == 200
+        assert resp.headers["X-KB-Pack-Entries"] == "1"
+
+        data = await resp.read()
+        index, _ = read_index(io.BytesIO(data))
+        entry = index.entries[0]
+        assert data[entry.offset:entry.offset + entry.length] == AUDIO[("q-002", "question")]
+
+    async def test_not_found(self, client):
+        resp = await client.get("/api/kb/audio-pack/other-module")
+        assert resp.status == 404
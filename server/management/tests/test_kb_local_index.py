@@ -0,0 +1,200 @@
+"""
+Tests for kb_local_index.py.
+
+The index must return exactly what the linear scan it replaced in
+/api/kb/questions returned, so most tests compare the two.
+"""
+
+import random
+
+import pytest
+
+from kb_local_index import KBLocalIndex
+
+
+def linear_scan(registry, questions_store, pack_id=None, domain_id=None, subcategory=None,
+                difficulties=None, question_type=None, has_audio=None, status=None,
+                search=None, limit=20, offset=0):
+    """The previous JSON-store filtering in handle_list_questions."""
+    all_questions = list(questions_store.get("questions", {}).values())
+    if pack_id:
+        pack = None
+        for p in registry.get("packs", []):
+            if p["id"] == pack_id:
+                pack = p
+                break
+        if pack:
+            pack_question_ids = set(pack.get("question_ids", []))
+            all_questions = [q for q in all_questions if q.get("id") in pack_question_ids]
+
+    filtered = []
+    for q in all_questions:
+        if domain_id and q.get("domain_id") != domain_id:
+            continue
+        if subcategory and q.get("subcategory") != subcategory:
+            continue
+        if difficulties and q.get("difficulty") not in difficulties:
+            continue
+        if question_type and q.get("question_type") != question_type:
+            continue
+        if has_audio is not None:
+            q_has_audio = q.get("has_audio", False)
+            if has_audio and not q_has_audio:
+                continue
+            if not has_audio and q_has_audio:
+                continue
+        if status and q.get("status") != status:
+            continue
+        if search:
+            q_text = q.get("question_text", "").lower()
+            a_text = q.get("answer_text", "").lower()
+            if search not in q_text and search not in a_text:
+                continue
+        filtered.append(q)
+
+    return filtered[offset : offset + limit], len(filtered)
+
+
+WORDS = ["Energy", "photosynthesis", "Naïve", "ÉCOLE", "war", "1812", "quote\"d", "100%", "a_b", "ΣΑΣ"]
+
+
+def make_sources(count=300, seed=3):
+    rng = random.Random(seed)
+    questions = {}
+    for i in range(count):
+        qid = f"q{i}"
+        questions[qid] = {
+            "id": qid,
+            "domain_id": rng.choice(["science", "history", "arts"]),
+            "subcategory": rng.choice(["General", "Physics"]),
+            "difficulty": rng.choice([1, 2, 3, 4, 5, 2.0, "3"]),
+            "question_type": rng.choice(["toss_up", "bonus"]),
+            "status": rng.choice(["active", "draft"]),
+            "question_text": " ".join(rng.choice(WORDS) for _ in range(6)),
+            "answer_text": rng.choice(WORDS),
+        }
+        if rng.random() < 0.5:
+            questions[qid]["has_audio"] = rng.random() < 0.5
+    ids = list(questions)
+    registry = {"packs": [
+        {"id": "pack-a", "question_ids": rng.sample(ids, 80)},
+        {"id": "pack-b", "question_ids": rng.sample(ids, 5) + ["missing"]},
+        {"id": "pack-a", "question_ids": ids},
+    ]}
+    return registry, {"questions": questions}
+
+
+@pytest.fixture
+def sources():
+    return make_sources()
+
+
+@pytest.fixture
+def index(sources):
+    registry, store = sources
+    index = KBLocalIndex()
+    index.sync(registry, 1, store, 1)
+    return index
+
+
+FILTER_CASES = [
+    {},
+    {"pack_id": "pack-a"},
+    {"pack_id": "pack-b", "status": "active"},
+    {"pack_id": "no-such-pack"},
+    {"domain_id": "science", "subcategory": "Physics"},
+    {"difficulties": [2, 3]},
+    {"question_type": "bonus", "has_audio": True},
+    {"has_audio": False},
+    {"search": "energy"},
+    {"search": "naïve"},
+    {"search": "école"},
+    {"search": "σας"},
+    {"search": "e"},
+    {"search": "18"},
+    {"search": "quote\"d"},
+    {"search": "100%"},
+    {"search": "a_b"},
+    {"search": "gy ph"},
+    {"search": "nothing-matches-this"},
+]
+
+
+class TestMatchesLinearScan:
+    """The index returns the same pages and totals as the old scan."""
+
+    @pytest.mark.parametrize("filters", FILTER_CASES)
+    @pytest.mark.parametrize("limit,offset", [(20, 0), (7, 13), (100, 250), (0, 0), (5, -10), (-1, 0)])
+    def test_same_results(self, index, sources, filters, limit, offset):
+        registry, store = sources
+        expected = linear_scan(registry, store, **filters, limit=limit, offset=offset)
+        assert index.query_questions(**filters, limit=limit, offset=offset) == expected
+
+    def test_same_results_without_fts(self, sources):
+        registry, store = sources
+        index = KBLocalIndex()
+        index.fts = False
+        index.sync(registry, 1, store, 1)
+        for filters in FILTER_CASES:
+            assert index.query_questions(**filters, limit=500) == linear_scan(
+                registry, store, **filters, limit=500
+            )
+
+    def test_returns_store_objects(self, index, sources):
+        _, store = sources
+        page, _ = index.query_questions(limit=1)
+        assert page[0] is store["questions"]["q0"]
+
+
+class TestSync:
+    """Tests for re-indexing when sources change."""
+
+    def test_new_version_reindexes_in_place_changes(self, index, sources):
+        registry, store = sources
+        store["questions"]["q0"]["domain_id"] = "unique-domain"
+        assert index.query_questions(domain_id="unique-domain")[1] == 0
+
+        index.sync(registry, 1, store, 2)
+        assert index.query_questions(domain_id="unique-domain")[1] == 1
+
+    def test_new_object_reindexes(self, index, sources):
+        registry, _ = sources
+        index.sync(registry, 1, {"questions": {"x": {"id": "x"}}}, 1)
+        assert index.query_questions()[1] == 1
+
+    def test_registry_change_keeps_questions(self, index, sources, monkeypatch):
+        registry, store = sources
+
+        def fail(*args):
+            raise AssertionError("questions should not be re-indexed")
+
+        monkeypatch.setattr(index, "_index_questions", fail)
+        registry["packs"][1]["question_ids"] = ["q1"]
+        index.sync(registry, 2, store, 1)
+        assert index.query_questions(pack_id="pack-b")[1] == 1
+
+
+class TestPackSummary:
+    """Tests for memoized pack computations."""
+
+    def test_memoized_until_change(self, index, sources):
+        registry, store = sources
+        calls = []
+
+        def count(pack, questions_store):
+            calls.append(pack["id"])
+            return len(pack["question_ids"])
+
+        pack = registry["packs"][1]
+        assert index.pack_summary(pack, count) == 6
+        assert index.pack_summary(pack, count) == 6
+        assert calls == ["pack-b"]
+
+        index.sync(registry, 2, store, 1)
+        index.pack_summary(pack, count)
+        assert calls == ["pack-b", "pack-b"]
+
+    def test_duplicate_pack_ids_not_confused(self, index, sources):
+        registry, _ = sources
+        sizes = [index.pack_summary(p, lambda pack, store: len(pack["question_ids"])) for p in registry["packs"]]
+        assert sizes == [80, 6, 300]
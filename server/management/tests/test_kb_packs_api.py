@@ -16,6 +16,17 @@ from aiohttp import web
 import kb_packs_api
 
 
+@pytest.fixture(autouse=True)
+def isolated_store(tmp_path, monkeypatch):
+    """Keep pack files in a temp directory and start each test uncached."""
+    monkeypatch.setattr(kb_packs_api, "PACKS_DIR", tmp_path / "kb_packs")
+    monkeypatch.setattr(kb_packs_api, "_json_cache", {})
+    monkeypatch.setattr(kb_packs_api, "_json_versions", {})
+    monkeypatch.setattr(kb_packs_api, "_local_index", kb_packs_api.KBLocalIndex())
+    monkeypatch.setattr(kb_packs_api, "_near_duplicates", kb_packs_api.NearDuplicateIndex())
+    monkeypatch.setattr(kb_packs_api, "_near_duplicates_synced", (None, None))
+
+
 # =============================================================================
 # Utility Function Tests
 # =============================================================================
@@ -214,6 +225,116 @@ class TestSaveQuestionsStore:
         kb_packs_api.save_questions_store(store)
 
 
+class TestJsonFileCache:
+    """Tests for reusing parsed pack files while they are unchanged."""
+
+    def test_unchanged_file_not_parsed_again(self):
+        kb_packs_api.save_questions_store({"questions": {"q1": {"id": "q1"}}, "version": "1.0.0"})
+        kb_packs_api._json_cache.clear()
+
+        with patch('kb_packs_api.json.load', wraps=json.load) as load:
+            first = kb_packs_api.load_questions_store()
+            second = kb_packs_api.load_questions_store()
+
+        assert load.call_count == 1
+        assert second is first
+
+    def test_saved_data_served_from_cache(self):
+        registry = {"packs": [{"id": "p1"}], "version": "1.0.0"}
+        kb_packs_api.save_packs_registry(registry)
+
+        assert kb_packs_api.load_packs_registry() is registry
+        assert json.loads(kb_packs_api.get_packs_registry_path().read_text()) == registry
+
+    def test_replaced_file_reloaded(self):
+        kb_packs_api.save_questions_store({"questions": {}, "version": "1.0.0"})
+        kb_packs_api.load_questions_store()
+
+        path = kb_packs_api.get_questions_store_path()
+        other = path.with_name("other.json")
+        other.write_text(json.dumps({"questions": {"q2": {}}, "version": "1.0.0"}))
+        other.replace(path)
+
+        assert "q2" in kb_packs_api.load_questions_store()["questions"]
+
+    def test_failed_save_drops_cache(self):
+        kb_packs_api.save_questions_store({"questions": {}, "version": "1.0.0"})
+        unsaved = kb_packs_api.load_questions_store()
+        unsaved["questions"]["q1"] = {"id": "q1", "bad": object()}
+
+        kb_packs_api.save_questions_store(unsaved)
+
+        reloaded = kb_packs_api.load_questions_store()
+        assert reloaded is not unsaved
+        assert reloaded["questions"] == {}
+
+    def test_copy_for_update_leaves_cache_alone(self):
+        kb_packs_api.save_packs_registry({"packs": [{"id": "p1", "name": "Orig"}], "version": "1.0.0"})
+
+        editable = kb_packs_api.load_packs_registry(for_update=True)
+        editable["packs"][0]["name"] = "Changed"
+
+        assert editable is not kb_packs_api.load_packs_registry()
+        assert kb_packs_api.load_packs_registry()["packs"][0]["name"] == "Orig"
+
+    @pytest.mark.asyncio
+    async def test_rejected_pack_update_not_served(self):
+        kb_packs_api.save_packs_registry({
+            "packs": [{"id": "pack-1", "name": "Orig", "type": "custom", "status": "active",
+                       "difficulty_tier": "varsity", "question_ids": []}],
+            "version": "1.0.0",
+        })
+        request = MagicMock(spec=web.Request)
+        request.app = {}
+        request.match_info = {"pack_id": "pack-1"}
+        request.json = AsyncMock(return_value={"name": "Hacked", "status": "bogus"})
+
+        response = await kb_packs_api.handle_update_pack(request)
+        assert response.status == 400
+
+        response = await kb_packs_api.handle_get_pack(request)
+        assert json.loads(response.body)["pack"]["name"] == "Orig"
+        saved = json.loads(kb_packs_api.get_packs_registry_path().read_text())
+        assert saved["packs"][0]["name"] == "Orig"
+
+    @pytest.mark.asyncio
+    async def test_rejected_question_update_not_served(self):
+        kb_packs_api.save_questions_store({
+            "questions": {"q1": {"id": "q1", "question_text": "Orig", "difficulty": 2}},
+            "version": "1.0.0",
+        })
+        request = MagicMock(spec=web.Request)
+        request.app = {}
+        request.match_info = {"question_id": "q1"}
+        request.json = AsyncMock(return_value={"question_text": "Hacked", "difficulty": 10})
+
+        response = await kb_packs_api.handle_update_question(request)
+        assert response.status == 400
+
+        response = await kb_packs_api.handle_get_question(request)
+        assert json.loads(response.body)["question"]["question_text"] == "Orig"
+
+    @pytest.mark.asyncio
+    async def test_list_questions_sees_saved_changes(self):
+        kb_packs_api.save_questions_store({
+            "questions": {"q1": {"id": "q1", "domain_id": "science", "question_text": "Water?"}},
+            "version": "1.0.0",
+        })
+        request = MagicMock(spec=web.Request)
+        request.app = {}
+        request.query = {"search": "water"}
+
+        response = await kb_packs_api.handle_list_questions(request)
+        assert json.loads(response.body)["total"] == 1
+
+        store = kb_packs_api.load_questions_store()
+        store["questions"]["q1"]["question_text"] = "Fire?"
+        kb_packs_api.save_questions_store(store)
+
+        response = await kb_packs_api.handle_list_questions(request)
+        assert json.loads(response.body)["total"] == 0
+
+
 class TestGeneratePackId:
     """Tests for generate_pack_id function."""
 
@@ -749,8 +870,33 @@ class TestHandleCreateQuestion:
         assert response.status == 200  # API returns 200 for successful creation
         assert data["success"] is True
         assert data["question"]["question_text"] == "What is the SI unit of force?"
+        assert data["near_duplicates"] == []
         mock_save.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch('kb_packs_api.load_questions_store')
+    @patch('kb_packs_api.save_questions_store')
+    @patch('kb_packs_api.load_packs_registry')
+    async def test_warns_about_near_duplicates(self, mock_load_reg, mock_save, mock_load, mock_request):
+        """Should list existing questions the new one nearly duplicates."""
+        mock_load.return_value = {"questions": {
+            "q1": {"id": "q1", "question_text": "What is the SI unit of force?", "answer_text": "Newton"},
+            "q2": {"id": "q2", "question_text": "What is the SI unit of energy?", "answer_text": "Joule"},
+        }}
+        mock_load_reg.return_value = {"packs": []}
+        mock_request.json = AsyncMock(return_value={
+            "domain_id": "science",
+            "question_text": "What's the SI unit of force?",
+            "answer_text": "The newton",
+        })
+
+        response = await kb_packs_api.handle_create_question(mock_request)
+        data = json.loads(response.body)
+
+        assert response.status == 200
+        assert [d["question_id"] for d in data["near_duplicates"]] == ["q1"]
+        assert 0.7 <= data["near_duplicates"][0]["similarity"] <= 1
+
     @pytest.mark.asyncio
     async def test_rejects_missing_fields(self, mock_request):
         """Should reject request with missing required fields."""
@@ -854,6 +1000,55 @@ class TestHandleListQuestions:
         assert "pack-1" in data["questions"][0]["pack_ids"]
 
 
+    @pytest.mark.asyncio
+    @patch('kb_packs_api.get_kb_repo')
+    async def test_database_page_has_cursor_and_facets(self, mock_get_repo, mock_request):
+        """Should return a cursor for the next page and facet counts."""
+        repo = MagicMock()
+        repo.list_questions = AsyncMock(return_value=(
+            [{"id": "q1", "created_at": "2024-01-01T00:00:00+00:00"}], 3
+        ))
+        repo.get_question_facets = AsyncMock(return_value={"domain": {"science": 3}})
+        repo.encode_question_cursor.return_value = "cursor-q1"
+        mock_get_repo.return_value = repo
+        mock_request.query = {"limit": "1", "cursor": "cursor-q0"}
+
+        response = await kb_packs_api.handle_list_questions(mock_request)
+        data = json.loads(response.body)
+
+        assert data["next_cursor"] == "cursor-q1"
+        assert data["facets"] == {"domain": {"science": 3}}
+        assert repo.list_questions.call_args.kwargs["cursor"] == "cursor-q0"
+        repo.encode_question_cursor.assert_called_once_with(data["questions"][0])
+
+    @pytest.mark.asyncio
+    @patch('kb_packs_api.get_kb_repo')
+    async def test_database_last_page_has_no_cursor(self, mock_get_repo, mock_request):
+        """Should not offer a next page after a short page."""
+        repo = MagicMock()
+        repo.list_questions = AsyncMock(return_value=([], 0))
+        repo.get_question_facets = AsyncMock(return_value={})
+        mock_get_repo.return_value = repo
+
+        response = await kb_packs_api.handle_list_questions(mock_request)
+        data = json.loads(response.body)
+
+        assert data["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    @patch('kb_packs_api.get_kb_repo')
+    async def test_database_invalid_cursor(self, mock_get_repo, mock_request):
+        """Should reject a malformed cursor."""
+        repo = MagicMock()
+        repo.list_questions = AsyncMock(side_effect=ValueError("Invalid cursor"))
+        mock_get_repo.return_value = repo
+        mock_request.query = {"cursor": "garbage"}
+
+        response = await kb_packs_api.handle_list_questions(mock_request)
+
+        assert response.status == 400
+
+
 class TestHandleAddQuestionsToPack:
     """Tests for handle_add_questions_to_pack handler."""
 
@@ -979,6 +1174,49 @@ class TestHandleCreateBundle:
         assert data["success"] is True
         assert data["pack"]["type"] == "bundle"
 
+    @pytest.mark.asyncio
+    @patch('kb_packs_api.load_packs_registry')
+    @patch('kb_packs_api.save_packs_registry')
+    @patch('kb_packs_api.load_questions_store')
+    @patch('kb_packs_api.save_questions_store')
+    async def test_skips_near_duplicates_with_threshold(self, mock_save_q, mock_load_q, mock_save_p, mock_load_p, mock_request):
+        """Should skip near-duplicates of kept questions when a threshold is given."""
+        mock_load_p.return_value = {"packs": [
+            {"id": "pack-1", "name": "Pack 1", "question_ids": ["q1", "q2"]},
+            {"id": "pack-2", "name": "Pack 2", "question_ids": ["q3"]},
+        ]}
+        mock_load_q.return_value = {"questions": {
+            "q1": {"id": "q1", "question_text": "Which planet is known as the Red Planet?", "answer_text": "Mars"},
+            "q2": {"id": "q2", "question_text": "What is the largest ocean on Earth?", "answer_text": "Pacific"},
+            "q3": {"id": "q3", "question_text": "For 10 points, which planet is known as the Red Planet?", "answer_text": "Mars"},
+        }}
+        body = {"name": "Bundle", "source_pack_ids": ["pack-1", "pack-2"], "deduplication_strategy": "keep_first"}
+
+        mock_request.json = AsyncMock(return_value=body)
+        data = json.loads((await kb_packs_api.handle_create_bundle(mock_request)).body)
+        assert data["pack"]["question_ids"] == ["q1", "q2", "q3"]
+
+        mock_request.json = AsyncMock(return_value={**body, "similarity_threshold": 0.8})
+        data = json.loads((await kb_packs_api.handle_create_bundle(mock_request)).body)
+        assert data["pack"]["question_ids"] == ["q1", "q2"]
+        assert data["duplicates_skipped"] == 1
+        assert data["duplicates"][0]["question_id"] == "q3"
+        assert data["duplicates"][0]["duplicate_of"] == "q1"
+        assert data["duplicates"][0]["similarity"] >= 0.8
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("threshold", [0, 1.5, "high", True])
+    async def test_rejects_invalid_threshold(self, mock_request, threshold):
+        """Should reject a similarity_threshold outside (0, 1]."""
+        mock_request.json = AsyncMock(return_value={
+            "name": "Bundle", "source_pack_ids": ["pack-1"], "similarity_threshold": threshold,
+        })
+
+        response = await kb_packs_api.handle_create_bundle(mock_request)
+
+        assert response.status == 400
+        assert "similarity_threshold" in json.loads(response.body)["error"]
+
 
 class TestHandlePreviewDeduplication:
     """Tests for handle_preview_deduplication handler."""
@@ -1023,6 +1261,46 @@ class TestHandlePreviewDeduplication:
         assert data["total_duplicates"] == 1  # Extra occurrences
         assert data["unique_questions_after_dedup"] == 3  # Unique question texts
         assert len(data["duplicate_groups"]) == 1  # One group of duplicates
+        # "Unique question 1" and "Unique question 2" differ by one character
+        assert data["total_near_duplicates"] == 1
+
+    @pytest.mark.asyncio
+    @patch('kb_packs_api.load_packs_registry')
+    @patch('kb_packs_api.load_questions_store')
+    async def test_detects_near_duplicates(self, mock_load_q, mock_load_p, mock_request):
+        """Should group distinct texts that nearly duplicate each other."""
+        mock_load_p.return_value = {"packs": [
+            {"id": "pack-1", "name": "Pack 1", "question_ids": ["q1", "q2"]},
+            {"id": "pack-2", "name": "Pack 2", "question_ids": ["q3", "q4", "q5"]},
+        ]}
+        mock_load_q.return_value = {"questions": {
+            "q1": {"id": "q1", "question_text": "The Treaty of Ghent ended which war?", "answer_text": "War of 1812"},
+            "q2": {"id": "q2", "question_text": "What is the chemical symbol for gold?", "answer_text": "Au"},
+            "q3": {"id": "q3", "question_text": "The treaty of Ghent ended what war?", "answer_text": "The War of 1812"},
+            "q4": {"id": "q4", "question_text": "What is the chemical symbol for silver?", "answer_text": "Ag"},
+            "q5": {"id": "q5", "question_text": "The Treaty of Ghent ended which war?", "answer_text": "War of 1812"},
+        }}
+        mock_request.json = AsyncMock(return_value={"source_pack_ids": ["pack-1", "pack-2"]})
+
+        response = await kb_packs_api.handle_preview_deduplication(mock_request)
+        data = json.loads(response.body)
+
+        assert response.status == 200
+        assert data["total_duplicates"] == 1  # q5 repeats q1 exactly
+        assert data["total_near_duplicates"] == 1
+        [group] = data["near_duplicate_groups"]
+        assert [(m["question_id"], m["pack_id"]) for m in group["members"]] == [("q1", "pack-1"), ("q3", "pack-2")]
+        assert group["members"][0]["similarity"] == 1.0
+        assert group["members"][1]["similarity"] >= data["similarity_threshold"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_threshold(self, mock_request):
+        """Should reject a similarity_threshold outside (0, 1]."""
+        mock_request.json = AsyncMock(return_value={"source_pack_ids": ["pack-1"], "similarity_threshold": 2})
+
+        response = await kb_packs_api.handle_preview_deduplication(mock_request)
+
+        assert response.status == 400
 
 
 class TestHandleGetQuestion:
@@ -1400,6 +1678,38 @@ class TestHandleImportFromModule:
         assert response.status == 200
         assert data["success"] is True
         assert data["imported_count"] == 1
+        assert data["near_duplicate_count"] == 0
+
+    @pytest.mark.asyncio
+    @patch('kb_packs_api.load_module_content')
+    @patch('kb_packs_api.load_packs_registry')
+    @patch('kb_packs_api.save_packs_registry')
+    @patch('kb_packs_api.load_questions_store')
+    @patch('kb_packs_api.save_questions_store')
+    async def test_warns_about_near_duplicates(self, mock_save_q, mock_load_q, mock_save_p, mock_load_p, mock_load_module, mock_request):
+        """Should warn about imports that nearly duplicate stored or earlier imported questions."""
+        mock_load_module.return_value = {"domains": [{"id": "science", "questions": [
+            {"id": "sci-001", "question_text": "Which organelle is called the powerhouse of the cell?",
+             "answer_text": "Mitochondria"},
+            {"id": "sci-002", "question_text": "Which organelle is often called the powrhouse of the cell?",
+             "answer_text": "Mitochondria"},
+            {"id": "sci-003", "question_text": "What is the chemical formula of water?", "answer_text": "H2O"},
+        ]}]}
+        mock_load_p.return_value = {"packs": [{"id": "pack-1", "name": "Test Pack", "question_ids": []}]}
+        mock_load_q.return_value = {"questions": {
+            "old-1": {"id": "old-1", "question_text": "What is the chemical formula for water?", "answer_text": "H2O"},
+        }}
+        mock_request.json = AsyncMock(return_value={"pack_id": "pack-1"})
+
+        response = await kb_packs_api.handle_import_from_module(mock_request)
+        data = json.loads(response.body)
+
+        assert data["imported_count"] == 3
+        assert data["near_duplicate_count"] == 2
+        assert [(d["question_id"], d["similar_to"]) for d in data["near_duplicates"]] == [
+            ("sci-002", "sci-001"),
+            ("sci-003", "old-1"),
+        ]
 
 
 class TestErrorHandling:
@@ -266,6 +266,103 @@ class TestQuestionOperations:
         assert questions == []
         assert total == 5
 
+    @pytest.mark.asyncio
+    async def test_list_questions_pack_filter_uses_exists(self, repo, mock_pool, mock_conn):
+        """Should filter by pack without joining and de-duplicating."""
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_conn.fetchval.return_value = 0
+        mock_conn.fetch.return_value = []
+
+        await repo.list_questions(pack_id="pack-1")
+
+        query = mock_conn.fetch.call_args.args[0]
+        assert "EXISTS" in query
+        assert "DISTINCT" not in query
+        assert "ORDER BY q.created_at DESC, q.id DESC" in query
+
+    @pytest.mark.asyncio
+    async def test_list_questions_with_cursor(self, repo, mock_pool, mock_conn):
+        """Should continue after the cursor's question instead of using OFFSET."""
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_conn.fetchval.return_value = 50
+        mock_conn.fetch.return_value = []
+        created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        cursor = repo.encode_question_cursor({"id": "q9", "created_at": created.isoformat()})
+
+        await repo.list_questions(domain_id="science", limit=10, offset=40, cursor=cursor)
+
+        query = mock_conn.fetch.call_args.args[0]
+        params = mock_conn.fetch.call_args.args[1:]
+        assert "(q.created_at, q.id) < ($2, $3)" in query
+        assert "OFFSET" not in query
+        assert params == ("science", created, "q9", 10)
+
+    @pytest.mark.asyncio
+    async def test_list_questions_invalid_cursor(self, repo, mock_pool, mock_conn):
+        """Should reject malformed cursors."""
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_conn.fetchval.return_value = 0
+
+        with pytest.raises(ValueError):
+            await repo.list_questions(cursor="not-a-cursor")
+
+    def test_encode_question_cursor_without_created_at(self, repo):
+        """Should have no cursor for questions without a creation time."""
+        assert repo.encode_question_cursor({"id": "q1", "created_at": None}) is None
+
+    @pytest.mark.asyncio
+    async def test_list_questions_caches_total(self, repo, mock_pool, mock_conn):
+        """Should count once per filter until a write invalidates the count."""
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_conn.fetchval.return_value = 3
+        mock_conn.fetch.return_value = []
+
+        await repo.list_questions(domain_id="science")
+        await repo.list_questions(domain_id="science", offset=20)
+        assert mock_conn.fetchval.await_count == 1
+
+        await repo.list_questions(domain_id="math")
+        assert mock_conn.fetchval.await_count == 2
+
+        mock_conn.execute.return_value = "UPDATE 2"
+        await repo.bulk_update_questions(["q1", "q2"], {"status": "archived"})
+        await repo.list_questions(domain_id="science")
+        assert mock_conn.fetchval.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_total_expires(self, repo, mock_pool, mock_conn):
+        """Should recount after the cache TTL, for writes by other processes."""
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_conn.fetchval.return_value = 3
+        mock_conn.fetch.return_value = []
+        repo.FACET_CACHE_TTL_SECONDS = 0
+
+        await repo.list_questions()
+        await repo.list_questions()
+
+        assert mock_conn.fetchval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_question_facets(self, repo, mock_pool, mock_conn):
+        """Should fold grouped counts into per-facet counts and cache them."""
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_conn.fetch.return_value = [
+            MockRecord({"domain_id": "science", "difficulty": 2, "status": "active", "count": 5}),
+            MockRecord({"domain_id": "science", "difficulty": 3, "status": "draft", "count": 1}),
+            MockRecord({"domain_id": "math", "difficulty": 2, "status": "active", "count": 4}),
+        ]
+
+        facets = await repo.get_question_facets(difficulties=[3, 2])
+        again = await repo.get_question_facets(difficulties=[2, 3])
+
+        assert facets == {
+            "domain": {"science": 6, "math": 4},
+            "difficulty": {2: 9, 3: 1},
+            "status": {"active": 9, "draft": 1},
+        }
+        assert again is facets
+        assert mock_conn.fetch.await_count == 1
+
     @pytest.mark.asyncio
     async def test_update_question(self, repo, mock_pool, mock_conn):
         """Should update a question."""
@@ -680,6 +777,74 @@ class TestImport:
         # First fails, second succeeds
         assert result == 1
 
+    @pytest.fixture
+    def staged_conn(self, mock_pool, mock_conn):
+        """Connection with a transaction and COPY support."""
+        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_conn.transaction = MagicMock()
+        mock_conn.transaction.return_value.__aenter__ = AsyncMock()
+        mock_conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_conn.fetchrow.return_value = MockRecord({"inserted": 1, "updated": 1})
+        return mock_conn
+
+    @pytest.mark.asyncio
+    async def test_import_questions_staged(self, repo, staged_conn):
+        """Should COPY valid questions and report inserted/updated/skipped."""
+        questions = [
+            {"id": "q1", "domain_id": "science", "question_text": "Q1?", "answer_text": "A1"},
+            {"id": "q2", "domain_id": "math", "question_text": "Q2?", "answer_text": "A2",
+             "hints": ["h"], "difficulty": 4},
+            {"id": "q1", "domain_id": "science", "question_text": "Dup?", "answer_text": "A"},
+            {"id": "q3", "domain_id": "science", "question_text": "Q3?", "answer_text": "A3",
+             "difficulty": 9},
+            {"id": "q4", "domain_id": "science", "question_text": "Q4?"},
+        ]
+        result = await repo.import_questions_staged(questions)
+
+        assert result == {"inserted": 1, "updated": 1, "skipped": 3}
+        staged_conn.copy_records_to_table.assert_awaited_once()
+        records = staged_conn.copy_records_to_table.call_args.kwargs["records"]
+        assert [r[1] for r in records] == ["q1", "q2"]
+        assert records[1][7] == 4
+        assert records[1][13] == ["h"]
+        staged_conn.fetchrow.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_import_questions_staged_nothing_valid(self, repo, mock_pool):
+        """Should not touch the database when nothing can be imported."""
+        questions = [{"id": "q1", "domain_id": "science", "question_text": "Q1?"}]
+        result = await repo.import_questions_staged(questions)
+
+        assert result == {"inserted": 0, "updated": 0, "skipped": 1}
+        mock_pool.acquire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_import_questions_staged_refreshes_pack(self, repo, staged_conn):
+        """Should replace the pack's members with the imported questions."""
+        questions = [
+            {"id": "q1", "domain_id": "science", "question_text": "Q1?", "answer_text": "A1"},
+        ]
+        await repo.import_questions_staged(questions, pack_id="pack-1")
+
+        statements = [call.args[0] for call in staged_conn.execute.await_args_list]
+        assert any("DELETE FROM kb_pack_questions" in sql for sql in statements)
+        assert any("INSERT INTO kb_pack_questions" in sql for sql in statements)
+        assert all(
+            call.args[1] == "pack-1"
+            for call in staged_conn.execute.await_args_list[1:]
+        )
+
+    @pytest.mark.asyncio
+    async def test_import_questions_staged_without_pack(self, repo, staged_conn):
+        """Should leave pack memberships alone without a pack."""
+        questions = [
+            {"id": "q1", "domain_id": "science", "question_text": "Q1?", "answer_text": "A1"},
+        ]
+        await repo.import_questions_staged(questions)
+
+        statements = [call.args[0] for call in staged_conn.execute.await_args_list]
+        assert not any("kb_pack_questions" in sql for sql in statements)
+
     @pytest.mark.asyncio
     async def test_get_question_count(self, repo, mock_pool, mock_conn):
         """Should get total question count."""
@@ -269,6 +269,7 @@ class MockAnalysisReport:
         self.network_projections = []
         self.regressions = []
         self.recommendations = ["Use Chatterbox TTS for lowest latency"]
+        self.regression_checks = []
 
 
 class MockOrchestrator:
@@ -283,6 +284,7 @@ class MockOrchestrator:
             "test_client_1": MockConnectedClient("test_client_1"),
         }
         self._runs = {}
+        self._live_stats = {}
 
     def list_suites(self):
         return list(self.suites.values())
@@ -299,6 +301,12 @@ class MockOrchestrator:
     def get_run(self, run_id):
         return self._runs.get(run_id)
 
+    async def load_run(self, run_id):
+        return self.get_run(run_id)
+
+    async def get_live_statistics(self, run_id):
+        return self._live_stats.get(run_id)
+
     async def start_test_run(self, suite_id, client_id=None, client_type=None):
         if suite_id not in self.suites:
             raise ValueError(f"Suite not found: {suite_id}")
@@ -732,6 +740,47 @@ class TestHandleGetRunResults:
         assert response.status == 404
 
 
+class TestHandleGetLiveStats:
+    """Tests for handle_get_live_stats endpoint."""
+
+    @pytest.mark.asyncio
+    @patch("latency_harness_api.get_orchestrator")
+    async def test_get_live_stats_success(self, mock_get_orch, mock_request):
+        """Test live statistics for a running run."""
+        orch = MockOrchestrator()
+        orch._runs["run_123"] = MockTestRun("run_123")
+        live_stats = MagicMock()
+        live_stats.summary.return_value = {
+            "successfulTests": 1,
+            "failedTests": 0,
+            "overall": {"e2e": {"count": 1, "p50": 400.0, "p95": 400.0, "p99": 400.0}},
+            "configurations": {},
+        }
+        orch._live_stats["run_123"] = live_stats
+        mock_get_orch.return_value = orch
+
+        request = mock_request(method="GET", match_info={"run_id": "run_123"})
+        response = await latency_harness_api.handle_get_live_stats(request)
+
+        assert response.status == 200
+        data = json.loads(response.body)
+        assert data["runId"] == "run_123"
+        assert data["overall"]["e2e"]["p50"] == 400.0
+
+    @pytest.mark.asyncio
+    @patch("latency_harness_api.get_orchestrator")
+    async def test_get_live_stats_not_found(self, mock_get_orch, mock_request):
+        """Test live statistics for a run without them."""
+        orch = MockOrchestrator()
+        orch._runs["run_123"] = MockTestRun("run_123")
+        mock_get_orch.return_value = orch
+
+        request = mock_request(method="GET", match_info={"run_id": "run_123"})
+        response = await latency_harness_api.handle_get_live_stats(request)
+
+        assert response.status == 404
+
+
 class TestHandleCancelRun:
     """Tests for handle_cancel_run endpoint."""
 
@@ -1673,6 +1722,7 @@ class TestRegisterRoutes:
         assert "/api/latency-tests/runs" in route_paths
         assert "/api/latency-tests/runs/{run_id}" in route_paths
         assert "/api/latency-tests/runs/{run_id}/results" in route_paths
+        assert "/api/latency-tests/runs/{run_id}/live-stats" in route_paths
         assert "/api/latency-tests/runs/{run_id}/analysis" in route_paths
         assert "/api/latency-tests/runs/{run_id}/export" in route_paths
 
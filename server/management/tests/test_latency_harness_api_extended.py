@@ -287,6 +287,11 @@ class MockRegressionInfo:
         self.current_value = current_value
         self.change_percent = ((current_value - baseline_value) / baseline_value) * 100
         self.severity = MagicMock(value=severity_value)
+        self.method = "mann_whitney_u"
+        self.p_value = 0.001
+        self.effect_size = 0.9
+        self.baseline_count = 20
+        self.current_count = 20
 
 
 class MockSummaryStatistics:
@@ -320,6 +325,7 @@ class MockAnalysisReport:
         self.network_projections = []
         self.regressions = regressions or []
         self.recommendations = ["Use Chatterbox TTS for lowest latency"]
+        self.regression_checks = []
 
 
 class MockParameterSpace:
@@ -393,6 +399,9 @@ class MockOrchestrator:
     def get_run(self, run_id):
         return self._runs.get(run_id)
 
+    async def load_run(self, run_id):
+        return self.get_run(run_id)
+
     async def start_test_run(self, suite_id, client_id=None, client_type=None):
         if suite_id not in self.suites:
             raise ValueError(f"Suite not found: {suite_id}")
@@ -0,0 +1,226 @@
+"""
+Tests for latency harness load generation.
+
+Tests cover:
+- Poisson arrival schedules and ramp profiles
+- Stage summaries and their storage on runs
+- Load stages against the local stub LLM and TTS servers
+- Coordinated-omission-correct timing when clients are saturated
+- Orchestrator load runs persisted alongside regular runs
+"""
+
+import asyncio
+import random
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add server directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from latency_harness import models
+from latency_harness.load import (
+    LoadGenerator,
+    LoadProfile,
+    LoadTarget,
+    RampStage,
+    StubTiming,
+    poisson_arrivals,
+    start_stub_servers,
+    summarize_stage,
+)
+from latency_harness.models import ClientType, LoadLevelResult, NetworkProfile, RunStatus
+from latency_harness.orchestrator import LatencyTestOrchestrator
+from latency_harness.storage import FileBasedLatencyStorage
+
+FAST_STUBS = StubTiming(
+    llm_ttfb_s=0.01, tokens=3, token_interval_s=0.001,
+    tts_ttfb_s=0.01, audio_chunks=2, audio_chunk_interval_s=0.001,
+)
+
+
+@pytest.fixture
+async def stubs():
+    runner, target = await start_stub_servers(FAST_STUBS)
+    yield target
+    await runner.cleanup()
+
+
+def make_result(e2e_ms: float, errors=()) -> models.TestResult:
+    return models.TestResult(
+        id=f"result_{e2e_ms}",
+        config_id="load_c2_r4",
+        scenario_name="load",
+        repetition=0,
+        timestamp=datetime(2026, 1, 1),
+        client_type=ClientType.LOAD_GENERATOR,
+        stt_latency_ms=None,
+        llm_ttfb_ms=10.0,
+        llm_completion_ms=20.0,
+        tts_ttfb_ms=10.0,
+        tts_completion_ms=20.0,
+        e2e_latency_ms=e2e_ms,
+        network_profile=NetworkProfile.LOCALHOST,
+        errors=list(errors),
+    )
+
+
+class TestProfiles:
+    """Tests for arrival schedules and load profiles."""
+
+    def test_poisson_arrivals(self):
+        arrivals = poisson_arrivals(50.0, 20.0, random.Random(3))
+
+        assert arrivals == sorted(arrivals)
+        assert 0 < arrivals[0] and arrivals[-1] < 20.0
+        # 1000 expected arrivals; the count's standard deviation is ~32
+        assert 900 < len(arrivals) < 1100
+        assert arrivals == poisson_arrivals(50.0, 20.0, random.Random(3))
+
+    def test_ramp_scales_rate_with_clients(self):
+        profile = LoadProfile.ramp([1, 4, 16], rate_per_client=0.5, stage_duration_s=10, seed=7)
+
+        assert [(s.clients, s.arrival_rate) for s in profile.stages] == [(1, 0.5), (4, 2.0), (16, 8.0)]
+        assert profile.stages[1].config_id == "load_c4_r2"
+        assert LoadProfile.from_dict(profile.to_dict()) == profile
+
+    def test_invalid_profiles_are_rejected(self):
+        with pytest.raises(ValueError):
+            LoadProfile(stages=[])
+        with pytest.raises(ValueError):
+            LoadProfile(stages=[RampStage(clients=0, arrival_rate=1.0, duration_s=1.0)])
+
+
+class TestStageSummary:
+    """Tests for LoadLevelResult summaries."""
+
+    def test_summarize_stage(self):
+        stage = RampStage(clients=2, arrival_rate=4.0, duration_s=2.0)
+        results = [make_result(float(ms)) for ms in range(100, 200, 10)]
+        results.append(make_result(0.0, errors=["timeout"]))
+
+        level = summarize_stage(stage, results, [0.0] * 10 + [50.0], elapsed_s=2.0)
+
+        assert (level.requests, level.successful, level.failed) == (11, 10, 1)
+        assert level.throughput_rps == 5.0
+        assert level.median_e2e_ms == 145.0
+        assert level.max_e2e_ms == 190.0
+        assert level.p99_queue_delay_ms == 45.0
+
+    def test_empty_stage_has_no_percentiles(self):
+        level = summarize_stage(RampStage(1, 1.0, 1.0), [], [], elapsed_s=1.0)
+        assert level.throughput_rps == 0.0
+        assert level.median_e2e_ms is None
+
+    def test_load_levels_round_trip_on_runs(self):
+        level = summarize_stage(RampStage(2, 4.0, 2.0), [make_result(120.0)], [1.5], elapsed_s=2.0)
+        run = models.TestRun(
+            id="load_1",
+            suite_name="Load Test",
+            suite_id="load_test",
+            started_at=datetime(2026, 1, 1),
+            client_id="load_generator",
+            client_type=ClientType.LOAD_GENERATOR,
+            total_configurations=1,
+            load_levels=[level],
+        )
+
+        restored = models.TestRun.from_dict(run.to_dict())
+        assert restored.load_levels == [level]
+        assert LoadLevelResult.from_dict(level.to_dict()) == level
+
+
+class TestLoadGenerator:
+    """Tests for load stages against the stub servers."""
+
+    async def test_stage_against_stubs(self, stubs):
+        generator = LoadGenerator(stubs)
+        stage = RampStage(clients=4, arrival_rate=40.0, duration_s=0.5)
+
+        results, level = await generator.run_stage(stage, random.Random(1))
+
+        assert results and all(r.is_success for r in results)
+        assert level.requests == level.successful == len(results)
+        assert {r.config_id for r in results} == {"load_c4_r40"}
+        for r in results:
+            assert r.client_type == ClientType.LOAD_GENERATOR
+            assert r.llm_output_tokens == FAST_STUBS.tokens
+            assert r.llm_ttfb_ms <= r.llm_completion_ms
+            assert r.tts_ttfb_ms <= r.tts_completion_ms
+            assert r.e2e_latency_ms >= r.llm_completion_ms + r.tts_ttfb_ms
+
+    async def test_latency_includes_queueing_behind_busy_clients(self):
+        # One client, one server slot and ~25 ms per request: arrivals at
+        # 200/s queue up, and latency must grow with the queue instead of
+        # staying at the service time.
+        runner, target = await start_stub_servers(StubTiming(
+            llm_ttfb_s=0.01, tokens=1, tts_ttfb_s=0.01, audio_chunks=1, slots=1,
+        ))
+        try:
+            stage = RampStage(clients=1, arrival_rate=200.0, duration_s=0.2)
+            results, level = await LoadGenerator(target).run_stage(stage, random.Random(2))
+        finally:
+            await runner.cleanup()
+
+        service_ms = max(r.llm_completion_ms + r.tts_ttfb_ms for r in results)
+        assert level.p99_queue_delay_ms > 5 * service_ms
+        assert level.max_e2e_ms > level.p99_queue_delay_ms
+        assert level.throughput_rps < stage.arrival_rate
+
+    async def test_unreachable_target_records_failures(self, unused_tcp_port):
+        target = LoadTarget(
+            llm_url=f"http://127.0.0.1:{unused_tcp_port}/v1/chat/completions",
+            tts_url=f"http://127.0.0.1:{unused_tcp_port}/v1/audio/speech",
+            request_timeout_s=2.0,
+        )
+        stage = RampStage(clients=2, arrival_rate=20.0, duration_s=0.3)
+
+        results, level = await LoadGenerator(target).run_stage(stage, random.Random(3))
+
+        assert results and not any(r.is_success for r in results)
+        assert level.failed == len(results)
+        assert level.median_e2e_ms is None
+
+    async def test_stop_ends_arrivals(self, stubs):
+        stage = RampStage(clients=2, arrival_rate=100.0, duration_s=10.0)
+        results, level = await LoadGenerator(stubs).run_stage(
+            stage, random.Random(4), should_stop=lambda: True
+        )
+        assert results == [] and level.requests == 0
+
+
+class TestOrchestratorLoadRun:
+    """Tests for LatencyTestOrchestrator.start_load_run."""
+
+    async def test_load_run_is_stored_with_its_levels(self, stubs, tmp_path):
+        storage = FileBasedLatencyStorage(tmp_path)
+        await storage.initialize()
+        orchestrator = LatencyTestOrchestrator(storage=storage)
+        await orchestrator.start()
+        try:
+            profile = LoadProfile.ramp([1, 3], rate_per_client=20.0, stage_duration_s=0.3, seed=5)
+            run = await orchestrator.start_load_run(profile, stubs)
+            assert run.client_type == ClientType.LOAD_GENERATOR
+
+            for _ in range(100):
+                if run.status != RunStatus.RUNNING:
+                    break
+                await asyncio.sleep(0.05)
+            assert run.status == RunStatus.COMPLETED
+            assert run.completed_configurations == 2
+            live = await orchestrator.get_live_statistics(run.id)
+            assert live.summary()["successfulTests"] == len(run.results)
+            assert run.id not in orchestrator.live_statistics
+        finally:
+            await orchestrator.stop()
+
+        try:
+            stored = await storage.get_run(run.id)
+            assert [level.clients for level in stored.load_levels] == [1, 3]
+            assert len(stored.results) == len(run.results)
+            for level in stored.load_levels:
+                assert len(await storage.get_results(run.id, config_id=level.config_id)) == level.requests
+        finally:
+            await storage.close()
@@ -0,0 +1,448 @@
+"""
+Tests for the latency harness statistics primitives and analyzer.
+
+Tests cover:
+- Sorted metric columns against the statistics module
+- Per-configuration columns and missing STT values
+- DDSketch relative accuracy, merging and serialization
+- Live run statistics kept by the orchestrator
+- ResultsAnalyzer reports built from the columns
+- Significance tests and regression checks against baseline
+  distributions, on synthetic data
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add server directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from latency_harness import models
+from latency_harness.analyzer import ResultsAnalyzer, baseline_metrics, percentile
+from latency_harness.models import ClientCapabilities, ClientType, NetworkProfile, RunStatus
+from latency_harness.orchestrator import LatencyTestOrchestrator
+from latency_harness.stats import (
+    DDSketch,
+    LiveRunStatistics,
+    MetricColumn,
+    ResultColumns,
+    benjamini_hochberg,
+    binomial_sf,
+    mann_whitney_u,
+    quantile_exceedance_test,
+    thin_sorted,
+)
+from latency_harness.storage import FileBasedLatencyStorage
+
+
+def make_result(
+    index: int,
+    e2e: float,
+    config_id: str = "config_a",
+    stt: float = None,
+    errors=None,
+    providers=("deepgram", "anthropic", "chatterbox"),
+) -> models.TestResult:
+    return models.TestResult(
+        id=f"result_{index}",
+        config_id=config_id,
+        scenario_name="short_response",
+        repetition=index,
+        timestamp=datetime(2026, 1, 1),
+        client_type=ClientType.IOS_SIMULATOR,
+        stt_latency_ms=stt,
+        llm_ttfb_ms=e2e * 0.25,
+        llm_completion_ms=e2e * 0.5,
+        tts_ttfb_ms=e2e * 0.1,
+        tts_completion_ms=e2e * 0.3,
+        e2e_latency_ms=e2e,
+        network_profile=NetworkProfile.LOCALHOST,
+        stt_config={"provider": providers[0]},
+        llm_config={"provider": providers[1]},
+        tts_config={"provider": providers[2]},
+        errors=list(errors or []),
+    )
+
+
+def make_run(results) -> models.TestRun:
+    return models.TestRun(
+        id="run_1",
+        suite_name="Quick Validation",
+        suite_id="quick_validation",
+        started_at=datetime(2026, 1, 1),
+        client_id="client_1",
+        client_type=ClientType.IOS_SIMULATOR,
+        total_configurations=len(results),
+        status=RunStatus.COMPLETED,
+        results=list(results),
+    )
+
+
+class TestMetricColumn:
+    """Tests for sorted metric columns."""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 100])
+    def test_matches_statistics_module(self, size):
+        rng = random.Random(size)
+        values = [rng.uniform(100, 900) for _ in range(size)]
+        column = MetricColumn(values)
+
+        assert column.median() == pytest.approx(statistics.median(values))
+        assert column.percentile(99) == pytest.approx(percentile(values, 99))
+        assert column.min() == min(values)
+        assert column.max() == max(values)
+        expected_stdev = statistics.stdev(values) if size > 1 else 0
+        assert column.stdev() == pytest.approx(expected_stdev)
+        assert column.count_below(500) == sum(1 for v in values if v < 500)
+
+    def test_empty_column(self):
+        column = MetricColumn([])
+        assert len(column) == 0
+        assert column.median() == 0.0
+        assert column.percentile(99) == 0.0
+
+
+class TestResultColumns:
+    """Tests for grouping results into columns."""
+
+    def test_groups_by_configuration_in_order(self):
+        results = [
+            make_result(0, 300.0, "config_b"),
+            make_result(1, 500.0, "config_a"),
+            make_result(2, 100.0, "config_b"),
+        ]
+        columns = ResultColumns(results)
+
+        assert columns.config_ids == ["config_b", "config_a"]
+        assert columns.count("config_b") == 2
+        assert columns.first_result("config_b").id == "result_0"
+        assert columns.column("e2e", "config_b").median() == 200.0
+        assert columns.column("e2e").median() == 300.0
+
+    def test_missing_stt_values_are_left_out(self):
+        results = [make_result(0, 300.0, stt=None), make_result(1, 300.0, stt=0), make_result(2, 300.0, stt=50.0)]
+        columns = ResultColumns(results)
+
+        assert len(columns.column("stt")) == 1
+        assert columns.column("stt").median() == 50.0
+
+    def test_projected_e2e_prefers_recorded_projections(self):
+        on_device = make_result(0, 200.0, "on_device", providers=("apple", "mlx", "apple"))
+        cloud = make_result(1, 200.0, "cloud")
+        recorded = make_result(2, 200.0, "cloud")
+        recorded.network_projections = {"cellular_us": 999.0}
+        columns = ResultColumns([on_device, cloud, recorded])
+
+        projected = columns.projected_e2e(NetworkProfile.CELLULAR_US)
+        # On-device adds nothing, three cloud hops add 50ms each
+        assert list(projected.values) == [200.0, 350.0, 999.0]
+
+
+class TestDDSketch:
+    """Tests for the DDSketch quantile sketch."""
+
+    @pytest.mark.parametrize("q", [0.01, 0.5, 0.9, 0.95, 0.99])
+    def test_quantiles_within_relative_accuracy(self, q):
+        rng = random.Random(11)
+        values = [rng.lognormvariate(6, 0.6) for _ in range(20000)]
+        sketch = DDSketch(relative_accuracy=0.01)
+        sketch.update(values)
+
+        exact = sorted(values)[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+        assert sketch.count == len(values)
+
+    def test_merge_matches_single_sketch(self):
+        rng = random.Random(3)
+        values = [rng.uniform(50, 5000) for _ in range(5000)]
+        whole = DDSketch()
+        whole.update(values)
+        left, right = DDSketch(), DDSketch()
+        left.update(values[:1234])
+        right.update(values[1234:])
+        left.merge(right)
+
+        assert left.bins == whole.bins
+        for q in (0.5, 0.95, 0.99):
+            assert left.quantile(q) == whole.quantile(q)
+        assert left.min == whole.min and left.max == whole.max
+
+    def test_merge_rejects_different_accuracy(self):
+        with pytest.raises(ValueError):
+            DDSketch(0.01).merge(DDSketch(0.02))
+
+    def test_zero_and_empty(self):
+        sketch = DDSketch()
+        assert sketch.quantile(0.5) is None
+        sketch.update([0.0, 0.0, 100.0])
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(100.0, rel=0.01)
+
+    def test_round_trips_through_dict(self):
+        sketch = DDSketch()
+        sketch.update([10.0, 20.0, 30.0, 0.0])
+        restored = DDSketch.from_dict(sketch.to_dict())
+
+        assert restored.bins == sketch.bins
+        assert restored.zero_count == 1
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+
+
+class TestLiveRunStatistics:
+    """Tests for streaming run statistics."""
+
+    def test_summary_per_configuration(self):
+        live = LiveRunStatistics()
+        for i in range(100):
+            live.add(make_result(i, 100.0 + i, "config_a" if i % 2 else "config_b", stt=40.0))
+        live.add(make_result(100, 0.0, errors=["timeout"]))
+
+        summary = live.summary()
+        assert summary["successfulTests"] == 100
+        assert summary["failedTests"] == 1
+        assert summary["overall"]["e2e"]["count"] == 100
+        assert summary["overall"]["e2e"]["p50"] == pytest.approx(149.5, rel=0.01)
+        assert summary["overall"]["stt"]["p99"] == pytest.approx(40.0, rel=0.01)
+        assert set(summary["configurations"]) == {"config_a", "config_b"}
+        assert "configurations" not in live.summary(include_configurations=False)
+
+    async def test_orchestrator_updates_live_statistics(self):
+        orchestrator = LatencyTestOrchestrator()
+        await orchestrator.register_suite(models.create_quick_validation_suite())
+        await orchestrator.register_client(
+            "client_1",
+            ClientType.IOS_SIMULATOR,
+            ClientCapabilities(["deepgram"], ["anthropic"], ["chatterbox"], True, True, False, 1),
+        )
+
+        run = await orchestrator.start_test_run("quick_validation", client_id="client_1")
+        live = orchestrator.live_statistics[run.id]
+        for _ in range(100):
+            if run.status == RunStatus.COMPLETED:
+                break
+            await asyncio.sleep(0)
+
+        assert live.successful_tests == len(run.results) == 3
+        assert live.summary()["overall"]["e2e"]["count"] == 3
+        assert await orchestrator.get_live_statistics("missing") is None
+
+    async def test_finished_run_statistics_come_from_stored_results(self, tmp_path):
+        storage = FileBasedLatencyStorage(tmp_path)
+        await storage.initialize()
+        orchestrator = LatencyTestOrchestrator(storage=storage)
+        await orchestrator.register_suite(models.create_quick_validation_suite())
+        await orchestrator.register_client(
+            "client_1",
+            ClientType.IOS_SIMULATOR,
+            ClientCapabilities(["deepgram"], ["anthropic"], ["chatterbox"], True, True, False, 1),
+        )
+
+        try:
+            run = await orchestrator.start_test_run("quick_validation", client_id="client_1")
+            for _ in range(100):
+                if run.id not in orchestrator.live_statistics:
+                    break
+                await asyncio.sleep(0)
+            assert run.id not in orchestrator.live_statistics
+
+            # Not held in memory either, so the stored results are used
+            del orchestrator.completed_runs[run.id]
+            live = await orchestrator.get_live_statistics(run.id)
+            assert live.successful_tests == len(run.results) == 3
+            assert live.summary()["overall"]["e2e"]["count"] == 3
+        finally:
+            await storage.close()
+
+
+class TestResultsAnalyzer:
+    """Tests for analysis reports."""
+
+    def test_analyze_summary_and_ranking(self):
+        rng = random.Random(8)
+        results = [make_result(i, rng.uniform(200, 400), "fast", stt=30.0) for i in range(50)]
+        results += [make_result(50 + i, rng.uniform(600, 900), "slow") for i in range(50)]
+        results.append(make_result(100, 0.0, "slow", errors=["boom"]))
+
+        report = ResultsAnalyzer().analyze(make_run(results))
+        successful = [r for r in results if r.is_success]
+        e2e = [r.e2e_latency_ms for r in successful]
+
+        assert report.summary.total_tests == 101
+        assert report.summary.failed_tests == 1
+        assert report.summary.total_configurations == 2
+        assert report.summary.overall_median_e2e_ms == pytest.approx(statistics.median(e2e))
+        assert report.summary.overall_p99_e2e_ms == pytest.approx(percentile(e2e, 99))
+        assert report.summary.median_stt_ms == 30.0
+
+        fast, slow = report.best_configurations
+        assert (fast.rank, fast.config_id, slow.rank, slow.config_id) == (1, "fast", 2, "slow")
+        fast_e2e = [r.e2e_latency_ms for r in results if r.config_id == "fast"]
+        assert fast.stddev_ms == pytest.approx(statistics.stdev(fast_e2e))
+        assert slow.breakdown.stt_ms is None
+        assert fast.network_projections["cellular_us"].e2e_ms == pytest.approx(fast.median_e2e_ms + 150)
+
+        localhost = next(p for p in report.network_projections if p.network == "localhost")
+        assert localhost.configs_meeting_target == 50
+        assert localhost.total_configs == 2
+
+    def test_regression_against_baseline(self):
+        results = [make_result(i, 600.0) for i in range(5)]
+        analyzer = ResultsAnalyzer(baselines={"config_a": {"e2e_median_ms": 300.0}})
+
+        (regression,) = analyzer.analyze(make_run(results)).regressions
+        assert regression.change_percent == pytest.approx(100.0)
+        assert regression.severity == models.RegressionSeverity.SEVERE
+
+
+def make_baseline(results) -> models.PerformanceBaseline:
+    columns = ResultColumns(results)
+    return models.PerformanceBaseline(
+        id="baseline_1",
+        name="Baseline",
+        description="",
+        run_id="run_0",
+        created_at=datetime(2026, 1, 1),
+        config_metrics={c: baseline_metrics(columns, c) for c in columns.config_ids},
+        overall_metrics=baseline_metrics(columns),
+    )
+
+
+def lognormal_results(count: int, seed: int, config_id: str = "config_a", scale: float = 1.0, start: int = 0):
+    rng = random.Random(seed)
+    return [make_result(start + i, rng.lognormvariate(6, 0.3) * scale, config_id) for i in range(count)]
+
+
+class TestSignificanceTests:
+    """Tests for the distribution-free tests behind regression checks."""
+
+    def test_mann_whitney_u_matches_reference(self):
+        # scipy.stats.mannwhitneyu(..., alternative="greater") gives 0.006092
+        p_value, delta = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+        assert p_value == pytest.approx(0.006092, abs=1e-5)
+        assert delta == 1.0
+
+        p_value, delta = mann_whitney_u([1, 2, 3], [1, 2, 3])
+        assert p_value > 0.5
+        assert delta == 0.0
+
+    def test_binomial_sf(self):
+        assert binomial_sf(3, 5, 0.5) == pytest.approx(0.5)
+        assert binomial_sf(0, 5, 0.1) == 1.0
+        assert binomial_sf(6, 5, 0.1) == 0.0
+
+    def test_benjamini_hochberg(self):
+        adjusted = benjamini_hochberg([0.01, 0.04, 0.03, 0.5])
+        assert adjusted == pytest.approx([0.04, 0.04 * 4 / 3, 0.04 * 4 / 3, 0.5])
+
+    def test_quantile_exceedance_needs_enough_baseline(self):
+        assert quantile_exceedance_test([1.0] * 10, [2.0] * 10, 0.99) is None
+
+    def test_thin_sorted_keeps_the_ends(self):
+        values = list(range(10001))
+        thinned = thin_sorted(values, 101)
+        assert len(thinned) == 101
+        assert thinned[0] == 0 and thinned[-1] == 10000 and thinned[50] == 5000
+        assert thin_sorted(values[:5], 101) == values[:5]
+
+
+class TestBaselineRegressions:
+    """Tests for regression checks against baseline distributions."""
+
+    def test_no_false_alarms_for_unchanged_distributions(self):
+        baseline_results, current_results = [], []
+        for n, config_id in enumerate(["a", "b", "c", "d", "e"]):
+            baseline_results += lognormal_results(300, seed=n, config_id=config_id)
+            current_results += lognormal_results(300, seed=100 + n, config_id=config_id)
+
+        report = ResultsAnalyzer().analyze(make_run(current_results), baseline=make_baseline(baseline_results))
+
+        assert report.regressions == []
+        # Median and P95/P99 of six metrics for five configs (no STT here)
+        assert len(report.regression_checks) == 5 * 5 * 3
+        assert all(c.skipped_reason is None for c in report.regression_checks)
+
+    def test_detects_median_shift(self):
+        baseline = make_baseline(lognormal_results(200, seed=1))
+        report = ResultsAnalyzer().analyze(
+            make_run(lognormal_results(200, seed=2, scale=1.3)), baseline=baseline
+        )
+
+        regression = next(r for r in report.regressions if r.metric == "e2e_median_ms")
+        assert regression.method == "mann_whitney_u"
+        assert regression.p_value < 0.001
+        assert regression.effect_size > 0.4
+        assert regression.change_percent == pytest.approx(30, abs=8)
+        assert regression.severity == models.RegressionSeverity.MODERATE
+        assert regression.baseline_count == 200
+
+    def test_detects_tail_regression_with_unchanged_median(self):
+        baseline = make_baseline(lognormal_results(1000, seed=3))
+        current = lognormal_results(1000, seed=4)
+        # One request in twenty stalls for three times as long
+        for result in current[::20]:
+            result.e2e_latency_ms *= 3
+
+        report = ResultsAnalyzer().analyze(make_run(current), baseline=baseline)
+        metrics = {r.metric for r in report.regressions}
+
+        assert "e2e_p99_ms" in metrics
+        assert "e2e_median_ms" not in metrics
+        p99 = next(r for r in report.regressions if r.metric == "e2e_p99_ms")
+        assert p99.method == "quantile_exceedance"
+        assert p99.effect_size > 2
+
+    def test_small_samples_are_skipped(self):
+        baseline = make_baseline(lognormal_results(200, seed=5))
+        report = ResultsAnalyzer().analyze(
+            make_run(lognormal_results(4, seed=6, scale=2.0)), baseline=baseline
+        )
+
+        assert report.regressions == []
+        assert all(c.skipped_reason for c in report.regression_checks)
+
+    def test_negligible_effect_is_not_reported(self):
+        baseline = make_baseline(lognormal_results(5000, seed=7))
+        report = ResultsAnalyzer().analyze(
+            make_run(lognormal_results(5000, seed=8, scale=1.05)),
+            baseline=baseline,
+            regression_threshold=0.02,
+        )
+
+        check = next(c for c in report.regression_checks if c.metric == "e2e_median_ms")
+        assert check.p_value < 0.05
+        assert check.effect_size < ResultsAnalyzer.MIN_EFFECT_SIZE
+        assert not check.regressed
+
+    def test_regression_threshold(self):
+        baseline = make_baseline(lognormal_results(500, seed=10))
+        current = make_run(lognormal_results(500, seed=11, scale=1.15))
+
+        metrics = {r.metric for r in ResultsAnalyzer().analyze(current, baseline=baseline).regressions}
+        assert "e2e_median_ms" in metrics
+        report = ResultsAnalyzer().analyze(current, baseline=baseline, regression_threshold=0.3)
+        assert "e2e_median_ms" not in {r.metric for r in report.regressions}
+
+    def test_baseline_without_distributions_uses_threshold(self):
+        baseline = make_baseline([make_result(i, 300.0) for i in range(3)])
+        baseline.config_metrics["config_a"].distributions = {}
+
+        report = ResultsAnalyzer().analyze(make_run([make_result(i, 400.0) for i in range(3)]), baseline=baseline)
+
+        (regression,) = report.regressions
+        assert regression.method == "threshold"
+        assert regression.change_percent == pytest.approx(33.33, abs=0.01)
+
+    def test_baseline_distributions_round_trip(self):
+        baseline = make_baseline(lognormal_results(50, seed=9))
+        restored = models.PerformanceBaseline.from_dict(baseline.to_dict())
+
+        metrics = restored.config_metrics["config_a"]
+        assert metrics.distributions["e2e"] == baseline.config_metrics["config_a"].distributions["e2e"]
+        assert len(metrics.distributions["e2e"]) == 50
+        assert metrics.p99_e2e_ms == pytest.approx(metrics.distributions["e2e"][49], abs=0.001)
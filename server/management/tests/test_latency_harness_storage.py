@@ -0,0 +1,222 @@
+"""
+Tests for the latency harness file-based storage.
+
+Tests cover:
+- Run summaries and lazily loaded results in the SQLite run index
+- Status updates that leave stored results alone
+- Import of run JSON files written before the index existed
+- Orchestrator.load_run for runs listed without their results
+"""
+
+import json
+import shutil
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add server directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from latency_harness import models
+from latency_harness.models import ClientType, NetworkProfile, RunStatus
+from latency_harness.orchestrator import LatencyTestOrchestrator
+from latency_harness.storage import FileBasedLatencyStorage
+
+
+def make_result(index: int, config_id: str = "config_a") -> models.TestResult:
+    return models.TestResult(
+        id=f"result_{index}",
+        config_id=config_id,
+        scenario_name="short_response",
+        repetition=index,
+        timestamp=datetime(2026, 1, 1, 12, 0, index),
+        client_type=ClientType.IOS_SIMULATOR,
+        stt_latency_ms=None,
+        llm_ttfb_ms=100.0 + index,
+        llm_completion_ms=300.0,
+        tts_ttfb_ms=80.0,
+        tts_completion_ms=200.0,
+        e2e_latency_ms=400.0 + index,
+        network_profile=NetworkProfile.LOCALHOST,
+    )
+
+
+def make_run(run_id: str, minutes: int, status: RunStatus = RunStatus.COMPLETED, results=()) -> models.TestRun:
+    return models.TestRun(
+        id=run_id,
+        suite_name="Quick Validation",
+        suite_id="quick_validation",
+        started_at=datetime(2026, 1, 1, 12, 0) + timedelta(minutes=minutes),
+        client_id="client_1",
+        client_type=ClientType.IOS_SIMULATOR,
+        total_configurations=4,
+        status=status,
+        results=list(results),
+    )
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    storage = FileBasedLatencyStorage(tmp_path)
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+class TestRunIndex:
+    """Tests for runs and results in the SQLite run index."""
+
+    async def test_list_runs_returns_summaries_newest_first(self, storage):
+        await storage.save_run(make_run("run_old", 0, results=[make_result(0)]))
+        await storage.save_run(make_run("run_new", 5, status=RunStatus.FAILED))
+
+        runs, total = await storage.list_runs()
+        assert total == 2
+        assert [r.id for r in runs] == ["run_new", "run_old"]
+        assert all(r.results == [] for r in runs)
+
+        runs, total = await storage.list_runs(status=RunStatus.FAILED)
+        assert [r.id for r in runs] == ["run_new"]
+        assert total == 1
+
+        runs, total = await storage.list_runs(limit=1, offset=1)
+        assert [r.id for r in runs] == ["run_old"]
+        assert total == 2
+
+    async def test_get_run_loads_results_in_order(self, storage):
+        await storage.save_run(make_run("run_1", 0))
+        for index in range(3):
+            await storage.save_result("run_1", make_result(index, "config_b" if index == 1 else "config_a"))
+
+        run = await storage.get_run("run_1")
+        assert [r.id for r in run.results] == ["result_0", "result_1", "result_2"]
+        assert run.results[2].e2e_latency_ms == 402.0
+
+        results = await storage.get_results("run_1", config_id="config_a", limit=1)
+        assert [r.id for r in results] == ["result_0"]
+        assert await storage.get_run("missing") is None
+
+    async def test_saving_a_run_again_does_not_duplicate_results(self, storage):
+        run = make_run("run_1", 0)
+        await storage.save_run(run)
+        result = make_result(0)
+        run.results.append(result)
+        await storage.save_result("run_1", result)
+        await storage.save_run(run)
+
+        assert len(await storage.get_results("run_1")) == 1
+
+    async def test_result_for_unknown_run_is_dropped(self, storage):
+        await storage.save_result("missing", make_result(0))
+        assert await storage.get_results("missing") == []
+
+    async def test_update_run_status_keeps_results(self, storage):
+        await storage.save_run(make_run("run_1", 0, status=RunStatus.RUNNING, results=[make_result(0)]))
+        completed_at = datetime(2026, 1, 1, 13, 0)
+
+        assert await storage.update_run_status("run_1", RunStatus.COMPLETED, 4, completed_at)
+        assert not await storage.update_run_status("missing", RunStatus.COMPLETED)
+
+        run = await storage.get_run("run_1")
+        assert run.status == RunStatus.COMPLETED
+        assert run.completed_configurations == 4
+        assert run.completed_at == completed_at
+        assert len(run.results) == 1
+
+    async def test_delete_run(self, storage):
+        await storage.save_run(make_run("run_1", 0, results=[make_result(0)]))
+
+        assert await storage.delete_run("run_1")
+        assert not await storage.delete_run("run_1")
+        assert await storage.get_results("run_1") == []
+
+    async def test_runs_persist_across_restarts(self, storage, tmp_path):
+        await storage.save_run(make_run("run_1", 0, results=[make_result(0)]))
+        await storage.close()
+
+        reopened = FileBasedLatencyStorage(tmp_path)
+        await reopened.initialize()
+        try:
+            assert len((await reopened.get_run("run_1")).results) == 1
+        finally:
+            await reopened.close()
+
+
+class TestLegacyImport:
+    """Tests for importing run JSON files into the index."""
+
+    async def test_imports_run_files_in_place(self, tmp_path):
+        runs_dir = tmp_path / "runs"
+        runs_dir.mkdir()
+        legacy = make_run("run_legacy", 0, results=[make_result(0), make_result(0), make_result(1)])
+        (runs_dir / "run_legacy.json").write_text(json.dumps(legacy.to_dict()))
+        (runs_dir / "broken.json").write_text("{not json")
+
+        storage = FileBasedLatencyStorage(tmp_path)
+        await storage.initialize()
+        try:
+            run = await storage.get_run("run_legacy")
+            # Duplicated result rows in old files are stored once
+            assert [r.id for r in run.results] == ["result_0", "result_1"]
+            assert (runs_dir / "run_legacy.json").exists()
+            assert (runs_dir / "broken.json").exists()
+            assert not (runs_dir / "imported").exists()
+        finally:
+            await storage.close()
+
+    async def test_files_imported_once(self, tmp_path):
+        runs_dir = tmp_path / "runs"
+        runs_dir.mkdir()
+        (runs_dir / "run_legacy.json").write_text(json.dumps(make_run("run_legacy", 0).to_dict()))
+        (runs_dir / "run_kept.json").write_text(json.dumps(make_run("run_kept", 1).to_dict()))
+
+        storage = FileBasedLatencyStorage(tmp_path)
+        await storage.initialize()
+        try:
+            assert await storage.delete_run("run_legacy")
+            updated = make_run("run_kept", 1, status=RunStatus.FAILED)
+            await storage.save_run(updated)
+        finally:
+            await storage.close()
+
+        reopened = FileBasedLatencyStorage(tmp_path)
+        await reopened.initialize()
+        try:
+            # Neither file is imported again over what the index holds now
+            assert await reopened.get_run("run_legacy") is None
+            assert (await reopened.get_run("run_kept")).status == RunStatus.FAILED
+            assert sorted(p.name for p in runs_dir.glob("*.json")) == ["run_kept.json", "run_legacy.json"]
+        finally:
+            await reopened.close()
+
+    async def test_tracked_fixtures_left_in_place(self, tmp_path):
+        fixtures = Path(__file__).resolve().parents[2] / "data" / "latency_harness" / "runs"
+        runs_dir = tmp_path / "runs"
+        shutil.copytree(fixtures, runs_dir)
+        names = sorted(p.name for p in runs_dir.glob("*.json"))
+
+        storage = FileBasedLatencyStorage(tmp_path)
+        await storage.initialize()
+        try:
+            assert sorted(p.name for p in runs_dir.glob("*.json")) == names
+            assert (await storage.list_runs(limit=100))[1] == len(names)
+        finally:
+            await storage.close()
+
+
+class TestOrchestratorLoadRun:
+    """Tests for LatencyTestOrchestrator.load_run with stored runs."""
+
+    async def test_load_run_reads_results_for_listed_runs(self, storage):
+        await storage.save_run(make_run("run_1", 0, results=[make_result(0)]))
+        await storage.save_run(make_run("run_stale", 1, status=RunStatus.RUNNING))
+
+        orchestrator = LatencyTestOrchestrator(storage=storage)
+        await orchestrator._load_from_storage()
+
+        assert orchestrator.get_run("run_1").results == []
+        assert len((await orchestrator.load_run("run_1")).results) == 1
+        assert (await storage.get_run("run_stale")).status == RunStatus.FAILED
+        assert await orchestrator.load_run("missing") is None
@@ -433,6 +433,18 @@ class TestManagementState:
         assert isinstance(mgmt_state.curriculum_details, dict)
         assert isinstance(mgmt_state.curriculum_raw, dict)
 
+    def test_retrieval_indexes_wait_for_startup(self, tmp_path):
+        """Test that indexes are only built and saved once enabled."""
+        mgmt_state = ManagementState()
+        assert mgmt_state.retrieval_indexes.directory is None
+        assert all(mgmt_state.retrieval_indexes.get(cid) is None for cid in mgmt_state.curriculum_raw)
+
+        mgmt_state.enable_retrieval_indexes(tmp_path)
+        mgmt_state.reload_curricula()
+        for curriculum_id in mgmt_state.curriculum_raw:
+            assert mgmt_state.retrieval_indexes.get(curriculum_id) is not None
+        assert len(list(tmp_path.glob("*.json"))) == len(mgmt_state.curriculum_raw)
+
     def test_reload_curricula_clears_state(self):
         """Test that reload_curricula clears the curriculum state."""
         mgmt_state = ManagementState()
@@ -462,6 +462,83 @@ class TestPrefetchUpcoming:
         await integration.prefetch_upcoming(session, 0, ["Seg 1"])
 
 
+class MockPlanner:
+    """Mock prefetch planner."""
+
+    def __init__(self):
+        self.schedule_calls = []
+        self.cancelled = []
+        self.removed = []
+        self.playback = []
+
+    async def schedule(self, **kwargs):
+        self.schedule_calls.append(kwargs)
+
+    def cancel_session(self, session_id):
+        self.cancelled.append(session_id)
+        return 2
+
+    def remove_session(self, session_id):
+        self.removed.append(session_id)
+
+    def record_playback(self, session_id, cache_hit):
+        self.playback.append((session_id, cache_hit))
+
+    def observe_generation(self, *args):
+        pass
+
+    def get_buffer_health(self, session_id):
+        return {"session_id": session_id}
+
+
+class TestPrefetchPlannerIntegration:
+    """Tests for routing live prefetch through the buffer planner."""
+
+    @pytest.fixture
+    def integration(self):
+        return SessionCacheIntegration(
+            MockTTSCache(), MockResourcePool(), MockPrefetcher(), planner=MockPlanner()
+        )
+
+    @pytest.fixture
+    def session(self):
+        session = MockUserSession()
+        session.playback_state.segment_offset_ms = 1200
+        return session
+
+    @pytest.mark.asyncio
+    async def test_planner_used_without_explicit_lookahead(self, integration, session):
+        await integration.prefetch_upcoming(session, 2, ["a", "b", "c", "d"])
+
+        call = integration.planner.schedule_calls[0]
+        assert call["current_index"] == 2
+        assert call["offset_ms"] == 1200
+        assert integration.prefetcher.prefetch_calls == []
+
+    @pytest.mark.asyncio
+    async def test_explicit_lookahead_uses_prefetcher(self, integration, session):
+        await integration.prefetch_upcoming(session, 0, ["a", "b"], lookahead=1)
+
+        assert integration.planner.schedule_calls == []
+        assert len(integration.prefetcher.prefetch_calls) == 1
+
+    def test_cancel_and_buffer_health(self, integration):
+        assert integration.cancel_prefetch("s1") == 2
+        assert integration.get_buffer_health("s1") == {"session_id": "s1"}
+
+    def test_cancel_without_planner(self):
+        integration = SessionCacheIntegration(MockTTSCache(), MockResourcePool())
+        assert integration.cancel_prefetch("s1") == 0
+        assert integration.get_buffer_health("s1") is None
+
+    def test_clear_session_stats_removes_planner_session(self, integration):
+        integration._record_hit("s1")
+        integration.clear_session_stats("s1")
+
+        assert integration.planner.removed == ["s1"]
+        assert integration.planner.playback == [("s1", True)]
+
+
 # =============================================================================
 # SESSION STATS TESTS
 # =============================================================================
@@ -0,0 +1,336 @@
+"""
+Tests for state_backend.py and the components that share state through it.
+
+Tests cover:
+- In-memory and SQLite backends (get/set, expiry, atomic update)
+- Backend URL parsing
+- SharedRateLimiter buckets across limiter instances
+- SessionManager continuity across workers sharing a backend
+- Compare-and-swap session saves and off-loop backend calls
+- Real worker processes sharing one SQLite backend
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from auth.rate_limiter import (
+    InMemoryRateLimiter,
+    RateLimitConfig,
+    SharedRateLimiter,
+    create_rate_limiter,
+)
+from fov_context.session import SessionManager, StaleSessionError
+from state_backend import (
+    InMemoryStateBackend,
+    SQLiteStateBackend,
+    StateBackend,
+    affinity_headers,
+    create_state_backend,
+)
+
+MANAGEMENT_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        backend = InMemoryStateBackend()
+    else:
+        backend = SQLiteStateBackend(tmp_path / "state.db")
+    yield backend
+    backend.close()
+
+
+class TestBackends:
+    """Tests shared by every backend."""
+
+    def test_set_get_delete(self, backend):
+        backend.set("ns", "a", b"1")
+        assert backend.get("ns", "a") == b"1"
+        assert backend.get("other", "a") is None
+        assert backend.delete("ns", "a") is True
+        assert backend.get("ns", "a") is None
+        assert backend.delete("ns", "a") is False
+
+    def test_expired_values_hidden_and_purged(self, backend):
+        backend.set("ns", "old", b"x", ttl_seconds=-1)
+        backend.set("ns", "new", b"y", ttl_seconds=60)
+        assert backend.items("ns") == [("new", b"y")]
+        assert backend.purge_expired("ns") == 1
+        assert backend.get("ns", "old") is None
+
+    def test_purge_limited_to_namespace(self, backend):
+        backend.set("a", "k", b"x", ttl_seconds=-1)
+        backend.set("b", "k", b"x", ttl_seconds=-1)
+        assert backend.purge_expired("a") == 1
+        assert backend.purge_expired() == 1
+
+    def test_update(self, backend):
+        def increment(raw):
+            return str(int(raw or b"0") + 1).encode()
+
+        assert backend.update("ns", "n", increment) == b"1"
+        assert backend.update("ns", "n", increment) == b"2"
+        assert backend.update("ns", "n", lambda raw: None) is None
+        assert backend.get("ns", "n") is None
+
+    def test_failed_update_leaves_value(self, backend):
+        backend.set("ns", "k", b"keep")
+
+        def fail(raw):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            backend.update("ns", "k", fail)
+        assert backend.get("ns", "k") == b"keep"
+
+    def test_json_helpers(self, backend):
+        backend.set_json("ns", "k", {"a": [1, 2]})
+        assert backend.get_json("ns", "k") == {"a": [1, 2]}
+        assert backend.get_json("ns", "missing") is None
+
+
+class TestCreateStateBackend:
+    """Tests for backend URLs."""
+
+    def test_memory_default(self):
+        assert isinstance(create_state_backend(None), InMemoryStateBackend)
+        assert isinstance(create_state_backend("memory"), InMemoryStateBackend)
+
+    def test_sqlite(self, tmp_path):
+        backend = create_state_backend(f"sqlite:///{tmp_path}/state.db")
+        assert isinstance(backend, SQLiteStateBackend)
+        assert backend.shared is True
+        backend.close()
+
+    def test_unsupported(self):
+        with pytest.raises(ValueError):
+            create_state_backend("redis://localhost")
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError):
+            StateBackend()
+
+    def test_affinity_headers(self, monkeypatch):
+        monkeypatch.setenv("VOICELEARN_WORKER_ID", "w1")
+        assert affinity_headers("s1") == {"X-Session-Affinity": "s1", "X-Worker-Id": "w1"}
+
+
+class TestSharedRateLimiter:
+    """Tests for rate limit buckets in a shared backend."""
+
+    LIMITS = {"default": RateLimitConfig(requests=3, window_seconds=60)}
+
+    def test_factory_picks_shared_only_for_shared_backends(self, tmp_path):
+        shared = SQLiteStateBackend(tmp_path / "state.db")
+        assert isinstance(create_rate_limiter(backend=shared), SharedRateLimiter)
+        assert type(create_rate_limiter(backend=InMemoryStateBackend())) is InMemoryRateLimiter
+        shared.close()
+
+    async def test_limiters_share_buckets(self, tmp_path):
+        first = SharedRateLimiter(SQLiteStateBackend(tmp_path / "state.db"), self.LIMITS)
+        second = SharedRateLimiter(SQLiteStateBackend(tmp_path / "state.db"), self.LIMITS)
+
+        results = [
+            (await limiter.check_rate_limit("1.2.3.4"))[0]
+            for limiter in (first, second, first, second)
+        ]
+        assert results == [True, True, True, False]
+
+        allowed, headers = await second.check_rate_limit("1.2.3.4")
+        assert allowed is False
+        assert "Retry-After" in headers
+
+        await first.reset("1.2.3.4")
+        assert (await second.check_rate_limit("1.2.3.4"))[0] is True
+
+
+class TestSharedSessionManager:
+    """Tests for sessions shared by two managers (workers)."""
+
+    @pytest.fixture
+    def workers(self, tmp_path):
+        return (
+            SessionManager(state_backend=SQLiteStateBackend(tmp_path / "state.db")),
+            SessionManager(state_backend=SQLiteStateBackend(tmp_path / "state.db")),
+        )
+
+    def test_session_visible_to_other_worker(self, workers):
+        first, second = workers
+        session = first.create_session("physics-101")
+        assert second.get_session(session.session_id).curriculum_id == "physics-101"
+        assert [s["session_id"] for s in second.list_sessions()] == [session.session_id]
+
+    def test_saved_changes_reloaded(self, workers):
+        first, second = workers
+        session = first.create_session("physics-101")
+        assert not second.get_session(session.session_id).conversation_history
+
+        session.add_user_turn("What is energy?")
+        first.save_session(session)
+        reloaded = second.get_session(session.session_id)
+        assert [turn.content for turn in reloaded.conversation_history] == ["What is energy?"]
+
+    def test_unchanged_session_not_reloaded(self, workers):
+        first, second = workers
+        session = first.create_session("physics-101")
+        assert second.get_session(session.session_id) is second.get_session(session.session_id)
+
+    def test_end_session_everywhere(self, workers):
+        first, second = workers
+        session = first.create_session("physics-101")
+        second.get_session(session.session_id)
+        assert first.end_session(session.session_id) is True
+        assert second.get_session(session.session_id) is None
+
+    def test_one_user_session_per_user(self, workers):
+        first, second = workers
+        created = first.create_user_session("user-1")
+        again = second.create_user_session("user-1")
+        assert again.session_id == created.session_id
+        assert second.get_user_session_by_user("user-1").session_id == created.session_id
+
+    def test_end_user_session_everywhere(self, workers):
+        first, second = workers
+        created = first.create_user_session("user-1")
+        assert second.end_user_session(created.session_id) is True
+        assert first.get_user_session(created.session_id) is None
+        assert first.get_user_session_by_user("user-1") is None
+
+    def test_stale_save_rejected(self, workers):
+        first, second = workers
+        session = first.create_session("physics-101")
+        stale = second.get_session(session.session_id)
+
+        session.add_user_turn("What is energy?")
+        first.save_session(session)
+        stale.add_user_turn("What is power?")
+        with pytest.raises(StaleSessionError):
+            second.save_session(stale)
+
+        # The rejected write left the first worker's save in place
+        reloaded = second.get_session(session.session_id)
+        assert [turn.content for turn in reloaded.conversation_history] == ["What is energy?"]
+        reloaded.add_user_turn("What is power?")
+        second.save_session(reloaded)
+        assert len(first.get_session(session.session_id).conversation_history) == 2
+
+    def test_save_after_end_elsewhere_rejected(self, workers):
+        first, second = workers
+        session = first.create_session("physics-101")
+        second.end_session(session.session_id)
+
+        with pytest.raises(StaleSessionError):
+            first.save_session(session)
+        assert first.get_session(session.session_id) is None
+        assert first.list_sessions() == []
+
+    async def test_concurrent_saves_from_one_worker(self, workers):
+        first, second = workers
+        session = await first.create_session_async("physics-101")
+        session.add_user_turn("What is energy?")
+
+        await asyncio.gather(*(first.save_session_async(session) for _ in range(5)))
+        reloaded = await second.get_session_async(session.session_id)
+        assert [turn.content for turn in reloaded.conversation_history] == ["What is energy?"]
+
+    async def test_async_calls_do_not_block_event_loop(self, workers):
+        first, second = workers
+        backend_get, backend_update = second.state_backend.get, second.state_backend.update
+
+        def slow_get(*args):
+            time.sleep(0.05)
+            return backend_get(*args)
+
+        def slow_update(*args):
+            time.sleep(0.05)
+            return backend_update(*args)
+
+        session = first.create_session("physics-101")
+        user = first.create_user_session("user-1")
+        second.state_backend.get, second.state_backend.update = slow_get, slow_update
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(tick())
+        loaded = await second.get_session_async(session.session_id)
+        loaded.add_user_turn("What is energy?")
+        await second.save_session_async(loaded)
+        assert (await second.get_user_session_by_user_async("user-1")).session_id == user.session_id
+        assert await second.end_user_session_async(user.session_id) is True
+        ticker.cancel()
+
+        assert ticks > 20
+        assert first.get_session(session.session_id).conversation_history
+        assert first.get_user_session(user.session_id) is None
+
+
+WORKER_SCRIPT = """
+import asyncio, json, sys
+from auth.rate_limiter import RateLimitConfig, SharedRateLimiter
+from fov_context.session import SessionManager
+from state_backend import SQLiteStateBackend
+
+db, action, arg = sys.argv[1:4]
+backend = SQLiteStateBackend(db)
+if action == "create":
+    manager = SessionManager(state_backend=backend)
+    session = manager.create_session("physics-101")
+    session.add_user_turn(arg)
+    manager.save_session(session)
+    print(session.session_id)
+elif action == "read":
+    session = SessionManager(state_backend=backend).get_session(arg)
+    print(json.dumps([turn.content for turn in session.conversation_history]))
+elif action == "drain":
+    limiter = SharedRateLimiter(
+        backend, {"default": RateLimitConfig(requests=10, window_seconds=3600)}
+    )
+
+    async def drain():
+        return [(await limiter.check_rate_limit("client"))[0] for _ in range(int(arg))]
+
+    print(sum(asyncio.run(drain())))
+"""
+
+
+def run_worker(db: Path, action: str, arg: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", WORKER_SCRIPT, str(db), action, arg],
+        cwd=MANAGEMENT_DIR,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def output(process: subprocess.Popen) -> str:
+    stdout, _ = process.communicate(timeout=60)
+    assert process.returncode == 0
+    return stdout.strip()
+
+
+class TestWorkerProcesses:
+    """Tests with separate worker processes on one SQLite backend."""
+
+    def test_session_continues_on_another_worker(self, tmp_path):
+        db = tmp_path / "state.db"
+        session_id = output(run_worker(db, "create", "What is entropy?"))
+        assert json.loads(output(run_worker(db, "read", session_id))) == ["What is entropy?"]
+
+    def test_workers_draw_from_one_bucket(self, tmp_path):
+        db = tmp_path / "state.db"
+        SQLiteStateBackend(db).close()
+        workers = [run_worker(db, "drain", "8") for _ in range(3)]
+        assert sum(int(output(worker)) for worker in workers) == 10
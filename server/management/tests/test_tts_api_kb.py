@@ -37,17 +37,29 @@ class MockKBAudioManager:
         self._manifests = {}
         self._jobs = {}
         self._feedback_audio = {}
+        self.available_formats = ()
 
     async def get_audio(self, module_id, question_id, segment_type, hint_index=0):
         """Get audio from mock storage."""
         key = f"{module_id}/{question_id}/{segment_type}/{hint_index}"
         return self._audio_data.get(key)
 
+    async def get_audio_variant(
+        self, module_id, question_id, segment_type, hint_index=0, format_name="wav"
+    ):
+        """Get audio from mock storage (only WAV is stored)."""
+        audio = await self.get_audio(module_id, question_id, segment_type, hint_index)
+        return (audio, "wav") if audio is not None else None
+
     async def get_manifest(self, module_id):
         """Get manifest for module."""
         return self._manifests.get(module_id)
 
-    def get_coverage_status(self, module_id, module_content):
+    def get_cached_coverage(self, module_id, content_version):
+        """No cached coverage; always recompute."""
+        return None
+
+    def get_coverage_status(self, module_id, module_content, content_version=None):
         """Get coverage status."""
         return KBCoverageStatus(
             module_id=module_id,
@@ -93,6 +105,25 @@ class MockKBAudioManager:
         """Extract segments from module content."""
         return [{"id": "seg-1"}, {"id": "seg-2"}]
 
+    def get_segment_availability(self, module_id, question_ids, segment_keys):
+        """Get availability from the mock manifest."""
+        manifest = self._manifests.get(module_id)
+        result = {"segments": {}, "total_size_bytes": 0, "available_count": 0, "missing_count": 0}
+        for qid in question_ids:
+            result["segments"][qid] = {}
+            for key in segment_keys:
+                entry = manifest.segments.get(qid, {}).get(key) if manifest else None
+                if entry:
+                    result["segments"][qid][key] = {
+                        "available": True, "duration": entry.duration_seconds, "size": entry.size_bytes,
+                    }
+                    result["total_size_bytes"] += entry.size_bytes
+                    result["available_count"] += 1
+                else:
+                    result["segments"][qid][key] = {"available": False, "duration": 0, "size": 0}
+                    result["missing_count"] += 1
+        return result
+
     def set_audio(self, module_id, question_id, segment_type, audio_data, hint_index=0):
         """Helper to set audio in mock storage."""
         key = f"{module_id}/{question_id}/{segment_type}/{hint_index}"
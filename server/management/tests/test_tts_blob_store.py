@@ -0,0 +1,234 @@
+"""
+Tests for the Content-Addressed Audio Blob Store
+
+Tests verify blob storage and hardlink reference counting, garbage
+collection, and sharing between the TTS cache, KB audio and pregen jobs.
+"""
+
+import io
+import wave
+import pytest
+from uuid import uuid4
+
+from tts_cache import AudioBlobStore, TTSCache, TTSCacheKey
+from tts_cache.blob_store import wav_info
+from tts_cache.kb_audio import KBAudioManager
+from tts_pregen.models import ItemStatus, TTSJobItem
+from tts_pregen.orchestrator import TTSPregenOrchestrator
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+def make_wav(seconds=0.5, sample_rate=24000):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(b"\x01\x00" * int(seconds * sample_rate))
+    return buf.getvalue()
+
+
+AUDIO = make_wav()
+
+
+def key_for(text, voice_id="nova", provider="vibevoice"):
+    return TTSCacheKey.from_request(text=text, voice_id=voice_id, provider=provider)
+
+
+class CountingPool:
+    """Resource pool that returns a real WAV and counts generations."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def generate_with_priority(self, text, voice_id, provider, speed, chatterbox_config, priority):
+        self.calls.append(text)
+        return AUDIO, 24000, 0.5
+
+
+@pytest.fixture
+async def store(tmp_path):
+    store = AudioBlobStore(tmp_path / "blobs")
+    await store.initialize()
+    return store
+
+
+@pytest.fixture
+async def cache(tmp_path, store):
+    cache = TTSCache(tmp_path / "cache", blob_store=store)
+    await cache.initialize()
+    return cache
+
+
+# =============================================================================
+# BLOB STORE
+# =============================================================================
+
+
+class TestAudioBlobStore:
+    """Tests for storing, linking and collecting blobs."""
+
+    async def test_store_links_and_counts_references(self, store, tmp_path):
+        key = key_for("Hello")
+        first, second = tmp_path / "a" / "one.wav", tmp_path / "b" / "two.wav"
+
+        await store.store(key, AUDIO, first)
+        assert await store.link(key, second)
+
+        assert first.read_bytes() == second.read_bytes() == AUDIO
+        assert store.ref_count(key) == 2
+        assert first.stat().st_ino == second.stat().st_ino
+
+    async def test_link_missing_blob(self, store, tmp_path):
+        assert not await store.link(key_for("missing"), tmp_path / "x.wav")
+        assert not (tmp_path / "x.wav").exists()
+        assert store.misses == 1
+
+    async def test_link_replaces_existing_file(self, store, tmp_path):
+        key = key_for("Hello")
+        dest = tmp_path / "dest.wav"
+        dest.write_bytes(b"stale")
+        await store.put(key, AUDIO)
+
+        assert await store.link(key, dest)
+        assert dest.read_bytes() == AUDIO
+
+    async def test_put_does_not_rewrite_linked_files(self, store, tmp_path):
+        key = key_for("Hello")
+        dest = tmp_path / "dest.wav"
+        await store.store(key, AUDIO, dest)
+
+        await store.put(key, make_wav(seconds=1.0))
+
+        assert dest.read_bytes() == AUDIO
+
+    async def test_collect_garbage_keeps_referenced_blobs(self, store, tmp_path):
+        kept, dropped = key_for("kept"), key_for("dropped")
+        await store.store(kept, AUDIO, tmp_path / "kept.wav")
+        await store.store(dropped, AUDIO, tmp_path / "dropped.wav")
+        (tmp_path / "dropped.wav").unlink()
+
+        assert await store.collect_garbage() == 1
+        assert store.has(kept)
+        assert not store.has(dropped)
+
+    async def test_stats_report_savings(self, store, tmp_path):
+        key = key_for("Hello")
+        await store.store(key, AUDIO, tmp_path / "a.wav")
+        for name in ("b", "c"):
+            await store.link(key, tmp_path / f"{name}.wav")
+
+        stats = await store.get_stats()
+
+        assert stats["blobs"] == 1
+        assert stats["references"] == 3
+        assert stats["physical_bytes"] == len(AUDIO)
+        assert stats["saved_bytes"] == 2 * len(AUDIO)
+
+    def test_wav_info(self, tmp_path):
+        path = tmp_path / "clip.wav"
+        path.write_bytes(make_wav(seconds=2.0, sample_rate=16000))
+        assert wav_info(path) == (16000, 2.0)
+
+
+# =============================================================================
+# SHARING BETWEEN SUBSYSTEMS
+# =============================================================================
+
+
+class TestCacheSharing:
+    """Tests for TTSCache backed by the blob store."""
+
+    async def test_put_links_into_store(self, cache, store):
+        key = key_for("Hello")
+        entry = await cache.put(key, AUDIO, 24000, 0.5)
+
+        assert store.ref_count(key) == 1
+        cached_path = cache.audio_dir / key.to_hash()[:2] / f"{key.to_hash()}.wav"
+        assert store.blob_path(key).stat().st_ino == cached_path.stat().st_ino
+        assert entry.size_bytes == len(AUDIO)
+
+    async def test_miss_adopts_audio_from_store(self, cache, store, tmp_path):
+        key = key_for("Generated elsewhere")
+        await store.store(key, AUDIO, tmp_path / "kb" / "question.wav")
+
+        assert await cache.get(key) == AUDIO
+        stats = await cache.get_stats()
+        assert stats.hits == 1
+        assert stats.shared_hits == 1
+        assert cache.index[key.to_hash()].duration_seconds == pytest.approx(0.5)
+        assert store.ref_count(key) == 2
+
+    async def test_has_adopts_from_store(self, cache, store, tmp_path):
+        key = key_for("Prefetched by KB")
+        assert not await cache.has(key)
+
+        await store.store(key, AUDIO, tmp_path / "kb.wav")
+        assert await cache.has(key)
+
+    async def test_eviction_keeps_blob_for_other_references(self, cache, store, tmp_path):
+        key = key_for("Hello")
+        await cache.put(key, AUDIO, 24000, 0.5)
+        await store.link(key, tmp_path / "kb.wav")
+
+        await cache.delete(key)
+
+        assert (tmp_path / "kb.wav").read_bytes() == AUDIO
+        assert store.ref_count(key) == 1
+
+
+class TestKBAudioSharing:
+    """Tests for KB generation reusing shared audio."""
+
+    async def test_kb_links_cached_audio_and_warms_cache(self, tmp_path, cache, store):
+        pool = CountingPool()
+        manager = KBAudioManager(str(tmp_path / "kb"), pool, delay_between_requests=0, blob_store=store)
+        await manager.initialize()
+        module = {"domains": [{"questions": [
+            {"id": "q1", "question_text": "Already spoken", "answer_text": "New answer"},
+        ]}]}
+        await cache.put(key_for("Already spoken"), AUDIO, 24000, 0.5)
+
+        job_id = await manager.prefetch_module("m1", module)
+        task, progress = manager._jobs[job_id]
+        await task
+
+        assert pool.calls == ["New answer"]
+        assert progress.shared == 1
+        assert progress.generated == 1
+        entry = manager._manifests["m1"].segments["q1"]["question"]
+        assert entry.duration_seconds == pytest.approx(0.5)
+
+        # Audio KB generated is a cache hit for live sessions
+        assert await cache.get(key_for("New answer")) == AUDIO
+        assert (await cache.get_stats()).shared_hits == 1
+
+
+class TestPregenSharing:
+    """Tests for pregen items reusing shared audio."""
+
+    async def test_item_links_shared_audio(self, tmp_path, store):
+        pool = CountingPool()
+        orchestrator = TTSPregenOrchestrator(None, pool, blob_store=store)
+        await store.store(key_for("Shared text"), AUDIO, tmp_path / "live.wav")
+
+        def item(text, index):
+            return TTSJobItem(
+                id=uuid4(), job_id=uuid4(), item_index=index, text_content=text,
+                text_hash=TTSJobItem.hash_text(text), status=ItemStatus.PENDING,
+            )
+
+        shared, fresh = item("Shared text", 0), item("Fresh text", 1)
+        for job_item in (shared, fresh):
+            assert await orchestrator._process_item(
+                job_item, "vibevoice", "nova", {}, tmp_path, "wav"
+            )
+
+        assert pool.calls == ["Fresh text"]
+        assert shared.duration_seconds == pytest.approx(0.5)
+        assert shared.file_size_bytes == len(AUDIO)
+        assert store.ref_count(key_for("Fresh text")) == 1
@@ -0,0 +1,383 @@
+"""
+Tests for the compressed audio storage tier.
+
+Covers format negotiation, the process-pool AudioEncoder, and how TTSCache
+and KBAudioManager store and serve compressed variants. A zlib-backed codec
+stands in for FLAC so the tests run without external encoder binaries.
+"""
+
+import io
+import os
+import wave
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tts_cache.cache import TTSCache
+from tts_cache.encoding import (
+    CODECS,
+    CONTENT_TYPE_FORMATS,
+    AudioCodec,
+    AudioEncoder,
+    content_type_for,
+    negotiate_format,
+    register_codec,
+    wav_duration_seconds,
+)
+from tts_cache.kb_audio import KBAudioManager
+from tts_cache.models import TTSCacheEntry, TTSCacheKey
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _zlib_encode(data: bytes) -> bytes:
+    return zlib.compress(data, 6)
+
+
+def _zlib_decode(data: bytes) -> bytes:
+    return zlib.decompress(data)
+
+
+def make_wav(seconds: float = 1.0, sample_rate: int = 24000, noisy: bool = False) -> bytes:
+    """Build a real 16-bit mono WAV (silence compresses well, noise does not)."""
+    frames = int(seconds * sample_rate)
+    if noisy:
+        pcm = os.urandom(frames * 2)
+    else:
+        pcm = b"\x00\x00" * frames
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    return buf.getvalue()
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def zlib_codec():
+    """Register a lossless test codec for the duration of a test."""
+    codec = AudioCodec(
+        name="ztest",
+        content_type="audio/x-ztest",
+        extension="zt",
+        lossless=True,
+        encode=_zlib_encode,
+        decode=_zlib_decode,
+    )
+    register_codec(codec)
+    yield codec
+    CODECS.pop("ztest", None)
+    CONTENT_TYPE_FORMATS.pop("audio/x-ztest", None)
+
+
+@pytest.fixture
+def thread_executor():
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def encoder(zlib_codec, thread_executor):
+    return AudioEncoder(formats=["ztest"], executor=thread_executor)
+
+
+@pytest.fixture
+def sample_key():
+    return TTSCacheKey.from_request(text="Hello world", voice_id="nova", provider="vibevoice")
+
+
+# =============================================================================
+# FORMAT NEGOTIATION
+# =============================================================================
+
+
+class TestNegotiateFormat:
+    """Tests for Accept-header negotiation."""
+
+    def test_no_accept_header_is_wav(self):
+        assert negotiate_format(None, ("flac",)) == "wav"
+
+    def test_wildcard_keeps_canonical(self):
+        assert negotiate_format("*/*", ("flac",)) == "wav"
+        assert negotiate_format("audio/*", ("flac",)) == "wav"
+
+    def test_prefers_available_compressed_type(self):
+        assert negotiate_format("audio/flac, audio/wav;q=0.5", ("flac",)) == "flac"
+
+    def test_quality_ordering(self):
+        accept = "audio/flac;q=0.4, audio/ogg;q=0.9"
+        assert negotiate_format(accept, ("flac", "opus")) == "opus"
+
+    def test_unavailable_format_falls_through(self):
+        assert negotiate_format("audio/flac, audio/wav", ()) == "wav"
+
+    def test_zero_quality_excluded(self):
+        assert negotiate_format("audio/flac;q=0, audio/wav", ("flac",)) == "wav"
+
+    def test_codecs_parameter(self):
+        assert negotiate_format("audio/ogg; codecs=opus", ("opus",)) == "opus"
+
+    def test_explicit_request_overrides_accept(self):
+        assert negotiate_format("audio/wav", ("flac",), requested="FLAC") == "flac"
+
+    def test_explicit_unavailable_request_is_wav(self):
+        assert negotiate_format("audio/flac", ("flac",), requested="opus") == "wav"
+
+    def test_content_type_for(self):
+        assert content_type_for("wav") == "audio/wav"
+        assert content_type_for("flac") == "audio/flac"
+        assert content_type_for("opus") == "audio/ogg"
+
+
+# =============================================================================
+# AUDIO ENCODER
+# =============================================================================
+
+
+class TestAudioEncoder:
+    """Tests for AudioEncoder."""
+
+    def test_unknown_and_unavailable_formats_dropped(self, zlib_codec):
+        register_codec(AudioCodec(
+            name="missing",
+            content_type="audio/x-missing",
+            extension="ms",
+            lossless=False,
+            encode=_zlib_encode,
+            binary="definitely-not-an-encoder-binary",
+        ))
+        try:
+            encoder = AudioEncoder(formats=["nope", "missing", "ztest"])
+            assert encoder.formats == ("ztest",)
+            assert encoder.enabled
+            assert encoder.lossless_format == "ztest"
+        finally:
+            CODECS.pop("missing", None)
+            CONTENT_TYPE_FORMATS.pop("audio/x-missing", None)
+
+    def test_disabled_without_formats(self):
+        encoder = AudioEncoder(formats=[])
+        assert not encoder.enabled
+        assert encoder.lossless_format is None
+
+    @pytest.mark.asyncio
+    async def test_encode_compressible_audio(self, encoder):
+        wav = make_wav(2.0)
+        result = await encoder.encode(wav, "ztest")
+
+        assert result is not None
+        assert result.savings_ratio > 0.9
+        assert _zlib_decode(result.data) == wav
+
+    @pytest.mark.asyncio
+    async def test_skips_incompressible_audio(self, encoder):
+        result = await encoder.encode(make_wav(0.5, noisy=True), "ztest")
+        assert result is None
+        assert encoder.stats["ztest"].skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_force_keeps_result(self, encoder):
+        result = await encoder.encode(make_wav(0.5, noisy=True), "ztest", force=True)
+        assert result is not None
+
+    @pytest.mark.asyncio
+    async def test_stats_track_cost_per_audio_minute(self, encoder):
+        await encoder.encode(make_wav(3.0), "ztest")
+        stats = encoder.get_stats()["by_format"]["ztest"]
+
+        assert stats["encoded"] == 1
+        assert stats["audio_seconds"] == pytest.approx(3.0)
+        assert stats["compression_ratio"] > 10
+        assert stats["encode_seconds_per_audio_minute"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_decode_failure_returns_none(self, zlib_codec, thread_executor):
+        encoder = AudioEncoder(formats=["ztest"], executor=thread_executor)
+        result = await encoder.decode(b"not zlib data", "ztest")
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_process_pool_default(self, zlib_codec):
+        encoder = AudioEncoder(formats=["ztest"], max_workers=1)
+        try:
+            result = await encoder.encode(make_wav(1.0), "ztest")
+            assert result is not None
+        finally:
+            encoder.shutdown()
+        assert encoder.executor is None
+
+    def test_wav_duration_fallback(self):
+        assert wav_duration_seconds(make_wav(1.5)) == pytest.approx(1.5)
+        assert wav_duration_seconds(b"RIFF" + b"\x00" * 48044) == pytest.approx(1.0, abs=0.01)
+
+
+# =============================================================================
+# TTS CACHE INTEGRATION
+# =============================================================================
+
+
+class TestTTSCacheEncoding:
+    """Tests for TTSCache with a compressed storage tier."""
+
+    @pytest.mark.asyncio
+    async def test_put_stores_variant(self, tmp_path, encoder, sample_key):
+        cache = TTSCache(tmp_path / "cache", encoder=encoder)
+        await cache.initialize()
+        wav = make_wav(1.0)
+
+        entry = await cache.put(sample_key, wav, 24000, 1.0)
+
+        assert entry.storage_format == "wav"
+        assert "ztest" in entry.variants
+        variant_path = Path(entry.variants["ztest"].file_path)
+        assert variant_path.exists()
+        assert entry.size_bytes == len(wav) + entry.variants["ztest"].size_bytes
+
+    @pytest.mark.asyncio
+    async def test_get_encoded_serves_variant(self, tmp_path, encoder, sample_key):
+        cache = TTSCache(tmp_path / "cache", encoder=encoder)
+        await cache.initialize()
+        wav = make_wav(1.0)
+        await cache.put(sample_key, wav, 24000, 1.0)
+
+        data, served = await cache.get_encoded(sample_key, "ztest")
+        assert served == "ztest"
+        assert _zlib_decode(data) == wav
+
+        assert await cache.get(sample_key) == wav
+
+    @pytest.mark.asyncio
+    async def test_incompressible_audio_has_no_variant(self, tmp_path, encoder, sample_key):
+        cache = TTSCache(tmp_path / "cache", encoder=encoder)
+        await cache.initialize()
+        wav = make_wav(0.5, noisy=True)
+        entry = await cache.put(sample_key, wav, 24000, 0.5)
+
+        assert entry.variants == {}
+        data, served = await cache.get_encoded(sample_key, "ztest")
+        assert served == "wav"
+        assert data == wav
+
+    @pytest.mark.asyncio
+    async def test_drop_canonical_stores_lossless_only(
+        self, tmp_path, zlib_codec, thread_executor, sample_key
+    ):
+        encoder = AudioEncoder(
+            formats=["ztest"], keep_canonical=False, executor=thread_executor
+        )
+        cache = TTSCache(tmp_path / "cache", encoder=encoder)
+        await cache.initialize()
+        wav = make_wav(2.0)
+
+        entry = await cache.put(sample_key, wav, 24000, 2.0)
+
+        assert entry.storage_format == "ztest"
+        assert entry.file_path.endswith(".zt")
+        assert entry.size_bytes < len(wav) // 10
+        assert not list((tmp_path / "cache" / "audio").rglob("*.wav"))
+        # WAV clients still get WAV, decoded from the lossless copy
+        assert await cache.get(sample_key) == wav
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_variant_files(self, tmp_path, encoder, sample_key):
+        cache = TTSCache(tmp_path / "cache", encoder=encoder)
+        await cache.initialize()
+        entry = await cache.put(sample_key, make_wav(1.0), 24000, 1.0)
+        variant_path = Path(entry.variants["ztest"].file_path)
+
+        await cache.delete(sample_key)
+
+        assert not variant_path.exists()
+        assert not Path(entry.file_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_index_round_trip_keeps_variants(self, tmp_path, encoder, sample_key):
+        cache = TTSCache(tmp_path / "cache", encoder=encoder)
+        await cache.initialize()
+        await cache.put(sample_key, make_wav(1.0), 24000, 1.0)
+        await cache.shutdown()
+
+        reloaded = TTSCache(tmp_path / "cache", encoder=encoder)
+        await reloaded.initialize()
+        entry = reloaded.index[sample_key.to_hash()]
+        assert "ztest" in entry.variants
+
+    def test_entry_from_dict_defaults(self, sample_key):
+        now = datetime.now().isoformat()
+        entry = TTSCacheEntry.from_dict({
+            "key": sample_key.to_dict(),
+            "file_path": "/tmp/x.wav",
+            "size_bytes": 10,
+            "sample_rate": 24000,
+            "duration_seconds": 1.0,
+            "created_at": now,
+            "last_accessed_at": now,
+        })
+        assert entry.storage_format == "wav"
+        assert entry.variants == {}
+        assert "variants" not in entry.to_dict()
+
+
+# =============================================================================
+# KB AUDIO INTEGRATION
+# =============================================================================
+
+
+class TestKBAudioEncoding:
+    """Tests for compressed KB audio sidecars."""
+
+    @pytest.mark.asyncio
+    async def test_generation_writes_sidecars(self, tmp_path, encoder):
+        wav = make_wav(1.0)
+        pool = MagicMock()
+        pool.generate_with_priority = AsyncMock(return_value=(wav, 24000, 1.0))
+        manager = KBAudioManager(
+            str(tmp_path / "kb"), pool, delay_between_requests=0.0, encoder=encoder
+        )
+        await manager.initialize()
+
+        content = {"domains": [{"questions": [
+            {"id": "q1", "question_text": "What is H2O?", "answer_text": "Water"},
+        ]}]}
+        job_id = await manager.prefetch_module("mod", content)
+        task, _ = manager._jobs[job_id]
+        await task
+
+        question_dir = tmp_path / "kb" / "mod" / "q1"
+        assert (question_dir / "question.zt").exists()
+        manifest = await manager.get_manifest("mod")
+        assert manifest.segments["q1"]["question"].variants["ztest"] > 0
+
+        data, served = await manager.get_audio_variant("mod", "q1", "question", format_name="ztest")
+        assert served == "ztest"
+        assert _zlib_decode(data) == wav
+
+        data, served = await manager.get_audio_variant("mod", "q1", "answer", format_name="wav")
+        assert served == "wav"
+        assert data == wav
+
+    @pytest.mark.asyncio
+    async def test_variant_falls_back_to_wav(self, tmp_path):
+        manager = KBAudioManager(str(tmp_path / "kb"), MagicMock())
+        await manager.initialize()
+        question_dir = tmp_path / "kb" / "mod" / "q1"
+        question_dir.mkdir(parents=True)
+        (question_dir / "question.wav").write_bytes(b"RIFF")
+
+        data, served = await manager.get_audio_variant("mod", "q1", "question", format_name="flac")
+        assert served == "wav"
+        assert data == b"RIFF"
@@ -0,0 +1,267 @@
+"""
+Tests for TTS Prefetch Planner
+
+Tests verify buffer-target planning, latency/duration learning, cross-session
+deduplication, cancellation and buffer health metrics.
+"""
+
+import asyncio
+import pytest
+
+from tts_cache import TTSCache, TTSCacheKey
+from tts_cache.prefetch_planner import BufferHealth, PrefetchPlanner
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+class GatedResourcePool:
+    """Resource pool whose generations block until released."""
+
+    def __init__(self, duration: float = 2.0):
+        self.duration = duration
+        self.calls = []
+        self.gate = asyncio.Event()
+
+    async def generate_with_priority(self, text, voice_id, provider, speed, chatterbox_config, priority):
+        self.calls.append(text)
+        await self.gate.wait()
+        return b"RIFF" + text.encode(), 24000, self.duration
+
+
+@pytest.fixture
+async def cache(tmp_path):
+    cache = TTSCache(tmp_path / "cache")
+    await cache.initialize()
+    return cache
+
+
+@pytest.fixture
+def pool():
+    return GatedResourcePool()
+
+
+async def put_segment(cache, text, duration, voice_id="nova", provider="vibevoice"):
+    key = TTSCacheKey.from_request(text=text, voice_id=voice_id, provider=provider)
+    await cache.put(key, b"RIFF" + text.encode(), 24000, duration)
+
+
+async def drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def wait_idle(planner):
+    """Wait until every in-flight prefetch (and any it queued) has finished."""
+    while planner._inflight:
+        await asyncio.gather(*planner._inflight.values(), return_exceptions=True)
+        await drain()
+
+
+# =============================================================================
+# BUFFER HEALTH
+# =============================================================================
+
+
+class TestBufferHealth:
+    """Tests for BufferHealth status and serialization."""
+
+    def test_status_thresholds(self):
+        health = BufferHealth(session_id="s1", target_seconds=20.0)
+        assert health.status == "starved"
+        health.buffered_seconds = 5.0
+        assert health.status == "low"
+        health.buffered_seconds = 20.0
+        assert health.status == "healthy"
+
+    def test_underrun_rate(self):
+        health = BufferHealth(session_id="s1", target_seconds=20.0, served=4, underruns=1)
+        assert health.underrun_rate == 25.0
+        assert health.to_dict()["underrun_rate"] == 25.0
+        assert health.to_dict()["last_planned_at"] is None
+
+
+# =============================================================================
+# PLANNING
+# =============================================================================
+
+
+class TestPlan:
+    """Tests for buffer-target planning."""
+
+    async def test_plans_until_buffer_target(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=10.0)
+        planner._realtime_factor["vibevoice"] = 0.0
+        # 30 chars at the default 15 chars/s = 2s per segment
+        segments = ["x" * 30] * 20
+
+        plan = planner.plan("s1", segments, current_index=0)
+
+        # 2s remaining in current + 4 upcoming segments reaches 10s
+        assert plan.segment_indices == [1, 2, 3, 4]
+        assert plan.buffered_seconds == pytest.approx(2.0)
+
+    async def test_cached_segments_count_toward_buffer(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=10.0)
+        planner._realtime_factor["vibevoice"] = 0.0
+        segments = [f"segment {i}" for i in range(10)]
+        await put_segment(cache, segments[1], 6.0)
+
+        plan = planner.plan("s1", segments, current_index=0)
+
+        assert 1 not in plan.segment_indices
+        assert plan.buffered_seconds >= 6.0
+
+    async def test_offset_reduces_current_segment_credit(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=10.0)
+        segments = ["intro", "next"]
+        await put_segment(cache, "intro", 8.0)
+
+        plan = planner.plan("s1", segments, current_index=0, offset_ms=6000)
+
+        assert plan.buffered_seconds == pytest.approx(2.0)
+
+    async def test_slow_provider_extends_lookahead(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=10.0)
+        segments = ["x" * 30] * 20
+
+        planner._realtime_factor["vibevoice"] = 0.0
+        fast = planner.plan("s1", segments, 0)
+        planner._realtime_factor["vibevoice"] = 1.0
+        slow = planner.plan("s1", segments, 0)
+
+        assert len(slow.segment_indices) > len(fast.segment_indices)
+
+    async def test_respects_max_lookahead(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=1000.0, max_lookahead=3)
+        plan = planner.plan("s1", ["x"] * 50, 0)
+        assert plan.segment_indices == [1, 2, 3]
+
+
+class TestEstimation:
+    """Tests for learned duration and latency estimates."""
+
+    def test_observe_updates_duration_estimate(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, smoothing=1.0)
+        planner.observe_generation("x" * 100, "nova", "vibevoice", 1.0, 10.0, 5.0)
+
+        assert planner.estimate_duration("x" * 50, "nova", "vibevoice") == pytest.approx(5.0)
+        assert planner.estimate_duration("x" * 50, "nova", "vibevoice", speed=2.0) == pytest.approx(2.5)
+        assert planner.realtime_factor("vibevoice") == pytest.approx(0.5)
+
+    def test_observe_is_smoothed(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, smoothing=0.5)
+        planner.observe_generation("x" * 10, "nova", "piper", 1.0, 1.0, 1.0)
+        planner.observe_generation("x" * 10, "nova", "piper", 1.0, 1.0, 3.0)
+        assert planner.realtime_factor("piper") == pytest.approx(2.0)
+
+    def test_observe_ignores_empty(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool)
+        planner.observe_generation("", "nova", "piper", 1.0, 1.0, 1.0)
+        planner.observe_generation("text", "nova", "piper", 1.0, 0.0, 1.0)
+        assert planner.get_stats()["realtime_factor"] == {}
+
+
+# =============================================================================
+# SCHEDULING
+# =============================================================================
+
+
+class TestSchedule:
+    """Tests for prefetch scheduling, dedupe and cancellation."""
+
+    async def test_schedule_limits_inflight_and_drains_queue(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=10.0, max_inflight_per_session=2)
+        segments = [f"segment number {i}" for i in range(6)]
+
+        await planner.schedule("s1", segments, 0)
+        await drain()
+        assert len(pool.calls) == 2
+
+        pool.gate.set()
+        await wait_idle(planner)
+        health = planner.get_buffer_health("s1")
+        assert health["prefetched"] == health["planned_segments"]
+        assert health["inflight"] == 0
+        key = TTSCacheKey.from_request(text=segments[1], voice_id="nova", provider="vibevoice")
+        assert await cache.has(key)
+
+    async def test_sessions_share_inflight_prefetch(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=5.0)
+        segments = [f"shared segment {i}" for i in range(4)]
+
+        await planner.schedule("s1", segments, 0)
+        await planner.schedule("s2", segments, 0)
+        await drain()
+
+        assert len(pool.calls) == len(set(pool.calls))
+        assert planner.get_buffer_health("s2")["shared"] > 0
+
+        pool.gate.set()
+        await wait_idle(planner)
+        assert planner.get_buffer_health("s1")["prefetched"] > 0
+        assert planner.get_buffer_health("s2")["prefetched"] > 0
+
+    async def test_cancel_session_cancels_orphaned_work(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=10.0)
+        await planner.schedule("s1", [f"seg {i}" for i in range(6)], 0)
+        await drain()
+
+        released = planner.cancel_session("s1")
+
+        assert released > 0
+        assert planner.get_stats()["inflight"] == 0
+        assert planner.get_buffer_health("s1")["cancelled"] == released
+
+    async def test_cancel_keeps_work_another_session_needs(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=5.0)
+        segments = [f"shared segment {i}" for i in range(4)]
+        await planner.schedule("s1", segments, 0)
+        await planner.schedule("s2", segments, 0)
+        await drain()
+
+        planner.cancel_session("s1")
+
+        assert planner.get_stats()["inflight"] > 0
+        pool.gate.set()
+        await wait_idle(planner)
+
+    async def test_cancelled_prefetch_finishing_late_keeps_new_request(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=4.0)
+        segments = [f"seg {i}" for i in range(6)]
+        await planner.schedule("s1", segments, 0)
+        await drain()
+
+        planner.cancel_session("s1")
+        await planner.schedule("s1", segments, 0)
+        # The cancelled prefetches only finish now, after the new ones started
+        await drain()
+
+        assert planner.get_buffer_health("s1")["inflight"] == planner.max_inflight_per_session
+        pool.gate.set()
+        await wait_idle(planner)
+        health = planner.get_buffer_health("s1")
+        assert health["prefetched"] == health["planned_segments"]
+
+    async def test_seek_releases_stale_prefetches(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool, target_buffer_seconds=4.0)
+        segments = ["x" * 30 + str(i) for i in range(20)]
+
+        await planner.schedule("s1", segments, 0)
+        await planner.schedule("s1", segments, 15)
+
+        assert planner.get_buffer_health("s1")["cancelled"] > 0
+        pool.gate.set()
+        await wait_idle(planner)
+
+    async def test_record_playback_and_remove(self, cache, pool):
+        planner = PrefetchPlanner(cache, pool)
+        planner.record_playback("s1", cache_hit=True)
+        planner.record_playback("s1", cache_hit=False)
+        assert planner.get_buffer_health("s1")["underruns"] == 1
+
+        planner.remove_session("s1")
+        assert planner.get_buffer_health("s1") is None
+        assert planner.get_all_buffer_health() == {}
@@ -1,6 +1,7 @@
 # Tests for TTS Comparison Manager
 # High-level service tests with mocked repository
 
+import asyncio
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -37,6 +38,7 @@ def mock_tts_pool():
     """Create a mock TTS resource pool."""
     pool = AsyncMock()
     pool.generate_with_priority = AsyncMock(return_value=(b"\x00\x00" * 11025, 22050, 1.0))
+    pool.get_provider_limit = MagicMock(return_value=2)
     return pool
 
 
@@ -95,6 +97,12 @@ def sample_variants(sample_session):
     return variants
 
 
+def written_counts(repo) -> Tuple[int, int]:
+    """Variants in the initial GENERATING batch and in the result batches."""
+    calls = [len(call.args[0]) for call in repo.update_variants.call_args_list]
+    return calls[0], sum(calls[1:])
+
+
 # =============================================================================
 # Session Management Tests
 # =============================================================================
@@ -335,14 +343,16 @@ class TestGenerateVariants:
         mock_repo.get_session = AsyncMock(return_value=sample_session)
         mock_repo.update_session_status = AsyncMock()
         mock_repo.get_session_variants = AsyncMock(return_value=sample_variants)
-        mock_repo.update_variant_status = AsyncMock()
+        mock_repo.update_variants = AsyncMock()
 
         result = await manager_with_tts.generate_variants(sample_session.id)
 
         # Check session status was updated
         assert mock_repo.update_session_status.call_count >= 2
-        # Check variants were processed
-        assert mock_repo.update_variant_status.call_count == len(sample_variants) * 2  # GENERATING + READY
+        # One batch marks every variant GENERATING, later batches record results
+        assert written_counts(mock_repo) == (len(sample_variants), len(sample_variants))
+        assert all(v.status == VariantStatus.READY for v in sample_variants)
+        assert all(Path(v.output_file).exists() for v in sample_variants)
 
     @pytest.mark.asyncio
     async def test_generate_variants_skips_ready(
@@ -355,13 +365,13 @@ class TestGenerateVariants:
         mock_repo.get_session = AsyncMock(return_value=sample_session)
         mock_repo.update_session_status = AsyncMock()
         mock_repo.get_session_variants = AsyncMock(return_value=sample_variants)
-        mock_repo.update_variant_status = AsyncMock()
+        mock_repo.update_variants = AsyncMock()
 
         await manager_with_tts.generate_variants(sample_session.id, regenerate=False)
 
         # Only 3 variants should be processed (not 4)
-        expected_calls = 3 * 2  # 3 variants, 2 status updates each (GENERATING + READY)
-        assert mock_repo.update_variant_status.call_count == expected_calls
+        assert written_counts(mock_repo) == (3, 3)
+        assert mock_tts_pool.generate_with_priority.call_count == 3
 
     @pytest.mark.asyncio
     async def test_generate_variants_regenerate_all(
@@ -375,13 +385,149 @@ class TestGenerateVariants:
         mock_repo.get_session = AsyncMock(return_value=sample_session)
         mock_repo.update_session_status = AsyncMock()
         mock_repo.get_session_variants = AsyncMock(return_value=sample_variants)
-        mock_repo.update_variant_status = AsyncMock()
+        mock_repo.update_variants = AsyncMock()
 
         await manager_with_tts.generate_variants(sample_session.id, regenerate=True)
 
         # All 4 variants should be processed
-        expected_calls = 4 * 2  # 4 variants, 2 status updates each
-        assert mock_repo.update_variant_status.call_count == expected_calls
+        assert written_counts(mock_repo) == (4, 4)
+
+    @pytest.mark.asyncio
+    async def test_generate_variants_records_failures(
+        self, manager_with_tts, mock_repo, mock_tts_pool, sample_session, sample_variants
+    ):
+        """Test a failing variant is recorded without stopping the others."""
+        mock_repo.get_session = AsyncMock(return_value=sample_session)
+        mock_repo.update_session_status = AsyncMock()
+        mock_repo.get_session_variants = AsyncMock(return_value=sample_variants)
+        mock_repo.update_variants = AsyncMock()
+
+        async def generate(text, **kwargs):
+            if text == "Text 1":
+                raise RuntimeError("server down")
+            return b"\x00\x00" * 100, 22050, 0.1
+
+        mock_tts_pool.generate_with_priority = AsyncMock(side_effect=generate)
+
+        await manager_with_tts.generate_variants(sample_session.id)
+
+        failed = [v for v in sample_variants if v.status == VariantStatus.FAILED]
+        assert len(failed) == 2
+        assert all(v.last_error == "server down" for v in failed)
+        mock_repo.update_session_status.assert_called_with(sample_session.id, SessionStatus.READY)
+
+
+class TestParallelGeneration:
+    """Tests for fanning variant generation out across providers."""
+
+    @staticmethod
+    def make_variants(session, providers, per_provider):
+        return [
+            TTSComparisonVariant.create(
+                session_id=session.id,
+                sample_index=s_idx,
+                config_index=c_idx,
+                text_content=f"Text {s_idx}",
+                tts_config={"provider": provider, "voice_id": "nova"},
+            )
+            for c_idx, provider in enumerate(providers)
+            for s_idx in range(per_provider)
+        ]
+
+    @pytest.fixture
+    def repo(self, mock_repo, sample_session):
+        mock_repo.get_session = AsyncMock(return_value=sample_session)
+        mock_repo.update_session_status = AsyncMock()
+        mock_repo.update_variants = AsyncMock()
+        return mock_repo
+
+    @pytest.mark.asyncio
+    async def test_providers_run_concurrently_within_limits(
+        self, repo, mock_tts_pool, sample_session, tmp_path
+    ):
+        """Test each provider runs up to its pool limit, side by side."""
+        variants = self.make_variants(sample_session, ["piper", "vibevoice"], 4)
+        repo.get_session_variants = AsyncMock(return_value=variants)
+        limits = {"piper": 2, "vibevoice": 1}
+        mock_tts_pool.get_provider_limit = MagicMock(side_effect=limits.get)
+
+        in_flight: Dict[str, int] = {"piper": 0, "vibevoice": 0}
+        peak: Dict[str, int] = {"piper": 0, "vibevoice": 0}
+        peak_total = 0
+
+        async def generate(provider, **kwargs):
+            nonlocal peak_total
+            in_flight[provider] += 1
+            peak[provider] = max(peak[provider], in_flight[provider])
+            peak_total = max(peak_total, sum(in_flight.values()))
+            await asyncio.sleep(0.01)
+            in_flight[provider] -= 1
+            return b"\x00\x00" * 100, 22050, 0.1
+
+        mock_tts_pool.generate_with_priority = AsyncMock(side_effect=generate)
+        manager = TTSComparisonManager(repo, mock_tts_pool, storage_dir=str(tmp_path))
+
+        await manager.generate_variants(sample_session.id)
+
+        assert peak == limits
+        assert peak_total == 3
+        assert all(v.status == VariantStatus.READY for v in variants)
+
+    @pytest.mark.asyncio
+    async def test_status_writes_are_batched(self, repo, mock_tts_pool, sample_session, tmp_path):
+        """Test results are flushed in batches rather than one write per variant."""
+        variants = self.make_variants(sample_session, ["piper"], 10)
+        repo.get_session_variants = AsyncMock(return_value=variants)
+        manager = TTSComparisonManager(
+            repo, mock_tts_pool, storage_dir=str(tmp_path),
+            flush_batch_size=4, flush_interval=60,
+        )
+
+        await manager.generate_variants(sample_session.id)
+
+        sizes = [len(call.args[0]) for call in repo.update_variants.call_args_list]
+        assert sizes == [10, 4, 4, 2]
+        repo.update_variant_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_progress_is_reported(self, repo, mock_tts_pool, sample_session, tmp_path):
+        """Test progress events cover start, each variant and completion."""
+        variants = self.make_variants(sample_session, ["piper", "vibevoice"], 2)
+        repo.get_session_variants = AsyncMock(return_value=variants)
+        events = []
+
+        async def on_progress(progress):
+            events.append(progress)
+
+        manager = TTSComparisonManager(
+            repo, mock_tts_pool, storage_dir=str(tmp_path), on_progress=on_progress
+        )
+
+        await manager.generate_variants(sample_session.id)
+
+        assert events[0]["completed"] == 0
+        assert events[0]["total"] == 4
+        variant_events = [e for e in events if "variant" in e]
+        assert [e["completed"] for e in variant_events] == [1, 2, 3, 4]
+        assert {e["variant"]["provider"] for e in variant_events} == {"piper", "vibevoice"}
+        assert events[-1]["status"] == SessionStatus.READY.value
+        assert events[-1]["session_id"] == str(sample_session.id)
+
+    @pytest.mark.asyncio
+    async def test_progress_listener_errors_are_ignored(
+        self, repo, mock_tts_pool, sample_session, tmp_path
+    ):
+        """Test a failing progress listener does not break generation."""
+        variants = self.make_variants(sample_session, ["piper"], 2)
+        repo.get_session_variants = AsyncMock(return_value=variants)
+        manager = TTSComparisonManager(
+            repo, mock_tts_pool, storage_dir=str(tmp_path),
+            on_progress=AsyncMock(side_effect=RuntimeError("socket closed")),
+        )
+
+        await manager.generate_variants(sample_session.id)
+
+        assert all(v.status == VariantStatus.READY for v in variants)
 
 
 class TestGetSessionWithVariants:
@@ -654,6 +654,65 @@ class TestJobItemOperations:
         assert "status = 'failed'" in call_args[0][0]
 
 
+    @pytest.mark.asyncio
+    async def test_claim_pending_items(self, repository, mock_connection, sample_item_row):
+        """Test claiming marks items processing in one statement."""
+        mock_connection.fetch.return_value = [sample_item_row]
+
+        items = await repository.claim_pending_items(uuid4(), limit=8)
+
+        assert len(items) == 1
+        query = mock_connection.fetch.call_args[0][0]
+        assert "status = 'processing'" in query
+        assert "FOR UPDATE SKIP LOCKED" in query
+        assert "RETURNING *" in query
+
+    @pytest.mark.asyncio
+    async def test_requeue_processing_items(self, repository, mock_connection):
+        """Test interrupted items go back to pending."""
+        mock_connection.execute.return_value = "UPDATE 2"
+
+        count = await repository.requeue_processing_items(uuid4())
+
+        assert count == 2
+        assert "status = 'processing'" in mock_connection.execute.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_update_job_items_uses_executemany(self, repository, mock_connection):
+        """Test bulk item updates are a single executemany."""
+        job_id = uuid4()
+        items = [
+            TTSJobItem(
+                id=uuid4(), job_id=job_id, item_index=i, text_content="t",
+                text_hash="h", status=ItemStatus.COMPLETED, attempt_count=1,
+            )
+            for i in range(3)
+        ]
+
+        count = await repository.update_job_items(items)
+
+        assert count == 3
+        mock_connection.executemany.assert_called_once()
+        rows = mock_connection.executemany.call_args[0][1]
+        assert len(rows) == 3
+        assert rows[0][1] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_update_job_items_empty(self, repository, mock_pool):
+        """Test bulk update with no items skips the database."""
+        assert await repository.update_job_items([]) == 0
+        mock_pool.acquire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_job_progress_leaves_status(self, repository, mock_connection):
+        """Test progress flush only touches counters."""
+        await repository.update_job_progress(uuid4(), 10, 2, 0, 12, "text")
+
+        query = mock_connection.execute.call_args[0][0]
+        assert "completed_items = $2" in query
+        assert "status" not in query.replace("updated_at", "")
+
+
 # =============================================================================
 # Comparison Session Tests
 # =============================================================================
@@ -806,6 +865,32 @@ class TestComparisonVariantOperations:
 
         mock_connection.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_variants_uses_executemany(self, repository, mock_connection):
+        """Test bulk variant updates are a single executemany."""
+        variants = [
+            TTSComparisonVariant.create(
+                session_id=uuid4(), sample_index=i, config_index=0,
+                text_content="t", tts_config={"provider": "piper", "voice_id": "nova"},
+            )
+            for i in range(3)
+        ]
+        variants[0].status = VariantStatus.READY
+        variants[0].output_file = "/path/to/audio.wav"
+
+        count = await repository.update_variants(variants)
+
+        assert count == 3
+        mock_connection.executemany.assert_called_once()
+        rows = mock_connection.executemany.call_args[0][1]
+        assert rows[0] == (variants[0].id, "ready", "/path/to/audio.wav", None, None)
+
+    @pytest.mark.asyncio
+    async def test_update_variants_empty(self, repository, mock_pool):
+        """Test bulk variant update with no variants skips the database."""
+        assert await repository.update_variants([]) == 0
+        mock_pool.acquire.assert_not_called()
+
 
 # =============================================================================
 # Rating Tests
@@ -673,6 +673,72 @@ class TestGenerateTTS:
                 )
 
 
+# =============================================================================
+# PER-PROVIDER CONCURRENCY TESTS
+# =============================================================================
+
+
+class TestProviderConcurrency:
+    """Tests for per-provider background caps."""
+
+    def test_get_provider_limit(self):
+        """Test limits fall back to, and never exceed, the background limit."""
+        pool = TTSResourcePool(
+            max_concurrent_background=3,
+            provider_concurrency={"vibevoice": 1, "piper": 8, "broken": 0},
+        )
+
+        assert pool.get_provider_limit("vibevoice") == 1
+        assert pool.get_provider_limit("piper") == 3
+        assert pool.get_provider_limit("broken") == 1
+        assert pool.get_provider_limit("chatterbox") == 3
+        assert pool.get_stats()["provider_concurrency"] == {"vibevoice": 1, "piper": 8, "broken": 1}
+
+    @pytest.mark.asyncio
+    async def test_background_requests_respect_provider_cap(self):
+        """Test a capped provider never exceeds its cap while others use spare slots."""
+        pool = TTSResourcePool(max_concurrent_background=3, provider_concurrency={"vibevoice": 1})
+        in_flight = {"vibevoice": 0, "piper": 0}
+        peak = {"vibevoice": 0, "piper": 0}
+
+        async def fake_generate(text, voice_id, provider, speed, chatterbox_config):
+            in_flight[provider] += 1
+            peak[provider] = max(peak[provider], in_flight[provider])
+            await asyncio.sleep(0.01)
+            in_flight[provider] -= 1
+            return GenerationResult(b"", 24000, 0.0)
+
+        with patch.object(pool, "_generate_tts", side_effect=fake_generate):
+            await asyncio.gather(*[
+                pool.generate_with_priority("Hi", "nova", provider, priority=Priority.SCHEDULED)
+                for provider in ["vibevoice"] * 4 + ["piper"] * 4
+            ])
+
+        assert peak == {"vibevoice": 1, "piper": 2}
+
+    @pytest.mark.asyncio
+    async def test_live_requests_ignore_provider_cap(self):
+        """Test LIVE requests are not held back by background caps."""
+        pool = TTSResourcePool(provider_concurrency={"vibevoice": 1})
+        peak = in_flight = 0
+
+        async def fake_generate(text, voice_id, provider, speed, chatterbox_config):
+            nonlocal peak, in_flight
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return GenerationResult(b"", 24000, 0.0)
+
+        with patch.object(pool, "_generate_tts", side_effect=fake_generate):
+            await asyncio.gather(*[
+                pool.generate_with_priority("Hi", "nova", "vibevoice", priority=Priority.LIVE)
+                for _ in range(3)
+            ])
+
+        assert peak == 3
+
+
 # =============================================================================
 # TTS RESOURCE POOL GET STATS TESTS
 # =============================================================================
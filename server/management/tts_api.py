@@ -18,6 +18,8 @@ from aiohttp import web
 
 from modules_api import validate_module_id, get_module_content_path
 from tts_cache import TTSCache, TTSCacheKey, TTSResourcePool, Priority
+from tts_cache.encoding import CANONICAL_FORMAT, content_type_for, negotiate_format
+from tts_cache.kb_audio_pack import PACK_CONTENT_TYPE
 
 logger = logging.getLogger(__name__)
 
@@ -54,14 +56,19 @@ async def handle_tts_request(request: web.Request) -> web.Response:
             "cfg_weight": 0.5,
             "language": "en"
         },
-        "skip_cache": false
+        "skip_cache": false,
+        "format": "flac"  (optional, overrides Accept negotiation)
     }
 
     Response:
-    - Content-Type: audio/wav
+    - Content-Type: audio/wav (or audio/flac, audio/ogg when negotiated via Accept)
     - X-TTS-Cache-Status: hit|miss|bypass
+    - X-TTS-Audio-Format: wav|flac|opus
     - X-TTS-Duration-Seconds: 3.5
     - X-TTS-Sample-Rate: 24000
+
+    Compressed formats are only served from the cache; freshly generated
+    audio is always returned as WAV so the live path never waits on encoding.
     """
     try:
         data = await request.json()
@@ -139,8 +146,14 @@ async def handle_tts_request(request: web.Request) -> web.Response:
 
     # Check cache first (unless skip_cache)
     if not skip_cache:
-        cached = await cache.get(key)
+        audio_format = negotiate_format(
+            request.headers.get("Accept"),
+            cache.available_formats,
+            requested=data.get("format"),
+        )
+        cached = await cache.get_encoded(key, audio_format)
         if cached:
+            cached_audio, served_format = cached
             # Get entry for metadata
             hash_key = key.to_hash()
             async with cache._lock:
@@ -149,12 +162,14 @@ async def handle_tts_request(request: web.Request) -> web.Response:
                 duration = entry.duration_seconds if entry else 0
 
             return web.Response(
-                body=cached,
-                content_type="audio/wav",
+                body=cached_audio,
+                content_type=content_type_for(served_format),
                 headers={
                     "X-TTS-Cache-Status": "hit",
+                    "X-TTS-Audio-Format": served_format,
                     "X-TTS-Duration-Seconds": str(round(duration, 2)),
                     "X-TTS-Sample-Rate": str(sample_rate),
+                    "Vary": "Accept",
                 },
             )
 
@@ -220,6 +235,14 @@ async def handle_get_cache_stats(request: web.Request) -> web.Response:
     if resource_pool:
         response["resource_pool"] = resource_pool.get_stats()
 
+    # Include compression tier stats if encoding is enabled
+    if getattr(cache, "encoder", None) is not None:
+        response["encoding"] = cache.encoder.get_stats()
+
+    # Include shared blob store usage (disk saved by deduplication)
+    if getattr(cache, "blob_store", None) is not None:
+        response["blob_store"] = await cache.blob_store.get_stats()
+
     return web.json_response(response)
 
 
@@ -410,6 +433,7 @@ async def handle_get_cache_entry(request: web.Request) -> web.Response:
     GET /api/tts/cache?text=...&voice_id=...&tts_provider=...&speed=...
 
     Get a cached audio entry directly (cache lookup only, no generation).
+    The stored format is negotiated from the Accept header or ?format=.
     """
     text = request.query.get("text")
     if not text:
@@ -486,12 +510,18 @@ async def handle_get_cache_entry(request: web.Request) -> web.Response:
     )
 
     # Lookup in cache
-    audio = await cache.get(key)
-    if audio is None:
+    audio_format = negotiate_format(
+        request.headers.get("Accept"),
+        cache.available_formats,
+        requested=request.query.get("format"),
+    )
+    cached = await cache.get_encoded(key, audio_format)
+    if cached is None:
         return web.json_response(
             {"error": "Cache miss", "hash": key.to_hash()[:16]},
             status=404,
         )
+    audio, served_format = cached
 
     # Get entry metadata
     hash_key = key.to_hash()
@@ -502,11 +532,13 @@ async def handle_get_cache_entry(request: web.Request) -> web.Response:
 
     return web.Response(
         body=audio,
-        content_type="audio/wav",
+        content_type=content_type_for(served_format),
         headers={
             "X-TTS-Cache-Status": "hit",
+            "X-TTS-Audio-Format": served_format,
             "X-TTS-Duration-Seconds": str(round(duration, 2)),
             "X-TTS-Sample-Rate": str(sample_rate),
+            "Vary": "Accept",
         },
     )
 
@@ -661,6 +693,36 @@ async def handle_cancel_prefetch(request: web.Request) -> web.Response:
     })
 
 
+async def handle_buffer_health(request: web.Request) -> web.Response:
+    """
+    GET /api/tts/prefetch/buffer-health
+    GET /api/tts/prefetch/buffer-health/{session_id}
+
+    Get prefetch buffer health for one or all live sessions.
+    """
+    planner = request.app.get("tts_prefetch_planner")
+    if not planner:
+        return web.json_response(
+            {"error": "TTS prefetch planner not initialized"},
+            status=503,
+        )
+
+    session_id = request.match_info.get("session_id")
+    if session_id:
+        health = planner.get_buffer_health(session_id)
+        if not health:
+            return web.json_response(
+                {"error": f"Session not found: {session_id}"},
+                status=404,
+            )
+        return web.json_response(health)
+
+    return web.json_response({
+        "sessions": planner.get_all_buffer_health(),
+        "planner": planner.get_stats(),
+    })
+
+
 # =============================================================================
 # Knowledge Bowl Audio Endpoints
 # =============================================================================
@@ -679,10 +741,12 @@ async def handle_kb_audio_get(request: web.Request) -> web.Response:
     Query params:
         hint_index: Index for hint segments (default: 0)
         module_id: Module identifier (default: "knowledge-bowl")
+        format: Preferred audio format (overrides Accept negotiation)
 
     Response:
-        Content-Type: audio/wav
+        Content-Type: audio/wav (or a negotiated compressed type)
         X-KB-Cache-Status: hit|miss
+        X-KB-Audio-Format: wav|flac|opus
         X-KB-Duration-Seconds: 8.5
     """
     question_id = request.match_info.get("question_id")
@@ -730,29 +794,46 @@ async def handle_kb_audio_get(request: web.Request) -> web.Response:
             status=503,
         )
 
-    audio = await kb_audio.get_audio(
+    audio_format = negotiate_format(
+        request.headers.get("Accept"),
+        kb_audio.available_formats,
+        requested=request.query.get("format"),
+    )
+    result = await kb_audio.get_audio_variant(
         module_id=module_id,
         question_id=question_id,
         segment_type=segment,
         hint_index=hint_index,
+        format_name=audio_format,
     )
 
-    if audio is None:
+    if result is None:
         return web.json_response(
             {"error": "Audio not found", "question_id": question_id, "segment": segment},
             status=404,
         )
+    audio, served_format = result
 
-    # Estimate duration from file size
-    duration = kb_audio._estimate_duration(len(audio))
+    if served_format == CANONICAL_FORMAT:
+        # Estimate duration from file size
+        duration = kb_audio._estimate_duration(len(audio))
+    else:
+        # Compressed size says nothing about duration; use the manifest
+        duration = 0.0
+        manifest = await kb_audio.get_manifest(module_id)
+        seg_key = f"hint_{hint_index}" if segment == "hint" else segment
+        if manifest and seg_key in manifest.segments.get(question_id, {}):
+            duration = manifest.segments[question_id][seg_key].duration_seconds
 
     return web.Response(
         body=audio,
-        content_type="audio/wav",
+        content_type=content_type_for(served_format),
         headers={
             "X-KB-Cache-Status": "hit",
+            "X-KB-Audio-Format": served_format,
             "X-KB-Duration-Seconds": str(round(duration, 2)),
             "X-KB-Sample-Rate": "24000",
+            "Vary": "Accept",
         },
     )
 
@@ -815,38 +896,7 @@ async def handle_kb_audio_batch(request: web.Request) -> web.Response:
             status=503,
         )
 
-    manifest = await kb_audio.get_manifest(module_id)
-
-    result = {"segments": {}}
-    total_size = 0
-    available_count = 0
-    missing_count = 0
-
-    for qid in question_ids:
-        result["segments"][qid] = {}
-
-        for seg in segments:
-            if manifest and qid in manifest.segments and seg in manifest.segments[qid]:
-                entry = manifest.segments[qid][seg]
-                result["segments"][qid][seg] = {
-                    "available": True,
-                    "duration": entry.duration_seconds,
-                    "size": entry.size_bytes,
-                }
-                total_size += entry.size_bytes
-                available_count += 1
-            else:
-                result["segments"][qid][seg] = {
-                    "available": False,
-                    "duration": 0,
-                    "size": 0,
-                }
-                missing_count += 1
-
-    result["total_size_bytes"] = total_size
-    result["available_count"] = available_count
-    result["missing_count"] = missing_count
-
+    result = kb_audio.get_segment_availability(module_id, question_ids, segments)
     return web.json_response(result)
 
 
@@ -1010,6 +1060,115 @@ async def handle_kb_manifest(request: web.Request) -> web.Response:
     return web.json_response(manifest.to_dict())
 
 
+async def _get_kb_audio_pack(request: web.Request):
+    """Resolve the pack for a pack request, or an error response."""
+    module_id = request.match_info.get("module_id")
+    if not module_id:
+        return None, web.json_response(
+            {"error": "Missing module_id"},
+            status=400,
+        )
+
+    if not validate_module_id(module_id):
+        return None, web.json_response(
+            {"error": f"Invalid module_id: {module_id}"},
+            status=400,
+        )
+
+    kb_audio = request.app.get("kb_audio_manager")
+    if not kb_audio:
+        return None, web.json_response(
+            {"error": "KB audio manager not initialized"},
+            status=503,
+        )
+
+    pack = await kb_audio.get_pack(module_id, request.query.get("format", CANONICAL_FORMAT))
+    if pack is None:
+        return None, web.json_response(
+            {"error": f"No audio found for module: {module_id}"},
+            status=404,
+        )
+    return pack, None
+
+
+def _split_query_list(value: str) -> list:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+async def handle_kb_audio_pack(request: web.Request) -> web.StreamResponse:
+    """
+    GET /api/kb/audio-pack/{module_id}
+
+    Download a module's KB audio as one packed bundle.
+
+    Query params:
+        format: Preferred audio format (default: wav)
+        question_ids: Comma-separated subset of questions
+        segments: Comma-separated subset of segments ("hint" matches every hint)
+
+    The full pack is served from disk with HTTP Range support, so clients can
+    fetch the index first and then any byte range of audio. A subset is
+    streamed as a smaller pack in the same format.
+
+    Response:
+        Content-Type: application/x-kb-audio-pack
+        X-KB-Pack-Entries: 120
+    """
+    pack, error = await _get_kb_audio_pack(request)
+    if error is not None:
+        return error
+
+    question_ids = _split_query_list(request.query.get("question_ids", ""))
+    segments = _split_query_list(request.query.get("segments", ""))
+
+    if not question_ids and not segments:
+        return web.FileResponse(
+            pack.path,
+            headers={
+                "Content-Type": PACK_CONTENT_TYPE,
+                "X-KB-Pack-Entries": str(len(pack.index.entries)),
+                "X-KB-Pack-Header-Length": str(pack.header_length),
+            },
+        )
+
+    entries = pack.select(question_ids, segments)
+    header, views = pack.subset(entries)
+
+    response = web.StreamResponse(
+        headers={
+            "Content-Type": PACK_CONTENT_TYPE,
+            "X-KB-Pack-Entries": str(len(entries)),
+            "X-KB-Pack-Header-Length": str(len(header)),
+        },
+    )
+    response.content_length = len(header) + sum(e.length for e in entries)
+    await response.prepare(request)
+    await response.write(header)
+    for view in views:
+        await response.write(view)
+    await response.write_eof()
+    return response
+
+
+async def handle_kb_audio_pack_index(request: web.Request) -> web.Response:
+    """
+    GET /api/kb/audio-pack/{module_id}/index
+
+    Get a pack's offset index without downloading audio.
+
+    Entry offsets are absolute byte offsets into the full pack, suitable for
+    Range requests against GET /api/kb/audio-pack/{module_id}.
+    """
+    pack, error = await _get_kb_audio_pack(request)
+    if error is not None:
+        return error
+
+    index = pack.index.to_dict()
+    index["header_length"] = pack.header_length
+    index["pack_size_bytes"] = pack.size_bytes
+    return web.json_response(index)
+
+
 async def handle_kb_coverage(request: web.Request) -> web.Response:
     """
     GET /api/kb/coverage/{module_id}
@@ -1045,23 +1204,30 @@ async def handle_kb_coverage(request: web.Request) -> web.Response:
             status=400,
         )
 
-    if not content_path.exists():
+    # Unchanged content (same mtime and size) reuses the cached coverage
+    try:
+        st = content_path.stat()
+    except FileNotFoundError:
         return web.json_response(
             {"error": "Module content not found"},
             status=404,
         )
+    content_version = (st.st_mtime_ns, st.st_size)
 
-    try:
-        async with aiofiles.open(content_path) as f:
-            content = await f.read()
-            module_content = json_module.loads(content)
-    except Exception as e:
-        return web.json_response(
-            {"error": f"Failed to load module content: {e}"},
-            status=500,
+    coverage = kb_audio.get_cached_coverage(module_id, content_version)
+    if coverage is None:
+        try:
+            async with aiofiles.open(content_path) as f:
+                content = await f.read()
+                module_content = json_module.loads(content)
+        except Exception as e:
+            return web.json_response(
+                {"error": f"Failed to load module content: {e}"},
+                status=500,
+            )
+        coverage = kb_audio.get_coverage_status(
+            module_id, module_content, content_version=content_version
         )
-
-    coverage = kb_audio.get_coverage_status(module_id, module_content)
     return web.json_response(coverage.to_dict())
 
 
@@ -1125,6 +1291,8 @@ def register_tts_routes(app: web.Application):
     # Prefetch
     app.router.add_post("/api/tts/prefetch/topic", handle_prefetch_topic)
     app.router.add_get("/api/tts/prefetch/status/{job_id}", handle_prefetch_status)
+    app.router.add_get("/api/tts/prefetch/buffer-health", handle_buffer_health)
+    app.router.add_get("/api/tts/prefetch/buffer-health/{session_id}", handle_buffer_health)
     app.router.add_delete("/api/tts/prefetch/{job_id}", handle_cancel_prefetch)
 
     # Knowledge Bowl audio endpoints
@@ -1133,6 +1301,8 @@ def register_tts_routes(app: web.Application):
     app.router.add_post("/api/kb/prefetch", handle_kb_prefetch)
     app.router.add_get("/api/kb/prefetch/{job_id}", handle_kb_prefetch_status)
     app.router.add_get("/api/kb/manifest/{module_id}", handle_kb_manifest)
+    app.router.add_get("/api/kb/audio-pack/{module_id}", handle_kb_audio_pack)
+    app.router.add_get("/api/kb/audio-pack/{module_id}/index", handle_kb_audio_pack_index)
     app.router.add_get("/api/kb/coverage/{module_id}", handle_kb_coverage)
     app.router.add_get("/api/kb/feedback/{feedback_type}", handle_kb_feedback_audio)
 
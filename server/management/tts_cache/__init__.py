@@ -1,18 +1,28 @@
 # TTS Cache Module
 # Server-side caching for text-to-speech audio
 
-from .models import TTSCacheKey, TTSCacheEntry, TTSCacheStats
+from .models import TTSCacheKey, TTSCacheEntry, TTSCacheStats, AudioVariant
 from .cache import TTSCache
+from .blob_store import AudioBlobStore
+from .encoding import AudioEncoder, AudioCodec, negotiate_format
 from .prefetcher import CurriculumPrefetcher, PrefetchProgress
+from .prefetch_planner import PrefetchPlanner, BufferHealth
 from .resource_pool import TTSResourcePool, Priority
 
 __all__ = [
     "TTSCacheKey",
     "TTSCacheEntry",
     "TTSCacheStats",
+    "AudioVariant",
     "TTSCache",
+    "AudioBlobStore",
+    "AudioEncoder",
+    "AudioCodec",
+    "negotiate_format",
     "CurriculumPrefetcher",
     "PrefetchProgress",
+    "PrefetchPlanner",
+    "BufferHealth",
     "TTSResourcePool",
     "Priority",
 ]
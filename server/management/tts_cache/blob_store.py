@@ -0,0 +1,220 @@
+# Content-Addressed Audio Store
+# One copy of each synthesized clip, shared by the cache, KB audio and pregen jobs
+
+import asyncio
+import logging
+import os
+import shutil
+import uuid
+import wave
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import aiofiles
+
+from .models import TTSCacheKey
+
+logger = logging.getLogger(__name__)
+
+
+def wav_info(path: Path) -> Tuple[int, float]:
+    """Read (sample_rate, duration_seconds) from a WAV file header.
+
+    Falls back to 16-bit mono at 24kHz when the header can't be parsed,
+    matching TTSResourcePool's duration estimate.
+    """
+    try:
+        with wave.open(str(path), "rb") as wav_file:
+            sample_rate = wav_file.getframerate()
+            return sample_rate, wav_file.getnframes() / sample_rate
+    except (wave.Error, EOFError, ZeroDivisionError):
+        size = path.stat().st_size
+        return 24000, max(0, size - 44) / 2 / 24000
+
+
+class AudioBlobStore:
+    """Content-addressed store for synthesized WAV audio.
+
+    Blobs live at blobs/<prefix>/<hash>.wav keyed by TTSCacheKey.to_hash(),
+    so the same text, voice and settings map to one file no matter which
+    subsystem generated it. Subsystems reference a blob by hardlinking it
+    into their own tree; the inode link count is the reference count and
+    deleting a subsystem's file drops its reference. Blobs nobody links to
+    any more are removed by collect_garbage().
+
+    Linked files must never be rewritten in place. Writers replace them
+    (temp file + rename), which leaves other references untouched.
+    """
+
+    def __init__(self, store_dir: Path):
+        """Initialize blob store.
+
+        Args:
+            store_dir: Directory for blob storage (same filesystem as the
+                subsystems' audio, otherwise links fall back to copies)
+        """
+        self.store_dir = Path(store_dir)
+        self.blob_dir = self.store_dir / "blobs"
+
+        # Lookup statistics
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.copy_fallbacks = 0
+
+    async def initialize(self) -> None:
+        """Create the blob directory."""
+        await asyncio.to_thread(self.blob_dir.mkdir, parents=True, exist_ok=True)
+        logger.info(f"Audio blob store ready at {self.blob_dir}")
+
+    def blob_path(self, key: TTSCacheKey) -> Path:
+        """Path of the blob for a key (whether or not it exists)."""
+        hash_key = key.to_hash()
+        return self.blob_dir / hash_key[:2] / f"{hash_key}.wav"
+
+    def has(self, key: TTSCacheKey) -> bool:
+        """Check whether audio for this key is stored."""
+        return self.blob_path(key).is_file()
+
+    def ref_count(self, key: TTSCacheKey) -> int:
+        """Number of subsystem files referencing the blob."""
+        try:
+            return self.blob_path(key).stat().st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    async def put(self, key: TTSCacheKey, audio_data: bytes) -> Path:
+        """Store audio for a key, replacing any earlier blob.
+
+        Files already linked to an earlier blob keep that audio.
+
+        Returns:
+            Path of the stored blob
+        """
+        path = self.blob_path(key)
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        async with aiofiles.open(temp_path, "wb") as f:
+            await f.write(audio_data)
+        await asyncio.to_thread(os.replace, temp_path, path)
+        self.puts += 1
+        return path
+
+    async def link(self, key: TTSCacheKey, dest: Path) -> bool:
+        """Reference a stored blob at dest, replacing any file there.
+
+        Args:
+            key: Cache key of the audio
+            dest: Path in the caller's tree
+
+        Returns:
+            True if dest now holds the audio, False if no blob is stored
+        """
+        linked = await asyncio.to_thread(self._link_sync, self.blob_path(key), Path(dest))
+        if linked:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return linked
+
+    async def store(self, key: TTSCacheKey, audio_data: bytes, dest: Path) -> None:
+        """Store audio and reference it at dest in one step."""
+        blob = await self.put(key, audio_data)
+        await asyncio.to_thread(self._link_sync, blob, Path(dest))
+
+    async def read(self, key: TTSCacheKey) -> Optional[bytes]:
+        """Read a blob's audio, or None if not stored."""
+        try:
+            async with aiofiles.open(self.blob_path(key), "rb") as f:
+                return await f.read()
+        except FileNotFoundError:
+            return None
+
+    def _link_sync(self, blob: Path, dest: Path) -> bool:
+        """Hardlink blob to dest via a temp name so dest is replaced atomically."""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = dest.with_name(f"{dest.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            os.link(blob, temp_path)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            # Cross-device or no hardlink support: keep a private copy
+            try:
+                shutil.copyfile(blob, temp_path)
+            except FileNotFoundError:
+                return False
+            self.copy_fallbacks += 1
+        os.replace(temp_path, dest)
+        return True
+
+    async def collect_garbage(self) -> int:
+        """Delete blobs that no subsystem references.
+
+        Returns:
+            Number of blobs removed
+        """
+        def _collect() -> int:
+            removed = 0
+            for blob, st in self._scan():
+                if st.st_nlink <= 1:
+                    try:
+                        blob.unlink()
+                        removed += 1
+                    except OSError as e:
+                        logger.warning(f"Failed to delete blob {blob}: {e}")
+            return removed
+
+        removed = await asyncio.to_thread(_collect)
+        if removed:
+            logger.info(f"Removed {removed} unreferenced audio blobs")
+        return removed
+
+    def _scan(self):
+        """Yield (path, stat) for every blob."""
+        if not self.blob_dir.is_dir():
+            return
+        with os.scandir(self.blob_dir) as prefixes:
+            for prefix in prefixes:
+                if not prefix.is_dir():
+                    continue
+                with os.scandir(prefix.path) as blobs:
+                    for blob in blobs:
+                        if blob.name.endswith(".wav"):
+                            yield Path(blob.path), blob.stat()
+
+    async def get_stats(self) -> Dict:
+        """Disk usage and sharing statistics.
+
+        logical_bytes is what the referencing files would occupy as private
+        copies; saved_bytes is the difference to what is actually on disk.
+        """
+        def _collect() -> Dict:
+            blobs = unreferenced = physical = logical = references = 0
+            for _, st in self._scan():
+                refs = st.st_nlink - 1
+                blobs += 1
+                physical += st.st_size
+                logical += st.st_size * refs
+                references += refs
+                if refs == 0:
+                    unreferenced += 1
+            return {
+                "blobs": blobs,
+                "references": references,
+                "unreferenced_blobs": unreferenced,
+                "physical_bytes": physical,
+                "logical_bytes": logical,
+                "saved_bytes": max(0, logical - physical),
+            }
+
+        stats = await asyncio.to_thread(_collect)
+        lookups = self.hits + self.misses
+        stats.update({
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            "puts": self.puts,
+            "copy_fallbacks": self.copy_fallbacks,
+        })
+        return stats
@@ -7,9 +7,15 @@ import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from .models import TTSCacheKey, TTSCacheEntry, TTSCacheStats
+from .blob_store import wav_info
+from .encoding import CANONICAL_FORMAT
+from .models import AudioVariant, TTSCacheKey, TTSCacheEntry, TTSCacheStats
+
+if TYPE_CHECKING:
+    from .blob_store import AudioBlobStore
+    from .encoding import AudioEncoder
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +29,9 @@ class TTSCache:
     - LRU eviction when size limit exceeded
     - TTL-based expiration
     - Thread-safe async operations
+    - Optional compressed storage tier (FLAC/Opus variants)
+    - Optional shared blob store: WAV files are links to content-addressed
+      blobs, and misses pick up audio KB or pregen jobs already generated
     """
 
     def __init__(
@@ -30,6 +39,8 @@ class TTSCache:
         cache_dir: Path,
         max_size_bytes: int = 2 * 1024 * 1024 * 1024,  # 2GB
         default_ttl_days: int = 30,
+        encoder: Optional["AudioEncoder"] = None,
+        blob_store: Optional["AudioBlobStore"] = None,
     ):
         """Initialize TTS cache.
 
@@ -37,12 +48,17 @@ class TTSCache:
             cache_dir: Directory for cache storage
             max_size_bytes: Maximum cache size in bytes (default 2GB)
             default_ttl_days: Default TTL for entries in days (default 30)
+            encoder: Optional encoder for compressed storage variants
+            blob_store: Optional content-addressed store shared with other
+                audio producers
         """
         self.cache_dir = Path(cache_dir)
         self.audio_dir = self.cache_dir / "audio"
         self.index_path = self.cache_dir / "index.json"
         self.max_size_bytes = max_size_bytes
         self.default_ttl = timedelta(days=default_ttl_days)
+        self.encoder = encoder
+        self.blob_store = blob_store
 
         # In-memory index: hash -> TTSCacheEntry
         self.index: Dict[str, TTSCacheEntry] = {}
@@ -82,6 +98,13 @@ class TTSCache:
             f"{self._stats.total_size_formatted}"
         )
 
+    @property
+    def available_formats(self) -> Tuple[str, ...]:
+        """Compressed formats this cache can store and serve."""
+        if self.encoder is None:
+            return ()
+        return self.encoder.formats
+
     async def get(self, key: TTSCacheKey) -> Optional[bytes]:
         """Get cached audio data.
 
@@ -91,26 +114,56 @@ class TTSCache:
         Returns:
             Audio bytes if found and not expired, None otherwise
         """
+        result = await self.get_encoded(key, CANONICAL_FORMAT)
+        return result[0] if result else None
+
+    async def get_encoded(
+        self,
+        key: TTSCacheKey,
+        format_name: str = CANONICAL_FORMAT,
+    ) -> Optional[Tuple[bytes, str]]:
+        """Get cached audio, preferring a specific stored format.
+
+        Falls back to canonical WAV when the requested variant was not
+        stored (e.g. encoding did not save enough space).
+
+        Args:
+            key: Cache key for the audio
+            format_name: Preferred format ("wav", "flac", "opus")
+
+        Returns:
+            Tuple of (audio bytes, format served) or None on miss
+        """
         hash_key = key.to_hash()
 
         async with self._lock:
-            if hash_key not in self.index:
-                self._stats.record_miss()
-                return None
+            entry = self.index.get(hash_key)
 
-            entry = self.index[hash_key]
+            if entry is not None:
+                # Check expiration
+                if entry.is_expired:
+                    await self._remove_entry_unlocked(hash_key)
+                    self._stats.record_miss()
+                    return None
 
-            # Check expiration
-            if entry.is_expired:
-                await self._remove_entry_unlocked(hash_key)
+                # Update access time
+                entry.touch()
+
+        if entry is None:
+            entry = await self._adopt_from_store(key)
+            if entry is None:
                 self._stats.record_miss()
                 return None
 
-            # Update access time
-            entry.touch()
+        variant = entry.variants.get(format_name)
+        if variant is not None:
+            audio_path = Path(variant.file_path)
+            served_format = format_name
+        else:
+            audio_path = Path(entry.file_path)
+            served_format = entry.storage_format
 
         # Read file outside lock
-        audio_path = Path(entry.file_path)
         if not audio_path.exists():
             # File missing, remove from index
             async with self._lock:
@@ -121,27 +174,35 @@ class TTSCache:
         try:
             async with aiofiles.open(audio_path, "rb") as f:
                 data = await f.read()
-            self._stats.record_hit()
-            return data
         except Exception as e:
             logger.error(f"Failed to read cached audio {audio_path}: {e}")
             self._stats.record_miss()
             return None
 
+        if served_format not in (format_name, CANONICAL_FORMAT):
+            # Canonical audio is stored losslessly compressed; restore WAV
+            data = await self.encoder.decode(data, served_format) if self.encoder else None
+            if data is None:
+                self._stats.record_miss()
+                return None
+            served_format = CANONICAL_FORMAT
+
+        self._stats.record_hit()
+        return data, served_format
+
     async def has(self, key: TTSCacheKey) -> bool:
         """Check if key exists and is not expired."""
         hash_key = key.to_hash()
 
         async with self._lock:
-            if hash_key not in self.index:
-                return False
+            entry = self.index.get(hash_key)
+            if entry is not None:
+                if entry.is_expired:
+                    await self._remove_entry_unlocked(hash_key)
+                    return False
+                return True
 
-            entry = self.index[hash_key]
-            if entry.is_expired:
-                await self._remove_entry_unlocked(hash_key)
-                return False
-
-            return True
+        return await self._adopt_from_store(key) is not None
 
     async def put(
         self,
@@ -167,14 +228,39 @@ class TTSCache:
         ttl_seconds = (ttl_days or self.default_ttl.days) * 24 * 60 * 60
 
         # Determine file path using hash prefix for distribution
-        prefix = hash_key[:2]
-        file_name = f"{hash_key}.wav"
-        file_path = self.audio_dir / prefix / file_name
-
-        # Write file first
+        prefix_dir = self.audio_dir / hash_key[:2]
+        file_path = prefix_dir / f"{hash_key}.wav"
+        storage_format = CANONICAL_FORMAT
+        stored_data = audio_data
+
+        # Optional compression tier (runs in the encoder's process pool)
+        encoded = {}
+        if self.encoder is not None and self.encoder.enabled:
+            encoded = await self.encoder.encode_all(audio_data)
+            lossless = self.encoder.lossless_format
+            if not self.encoder.keep_canonical and lossless in encoded:
+                replacement = encoded.pop(lossless)
+                storage_format = lossless
+                stored_data = replacement.data
+                file_path = prefix_dir / f"{hash_key}.{replacement.extension}"
+
+        # Write files first
+        variants: Dict[str, AudioVariant] = {}
         try:
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(audio_data)
+            if self.blob_store is not None and storage_format == CANONICAL_FORMAT:
+                await self.blob_store.store(key, stored_data, file_path)
+            else:
+                async with aiofiles.open(file_path, "wb") as f:
+                    await f.write(stored_data)
+            for format_name, result in encoded.items():
+                variant_path = prefix_dir / f"{hash_key}.{result.extension}"
+                async with aiofiles.open(variant_path, "wb") as f:
+                    await f.write(result.data)
+                variants[format_name] = AudioVariant(
+                    format=format_name,
+                    file_path=str(variant_path),
+                    size_bytes=len(result.data),
+                )
         except Exception as e:
             logger.error(f"Failed to write cache file {file_path}: {e}")
             raise
@@ -184,13 +270,15 @@ class TTSCache:
         entry = TTSCacheEntry(
             key=key,
             file_path=str(file_path),
-            size_bytes=len(audio_data),
+            size_bytes=len(stored_data) + sum(v.size_bytes for v in variants.values()),
             sample_rate=sample_rate,
             duration_seconds=duration_seconds,
             created_at=now,
             last_accessed_at=now,
             access_count=1,
             ttl_seconds=ttl_seconds,
+            storage_format=storage_format,
+            variants=variants,
         )
 
         # Update index
@@ -199,19 +287,15 @@ class TTSCache:
             if hash_key in self.index:
                 old_entry = self.index[hash_key]
                 self._stats.total_size_bytes -= old_entry.size_bytes
+                kept = set(self._entry_files(entry))
+                for stale in self._entry_files(old_entry):
+                    if stale not in kept:
+                        self._unlink(stale)
                 provider = old_entry.key.tts_provider
                 if provider in self._stats.entries_by_provider:
                     self._stats.entries_by_provider[provider] -= 1
 
-            self.index[hash_key] = entry
-            self._stats.total_size_bytes += entry.size_bytes
-            self._stats.total_entries = len(self.index)
-
-            # Update provider count
-            provider = key.tts_provider
-            if provider not in self._stats.entries_by_provider:
-                self._stats.entries_by_provider[provider] = 0
-            self._stats.entries_by_provider[provider] += 1
+            self._add_entry_unlocked(hash_key, entry)
 
         # Check if we need to evict (outside lock to avoid blocking)
         await self._maybe_evict()
@@ -220,7 +304,7 @@ class TTSCache:
         if len(self.index) % 10 == 0:
             asyncio.create_task(self._save_index())
 
-        logger.debug(f"Cached TTS audio: {hash_key} ({len(audio_data)} bytes)")
+        logger.debug(f"Cached TTS audio: {hash_key} ({entry.size_bytes} bytes)")
         return entry
 
     async def delete(self, key: TTSCacheKey) -> bool:
@@ -335,9 +419,68 @@ class TTSCache:
                 eviction_count=self._stats.eviction_count,
                 prefetch_count=self._stats.prefetch_count,
                 prefetch_hits=self._stats.prefetch_hits,
+                shared_hits=self._stats.shared_hits,
                 entries_by_provider=dict(self._stats.entries_by_provider),
             )
 
+    async def _adopt_from_store(self, key: TTSCacheKey) -> Optional[TTSCacheEntry]:
+        """Index audio another subsystem stored in the blob store.
+
+        Returns:
+            The new entry, or None if the store has no audio for the key
+        """
+        if self.blob_store is None:
+            return None
+
+        hash_key = key.to_hash()
+        file_path = self.audio_dir / hash_key[:2] / f"{hash_key}.wav"
+        if not await self.blob_store.link(key, file_path):
+            return None
+
+        try:
+            sample_rate, duration = await asyncio.to_thread(wav_info, file_path)
+            size_bytes = (await asyncio.to_thread(file_path.stat)).st_size
+        except OSError as e:
+            logger.warning(f"Failed to adopt shared audio {hash_key}: {e}")
+            return None
+
+        now = datetime.now()
+        entry = TTSCacheEntry(
+            key=key,
+            file_path=str(file_path),
+            size_bytes=size_bytes,
+            sample_rate=sample_rate,
+            duration_seconds=duration,
+            created_at=now,
+            last_accessed_at=now,
+            access_count=1,
+            ttl_seconds=int(self.default_ttl.total_seconds()),
+        )
+
+        async with self._lock:
+            existing = self.index.get(hash_key)
+            if existing is not None:
+                # A concurrent put indexed the same key first
+                return existing
+            self._add_entry_unlocked(hash_key, entry)
+            self._stats.shared_hits += 1
+
+        await self._maybe_evict()
+        logger.debug(f"Adopted shared TTS audio: {hash_key}")
+        return entry
+
+    def _add_entry_unlocked(self, hash_key: str, entry: TTSCacheEntry) -> None:
+        """Add an entry to the index and stats. Must hold lock."""
+        self.index[hash_key] = entry
+        self._stats.total_size_bytes += entry.size_bytes
+        self._stats.total_entries = len(self.index)
+
+        # Update provider count
+        provider = entry.key.tts_provider
+        if provider not in self._stats.entries_by_provider:
+            self._stats.entries_by_provider[provider] = 0
+        self._stats.entries_by_provider[provider] += 1
+
     async def _maybe_evict(self) -> None:
         """Trigger LRU eviction if over size limit."""
         if self._stats.total_size_bytes > self.max_size_bytes:
@@ -361,8 +504,18 @@ class TTSCache:
         # Remove from index
         del self.index[hash_key]
 
-        # Delete file (don't await, fire and forget)
-        file_path = Path(entry.file_path)
+        # Delete canonical file and any compressed variants
+        for file_path in self._entry_files(entry):
+            self._unlink(file_path)
+
+    @staticmethod
+    def _entry_files(entry: TTSCacheEntry) -> List[Path]:
+        """All on-disk files belonging to an entry."""
+        return [Path(entry.file_path)] + [Path(v.file_path) for v in entry.variants.values()]
+
+    @staticmethod
+    def _unlink(file_path: Path) -> None:
+        """Delete a cache file, logging failures."""
         if file_path.exists():
             try:
                 file_path.unlink()
@@ -399,6 +552,7 @@ class TTSCache:
             self._stats.eviction_count = stats.get("eviction_count", 0)
             self._stats.prefetch_count = stats.get("prefetch_count", 0)
             self._stats.prefetch_hits = stats.get("prefetch_hits", 0)
+            self._stats.shared_hits = stats.get("shared_hits", 0)
 
             # Rebuild provider counts
             self._stats.entries_by_provider = {}
@@ -428,6 +582,7 @@ class TTSCache:
                         "eviction_count": self._stats.eviction_count,
                         "prefetch_count": self._stats.prefetch_count,
                         "prefetch_hits": self._stats.prefetch_hits,
+                        "shared_hits": self._stats.shared_hits,
                     },
                 }
 
@@ -444,4 +599,6 @@ class TTSCache:
     async def shutdown(self) -> None:
         """Graceful shutdown: save index."""
         await self._save_index()
+        if self.encoder is not None:
+            self.encoder.shutdown()
         logger.info("TTS cache shutdown complete")
@@ -0,0 +1,400 @@
+# TTS Audio Encoding
+# Optional compressed storage tier for cached and pre-generated TTS audio
+
+import asyncio
+import functools
+import io
+import logging
+import shutil
+import subprocess
+import time
+import wave
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Format every provider returns and every client understands
+CANONICAL_FORMAT = "wav"
+CANONICAL_CONTENT_TYPE = "audio/wav"
+
+# Seconds before an external encoder process is considered hung
+ENCODER_TIMEOUT_SECONDS = 60
+
+
+def _run_cli(command: Tuple[str, ...], data: bytes) -> bytes:
+    """Pipe audio through an external codec binary.
+
+    Module-level so it can be pickled into worker processes.
+    """
+    result = subprocess.run(
+        list(command),
+        input=data,
+        capture_output=True,
+        check=True,
+        timeout=ENCODER_TIMEOUT_SECONDS,
+    )
+    return result.stdout
+
+
+def _timed(fn: Callable[[bytes], bytes], data: bytes) -> Tuple[bytes, float]:
+    """Run a codec function and report its wall time (runs in worker)."""
+    start = time.perf_counter()
+    output = fn(data)
+    return output, time.perf_counter() - start
+
+
+@dataclass(frozen=True)
+class AudioCodec:
+    """A compressed audio format the encoding tier can produce.
+
+    encode/decode must be picklable (module-level functions or
+    functools.partial of them) because they run in a process pool.
+    """
+    name: str
+    content_type: str
+    extension: str
+    lossless: bool
+    encode: Callable[[bytes], bytes]
+    decode: Optional[Callable[[bytes], bytes]] = None
+    binary: Optional[str] = None  # External executable required, if any
+
+    def is_available(self) -> bool:
+        """Check whether the codec can run on this host."""
+        if self.binary is None:
+            return True
+        return shutil.which(self.binary) is not None
+
+
+# Registry of known codecs, keyed by format name
+CODECS: Dict[str, AudioCodec] = {}
+
+# Accept-header media types mapped to format names
+CONTENT_TYPE_FORMATS: Dict[str, str] = {
+    "audio/wav": CANONICAL_FORMAT,
+    "audio/wave": CANONICAL_FORMAT,
+    "audio/x-wav": CANONICAL_FORMAT,
+    "audio/vnd.wave": CANONICAL_FORMAT,
+}
+
+
+def register_codec(codec: AudioCodec, content_types: Iterable[str] = ()) -> None:
+    """Register a codec and the media types that select it."""
+    CODECS[codec.name] = codec
+    CONTENT_TYPE_FORMATS[codec.content_type] = codec.name
+    for content_type in content_types:
+        CONTENT_TYPE_FORMATS[content_type] = codec.name
+
+
+register_codec(
+    AudioCodec(
+        name="flac",
+        content_type="audio/flac",
+        extension="flac",
+        lossless=True,
+        encode=functools.partial(_run_cli, ("flac", "--silent", "--best", "--stdout", "-")),
+        decode=functools.partial(_run_cli, ("flac", "--silent", "--decode", "--stdout", "-")),
+        binary="flac",
+    ),
+    content_types=("audio/x-flac",),
+)
+
+register_codec(
+    AudioCodec(
+        name="opus",
+        content_type="audio/ogg",
+        extension="opus",
+        lossless=False,
+        encode=functools.partial(_run_cli, ("opusenc", "--quiet", "--bitrate", "32", "-", "-")),
+        binary="opusenc",
+    ),
+    content_types=("audio/opus", "audio/ogg; codecs=opus"),
+)
+
+
+def content_type_for(format_name: str) -> str:
+    """Get the Content-Type to serve for a format name."""
+    if format_name == CANONICAL_FORMAT:
+        return CANONICAL_CONTENT_TYPE
+    codec = CODECS.get(format_name)
+    return codec.content_type if codec else "application/octet-stream"
+
+
+def wav_duration_seconds(data: bytes, default_sample_rate: int = 24000) -> float:
+    """Read duration from a WAV header, estimating if the header is unusable."""
+    try:
+        with wave.open(io.BytesIO(data), "rb") as wav_file:
+            frames = wav_file.getnframes()
+            rate = wav_file.getframerate()
+            if rate > 0:
+                return frames / rate
+    except (wave.Error, EOFError):
+        pass
+    # 44 byte header + 16-bit mono samples
+    return max(0, len(data) - 44) / 2 / default_sample_rate
+
+
+def negotiate_format(
+    accept: Optional[str],
+    available: Sequence[str],
+    requested: Optional[str] = None,
+) -> str:
+    """Pick the best stored format for a client.
+
+    Args:
+        accept: Value of the request's Accept header
+        available: Compressed formats the server can serve
+        requested: Explicit format override (e.g. ?format=flac)
+
+    Returns:
+        Format name; falls back to the canonical WAV format
+    """
+    if requested:
+        requested = requested.lower()
+        if requested in available:
+            return requested
+        return CANONICAL_FORMAT
+
+    if not accept:
+        return CANONICAL_FORMAT
+
+    candidates: List[Tuple[float, int, str]] = []
+    for position, part in enumerate(accept.split(",")):
+        pieces = [p.strip() for p in part.split(";")]
+        media_type = pieces[0].lower()
+        quality = 1.0
+        params = []
+        for param in pieces[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+            else:
+                params.append(param.lower().replace(" ", ""))
+        if quality <= 0:
+            continue
+        if params:
+            media_type = f"{media_type}; {'; '.join(params)}"
+        candidates.append((-quality, position, media_type))
+
+    for _, _, media_type in sorted(candidates):
+        if media_type in ("*/*", "audio/*"):
+            # Wildcards keep existing clients on the canonical format
+            return CANONICAL_FORMAT
+        format_name = CONTENT_TYPE_FORMATS.get(media_type)
+        if format_name is None:
+            format_name = CONTENT_TYPE_FORMATS.get(media_type.split(";")[0])
+        if format_name == CANONICAL_FORMAT or format_name in available:
+            return format_name
+
+    return CANONICAL_FORMAT
+
+
+@dataclass
+class EncodedAudio:
+    """Result of encoding one audio clip."""
+    format: str
+    data: bytes
+    original_size: int
+    encode_seconds: float
+
+    @property
+    def extension(self) -> str:
+        return CODECS[self.format].extension
+
+    @property
+    def savings_ratio(self) -> float:
+        """Fraction of the original size saved (0.6 = 60% smaller)."""
+        if self.original_size == 0:
+            return 0.0
+        return 1 - len(self.data) / self.original_size
+
+
+@dataclass
+class EncodingStats:
+    """Per-format encoding counters for monitoring and benchmarks."""
+    encoded: int = 0
+    skipped: int = 0  # Encoded but not stored (insufficient savings)
+    failed: int = 0
+    input_bytes: int = 0
+    output_bytes: int = 0
+    audio_seconds: float = 0.0
+    encode_seconds: float = 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Input size divided by output size (2.0 = half the space)."""
+        if self.output_bytes == 0:
+            return 0.0
+        return self.input_bytes / self.output_bytes
+
+    @property
+    def encode_seconds_per_audio_minute(self) -> float:
+        """Encoder wall time spent per minute of audio."""
+        if self.audio_seconds == 0:
+            return 0.0
+        return self.encode_seconds / (self.audio_seconds / 60)
+
+    def to_dict(self) -> Dict:
+        return {
+            "encoded": self.encoded,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "audio_seconds": round(self.audio_seconds, 2),
+            "encode_seconds": round(self.encode_seconds, 4),
+            "compression_ratio": round(self.compression_ratio, 2),
+            "encode_seconds_per_audio_minute": round(self.encode_seconds_per_audio_minute, 4),
+        }
+
+
+class AudioEncoder:
+    """Encodes canonical WAV audio into compressed formats off the event loop.
+
+    Encoding runs in a process pool so CPU-bound codecs never block
+    request handling. A compressed variant is only kept when it saves at
+    least min_savings_ratio of the canonical size.
+    """
+
+    def __init__(
+        self,
+        formats: Sequence[str] = ("flac",),
+        max_workers: int = 2,
+        min_savings_ratio: float = 0.1,
+        keep_canonical: bool = True,
+        executor: Optional[Executor] = None,
+    ):
+        """Initialize the encoder.
+
+        Args:
+            formats: Requested formats, in preference order
+            max_workers: Process pool size
+            min_savings_ratio: Minimum fractional size reduction worth storing
+            keep_canonical: Keep the WAV when a lossless variant exists
+            executor: Optional executor to use instead of a private process pool
+        """
+        usable = []
+        for name in formats:
+            codec = CODECS.get(name)
+            if codec is None:
+                logger.warning(f"Unknown audio format '{name}', skipping")
+            elif not codec.is_available():
+                logger.warning(f"Encoder '{codec.binary}' for {name} not found, skipping")
+            else:
+                usable.append(name)
+
+        self.formats: Tuple[str, ...] = tuple(usable)
+        self.max_workers = max_workers
+        self.min_savings_ratio = min_savings_ratio
+        self.keep_canonical = keep_canonical
+        self.executor = executor
+        self._owns_executor = executor is None
+        self.stats: Dict[str, EncodingStats] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.formats)
+
+    @property
+    def lossless_format(self) -> Optional[str]:
+        """First configured lossless format, usable as canonical storage."""
+        for name in self.formats:
+            if CODECS[name].lossless:
+                return name
+        return None
+
+    def _get_executor(self) -> Executor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+
+    async def encode(
+        self,
+        audio_data: bytes,
+        format_name: str,
+        force: bool = False,
+    ) -> Optional[EncodedAudio]:
+        """Encode WAV audio into one format.
+
+        Args:
+            audio_data: Canonical WAV bytes
+            format_name: Target format
+            force: Return the result even if it does not save space
+
+        Returns:
+            Encoded audio, or None if encoding failed or was not worthwhile
+        """
+        codec = CODECS.get(format_name)
+        if codec is None or format_name not in self.formats:
+            return None
+
+        stats = self.stats.setdefault(format_name, EncodingStats())
+        loop = asyncio.get_running_loop()
+        try:
+            data, elapsed = await loop.run_in_executor(
+                self._get_executor(), _timed, codec.encode, audio_data
+            )
+        except Exception as e:
+            stats.failed += 1
+            logger.warning(f"Failed to encode audio as {format_name}: {e}")
+            return None
+
+        encoded = EncodedAudio(
+            format=format_name,
+            data=data,
+            original_size=len(audio_data),
+            encode_seconds=elapsed,
+        )
+
+        stats.input_bytes += len(audio_data)
+        stats.audio_seconds += wav_duration_seconds(audio_data)
+        stats.encode_seconds += elapsed
+
+        if not force and (not data or encoded.savings_ratio < self.min_savings_ratio):
+            stats.skipped += 1
+            stats.output_bytes += len(audio_data)
+            return None
+
+        stats.encoded += 1
+        stats.output_bytes += len(data)
+        return encoded
+
+    async def encode_all(self, audio_data: bytes) -> Dict[str, EncodedAudio]:
+        """Encode into every configured format, keeping only useful results."""
+        results = await asyncio.gather(
+            *(self.encode(audio_data, name) for name in self.formats)
+        )
+        return {r.format: r for r in results if r is not None}
+
+    async def decode(self, data: bytes, format_name: str) -> Optional[bytes]:
+        """Decode a lossless variant back to canonical WAV."""
+        codec = CODECS.get(format_name)
+        if codec is None or codec.decode is None:
+            return None
+        loop = asyncio.get_running_loop()
+        try:
+            wav_data, _ = await loop.run_in_executor(
+                self._get_executor(), _timed, codec.decode, data
+            )
+            return wav_data
+        except Exception as e:
+            logger.warning(f"Failed to decode {format_name} audio: {e}")
+            return None
+
+    def get_stats(self) -> Dict:
+        """Encoding statistics per format."""
+        return {
+            "formats": list(self.formats),
+            "keep_canonical": self.keep_canonical,
+            "by_format": {name: s.to_dict() for name, s in self.stats.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Stop worker processes (only if this encoder created them)."""
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
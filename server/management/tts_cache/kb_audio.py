@@ -2,6 +2,7 @@
 # Pre-generation and serving of TTS audio for KB questions
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -10,9 +11,18 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+import aiofiles
+
+from .blob_store import wav_info
+from .encoding import CANONICAL_FORMAT, CODECS
+from .kb_audio_pack import KBAudioPack, build_pack, pack_path_for
+from .models import TTSCacheKey
 
 if TYPE_CHECKING:
+    from .blob_store import AudioBlobStore
+    from .encoding import AudioEncoder
     from .resource_pool import TTSResourcePool
 
 logger = logging.getLogger(__name__)
@@ -31,6 +41,15 @@ def _validate_path_component(component: str) -> bool:
     return True
 
 
+async def _write_file_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file and rename so readers never see partial audio."""
+    await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    async with aiofiles.open(temp_path, "wb") as f:
+        await f.write(data)
+    await asyncio.to_thread(os.replace, temp_path, path)
+
+
 class KBSegmentType(str, Enum):
     """Types of audio segments for a KB question."""
     QUESTION = "question"
@@ -47,12 +66,17 @@ class KBSegment:
     text: str
     hint_index: int = 0  # For questions with multiple hints
 
+    @property
+    def stem(self) -> str:
+        """Filename without extension (also the manifest key)."""
+        if self.segment_type == KBSegmentType.HINT:
+            return f"hint_{self.hint_index}"
+        return self.segment_type.value
+
     @property
     def filename(self) -> str:
         """Generate filename for this segment."""
-        if self.segment_type == KBSegmentType.HINT:
-            return f"hint_{self.hint_index}.wav"
-        return f"{self.segment_type.value}.wav"
+        return f"{self.stem}.wav"
 
 
 @dataclass
@@ -66,9 +90,10 @@ class KBAudioEntry:
     sample_rate: int
     created_at: datetime
     hint_index: int = 0
+    variants: Dict[str, int] = field(default_factory=dict)  # format -> size_bytes
 
     def to_dict(self) -> Dict:
-        return {
+        d = {
             "question_id": self.question_id,
             "segment_type": self.segment_type,
             "file_path": self.file_path,
@@ -78,6 +103,9 @@ class KBAudioEntry:
             "created_at": self.created_at.isoformat(),
             "hint_index": self.hint_index,
         }
+        if self.variants:
+            d["variants"] = dict(self.variants)
+        return d
 
     @classmethod
     def from_dict(cls, d: Dict) -> "KBAudioEntry":
@@ -90,6 +118,7 @@ class KBAudioEntry:
             sample_rate=d["sample_rate"],
             created_at=datetime.fromisoformat(d["created_at"]),
             hint_index=d.get("hint_index", 0),
+            variants=dict(d.get("variants", {})),
         )
 
 
@@ -105,6 +134,7 @@ class KBManifest:
     total_size_bytes: int = 0
     total_duration_seconds: float = 0.0
     segments: Dict[str, Dict[str, KBAudioEntry]] = field(default_factory=dict)
+    complete: bool = True  # False for a checkpoint of an unfinished job
 
     def to_dict(self) -> Dict:
         segments_dict = {}
@@ -114,7 +144,7 @@ class KBManifest:
                 for seg_type, entry in entries.items()
             }
 
-        return {
+        d = {
             "module_id": self.module_id,
             "voice_id": self.voice_id,
             "provider": self.provider,
@@ -125,6 +155,9 @@ class KBManifest:
             "total_duration_seconds": round(self.total_duration_seconds, 2),
             "segments": segments_dict,
         }
+        if not self.complete:
+            d["complete"] = False
+        return d
 
     @classmethod
     def from_dict(cls, d: Dict) -> "KBManifest":
@@ -145,6 +178,7 @@ class KBManifest:
             total_size_bytes=d.get("total_size_bytes", 0),
             total_duration_seconds=d.get("total_duration_seconds", 0.0),
             segments=segments,
+            complete=d.get("complete", True),
         )
 
 
@@ -157,6 +191,7 @@ class KBPrefetchProgress:
     completed: int = 0
     cached: int = 0
     generated: int = 0
+    shared: int = 0  # Linked from audio another subsystem generated
     failed: int = 0
     status: str = "pending"
     started_at: Optional[datetime] = None
@@ -177,6 +212,7 @@ class KBPrefetchProgress:
             "completed": self.completed,
             "cached": self.cached,
             "generated": self.generated,
+            "shared": self.shared,
             "failed": self.failed,
             "status": self.status,
             "percent_complete": round(self.percent_complete, 1),
@@ -219,14 +255,87 @@ class KBCoverageStatus:
         }
 
 
+@dataclass
+class _ModuleCoverage:
+    """Coverage of a module's content by its audio, kept up to date as audio is written.
+
+    Built once per content layout (identified by content_hash) from the
+    manifest; afterwards each written segment adjusts the counters, so
+    reading coverage costs nothing.
+    """
+    content_hash: str
+    expected: Dict[str, Set[str]]  # question_id -> manifest keys in the content
+    total_segments: int
+    covered: Dict[str, Dict[str, int]] = field(default_factory=dict)  # -> {key: size}
+    covered_segments: int = 0
+    total_size_bytes: int = 0
+    content_version: Any = None  # Caller's cheap change marker (e.g. file mtime)
+
+    @classmethod
+    def build(
+        cls,
+        content_hash: str,
+        segments: List["KBSegment"],
+        manifest: Optional[KBManifest],
+    ) -> "_ModuleCoverage":
+        expected: Dict[str, Set[str]] = {}
+        for segment in segments:
+            expected.setdefault(segment.question_id, set()).add(segment.stem)
+        coverage = cls(content_hash=content_hash, expected=expected, total_segments=len(segments))
+        if manifest is not None:
+            coverage.apply(manifest)
+        return coverage
+
+    def apply(self, manifest: KBManifest) -> None:
+        """Recount from a manifest (after a job replaces it)."""
+        self.covered = {}
+        self.covered_segments = 0
+        self.total_size_bytes = 0
+        for qid, entries in manifest.segments.items():
+            for key, entry in entries.items():
+                self.note(qid, key, entry.size_bytes)
+
+    def note(self, question_id: str, key: str, size_bytes: int) -> None:
+        """Record that audio for a segment exists."""
+        if key not in self.expected.get(question_id, ()):
+            return
+        sizes = self.covered.setdefault(question_id, {})
+        previous = sizes.get(key)
+        if previous is None:
+            self.covered_segments += 1
+        else:
+            self.total_size_bytes -= previous
+        sizes[key] = size_bytes
+        self.total_size_bytes += size_bytes
+
+    def status(self, module_id: str) -> KBCoverageStatus:
+        return KBCoverageStatus(
+            module_id=module_id,
+            total_questions=len(self.expected),
+            covered_questions=len(self.covered),
+            total_segments=self.total_segments,
+            covered_segments=self.covered_segments,
+            missing_segments=self.total_segments - self.covered_segments,
+            total_size_bytes=self.total_size_bytes,
+            is_complete=self.covered_segments == self.total_segments,
+        )
+
+
 class KBAudioManager:
     """Manages pre-generated TTS audio for Knowledge Bowl questions.
 
     Features:
-    - Pre-generates all audio for a module's questions
+    - Pre-generates all audio for a module's questions with bounded concurrency
+    - Checkpoints the manifest so interrupted jobs resume
     - Stores audio in organized directory structure
     - Tracks progress and provides manifest
     - Serves audio efficiently
+    - Optional compressed sidecars (e.g. question.flac next to question.wav)
+    - Packed per-module bundles for one-shot downloads
+    - Optional shared blob store: segments already synthesized by the live
+      cache or a pregen job are linked instead of regenerated
+    - Coverage and batch availability served from in-memory indexes that
+      are updated as audio is written
     """
 
     def __init__(
@@ -234,17 +343,30 @@ class KBAudioManager:
         base_dir: str,
         resource_pool: "TTSResourcePool",
         delay_between_requests: float = 0.1,
+        encoder: Optional["AudioEncoder"] = None,
+        max_concurrent: int = 3,
+        checkpoint_interval: int = 25,
+        blob_store: Optional["AudioBlobStore"] = None,
     ):
         """Initialize KB Audio Manager.
 
         Args:
             base_dir: Base directory for KB audio storage
             resource_pool: TTS resource pool for generation
-            delay_between_requests: Rate limiting delay
+            delay_between_requests: Rate limiting delay (per worker)
+            encoder: Optional encoder for compressed audio sidecars
+            max_concurrent: Segments generated in parallel per module job
+            checkpoint_interval: Segments between manifest checkpoints
+            blob_store: Optional content-addressed store shared with the
+                TTS cache and pregen jobs
         """
         self.base_dir = Path(base_dir)
         self.resource_pool = resource_pool
         self.delay = delay_between_requests
+        self.encoder = encoder
+        self.max_concurrent = max(1, max_concurrent)
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.blob_store = blob_store
 
         # Active jobs
         self._jobs: Dict[str, tuple[asyncio.Task, KBPrefetchProgress]] = {}
@@ -255,6 +377,19 @@ class KBAudioManager:
         # Lock for thread safety
         self._lock = asyncio.Lock()
 
+        # Serializes manifest writes (checkpoints from concurrent workers)
+        self._manifest_write_lock = asyncio.Lock()
+
+        # Coverage per module, updated as segments are written
+        self._coverage: Dict[str, _ModuleCoverage] = {}
+
+        # Batch availability rows per module, rebuilt when the manifest is replaced
+        self._availability: Dict[str, Tuple[KBManifest, Dict[str, Dict[str, Dict]]]] = {}
+
+        # Open packs by (module_id, format)
+        self._packs: Dict[Tuple[str, str], KBAudioPack] = {}
+        self._pack_lock = asyncio.Lock()
+
     async def initialize(self) -> None:
         """Initialize storage directories and load existing manifests."""
         self.base_dir.mkdir(parents=True, exist_ok=True)
@@ -401,132 +536,297 @@ class KBAudioManager:
         speed: float,
         force_regenerate: bool,
     ) -> None:
-        """Internal: Generate audio for all segments."""
-        from .resource_pool import Priority
+        """Internal: Generate audio for all segments.
 
+        Segments already on disk (found with one directory scan) are reused,
+        keeping their entries from any earlier or checkpointed manifest.
+        Missing segments are generated by up to max_concurrent workers and
+        the manifest is checkpointed every checkpoint_interval segments, so
+        an interrupted job resumes where it stopped.
+        """
         progress.status = "in_progress"
         progress.started_at = datetime.now()
 
-        # Create module directory
         module_dir = self.base_dir / progress.module_id
-        module_dir.mkdir(parents=True, exist_ok=True)
-
-        # Initialize manifest
         manifest = KBManifest(
             module_id=progress.module_id,
             voice_id=voice_id,
             provider=provider,
             generated_at=datetime.now(),
+            complete=False,
         )
+        question_ids = {segment.question_id for segment in segments}
+        pending: List[KBSegment] = []
+        since_checkpoint = 0
+
+        async def generate_worker(queue: "asyncio.Queue[KBSegment]") -> None:
+            nonlocal since_checkpoint
+            while True:
+                segment = await queue.get()
+                shared = False
+                try:
+                    entry, shared = await self._generate_segment(
+                        module_dir, segment, voice_id, provider, speed,
+                        reuse_shared=not force_regenerate,
+                    )
+                    self._add_to_manifest(manifest, entry)
+                    if shared:
+                        progress.shared += 1
+                    else:
+                        progress.generated += 1
+                except Exception as e:
+                    logger.warning(f"Failed to generate {segment.question_id}/{segment.segment_type}: {e}")
+                    progress.failed += 1
+                progress.completed += 1
 
-        question_ids = set()
-
-        try:
-            for segment in segments:
-                if progress.status == "cancelled":
-                    break
-
-                question_ids.add(segment.question_id)
+                since_checkpoint += 1
+                if since_checkpoint >= self.checkpoint_interval:
+                    since_checkpoint = 0
+                    await self._checkpoint_quietly(module_dir, manifest)
+                queue.task_done()
 
-                # Create question directory
-                question_dir = module_dir / segment.question_id
-                question_dir.mkdir(exist_ok=True)
+                # Rate limiting
+                if self.delay > 0 and not shared:
+                    await asyncio.sleep(self.delay)
 
-                # Check if already exists
-                file_path = question_dir / segment.filename
-                if file_path.exists() and not force_regenerate:
-                    progress.cached += 1
-                    progress.completed += 1
+        workers: List[asyncio.Task] = []
+        try:
+            on_disk = await asyncio.to_thread(self._scan_module_dir, module_dir)
+            previous = await self._load_resumable_manifest(module_dir, voice_id, provider)
 
-                    # Add to manifest from existing file
-                    entry = KBAudioEntry(
-                        question_id=segment.question_id,
-                        segment_type=segment.segment_type.value,
-                        file_path=str(file_path),
-                        size_bytes=file_path.stat().st_size,
-                        duration_seconds=self._estimate_duration(file_path.stat().st_size),
-                        sample_rate=24000,
-                        created_at=datetime.fromtimestamp(file_path.stat().st_mtime),
-                        hint_index=segment.hint_index,
-                    )
-                    self._add_to_manifest(manifest, entry)
+            for segment in segments:
+                files = on_disk.get(segment.question_id, {})
+                if segment.filename not in files or force_regenerate:
+                    pending.append(segment)
                     continue
 
-                # Generate audio
-                try:
-                    audio_data, sample_rate, duration = await self.resource_pool.generate_with_priority(
-                        text=segment.text,
-                        voice_id=voice_id,
-                        provider=provider,
-                        speed=speed,
-                        chatterbox_config=None,
-                        priority=Priority.SCHEDULED,
-                    )
-
-                    # Save audio file
-                    with open(file_path, "wb") as f:
-                        f.write(audio_data)
-
+                entry = None
+                if previous is not None:
+                    entry = previous.segments.get(segment.question_id, {}).get(segment.stem)
+                if entry is None:
+                    st = files[segment.filename]
                     entry = KBAudioEntry(
                         question_id=segment.question_id,
                         segment_type=segment.segment_type.value,
-                        file_path=str(file_path),
-                        size_bytes=len(audio_data),
-                        duration_seconds=duration,
-                        sample_rate=sample_rate,
-                        created_at=datetime.now(),
+                        file_path=str(module_dir / segment.question_id / segment.filename),
+                        size_bytes=st.st_size,
+                        duration_seconds=self._estimate_duration(st.st_size),
+                        sample_rate=24000,
+                        created_at=datetime.fromtimestamp(st.st_mtime),
                         hint_index=segment.hint_index,
                     )
-                    self._add_to_manifest(manifest, entry)
+                entry.variants = self._variants_from_scan(files, segment.stem)
+                self._add_to_manifest(manifest, entry)
+                progress.cached += 1
+                progress.completed += 1
+
+            queue: "asyncio.Queue[KBSegment]" = asyncio.Queue()
+            for segment in pending:
+                queue.put_nowait(segment)
+
+            workers = [
+                asyncio.create_task(generate_worker(queue))
+                for _ in range(min(self.max_concurrent, len(pending)))
+            ]
+            if workers:
+                await queue.join()
 
-                    progress.generated += 1
-                    progress.completed += 1
-
-                    # Rate limiting
-                    if self.delay > 0:
-                        await asyncio.sleep(self.delay)
-
-                except asyncio.CancelledError:
-                    progress.status = "cancelled"
-                    break
-                except Exception as e:
-                    logger.warning(f"Failed to generate {segment.question_id}/{segment.segment_type}: {e}")
-                    progress.failed += 1
-                    progress.completed += 1
-
-            # Update manifest totals
             manifest.total_questions = len(question_ids)
-            manifest.total_segments = progress.completed
-
-            # Save manifest
-            if progress.status != "cancelled":
-                manifest_path = module_dir / "manifest.json"
-                with open(manifest_path, "w") as f:
-                    json.dump(manifest.to_dict(), f, indent=2)
+            manifest.complete = True
 
-                async with self._lock:
-                    self._manifests[progress.module_id] = manifest
-
-            # Update status
-            if progress.status != "cancelled":
-                progress.status = "completed" if progress.failed == 0 else "completed_with_errors"
+            await self._save_manifest(module_dir, manifest)
+            async with self._lock:
+                self._manifests[progress.module_id] = manifest
+                coverage = self._coverage.get(progress.module_id)
+                if coverage is not None:
+                    coverage.apply(manifest)
+            await self._invalidate_packs(progress.module_id)
 
+            progress.status = "completed" if progress.failed == 0 else "completed_with_errors"
             progress.completed_at = datetime.now()
 
             logger.info(
                 f"KB prefetch job {progress.job_id} complete: "
-                f"{progress.generated} generated, {progress.cached} cached, "
+                f"{progress.generated} generated, {progress.shared} shared, "
+                f"{progress.cached} cached, "
                 f"{progress.failed} failed"
             )
 
         except asyncio.CancelledError:
+            # Keep what was generated so a rerun resumes from here
+            await self._checkpoint_quietly(module_dir, manifest)
             progress.status = "cancelled"
             progress.completed_at = datetime.now()
         except Exception as e:
+            await self._checkpoint_quietly(module_dir, manifest)
             progress.status = "failed"
             progress.error = str(e)
             progress.completed_at = datetime.now()
             logger.error(f"KB prefetch job {progress.job_id} failed: {e}")
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _generate_segment(
+        self,
+        module_dir: Path,
+        segment: KBSegment,
+        voice_id: str,
+        provider: str,
+        speed: float,
+        reuse_shared: bool = True,
+    ) -> Tuple[KBAudioEntry, bool]:
+        """Generate one segment and write it (and any sidecars) to disk.
+
+        Returns:
+            Tuple of (manifest entry, whether the audio came from the blob store)
+        """
+        from .resource_pool import Priority
+
+        question_dir = module_dir / segment.question_id
+        file_path = question_dir / segment.filename
+        key = TTSCacheKey.from_request(
+            text=segment.text, voice_id=voice_id, provider=provider, speed=speed
+        )
+
+        shared = (
+            self.blob_store is not None
+            and reuse_shared
+            and await self.blob_store.link(key, file_path)
+        )
+        if shared:
+            sample_rate, duration = await asyncio.to_thread(wav_info, file_path)
+            audio_data = None
+            size_bytes = (await asyncio.to_thread(file_path.stat)).st_size
+            if self.encoder is not None and self.encoder.enabled:
+                audio_data = await self.blob_store.read(key)
+        else:
+            audio_data, sample_rate, duration = await self.resource_pool.generate_with_priority(
+                text=segment.text,
+                voice_id=voice_id,
+                provider=provider,
+                speed=speed,
+                chatterbox_config=None,
+                priority=Priority.SCHEDULED,
+            )
+            size_bytes = len(audio_data)
+            if self.blob_store is not None:
+                await self.blob_store.store(key, audio_data, file_path)
+            else:
+                await _write_file_atomic(file_path, audio_data)
+
+        variants = {}
+        if audio_data is not None:
+            variants = await self._write_variants(question_dir, segment.stem, audio_data)
+
+        entry = KBAudioEntry(
+            question_id=segment.question_id,
+            segment_type=segment.segment_type.value,
+            file_path=str(file_path),
+            size_bytes=size_bytes,
+            duration_seconds=duration,
+            sample_rate=sample_rate,
+            created_at=datetime.now(),
+            hint_index=segment.hint_index,
+            variants=variants,
+        )
+        return entry, shared
+
+    async def _write_variants(
+        self,
+        question_dir: Path,
+        stem: str,
+        audio_data: bytes,
+    ) -> Dict[str, int]:
+        """Encode and store compressed sidecars for a segment."""
+        if self.encoder is None or not self.encoder.enabled:
+            return {}
+
+        variants = {}
+        for format_name, result in (await self.encoder.encode_all(audio_data)).items():
+            await _write_file_atomic(question_dir / f"{stem}.{result.extension}", result.data)
+            variants[format_name] = len(result.data)
+        return variants
+
+    @staticmethod
+    def _scan_module_dir(module_dir: Path) -> Dict[str, Dict[str, os.stat_result]]:
+        """List every audio file in a module as {question_id: {filename: stat}}.
+
+        One scandir pass per question directory replaces per-segment
+        exists()/stat() calls. Leftover .tmp files from an interrupted
+        write are ignored.
+        """
+        found: Dict[str, Dict[str, os.stat_result]] = {}
+        if not module_dir.is_dir():
+            return found
+        with os.scandir(module_dir) as questions:
+            for question in questions:
+                if not question.is_dir():
+                    continue
+                with os.scandir(question.path) as files:
+                    found[question.name] = {
+                        f.name: f.stat() for f in files
+                        if f.is_file() and not f.name.endswith(".tmp")
+                    }
+        return found
+
+    def _variants_from_scan(self, files: Dict[str, os.stat_result], stem: str) -> Dict[str, int]:
+        """Find compressed sidecars for a segment in a directory scan."""
+        if self.encoder is None:
+            return {}
+
+        variants = {}
+        for format_name in self.encoder.formats:
+            st = files.get(f"{stem}.{CODECS[format_name].extension}")
+            if st is not None:
+                variants[format_name] = st.st_size
+        return variants
+
+    async def _load_resumable_manifest(
+        self,
+        module_dir: Path,
+        voice_id: str,
+        provider: str,
+    ) -> Optional[KBManifest]:
+        """Load the on-disk manifest if it was made with the same voice."""
+        manifest_path = module_dir / "manifest.json"
+        try:
+            async with aiofiles.open(manifest_path) as f:
+                manifest = KBManifest.from_dict(json.loads(await f.read()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+            return None
+
+        if manifest.voice_id != voice_id or manifest.provider != provider:
+            return None
+        return manifest
+
+    async def _save_manifest(self, module_dir: Path, manifest: KBManifest) -> None:
+        """Write the manifest atomically (also used for checkpoints)."""
+        manifest.total_segments = sum(len(entries) for entries in manifest.segments.values())
+        if not manifest.complete:
+            manifest.total_questions = len(manifest.segments)
+        data = json.dumps(manifest.to_dict(), indent=2).encode()
+        async with self._manifest_write_lock:
+            await _write_file_atomic(module_dir / "manifest.json", data)
+
+    async def _checkpoint_quietly(self, module_dir: Path, manifest: KBManifest) -> None:
+        """Best-effort checkpoint when a job stops early."""
+        if not manifest.segments:
+            return
+        try:
+            await asyncio.shield(self._save_manifest(module_dir, manifest))
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint manifest for {manifest.module_id}: {e}")
+
+    @property
+    def available_formats(self) -> Tuple[str, ...]:
+        """Compressed formats KB audio may be served in."""
+        if self.encoder is None:
+            return ()
+        return self.encoder.formats
 
     def _add_to_manifest(self, manifest: KBManifest, entry: KBAudioEntry) -> None:
         """Add an entry to the manifest."""
@@ -545,6 +845,10 @@ class KBAudioManager:
         manifest.total_size_bytes += entry.size_bytes
         manifest.total_duration_seconds += entry.duration_seconds
 
+        coverage = self._coverage.get(manifest.module_id)
+        if coverage is not None:
+            coverage.note(qid, key, entry.size_bytes)
+
     def _estimate_duration(self, size_bytes: int, sample_rate: int = 24000) -> float:
         """Estimate audio duration from file size (WAV format)."""
         # WAV: 44 byte header + 2 bytes per sample (16-bit mono)
@@ -570,6 +874,31 @@ class KBAudioManager:
         Returns:
             Audio bytes if found, None otherwise
         """
+        result = await self.get_audio_variant(
+            module_id, question_id, segment_type, hint_index, CANONICAL_FORMAT
+        )
+        return result[0] if result else None
+
+    async def get_audio_variant(
+        self,
+        module_id: str,
+        question_id: str,
+        segment_type: str,
+        hint_index: int = 0,
+        format_name: str = CANONICAL_FORMAT,
+    ) -> Optional[Tuple[bytes, str]]:
+        """Get pre-generated audio, preferring a compressed sidecar.
+
+        Args:
+            module_id: Module identifier
+            question_id: Question identifier
+            segment_type: Type of segment (question, answer, hint, explanation)
+            hint_index: Index for hint segments
+            format_name: Preferred format; falls back to WAV if not stored
+
+        Returns:
+            Tuple of (audio bytes, format served) if found, None otherwise
+        """
         # Validate inputs to prevent path traversal attacks
         if not _validate_path_component(module_id):
             logger.warning(f"Invalid module_id rejected: {module_id!r}")
@@ -581,12 +910,17 @@ class KBAudioManager:
             logger.warning(f"Invalid segment_type rejected: {segment_type!r}")
             return None
 
-        if segment_type == "hint":
-            filename = f"hint_{hint_index}.wav"
-        else:
-            filename = f"{segment_type}.wav"
+        stem = f"hint_{hint_index}" if segment_type == "hint" else segment_type
+        question_dir = self.base_dir / module_id / question_id
 
-        file_path = self.base_dir / module_id / question_id / filename
+        file_path = question_dir / f"{stem}.wav"
+        served_format = CANONICAL_FORMAT
+        codec = CODECS.get(format_name)
+        if codec is not None and format_name in self.available_formats:
+            variant_path = question_dir / f"{stem}.{codec.extension}"
+            if variant_path.exists():
+                file_path = variant_path
+                served_format = format_name
 
         # Verify resolved path is still within base_dir using secure relative_to check
         try:
@@ -603,7 +937,7 @@ class KBAudioManager:
 
         try:
             with open(file_path, "rb") as f:
-                return f.read()
+                return f.read(), served_format
         except Exception:
             logger.error("Failed to read audio file")
             return None
@@ -613,43 +947,198 @@ class KBAudioManager:
         async with self._lock:
             return self._manifests.get(module_id)
 
-    def get_coverage_status(self, module_id: str, module_content: Dict) -> KBCoverageStatus:
+    async def get_pack(
+        self,
+        module_id: str,
+        format_name: str = CANONICAL_FORMAT,
+    ) -> Optional[KBAudioPack]:
+        """Get the packed bundle of a module's audio, building it if stale.
+
+        A pack is rebuilt when its manifest timestamp no longer matches the
+        module's manifest (i.e. after a regeneration).
+
+        Args:
+            module_id: Module identifier
+            format_name: Preferred format; WAV if not stored compressed
+
+        Returns:
+            Open pack, or None if the module has no audio
+        """
+        if not _validate_path_component(module_id):
+            logger.warning(f"Invalid module_id rejected: {module_id!r}")
+            return None
+        if format_name not in self.available_formats:
+            format_name = CANONICAL_FORMAT
+
+        manifest = await self.get_manifest(module_id)
+        if manifest is None or not manifest.segments:
+            return None
+
+        def is_current(pack: KBAudioPack) -> bool:
+            return (
+                pack.index.manifest_generated_at == manifest.generated_at
+                and pack.index.voice_id == manifest.voice_id
+                and pack.index.provider == manifest.provider
+            )
+
+        async with self._pack_lock:
+            key = (module_id, format_name)
+            pack = self._packs.get(key)
+            if pack is not None and is_current(pack):
+                return pack
+
+            module_dir = self.base_dir / module_id
+            path = pack_path_for(module_dir, manifest.voice_id, format_name)
+            candidate = None
+            if path.exists():
+                try:
+                    candidate = await asyncio.to_thread(KBAudioPack, path)
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable KB pack {path}: {e}")
+                if candidate is not None and not is_current(candidate):
+                    candidate.close()
+                    candidate = None
+
+            if candidate is None:
+                try:
+                    path = await asyncio.to_thread(build_pack, module_dir, manifest, format_name)
+                    candidate = await asyncio.to_thread(KBAudioPack, path)
+                except Exception as e:
+                    logger.error(f"Failed to build KB pack for {module_id}: {e}")
+                    return None
+
+            if pack is not None:
+                pack.close()
+            self._packs[key] = candidate
+            return candidate
+
+    async def _invalidate_packs(self, module_id: str) -> None:
+        """Close open packs for a module after its audio changed."""
+        async with self._pack_lock:
+            for key in [k for k in self._packs if k[0] == module_id]:
+                self._packs.pop(key).close()
+
+    def get_coverage_status(
+        self,
+        module_id: str,
+        module_content: Dict,
+        content_version: Any = None,
+    ) -> KBCoverageStatus:
         """Check how much of a module has pre-generated audio.
 
+        Coverage is counted from the manifest and kept current as segments
+        are written. Segments are only re-extracted when content_version
+        changes, and the counts only rebuilt when the extracted layout
+        hashes differently; no audio files are touched.
+
         Args:
             module_id: Module identifier
             module_content: Full module content to compare against
+            content_version: Optional marker that changes with the content
+                (e.g. file mtime); lets unchanged content skip extraction
 
         Returns:
             Coverage status
         """
+        coverage = self._coverage.get(module_id)
+        if (
+            coverage is not None
+            and content_version is not None
+            and coverage.content_version == content_version
+        ):
+            return coverage.status(module_id)
+
         segments = self.extract_segments(module_content)
-        total_segments = len(segments)
-        total_questions = len(set(s.question_id for s in segments))
+        content_hash = self._layout_hash(segments)
+        if coverage is None or coverage.content_hash != content_hash:
+            coverage = _ModuleCoverage.build(content_hash, segments, self._manifests.get(module_id))
+            self._coverage[module_id] = coverage
+        coverage.content_version = content_version
+        return coverage.status(module_id)
+
+    def get_cached_coverage(self, module_id: str, content_version: Any) -> Optional[KBCoverageStatus]:
+        """Coverage for unchanged content, or None if it must be recomputed."""
+        coverage = self._coverage.get(module_id)
+        if coverage is None or content_version is None or coverage.content_version != content_version:
+            return None
+        return coverage.status(module_id)
 
-        covered_segments = 0
-        covered_questions = set()
-        total_size = 0
+    @staticmethod
+    def _layout_hash(segments: List[KBSegment]) -> str:
+        """Hash of which segments a module's content defines."""
+        digest = hashlib.sha256()
+        for segment in segments:
+            digest.update(f"{segment.question_id}/{segment.stem}\n".encode())
+        return digest.hexdigest()[:16]
 
-        module_dir = self.base_dir / module_id
+    def get_segment_availability(
+        self,
+        module_id: str,
+        question_ids: Iterable[str],
+        segment_keys: Iterable[str],
+    ) -> Dict:
+        """Availability metadata for requested segments (batch prefetch).
 
-        for segment in segments:
-            file_path = module_dir / segment.question_id / segment.filename
-            if file_path.exists():
-                covered_segments += 1
-                covered_questions.add(segment.question_id)
-                total_size += file_path.stat().st_size
+        Rows come from a per-manifest table built once, so a lookup costs
+        O(requested segments).
 
-        return KBCoverageStatus(
-            module_id=module_id,
-            total_questions=total_questions,
-            covered_questions=len(covered_questions),
-            total_segments=total_segments,
-            covered_segments=covered_segments,
-            missing_segments=total_segments - covered_segments,
-            total_size_bytes=total_size,
-            is_complete=covered_segments == total_segments,
-        )
+        Args:
+            module_id: Module identifier
+            question_ids: Questions to report
+            segment_keys: Manifest keys ("question", "answer", "hint_0", ...)
+
+        Returns:
+            Dict with per-question "segments", "total_size_bytes",
+            "available_count" and "missing_count"
+        """
+        table = self._availability_table(module_id)
+        segment_keys = list(segment_keys)
+        missing = {"available": False, "duration": 0, "size": 0}
+
+        result: Dict[str, Dict[str, Dict]] = {}
+        total_size = available = missing_count = 0
+        for qid in question_ids:
+            rows = table.get(qid, {})
+            result[qid] = {}
+            for key in segment_keys:
+                row = rows.get(key)
+                if row is None:
+                    result[qid][key] = dict(missing)
+                    missing_count += 1
+                else:
+                    result[qid][key] = row
+                    total_size += row["size"]
+                    available += 1
+
+        return {
+            "segments": result,
+            "total_size_bytes": total_size,
+            "available_count": available,
+            "missing_count": missing_count,
+        }
+
+    def _availability_table(self, module_id: str) -> Dict[str, Dict[str, Dict]]:
+        """Per-segment availability rows for the module's current manifest."""
+        manifest = self._manifests.get(module_id)
+        if manifest is None:
+            return {}
+        cached = self._availability.get(module_id)
+        if cached is not None and cached[0] is manifest:
+            return cached[1]
+
+        table = {
+            qid: {
+                key: {
+                    "available": True,
+                    "duration": entry.duration_seconds,
+                    "size": entry.size_bytes,
+                }
+                for key, entry in entries.items()
+            }
+            for qid, entries in manifest.segments.items()
+        }
+        self._availability[module_id] = (manifest, table)
+        return table
 
     def get_progress(self, job_id: str) -> Optional[Dict]:
         """Get progress for a prefetch job."""
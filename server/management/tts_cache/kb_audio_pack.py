@@ -0,0 +1,308 @@
+# Knowledge Bowl Audio Packs
+# Single-file bundles of a module's KB audio with an offset index
+
+import json
+import logging
+import mmap
+import os
+import struct
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .encoding import CANONICAL_FORMAT, CODECS, content_type_for
+
+if TYPE_CHECKING:
+    from .kb_audio import KBManifest
+
+logger = logging.getLogger(__name__)
+
+# Pack layout:
+#   magic "KBPK" | version u16 | reserved u16 | index length u32   (12 bytes, big-endian)
+#   index (UTF-8 JSON, see KBAudioPackIndex.to_dict)
+#   audio blobs, back to back; entry offsets are absolute file offsets
+PACK_MAGIC = b"KBPK"
+PACK_VERSION = 1
+PACK_CONTENT_TYPE = "application/x-kb-audio-pack"
+_HEADER = struct.Struct(">4sHHI")
+
+# Streaming chunk for copying audio into a pack
+_COPY_CHUNK = 1024 * 1024
+
+
+@dataclass
+class KBAudioPackEntry:
+    """Location of one segment's audio inside a pack."""
+    question_id: str
+    segment: str           # Manifest key: question, answer, hint_0, explanation...
+    format: str
+    offset: int
+    length: int
+    duration_seconds: float
+
+    def to_dict(self) -> Dict:
+        return {
+            "question_id": self.question_id,
+            "segment": self.segment,
+            "format": self.format,
+            "content_type": content_type_for(self.format),
+            "offset": self.offset,
+            "length": self.length,
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "KBAudioPackEntry":
+        return cls(
+            question_id=d["question_id"],
+            segment=d["segment"],
+            format=d["format"],
+            offset=d["offset"],
+            length=d["length"],
+            duration_seconds=d.get("duration_seconds", 0.0),
+        )
+
+
+@dataclass
+class KBAudioPackIndex:
+    """Header index of a pack."""
+    module_id: str
+    voice_id: str
+    provider: str
+    format: str
+    manifest_generated_at: datetime
+    entries: List[KBAudioPackEntry] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(e.length for e in self.entries)
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": PACK_VERSION,
+            "module_id": self.module_id,
+            "voice_id": self.voice_id,
+            "provider": self.provider,
+            "format": self.format,
+            "manifest_generated_at": self.manifest_generated_at.isoformat(),
+            "entry_count": len(self.entries),
+            "total_audio_bytes": self.total_bytes,
+            "entries": [e.to_dict() for e in self.entries],
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "KBAudioPackIndex":
+        return cls(
+            module_id=d["module_id"],
+            voice_id=d["voice_id"],
+            provider=d["provider"],
+            format=d["format"],
+            manifest_generated_at=datetime.fromisoformat(d["manifest_generated_at"]),
+            entries=[KBAudioPackEntry.from_dict(e) for e in d.get("entries", [])],
+        )
+
+
+def _encode_header(index: KBAudioPackIndex) -> bytes:
+    """Serialize header + index, fixing up entry offsets to follow it.
+
+    Offsets depend on the index length, which depends on the offsets'
+    digit counts, so iterate until the length is stable (2 passes in
+    practice).
+    """
+    relative = [e.offset for e in index.entries]
+    index_len = 0
+    for _ in range(5):
+        base = _HEADER.size + index_len
+        for entry, rel in zip(index.entries, relative):
+            entry.offset = base + rel
+        encoded = json.dumps(index.to_dict(), separators=(",", ":")).encode()
+        if len(encoded) == index_len:
+            break
+        index_len = len(encoded)
+    else:
+        raise RuntimeError("KB pack index length did not converge")
+    return _HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, index_len) + encoded
+
+
+def pack_path_for(module_dir: Path, voice_id: str, format_name: str) -> Path:
+    """Where a module's pack for a voice and format lives."""
+    safe_voice = "".join(c if c.isalnum() or c in "-_" else "_" for c in voice_id) or "default"
+    return module_dir / f"{safe_voice}.{format_name}.kbpack"
+
+
+def build_pack(
+    module_dir: Path,
+    manifest: "KBManifest",
+    format_name: str = CANONICAL_FORMAT,
+) -> Path:
+    """Write a pack for every segment in a manifest (blocking; run in a thread).
+
+    Segments without a variant in format_name are packed as WAV; each entry
+    records its own format. Segments whose files are missing are skipped.
+
+    Returns:
+        Path of the written pack
+    """
+    index = KBAudioPackIndex(
+        module_id=manifest.module_id,
+        voice_id=manifest.voice_id,
+        provider=manifest.provider,
+        format=format_name,
+        manifest_generated_at=manifest.generated_at,
+    )
+
+    sources: List[Path] = []
+    position = 0
+    for question_id in sorted(manifest.segments):
+        for segment, entry in sorted(manifest.segments[question_id].items()):
+            fmt = format_name if format_name in entry.variants else CANONICAL_FORMAT
+            ext = CODECS[fmt].extension if fmt != CANONICAL_FORMAT else "wav"
+            path = module_dir / question_id / f"{segment}.{ext}"
+            try:
+                size = path.stat().st_size
+            except FileNotFoundError:
+                logger.warning(f"Skipping missing KB audio {path}")
+                continue
+            index.entries.append(KBAudioPackEntry(
+                question_id=question_id,
+                segment=segment,
+                format=fmt,
+                offset=position,
+                length=size,
+                duration_seconds=entry.duration_seconds,
+            ))
+            sources.append(path)
+            position += size
+
+    pack_path = pack_path_for(module_dir, manifest.voice_id, format_name)
+    temp_path = pack_path.with_name(pack_path.name + ".tmp")
+    with open(temp_path, "wb") as out:
+        out.write(_encode_header(index))
+        for path in sources:
+            with open(path, "rb") as src:
+                while chunk := src.read(_COPY_CHUNK):
+                    out.write(chunk)
+    os.replace(temp_path, pack_path)
+
+    logger.info(
+        f"Built KB pack {pack_path.name} for {manifest.module_id}: "
+        f"{len(index.entries)} segments, {position} bytes"
+    )
+    return pack_path
+
+
+def read_index(f: BinaryIO) -> Tuple[KBAudioPackIndex, int]:
+    """Read a pack's index from an open file.
+
+    Returns:
+        Tuple of (index, header_length)
+    """
+    header = f.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError("Truncated KB pack header")
+    magic, version, _, index_len = _HEADER.unpack(header)
+    if magic != PACK_MAGIC:
+        raise ValueError("Not a KB pack")
+    if version != PACK_VERSION:
+        raise ValueError(f"Unsupported KB pack version {version}")
+    index = KBAudioPackIndex.from_dict(json.loads(f.read(index_len)))
+    return index, _HEADER.size + index_len
+
+
+class KBAudioPack:
+    """A memory-mapped pack opened for serving.
+
+    Slices are zero-copy views into the page cache, so serving a subset
+    never reads the individual segment files.
+    """
+
+    def __init__(self, path: Path):
+        """Open and map a pack.
+
+        Args:
+            path: Pack file written by build_pack
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self.index, self.header_length = read_index(self._file)
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._by_key: Dict[Tuple[str, str], KBAudioPackEntry] = {
+            (e.question_id, e.segment): e for e in self.index.entries
+        }
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._mmap)
+
+    def get(self, question_id: str, segment: str) -> Optional[KBAudioPackEntry]:
+        """Look up one segment's entry."""
+        return self._by_key.get((question_id, segment))
+
+    def read(self, entry: KBAudioPackEntry) -> memoryview:
+        """Zero-copy view of an entry's audio."""
+        return memoryview(self._mmap)[entry.offset:entry.offset + entry.length]
+
+    def select(
+        self,
+        question_ids: Optional[List[str]] = None,
+        segments: Optional[List[str]] = None,
+    ) -> List[KBAudioPackEntry]:
+        """Entries matching question ids and segment names (hint matches hint_N)."""
+        wanted_questions = set(question_ids) if question_ids else None
+        wanted_segments = set(segments) if segments else None
+
+        selected = []
+        for entry in self.index.entries:
+            if wanted_questions is not None and entry.question_id not in wanted_questions:
+                continue
+            if wanted_segments is not None:
+                base = "hint" if entry.segment.startswith("hint_") else entry.segment
+                if entry.segment not in wanted_segments and base not in wanted_segments:
+                    continue
+            selected.append(entry)
+        return selected
+
+    def subset(self, entries: List[KBAudioPackEntry]) -> Tuple[bytes, List[memoryview]]:
+        """Re-pack selected entries without copying audio.
+
+        All views are taken up front, so a close() while the subset is
+        still being written leaves the mapping alive until they are freed.
+
+        Returns:
+            Tuple of (header bytes, list of audio views) which written
+            back to back form a valid pack
+        """
+        sub = KBAudioPackIndex(
+            module_id=self.index.module_id,
+            voice_id=self.index.voice_id,
+            provider=self.index.provider,
+            format=self.index.format,
+            manifest_generated_at=self.index.manifest_generated_at,
+        )
+        position = 0
+        for entry in entries:
+            sub.entries.append(KBAudioPackEntry(
+                question_id=entry.question_id,
+                segment=entry.segment,
+                format=entry.format,
+                offset=position,
+                length=entry.length,
+                duration_seconds=entry.duration_seconds,
+            ))
+            position += entry.length
+        return _encode_header(sub), [self.read(e) for e in entries]
+
+    def close(self) -> None:
+        """Unmap and close the pack file."""
+        try:
+            self._mmap.close()
+        except BufferError:
+            # A response is still streaming a view; the mapping is released
+            # when that view is garbage collected
+            pass
+        self._file.close()
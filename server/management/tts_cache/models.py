@@ -133,9 +133,37 @@ class TTSCacheKey:
         )
 
 
+@dataclass
+class AudioVariant:
+    """A compressed copy of cached audio stored alongside the canonical file."""
+    format: str               # "flac", "opus"
+    file_path: str
+    size_bytes: int
+
+    def to_dict(self) -> Dict:
+        return {
+            "format": self.format,
+            "file_path": self.file_path,
+            "size_bytes": self.size_bytes,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "AudioVariant":
+        return cls(
+            format=d["format"],
+            file_path=d["file_path"],
+            size_bytes=d["size_bytes"],
+        )
+
+
 @dataclass
 class TTSCacheEntry:
-    """Metadata for a cached TTS audio file."""
+    """Metadata for a cached TTS audio file.
+
+    file_path holds the canonical audio in storage_format ("wav" unless the
+    encoder replaced it with a lossless format). size_bytes is the total
+    on-disk footprint including any compressed variants.
+    """
     key: TTSCacheKey
     file_path: str
     size_bytes: int
@@ -145,6 +173,8 @@ class TTSCacheEntry:
     last_accessed_at: datetime
     access_count: int = 1
     ttl_seconds: int = 30 * 24 * 60 * 60  # 30 days default
+    storage_format: str = "wav"
+    variants: Dict[str, AudioVariant] = field(default_factory=dict)
 
     @property
     def is_expired(self) -> bool:
@@ -168,7 +198,7 @@ class TTSCacheEntry:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
-        return {
+        d = {
             "key": self.key.to_dict(),
             "file_path": self.file_path,
             "size_bytes": self.size_bytes,
@@ -179,6 +209,11 @@ class TTSCacheEntry:
             "access_count": self.access_count,
             "ttl_seconds": self.ttl_seconds,
         }
+        if self.storage_format != "wav":
+            d["storage_format"] = self.storage_format
+        if self.variants:
+            d["variants"] = {f: v.to_dict() for f, v in self.variants.items()}
+        return d
 
     @classmethod
     def from_dict(cls, d: Dict) -> "TTSCacheEntry":
@@ -193,6 +228,11 @@ class TTSCacheEntry:
             last_accessed_at=datetime.fromisoformat(d["last_accessed_at"]),
             access_count=d.get("access_count", 1),
             ttl_seconds=d.get("ttl_seconds", 30 * 24 * 60 * 60),
+            storage_format=d.get("storage_format", "wav"),
+            variants={
+                f: AudioVariant.from_dict(v)
+                for f, v in d.get("variants", {}).items()
+            },
         )
 
 
@@ -207,6 +247,7 @@ class TTSCacheStats:
     eviction_count: int = 0
     prefetch_count: int = 0
     prefetch_hits: int = 0
+    shared_hits: int = 0  # Hits served from audio another subsystem stored
     entries_by_provider: Dict[str, int] = field(default_factory=dict)
 
     @property
@@ -268,5 +309,6 @@ class TTSCacheStats:
             "eviction_count": self.eviction_count,
             "prefetch_count": self.prefetch_count,
             "prefetch_hits": self.prefetch_hits,
+            "shared_hits": self.shared_hits,
             "entries_by_provider": self.entries_by_provider,
         }
@@ -0,0 +1,488 @@
+# Prefetch Planner
+# Position-aware, latency-adaptive prefetch for live playback sessions
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from .cache import TTSCache
+from .models import TTSCacheKey
+
+if TYPE_CHECKING:
+    from .resource_pool import TTSResourcePool
+
+logger = logging.getLogger(__name__)
+
+# Speech rate used before any audio has been measured (~180 wpm at speed 1.0)
+DEFAULT_CHARS_PER_SECOND = 15.0
+
+# Generation time per second of audio assumed before any measurement
+DEFAULT_REALTIME_FACTOR = 0.5
+
+
+@dataclass
+class BufferHealth:
+    """Per-session prefetch buffer metrics.
+
+    buffered_seconds is the contiguous audio already cached ahead of the
+    playhead; anything after the first uncached segment does not count
+    because playback would stall there.
+    """
+    session_id: str
+    target_seconds: float
+    buffered_seconds: float = 0.0
+    planned_segments: int = 0
+    inflight: int = 0
+    prefetched: int = 0      # Prefetches completed on behalf of this session
+    shared: int = 0          # Prefetches joined from another session's in-flight request
+    cancelled: int = 0       # Prefetches dropped on topic change / barge-in / seek
+    served: int = 0          # Segments played
+    underruns: int = 0       # Segments played that were not cached yet
+    last_planned_at: Optional[datetime] = None
+
+    @property
+    def status(self) -> str:
+        """healthy (>= target), low (>= 25% of target), or starved."""
+        if self.buffered_seconds >= self.target_seconds:
+            return "healthy"
+        if self.buffered_seconds >= self.target_seconds * 0.25:
+            return "low"
+        return "starved"
+
+    @property
+    def underrun_rate(self) -> float:
+        """Percentage of played segments that missed the cache."""
+        if self.served == 0:
+            return 0.0
+        return self.underruns / self.served * 100
+
+    def to_dict(self) -> Dict:
+        return {
+            "session_id": self.session_id,
+            "status": self.status,
+            "buffered_seconds": round(self.buffered_seconds, 2),
+            "target_seconds": round(self.target_seconds, 2),
+            "planned_segments": self.planned_segments,
+            "inflight": self.inflight,
+            "prefetched": self.prefetched,
+            "shared": self.shared,
+            "cancelled": self.cancelled,
+            "served": self.served,
+            "underruns": self.underruns,
+            "underrun_rate": round(self.underrun_rate, 1),
+            "last_planned_at": self.last_planned_at.isoformat() if self.last_planned_at else None,
+        }
+
+
+@dataclass
+class PrefetchPlan:
+    """Segments to prefetch so a session reaches its buffer target."""
+    session_id: str
+    current_index: int
+    buffered_seconds: float
+    required_seconds: float
+    segment_indices: List[int] = field(default_factory=list)
+
+
+@dataclass
+class _PrefetchRequest:
+    """A segment queued for prefetch on behalf of a session."""
+    hash_key: str
+    key: TTSCacheKey
+    text: str
+    voice_id: str
+    provider: str
+    speed: float
+    chatterbox_config: Optional[dict]
+
+
+class PrefetchPlanner:
+    """Keeps a target seconds-of-audio buffer ahead of each learner.
+
+    Instead of a fixed lookahead and delay, each plan walks forward from the
+    playhead summing (cached or estimated) segment durations until the
+    buffer target is met. The target grows with the provider's measured
+    real-time factor so slow providers start earlier.
+
+    Features:
+    - Duration estimates learned per voice from generated audio
+    - Generation latency learned per provider
+    - In-flight prefetches shared across sessions with the same voice config
+    - Stale prefetches cancelled on seek, topic change or barge-in
+    - Per-session buffer health metrics
+    """
+
+    def __init__(
+        self,
+        cache: TTSCache,
+        resource_pool: "TTSResourcePool",
+        target_buffer_seconds: float = 30.0,
+        max_lookahead: int = 20,
+        max_inflight_per_session: int = 2,
+        smoothing: float = 0.2,
+    ):
+        """Initialize planner.
+
+        Args:
+            cache: TTS cache instance
+            resource_pool: TTS resource pool for priority-based generation
+            target_buffer_seconds: Audio to keep ready ahead of the playhead
+            max_lookahead: Hard cap on segments considered per plan
+            max_inflight_per_session: Concurrent prefetches per session
+            smoothing: EWMA weight for new duration/latency observations
+        """
+        self.cache = cache
+        self.resource_pool = resource_pool
+        self.target_buffer_seconds = target_buffer_seconds
+        self.max_lookahead = max_lookahead
+        self.max_inflight_per_session = max_inflight_per_session
+        self.smoothing = smoothing
+
+        # Learned estimates
+        self._seconds_per_char: Dict[Tuple[str, str], float] = {}  # (provider, voice) at speed 1.0
+        self._realtime_factor: Dict[str, float] = {}               # provider -> gen s / audio s
+
+        # Shared in-flight prefetches: hash_key -> task, and who is waiting on it
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._interest: Dict[str, Set[str]] = {}
+
+        # Per-session state
+        self._session_keys: Dict[str, Set[str]] = {}
+        self._pending: Dict[str, Deque[_PrefetchRequest]] = {}
+        self._health: Dict[str, BufferHealth] = {}
+
+    # -------------------------------------------------------------------------
+    # Estimation
+    # -------------------------------------------------------------------------
+
+    def estimate_duration(self, text: str, voice_id: str, provider: str, speed: float = 1.0) -> float:
+        """Estimate audio seconds for text with a given voice."""
+        per_char = self._seconds_per_char.get(
+            (provider, voice_id), 1.0 / DEFAULT_CHARS_PER_SECOND
+        )
+        return len(text) * per_char / max(speed, 0.1)
+
+    def realtime_factor(self, provider: str) -> float:
+        """Measured generation seconds per audio second for a provider."""
+        return self._realtime_factor.get(provider, DEFAULT_REALTIME_FACTOR)
+
+    def observe_generation(
+        self,
+        text: str,
+        voice_id: str,
+        provider: str,
+        speed: float,
+        duration_seconds: float,
+        latency_seconds: float,
+    ) -> None:
+        """Feed a completed generation into the duration and latency estimates."""
+        if not text or duration_seconds <= 0:
+            return
+
+        alpha = self.smoothing
+        per_char = duration_seconds * speed / len(text)
+        voice_key = (provider, voice_id)
+        if voice_key in self._seconds_per_char:
+            per_char = (1 - alpha) * self._seconds_per_char[voice_key] + alpha * per_char
+        self._seconds_per_char[voice_key] = per_char
+
+        rtf = latency_seconds / duration_seconds
+        if provider in self._realtime_factor:
+            rtf = (1 - alpha) * self._realtime_factor[provider] + alpha * rtf
+        self._realtime_factor[provider] = rtf
+
+    def _cached_duration(self, key: TTSCacheKey) -> Optional[float]:
+        """Duration of a cached, unexpired entry (index read only, no file I/O)."""
+        entry = self.cache.index.get(key.to_hash())
+        if entry is None or entry.is_expired:
+            return None
+        return entry.duration_seconds
+
+    # -------------------------------------------------------------------------
+    # Planning
+    # -------------------------------------------------------------------------
+
+    def plan(
+        self,
+        session_id: str,
+        segments: List[str],
+        current_index: int,
+        offset_ms: int = 0,
+        voice_id: str = "nova",
+        provider: str = "vibevoice",
+        speed: float = 1.0,
+        chatterbox_config: Optional[dict] = None,
+    ) -> PrefetchPlan:
+        """Decide which upcoming segments must be generated.
+
+        Args:
+            session_id: Session being planned for
+            segments: All segments in the current topic
+            current_index: Segment currently playing
+            offset_ms: Position within the current segment
+            voice_id, provider, speed, chatterbox_config: Session voice config
+
+        Returns:
+            Plan with the buffer measured and segment indices to prefetch
+        """
+        required = self.target_buffer_seconds * (1 + self.realtime_factor(provider))
+        plan = PrefetchPlan(
+            session_id=session_id,
+            current_index=current_index,
+            buffered_seconds=0.0,
+            required_seconds=required,
+        )
+
+        if 0 <= current_index < len(segments):
+            key = self._make_key(segments[current_index], voice_id, provider, speed, chatterbox_config)
+            current = self._cached_duration(key)
+            if current is None:
+                current = self.estimate_duration(segments[current_index], voice_id, provider, speed)
+            ahead = max(0.0, current - offset_ms / 1000)
+        else:
+            ahead = 0.0
+
+        contiguous = True
+        plan.buffered_seconds = ahead
+        end = min(len(segments), current_index + 1 + self.max_lookahead)
+        for index in range(max(0, current_index + 1), end):
+            if ahead >= required:
+                break
+            text = segments[index]
+            key = self._make_key(text, voice_id, provider, speed, chatterbox_config)
+            duration = self._cached_duration(key)
+            if duration is None:
+                contiguous = False
+                plan.segment_indices.append(index)
+                duration = self.estimate_duration(text, voice_id, provider, speed)
+            elif contiguous:
+                plan.buffered_seconds += duration
+            ahead += duration
+
+        return plan
+
+    async def schedule(
+        self,
+        session_id: str,
+        segments: List[str],
+        current_index: int,
+        offset_ms: int = 0,
+        voice_id: str = "nova",
+        provider: str = "vibevoice",
+        speed: float = 1.0,
+        chatterbox_config: Optional[dict] = None,
+    ) -> PrefetchPlan:
+        """Re-plan a session and start prefetches for what it needs.
+
+        Prefetches the session was waiting on that are no longer in the plan
+        (e.g. after a seek) are released; shared work continues if another
+        session still needs it.
+        """
+        plan = self.plan(
+            session_id, segments, current_index, offset_ms,
+            voice_id, provider, speed, chatterbox_config,
+        )
+
+        requests = []
+        for index in plan.segment_indices:
+            text = segments[index]
+            key = self._make_key(text, voice_id, provider, speed, chatterbox_config)
+            requests.append(_PrefetchRequest(
+                hash_key=key.to_hash(),
+                key=key,
+                text=text,
+                voice_id=voice_id,
+                provider=provider,
+                speed=speed,
+                chatterbox_config=chatterbox_config,
+            ))
+
+        wanted = {r.hash_key for r in requests}
+        stale = self._session_keys.get(session_id, set()) - wanted
+        for hash_key in stale:
+            self._release(session_id, hash_key)
+
+        health = self._get_health(session_id)
+        health.cancelled += len(stale)
+        health.buffered_seconds = plan.buffered_seconds
+        health.target_seconds = plan.required_seconds
+        health.planned_segments = len(plan.segment_indices)
+        health.last_planned_at = datetime.now()
+
+        self._pending[session_id] = deque(requests)
+        self._pump(session_id)
+        return plan
+
+    def cancel_session(self, session_id: str) -> int:
+        """Drop every queued and in-flight prefetch for a session.
+
+        Call on topic change, barge-in or voice change.
+
+        Returns:
+            Number of prefetches released
+        """
+        pending = self._pending.pop(session_id, deque())
+        keys = list(self._session_keys.get(session_id, set()))
+        for hash_key in keys:
+            self._release(session_id, hash_key)
+
+        released = len(pending) + len(keys)
+        if session_id in self._health:
+            health = self._health[session_id]
+            health.cancelled += released
+            health.planned_segments = 0
+            health.inflight = 0
+        return released
+
+    def remove_session(self, session_id: str) -> None:
+        """Cancel prefetches and forget metrics for an ended session."""
+        self.cancel_session(session_id)
+        self._session_keys.pop(session_id, None)
+        self._health.pop(session_id, None)
+
+    def record_playback(self, session_id: str, cache_hit: bool) -> None:
+        """Record a segment being served to the learner."""
+        health = self._get_health(session_id)
+        health.served += 1
+        if not cache_hit:
+            health.underruns += 1
+
+    def get_buffer_health(self, session_id: str) -> Optional[Dict]:
+        """Buffer metrics for one session."""
+        health = self._health.get(session_id)
+        return health.to_dict() if health else None
+
+    def get_all_buffer_health(self) -> Dict[str, Dict]:
+        """Buffer metrics for every tracked session."""
+        return {sid: h.to_dict() for sid, h in self._health.items()}
+
+    def get_stats(self) -> Dict:
+        """Planner-wide estimates and in-flight counts."""
+        return {
+            "inflight": len(self._inflight),
+            "sessions": len(self._health),
+            "realtime_factor": {p: round(v, 3) for p, v in self._realtime_factor.items()},
+            "chars_per_second": {
+                f"{p}/{v}": round(1 / s, 2) for (p, v), s in self._seconds_per_char.items() if s > 0
+            },
+        }
+
+    # -------------------------------------------------------------------------
+    # Internal
+    # -------------------------------------------------------------------------
+
+    def _make_key(
+        self,
+        text: str,
+        voice_id: str,
+        provider: str,
+        speed: float,
+        chatterbox_config: Optional[dict],
+    ) -> TTSCacheKey:
+        return TTSCacheKey.from_request(
+            text=text,
+            voice_id=voice_id,
+            provider=provider,
+            speed=speed,
+            exaggeration=chatterbox_config.get("exaggeration") if chatterbox_config else None,
+            cfg_weight=chatterbox_config.get("cfg_weight") if chatterbox_config else None,
+            language=chatterbox_config.get("language") if chatterbox_config else None,
+        )
+
+    def _get_health(self, session_id: str) -> BufferHealth:
+        if session_id not in self._health:
+            self._health[session_id] = BufferHealth(
+                session_id=session_id,
+                target_seconds=self.target_buffer_seconds,
+            )
+        return self._health[session_id]
+
+    def _pump(self, session_id: str) -> None:
+        """Start queued prefetches up to the per-session concurrency limit."""
+        pending = self._pending.get(session_id)
+        keys = self._session_keys.setdefault(session_id, set())
+        health = self._get_health(session_id)
+
+        while pending and len(keys) < self.max_inflight_per_session:
+            request = pending.popleft()
+            if request.hash_key in keys:
+                continue
+            keys.add(request.hash_key)
+            interested = self._interest.setdefault(request.hash_key, set())
+            interested.add(session_id)
+
+            if request.hash_key in self._inflight:
+                health.shared += 1
+                continue
+
+            task = asyncio.create_task(self._prefetch(request))
+            self._inflight[request.hash_key] = task
+            task.add_done_callback(lambda t, h=request.hash_key: self._on_done(h, t))
+
+        health.inflight = len(keys)
+
+    def _release(self, session_id: str, hash_key: str) -> None:
+        """Remove a session's interest in a prefetch, cancelling it if orphaned."""
+        self._session_keys.get(session_id, set()).discard(hash_key)
+        interested = self._interest.get(hash_key)
+        if interested is None:
+            return
+        interested.discard(session_id)
+        if not interested:
+            del self._interest[hash_key]
+            task = self._inflight.pop(hash_key, None)
+            if task is not None and not task.done():
+                task.cancel()
+
+    def _on_done(self, hash_key: str, task: asyncio.Task) -> None:
+        """Credit waiting sessions and keep their queues moving."""
+        if self._inflight.get(hash_key) is not task:
+            # Released and cancelled; a newer prefetch may own the key now
+            return
+        del self._inflight[hash_key]
+        sessions = self._interest.pop(hash_key, set())
+        succeeded = not task.cancelled() and task.exception() is None and task.result()
+
+        for session_id in sessions:
+            self._session_keys.get(session_id, set()).discard(hash_key)
+            health = self._health.get(session_id)
+            if health is None:
+                continue
+            if succeeded:
+                health.prefetched += 1
+            self._pump(session_id)
+
+    async def _prefetch(self, request: _PrefetchRequest) -> bool:
+        """Generate one segment into the cache with PREFETCH priority."""
+        from .resource_pool import Priority
+
+        if await self.cache.has(request.key):
+            return True
+
+        start = time.monotonic()
+        try:
+            audio_data, sample_rate, duration = await self.resource_pool.generate_with_priority(
+                text=request.text,
+                voice_id=request.voice_id,
+                provider=request.provider,
+                speed=request.speed,
+                chatterbox_config=request.chatterbox_config,
+                priority=Priority.PREFETCH,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Planned prefetch failed: {e}")
+            return False
+
+        self.observe_generation(
+            request.text, request.voice_id, request.provider, request.speed,
+            duration, time.monotonic() - start,
+        )
+        await self.cache.put(request.key, audio_data, sample_rate, duration)
+        self.cache._stats.record_prefetch()
+        return True
@@ -5,7 +5,7 @@ import asyncio
 import logging
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Optional, Tuple, Callable, Awaitable
+from typing import Dict, Optional, Tuple, Callable, Awaitable
 
 import aiohttp
 
@@ -51,6 +51,8 @@ class TTSResourcePool:
     Features:
     - Separate concurrency limits for live vs background requests
     - Live users never starved by background pre-generation
+    - Optional per-provider caps on background requests, so batch work can
+      fan out across TTS servers without overloading any one of them
     - Rate limiting to avoid overwhelming TTS servers
     - Statistics tracking
 
@@ -69,6 +71,7 @@ class TTSResourcePool:
         max_concurrent_live: int = 7,
         max_concurrent_background: int = 3,
         request_timeout: float = 30.0,
+        provider_concurrency: Optional[Dict[str, int]] = None,
     ):
         """Initialize resource pool.
 
@@ -76,6 +79,8 @@ class TTSResourcePool:
             max_concurrent_live: Max concurrent LIVE priority requests (default 7)
             max_concurrent_background: Max concurrent background requests (default 3)
             request_timeout: Timeout for TTS requests in seconds (default 30)
+            provider_concurrency: Optional max concurrent background requests
+                per provider (unlisted providers share the background limit)
         """
         self.max_concurrent_live = max_concurrent_live
         self.max_concurrent_background = max_concurrent_background
@@ -85,6 +90,15 @@ class TTSResourcePool:
         self._live_semaphore = asyncio.Semaphore(max_concurrent_live)
         self._background_semaphore = asyncio.Semaphore(max_concurrent_background)
 
+        # Per-provider background caps
+        self.provider_concurrency: Dict[str, int] = {
+            provider: max(1, limit) for provider, limit in (provider_concurrency or {}).items()
+        }
+        self._provider_semaphores: Dict[str, asyncio.Semaphore] = {
+            provider: asyncio.Semaphore(limit)
+            for provider, limit in self.provider_concurrency.items()
+        }
+
         # Statistics
         self._live_requests = 0
         self._background_requests = 0
@@ -130,7 +144,40 @@ class TTSResourcePool:
             semaphore = self._background_semaphore
             is_live = False
 
-        # Acquire semaphore and generate
+        # Background work waits for its provider's cap before taking a shared slot
+        provider_semaphore = None if is_live else self._provider_semaphores.get(provider)
+        if provider_semaphore is not None:
+            async with provider_semaphore:
+                return await self._generate_in_slot(
+                    semaphore, is_live, text, voice_id, provider, speed, chatterbox_config
+                )
+        return await self._generate_in_slot(
+            semaphore, is_live, text, voice_id, provider, speed, chatterbox_config
+        )
+
+    def get_provider_limit(self, provider: str) -> int:
+        """Background requests a provider can usefully run at once.
+
+        Args:
+            provider: TTS provider name
+
+        Returns:
+            The provider's cap, or the shared background limit if uncapped
+        """
+        limit = self.provider_concurrency.get(provider, self.max_concurrent_background)
+        return max(1, min(limit, self.max_concurrent_background))
+
+    async def _generate_in_slot(
+        self,
+        semaphore: asyncio.Semaphore,
+        is_live: bool,
+        text: str,
+        voice_id: str,
+        provider: str,
+        speed: float,
+        chatterbox_config: Optional[dict],
+    ) -> Tuple[bytes, int, float]:
+        """Internal: Hold a live/background slot while generating."""
         async with semaphore:
             if is_live:
                 self._live_in_flight += 1
@@ -245,6 +292,7 @@ class TTSResourcePool:
             "errors": self._errors,
             "max_concurrent_live": self.max_concurrent_live,
             "max_concurrent_background": self.max_concurrent_background,
+            "provider_concurrency": dict(self.provider_concurrency),
         }
 
     def configure_server(self, provider: str, url: str, sample_rate: int = 24000) -> None:
@@ -4,9 +4,10 @@
 
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from .models import (
@@ -31,7 +32,7 @@ class TTSComparisonManager:
 
     Provides:
     - Session creation with sample and configuration definitions
-    - Variant audio generation
+    - Variant audio generation, fanned out across providers
     - Rating management
     - Profile creation from winning variants
     """
@@ -41,6 +42,9 @@ class TTSComparisonManager:
         repo: TTSPregenRepository,
         tts_pool: Optional[Any] = None,
         storage_dir: str = DEFAULT_COMPARISON_DIR,
+        on_progress: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        flush_interval: float = 1.0,
+        flush_batch_size: int = 25,
     ):
         """Initialize the comparison manager.
 
@@ -48,10 +52,16 @@ class TTSComparisonManager:
             repo: Repository for database operations
             tts_pool: TTS resource pool for audio generation
             storage_dir: Directory for storing comparison audio files
+            on_progress: Optional async callback for generation progress
+            flush_interval: Max seconds variant results wait before being written
+            flush_batch_size: Variant results that force an early write
         """
         self.repo = repo
         self.tts_pool = tts_pool
         self.storage_dir = Path(storage_dir)
+        self.on_progress = on_progress
+        self.flush_interval = flush_interval
+        self.flush_batch_size = max(1, flush_batch_size)
 
         # Ensure storage directory exists
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -193,6 +203,11 @@ class TTSComparisonManager:
     ) -> TTSComparisonSession:
         """Generate audio for all variants in a session.
 
+        Variants are grouped by provider and each group is drained by as
+        many workers as the TTS pool allows for that provider, so providers
+        generate side by side. Status changes are written in batches and
+        progress is reported through on_progress after every variant.
+
         Args:
             session_id: Session ID
             regenerate: If True, regenerate all variants including completed ones
@@ -234,67 +249,78 @@ class TTSComparisonManager:
         session_dir = self.storage_dir / str(session_id)
         session_dir.mkdir(parents=True, exist_ok=True)
 
-        success_count = 0
-        fail_count = 0
-
+        # One write marks the whole batch as generating
         for variant in to_generate:
-            try:
-                await self.repo.update_variant_status(
-                    variant.id, VariantStatus.GENERATING
-                )
-
-                # Build TTS config
-                config = variant.tts_config
-                chatterbox_config = None
-                if config.get("provider") == "chatterbox":
-                    settings = config.get("settings", {})
-                    chatterbox_config = {
-                        "exaggeration": settings.get("exaggeration"),
-                        "cfg_weight": settings.get("cfg_weight"),
-                    }
-
-                # Generate audio
-                audio_data, sample_rate, duration = await self.tts_pool.generate_with_priority(
-                    text=variant.text_content,
-                    voice_id=config.get("voice_id"),
-                    provider=config.get("provider"),
-                    speed=config.get("settings", {}).get("speed", 1.0),
-                    chatterbox_config=chatterbox_config,
-                    priority=Priority.SCHEDULED,
-                )
-
-                # Save audio file (in thread to avoid blocking event loop)
-                filename = f"variant_{variant.sample_index}_{variant.config_index}.wav"
-                output_path = session_dir / filename
-
-                def _write_wav_file(path: Path, rate: int, data: bytes) -> None:
-                    import wave
-                    with wave.open(str(path), "wb") as wav_file:
-                        wav_file.setnchannels(1)
-                        wav_file.setsampwidth(2)  # 16-bit
-                        wav_file.setframerate(rate)
-                        wav_file.writeframes(data)
-
-                await asyncio.to_thread(_write_wav_file, output_path, sample_rate, audio_data)
-
-                # Update variant status
-                await self.repo.update_variant_status(
-                    variant.id,
-                    VariantStatus.READY,
-                    output_file=str(output_path),
-                    duration_seconds=duration,
-                )
+            variant.status = VariantStatus.GENERATING
+            variant.last_error = None
+        await self.repo.update_variants(to_generate)
+
+        progress = {
+            "session_id": str(session_id),
+            "status": SessionStatus.GENERATING.value,
+            "total": len(to_generate),
+            "completed": 0,
+            "failed": 0,
+        }
+        await self._emit_progress(dict(progress))
 
-                success_count += 1
+        by_provider: Dict[str, Deque[TTSComparisonVariant]] = {}
+        for variant in to_generate:
+            provider = variant.tts_config.get("provider") or ""
+            by_provider.setdefault(provider, deque()).append(variant)
+
+        pending: List[TTSComparisonVariant] = []
+        loop = asyncio.get_running_loop()
+        last_flush = loop.time()
+
+        async def flush() -> None:
+            nonlocal last_flush
+            batch = pending[:]
+            pending.clear()
+            last_flush = loop.time()
+            if batch:
+                await self.repo.update_variants(batch)
+
+        async def drain(queue: Deque[TTSComparisonVariant]) -> None:
+            while queue:
+                variant = queue.popleft()
+                await self._generate_variant(variant, session_dir, Priority.SCHEDULED)
+
+                pending.append(variant)
+                progress["completed"] += 1
+                if variant.status == VariantStatus.FAILED:
+                    progress["failed"] += 1
+                await self._emit_progress({
+                    **progress,
+                    "variant": {
+                        "id": str(variant.id),
+                        "sample_index": variant.sample_index,
+                        "config_index": variant.config_index,
+                        "provider": variant.tts_config.get("provider"),
+                        "status": variant.status.value,
+                    },
+                })
+
+                if (
+                    len(pending) >= self.flush_batch_size
+                    or loop.time() - last_flush >= self.flush_interval
+                ):
+                    await flush()
+
+        workers = [
+            asyncio.create_task(drain(queue))
+            for provider, queue in by_provider.items()
+            for _ in range(min(self.tts_pool.get_provider_limit(provider), len(queue)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await flush()
 
-            except Exception as e:
-                logger.error(f"Failed to generate variant {variant.id}: {e}")
-                await self.repo.update_variant_status(
-                    variant.id,
-                    VariantStatus.FAILED,
-                    error=str(e),
-                )
-                fail_count += 1
+        success_count = sum(1 for v in to_generate if v.status == VariantStatus.READY)
+        fail_count = len(to_generate) - success_count
 
         # Update session status
         if fail_count == 0:
@@ -305,6 +331,7 @@ class TTSComparisonManager:
             new_status = SessionStatus.READY  # Partial success is still ready
 
         await self.repo.update_session_status(session_id, new_status)
+        await self._emit_progress({**progress, "status": new_status.value})
 
         logger.info(
             f"Generated {success_count} variants for session {session_id} "
@@ -314,6 +341,67 @@ class TTSComparisonManager:
         # Return updated session
         return await self.repo.get_session(session_id)
 
+    async def _generate_variant(
+        self,
+        variant: TTSComparisonVariant,
+        session_dir: Path,
+        priority: int,
+    ) -> None:
+        """Generate one variant's audio, recording the outcome on the variant."""
+        try:
+            # Build TTS config
+            config = variant.tts_config
+            chatterbox_config = None
+            if config.get("provider") == "chatterbox":
+                settings = config.get("settings", {})
+                chatterbox_config = {
+                    "exaggeration": settings.get("exaggeration"),
+                    "cfg_weight": settings.get("cfg_weight"),
+                }
+
+            # Generate audio
+            audio_data, sample_rate, duration = await self.tts_pool.generate_with_priority(
+                text=variant.text_content,
+                voice_id=config.get("voice_id"),
+                provider=config.get("provider"),
+                speed=config.get("settings", {}).get("speed", 1.0),
+                chatterbox_config=chatterbox_config,
+                priority=priority,
+            )
+
+            # Save audio file (in thread to avoid blocking event loop)
+            filename = f"variant_{variant.sample_index}_{variant.config_index}.wav"
+            output_path = session_dir / filename
+
+            def _write_wav_file(path: Path, rate: int, data: bytes) -> None:
+                import wave
+                with wave.open(str(path), "wb") as wav_file:
+                    wav_file.setnchannels(1)
+                    wav_file.setsampwidth(2)  # 16-bit
+                    wav_file.setframerate(rate)
+                    wav_file.writeframes(data)
+
+            await asyncio.to_thread(_write_wav_file, output_path, sample_rate, audio_data)
+
+            variant.status = VariantStatus.READY
+            variant.output_file = str(output_path)
+            variant.duration_seconds = duration
+            variant.last_error = None
+
+        except Exception as e:
+            logger.error(f"Failed to generate variant {variant.id}: {e}")
+            variant.status = VariantStatus.FAILED
+            variant.last_error = str(e)
+
+    async def _emit_progress(self, progress: Dict[str, Any]) -> None:
+        """Report generation progress; listener errors never stop generation."""
+        if self.on_progress is None:
+            return
+        try:
+            await self.on_progress(progress)
+        except Exception as e:
+            logger.warning(f"Comparison progress listener failed: {e}")
+
     async def get_session_with_variants(
         self, session_id: UUID
     ) -> Tuple[Optional[TTSComparisonSession], List[TTSComparisonVariant], Dict[UUID, TTSComparisonRating]]:
@@ -407,6 +407,29 @@ class JobManager:
         logger.info(f"Reset {count} failed items in job {job_id}")
         return count
 
+    async def claim_pending_items(self, job_id: UUID, limit: int = 100) -> List[TTSJobItem]:
+        """Take pending items for processing, marking them in one round trip.
+
+        Args:
+            job_id: Job ID
+            limit: Maximum number of items to claim
+
+        Returns:
+            Claimed items, ordered by index
+        """
+        return await self.repository.claim_pending_items(job_id, limit)
+
+    async def update_items(self, items: List[TTSJobItem]) -> int:
+        """Persist a batch of item updates.
+
+        Args:
+            items: Items to update
+
+        Returns:
+            Number of items written
+        """
+        return await self.repository.update_job_items(items)
+
     async def update_item(self, item: TTSJobItem) -> TTSJobItem:
         """Update a job item.
 
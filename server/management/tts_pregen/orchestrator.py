@@ -5,9 +5,10 @@ import asyncio
 import logging
 import os
 import wave
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set
 from uuid import UUID
 
 from .models import TTSPregenJob, TTSJobItem, JobStatus, ItemStatus
@@ -21,31 +22,69 @@ RETRY_DELAYS = [5, 15, 45]  # Exponential backoff in seconds
 MAX_CONSECUTIVE_FAILURES = 5  # Auto-pause after this many failures
 
 
+@dataclass
+class _JobRun:
+    """In-memory state of a running job, flushed to the database in batches."""
+    job_id: UUID
+    completed_items: int
+    failed_items: int
+    consecutive_failures: int = 0
+    current_item_index: Optional[int] = None
+    current_item_text: Optional[str] = None
+    dirty: bool = False
+    auto_paused: bool = False
+    pending_writes: List[TTSJobItem] = field(default_factory=list)
+    flush_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
 class TTSPregenOrchestrator:
     """Executes TTS pre-generation jobs with priority queuing.
 
     Features:
-    - Per-item processing with database persistence
+    - Worker pool per job with configurable concurrency
+    - Items claimed in batches; results and job counters flushed in batches
     - Integration with TTSResourcePool (Priority.SCHEDULED)
     - Retry logic with exponential backoff
     - Profile resolution
     - Pause/resume support
     - Auto-pause on consecutive failures
+    - Compressed output formats via an optional AudioEncoder
+    - Optional shared blob store: WAV items link audio the live cache or KB
+      jobs already generated, and new audio warms the live cache
     """
 
     def __init__(
         self,
         job_manager: JobManager,
         tts_resource_pool: Any,  # TTSResourcePool
+        audio_encoder: Any = None,  # AudioEncoder
+        concurrency: int = 4,
+        flush_interval: float = 1.0,
+        flush_batch_size: int = 100,
+        retry_delays: Sequence[float] = RETRY_DELAYS,
+        blob_store: Any = None,  # AudioBlobStore
     ):
         """Initialize orchestrator.
 
         Args:
             job_manager: Job manager for database operations
             tts_resource_pool: TTS resource pool for generation
+            audio_encoder: Optional encoder for non-WAV output formats
+            concurrency: Items processed in parallel per job
+            flush_interval: Seconds between progress flushes to the database
+            flush_batch_size: Buffered item updates that force an early flush
+            retry_delays: Backoff before each retry of a failed item
+            blob_store: Optional content-addressed store shared with the
+                TTS cache and KB audio (WAV output only)
         """
         self.job_manager = job_manager
         self.tts_pool = tts_resource_pool
+        self.audio_encoder = audio_encoder
+        self.concurrency = max(1, concurrency)
+        self.flush_interval = flush_interval
+        self.flush_batch_size = max(1, flush_batch_size)
+        self.retry_delays = list(retry_delays)
+        self.blob_store = blob_store
         self._running_jobs: Set[UUID] = set()
         self._stop_flags: Dict[UUID, bool] = {}
 
@@ -87,6 +126,9 @@ class TTSPregenOrchestrator:
     async def stop_job(self, job_id: UUID) -> bool:
         """Stop a running job (pause or cancel).
 
+        Items already generating finish; claimed items not yet started
+        go back to pending.
+
         Args:
             job_id: Job ID to stop
 
@@ -102,9 +144,19 @@ class TTSPregenOrchestrator:
     async def _process_job(self, job_id: UUID) -> None:
         """Process all items in a job.
 
+        A producer claims pending items in batches and feeds a bounded queue
+        drained by `concurrency` workers. Item results and job counters are
+        buffered and written every flush_interval seconds or
+        flush_batch_size items, instead of several round trips per item.
+
         Args:
             job_id: Job ID to process
         """
+        run: Optional[_JobRun] = None
+        tasks: List[asyncio.Task] = []
+        flusher: Optional[asyncio.Task] = None
+        done = asyncio.Event()
+
         try:
             job = await self.job_manager.get_job(job_id)
             if not job:
@@ -119,77 +171,181 @@ class TTSPregenOrchestrator:
             # Ensure output directory exists
             output_dir = await self.job_manager.ensure_output_directory(job)
 
-            logger.info(f"Processing job {job_id} with provider={provider}, voice_id={voice_id}")
-
-            consecutive_failures = 0
-
-            while not self._stop_flags.get(job_id, False):
-                # Get next batch of pending items
-                pending_items = await self.job_manager.get_pending_items(job_id, limit=10)
-
-                if not pending_items:
-                    # No more items, job is complete
-                    await self.job_manager.complete_job(job_id)
-                    break
-
-                for item in pending_items:
-                    if self._stop_flags.get(job_id, False):
-                        break
-
-                    # Update current item
-                    job = await self.job_manager.get_job(job_id)
-                    if job:
-                        job.current_item_index = item.item_index
-                        job.current_item_text = item.text_content[:100]  # Truncate
-                        await self.job_manager.repository.update_job(job)
-
-                    # Process item with retries
-                    success = await self._process_item(
-                        item=item,
-                        provider=provider,
-                        voice_id=voice_id,
-                        settings=settings,
-                        output_dir=output_dir,
-                        output_format=job.output_format,
+            # Items a previous run left mid-flight
+            await self.job_manager.repository.requeue_processing_items(job_id)
+
+            logger.info(
+                f"Processing job {job_id} with provider={provider}, voice_id={voice_id}, "
+                f"concurrency={self.concurrency}"
+            )
+
+            run = _JobRun(
+                job_id=job_id,
+                completed_items=job.completed_items,
+                failed_items=job.failed_items,
+                consecutive_failures=job.consecutive_failures,
+            )
+            queue: "asyncio.Queue[Optional[TTSJobItem]]" = asyncio.Queue(
+                maxsize=self.concurrency * 2
+            )
+            tasks = [
+                asyncio.create_task(self._worker(
+                    run, queue, provider, voice_id, settings, output_dir, job.output_format,
+                ))
+                for _ in range(self.concurrency)
+            ]
+            flusher = asyncio.create_task(self._flush_periodically(run, done))
+
+            producer = asyncio.create_task(self._produce(run, queue))
+            tasks.append(producer)
+            # Surface the first failure (e.g. a database error) immediately
+            await asyncio.gather(*tasks)
+            exhausted = producer.result()
+            tasks = []
+
+            done.set()
+            await flusher
+            flusher = None
+            await self._flush(run)
+
+            if exhausted and not self._stop_flags.get(job_id, False):
+                # No more items, job is complete
+                await self.job_manager.complete_job(job_id)
+            else:
+                if run.auto_paused:
+                    logger.warning(
+                        f"Job {job_id} auto-paused after {run.consecutive_failures} consecutive failures"
                     )
-
-                    # Update job counters
-                    job = await self.job_manager.get_job(job_id)
-                    if job:
-                        if success:
-                            job.completed_items += 1
-                            consecutive_failures = 0
-                            job.consecutive_failures = 0
-                        else:
-                            job.failed_items += 1
-                            consecutive_failures += 1
-                            job.consecutive_failures = consecutive_failures
-
-                        await self.job_manager.repository.update_job(job)
-
-                        # Auto-pause on too many consecutive failures
-                        if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                            logger.warning(
-                                f"Job {job_id} auto-paused after {consecutive_failures} consecutive failures"
-                            )
-                            await self.job_manager.pause_job(job_id)
-                            self._stop_flags[job_id] = True
-                            break
-
-            # Handle stop
-            if self._stop_flags.get(job_id, False):
                 job = await self.job_manager.get_job(job_id)
                 if job and job.status == JobStatus.RUNNING:
                     await self.job_manager.pause_job(job_id)
 
         except Exception as e:
             logger.exception(f"Error processing job {job_id}: {e}")
+            for task in tasks:
+                task.cancel()
+            done.set()
+            if flusher is not None:
+                flusher.cancel()
+            if run is not None:
+                try:
+                    await self._flush(run)
+                except Exception:
+                    logger.exception(f"Failed to flush progress for job {job_id}")
             await self.job_manager.fail_job(job_id, str(e))
 
         finally:
             self._running_jobs.discard(job_id)
             self._stop_flags.pop(job_id, None)
 
+    async def _produce(
+        self,
+        run: _JobRun,
+        queue: "asyncio.Queue[Optional[TTSJobItem]]",
+    ) -> bool:
+        """Claim pending items in batches and queue them for the workers.
+
+        Returns:
+            True if the job ran out of pending items, False if it was stopped
+        """
+        exhausted = False
+        while not self._stop_flags.get(run.job_id, False):
+            items = await self.job_manager.claim_pending_items(
+                run.job_id, limit=self.concurrency * 2
+            )
+            if not items:
+                exhausted = True
+                break
+            for item in items:
+                if self._stop_flags.get(run.job_id, False):
+                    self._release(run, item)
+                else:
+                    await queue.put(item)
+
+        for _ in range(self.concurrency):
+            await queue.put(None)
+        return exhausted
+
+    async def _worker(
+        self,
+        run: _JobRun,
+        queue: "asyncio.Queue[Optional[TTSJobItem]]",
+        provider: str,
+        voice_id: str,
+        settings: Dict[str, Any],
+        output_dir: Path,
+        output_format: str,
+    ) -> None:
+        """Process queued items until a None sentinel arrives."""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            if self._stop_flags.get(run.job_id, False):
+                self._release(run, item)
+                continue
+
+            run.current_item_index = item.item_index
+            run.current_item_text = item.text_content[:100]  # Truncate
+            run.dirty = True
+
+            success = await self._process_item(
+                item=item,
+                provider=provider,
+                voice_id=voice_id,
+                settings=settings,
+                output_dir=output_dir,
+                output_format=output_format,
+            )
+
+            if success:
+                run.completed_items += 1
+                run.consecutive_failures = 0
+            else:
+                run.failed_items += 1
+                run.consecutive_failures += 1
+                # Auto-pause on too many consecutive failures
+                if run.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                    run.auto_paused = True
+                    self._stop_flags[run.job_id] = True
+
+            run.pending_writes.append(item)
+            if len(run.pending_writes) >= self.flush_batch_size:
+                await self._flush(run)
+
+    def _release(self, run: _JobRun, item: TTSJobItem) -> None:
+        """Hand a claimed but unprocessed item back to pending."""
+        item.status = ItemStatus.PENDING
+        item.processing_started_at = None
+        run.pending_writes.append(item)
+
+    async def _flush_periodically(self, run: _JobRun, done: asyncio.Event) -> None:
+        """Flush buffered progress every flush_interval until the job ends."""
+        while not done.is_set():
+            try:
+                await asyncio.wait_for(done.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                await self._flush(run)
+
+    async def _flush(self, run: _JobRun) -> None:
+        """Write buffered item updates and job counters in two round trips."""
+        async with run.flush_lock:
+            items, run.pending_writes = run.pending_writes, []
+            if not items and not run.dirty:
+                return
+            run.dirty = False
+            if items:
+                await self.job_manager.update_items(items)
+            await self.job_manager.repository.update_job_progress(
+                run.job_id,
+                completed_items=run.completed_items,
+                failed_items=run.failed_items,
+                consecutive_failures=run.consecutive_failures,
+                current_item_index=run.current_item_index,
+                current_item_text=run.current_item_text,
+            )
+
     async def _process_item(
         self,
         item: TTSJobItem,
@@ -201,6 +357,8 @@ class TTSPregenOrchestrator:
     ) -> bool:
         """Process a single item with retries.
 
+        Updates the item in memory only; the caller persists it.
+
         Args:
             item: Job item to process
             provider: TTS provider name
@@ -212,18 +370,53 @@ class TTSPregenOrchestrator:
         Returns:
             True if item was processed successfully
         """
-        # Mark as processing
+        # Import Priority with fallback
+        try:
+            from tts_cache.resource_pool import Priority
+        except ImportError:
+            from enum import IntEnum
+
+            class Priority(IntEnum):
+                SCHEDULED = 1
+
         item.status = ItemStatus.PROCESSING
-        item.processing_started_at = datetime.now()
-        item.attempt_count += 1
-        await self.job_manager.update_item(item)
+        if item.processing_started_at is None:
+            item.processing_started_at = datetime.now()
+
+        filename = f"{item.item_index:05d}_{item.text_hash[:8]}.{output_format}"
+        output_path = output_dir / filename
+
+        blob_key = None
+        if self.blob_store is not None and output_format == "wav":
+            from tts_cache.blob_store import wav_info
+            from tts_cache.models import TTSCacheKey
+
+            chatterbox = settings.get("chatterbox_config") or {}
+            blob_key = TTSCacheKey.from_request(
+                text=item.text_content,
+                voice_id=voice_id,
+                provider=provider,
+                speed=settings.get("speed", 1.0),
+                exaggeration=chatterbox.get("exaggeration"),
+                cfg_weight=chatterbox.get("cfg_weight"),
+                language=chatterbox.get("language"),
+            )
+            if await self.blob_store.link(blob_key, output_path):
+                sample_rate, duration = await asyncio.to_thread(wav_info, output_path)
+                item.status = ItemStatus.COMPLETED
+                item.output_file = str(output_path)
+                item.duration_seconds = duration
+                item.file_size_bytes = await asyncio.to_thread(os.path.getsize, output_path)
+                item.sample_rate = sample_rate
+                item.processing_completed_at = datetime.now()
+                item.last_error = None
+                logger.debug(f"Linked shared audio for item {item.item_index}: {output_path}")
+                return True
 
         for attempt in range(MAX_RETRIES):
+            item.attempt_count += 1
             try:
                 # Generate audio using resource pool
-                # Import Priority here to avoid circular imports
-                from ..tts_cache.resource_pool import Priority
-
                 audio_data, sample_rate, duration = await self.tts_pool.generate_with_priority(
                     text=item.text_content,
                     voice_id=voice_id,
@@ -234,11 +427,23 @@ class TTSPregenOrchestrator:
                 )
 
                 # Save to file (in thread to avoid blocking event loop)
-                filename = f"{item.item_index:05d}_{item.text_hash[:8]}.{output_format}"
-                output_path = output_dir / filename
+                encoded = None
+                if (
+                    output_format != "wav"
+                    and self.audio_encoder is not None
+                    and output_format in self.audio_encoder.formats
+                ):
+                    encoded = await self.audio_encoder.encode(
+                        audio_data, output_format, force=True
+                    )
 
-                if output_format == "wav":
+                if blob_key is not None:
+                    # TTS servers return complete WAV files; share them as-is
+                    await self.blob_store.store(blob_key, audio_data, output_path)
+                elif output_format == "wav":
                     await asyncio.to_thread(self._save_wav, output_path, audio_data, sample_rate)
+                elif encoded is not None:
+                    await asyncio.to_thread(output_path.write_bytes, encoded.data)
                 else:
                     # For other formats, just write raw audio
                     def _write_raw(path: Path, data: bytes) -> None:
@@ -254,7 +459,6 @@ class TTSPregenOrchestrator:
                 item.sample_rate = sample_rate
                 item.processing_completed_at = datetime.now()
                 item.last_error = None
-                await self.job_manager.update_item(item)
 
                 logger.debug(f"Generated item {item.item_index}: {output_path}")
                 return True
@@ -264,18 +468,15 @@ class TTSPregenOrchestrator:
                     f"Attempt {attempt + 1}/{MAX_RETRIES} failed for item {item.item_index}: {e}"
                 )
                 item.last_error = str(e)
-                item.attempt_count = attempt + 1
-                await self.job_manager.update_item(item)
 
-                if attempt < MAX_RETRIES - 1:
+                if attempt < MAX_RETRIES - 1 and self.retry_delays:
                     # Wait before retry
-                    delay = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+                    delay = self.retry_delays[min(attempt, len(self.retry_delays) - 1)]
                     await asyncio.sleep(delay)
 
         # All retries exhausted
         item.status = ItemStatus.FAILED
         item.processing_completed_at = datetime.now()
-        await self.job_manager.update_item(item)
 
         logger.error(f"Item {item.item_index} failed after {MAX_RETRIES} attempts")
         return False
@@ -498,6 +498,39 @@ class TTSPregenRepository:
                     error,
                 )
 
+    async def update_job_progress(
+        self,
+        job_id: UUID,
+        completed_items: int,
+        failed_items: int,
+        consecutive_failures: int,
+        current_item_index: Optional[int] = None,
+        current_item_text: Optional[str] = None,
+    ) -> None:
+        """Update just the job's progress counters.
+
+        Leaves status and timestamps alone so a pause or cancel issued while
+        the job runs is not overwritten by a progress flush.
+        """
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                """
+                UPDATE tts_pregen_jobs SET
+                    completed_items = $2, failed_items = $3, consecutive_failures = $4,
+                    current_item_index = COALESCE($5, current_item_index),
+                    current_item_text = COALESCE($6, current_item_text),
+                    updated_at = $7
+                WHERE id = $1
+                """,
+                job_id,
+                completed_items,
+                failed_items,
+                consecutive_failures,
+                current_item_index,
+                current_item_text,
+                datetime.now(),
+            )
+
     def _row_to_job(self, row: asyncpg.Record) -> TTSPregenJob:
         """Convert database row to TTSPregenJob."""
         tts_config = row["tts_config"]
@@ -625,6 +658,88 @@ class TTSPregenRepository:
             )
             return [self._row_to_item(row) for row in rows]
 
+    async def claim_pending_items(self, job_id: UUID, limit: int = 100) -> List[TTSJobItem]:
+        """Atomically fetch pending items and mark them processing.
+
+        One round trip replaces a select plus a per-item status update.
+        SKIP LOCKED keeps concurrent claimers from taking the same rows.
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                UPDATE tts_pregen_job_items SET
+                    status = 'processing', processing_started_at = $3
+                WHERE id IN (
+                    SELECT id FROM tts_pregen_job_items
+                    WHERE job_id = $1 AND status = 'pending'
+                    ORDER BY item_index
+                    LIMIT $2
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING *
+                """,
+                job_id,
+                limit,
+                datetime.now(),
+            )
+            items = [self._row_to_item(row) for row in rows]
+            items.sort(key=lambda item: item.item_index)
+            return items
+
+    async def requeue_processing_items(self, job_id: UUID) -> int:
+        """Return items left in processing (e.g. after a crash) to pending."""
+        async with self.pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE tts_pregen_job_items SET
+                    status = 'pending', processing_started_at = NULL
+                WHERE job_id = $1 AND status = 'processing'
+                """,
+                job_id,
+            )
+            count = int(result.split()[-1])
+            if count:
+                logger.info(f"Requeued {count} interrupted items for job {job_id}")
+            return count
+
+    async def update_job_items(self, items: List[TTSJobItem]) -> int:
+        """Bulk update job items' status and results with executemany."""
+        if not items:
+            return 0
+
+        async with self.pool.acquire() as conn:
+            await conn.executemany(
+                """
+                UPDATE tts_pregen_job_items SET
+                    status = $2, attempt_count = $3, output_file = $4,
+                    duration_seconds = $5, file_size_bytes = $6, sample_rate = $7,
+                    last_error = $8, processing_started_at = $9,
+                    processing_completed_at = $10
+                WHERE id = $1
+                """,
+                [
+                    (
+                        item.id,
+                        item.status.value,
+                        item.attempt_count,
+                        item.output_file,
+                        item.duration_seconds,
+                        item.file_size_bytes,
+                        item.sample_rate,
+                        item.last_error,
+                        item.processing_started_at,
+                        item.processing_completed_at,
+                    )
+                    for item in items
+                ],
+            )
+            return len(items)
+
+    async def update_job_item(self, item: TTSJobItem) -> TTSJobItem:
+        """Update a single job item."""
+        await self.update_job_items([item])
+        return item
+
     async def update_item_status(
         self,
         item_id: UUID,
@@ -916,6 +1031,31 @@ class TTSPregenRepository:
                 error,
             )
 
+    async def update_variants(self, variants: List[TTSComparisonVariant]) -> int:
+        """Bulk update variants' status and results with executemany."""
+        if not variants:
+            return 0
+
+        async with self.pool.acquire() as conn:
+            await conn.executemany(
+                """
+                UPDATE tts_comparison_variants SET
+                    status = $2, output_file = $3, duration_seconds = $4, last_error = $5
+                WHERE id = $1
+                """,
+                [
+                    (
+                        variant.id,
+                        variant.status.value,
+                        variant.output_file,
+                        variant.duration_seconds,
+                        variant.last_error,
+                    )
+                    for variant in variants
+                ],
+            )
+            return len(variants)
+
     def _row_to_variant(self, row: asyncpg.Record) -> TTSComparisonVariant:
         """Convert database row to TTSComparisonVariant."""
         tts_config = row["tts_config"]
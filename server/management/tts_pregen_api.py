@@ -1348,6 +1348,13 @@ async def handle_extract_content(request: web.Request) -> web.Response:
 # =============================================================================
 
 
+async def _broadcast_comparison_progress(progress: Dict[str, Any]) -> None:
+    """Forward comparison generation progress to dashboard WebSocket clients."""
+    broadcast = _app.get("broadcast_message") if _app is not None else None
+    if broadcast:
+        await broadcast("tts_comparison_progress", progress)
+
+
 def init_tts_pregen_system(app: web.Application):
     """Initialize the TTS pre-generation system.
 
@@ -1380,6 +1387,7 @@ def init_tts_pregen_system(app: web.Application):
         repo=repo,
         tts_pool=tts_pool,
         storage_dir=str(PREGEN_OUTPUT_DIR / "comparisons"),
+        on_progress=_broadcast_comparison_progress,
     )
 
     # Initialize job manager and orchestrator
@@ -1394,6 +1402,8 @@ def init_tts_pregen_system(app: web.Application):
         orchestrator = TTSPregenOrchestrator(
             job_manager=job_manager,
             tts_resource_pool=tts_pool,
+            audio_encoder=app.get("audio_encoder"),
+            blob_store=app.get("audio_blob_store"),
         )
         _app_ref["orchestrator"] = orchestrator
     else:
@@ -366,6 +366,7 @@ export interface BundlePacksData {
   source_pack_ids: string[];
   is_reference_bundle?: boolean;
   deduplication_strategy: 'keep_all' | 'keep_first' | 'manual';
+  similarity_threshold?: number;
   excluded_question_ids?: string[];
   difficulty_tier: DifficultyTier;
   competition_year?: string;
@@ -382,6 +383,18 @@ export interface DeduplicationPreview {
   }>;
   total_duplicates: number;
   unique_questions_after_dedup: number;
+  near_duplicate_groups: Array<{
+    question_text: string;
+    members: Array<{
+      question_id: string;
+      pack_id: string;
+      pack_name: string;
+      question_text: string;
+      similarity: number;
+    }>;
+  }>;
+  total_near_duplicates: number;
+  similarity_threshold: number;
 }
 
 // ============================================================================